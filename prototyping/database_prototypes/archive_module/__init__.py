@@ -0,0 +1,11 @@
+__all__: list[str] = [
+    "ArchiveDependent",
+    "ArchivePolicy",
+    "HistoryRepository",
+    "HotTableArchiver",
+    "NEKOSHOP_ARCHIVE_POLICIES",
+]
+
+from .history_repository import HistoryRepository
+from .hot_table_archiver import HotTableArchiver, NEKOSHOP_ARCHIVE_POLICIES
+from .types import ArchiveDependent, ArchivePolicy
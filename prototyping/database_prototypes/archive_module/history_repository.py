@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `history_repository` реализует чтение истории заказов и обращений
+пользователя одновременно из рабочих и архивных таблиц,
+чтобы архивация строк не была заметна пользователю.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["HistoryRepository"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from string import Template
+from typing import Any, List, Optional, Tuple
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+from ..schema_module.nekoshop_models import TABLE_COLUMNS, OrderRow, TicketRow
+
+
+# Каждая часть ограничена отдельно, чтобы читать не больше limit строк из таблицы.
+_HISTORY_TEMPLATE = Template(
+    "(SELECT $columns FROM `$table` WHERE `$user_column` = %s "
+    "ORDER BY `created_at` DESC LIMIT %s) "
+    "UNION ALL "
+    "(SELECT $columns FROM `${table}Archive` WHERE `$user_column` = %s "
+    "ORDER BY `created_at` DESC LIMIT %s) "
+    "ORDER BY `created_at` DESC, `id` DESC LIMIT %s"
+)
+
+_SELECT_BY_ID_TEMPLATE = Template(
+    "(SELECT $columns FROM `$table` WHERE `id` = %s) "
+    "UNION ALL "
+    "(SELECT $columns FROM `${table}Archive` WHERE `id` = %s)"
+)
+
+
+# ----------------------------------------------------------------------------
+def _get_columns(table: str) -> str:
+    return ", ".join(f"`{column}`" for column in TABLE_COLUMNS[table])
+
+
+# _____________________________________________________________________________
+class HistoryRepository:
+    """HistoryRepository класс для чтения истории пользователя с учётом архива.
+
+    Строка переносится в архив одной транзакцией (см. `HotTableArchiver`),
+    а выборка из рабочей и архивной таблиц выполняется одним запросом,
+    поэтому строка в процессе переноса не пропадает и не повторяется.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+    """
+
+    __api: AsyncMySQLAPI
+
+    # -------------------------------------------------------------------------
+    def __init__(self, api: AsyncMySQLAPI) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+        """
+        self.__api = api
+
+    # -------------------------------------------------------------------------
+    async def get_order_history(
+        self, customer_user_id: int, limit: int = 50
+    ) -> List[OrderRow]:
+        """get_order_history возвращает последние заказы пользователя.
+
+        Args:
+            customer_user_id (int): Идентификатор покупателя.
+            limit (int, optional): Максимальное количество заказов. По умолчанию 50.
+
+        Returns:
+            List[OrderRow]: Заказы от новых к старым.
+        """
+        rows: List[Tuple[Any, ...]] = await self.__select_history(
+            table="Order",
+            user_column="customer_user_id",
+            user_id=customer_user_id,
+            limit=limit,
+        )
+
+        return [OrderRow(*row) for row in rows]
+
+    # -------------------------------------------------------------------------
+    async def get_ticket_history(
+        self, creator_user_id: int, limit: int = 50
+    ) -> List[TicketRow]:
+        """get_ticket_history возвращает последние обращения пользователя.
+
+        Args:
+            creator_user_id (int): Идентификатор автора обращений.
+            limit (int, optional): Максимальное количество обращений. По умолчанию 50.
+
+        Returns:
+            List[TicketRow]: Обращения от новых к старым.
+        """
+        rows: List[Tuple[Any, ...]] = await self.__select_history(
+            table="Ticket",
+            user_column="creator_user_id",
+            user_id=creator_user_id,
+            limit=limit,
+        )
+
+        return [TicketRow(*row) for row in rows]
+
+    # -------------------------------------------------------------------------
+    async def get_order(self, order_id: int) -> Optional[OrderRow]:
+        """get_order возвращает заказ из рабочей, либо архивной таблицы.
+
+        Args:
+            order_id (int): Идентификатор заказа.
+
+        Returns:
+            Optional[OrderRow]: Заказ, либо None если заказ не найден.
+        """
+        select_query: str = _SELECT_BY_ID_TEMPLATE.substitute(
+            table="Order", columns=_get_columns(table="Order")
+        )
+
+        def transaction(
+            connection: MySQLPooledConnection,
+        ) -> Optional[Tuple[Any, ...]]:
+            with connection.cursor() as cursor:
+                cursor.execute(select_query, (order_id, order_id))
+
+                return cursor.fetchone()
+
+        row: Optional[Tuple[Any, ...]] = await self.__api.execute_transaction_use_pool(
+            transaction
+        )
+
+        return None if row is None else OrderRow(*row)
+
+    # -------------------------------------------------------------------------
+    async def __select_history(
+        self, table: str, user_column: str, user_id: int, limit: int
+    ) -> List[Tuple[Any, ...]]:
+        select_query: str = _HISTORY_TEMPLATE.substitute(
+            table=table, columns=_get_columns(table=table), user_column=user_column
+        )
+
+        def transaction(connection: MySQLPooledConnection) -> List[Tuple[Any, ...]]:
+            with connection.cursor() as cursor:
+                cursor.execute(select_query, (user_id, limit, user_id, limit, limit))
+
+                return cursor.fetchall()
+
+        return await self.__api.execute_transaction_use_pool(transaction)
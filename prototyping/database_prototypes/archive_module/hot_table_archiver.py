@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `hot_table_archiver` реализует перенос закрытых и старых строк
+рабочих таблиц (`Order`, `Ticket`, `Request*`) в архивные таблицы,
+секционированные по году создания, чтобы рабочие таблицы и их индексы
+не росли неограниченно.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["NEKOSHOP_ARCHIVE_POLICIES", "HotTableArchiver"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+import asyncio
+
+from datetime import datetime, timedelta
+from string import Template
+from typing import Dict, List, Optional, Tuple
+
+from mysql.connector.errors import Error as MySQLError
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+from ..schema_module.nekoshop_models import TABLE_COLUMNS
+
+from .types import ArchiveDependent, ArchivePolicy
+
+
+_REQUEST_CLOSED_STATUSES: Tuple[str, ...] = ("closed", "canceled")
+
+NEKOSHOP_ARCHIVE_POLICIES: Tuple[ArchivePolicy, ...] = (
+    ArchivePolicy(
+        table="Order",
+        closed_statuses=("canceled", "refunded", "completed"),
+        retention=timedelta(days=180),
+    ),
+    ArchivePolicy(
+        table="Ticket",
+        closed_statuses=("resolved", "closed"),
+        retention=timedelta(days=90),
+        dependents=(ArchiveDependent(table="TicketSolution", key_column="ticket_id"),),
+    ),
+    ArchivePolicy(
+        table="RequestAddProduct",
+        closed_statuses=_REQUEST_CLOSED_STATUSES,
+        retention=timedelta(days=30),
+        dependents=(ArchiveDependent(table="AddProductData", key_column="request_id"),),
+    ),
+    ArchivePolicy(
+        table="RequestEditProduct",
+        closed_statuses=_REQUEST_CLOSED_STATUSES,
+        retention=timedelta(days=30),
+        dependents=(
+            ArchiveDependent(table="EditProductData", key_column="request_id"),
+        ),
+    ),
+    ArchivePolicy(
+        table="RequestDeleteProduct",
+        closed_statuses=_REQUEST_CLOSED_STATUSES,
+        retention=timedelta(days=30),
+    ),
+    ArchivePolicy(
+        table="RequestBlockProduct",
+        closed_statuses=_REQUEST_CLOSED_STATUSES,
+        retention=timedelta(days=30),
+    ),
+    ArchivePolicy(
+        table="RequestUnblockProduct",
+        closed_statuses=_REQUEST_CLOSED_STATUSES,
+        retention=timedelta(days=30),
+    ),
+)
+
+# Архивные таблицы не входят в схему MainDataBaseModel: они повторяют
+# рабочие таблицы без внешних ключей, чтобы архив не зависел от рабочих строк.
+_CREATE_ARCHIVE_TEMPLATE = Template(
+    "CREATE TABLE IF NOT EXISTS `$archive` LIKE `$table`"
+)
+
+_SELECT_PARTITIONS_QUERY: str = (
+    "SELECT `PARTITION_NAME` FROM `information_schema`.`PARTITIONS` "
+    "WHERE `TABLE_SCHEMA` = DATABASE() AND `TABLE_NAME` = %s "
+    "AND `PARTITION_NAME` IS NOT NULL"
+)
+
+# Ключ секционированной таблицы должен включать столбец секционирования.
+_PARTITION_TEMPLATE = Template(
+    "ALTER TABLE `$archive` DROP PRIMARY KEY, ADD PRIMARY KEY (`id`, `created_at`) "
+    "PARTITION BY RANGE (YEAR(`created_at`)) ($partitions)"
+)
+
+_ADD_PARTITIONS_TEMPLATE = Template(
+    "ALTER TABLE `$archive` REORGANIZE PARTITION `p_future` INTO ($partitions)"
+)
+
+# Индекс, по которому выбираются строки для архивации.
+_CANDIDATES_INDEX_TEMPLATE = Template(
+    "CREATE INDEX `status_created_at_idx` ON `$table` (`status`, `created_at`)"
+)
+
+# Кандидаты выбираются неблокирующим чтением по индексу: блокирующая выборка
+# по условию блокировала бы все просмотренные строки и промежутки индекса,
+# задерживая вставку и изменение рабочих строк.
+_SELECT_CANDIDATES_TEMPLATE = Template(
+    "SELECT `id` FROM `$table` "
+    "WHERE `status` IN ($statuses) AND `created_at` < NOW() - INTERVAL %s SECOND "
+    "LIMIT %s"
+)
+
+# Блокируются только кандидаты по первичному ключу; строки, заблокированные
+# рабочими транзакциями или изменившие статус, пропускаются до следующего пакета.
+_LOCK_BATCH_TEMPLATE = Template(
+    "SELECT `id` FROM `$table` "
+    "WHERE `id` IN ($placeholders) AND `status` IN ($statuses) "
+    "FOR UPDATE SKIP LOCKED"
+)
+
+_COPY_TEMPLATE = Template(
+    "INSERT INTO `$archive` ($columns) SELECT $columns FROM `$table` "
+    "WHERE `$key_column` IN ($placeholders)"
+)
+
+_DELETE_TEMPLATE = Template(
+    "DELETE FROM `$table` WHERE `$key_column` IN ($placeholders)"
+)
+
+# Код ошибки MySQL при попытке создать уже существующий индекс.
+_DUPLICATE_KEY_NAME_ERRNO: int = 1061
+
+
+# ----------------------------------------------------------------------------
+def _copy_and_delete(
+    connection: MySQLPooledConnection, table: str, key_column: str, ids: List[int]
+) -> None:
+    """_copy_and_delete переносит строки таблицы с указанными ключами в архивную."""
+    columns: str = ", ".join(f"`{column}`" for column in TABLE_COLUMNS[table])
+    placeholders: str = ", ".join(["%s"] * len(ids))
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _COPY_TEMPLATE.substitute(
+                archive=f"{table}Archive",
+                table=table,
+                columns=columns,
+                key_column=key_column,
+                placeholders=placeholders,
+            ),
+            ids,
+        )
+        cursor.execute(
+            _DELETE_TEMPLATE.substitute(
+                table=table, key_column=key_column, placeholders=placeholders
+            ),
+            ids,
+        )
+
+
+# ----------------------------------------------------------------------------
+def _get_partitions(first_year: int, last_year: int) -> str:
+    """_get_partitions возвращает описание секций по годам и секции будущих строк."""
+    return ", ".join(
+        [
+            *(
+                f"PARTITION `p{year}` VALUES LESS THAN ({year + 1})"
+                for year in range(first_year, last_year + 1)
+            ),
+            "PARTITION `p_future` VALUES LESS THAN MAXVALUE",
+        ]
+    )
+
+
+# _____________________________________________________________________________
+class HotTableArchiver:
+    """HotTableArchiver класс переноса закрытых строк в архивные таблицы.
+
+    Строки переносятся пакетами: каждый пакет - отдельная транзакция,
+    которая выбирает строки неблокирующим чтением, блокирует только
+    выбранные строки по первичному ключу (SKIP LOCKED), копирует их
+    вместе со строками зависимых таблиц в архивные таблицы и удаляет из рабочих.
+    Между пакетами архиватор ожидает так, чтобы транзакции архивации занимали
+    не более duty_cycle времени, поэтому нагрузка на БД ограничена
+    и при медленных транзакциях снижается сама.
+
+    Архивные таблицы рабочих таблиц секционированы по году создания строки,
+    поэтому выборки за период читают только нужные секции, а старые годы
+    можно удалить целиком (`ALTER TABLE ... DROP PARTITION`).
+
+    *Секции следующих лет добавляются методом create_archive_tables,
+    который следует вызывать при запуске и не реже раза в год.
+    Чтение рабочих и архивных строк вместе - см. `HistoryRepository`.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+        __policies (Tuple[ArchivePolicy, ...]): Правила архивации таблиц.
+        __batch_size (int): Максимальное количество строк в пакете.
+        __duty_cycle (float): Доля времени, которую занимают транзакции архивации.
+        __interval (float): Пауза между проходами по всем таблицам в секундах.
+        __first_partition_year (int): Год первой секции архивных таблиц.
+        __archive_task (Optional[asyncio.Task]): Фоновая задача архивации.
+    """
+
+    __api: AsyncMySQLAPI
+    __policies: Tuple[ArchivePolicy, ...]
+    __batch_size: int
+    __duty_cycle: float
+    __interval: float
+    __first_partition_year: int
+    __archive_task: Optional[asyncio.Task]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        api: AsyncMySQLAPI,
+        policies: Tuple[ArchivePolicy, ...] = NEKOSHOP_ARCHIVE_POLICIES,
+        batch_size: int = 500,
+        duty_cycle: float = 0.25,
+        interval: float = 3600.0,
+        first_partition_year: int = 2024,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+            policies (Tuple[ArchivePolicy, ...], optional): Правила архивации таблиц.
+                По умолчанию NEKOSHOP_ARCHIVE_POLICIES.
+            batch_size (int, optional): Максимальное количество строк в пакете.
+                                        По умолчанию 500.
+            duty_cycle (float, optional): Доля времени, которую занимают транзакции
+                                          архивации. По умолчанию 0.25.
+            interval (float, optional): Пауза между проходами по всем таблицам
+                                        в секундах. По умолчанию 3600.0.
+            first_partition_year (int, optional): Год первой секции архивных таблиц,
+                                                  она хранит и все более ранние строки.
+                                                  По умолчанию 2024.
+
+        Raises:
+            ValueError: Возбуждается если размер пакета меньше 1,
+                        либо доля времени не в промежутке (0, 1].
+        """
+        if batch_size < 1 or not 0 < duty_cycle <= 1:
+            raise ValueError("Недопустимые параметры архивации!")
+
+        self.__api = api
+        self.__policies = policies
+        self.__batch_size = batch_size
+        self.__duty_cycle = duty_cycle
+        self.__interval = interval
+        self.__first_partition_year = first_partition_year
+        self.__archive_task = None
+
+    # -------------------------------------------------------------------------
+    async def create_archive_tables(self) -> None:
+        """create_archive_tables создаёт архивные таблицы и секции до следующего года.
+
+        *Также создаётся индекс (`status`, `created_at`) рабочих таблиц,
+        по которому выбираются строки для архивации.
+        """
+        last_year: int = datetime.now().year + 1
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                for policy in self.__policies:
+                    try:
+                        cursor.execute(
+                            _CANDIDATES_INDEX_TEMPLATE.substitute(table=policy.table)
+                        )
+                    except MySQLError as error:
+                        if error.errno != _DUPLICATE_KEY_NAME_ERRNO:
+                            raise
+
+                    for table in (
+                        policy.table,
+                        *(dependent.table for dependent in policy.dependents),
+                    ):
+                        cursor.execute(
+                            _CREATE_ARCHIVE_TEMPLATE.substitute(
+                                archive=f"{table}Archive", table=table
+                            )
+                        )
+
+                    cursor.execute(_SELECT_PARTITIONS_QUERY, (policy.archive_table,))
+                    partition_years: List[int] = [
+                        int(name[1:])
+                        for (name,) in cursor.fetchall()
+                        if name != "p_future"
+                    ]
+
+                    if not partition_years:
+                        cursor.execute(
+                            _PARTITION_TEMPLATE.substitute(
+                                archive=policy.archive_table,
+                                partitions=_get_partitions(
+                                    first_year=self.__first_partition_year,
+                                    last_year=last_year,
+                                ),
+                            )
+                        )
+
+                    elif max(partition_years) < last_year:
+                        cursor.execute(
+                            _ADD_PARTITIONS_TEMPLATE.substitute(
+                                archive=policy.archive_table,
+                                partitions=_get_partitions(
+                                    first_year=max(partition_years) + 1,
+                                    last_year=last_year,
+                                ),
+                            )
+                        )
+
+        await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def archive_batch(self, policy: ArchivePolicy) -> int:
+        """archive_batch переносит в архив один пакет закрытых строк таблицы.
+
+        Args:
+            policy (ArchivePolicy): Правило архивации таблицы.
+
+        Returns:
+            int: Количество перенесённых строк рабочей таблицы.
+        """
+        statuses: str = ", ".join(["%s"] * len(policy.closed_statuses))
+        select_query: str = _SELECT_CANDIDATES_TEMPLATE.substitute(
+            table=policy.table, statuses=statuses
+        )
+
+        def transaction(connection: MySQLPooledConnection) -> int:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    select_query,
+                    (
+                        *policy.closed_statuses,
+                        int(policy.retention.total_seconds()),
+                        self.__batch_size,
+                    ),
+                )
+                candidate_ids: List[int] = [row[0] for row in cursor.fetchall()]
+
+                if not candidate_ids:
+                    return 0
+
+                cursor.execute(
+                    _LOCK_BATCH_TEMPLATE.substitute(
+                        table=policy.table,
+                        placeholders=", ".join(["%s"] * len(candidate_ids)),
+                        statuses=statuses,
+                    ),
+                    (*candidate_ids, *policy.closed_statuses),
+                )
+                ids: List[int] = [row[0] for row in cursor.fetchall()]
+
+            if not ids:
+                return 0
+
+            # Зависимые строки переносятся первыми: внешние ключи не всегда каскадные.
+            for dependent in policy.dependents:
+                _copy_and_delete(
+                    connection=connection,
+                    table=dependent.table,
+                    key_column=dependent.key_column,
+                    ids=ids,
+                )
+
+            _copy_and_delete(
+                connection=connection, table=policy.table, key_column="id", ids=ids
+            )
+
+            return len(ids)
+
+        return await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def archive_table(self, policy: ArchivePolicy) -> int:
+        """archive_table переносит в архив все закрытые строки таблицы пакетами.
+
+        Args:
+            policy (ArchivePolicy): Правило архивации таблицы.
+
+        Returns:
+            int: Количество перенесённых строк рабочей таблицы.
+        """
+        archived_amount: int = 0
+
+        while True:
+            started_at: float = time.monotonic()
+            batch_amount: int = await self.archive_batch(policy=policy)
+            archived_amount += batch_amount
+
+            if batch_amount < self.__batch_size:
+                return archived_amount
+
+            elapsed: float = time.monotonic() - started_at
+            await asyncio.sleep(elapsed * (1 - self.__duty_cycle) / self.__duty_cycle)
+
+    # -------------------------------------------------------------------------
+    async def archive_all(self) -> Dict[str, int]:
+        """archive_all переносит в архив закрытые строки всех таблиц.
+
+        Returns:
+            Dict[str, int]: Количество перенесённых строк по названию таблицы.
+        """
+        return {
+            policy.table: await self.archive_table(policy=policy)
+            for policy in self.__policies
+        }
+
+    # -------------------------------------------------------------------------
+    def start(self) -> None:
+        """start запускает фоновую задачу архивации."""
+        self.__archive_task = asyncio.get_running_loop().create_task(
+            self.__run_archive()
+        )
+
+    # -------------------------------------------------------------------------
+    async def stop(self) -> None:
+        """stop останавливает фоновую задачу архивации.
+
+        *Транзакция прерванного пакета либо завершается, либо откатывается целиком.
+        """
+        if self.__archive_task is not None:
+            self.__archive_task.cancel()
+
+            try:
+                await self.__archive_task
+            except asyncio.CancelledError:
+                pass
+
+            self.__archive_task = None
+
+    # -------------------------------------------------------------------------
+    async def __run_archive(self) -> None:
+        """__run_archive переносит закрытые строки в архив по интервалу."""
+        while True:
+            try:
+                await self.archive_all()
+            except Exception as error:
+                print(f"Возникла ошибка при архивации таблиц! {error}")
+
+            await asyncio.sleep(self.__interval)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль предназначен для хранения типов,
+описывающих перенос закрытых строк из рабочих таблиц в архивные.
+"""
+
+__all__: list[str] = ["ArchiveDependent", "ArchivePolicy"]
+
+from datetime import timedelta
+from dataclasses import dataclass
+
+from typing import Tuple
+
+
+# _____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class ArchiveDependent:
+    """ArchiveDependent класс для представления таблицы, зависящей от архивируемой.
+
+    Attributes:
+        table (str): Название зависимой таблицы.
+        key_column (str): Столбец со ссылкой на идентификатор архивируемой строки.
+    """
+
+    table: str
+    key_column: str
+
+
+# _____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class ArchivePolicy:
+    """ArchivePolicy класс для представления правила архивации таблицы.
+
+    Attributes:
+        table (str): Название рабочей таблицы.
+        closed_statuses (Tuple[str, ...]): Статусы строк, которые больше не изменяются.
+        retention (timedelta): Возраст строки (по `created_at`), после которого
+                               закрытая строка переносится в архив.
+        dependents (Tuple[ArchiveDependent, ...]): Зависимые таблицы, строки которых
+                                                   переносятся вместе со строкой.
+    """
+
+    table: str
+    closed_statuses: Tuple[str, ...]
+    retention: timedelta
+    dependents: Tuple[ArchiveDependent, ...] = ()
+
+    # -------------------------------------------------------------------------
+    @property
+    def archive_table(self) -> str:
+        return f"{self.table}Archive"
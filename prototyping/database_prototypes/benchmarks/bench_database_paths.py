@@ -0,0 +1,556 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `bench_database_paths` сравнивает способы выполнения запросов API БД:
+независимое асинхронное соединение (`separate`),
+запрос через пул в цикле событий (`pool_query`, execute_sql_query_use_pool)
+и транзакцию через пул в отдельном потоке (`pool`, execute_transaction_use_pool),
+при возрастающем количестве одновременных запросов и разных размерах пула.
+
+Для каждого способа выводятся пропускная способность, перцентили задержки,
+ожидание соединения и задержка цикла событий. Результаты можно сохранить в JSON
+и сравнить с предыдущим запуском.
+
+Запуск из каталога `prototyping`:
+    python -m database_prototypes.benchmarks.bench_database_paths --backend sqlite
+    python -m database_prototypes.benchmarks.bench_database_paths --backend mysql \\
+        --pool-sizes 3 8 --concurrency 1 8 32 --mix lookup=70 catalogue=25 order=5 \\
+        --output after.json --baseline before.json
+
+*Над MySQL используется существующая схема NekoShop; добавленные строки удаляются.
+Независимое соединение не поддерживает одновременные запросы,
+поэтому запросы к нему выполняются по очереди.
+Над MySQL способ `pool_query` блокирует цикл событий на время запроса, что видно
+по задержке цикла, и не замеряет ожидание соединения; над SQLite тот же метод
+выполняется транзакцией пула. Результаты запросов `pool_query` не возвращает.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import json
+import time
+import random
+import asyncio
+import argparse
+import datetime
+import dataclasses
+
+from string import Template
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .benchmark_tools import create_mysql_database, create_sqlite_database, percentile
+
+
+_BENCHMARK_NAME: str = "benchmark"
+_BENCHMARK_PHONE: str = "+00000000000"
+_PRODUCTS_PER_SERVICE: int = 50
+
+# Запросы смеси: (запрос, возвращает ли строки).
+_QUERIES: Dict[str, Tuple[str, bool]] = {
+    "lookup": (
+        "SELECT `id`, `title`, `description`, `price`, `quantity` "
+        "FROM `Product` WHERE `id` = %s",
+        True,
+    ),
+    "catalogue": (
+        "SELECT `id`, `title`, `price` FROM `Product` "
+        "WHERE `service_id` = %s AND `is_blocked` = 0 ORDER BY `id` LIMIT 20",
+        True,
+    ),
+    "order": (
+        "INSERT INTO `Order` (`product_id`, `customer_user_id`, `total_price`, "
+        "`created_at`) VALUES (%s, %s, %s, %s)",
+        False,
+    ),
+}
+
+
+# ____________________________________________________________________________
+@dataclasses.dataclass(frozen=True, slots=True)
+class _SeedData:
+    user_id: int
+    service_ids: List[int]
+    product_ids: List[int]
+
+
+# ____________________________________________________________________________
+@dataclasses.dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """BenchmarkResult класс результата замера одного способа и нагрузки.
+
+    Attributes:
+        backend (str): СУБД ("mysql", "sqlite").
+        path (str): Способ выполнения запросов ("separate", "pool_query", "pool").
+        pool_size (int): Размер пула, либо 0 для независимого соединения.
+        concurrency (int): Количество одновременных запросов.
+        operations (int): Количество выполненных запросов.
+        errors (int): Количество запросов, завершившихся ошибкой.
+        throughput (float): Запросов в секунду.
+        latency_p50_ms (float): Медиана задержки запроса.
+        latency_p95_ms (float): 95-й перцентиль задержки запроса.
+        latency_p99_ms (float): 99-й перцентиль задержки запроса.
+        wait_p50_ms (float): Медиана ожидания соединения.
+        wait_p99_ms (float): 99-й перцентиль ожидания соединения.
+        loop_lag_p99_ms (float): 99-й перцентиль задержки цикла событий.
+        loop_lag_max_ms (float): Наибольшая задержка цикла событий.
+    """
+
+    backend: str
+    path: str
+    pool_size: int
+    concurrency: int
+    operations: int
+    errors: int
+    throughput: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    wait_p50_ms: float
+    wait_p99_ms: float
+    loop_lag_p99_ms: float
+    loop_lag_max_ms: float
+
+    # -------------------------------------------------------------------------
+    @property
+    def key(self) -> Tuple[str, str, int, int]:
+        return self.backend, self.path, self.pool_size, self.concurrency
+
+
+# ----------------------------------------------------------------------------
+def parse_mix(items: Sequence[str]) -> Dict[str, int]:
+    """parse_mix разбирает веса запросов смеси вида `lookup=70`.
+
+    Raises:
+        ValueError: Возбуждается если запрос неизвестен, либо вес некорректен.
+
+    Returns:
+        Dict[str, int]: Веса запросов по названию.
+    """
+    mix: Dict[str, int] = {}
+
+    for item in items:
+        name, _, weight = item.partition("=")
+
+        if name not in _QUERIES or not weight.isdigit():
+            raise ValueError(f"Некорректный запрос смеси: {item}")
+
+        mix[name] = int(weight)
+
+    if not any(mix.values()):
+        raise ValueError("Сумма весов смеси должна быть больше 0!")
+
+    return mix
+
+
+# ----------------------------------------------------------------------------
+def _seed(connection: Any) -> _SeedData:
+    with connection.cursor() as cursor:
+        _cleanup_rows(cursor=cursor)
+
+        cursor.execute(
+            "SELECT COUNT(*) FROM `SupportedInterfaceLanguage` WHERE `code` = %s",
+            ("bm",),
+        )
+
+        if cursor.fetchone()[0] == 0:
+            cursor.execute(
+                "INSERT INTO `SupportedInterfaceLanguage` (`code`, `name`) "
+                "VALUES (%s, %s)",
+                ("bm", _BENCHMARK_NAME),
+            )
+
+        cursor.execute(
+            "INSERT INTO `User` (`phone_number`, `interface_language_code`) "
+            "VALUES (%s, %s)",
+            (_BENCHMARK_PHONE, "bm"),
+        )
+        user_id: int = cursor.lastrowid
+
+        cursor.execute(
+            "INSERT INTO `Category` (`name`, `description`) VALUES (%s, %s)",
+            (_BENCHMARK_NAME, _BENCHMARK_NAME),
+        )
+        category_id: int = cursor.lastrowid
+
+        service_ids: List[int] = []
+        product_ids: List[int] = []
+
+        for service_index in range(4):
+            cursor.execute(
+                "INSERT INTO `Service` (`category_id`, `name`, `description`, `image`) "
+                "VALUES (%s, %s, %s, %s)",
+                (category_id, f"{_BENCHMARK_NAME}_{service_index}", "", b""),
+            )
+            service_ids.append(cursor.lastrowid)
+
+            for product_index in range(_PRODUCTS_PER_SERVICE):
+                cursor.execute(
+                    "INSERT INTO `Product` (`owner_id`, `service_id`, `title`, "
+                    "`description`, `image`, `price`, `quantity`) "
+                    "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                    (
+                        user_id,
+                        service_ids[-1],
+                        f"product {product_index}",
+                        "benchmark product",
+                        b"",
+                        Decimal("9.99"),
+                        100,
+                    ),
+                )
+                product_ids.append(cursor.lastrowid)
+
+    return _SeedData(user_id=user_id, service_ids=service_ids, product_ids=product_ids)
+
+
+# ----------------------------------------------------------------------------
+def _cleanup_rows(cursor: Any) -> None:
+    cursor.execute(
+        "DELETE FROM `Order` WHERE `customer_user_id` IN "
+        "(SELECT `id` FROM `User` WHERE `phone_number` = %s)",
+        (_BENCHMARK_PHONE,),
+    )
+    cursor.execute("DELETE FROM `Category` WHERE `name` = %s", (_BENCHMARK_NAME,))
+    cursor.execute("DELETE FROM `User` WHERE `phone_number` = %s", (_BENCHMARK_PHONE,))
+
+
+# ----------------------------------------------------------------------------
+def _cleanup(connection: Any) -> None:
+    with connection.cursor() as cursor:
+        _cleanup_rows(cursor=cursor)
+
+
+# ____________________________________________________________________________
+class _LoopLagSampler:
+    """_LoopLagSampler замеряет задержку пробуждения цикла событий."""
+
+    __interval: float
+    __samples: List[float]
+    __task: Optional[asyncio.Task]
+
+    # -------------------------------------------------------------------------
+    def __init__(self, interval: float = 0.005) -> None:
+        self.__interval = interval
+        self.__samples = []
+        self.__task = None
+
+    # -------------------------------------------------------------------------
+    def start(self) -> None:
+        self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    # -------------------------------------------------------------------------
+    async def stop(self) -> List[float]:
+        if self.__task is not None:
+            self.__task.cancel()
+
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+
+        return sorted(self.__samples)
+
+    # -------------------------------------------------------------------------
+    async def __run(self) -> None:
+        while True:
+            started_at: float = time.perf_counter()
+            await asyncio.sleep(self.__interval)
+            self.__samples.append(
+                max(0.0, time.perf_counter() - started_at - self.__interval)
+            )
+
+
+# ----------------------------------------------------------------------------
+def _create_parameters(
+    name: str, seed: _SeedData, generator: random.Random
+) -> Tuple[Any, ...]:
+    if name == "lookup":
+        return (generator.choice(seed.product_ids),)
+
+    if name == "catalogue":
+        return (generator.choice(seed.service_ids),)
+
+    return (
+        generator.choice(seed.product_ids),
+        seed.user_id,
+        Decimal("9.99"),
+        datetime.datetime.now().replace(microsecond=0),
+    )
+
+
+# ----------------------------------------------------------------------------
+def _format_literal(value: Any) -> str:
+    if isinstance(value, (int, Decimal)):
+        return str(value)
+
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat(sep=" ")
+
+    return "'{}'".format(str(value).replace("'", "''"))
+
+
+# ----------------------------------------------------------------------------
+def _create_template(
+    query: str, values: Tuple[Any, ...]
+) -> Tuple[Template, Dict[str, str]]:
+    parts: List[str] = query.replace("$", "$$").split("%s")
+    query_data: Dict[str, str] = {
+        f"value_{index}": _format_literal(value) for index, value in enumerate(values)
+    }
+    template_string: str = parts[0] + "".join(
+        f"${{value_{index}}}{part}" for index, part in enumerate(parts[1:])
+    )
+
+    return Template(template_string), query_data
+
+
+# ----------------------------------------------------------------------------
+async def run_benchmark(
+    backend: str,
+    path: str,
+    pool_size: int,
+    concurrency: int,
+    operations: int,
+    mix: Dict[str, int],
+    seed_value: int = 0,
+) -> BenchmarkResult:
+    """run_benchmark выполняет замер одного способа выполнения запросов.
+
+    Args:
+        backend (str): СУБД ("mysql", "sqlite").
+        path (str): Способ выполнения запросов ("separate", "pool_query", "pool").
+        pool_size (int): Размер пула соединений.
+        concurrency (int): Количество одновременных запросов.
+        operations (int): Количество запросов.
+        mix (Dict[str, int]): Веса запросов смеси.
+        seed_value (int, optional): Начальное значение генератора. По умолчанию 0.
+
+    Returns:
+        BenchmarkResult: Результат замера.
+    """
+    create_database = (
+        create_sqlite_database if backend == "sqlite" else create_mysql_database
+    )
+    # execute_sql_query_use_pool не читает результаты запросов.
+    database = (
+        await create_database(pool_size=pool_size, consume_results=True)
+        if backend == "mysql" and path == "pool_query"
+        else await create_database(pool_size=pool_size)
+    )
+    api = database.api
+
+    seed: _SeedData = await api.execute_transaction_use_pool(_seed)
+
+    generator = random.Random(seed_value)
+    names: List[str] = generator.choices(
+        population=list(mix), weights=list(mix.values()), k=operations
+    )
+    parameters: List[Tuple[Any, ...]] = [
+        _create_parameters(name=name, seed=seed, generator=generator) for name in names
+    ]
+
+    latencies: List[float] = []
+    waits: List[float] = []
+    errors: int = 0
+    next_index: int = 0
+
+    api.set_transaction_observer(lambda wait, _, __: waits.append(wait))
+
+    async def execute_separate(query: str, values: Tuple[Any, ...], fetch: bool) -> None:
+        queued_at: float = time.perf_counter()
+
+        async def operation(connection: Any) -> None:
+            waits.append(time.perf_counter() - queued_at)
+
+            async with await connection.cursor() as cursor:
+                await cursor.execute(query, values)
+
+                if fetch:
+                    await cursor.fetchall()
+
+                await connection.commit()
+
+        await api.execute_use_connection_with_database(operation)
+
+    async def execute_pool(query: str, values: Tuple[Any, ...], fetch: bool) -> None:
+        def transaction(pooled_connection: Any) -> None:
+            with pooled_connection.cursor() as cursor:
+                cursor.execute(query, values)
+
+                if fetch:
+                    cursor.fetchall()
+
+        await api.execute_transaction_use_pool(transaction)
+
+    async def execute_pool_query(query: str, values: Tuple[Any, ...], _: bool) -> None:
+        query_template, query_data = _create_template(query=query, values=values)
+
+        await api.execute_sql_query_use_pool(
+            query_template=query_template, query_data=query_data
+        )
+
+    execute = {
+        "separate": execute_separate,
+        "pool_query": execute_pool_query,
+        "pool": execute_pool,
+    }[path]
+
+    async def worker() -> None:
+        nonlocal errors, next_index
+
+        while next_index < operations:
+            index: int = next_index
+            next_index += 1
+
+            query, fetch = _QUERIES[names[index]]
+            started_at: float = time.perf_counter()
+
+            try:
+                await execute(query, parameters[index], fetch)
+            except Exception as error:
+                errors += 1
+
+                if errors == 1:
+                    print(f"Возникла ошибка при выполнении запроса! {error!r}")
+
+            latencies.append(time.perf_counter() - started_at)
+
+    sampler = _LoopLagSampler()
+    sampler.start()
+
+    try:
+        started: float = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed: float = time.perf_counter() - started
+
+    finally:
+        lags: List[float] = await sampler.stop()
+        api.set_transaction_observer(None)
+
+        await api.execute_transaction_use_pool(_cleanup)
+        await database.close_connection_with_database()
+        await database.close_pool()
+
+    latencies.sort()
+    waits.sort()
+
+    return BenchmarkResult(
+        backend=backend,
+        path=path,
+        pool_size=0 if path == "separate" else pool_size,
+        concurrency=concurrency,
+        operations=operations,
+        errors=errors,
+        throughput=operations / elapsed,
+        latency_p50_ms=percentile(latencies, 0.50) * 1000,
+        latency_p95_ms=percentile(latencies, 0.95) * 1000,
+        latency_p99_ms=percentile(latencies, 0.99) * 1000,
+        wait_p50_ms=percentile(waits, 0.50) * 1000,
+        wait_p99_ms=percentile(waits, 0.99) * 1000,
+        loop_lag_p99_ms=percentile(lags, 0.99) * 1000,
+        loop_lag_max_ms=(lags[-1] if lags else 0.0) * 1000,
+    )
+
+
+# ----------------------------------------------------------------------------
+def format_result(
+    result: BenchmarkResult, baseline: Optional[BenchmarkResult] = None
+) -> str:
+    """format_result возвращает строку отчёта; с baseline - с изменением к нему.
+
+    Returns:
+        str: Строка отчёта.
+    """
+    line: str = (
+        f"{result.backend:<6} {result.path:<10} pool={result.pool_size:<3} "
+        f"concurrency={result.concurrency:<4} ops/s={result.throughput:10.1f} "
+        f"p50={result.latency_p50_ms:8.2f} p95={result.latency_p95_ms:8.2f} "
+        f"p99={result.latency_p99_ms:8.2f} ms "
+        f"wait p50={result.wait_p50_ms:7.2f} p99={result.wait_p99_ms:7.2f} ms "
+        f"lag p99={result.loop_lag_p99_ms:6.2f} max={result.loop_lag_max_ms:6.2f} ms "
+        f"errors={result.errors}"
+    )
+
+    if baseline is not None and baseline.throughput > 0:
+        line += (
+            f" | ops/s {(result.throughput / baseline.throughput - 1) * 100:+6.1f}%"
+            f" p99 {result.latency_p99_ms - baseline.latency_p99_ms:+8.2f} ms"
+        )
+
+    return line
+
+
+# ----------------------------------------------------------------------------
+def load_results(filepath: str) -> Dict[Tuple[str, str, int, int], BenchmarkResult]:
+    """load_results загружает результаты, сохранённые параметром --output.
+
+    Returns:
+        Dict[Tuple[str, str, int, int], BenchmarkResult]: Результаты по ключу замера.
+    """
+    with open(filepath, encoding="utf-8") as file:
+        results = [BenchmarkResult(**item) for item in json.load(file)]
+
+    return {result.key: result for result in results}
+
+
+# ----------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--backend", choices=("mysql", "sqlite"), default="mysql")
+    parser.add_argument(
+        "--paths",
+        nargs="+",
+        choices=("separate", "pool_query", "pool"),
+        default=["separate", "pool_query", "pool"],
+    )
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[3, 8])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument(
+        "--mix", nargs="+", default=["lookup=70", "catalogue=25", "order=5"]
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Сохранить результаты в JSON файл.")
+    parser.add_argument("--baseline", help="Сравнить с результатами из JSON файла.")
+    arguments = parser.parse_args()
+
+    mix: Dict[str, int] = parse_mix(arguments.mix)
+    baseline = load_results(arguments.baseline) if arguments.baseline else {}
+    results: List[BenchmarkResult] = []
+
+    for path in arguments.paths:
+        # Независимое соединение не зависит от размера пула.
+        pool_sizes: List[int] = (
+            arguments.pool_sizes[:1] if path == "separate" else arguments.pool_sizes
+        )
+
+        for pool_size in pool_sizes:
+            for concurrency in arguments.concurrency:
+                result: BenchmarkResult = asyncio.run(
+                    run_benchmark(
+                        backend=arguments.backend,
+                        path=path,
+                        pool_size=pool_size,
+                        concurrency=concurrency,
+                        operations=arguments.operations,
+                        mix=mix,
+                        seed_value=arguments.seed,
+                    )
+                )
+                results.append(result)
+                print(format_result(result=result, baseline=baseline.get(result.key)))
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump([dataclasses.asdict(result) for result in results], file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
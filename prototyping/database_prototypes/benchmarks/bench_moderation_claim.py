@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `bench_moderation_claim` замеряет пропускную способность выборки заявок
+на модерацию при одновременной работе нескольких обработчиков.
+
+Запуск из каталога `prototyping`:
+    python -m database_prototypes.benchmarks.bench_moderation_claim --requests 5000 --workers 1 4 16
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import argparse
+import asyncio
+import time
+
+from typing import List, Set, Tuple
+
+from ..moderation_module import (
+    AdminAssigner,
+    ModerationQueue,
+    ModerationRequest,
+    ModerationRequestKind,
+)
+from ..mysql_database_module.types import MySQLPooledConnection
+
+from .benchmark_tools import create_mysql_database
+
+
+# ----------------------------------------------------------------------------
+async def _notify_nothing(admin_id: int, request: ModerationRequest) -> None:
+    pass
+
+
+# ----------------------------------------------------------------------------
+def _seed_requests(connection: MySQLPooledConnection, amount: int) -> int:
+    """_seed_requests добавляет заявки на блокировку товара для замера.
+
+    Returns:
+        int: Наибольший идентификатор заявки до добавления.
+    """
+    table: str = ModerationRequestKind.BLOCK_PRODUCT.value
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COALESCE(MAX(`id`), 0) FROM `{table}`")
+        (last_id,) = cursor.fetchone()
+
+        # Товары для заявок не создаются, поэтому проверка внешних ключей отключается.
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        cursor.executemany(
+            f"INSERT INTO `{table}` (`product_id`, `status`, `created_at`) "
+            "VALUES (%s, 'open', NOW())",
+            [(index + 1,) for index in range(amount)],
+        )
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+    return last_id
+
+
+# ----------------------------------------------------------------------------
+def _delete_seeded_requests(connection: MySQLPooledConnection, last_id: int) -> None:
+    table: str = ModerationRequestKind.BLOCK_PRODUCT.value
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM `{table}` WHERE `id` > %s", (last_id,))
+
+
+# ----------------------------------------------------------------------------
+async def _claim_until_empty(
+    queue: ModerationQueue, claimed_ids: Set[int]
+) -> Tuple[int, int]:
+    claimed: int = 0
+    duplicates: int = 0
+
+    while requests := await queue.claim_batch():
+        for request in requests:
+            if request.request_id in claimed_ids:
+                duplicates += 1
+
+            claimed_ids.add(request.request_id)
+
+        claimed += len(requests)
+
+    return claimed, duplicates
+
+
+# ----------------------------------------------------------------------------
+async def run_benchmark(requests_amount: int, workers: int, batch_size: int) -> None:
+    database = await create_mysql_database(pool_size=workers)
+
+    last_id: int = await database.api.execute_transaction_use_pool(
+        lambda connection: _seed_requests(connection=connection, amount=requests_amount)
+    )
+
+    queues: List[ModerationQueue] = [
+        ModerationQueue(
+            api=database.api,
+            assigner=AdminAssigner(admin_ids=[1]),
+            notify=_notify_nothing,
+            batch_size=batch_size,
+        )
+        for _ in range(workers)
+    ]
+    await queues[0].create_claim_indexes()
+
+    claimed_ids: Set[int] = set()
+
+    try:
+        started_at: float = time.perf_counter()
+        results: List[Tuple[int, int]] = await asyncio.gather(
+            *(_claim_until_empty(queue=queue, claimed_ids=claimed_ids) for queue in queues)
+        )
+        elapsed: float = time.perf_counter() - started_at
+
+    finally:
+        await database.api.execute_transaction_use_pool(
+            lambda connection: _delete_seeded_requests(connection=connection, last_id=last_id)
+        )
+        await database.close_connection_with_database()
+
+    claimed: int = sum(result[0] for result in results)
+    duplicates: int = sum(result[1] for result in results)
+
+    print(
+        f"workers={workers:<3} batch={batch_size:<4} claimed={claimed:<7} "
+        f"duplicates={duplicates:<3} elapsed={elapsed:8.3f}s "
+        f"throughput={claimed / elapsed:10.1f} req/s"
+    )
+
+
+# ----------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    arguments = parser.parse_args()
+
+    for workers in arguments.workers:
+        asyncio.run(
+            run_benchmark(
+                requests_amount=arguments.requests,
+                workers=workers,
+                batch_size=arguments.batch_size,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
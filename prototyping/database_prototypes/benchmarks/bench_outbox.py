@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `bench_outbox` замеряет время добавления задачи в очередь задач
+и пропускную способность выполнения задач несколькими обработчиками.
+
+Запуск из каталога `prototyping`:
+    python -m database_prototypes.benchmarks.bench_outbox --jobs 5000 --concurrency 1 16 64
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import argparse
+import asyncio
+import time
+
+from ..outbox_module import Outbox, OutboxJob
+from ..mysql_database_module.types import MySQLPooledConnection
+
+from .benchmark_tools import create_mysql_database
+
+
+# ----------------------------------------------------------------------------
+def _delete_jobs(connection: MySQLPooledConnection) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM `OutboxJob` WHERE `kind` = 'benchmark'")
+
+
+# ----------------------------------------------------------------------------
+async def run_benchmark(jobs_amount: int, concurrency: int, batch_size: int) -> None:
+    database = await create_mysql_database(pool_size=4)
+    outbox = Outbox(
+        api=database.api,
+        max_concurrency=concurrency,
+        batch_size=batch_size,
+        poll_interval=0.01,
+    )
+    completed: asyncio.Event = asyncio.Event()
+    completed_amount: int = 0
+
+    async def handle(job: OutboxJob) -> None:
+        nonlocal completed_amount
+
+        completed_amount += 1
+
+        if completed_amount == jobs_amount:
+            completed.set()
+
+    outbox.register(kind="benchmark", handler=handle)
+    await outbox.create_table()
+
+    try:
+        started_at: int = time.perf_counter_ns()
+
+        for index in range(jobs_amount):
+            outbox.enqueue_nowait(kind="benchmark", payload={"index": index})
+
+        enqueue_ns: float = (time.perf_counter_ns() - started_at) / jobs_amount
+
+        started: float = time.perf_counter()
+        outbox.start()
+        await completed.wait()
+        await outbox.stop()
+        elapsed: float = time.perf_counter() - started
+
+    finally:
+        await database.api.execute_transaction_use_pool(_delete_jobs)
+        await database.close_connection_with_database()
+
+    print(
+        f"concurrency={concurrency:<3} batch={batch_size:<4} jobs={jobs_amount:<7} "
+        f"enqueue={enqueue_ns:8.0f} ns/op elapsed={elapsed:8.3f}s "
+        f"throughput={jobs_amount / elapsed:10.1f} jobs/s"
+    )
+
+
+# ----------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    arguments = parser.parse_args()
+
+    for concurrency in arguments.concurrency:
+        asyncio.run(
+            run_benchmark(
+                jobs_amount=arguments.jobs,
+                concurrency=concurrency,
+                batch_size=arguments.batch_size,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `bench_pool_autosizing` проверяет изменение размера пула соединений
+под синтетической нагрузкой, меняющейся по фазам (например, ночь - пик - ночь).
+
+Каждая фаза задаётся как `длительность:одновременность`; транзакция выполняет
+запрос и удерживает соединение `--hold-ms` миллисекунд, имитируя задержку сервера.
+Раз в секунду выводятся размер пула, ожидание соединения и загрузка пула,
+а решения об изменении размера выводятся по мере их принятия.
+
+*Транзакции SQLite начинаются с BEGIN IMMEDIATE и выполняются по одной,
+поэтому для SQLite рост пула не увеличивает пропускную способность.
+Имитация пула (`--backend fake`) не требует БД и показывает поведение
+при пропускной способности, растущей вместе с пулом.
+
+Запуск из каталога `prototyping`:
+    python -m database_prototypes.benchmarks.bench_pool_autosizing --backend fake --phases 10:1 20:24 30:1
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import argparse
+import asyncio
+import time
+
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+from ..database_module import PoolAutosizer, PoolSizingDecision
+
+from .benchmark_tools import create_mysql_database, create_sqlite_database
+
+
+# _____________________________________________________________________________
+class _SimulatedPoolAPI:
+    """_SimulatedPoolAPI класс имитации API БД с пулом соединений.
+
+    *Транзакция занимает соединение на заданное время, не вызывая функцию-транзакцию;
+    установка соединения при увеличении пула также занимает заданное время.
+
+    Attributes:
+        __pool_size (int): Размер пула.
+        __free (int): Количество свободных соединений.
+        __active (int): Количество выполняющихся и ожидающих транзакций.
+        __hold_seconds (float): Время выполнения транзакции.
+        __connect_seconds (float): Время установки одного соединения.
+        __condition (asyncio.Condition): Ожидание свободного соединения.
+        __observer (Optional[Callable[[float, float, Optional[BaseException]], Any]]):
+            Наблюдатель транзакций.
+    """
+
+    __pool_size: int
+    __free: int
+    __active: int
+    __hold_seconds: float
+    __connect_seconds: float
+    __condition: asyncio.Condition
+    __observer: Optional[Callable[[float, float, Optional[BaseException]], Any]]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self, pool_size: int, hold_seconds: float, connect_seconds: float = 0.005
+    ) -> None:
+        self.__pool_size = pool_size
+        self.__free = pool_size
+        self.__active = 0
+        self.__hold_seconds = hold_seconds
+        self.__connect_seconds = connect_seconds
+        self.__condition = asyncio.Condition()
+        self.__observer = None
+
+    # -------------------------------------------------------------------------
+    @property
+    def pool_size(self) -> int:
+        return self.__pool_size
+
+    # -------------------------------------------------------------------------
+    @property
+    def active_transactions_amount(self) -> int:
+        return self.__active
+
+    # -------------------------------------------------------------------------
+    @property
+    def connections_in_use_amount(self) -> int:
+        return self.__pool_size - self.__free
+
+    # -------------------------------------------------------------------------
+    @property
+    def transaction_observer(
+        self,
+    ) -> Optional[Callable[[float, float, Optional[BaseException]], Any]]:
+        return self.__observer
+
+    # -------------------------------------------------------------------------
+    def set_transaction_observer(
+        self, observer: Optional[Callable[[float, float, Optional[BaseException]], Any]]
+    ) -> None:
+        self.__observer = observer
+
+    # -------------------------------------------------------------------------
+    async def resize_pool(self, pool_size: int) -> int:
+        if pool_size > self.__pool_size:
+            await asyncio.sleep(self.__connect_seconds * (pool_size - self.__pool_size))
+
+        async with self.__condition:
+            # Как и настоящие пулы, имитация закрывает только свободные соединения.
+            delta: int = max(pool_size - self.__pool_size, -self.__free)
+            self.__pool_size += delta
+            self.__free += delta
+            self.__condition.notify_all()
+
+        return self.__pool_size
+
+    # -------------------------------------------------------------------------
+    async def execute_transaction_use_pool(self, transaction: Any) -> None:
+        queued_at: float = time.perf_counter()
+        started_at: float = queued_at
+
+        self.__active += 1
+
+        try:
+            async with self.__condition:
+                await self.__condition.wait_for(lambda: self.__free > 0)
+                self.__free -= 1
+
+            started_at = time.perf_counter()
+
+            try:
+                await asyncio.sleep(self.__hold_seconds)
+
+            finally:
+                async with self.__condition:
+                    self.__free += 1
+                    self.__condition.notify()
+
+        finally:
+            self.__active -= 1
+
+            if self.__observer is not None:
+                self.__observer(
+                    started_at - queued_at, time.perf_counter() - started_at, None
+                )
+
+
+# ----------------------------------------------------------------------------
+def _parse_phase(value: str) -> Tuple[float, int]:
+    duration, concurrency = value.split(":")
+
+    return float(duration), int(concurrency)
+
+
+# ----------------------------------------------------------------------------
+async def run_benchmark(
+    backend: str,
+    phases: List[Tuple[float, int]],
+    min_size: int,
+    max_size: int,
+    hold_seconds: float,
+    evaluation_interval: float,
+    shrink_after: int,
+) -> None:
+    database: Any = None
+    saturation_errors: Tuple[Type[BaseException], ...] = (TimeoutError,)
+
+    if backend == "mysql":
+        # Транзакции MySQL ожидают соединение в очереди, а не завершаются PoolError.
+        database = await create_mysql_database(pool_size=min_size)
+    elif backend == "sqlite":
+        database = await create_sqlite_database(pool_size=min_size)
+
+    api: Any = (
+        _SimulatedPoolAPI(pool_size=min_size, hold_seconds=hold_seconds)
+        if database is None
+        else database.api
+    )
+    autosizer = PoolAutosizer(
+        api=api,
+        min_size=min_size,
+        max_size=max_size,
+        window_seconds=evaluation_interval * 2,
+        evaluation_interval=evaluation_interval,
+        sample_interval=evaluation_interval / 10,
+        shrink_after=shrink_after,
+        saturation_errors=saturation_errors,
+    )
+
+    def report(decision: PoolSizingDecision) -> None:
+        print(
+            f"    resize {decision.previous_size:>3} -> {decision.pool_size:<3} "
+            f"reason={decision.reason:<11} wait p95={decision.wait_p95_seconds * 1000:7.2f} ms "
+            f"utilization={decision.utilization:5.2f}"
+        )
+
+    autosizer.set_decision_observer(report)
+    autosizer.start()
+
+    def transaction(connection: Any) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+
+        time.sleep(hold_seconds)
+
+    completed: int = 0
+    errors: int = 0
+    concurrency: int = 0
+
+    async def worker(index: int) -> None:
+        nonlocal completed, errors
+
+        while True:
+            if index >= concurrency:
+                await asyncio.sleep(0.05)
+                continue
+
+            try:
+                await api.execute_transaction_use_pool(transaction)
+                completed += 1
+
+            except saturation_errors:
+                errors += 1
+                await asyncio.sleep(hold_seconds)
+
+    workers: List[asyncio.Task] = [
+        asyncio.create_task(worker(index))
+        for index in range(max(concurrency for _, concurrency in phases))
+    ]
+
+    started_at: float = time.perf_counter()
+
+    for phase_index, (duration, phase_concurrency) in enumerate(phases):
+        concurrency = phase_concurrency
+        phase_end: float = time.perf_counter() + duration
+
+        while time.perf_counter() < phase_end:
+            completed_before: int = completed
+            await asyncio.sleep(1.0)
+
+            print(
+                f"t={time.perf_counter() - started_at:6.1f}s phase={phase_index} "
+                f"concurrency={concurrency:<3} pool={autosizer.pool_size:<3} "
+                f"ops/s={completed - completed_before:<6} errors={errors:<5} "
+                f"wait p95={autosizer.wait_p95_seconds * 1000:7.2f} ms "
+                f"utilization={autosizer.utilization:5.2f}"
+            )
+
+    for task in workers:
+        task.cancel()
+
+    await asyncio.gather(*workers, return_exceptions=True)
+    await autosizer.stop()
+
+    grows: int = sum(
+        decision.pool_size > decision.previous_size for decision in autosizer.decisions
+    )
+    print(
+        f"{backend} resizes={len(autosizer.decisions)} grows={grows} "
+        f"shrinks={len(autosizer.decisions) - grows} final pool={autosizer.pool_size}"
+    )
+
+    if database is not None:
+        await database.close_connection_with_database()
+        await database.close_pool()
+
+
+# ----------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--backend", choices=("mysql", "sqlite", "fake"), default="mysql"
+    )
+    parser.add_argument(
+        "--phases", type=_parse_phase, nargs="+", default=[(10, 1), (20, 24), (30, 1)]
+    )
+    parser.add_argument("--min-size", type=int, default=2)
+    parser.add_argument("--max-size", type=int, default=16)
+    parser.add_argument("--hold-ms", type=float, default=5.0)
+    parser.add_argument("--evaluation-interval", type=float, default=1.0)
+    parser.add_argument("--shrink-after", type=int, default=3)
+    arguments = parser.parse_args()
+
+    asyncio.run(
+        run_benchmark(
+            backend=arguments.backend,
+            phases=arguments.phases,
+            min_size=arguments.min_size,
+            max_size=arguments.max_size,
+            hold_seconds=arguments.hold_ms / 1000,
+            evaluation_interval=arguments.evaluation_interval,
+            shrink_after=arguments.shrink_after,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
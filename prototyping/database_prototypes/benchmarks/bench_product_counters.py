@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `bench_product_counters` сравнивает учёт событий товаров запросом
+на каждое событие и накоплением событий в памяти с пакетной записью (ProductCounters).
+События распределены неравномерно: большая их часть приходится на несколько товаров.
+
+Запуск из каталога `prototyping`:
+    python -m database_prototypes.benchmarks.bench_product_counters --events 20000 --concurrency 16
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import argparse
+import asyncio
+import random
+import time
+
+from typing import List
+
+from ..counters_module import ProductCounterKind, ProductCounters
+from ..mysql_database_module.types import MySQLPooledConnection
+
+from .benchmark_tools import create_mysql_database
+
+
+_INCREMENT_QUERY: str = (
+    "INSERT INTO `ProductCounter` (`product_id`, `views`) VALUES (%s, 1) "
+    "ON DUPLICATE KEY UPDATE `views` = `views` + 1"
+)
+
+
+# ----------------------------------------------------------------------------
+def _delete_counters(connection: MySQLPooledConnection) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM `ProductCounter` WHERE `product_id` < 0")
+
+
+# ----------------------------------------------------------------------------
+async def run_benchmark(
+    events_amount: int, products_amount: int, concurrency: int
+) -> None:
+    database = await create_mysql_database(pool_size=concurrency)
+    api = database.api
+    counters = ProductCounters(api=api, flush_interval=0.5)
+    await counters.create_table()
+
+    # Отрицательные идентификаторы не пересекаются с товарами тестовой БД.
+    product_ids: List[int] = [
+        -(int(random.paretovariate(1.1)) % products_amount) - 1
+        for _ in range(events_amount)
+    ]
+
+    async def increment_per_event(worker: int) -> None:
+        for product_id in product_ids[worker::concurrency]:
+
+            def transaction(connection: MySQLPooledConnection) -> None:
+                with connection.cursor() as cursor:
+                    cursor.execute(_INCREMENT_QUERY, (product_id,))
+
+            await api.execute_transaction_use_pool(transaction)
+
+    try:
+        started: float = time.perf_counter()
+        await asyncio.gather(
+            *(increment_per_event(worker) for worker in range(concurrency))
+        )
+        per_event_elapsed: float = time.perf_counter() - started
+
+        await api.execute_transaction_use_pool(_delete_counters)
+
+        started = time.perf_counter()
+        counters.start()
+
+        for index, product_id in enumerate(product_ids):
+            counters.increment(product_id=product_id, kind=ProductCounterKind.VIEWS)
+
+            # Цикл событий освобождается, как при обработке отдельных обновлений.
+            if index % concurrency == 0:
+                await asyncio.sleep(0)
+
+        await counters.stop()
+        coalesced_elapsed: float = time.perf_counter() - started
+
+    finally:
+        await api.execute_transaction_use_pool(_delete_counters)
+        await database.close_connection_with_database()
+
+    for name, elapsed in (
+        ("per-event", per_event_elapsed),
+        ("coalesced", coalesced_elapsed),
+    ):
+        print(
+            f"{name:<10} events={events_amount:<7} products={products_amount:<6} "
+            f"concurrency={concurrency:<3} elapsed={elapsed:8.3f}s "
+            f"throughput={events_amount / elapsed:12.1f} events/s"
+        )
+
+    print(f"popular: {counters.popularity.top(limit=5)}")
+
+
+# ----------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    arguments = parser.parse_args()
+
+    asyncio.run(
+        run_benchmark(
+            events_amount=arguments.events,
+            products_amount=arguments.products,
+            concurrency=arguments.concurrency,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `benchmark_tools` содержит общие функции для замеров производительности,
+выполняемых над локальным сервером MySQL, либо над БД SQLite в памяти процесса.
+
+Данные для подключения берутся из переменных окружения:
+`MYSQL_HOST`, `MYSQL_PORT`, `MYSQL_USER`, `MYSQL_PASSWORD`, `MYSQL_DATABASE`.
+
+*Замеры изменяют данные в БД, поэтому их следует запускать над отдельной тестовой БД.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "get_connection_data_from_environment",
+    "create_mysql_database",
+    "create_sqlite_database",
+    "percentile",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import os
+
+from typing import Any, Dict, List
+
+from mysql.connector.aio import connect
+
+from ..mysql_database_module import AsyncMySQLAPI, AsyncMySQLDataBase
+from ..sqlite_database_module import AsyncSQLiteAPI, AsyncSQLiteDataBase
+
+
+# ----------------------------------------------------------------------------
+def get_connection_data_from_environment() -> Dict[str, Any]:
+    """get_connection_data_from_environment возвращает данные для подключения к БД.
+
+    Returns:
+        Dict[str, Any]: Данные для подключения к тестовому серверу MySQL.
+    """
+    return {
+        "host": os.environ.get("MYSQL_HOST", "127.0.0.1"),
+        "port": int(os.environ.get("MYSQL_PORT", "3306")),
+        "user": os.environ.get("MYSQL_USER", "root"),
+        "password": os.environ.get("MYSQL_PASSWORD", ""),
+        "database": os.environ.get("MYSQL_DATABASE", "nekoshop_benchmark"),
+    }
+
+
+# ----------------------------------------------------------------------------
+async def create_mysql_database(
+    pool_size: int, consume_results: bool = False
+) -> AsyncMySQLDataBase:
+    """create_mysql_database создаёт и подключает БД с настроенным API.
+
+    Args:
+        pool_size (int): Размер пула соединений.
+        consume_results (bool, optional): Дочитывать непрочитанные результаты
+            запросов автоматически. По умолчанию False.
+
+    Returns:
+        AsyncMySQLDataBase: БД с подключённым API.
+    """
+    database = AsyncMySQLDataBase(
+        connect_method=connect,
+        connection_data={
+            **get_connection_data_from_environment(),
+            "consume_results": consume_results,
+        },
+        api=AsyncMySQLAPI(),
+        pool_name=f"benchmark_pool_{pool_size}",
+        pool_size=pool_size,
+        open_pool_on_init=False,
+    )
+
+    await database.connect_api_to_database()
+
+    return database
+
+
+# ----------------------------------------------------------------------------
+async def create_sqlite_database(pool_size: int) -> AsyncSQLiteDataBase:
+    """create_sqlite_database создаёт БД SQLite в памяти со схемой NekoShop.
+
+    *Сервер не требуется, поэтому замеры можно выполнять без MySQL.
+
+    Args:
+        pool_size (int): Размер пула соединений.
+
+    Returns:
+        AsyncSQLiteDataBase: БД с подключённым API и созданными таблицами.
+    """
+    database = AsyncSQLiteDataBase(
+        connection_data={"database": ":memory:"},
+        api=AsyncSQLiteAPI(),
+        pool_name=f"benchmark_pool_{pool_size}",
+        pool_size=pool_size,
+    )
+
+    await database.connect_api_to_database()
+    await database.create_schema()
+
+    return database
+
+
+# ----------------------------------------------------------------------------
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """percentile возвращает перцентиль из отсортированных значений.
+
+    Args:
+        sorted_values (List[float]): Значения, отсортированные по возрастанию.
+        fraction (float): Доля перцентиля от 0 до 1.
+
+    Returns:
+        float: Значение перцентиля, либо 0.0 для пустого списка.
+    """
+    if not sorted_values:
+        return 0.0
+
+    index: int = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+
+    return sorted_values[index]
@@ -0,0 +1,3 @@
+__all__: list[str] = ["ProductSearch"]
+
+from .product_search import ProductSearch
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `product_search` реализует полнотекстовый поиск товаров
+по названию и описанию (индекс FULLTEXT), используемый inline-режимом бота.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["ProductSearch"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import re
+
+from typing import Any, List, Tuple
+
+from mysql.connector.errors import Error as MySQLError
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+
+
+# Парсер ngram разбивает текст на пары символов, поэтому поиск работает
+# для любого языка и находит товар по части слова.
+_CREATE_INDEX_QUERY: str = (
+    "CREATE FULLTEXT INDEX `title_description_ftx` "
+    "ON `Product` (`title`, `description`) WITH PARSER ngram"
+)
+
+_SEARCH_QUERY: str = (
+    "SELECT `id`, `title`, `description`, `price` FROM `Product` "
+    "WHERE MATCH (`title`, `description`) AGAINST (%s IN BOOLEAN MODE) "
+    "AND `is_blocked` = 0 "
+    "ORDER BY MATCH (`title`, `description`) AGAINST (%s IN BOOLEAN MODE) DESC, `id` "
+    "LIMIT %s OFFSET %s"
+)
+
+# Код ошибки MySQL при попытке создать уже существующий индекс.
+_DUPLICATE_KEY_NAME_ERRNO: int = 1061
+
+# Символы, являющиеся операторами полнотекстового поиска в режиме BOOLEAN MODE.
+_OPERATORS_PATTERN: re.Pattern = re.compile(r"[+\-<>()~*\"@]+")
+
+# Минимальная длина слова, совпадающая с ngram_token_size по умолчанию.
+_MIN_WORD_LENGTH: int = 2
+
+
+# ----------------------------------------------------------------------------
+def _build_boolean_query(query: str) -> str:
+    """_build_boolean_query возвращает запрос, требующий наличия всех слов."""
+    words: List[str] = [
+        word
+        for word in _OPERATORS_PATTERN.sub(" ", query).split()
+        if len(word) >= _MIN_WORD_LENGTH
+    ]
+
+    return " ".join(f'+"{word}"' for word in words)
+
+
+# _____________________________________________________________________________
+class ProductSearch:
+    """ProductSearch класс полнотекстового поиска незаблокированных товаров.
+
+    Слова запроса очищаются от операторов поиска, и каждое слово
+    становится обязательным, поэтому ввод пользователя не может изменить
+    смысл запроса. Результаты упорядочены по релевантности.
+
+    *Запрос без слов длиной от двух символов не выполняется.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+    """
+
+    __api: AsyncMySQLAPI
+
+    # -------------------------------------------------------------------------
+    def __init__(self, api: AsyncMySQLAPI) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+        """
+        self.__api = api
+
+    # -------------------------------------------------------------------------
+    async def create_index(self) -> None:
+        """create_index создаёт полнотекстовый индекс товаров, если он не существует."""
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                try:
+                    cursor.execute(_CREATE_INDEX_QUERY)
+                except MySQLError as error:
+                    if error.errno != _DUPLICATE_KEY_NAME_ERRNO:
+                        raise
+
+        await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def search(
+        self, query: str, offset: int = 0, limit: int = 20
+    ) -> List[Tuple[Any, ...]]:
+        """search ищет товары по названию и описанию.
+
+        *Сигнатура совместима с ProductSearchMethodType из модуля
+        inline_search_handler (telegram_scripts).
+
+        Args:
+            query (str): Текст запроса.
+            offset (int, optional): Количество пропускаемых результатов. По умолчанию 0.
+            limit (int, optional): Максимальное количество результатов. По умолчанию 20.
+
+        Returns:
+            List[Tuple[Any, ...]]: Строки (id, title, description, price).
+        """
+        boolean_query: str = _build_boolean_query(query=query)
+
+        if not boolean_query:
+            return []
+
+        def transaction(connection: MySQLPooledConnection) -> List[Tuple[Any, ...]]:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    _SEARCH_QUERY, (boolean_query, boolean_query, limit, offset)
+                )
+
+                return cursor.fetchall()
+
+        return await self.__api.execute_transaction_use_pool(transaction)
@@ -0,0 +1,5 @@
+__all__: list[str] = ["PopularityTracker", "ProductCounterKind", "ProductCounters"]
+
+from .popularity_tracker import PopularityTracker
+from .product_counters import ProductCounters
+from .types import ProductCounterKind
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `popularity_tracker` реализует приближённый подсчёт популярности товаров
+(count-min sketch) и хранение K самых популярных товаров (куча), чтобы каталог
+мог показывать популярные товары без запросов к БД.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["PopularityTracker"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import heapq
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Множитель, из которого получаются различные хеш-функции строк скетча.
+_ROW_SALT: int = 0x9E3779B1
+
+
+# _____________________________________________________________________________
+class PopularityTracker:
+    """PopularityTracker класс отслеживания самых популярных товаров.
+
+    Популярность товара оценивается скетчем count-min: depth строк по width
+    счётчиков, оценка - минимум счётчиков товара в строках. Оценка не меньше
+    точного значения и превышает его не более чем на долю ~e/width от суммы весов.
+    Счётчики увеличиваются консервативно (только минимальные), что уменьшает ошибку.
+
+    K товаров с наибольшей оценкой хранятся в словаре, а наименее популярный
+    из них находится кучей. Записи кучи с устаревшей оценкой пропускаются.
+
+    *Трекер не использует блокировки и рассчитан на работу в одном цикле событий.
+    Чтобы популярность отражала недавние события, следует периодически вызывать decay.
+
+    Attributes:
+        __size (int): Количество хранимых популярных товаров (K).
+        __width (int): Количество счётчиков в строке скетча.
+        __rows (List[array]): Строки скетча.
+        __top (Dict[int, int]): Популярные товары: идентификатор -> оценка.
+        __heap (List[Tuple[int, int]]): Куча (оценка, идентификатор) популярных товаров.
+    """
+
+    __size: int
+    __width: int
+    __rows: List[array]
+    __top: Dict[int, int]
+    __heap: List[Tuple[int, int]]
+
+    # -------------------------------------------------------------------------
+    def __init__(self, size: int = 50, width: int = 4096, depth: int = 4) -> None:
+        """__init__ конструктор.
+
+        Args:
+            size (int, optional): Количество хранимых популярных товаров. По умолчанию 50.
+            width (int, optional): Количество счётчиков в строке скетча.
+                                   По умолчанию 4096.
+            depth (int, optional): Количество строк скетча. По умолчанию 4.
+
+        Raises:
+            ValueError: Возбуждается если размеры меньше 1.
+        """
+        if min(size, width, depth) < 1:
+            raise ValueError("Размеры трекера популярности должны быть больше нуля!")
+
+        self.__size = size
+        self.__width = width
+        self.__rows = [array("q", bytes(8 * width)) for _ in range(depth)]
+        self.__top = {}
+        self.__heap = []
+
+    # -------------------------------------------------------------------------
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    # -------------------------------------------------------------------------
+    def observe(self, product_id: int, weight: int = 1) -> int:
+        """observe учитывает событие товара.
+
+        Args:
+            product_id (int): Идентификатор товара.
+            weight (int, optional): Вес события. По умолчанию 1.
+
+        Returns:
+            int: Оценка популярности товара после события.
+        """
+        indices: List[int] = self.__get_indices(product_id=product_id)
+        estimate: int = (
+            min(row[index] for row, index in zip(self.__rows, indices)) + weight
+        )
+
+        for row, index in zip(self.__rows, indices):
+            if row[index] < estimate:
+                row[index] = estimate
+
+        self.__offer(product_id=product_id, estimate=estimate)
+
+        return estimate
+
+    # -------------------------------------------------------------------------
+    def estimate(self, product_id: int) -> int:
+        """estimate возвращает оценку популярности товара.
+
+        Args:
+            product_id (int): Идентификатор товара.
+
+        Returns:
+            int: Оценка популярности товара.
+        """
+        indices: List[int] = self.__get_indices(product_id=product_id)
+
+        return min(row[index] for row, index in zip(self.__rows, indices))
+
+    # -------------------------------------------------------------------------
+    def top(self, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+        """top возвращает самые популярные товары.
+
+        Args:
+            limit (Optional[int], optional): Максимальное количество товаров.
+                                             По умолчанию None - все хранимые.
+
+        Returns:
+            List[Tuple[int, int]]: Пары (идентификатор товара, оценка)
+                                   по убыванию оценки.
+        """
+        return heapq.nlargest(
+            self.__size if limit is None else limit,
+            self.__top.items(),
+            key=lambda item: item[1],
+        )
+
+    # -------------------------------------------------------------------------
+    def seed(self, scores: Iterable[Tuple[int, int]]) -> None:
+        """seed учитывает известную популярность товаров (например, загруженную из БД).
+
+        Args:
+            scores (Iterable[Tuple[int, int]]): Пары (идентификатор товара, оценка).
+        """
+        for product_id, score in scores:
+            self.observe(product_id=product_id, weight=score)
+
+    # -------------------------------------------------------------------------
+    def discard(self, product_id: int) -> None:
+        """discard исключает товар из популярных (например, заблокированный).
+
+        *Оценка товара в скетче сохраняется; товар вернётся в популярные,
+        если его оценка снова превысит оценку наименее популярного из них.
+
+        Args:
+            product_id (int): Идентификатор товара.
+        """
+        self.__top.pop(product_id, None)
+
+    # -------------------------------------------------------------------------
+    def decay(self) -> None:
+        """decay уменьшает вдвое все оценки, чтобы старые события весили меньше новых."""
+        for row in self.__rows:
+            for index in range(self.__width):
+                row[index] >>= 1
+
+        self.__top = {
+            product_id: estimate >> 1 for product_id, estimate in self.__top.items()
+        }
+        self.__heap = [
+            (estimate, product_id) for product_id, estimate in self.__top.items()
+        ]
+        heapq.heapify(self.__heap)
+
+    # -------------------------------------------------------------------------
+    def __get_indices(self, product_id: int) -> List[int]:
+        return [
+            hash((row_number * _ROW_SALT, product_id)) % self.__width
+            for row_number in range(len(self.__rows))
+        ]
+
+    # -------------------------------------------------------------------------
+    def __offer(self, product_id: int, estimate: int) -> None:
+        if product_id not in self.__top and len(self.__top) >= self.__size:
+            least_estimate, least_product_id = self.__peek_least()
+
+            if estimate <= least_estimate:
+                return
+
+            heapq.heappop(self.__heap)
+            del self.__top[least_product_id]
+
+        self.__top[product_id] = estimate
+        heapq.heappush(self.__heap, (estimate, product_id))
+
+        # Устаревшие записи удаляются, чтобы куча не росла неограниченно.
+        if len(self.__heap) > 4 * self.__size:
+            self.__heap = [
+                (estimate, product_id) for product_id, estimate in self.__top.items()
+            ]
+            heapq.heapify(self.__heap)
+
+    # -------------------------------------------------------------------------
+    def __peek_least(self) -> Tuple[int, int]:
+        while self.__heap:
+            estimate, product_id = self.__heap[0]
+
+            if self.__top.get(product_id) == estimate:
+                return estimate, product_id
+
+            heapq.heappop(self.__heap)
+
+        raise RuntimeError("Куча популярных товаров не соответствует словарю!")
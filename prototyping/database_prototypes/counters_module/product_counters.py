@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `product_counters` реализует счётчики событий товаров (просмотры, нажатия,
+добавления в корзину), увеличиваемые в памяти процесса и записываемые в БД
+одним пакетным запросом за интервал, вместо запроса
+`UPDATE ... SET x = x + 1` на каждое событие над самыми нагруженными строками.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["ProductCounters"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+import asyncio
+
+from string import Template
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+
+from .popularity_tracker import PopularityTracker
+from .types import ProductCounterKind
+
+
+# Порядок счётчиков в буфере совпадает с порядком столбцов в запросах.
+_KINDS: Tuple[ProductCounterKind, ...] = tuple(ProductCounterKind)
+
+# Таблица не входит в схему MainDataBaseModel и хранит счётчики отдельно от `Product`,
+# чтобы запись счётчиков не блокировала строки товаров.
+# *Внешний ключ не используется: пакет счётчиков удалённого товара
+# не должен отклоняться целиком.
+_CREATE_TABLE_QUERY: str = (
+    "CREATE TABLE IF NOT EXISTS `ProductCounter` ("
+    "`product_id` INT NOT NULL, "
+    + "".join(f"`{kind}` BIGINT UNSIGNED NOT NULL DEFAULT 0, " for kind in _KINDS)
+    + "`updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) "
+    "ON UPDATE CURRENT_TIMESTAMP(6), "
+    "PRIMARY KEY (`product_id`))"
+)
+
+# executemany объединяет строки в один запрос INSERT с несколькими VALUES.
+_UPSERT_QUERY: str = (
+    "INSERT INTO `ProductCounter` (`product_id`, "
+    + ", ".join(f"`{kind}`" for kind in _KINDS)
+    + ") VALUES (%s, "
+    + ", ".join("%s" for _ in _KINDS)
+    + ") AS `new` ON DUPLICATE KEY UPDATE "
+    + ", ".join(
+        f"`{kind}` = `ProductCounter`.`{kind}` + `new`.`{kind}`" for kind in _KINDS
+    )
+)
+
+_POPULAR_TEMPLATE = Template(
+    "SELECT `ProductCounter`.`product_id`, $score AS `score` "
+    "FROM `ProductCounter` "
+    "JOIN `Product` ON `Product`.`id` = `ProductCounter`.`product_id` "
+    "WHERE `Product`.`is_blocked` = 0 "
+    "ORDER BY `score` DESC LIMIT %s"
+)
+
+_SELECT_TEMPLATE = Template(
+    "SELECT `product_id`, "
+    + ", ".join(f"`{kind}`" for kind in _KINDS)
+    + " FROM `ProductCounter` WHERE `product_id` IN ($placeholders)"
+)
+
+# Веса событий при оценке популярности товара.
+_DEFAULT_WEIGHTS: Dict[ProductCounterKind, int] = {
+    ProductCounterKind.VIEWS: 1,
+    ProductCounterKind.CLICKS: 3,
+    ProductCounterKind.ADD_TO_CART: 10,
+}
+
+
+# _____________________________________________________________________________
+class ProductCounters:
+    """ProductCounters класс счётчиков событий товаров с отложенной записью.
+
+    Увеличение счётчика (increment) изменяет только буфер памяти: по одному
+    массиву счётчиков на товар. Фоновая задача раз в flush_interval секунд
+    подменяет буфер пустым и записывает накопленные значения одним пакетным
+    запросом INSERT ... ON DUPLICATE KEY UPDATE, прибавляющим их к значениям в БД.
+    Если запись не удалась, значения возвращаются в буфер и будут записаны позже.
+
+    События также учитываются трекером популярности, поэтому каталог
+    может показывать популярные товары без запросов к БД.
+
+    *Счётчики не используют блокировки и рассчитаны на работу в одном цикле событий,
+    поэтому буфер не разделяется на части. При корректной остановке (stop)
+    буфер записывается, поэтому события не теряются; при аварийном
+    завершении процесса теряются события последнего интервала.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+        __popularity (PopularityTracker): Трекер популярных товаров.
+        __weights (Dict[ProductCounterKind, int]): Веса событий при оценке популярности.
+        __flush_interval (float): Интервал записи буфера в секундах.
+        __max_pending_products (int): Количество товаров в буфере для досрочной записи.
+        __decay_interval (float): Интервал уменьшения оценок популярности в секундах.
+        __pending (Dict[int, List[int]]): Буфер: идентификатор товара -> счётчики.
+        __buffer_full (asyncio.Event): Событие заполнения буфера.
+        __flush_task (Optional[asyncio.Task]): Задача записи буфера.
+        __decayed_at (float): Время последнего уменьшения оценок популярности.
+    """
+
+    __api: AsyncMySQLAPI
+    __popularity: PopularityTracker
+    __weights: Dict[ProductCounterKind, int]
+    __flush_interval: float
+    __max_pending_products: int
+    __decay_interval: float
+    __pending: Dict[int, List[int]]
+    __buffer_full: asyncio.Event
+    __flush_task: Optional[asyncio.Task]
+    __decayed_at: float
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        api: AsyncMySQLAPI,
+        popularity: Optional[PopularityTracker] = None,
+        weights: Optional[Mapping[ProductCounterKind, int]] = None,
+        flush_interval: float = 5.0,
+        max_pending_products: int = 10_000,
+        decay_interval: float = 3600.0,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+            popularity (Optional[PopularityTracker], optional): Трекер популярных товаров.
+                По умолчанию None - создаётся трекер с параметрами по умолчанию.
+            weights (Optional[Mapping[ProductCounterKind, int]], optional): Веса событий
+                при оценке популярности. По умолчанию просмотр - 1, нажатие - 3,
+                добавление в корзину - 10.
+            flush_interval (float, optional): Интервал записи буфера. По умолчанию 5.0.
+            max_pending_products (int, optional): Количество товаров в буфере,
+                при котором буфер записывается досрочно. По умолчанию 10000.
+            decay_interval (float, optional): Интервал, за который оценки популярности
+                                              уменьшаются вдвое. По умолчанию 3600.0.
+
+        Raises:
+            ValueError: Возбуждается если количество товаров в буфере меньше 1.
+        """
+        if max_pending_products < 1:
+            raise ValueError("Количество товаров в буфере должно быть больше нуля!")
+
+        self.__api = api
+        self.__popularity = PopularityTracker() if popularity is None else popularity
+        self.__weights = {**_DEFAULT_WEIGHTS, **(weights or {})}
+        self.__flush_interval = flush_interval
+        self.__max_pending_products = max_pending_products
+        self.__decay_interval = decay_interval
+        self.__pending = {}
+        self.__buffer_full = asyncio.Event()
+        self.__flush_task = None
+        self.__decayed_at = time.monotonic()
+
+    # -------------------------------------------------------------------------
+    @property
+    def popularity(self) -> PopularityTracker:
+        return self.__popularity
+
+    # -------------------------------------------------------------------------
+    @property
+    def pending_products_amount(self) -> int:
+        return len(self.__pending)
+
+    # -------------------------------------------------------------------------
+    async def create_table(self) -> None:
+        """create_table создаёт таблицу `ProductCounter`, если она не существует."""
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                cursor.execute(_CREATE_TABLE_QUERY)
+
+        await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    def increment(
+        self, product_id: int, kind: ProductCounterKind, amount: int = 1
+    ) -> None:
+        """increment увеличивает счётчик товара в буфере, не обращаясь к БД.
+
+        Args:
+            product_id (int): Идентификатор товара.
+            kind (ProductCounterKind): Счётчик.
+            amount (int, optional): Величина увеличения. По умолчанию 1.
+        """
+        counters: Optional[List[int]] = self.__pending.get(product_id)
+
+        if counters is None:
+            counters = self.__pending[product_id] = [0] * len(_KINDS)
+
+            if len(self.__pending) >= self.__max_pending_products:
+                self.__buffer_full.set()
+
+        counters[_KINDS.index(kind)] += amount
+
+        self.__popularity.observe(
+            product_id=product_id, weight=self.__weights[kind] * amount
+        )
+
+    # -------------------------------------------------------------------------
+    def get_pending(self, product_id: int) -> Dict[ProductCounterKind, int]:
+        """get_pending возвращает ещё не записанные в БД значения счётчиков товара.
+
+        Args:
+            product_id (int): Идентификатор товара.
+
+        Returns:
+            Dict[ProductCounterKind, int]: Значения счётчиков из буфера.
+        """
+        counters: List[int] = self.__pending.get(product_id, [0] * len(_KINDS))
+
+        return dict(zip(_KINDS, counters))
+
+    # -------------------------------------------------------------------------
+    async def flush(self) -> int:
+        """flush записывает буфер одним пакетным запросом.
+
+        Returns:
+            int: Количество записанных товаров.
+        """
+        pending, self.__pending = self.__pending, {}
+
+        self.__buffer_full.clear()
+
+        if not pending:
+            return 0
+
+        # Строки упорядочены по ключу, поэтому одновременные записи
+        # нескольких процессов блокируют строки в одном порядке.
+        rows: List[Tuple[int, ...]] = [
+            (product_id, *counters) for product_id, counters in sorted(pending.items())
+        ]
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                cursor.executemany(_UPSERT_QUERY, rows)
+
+        try:
+            await self.__api.execute_transaction_use_pool(transaction)
+
+        except Exception:
+            # Незаписанные значения прибавляются к накопленным во время записи.
+            for product_id, counters in pending.items():
+                current: Optional[List[int]] = self.__pending.get(product_id)
+
+                if current is None:
+                    self.__pending[product_id] = counters
+                else:
+                    for index, value in enumerate(counters):
+                        current[index] += value
+
+            raise
+
+        return len(rows)
+
+    # -------------------------------------------------------------------------
+    async def load_counters(
+        self, product_ids: List[int]
+    ) -> Dict[int, Dict[ProductCounterKind, int]]:
+        """load_counters возвращает значения счётчиков товаров, включая буфер.
+
+        Args:
+            product_ids (List[int]): Идентификаторы товаров.
+
+        Returns:
+            Dict[int, Dict[ProductCounterKind, int]]: Значения счётчиков по товарам.
+        """
+        if not product_ids:
+            return {}
+
+        select_query: str = _SELECT_TEMPLATE.substitute(
+            placeholders=", ".join(["%s"] * len(product_ids))
+        )
+
+        def transaction(
+            connection: MySQLPooledConnection,
+        ) -> List[Tuple[int, ...]]:
+            with connection.cursor() as cursor:
+                cursor.execute(select_query, tuple(product_ids))
+
+                return cursor.fetchall()
+
+        stored: Dict[int, Tuple[int, ...]] = {
+            row[0]: row[1:]
+            for row in await self.__api.execute_transaction_use_pool(transaction)
+        }
+
+        return {
+            product_id: {
+                kind: int(value) + pending
+                for (kind, pending), value in zip(
+                    self.get_pending(product_id=product_id).items(),
+                    stored.get(product_id, (0,) * len(_KINDS)),
+                )
+            }
+            for product_id in product_ids
+        }
+
+    # -------------------------------------------------------------------------
+    async def warm_up_popularity(self) -> None:
+        """warm_up_popularity загружает популярные товары из БД в трекер.
+
+        *Следует вызвать при запуске, чтобы популярные товары были известны
+        до накопления событий; трекер учитывает только события своего процесса.
+        """
+        popular_query: str = _POPULAR_TEMPLATE.substitute(
+            score=" + ".join(
+                f"`ProductCounter`.`{kind}` * {self.__weights[kind]}" for kind in _KINDS
+            )
+        )
+        limit: int = self.__popularity.size
+
+        def transaction(
+            connection: MySQLPooledConnection,
+        ) -> List[Tuple[int, int]]:
+            with connection.cursor() as cursor:
+                cursor.execute(popular_query, (limit,))
+
+                return cursor.fetchall()
+
+        scores: List[Tuple[int, int]] = await self.__api.execute_transaction_use_pool(
+            transaction
+        )
+
+        self.__popularity.seed(
+            scores=[(product_id, int(score)) for product_id, score in scores]
+        )
+
+    # -------------------------------------------------------------------------
+    def start(self) -> None:
+        """start запускает фоновую задачу записи буфера."""
+        self.__flush_task = asyncio.get_running_loop().create_task(self.__run_flush())
+
+    # -------------------------------------------------------------------------
+    async def stop(self) -> None:
+        """stop останавливает фоновую задачу и записывает буфер.
+
+        *Следует добавить шагом остановки (LifecycleManager.add_shutdown_step),
+        чтобы события, накопленные до остановки, не были потеряны.
+        """
+        if self.__flush_task is not None:
+            self.__flush_task.cancel()
+
+            try:
+                await self.__flush_task
+            except asyncio.CancelledError:
+                pass
+
+            self.__flush_task = None
+
+        await self.flush()
+
+    # -------------------------------------------------------------------------
+    async def __run_flush(self) -> None:
+        """__run_flush записывает буфер по интервалу, либо при заполнении."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self.__buffer_full.wait(), timeout=self.__flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                await self.flush()
+            except Exception as error:
+                print(f"Возникла ошибка при записи счётчиков товаров! {error}")
+                await asyncio.sleep(self.__flush_interval)
+
+            if time.monotonic() - self.__decayed_at >= self.__decay_interval:
+                self.__popularity.decay()
+                self.__decayed_at = time.monotonic()
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль предназначен для хранения типов,
+описывающих счётчики событий товаров.
+"""
+
+__all__: list[str] = ["ProductCounterKind"]
+
+from enum import StrEnum
+
+
+# _____________________________________________________________________________
+class ProductCounterKind(StrEnum):
+    """ProductCounterKind перечисление счётчиков событий товара.
+
+    Значение каждого элемента совпадает с названием столбца таблицы `ProductCounter`.
+    """
+
+    VIEWS = "views"
+    CLICKS = "clicks"
+    ADD_TO_CART = "add_to_cart"
@@ -1,5 +1,15 @@
-__all__: list[str] = ["AbstractAsyncDataBase", "AsyncSQLDataBaseAPI", "AsyncSQLDataBasePoolAPI"]
+__all__: list[str] = [
+    "AbstractAsyncDataBase",
+    "AsyncSQLDataBaseAPI",
+    "AsyncSQLDataBasePoolAPI",
+    "AutosizedPoolAPI",
+    "PoolAutosizer",
+    "PoolSizingDecision",
+    "SeparateConnectionChannel",
+]
 
 from .abstract_async_database import AbstractAsyncDataBase
 from .async_sql_database_api import AsyncSQLDataBaseAPI
-from .async_sql_database_pool_api import AsyncSQLDataBasePoolAPI
\ No newline at end of file
+from .async_sql_database_pool_api import AsyncSQLDataBasePoolAPI
+from .pool_autosizer import AutosizedPoolAPI, PoolAutosizer, PoolSizingDecision
+from .separate_connection_channel import SeparateConnectionChannel
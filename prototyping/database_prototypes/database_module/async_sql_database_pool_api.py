@@ -16,7 +16,7 @@ __version__ = "1.0.0"
 
 from abc import ABC, abstractmethod
 
-from typing import Dict
+from typing import Callable, Dict
 from string import Template
 
 
@@ -93,3 +93,27 @@ class AsyncSQLDataBasePoolAPI[PoolType, PooledConnectionType](ABC):
             query_data (Dict[str, str]): Данные для подстановки в запрос.
         """
         pass
+
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    async def execute_transaction_use_pool[ResultType](
+        self,
+        transaction: Callable[[PooledConnectionType], ResultType],
+    ) -> ResultType:
+        """execute_transaction_use_pool выполняет транзакцию над БД.
+
+        Этот метод должен выполнять переданную функцию-транзакцию,
+        используя соединение из пула, фиксируя изменения при успешном выполнении
+        и откатывая их при возникновении ошибки.
+
+        *Функция-транзакция может выполнять несколько запросов,
+        все они должны быть выполнены в рамках одной транзакции.
+
+        Args:
+            transaction (Callable[[PooledConnectionType], ResultType]): Функция,
+                получающая соединение из пула и выполняющая запросы.
+
+        Returns:
+            ResultType: Результат, возвращённый функцией-транзакцией.
+        """
+        pass
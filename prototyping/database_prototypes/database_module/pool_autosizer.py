@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `pool_autosizer` реализует класс, изменяющий размер пула соединений
+в заданных границах по замерам ожидания соединения и загрузки пула.
+
+Замеры собираются в скользящем окне: ожидание соединения - по каждой транзакции,
+загрузка пула (отношение выполняющихся и ожидающих транзакций к размеру пула) -
+с заданным интервалом. Пул увеличивается, если ожидание или загрузка высоки,
+и уменьшается, если пул простаивает несколько оценок подряд.
+Пороги увеличения и уменьшения различаются (гистерезис), а после изменения
+размера окно очищается, поэтому размер не колеблется на границе порогов.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["AutosizedPoolAPI", "PoolSizingDecision", "PoolAutosizer"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+import asyncio
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, List, Optional, Protocol, Tuple, Type
+
+
+# Аннотация для функции, получающей замеры транзакции (см. TransactionObserverType).
+_TransactionObserverType = Callable[[float, float, Optional[BaseException]], Any]
+
+
+# _____________________________________________________________________________
+class AutosizedPoolAPI(Protocol):
+    """AutosizedPoolAPI описание API БД, пул которого может изменять размер.
+
+    *Соответствует AsyncMySQLAPI и AsyncSQLiteAPI.
+    """
+
+    @property
+    def pool_size(self) -> int: ...
+
+    @property
+    def connections_in_use_amount(self) -> int: ...
+
+    @property
+    def transaction_observer(self) -> Optional[_TransactionObserverType]: ...
+
+    def set_transaction_observer(
+        self, observer: Optional[_TransactionObserverType]
+    ) -> None: ...
+
+    async def resize_pool(self, pool_size: int) -> int: ...
+
+
+# _____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class PoolSizingDecision:
+    """PoolSizingDecision класс для представления изменения размера пула.
+
+    Attributes:
+        previous_size (int): Размер пула до изменения.
+        pool_size (int): Размер пула после изменения.
+        reason (str): Причина: "wait", "utilization", "saturation", "idle"
+                      или "bounds" (размер пула вне границ).
+        wait_p95_seconds (float): 95-й перцентиль ожидания соединения в окне.
+        utilization (float): Средняя загрузка пула в окне.
+        created_at (float): Время изменения (time.time).
+    """
+
+    previous_size: int
+    pool_size: int
+    reason: str
+    wait_p95_seconds: float
+    utilization: float
+    created_at: float
+
+
+# _____________________________________________________________________________
+class PoolAutosizer:
+    """PoolAutosizer класс автоматического изменения размера пула соединений.
+
+    *Замеры транзакций получаются через наблюдателя транзакций API;
+    ранее установленный наблюдатель (например, метрики) продолжает вызываться.
+
+    Attributes:
+        __api (AutosizedPoolAPI): API БД с подключённым пулом.
+        __min_size (int): Минимальный размер пула.
+        __max_size (int): Максимальный размер пула.
+        __window_seconds (float): Длительность скользящего окна замеров.
+        __evaluation_interval (float): Интервал оценки размера пула.
+        __sample_interval (float): Интервал замера загрузки пула.
+        __grow_wait_seconds (float): Ожидание (p95), начиная с которого пул растёт.
+        __shrink_wait_seconds (float): Ожидание (p95), ниже которого пул может уменьшаться.
+        __high_utilization (float): Загрузка, начиная с которой пул растёт.
+        __low_utilization (float): Загрузка, ниже которой пул может уменьшаться.
+        __grow_step (int): Количество соединений, добавляемых за одно изменение.
+        __shrink_step (int): Количество соединений, закрываемых за одно изменение.
+        __shrink_after (int): Количество оценок простоя подряд перед уменьшением.
+        __saturation_errors (Tuple[Type[BaseException], ...]): Ошибки исчерпания пула.
+        __waits (Deque[Tuple[float, float]]): Замеры ожидания: (время, секунды).
+        __utilizations (Deque[Tuple[float, float]]): Замеры загрузки: (время, загрузка).
+        __saturations (Deque[float]): Время ошибок исчерпания пула.
+        __idle_streak (int): Количество оценок простоя подряд.
+        __decisions (Deque[PoolSizingDecision]): Последние изменения размера пула.
+        __decision_observer (Optional[Callable[[PoolSizingDecision], Any]]): Функция,
+            получающая каждое изменение размера пула.
+        __previous_observer (Optional[_TransactionObserverType]): Наблюдатель транзакций,
+            установленный до запуска.
+        __task (Optional[asyncio.Task]): Фоновая задача замеров и оценки.
+        __wait_p95_seconds (float): Ожидание (p95) при последней оценке.
+        __utilization (float): Загрузка при последней оценке.
+    """
+
+    __api: AutosizedPoolAPI
+    __min_size: int
+    __max_size: int
+    __window_seconds: float
+    __evaluation_interval: float
+    __sample_interval: float
+    __grow_wait_seconds: float
+    __shrink_wait_seconds: float
+    __high_utilization: float
+    __low_utilization: float
+    __grow_step: int
+    __shrink_step: int
+    __shrink_after: int
+    __saturation_errors: Tuple[Type[BaseException], ...]
+    __waits: Deque[Tuple[float, float]]
+    __utilizations: Deque[Tuple[float, float]]
+    __saturations: Deque[float]
+    __idle_streak: int
+    __decisions: Deque[PoolSizingDecision]
+    __decision_observer: Optional[Callable[[PoolSizingDecision], Any]]
+    __previous_observer: Optional[_TransactionObserverType]
+    __task: Optional[asyncio.Task]
+    __wait_p95_seconds: float
+    __utilization: float
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        api: AutosizedPoolAPI,
+        min_size: int,
+        max_size: int,
+        window_seconds: float = 30.0,
+        evaluation_interval: float = 5.0,
+        sample_interval: float = 0.5,
+        grow_wait_seconds: float = 0.01,
+        shrink_wait_seconds: float = 0.001,
+        high_utilization: float = 0.8,
+        low_utilization: float = 0.3,
+        grow_step: int = 2,
+        shrink_step: int = 1,
+        shrink_after: int = 6,
+        saturation_errors: Tuple[Type[BaseException], ...] = (TimeoutError,),
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AutosizedPoolAPI): API БД с подключённым пулом.
+            min_size (int): Минимальный размер пула.
+            max_size (int): Максимальный размер пула.
+            window_seconds (float, optional): Длительность скользящего окна замеров.
+                                              По умолчанию 30.0.
+            evaluation_interval (float, optional): Интервал оценки размера пула.
+                                                   По умолчанию 5.0.
+            sample_interval (float, optional): Интервал замера загрузки пула.
+                                               По умолчанию 0.5.
+            grow_wait_seconds (float, optional): Ожидание (p95), начиная с которого
+                                                 пул растёт. По умолчанию 0.01.
+            shrink_wait_seconds (float, optional): Ожидание (p95), ниже которого
+                                                   пул может уменьшаться. По умолчанию 0.001.
+            high_utilization (float, optional): Загрузка, начиная с которой пул растёт.
+                                                По умолчанию 0.8.
+            low_utilization (float, optional): Загрузка, ниже которой пул может
+                                               уменьшаться. По умолчанию 0.3.
+            grow_step (int, optional): Соединений, добавляемых за одно изменение.
+                                       По умолчанию 2.
+            shrink_step (int, optional): Соединений, закрываемых за одно изменение.
+                                         По умолчанию 1.
+            shrink_after (int, optional): Оценок простоя подряд перед уменьшением.
+                                          По умолчанию 6.
+            saturation_errors (Tuple[Type[BaseException], ...], optional): Ошибки
+                исчерпания пула (истёк timeout ожидания). По умолчанию (TimeoutError,).
+
+        Raises:
+            ValueError: Возбуждается если границы размера или пороги заданы неверно.
+        """
+        if not 1 <= min_size <= max_size:
+            raise ValueError("Границы размера пула должны быть 1 <= min_size <= max_size!")
+
+        if shrink_wait_seconds > grow_wait_seconds or low_utilization >= high_utilization:
+            raise ValueError("Пороги уменьшения пула должны быть ниже порогов увеличения!")
+
+        self.__api = api
+        self.__min_size = min_size
+        self.__max_size = max_size
+        self.__window_seconds = window_seconds
+        self.__evaluation_interval = evaluation_interval
+        self.__sample_interval = sample_interval
+        self.__grow_wait_seconds = grow_wait_seconds
+        self.__shrink_wait_seconds = shrink_wait_seconds
+        self.__high_utilization = high_utilization
+        self.__low_utilization = low_utilization
+        self.__grow_step = grow_step
+        self.__shrink_step = shrink_step
+        self.__shrink_after = shrink_after
+        self.__saturation_errors = saturation_errors
+        self.__waits = deque()
+        self.__utilizations = deque()
+        self.__saturations = deque()
+        self.__idle_streak = 0
+        self.__decisions = deque(maxlen=100)
+        self.__decision_observer = None
+        self.__previous_observer = None
+        self.__task = None
+        self.__wait_p95_seconds = 0.0
+        self.__utilization = 0.0
+
+    # -------------------------------------------------------------------------
+    @property
+    def pool_size(self) -> int:
+        return self.__api.pool_size
+
+    # -------------------------------------------------------------------------
+    @property
+    def min_size(self) -> int:
+        return self.__min_size
+
+    # -------------------------------------------------------------------------
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    # -------------------------------------------------------------------------
+    @property
+    def wait_p95_seconds(self) -> float:
+        return self.__wait_p95_seconds
+
+    # -------------------------------------------------------------------------
+    @property
+    def utilization(self) -> float:
+        return self.__utilization
+
+    # -------------------------------------------------------------------------
+    @property
+    def decisions(self) -> Tuple[PoolSizingDecision, ...]:
+        return tuple(self.__decisions)
+
+    # -------------------------------------------------------------------------
+    def set_decision_observer(
+        self, observer: Optional[Callable[[PoolSizingDecision], Any]]
+    ) -> None:
+        """set_decision_observer задаёт функцию, получающую изменения размера пула.
+
+        Args:
+            observer (Optional[Callable[[PoolSizingDecision], Any]]): Функция;
+                                                                      None - отключить.
+        """
+        self.__decision_observer = observer
+
+    # -------------------------------------------------------------------------
+    def observe_transaction(
+        self, wait_seconds: float, duration_seconds: float, error: Optional[BaseException]
+    ) -> None:
+        """observe_transaction учитывает замер транзакции над пулом.
+
+        Args:
+            wait_seconds (float): Ожидание соединения.
+            duration_seconds (float): Длительность транзакции.
+            error (Optional[BaseException]): Исключение транзакции, либо None.
+        """
+        now: float = time.monotonic()
+
+        self.__waits.append((now, wait_seconds))
+
+        if isinstance(error, self.__saturation_errors):
+            self.__saturations.append(now)
+
+        if self.__previous_observer is not None:
+            self.__previous_observer(wait_seconds, duration_seconds, error)
+
+    # -------------------------------------------------------------------------
+    def sample_utilization(self) -> None:
+        """sample_utilization учитывает текущую загрузку пула.
+
+        *Загрузка - доля занятых соединений: транзакции, ожидающие соединения,
+        не занимают его, поэтому не учитываются.
+        """
+        self.__utilizations.append(
+            (
+                time.monotonic(),
+                self.__api.connections_in_use_amount / max(1, self.__api.pool_size),
+            )
+        )
+
+    # -------------------------------------------------------------------------
+    async def evaluate(self) -> Optional[PoolSizingDecision]:
+        """evaluate оценивает замеры окна и при необходимости изменяет размер пула.
+
+        Returns:
+            Optional[PoolSizingDecision]: Изменение размера пула, либо None.
+        """
+        self.__trim_window()
+
+        waits: List[float] = sorted(wait for _, wait in self.__waits)
+        self.__wait_p95_seconds = (
+            waits[min(len(waits) - 1, int(0.95 * len(waits)))] if waits else 0.0
+        )
+        self.__utilization = (
+            sum(value for _, value in self.__utilizations) / len(self.__utilizations)
+            if self.__utilizations
+            else 0.0
+        )
+
+        pool_size: int = self.__api.pool_size
+        reason: Optional[str] = self.__get_grow_reason()
+        target_size: int = pool_size
+
+        if pool_size < self.__min_size or pool_size > self.__max_size:
+            reason = "bounds"
+            target_size = min(self.__max_size, max(self.__min_size, pool_size))
+
+        elif reason is not None:
+            self.__idle_streak = 0
+            target_size = min(self.__max_size, pool_size + self.__grow_step)
+
+        elif self.__is_idle(pool_size=pool_size):
+            self.__idle_streak += 1
+
+            if self.__idle_streak >= self.__shrink_after:
+                reason = "idle"
+                target_size = max(self.__min_size, pool_size - self.__shrink_step)
+
+        else:
+            self.__idle_streak = 0
+
+        if target_size == pool_size:
+            return None
+
+        new_size: int = await self.__api.resize_pool(target_size)
+
+        decision = PoolSizingDecision(
+            previous_size=pool_size,
+            pool_size=new_size,
+            reason=reason,  # type: ignore
+            wait_p95_seconds=self.__wait_p95_seconds,
+            utilization=self.__utilization,
+            created_at=time.time(),
+        )
+
+        # Замеры относятся к прежнему размеру пула, поэтому окно начинается заново.
+        self.__waits.clear()
+        self.__utilizations.clear()
+        self.__saturations.clear()
+        self.__idle_streak = 0
+        self.__decisions.append(decision)
+
+        if self.__decision_observer is not None:
+            self.__decision_observer(decision)
+
+        return decision
+
+    # -------------------------------------------------------------------------
+    def start(self) -> None:
+        """start подключается к наблюдателю транзакций API и запускает оценку."""
+        if self.__task is not None and not self.__task.done():
+            return
+
+        self.__previous_observer = self.__api.transaction_observer
+        self.__api.set_transaction_observer(self.observe_transaction)
+        self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    # -------------------------------------------------------------------------
+    async def stop(self) -> None:
+        """stop останавливает оценку и возвращает прежнего наблюдателя транзакций."""
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+
+        self.__task = None
+
+        if self.__api.transaction_observer == self.observe_transaction:
+            self.__api.set_transaction_observer(self.__previous_observer)
+
+        self.__previous_observer = None
+
+    # -------------------------------------------------------------------------
+    def __get_grow_reason(self) -> Optional[str]:
+        if self.__saturations:
+            return "saturation"
+
+        if self.__wait_p95_seconds >= self.__grow_wait_seconds:
+            return "wait"
+
+        if self.__utilization >= self.__high_utilization:
+            return "utilization"
+
+        return None
+
+    # -------------------------------------------------------------------------
+    def __is_idle(self, pool_size: int) -> bool:
+        if self.__wait_p95_seconds > self.__shrink_wait_seconds:
+            return False
+
+        # Загрузка пересчитывается на уменьшенный пул, чтобы он сразу не вырос обратно.
+        shrunk_size: int = max(1, pool_size - self.__shrink_step)
+
+        return (
+            self.__utilization < self.__low_utilization
+            and self.__utilization * pool_size / shrunk_size < self.__high_utilization
+        )
+
+    # -------------------------------------------------------------------------
+    def __trim_window(self) -> None:
+        border: float = time.monotonic() - self.__window_seconds
+
+        while self.__waits and self.__waits[0][0] < border:
+            self.__waits.popleft()
+
+        while self.__utilizations and self.__utilizations[0][0] < border:
+            self.__utilizations.popleft()
+
+        while self.__saturations and self.__saturations[0] < border:
+            self.__saturations.popleft()
+
+    # -------------------------------------------------------------------------
+    async def __run(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        evaluate_at: float = loop.time() + self.__evaluation_interval
+
+        while True:
+            await asyncio.sleep(self.__sample_interval)
+
+            self.sample_utilization()
+
+            if loop.time() >= evaluate_at:
+                evaluate_at = loop.time() + self.__evaluation_interval
+
+                try:
+                    await self.evaluate()
+
+                except Exception as error:
+                    print(f"Не удалось изменить размер пула соединений! {error}")
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `separate_connection_channel` предоставляет класс канала,
+через который несколько задач безопасно используют одно независимое соединение к БД.
+
+Асинхронное соединение не поддерживает одновременные запросы: пакеты протокола
+двух задач, ожидающих ответа на одном соединении, перемешиваются.
+Канал помещает операции в очередь, а единственная задача-исполнитель
+выполняет их по порядку и передаёт результат (или исключение) вызвавшей задаче.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["SeparateConnectionChannel"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+
+# _____________________________________________________________________________
+class SeparateConnectionChannel[ConnectionType]:
+    """SeparateConnectionChannel класс канала операций над независимым соединением.
+
+    *Если задана глубина очереди и у операции есть запасной вариант,
+    то при заполненной очереди выполняется запасной вариант (например, через пул),
+    а не ожидание очереди.
+
+    Attributes:
+        __connection (ConnectionType): Независимое соединение к БД.
+        __fallback_queue_depth (Optional[int]): Глубина очереди, начиная с которой
+                                                выполняется запасной вариант операции.
+        __queue (asyncio.Queue): Ожидающие операции: (future вызвавшей задачи, операция).
+        __writer (Optional[asyncio.Task]): Задача-исполнитель операций.
+        __fallback_amount (int): Количество операций, выполненных запасным вариантом.
+    """
+
+    __connection: ConnectionType
+    __fallback_queue_depth: Optional[int]
+    __queue: "asyncio.Queue[Tuple[asyncio.Future, Callable[[ConnectionType], Awaitable[Any]]]]"
+    __writer: Optional[asyncio.Task]
+    __fallback_amount: int
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self, connection: ConnectionType, fallback_queue_depth: Optional[int] = 16
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            connection (ConnectionType): Независимое соединение к БД.
+            fallback_queue_depth (Optional[int], optional): Глубина очереди для запасного
+                                                            варианта. None - всегда ожидать
+                                                            очереди. По умолчанию 16.
+        """
+        self.__connection = connection
+        self.__fallback_queue_depth = fallback_queue_depth
+        self.__queue = asyncio.Queue()
+        self.__writer = None
+        self.__fallback_amount = 0
+
+    # -------------------------------------------------------------------------
+    @property
+    def connection(self) -> ConnectionType:
+        return self.__connection
+
+    # -------------------------------------------------------------------------
+    @property
+    def queue_depth(self) -> int:
+        return self.__queue.qsize()
+
+    # -------------------------------------------------------------------------
+    @property
+    def fallback_amount(self) -> int:
+        return self.__fallback_amount
+
+    # -------------------------------------------------------------------------
+    async def execute[ResultType](
+        self,
+        operation: Callable[[ConnectionType], Awaitable[ResultType]],
+        fallback: Optional[Callable[[], Awaitable[ResultType]]] = None,
+    ) -> ResultType:
+        """execute выполняет операцию над соединением в порядке очереди.
+
+        *Если вызвавшая задача отменена до начала операции, операция не выполняется.
+        Начатая операция завершается, даже если вызвавшая задача отменена,
+        чтобы соединение не осталось с непрочитанным ответом.
+
+        Args:
+            operation (Callable[[ConnectionType], Awaitable[ResultType]]): Функция,
+                получающая соединение и выполняющая запросы.
+            fallback (Optional[Callable[[], Awaitable[ResultType]]], optional): Запасной
+                вариант операции без соединения канала. По умолчанию None.
+
+        Returns:
+            ResultType: Результат операции.
+        """
+        if (
+            fallback is not None
+            and self.__fallback_queue_depth is not None
+            and self.__queue.qsize() >= self.__fallback_queue_depth
+        ):
+            self.__fallback_amount += 1
+            return await fallback()
+
+        loop = asyncio.get_running_loop()
+
+        if self.__writer is None or self.__writer.done():
+            self.__writer = loop.create_task(self.__run())
+
+        future: asyncio.Future = loop.create_future()
+        self.__queue.put_nowait((future, operation))
+
+        return await future
+
+    # -------------------------------------------------------------------------
+    async def close(self) -> None:
+        """close ожидает выполнения операций в очереди и останавливает исполнителя."""
+        if self.__writer is None:
+            return
+
+        await self.__queue.join()
+
+        writer, self.__writer = self.__writer, None
+        writer.cancel()
+
+        try:
+            await writer
+        except asyncio.CancelledError:
+            pass
+
+    # -------------------------------------------------------------------------
+    async def __run(self) -> None:
+        while True:
+            future, operation = await self.__queue.get()
+
+            try:
+                if future.done():
+                    continue
+
+                result: Any = await operation(self.__connection)
+
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+            finally:
+                self.__queue.task_done()
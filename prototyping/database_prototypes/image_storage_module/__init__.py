@@ -0,0 +1,9 @@
+__all__: list[str] = [
+    "AbstractImageStorage",
+    "FileSystemImageStorage",
+    "ProductImageMigrator",
+]
+
+from .abstract_image_storage import AbstractImageStorage
+from .filesystem_image_storage import FileSystemImageStorage
+from .product_image_migrator import ProductImageMigrator
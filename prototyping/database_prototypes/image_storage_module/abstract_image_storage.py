@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `abstract_image_storage` предоставляет базовый абстрактный класс хранилища
+изображений товаров, адресуемых по содержимому (ключ - SHA-256 изображения).
+
+Конкретные реализации хранилища будут наследоваться от этого абстрактного класса
+и реализовывать методы для работы над определённым типом хранилища.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["AbstractImageStorage"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import hashlib
+
+from abc import ABC, abstractmethod
+
+from typing import AsyncIterator, ContextManager, Union
+
+
+# Аннотация для содержимого изображения, передаваемого без копирования.
+ImageBufferType = Union[bytes, bytearray, memoryview]
+
+
+# _____________________________________________________________________________
+class AbstractImageStorage(ABC):
+    """AbstractImageStorage класс для представления хранилища изображений.
+
+    Изображение сохраняется один раз, повторное сохранение того же содержимого
+    возвращает существующий ключ.
+
+    *Методы чтения возвращают memoryview, чтобы содержимое передавалось
+    в тело запроса без промежуточных копий.
+
+    Args:
+        ABC: Базовый класс для создания абстрактных классов,
+             позволяющий реализовать абстракцию.
+    """
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def make_key(image: ImageBufferType) -> str:
+        """make_key возвращает ключ изображения.
+
+        Args:
+            image (ImageBufferType): Содержимое изображения.
+
+        Returns:
+            str: SHA-256 в шестнадцатеричном виде.
+        """
+        return hashlib.sha256(image).hexdigest()
+
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    def put_sync(self, image: ImageBufferType) -> str:
+        """put_sync сохраняет изображение в вызывающем потоке.
+
+        *Метод предназначен для использования внутри транзакций,
+        выполняемых в отдельном потоке.
+
+        Args:
+            image (ImageBufferType): Содержимое изображения.
+
+        Returns:
+            str: Ключ изображения.
+        """
+        pass
+
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    async def put(self, image: ImageBufferType) -> str:
+        """put сохраняет изображение.
+
+        Args:
+            image (ImageBufferType): Содержимое изображения.
+
+        Returns:
+            str: Ключ изображения.
+        """
+        pass
+
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """exists проверяет, сохранено ли изображение.
+
+        Args:
+            key (str): Ключ изображения.
+
+        Returns:
+            bool: True, если изображение сохранено.
+        """
+        pass
+
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """delete удаляет изображение.
+
+        Args:
+            key (str): Ключ изображения.
+
+        Returns:
+            bool: True, если изображение было удалено.
+        """
+        pass
+
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    def open(self, key: str) -> ContextManager[memoryview]:
+        """open возвращает содержимое изображения без копирования.
+
+        *memoryview действителен только внутри блока `with`.
+
+        Args:
+            key (str): Ключ изображения.
+
+        Raises:
+            KeyError: Возбуждается если изображение не найдено.
+
+        Returns:
+            ContextManager[memoryview]: Менеджер контекста, возвращающий содержимое.
+        """
+        pass
+
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    def iter_chunks(self, key: str, chunk_size: int = 65536) -> AsyncIterator[memoryview]:
+        """iter_chunks возвращает содержимое изображения частями.
+
+        Args:
+            key (str): Ключ изображения.
+            chunk_size (int, optional): Размер части в байтах. По умолчанию 65536.
+
+        Raises:
+            KeyError: Возбуждается если изображение не найдено.
+
+        Returns:
+            AsyncIterator[memoryview]: Части изображения без копирования.
+        """
+        pass
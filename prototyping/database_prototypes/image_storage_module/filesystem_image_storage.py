@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `filesystem_image_storage` реализует хранилище изображений товаров
+в локальной файловой системе. Файлы читаются через `mmap`,
+поэтому содержимое передаётся из кэша страниц ОС без копирования в память процесса.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["FileSystemImageStorage"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import os
+import mmap
+import asyncio
+import tempfile
+import contextlib
+
+from typing import AsyncIterator, Iterator
+
+from .abstract_image_storage import AbstractImageStorage, ImageBufferType
+
+
+# _____________________________________________________________________________
+class FileSystemImageStorage(AbstractImageStorage):
+    """FileSystemImageStorage класс хранилища изображений в файловой системе.
+
+    Изображение с ключом `abcdef...` хранится в файле `<root>/ab/cd/abcdef...`,
+    чтобы в одном каталоге не накапливалось слишком много файлов.
+    Файл записывается во временный файл того же каталога и переименовывается,
+    поэтому читатели не видят частично записанных изображений.
+
+    Args:
+        AbstractImageStorage: Базовый класс хранилища изображений.
+
+    Attributes:
+        __root_dir (str): Корневой каталог хранилища.
+    """
+
+    __root_dir: str
+
+    # -------------------------------------------------------------------------
+    def __init__(self, root_dir: str) -> None:
+        """__init__ конструктор.
+
+        Args:
+            root_dir (str): Корневой каталог хранилища; создаётся, если не существует.
+        """
+        self.__root_dir = root_dir
+
+        os.makedirs(root_dir, exist_ok=True)
+
+    # -------------------------------------------------------------------------
+    def get_path(self, key: str) -> str:
+        """get_path возвращает путь к файлу изображения.
+
+        Args:
+            key (str): Ключ изображения.
+
+        Raises:
+            ValueError: Возбуждается если ключ не является SHA-256.
+
+        Returns:
+            str: Путь к файлу.
+        """
+        if len(key) != 64 or not all(symbol in "0123456789abcdef" for symbol in key):
+            raise ValueError(f"Некорректный ключ изображения: {key!r}")
+
+        return os.path.join(self.__root_dir, key[:2], key[2:4], key)
+
+    # -------------------------------------------------------------------------
+    def put_sync(self, image: ImageBufferType) -> str:
+        key: str = self.make_key(image=image)
+        path: str = self.get_path(key=key)
+
+        if os.path.exists(path):
+            return key
+
+        directory: str = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(image)
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(temporary_path, path)
+
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temporary_path)
+
+            raise
+
+        return key
+
+    # -------------------------------------------------------------------------
+    async def put(self, image: ImageBufferType) -> str:
+        return await asyncio.to_thread(self.put_sync, image)
+
+    # -------------------------------------------------------------------------
+    async def exists(self, key: str) -> bool:
+        return os.path.exists(self.get_path(key=key))
+
+    # -------------------------------------------------------------------------
+    async def delete(self, key: str) -> bool:
+        try:
+            await asyncio.to_thread(os.remove, self.get_path(key=key))
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    # -------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def open(self, key: str) -> Iterator[memoryview]:
+        try:
+            file = open(self.get_path(key=key), "rb")
+        except FileNotFoundError:
+            raise KeyError(f"Изображение не найдено: {key}") from None
+
+        with file:
+            # Пустой файл не может быть отображён в память.
+            if os.fstat(file.fileno()).st_size == 0:
+                yield memoryview(b"")
+                return
+
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapping)
+
+            try:
+                yield view
+            finally:
+                view.release()
+
+                # Если части содержимого ещё используются (например, буфером отправки),
+                # отображение будет закрыто сборщиком мусора после их освобождения.
+                with contextlib.suppress(BufferError):
+                    mapping.close()
+
+    # -------------------------------------------------------------------------
+    async def iter_chunks(
+        self, key: str, chunk_size: int = 65536
+    ) -> AsyncIterator[memoryview]:
+        if chunk_size < 1:
+            raise ValueError("Размер части должен быть больше нуля!")
+
+        with self.open(key=key) as view:
+            for offset in range(0, len(view), chunk_size):
+                yield view[offset : offset + chunk_size]
+
+                # Чтение следующей части может потребовать обращения к диску,
+                # поэтому между частями цикл событий обрабатывает другие задачи.
+                await asyncio.sleep(0)
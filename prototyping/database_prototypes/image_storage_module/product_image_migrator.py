@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `product_image_migrator` реализует перенос изображений товаров
+из столбца `Product`.`image` (BLOB) в хранилище изображений пакетами.
+
+После переноса в столбце `image_key` сохраняется ключ изображения,
+а столбец `image` очищается (он объявлен как NOT NULL, поэтому хранит пустое значение).
+Строки без `image_key` продолжают читаться из BLOB, поэтому перенос можно
+выполнять на работающей БД и прерывать в любой момент.
+
+Запуск из каталога `prototyping`:
+    python -m database_prototypes.image_storage_module.product_image_migrator --root-dir images
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["ProductImageMigrator"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import argparse
+
+from typing import Any, List, Optional, Tuple
+
+from mysql.connector.errors import Error as MySQLError
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+
+from .abstract_image_storage import AbstractImageStorage
+
+
+# Код ошибки MySQL: столбец с таким именем уже существует.
+_DUPLICATE_COLUMN_ERRNO: int = 1060
+
+_ADD_IMAGE_KEY_COLUMN_QUERY: str = (
+    "ALTER TABLE `Product` ADD COLUMN `image_key` CHAR(64) NULL DEFAULT NULL"
+)
+
+# Строки выбираются по возрастанию `id` начиная с последней обработанной,
+# поэтому каждый пакет читает только свои строки.
+_SELECT_BATCH_QUERY: str = (
+    "SELECT `id`, `image` FROM `Product` "
+    "WHERE `id` > %s AND `image_key` IS NULL "
+    "ORDER BY `id` LIMIT %s "
+    "FOR UPDATE SKIP LOCKED"
+)
+
+# Завершающий проход ожидает блокировки строк, пропущенных основным проходом.
+_SELECT_REMAINING_BATCH_QUERY: str = (
+    "SELECT `id`, `image` FROM `Product` "
+    "WHERE `id` > %s AND `image_key` IS NULL "
+    "ORDER BY `id` LIMIT %s "
+    "FOR UPDATE"
+)
+
+_SET_IMAGE_KEY_QUERY: str = (
+    "UPDATE `Product` SET `image_key` = %s, `image` = '' WHERE `id` = %s"
+)
+
+_SELECT_IMAGE_QUERY: str = "SELECT `image_key`, `image` FROM `Product` WHERE `id` = %s"
+
+
+# _____________________________________________________________________________
+class ProductImageMigrator:
+    """ProductImageMigrator класс для переноса изображений товаров в хранилище.
+
+    Каждый пакет переносится в одной транзакции: изображения записываются
+    в хранилище, затем строкам назначается ключ. Если транзакция не завершилась,
+    записанные файлы остаются в хранилище и будут переиспользованы
+    при следующем переносе, так как ключом является содержимое.
+
+    Основной проход пропускает строки, заблокированные другими транзакциями
+    (SKIP LOCKED), поэтому не ожидает изменения товаров. Затем выполняется
+    завершающий проход с начала таблицы, ожидающий блокировки, поэтому
+    пропущенные строки также переносятся.
+
+    *Изображения заявок (`AddProductData`, `EditProductData`) не переносятся:
+    заявки хранятся недолго, а одобренное изображение попадает в `Product`.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+        __storage (AbstractImageStorage): Хранилище изображений.
+        __batch_size (int): Количество строк в пакете.
+        __last_id (int): Идентификатор последней обработанной строки.
+    """
+
+    __api: AsyncMySQLAPI
+    __storage: AbstractImageStorage
+    __batch_size: int
+    __last_id: int
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self, api: AsyncMySQLAPI, storage: AbstractImageStorage, batch_size: int = 100
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+            storage (AbstractImageStorage): Хранилище изображений.
+            batch_size (int, optional): Количество строк в пакете. По умолчанию 100.
+
+        Raises:
+            ValueError: Возбуждается если размер пакета меньше 1.
+        """
+        if batch_size < 1:
+            raise ValueError("Размер пакета должен быть больше нуля!")
+
+        self.__api = api
+        self.__storage = storage
+        self.__batch_size = batch_size
+        self.__last_id = 0
+
+    # -------------------------------------------------------------------------
+    async def create_image_key_column(self) -> None:
+        """create_image_key_column добавляет столбец `image_key` в таблицу `Product`."""
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                try:
+                    cursor.execute(_ADD_IMAGE_KEY_COLUMN_QUERY)
+                except MySQLError as error:
+                    if error.errno != _DUPLICATE_COLUMN_ERRNO:
+                        raise
+
+        await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def migrate_batch(self, skip_locked: bool = True) -> int:
+        """migrate_batch переносит один пакет изображений.
+
+        Args:
+            skip_locked (bool, optional): Пропускать ли заблокированные строки.
+                                          По умолчанию True.
+
+        Returns:
+            int: Количество перенесённых изображений; 0 - проход завершён.
+        """
+        last_id: int = self.__last_id
+        select_query: str = (
+            _SELECT_BATCH_QUERY if skip_locked else _SELECT_REMAINING_BATCH_QUERY
+        )
+
+        def transaction(connection: MySQLPooledConnection) -> Tuple[int, int]:
+            with connection.cursor() as cursor:
+                cursor.execute(select_query, (last_id, self.__batch_size))
+                rows: List[Tuple[Any, ...]] = cursor.fetchall()
+
+                updates: List[Tuple[str, int]] = [
+                    (self.__storage.put_sync(image=image), product_id)
+                    for product_id, image in rows
+                ]
+
+                if updates:
+                    cursor.executemany(_SET_IMAGE_KEY_QUERY, updates)
+
+            return len(rows), (rows[-1][0] if rows else last_id)
+
+        migrated, self.__last_id = await self.__api.execute_transaction_use_pool(
+            transaction
+        )
+
+        return migrated
+
+    # -------------------------------------------------------------------------
+    async def run(self, pause_seconds: float = 0.0) -> int:
+        """run переносит все изображения пакетами.
+
+        Args:
+            pause_seconds (float, optional): Пауза между пакетами, снижающая нагрузку
+                                             на работающую БД. По умолчанию 0.0.
+
+        Returns:
+            int: Количество перенесённых изображений.
+        """
+        total: int = 0
+
+        for skip_locked in (True, False):
+            self.__last_id = 0
+
+            while migrated := await self.migrate_batch(skip_locked=skip_locked):
+                total += migrated
+                print(
+                    f"Перенесено изображений: {total} (последний id: {self.__last_id})"
+                )
+
+                await asyncio.sleep(pause_seconds)
+
+        return total
+
+    # -------------------------------------------------------------------------
+    async def read_image(self, product_id: int) -> Optional[bytes]:
+        """read_image возвращает изображение товара независимо от места хранения.
+
+        Args:
+            product_id (int): Идентификатор товара.
+
+        Returns:
+            Optional[bytes]: Изображение, либо None если товар не найден.
+        """
+
+        def transaction(connection: MySQLPooledConnection) -> Optional[Tuple[Any, ...]]:
+            with connection.cursor() as cursor:
+                cursor.execute(_SELECT_IMAGE_QUERY, (product_id,))
+
+                return cursor.fetchone()
+
+        row: Optional[Tuple[Any, ...]] = await self.__api.execute_transaction_use_pool(
+            transaction
+        )
+
+        if row is None:
+            return None
+
+        image_key, image = row
+
+        if image_key is None:
+            return bytes(image)
+
+        with self.__storage.open(key=image_key) as view:
+            return view.tobytes()
+
+
+# ----------------------------------------------------------------------------
+def main() -> None:
+    from ..benchmarks.benchmark_tools import create_mysql_database
+    from .filesystem_image_storage import FileSystemImageStorage
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--root-dir", required=True)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--pause", type=float, default=0.0)
+    arguments = parser.parse_args()
+
+    async def migrate() -> None:
+        database = await create_mysql_database(pool_size=1)
+        migrator = ProductImageMigrator(
+            api=database.api,
+            storage=FileSystemImageStorage(root_dir=arguments.root_dir),
+            batch_size=arguments.batch_size,
+        )
+
+        await migrator.create_image_key_column()
+        await migrator.run(pause_seconds=arguments.pause)
+        await database.close_connection_with_database()
+
+    asyncio.run(migrate())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+__all__: list[str] = ["MediaRepository"]
+
+from .media_repository import MediaRepository
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `media_repository` реализует класс для хранения идентификаторов файлов telegram
+(`file_id`), полученных после первой загрузки изображения товара.
+Ключом является SHA-256 содержимого изображения, поэтому одинаковые изображения
+разных товаров загружаются в telegram один раз.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["MediaRepository"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from string import Template
+from typing import Dict, Mapping, Optional, Sequence
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+
+
+# Таблица не входит в схему MainDataBaseModel, так как хранит данные,
+# относящиеся только к telegram боту.
+_CREATE_TABLE_QUERY: str = (
+    "CREATE TABLE IF NOT EXISTS `TelegramMediaCache` ("
+    "`content_hash` CHAR(64) NOT NULL, "
+    "`file_id` VARCHAR(255) NOT NULL, "
+    "`created_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+    "PRIMARY KEY (`content_hash`))"
+)
+
+_SELECT_FILE_IDS_TEMPLATE = Template(
+    "SELECT `content_hash`, `file_id` FROM `TelegramMediaCache` "
+    "WHERE `content_hash` IN ($placeholders)"
+)
+
+_UPSERT_FILE_ID_QUERY: str = (
+    "INSERT INTO `TelegramMediaCache` (`content_hash`, `file_id`) VALUES (%s, %s) "
+    "ON DUPLICATE KEY UPDATE `file_id` = VALUES(`file_id`)"
+)
+
+_DELETE_FILE_ID_QUERY: str = (
+    "DELETE FROM `TelegramMediaCache` WHERE `content_hash` = %s"
+)
+
+
+# _____________________________________________________________________________
+class MediaRepository:
+    """MediaRepository класс для хранения идентификаторов файлов telegram.
+
+    *Методы совместимы с MediaCache из пакета telegram_scripts.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+    """
+
+    __api: AsyncMySQLAPI
+
+    # -------------------------------------------------------------------------
+    def __init__(self, api: AsyncMySQLAPI) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+        """
+        self.__api = api
+
+    # -------------------------------------------------------------------------
+    async def create_table(self) -> None:
+        """create_table создаёт таблицу `TelegramMediaCache`, если она не существует."""
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                cursor.execute(_CREATE_TABLE_QUERY)
+
+        await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def fetch_file_ids(self, content_hashes: Sequence[str]) -> Dict[str, str]:
+        """fetch_file_ids возвращает идентификаторы файлов одним запросом.
+
+        Args:
+            content_hashes (Sequence[str]): SHA-256 изображений.
+
+        Returns:
+            Dict[str, str]: Пары - [хэш : file_id] для найденных изображений.
+        """
+        if not content_hashes:
+            return {}
+
+        query: str = _SELECT_FILE_IDS_TEMPLATE.substitute(
+            placeholders=", ".join(["%s"] * len(content_hashes))
+        )
+
+        def transaction(connection: MySQLPooledConnection) -> Dict[str, str]:
+            with connection.cursor() as cursor:
+                cursor.execute(query, tuple(content_hashes))
+
+                return {content_hash: file_id for content_hash, file_id in cursor}
+
+        return await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def fetch_file_id(self, content_hash: str) -> Optional[str]:
+        """fetch_file_id возвращает идентификатор файла изображения.
+
+        Args:
+            content_hash (str): SHA-256 изображения.
+
+        Returns:
+            Optional[str]: file_id, либо None если изображение не загружалось.
+        """
+        file_ids: Dict[str, str] = await self.fetch_file_ids(
+            content_hashes=(content_hash,)
+        )
+
+        return file_ids.get(content_hash)
+
+    # -------------------------------------------------------------------------
+    async def store_file_ids(self, file_ids: Mapping[str, str]) -> None:
+        """store_file_ids сохраняет идентификаторы файлов одной транзакцией.
+
+        Args:
+            file_ids (Mapping[str, str]): Пары - [хэш : file_id].
+        """
+        if not file_ids:
+            return
+
+        rows = list(file_ids.items())
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                cursor.executemany(_UPSERT_FILE_ID_QUERY, rows)
+
+        await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def delete_file_id(self, content_hash: str) -> None:
+        """delete_file_id удаляет идентификатор файла, отклонённый telegram.
+
+        Args:
+            content_hash (str): SHA-256 изображения.
+        """
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                cursor.execute(_DELETE_FILE_ID_QUERY, (content_hash,))
+
+        await self.__api.execute_transaction_use_pool(transaction)
@@ -0,0 +1,10 @@
+__all__: list[str] = [
+    "AdminAssigner",
+    "ModerationQueue",
+    "ModerationRequest",
+    "ModerationRequestKind",
+]
+
+from .admin_assigner import AdminAssigner
+from .moderation_queue import ModerationQueue
+from .types import ModerationRequest, ModerationRequestKind
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `admin_assigner` реализует класс,
+который распределяет заявки на модерацию между администраторами.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["AdminAssigner"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from itertools import count
+
+from typing import Dict, Iterable, Iterator, Optional
+
+
+# _____________________________________________________________________________
+class AdminAssigner:
+    """AdminAssigner класс для равномерного распределения заявок.
+
+    Каждая новая заявка назначается администратору с наименьшим количеством
+    нерассмотренных заявок. При равной нагрузке выбирается администратор,
+    который дольше всех не получал заявку (круговой порядок).
+
+    Attributes:
+        __loads (Dict[int, int]): Количество нерассмотренных заявок у администратора.
+        __last_assignment (Dict[int, int]): Порядковый номер последнего назначения.
+        __sequence (Iterator[int]): Счётчик порядковых номеров назначений.
+    """
+
+    __loads: Dict[int, int]
+    __last_assignment: Dict[int, int]
+    __sequence: Iterator[int]
+
+    # -------------------------------------------------------------------------
+    def __init__(self, admin_ids: Iterable[int]) -> None:
+        """__init__ конструктор.
+
+        Args:
+            admin_ids (Iterable[int]): Идентификаторы администраторов.
+
+        Raises:
+            ValueError: Возбуждается если не передан ни один администратор.
+        """
+        self.__loads = {}
+        self.__last_assignment = {}
+        self.__sequence = count()
+
+        for admin_id in admin_ids:
+            self.add_admin(admin_id=admin_id)
+
+        if not self.__loads:
+            raise ValueError("Для распределения заявок требуется хотя бы один администратор!")
+
+    # -------------------------------------------------------------------------
+    def add_admin(self, admin_id: int) -> None:
+        """add_admin добавляет администратора в распределение.
+
+        Args:
+            admin_id (int): Идентификатор администратора.
+        """
+        self.__loads.setdefault(admin_id, 0)
+        self.__last_assignment.setdefault(admin_id, -1)
+
+    # -------------------------------------------------------------------------
+    def remove_admin(self, admin_id: int) -> None:
+        """remove_admin исключает администратора из распределения.
+
+        Args:
+            admin_id (int): Идентификатор администратора.
+        """
+        self.__loads.pop(admin_id, None)
+        self.__last_assignment.pop(admin_id, None)
+
+    # -------------------------------------------------------------------------
+    def assign(self) -> Optional[int]:
+        """assign выбирает администратора для новой заявки.
+
+        Returns:
+            Optional[int]: Идентификатор выбранного администратора,
+                           либо None если все администраторы исключены.
+        """
+        if not self.__loads:
+            return None
+
+        admin_id: int = min(
+            self.__loads,
+            key=lambda admin: (self.__loads[admin], self.__last_assignment[admin]),
+        )
+
+        self.__loads[admin_id] += 1
+        self.__last_assignment[admin_id] = next(self.__sequence)
+
+        return admin_id
+
+    # -------------------------------------------------------------------------
+    def release(self, admin_id: int) -> None:
+        """release уменьшает нагрузку администратора после рассмотрения заявки.
+
+        Args:
+            admin_id (int): Идентификатор администратора.
+        """
+        if self.__loads.get(admin_id, 0) > 0:
+            self.__loads[admin_id] -= 1
+
+    # -------------------------------------------------------------------------
+    def get_load(self, admin_id: int) -> int:
+        """get_load возвращает количество нерассмотренных заявок администратора.
+
+        Args:
+            admin_id (int): Идентификатор администратора.
+
+        Returns:
+            int: Количество нерассмотренных заявок.
+        """
+        return self.__loads.get(admin_id, 0)
@@ -0,0 +1,514 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `moderation_queue` реализует очередь заявок продавцов на модерацию,
+которая забирает ожидающие заявки из БД пакетами, распределяет их
+между администраторами и применяет одобренные изменения к товарам.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["ModerationQueue"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+
+from string import Template
+from typing import Dict, List, Optional, Tuple
+
+from mysql.connector.errors import Error as MySQLError
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+
+from .admin_assigner import AdminAssigner
+from .types import (
+    ModerationNotifyMethodType,
+    ModerationRequest,
+    ModerationRequestKind,
+)
+
+
+# Столбец с идентификатором товара для каждого типа заявки.
+_PRODUCT_COLUMNS: Dict[ModerationRequestKind, str] = {
+    ModerationRequestKind.ADD_PRODUCT: "NULL",
+    ModerationRequestKind.EDIT_PRODUCT: "`product_id`",
+    ModerationRequestKind.BLOCK_PRODUCT: "`product_id`",
+    ModerationRequestKind.UNBLOCK_PRODUCT: "`product_id`",
+    ModerationRequestKind.DELETE_PRODUCT: "`product_id`",
+}
+
+# Индексы, по которым выполняются выборки новых заявок и заявок с истёкшей арендой.
+_CLAIM_INDEX_TEMPLATES: Tuple[Template, ...] = (
+    Template(
+        "CREATE INDEX `status_created_at_idx` ON `$table` (`status`, `created_at`)"
+    ),
+    Template(
+        "CREATE INDEX `status_updated_at_idx` ON `$table` (`status`, `updated_at`)"
+    ),
+)
+
+# Выборки разделены, чтобы каждая читала диапазон своего индекса
+# без ожидания строк, заблокированных другими обработчиками:
+# условие с OR по двум статусам вынуждает MySQL просматривать таблицу.
+_CLAIM_EXPIRED_TEMPLATE = Template(
+    "SELECT `id`, $product_column, `created_at` FROM `$table` "
+    "WHERE `status` = 'pending' AND `updated_at` < NOW() - INTERVAL %s SECOND "
+    "ORDER BY `updated_at` LIMIT %s "
+    "FOR UPDATE SKIP LOCKED"
+)
+
+_CLAIM_OPEN_TEMPLATE = Template(
+    "SELECT `id`, $product_column, `created_at` FROM `$table` "
+    "WHERE `status` = 'open' "
+    "ORDER BY `created_at` LIMIT %s "
+    "FOR UPDATE SKIP LOCKED"
+)
+
+_MARK_PENDING_TEMPLATE = Template(
+    "UPDATE `$table` SET `status` = 'pending', `updated_at` = NOW() "
+    "WHERE `id` IN ($placeholders)"
+)
+
+_LOCK_PENDING_TEMPLATE = Template(
+    "SELECT `id` FROM `$table` WHERE `id` = %s AND `status` = 'pending' FOR UPDATE"
+)
+
+_REOPEN_TEMPLATE = Template(
+    "UPDATE `$table` SET `status` = 'open', `updated_at` = NOW() "
+    "WHERE `id` IN ($placeholders) AND `status` = 'pending'"
+)
+
+_SET_STATUS_TEMPLATE = Template(
+    "UPDATE `$table` SET `status` = %s, `updated_at` = NOW() WHERE `id` = %s"
+)
+
+# Запросы, применяющие одобренную заявку к таблице `Product`.
+_APPLY_QUERIES: Dict[ModerationRequestKind, str] = {
+    ModerationRequestKind.ADD_PRODUCT: (
+        "INSERT INTO `Product` "
+        "(`owner_id`, `service_id`, `title`, `description`, `image`, `price`) "
+        "SELECT r.`owner_user_id`, r.`service_id`, "
+        "d.`title`, d.`description`, d.`image`, d.`price` "
+        "FROM `RequestAddProduct` AS r "
+        "JOIN `AddProductData` AS d ON d.`request_id` = r.`id` "
+        "WHERE r.`id` = %s"
+    ),
+    ModerationRequestKind.EDIT_PRODUCT: (
+        "UPDATE `Product` AS p "
+        "JOIN `RequestEditProduct` AS r ON r.`product_id` = p.`id` "
+        "JOIN `EditProductData` AS d ON d.`request_id` = r.`id` "
+        "SET p.`title` = COALESCE(d.`new_title`, p.`title`), "
+        "p.`description` = COALESCE(d.`new_description`, p.`description`), "
+        "p.`image` = COALESCE(d.`new_image`, p.`image`), "
+        "p.`price` = COALESCE(d.`new_price`, p.`price`) "
+        "WHERE r.`id` = %s"
+    ),
+    ModerationRequestKind.BLOCK_PRODUCT: (
+        "UPDATE `Product` SET `is_blocked` = 1 WHERE `id` = %s"
+    ),
+    ModerationRequestKind.UNBLOCK_PRODUCT: (
+        "UPDATE `Product` SET `is_blocked` = 0 WHERE `id` = %s"
+    ),
+    ModerationRequestKind.DELETE_PRODUCT: "DELETE FROM `Product` WHERE `id` = %s",
+}
+
+# Код ошибки MySQL при попытке создать уже существующий индекс.
+_DUPLICATE_KEY_NAME_ERRNO: int = 1061
+
+# Максимальная пауза между попытками обработки очереди после ошибок подряд.
+_MAX_BACKOFF_SECONDS: float = 60.0
+
+
+# _____________________________________________________________________________
+class ModerationQueue:
+    """ModerationQueue класс очереди заявок на модерацию.
+
+    Этот класс забирает ожидающие заявки всех типов пакетами,
+    используя `SELECT ... FOR UPDATE SKIP LOCKED`, благодаря чему
+    несколько обработчиков могут работать одновременно, не блокируя друг друга
+    и не получая одни и те же заявки.
+
+    Забранные заявки переводятся в статус 'pending' и назначаются администраторам,
+    после чего отправляются в их чаты. Если решение по заявке не принято
+    за время аренды, заявка снова становится доступной для выборки.
+
+    *В модели БД таблицы заявок не хранят ответственного администратора,
+    поэтому назначения хранятся в памяти процесса.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+        __assigner (AdminAssigner): Распределитель заявок между администраторами.
+        __notify (ModerationNotifyMethodType): Функция отправки заявки администратору.
+        __batch_size (int): Максимальное количество заявок, забираемых за раз.
+        __lease_seconds (int): Время аренды заявки в статусе 'pending'.
+        __poll_interval (float): Пауза между выборками при пустой очереди.
+        __assignments (Dict[Tuple[ModerationRequestKind, int], int]): Назначенные заявки.
+        __next_kind_index (int): Тип заявки, с которого начнётся следующая выборка.
+    """
+
+    __api: AsyncMySQLAPI
+    __assigner: AdminAssigner
+    __notify: ModerationNotifyMethodType
+    __batch_size: int
+    __lease_seconds: int
+    __poll_interval: float
+    __assignments: Dict[Tuple[ModerationRequestKind, int], int]
+    __next_kind_index: int
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        api: AsyncMySQLAPI,
+        assigner: AdminAssigner,
+        notify: ModerationNotifyMethodType,
+        batch_size: int = 20,
+        lease_seconds: int = 3600,
+        poll_interval: float = 5.0,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+            assigner (AdminAssigner): Распределитель заявок между администраторами.
+            notify (ModerationNotifyMethodType): Функция отправки заявки в чат администратора.
+            batch_size (int, optional): Размер пакета заявок. По умолчанию 20.
+            lease_seconds (int, optional): Время аренды заявки в секундах. По умолчанию 3600.
+            poll_interval (float, optional): Пауза между выборками при пустой очереди.
+                                             По умолчанию 5.0.
+        """
+        self.__api = api
+        self.__assigner = assigner
+        self.__notify = notify
+        self.__batch_size = batch_size
+        self.__lease_seconds = lease_seconds
+        self.__poll_interval = poll_interval
+        self.__assignments = {}
+        self.__next_kind_index = 0
+
+    # -------------------------------------------------------------------------
+    async def create_claim_indexes(self) -> None:
+        """create_claim_indexes создаёт индексы для выборки ожидающих заявок.
+
+        Без индексов по (`status`, `created_at`) и (`status`, `updated_at`)
+        выборки просматривают и блокируют всю таблицу заявок, что снижает
+        пропускную способность при одновременной работе нескольких обработчиков.
+        """
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                for kind in ModerationRequestKind:
+                    for template in _CLAIM_INDEX_TEMPLATES:
+                        try:
+                            cursor.execute(template.substitute(table=kind.value))
+                        except MySQLError as error:
+                            if error.errno != _DUPLICATE_KEY_NAME_ERRNO:
+                                raise
+
+        await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def claim_batch(self) -> List[ModerationRequest]:
+        """claim_batch забирает пакет ожидающих заявок.
+
+        Заявки выбираются из всех таблиц в одной транзакции,
+        начиная каждый раз со следующего типа заявки, чтобы ни один тип
+        не ожидал бесконечно при большом потоке заявок другого типа.
+
+        Returns:
+            List[ModerationRequest]: Забранные заявки, переведённые в статус 'pending'.
+        """
+        kinds: List[ModerationRequestKind] = list(ModerationRequestKind)
+        start: int = self.__next_kind_index
+        self.__next_kind_index = (start + 1) % len(kinds)
+
+        ordered_kinds: List[ModerationRequestKind] = kinds[start:] + kinds[:start]
+
+        def transaction(connection: MySQLPooledConnection) -> List[ModerationRequest]:
+            claimed: List[ModerationRequest] = []
+
+            with connection.cursor() as cursor:
+                for kind in ordered_kinds:
+                    remaining: int = self.__batch_size - len(claimed)
+
+                    if remaining <= 0:
+                        break
+
+                    # Заявки с истёкшей арендой забираются первыми,
+                    # так как они ожидают решения дольше новых.
+                    cursor.execute(
+                        _CLAIM_EXPIRED_TEMPLATE.substitute(
+                            table=kind.value, product_column=_PRODUCT_COLUMNS[kind]
+                        ),
+                        (self.__lease_seconds, remaining),
+                    )
+                    rows: List[Tuple] = cursor.fetchall()
+
+                    if len(rows) < remaining:
+                        cursor.execute(
+                            _CLAIM_OPEN_TEMPLATE.substitute(
+                                table=kind.value, product_column=_PRODUCT_COLUMNS[kind]
+                            ),
+                            (remaining - len(rows),),
+                        )
+                        rows.extend(cursor.fetchall())
+
+                    if not rows:
+                        continue
+
+                    cursor.execute(
+                        _MARK_PENDING_TEMPLATE.substitute(
+                            table=kind.value, placeholders=", ".join(["%s"] * len(rows))
+                        ),
+                        tuple(row[0] for row in rows),
+                    )
+
+                    claimed.extend(
+                        ModerationRequest(
+                            kind=kind,
+                            request_id=row[0],
+                            product_id=row[1],
+                            created_at=row[2],
+                        )
+                        for row in rows
+                    )
+
+            return claimed
+
+        return await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def dispatch(self, requests: List[ModerationRequest]) -> int:
+        """dispatch назначает заявки администраторам и отправляет их в чаты.
+
+        Заявка, которую не удалось назначить или отправить, снимается
+        с администратора и возвращается в статус 'open' для повторной выборки.
+
+        Args:
+            requests (List[ModerationRequest]): Забранные заявки.
+
+        Returns:
+            int: Количество отправленных заявок.
+        """
+        notified: List[ModerationRequest] = []
+        failed: List[ModerationRequest] = []
+        notifications = []
+
+        for request in requests:
+            key: Tuple[ModerationRequestKind, int] = (request.kind, request.request_id)
+
+            admin_id: Optional[int] = self.__assignments.get(key)
+
+            if admin_id is None:
+                admin_id = self.__assigner.assign()
+
+                if admin_id is None:
+                    failed.append(request)
+                    continue
+
+                self.__assignments[key] = admin_id
+
+            notified.append(request)
+            notifications.append(self.__notify(admin_id, request))
+
+        if failed:
+            print(
+                "Возникла ошибка при назначении заявок! "
+                "Нет администраторов для их рассмотрения."
+            )
+
+        results: List[Optional[BaseException]] = await asyncio.gather(
+            *notifications, return_exceptions=True
+        )
+
+        for request, result in zip(notified, results):
+            if isinstance(result, BaseException):
+                print(
+                    "Возникла ошибка при отправке заявки "
+                    f"{request.kind.value} {request.request_id}! {result}"
+                )
+                self.__release(request=request)
+                failed.append(request)
+
+        if failed:
+            await self.__reopen(requests=failed)
+
+        return len(requests) - len(failed)
+
+    # -------------------------------------------------------------------------
+    async def approve(self, request: ModerationRequest) -> bool:
+        """approve одобряет заявку, применяя изменения к товару.
+
+        Изменение товара и закрытие заявки выполняются в одной транзакции.
+
+        Args:
+            request (ModerationRequest): Одобряемая заявка.
+
+        Returns:
+            bool: True, если заявка применена; False, если она уже не ожидает решения.
+        """
+        apply_parameter: Optional[int] = (
+            request.request_id
+            if request.kind
+            in (ModerationRequestKind.ADD_PRODUCT, ModerationRequestKind.EDIT_PRODUCT)
+            else request.product_id
+        )
+
+        def transaction(connection: MySQLPooledConnection) -> bool:
+            with connection.cursor() as cursor:
+                if not self.__lock_pending_request(cursor=cursor, request=request):
+                    return False
+
+                # Заявка закрывается до применения, так как удаление товара
+                # каскадно удаляет связанную с ним заявку.
+                cursor.execute(
+                    _SET_STATUS_TEMPLATE.substitute(table=request.kind.value),
+                    ("closed", request.request_id),
+                )
+                cursor.execute(_APPLY_QUERIES[request.kind], (apply_parameter,))
+
+            return True
+
+        applied: bool = await self.__api.execute_transaction_use_pool(transaction)
+
+        self.__release(request=request)
+
+        return applied
+
+    # -------------------------------------------------------------------------
+    async def reject(self, request: ModerationRequest) -> bool:
+        """reject отклоняет заявку, не изменяя товар.
+
+        Args:
+            request (ModerationRequest): Отклоняемая заявка.
+
+        Returns:
+            bool: True, если заявка отклонена; False, если она уже не ожидает решения.
+        """
+
+        def transaction(connection: MySQLPooledConnection) -> bool:
+            with connection.cursor() as cursor:
+                if not self.__lock_pending_request(cursor=cursor, request=request):
+                    return False
+
+                cursor.execute(
+                    _SET_STATUS_TEMPLATE.substitute(table=request.kind.value),
+                    ("canceled", request.request_id),
+                )
+
+            return True
+
+        rejected: bool = await self.__api.execute_transaction_use_pool(transaction)
+
+        self.__release(request=request)
+
+        return rejected
+
+    # -------------------------------------------------------------------------
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """run запускает обработку очереди до установки события остановки.
+
+        Одновременно может работать несколько обработчиков,
+        каждый из которых забирает свои пакеты заявок.
+
+        Args:
+            stop_event (asyncio.Event): Событие, сигнализирующее об остановке.
+        """
+        failures: int = 0
+
+        while not stop_event.is_set():
+            try:
+                requests: List[ModerationRequest] = await self.claim_batch()
+
+                if requests and not await self.dispatch(requests=requests):
+                    # Все заявки возвращены в очередь; без паузы
+                    # они были бы сразу забраны снова.
+                    failures += 1
+                    requests = []
+                else:
+                    failures = 0
+
+            except Exception as error:
+                print(f"Возникла ошибка при обработке очереди модерации! {error}")
+
+                failures += 1
+                requests = []
+
+            if requests:
+                continue
+
+            # После ошибок подряд пауза растёт, чтобы не нагружать недоступную БД.
+            delay: float = min(
+                self.__poll_interval * 2 ** max(failures - 1, 0), _MAX_BACKOFF_SECONDS
+            )
+
+            try:
+                async with asyncio.timeout(delay=delay):
+                    await stop_event.wait()
+            except asyncio.TimeoutError:
+                pass
+
+    # -------------------------------------------------------------------------
+    def __lock_pending_request(self, cursor, request: ModerationRequest) -> bool:
+        """__lock_pending_request блокирует заявку, если она ожидает решения.
+
+        Args:
+            cursor: Курсор текущей транзакции.
+            request (ModerationRequest): Заявка для блокировки.
+
+        Returns:
+            bool: True, если заявка находится в статусе 'pending'.
+        """
+        cursor.execute(
+            _LOCK_PENDING_TEMPLATE.substitute(table=request.kind.value),
+            (request.request_id,),
+        )
+
+        return cursor.fetchone() is not None
+
+    # -------------------------------------------------------------------------
+    async def __reopen(self, requests: List[ModerationRequest]) -> None:
+        """__reopen возвращает заявки из статуса 'pending' в статус 'open'.
+
+        *Если вернуть заявки не удалось, они станут доступны по истечении аренды.
+
+        Args:
+            requests (List[ModerationRequest]): Заявки, не дошедшие до администраторов.
+        """
+        request_ids: Dict[ModerationRequestKind, List[int]] = {}
+
+        for request in requests:
+            request_ids.setdefault(request.kind, []).append(request.request_id)
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                for kind, ids in request_ids.items():
+                    cursor.execute(
+                        _REOPEN_TEMPLATE.substitute(
+                            table=kind.value, placeholders=", ".join(["%s"] * len(ids))
+                        ),
+                        tuple(ids),
+                    )
+
+        try:
+            await self.__api.execute_transaction_use_pool(transaction)
+
+        except Exception as error:
+            print(f"Возникла ошибка при возврате заявок в очередь! {error}")
+
+    # -------------------------------------------------------------------------
+    def __release(self, request: ModerationRequest) -> None:
+        """__release снимает заявку с назначенного администратора.
+
+        Args:
+            request (ModerationRequest): Рассмотренная заявка.
+        """
+        admin_id: Optional[int] = self.__assignments.pop(
+            (request.kind, request.request_id), None
+        )
+
+        if admin_id is not None:
+            self.__assigner.release(admin_id=admin_id)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль предназначен для хранения типов,
+описывающих заявки продавцов, проходящие модерацию.
+"""
+
+__all__: list[str] = [
+    "ModerationRequestKind",
+    "ModerationRequest",
+    "ModerationNotifyMethodType",
+]
+
+from enum import StrEnum
+from datetime import datetime
+from dataclasses import dataclass
+
+from typing import Awaitable, Callable, Optional
+
+
+# _____________________________________________________________________________
+class ModerationRequestKind(StrEnum):
+    """ModerationRequestKind перечисление типов заявок на модерацию.
+
+    Значение каждого элемента совпадает с названием таблицы заявок в БД.
+    """
+
+    ADD_PRODUCT = "RequestAddProduct"
+    EDIT_PRODUCT = "RequestEditProduct"
+    BLOCK_PRODUCT = "RequestBlockProduct"
+    UNBLOCK_PRODUCT = "RequestUnblockProduct"
+    DELETE_PRODUCT = "RequestDeleteProduct"
+
+
+# _____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class ModerationRequest:
+    """ModerationRequest класс для представления заявки на модерацию.
+
+    Attributes:
+        kind (ModerationRequestKind): Тип заявки (таблица, хранящая заявку).
+        request_id (int): Идентификатор заявки в таблице.
+        product_id (Optional[int]): Идентификатор товара, к которому относится заявка.
+                                    Для заявок на добавление товара - None.
+        created_at (datetime): Дата и время создания заявки.
+    """
+
+    kind: ModerationRequestKind
+    request_id: int
+    product_id: Optional[int]
+    created_at: datetime
+
+
+# Аннотация для функции, отправляющей заявку в чат администратора.
+ModerationNotifyMethodType = Callable[[int, ModerationRequest], Awaitable[None]]
@@ -1,4 +1,9 @@
-__all__: list[str] = ["AsyncMySQLAPI", "AsyncMySQLDataBase"]
+__all__: list[str] = [
+    "AsyncMySQLAPI",
+    "AsyncMySQLDataBase",
+    "ResizableMySQLConnectionPool",
+]
 
 from .async_mysql_database import AsyncMySQLDataBase
 from .async_mysql_database_api import AsyncMySQLAPI
+from .resizable_pool import ResizableMySQLConnectionPool
@@ -15,10 +15,13 @@ __version__ = "1.0.0"
 
 from ..database_module.abstract_async_database import AbstractAsyncDataBase
 
-from typing import Dict, Any
+import asyncio
+
+from typing import Dict, Any, Optional
 from mysql.connector.pooling import MySQLConnectionPool
 
 from .async_mysql_database_api import AsyncMySQLAPI
+from .resizable_pool import ResizableMySQLConnectionPool
 from .types import AsyncMySQLConnectionType, AsyncMySQLConnectMethodType
 
 
@@ -41,10 +44,15 @@ class AsyncMySQLDataBase(
         AbstractAsyncDataBase: Базовый класс для реализации конкретного типа БД.
 
     Attributes:
-        __pool (AsyncMySQLConnectionPool): Активный пул соединений к БД.
+        __pool (Optional[MySQLConnectionPool]): Активный пул соединений к БД,
+                                                либо None если пул ещё не открыт.
+        __pool_name (str): Именной идентификатор пула соединений.
+        __pool_size (int): Размер/количество доступных соединений пула.
     """
 
-    __pool: MySQLConnectionPool
+    __pool: Optional[MySQLConnectionPool]
+    __pool_name: str
+    __pool_size: int
 
     # -------------------------------------------------------------------------
     def __init__(
@@ -54,6 +62,7 @@ class AsyncMySQLDataBase(
         api: AsyncMySQLAPI,
         pool_name: str = "mysql_pool",
         pool_size: int = 3,
+        open_pool_on_init: bool = True,
     ) -> None:
         """__init__ конструктор.
 
@@ -67,6 +76,10 @@ class AsyncMySQLDataBase(
                                        По умолчанию "mysql_pool".
             pool_size (int, optional): Размер/количество доступных соединений пула.
                                        По умолчанию 3.
+            open_pool_on_init (bool, optional): Открывать ли пул соединений в конструкторе.
+                                                Если False, пул открывается методом open_pool
+                                                в отдельном потоке, не блокируя цикл событий.
+                                                По умолчанию True.
         """
         super().__init__(
             connect_method=connect_method,
@@ -74,9 +87,27 @@ class AsyncMySQLDataBase(
             api=api,
         )
 
-        self.__pool = MySQLConnectionPool(
-            pool_name=pool_name, pool_size=pool_size, **connection_data
-        )
+        self.__pool = None
+        self.__pool_name = pool_name
+        self.__pool_size = pool_size
+
+        if open_pool_on_init:
+            self.__pool = self.__create_pool()
+
+    # -------------------------------------------------------------------------
+    async def open_pool(self) -> MySQLConnectionPool:
+        """open_pool открывает пул соединений к БД, если он ещё не открыт.
+
+        *Соединения пула устанавливаются синхронно,
+        поэтому пул создаётся в отдельном потоке.
+
+        Returns:
+            MySQLConnectionPool: Открытый пул соединений к БД.
+        """
+        if self.__pool is None:
+            self.__pool = await asyncio.to_thread(self.__create_pool)
+
+        return self.__pool
 
     # -------------------------------------------------------------------------
     async def get_connect_method(self) -> AsyncMySQLConnectMethodType:
@@ -133,13 +164,37 @@ class AsyncMySQLDataBase(
 
         Этот метод закрывает текущее независимое от пула соединений,
         соединение к БД, тем самым обрывая независимое подключение к БД.
+
+        *Если соединение не было создано, метод ничего не делает.
+        Перед закрытием ожидаются операции, ожидающие в очереди API.
         """
-        connection: AsyncMySQLConnectionType = (
-            await self.get_connection_with_database()
-        )
+        connection: Optional[AsyncMySQLConnectionType] = self._connection_with_database
+
+        if connection is None:
+            return
+
+        await self.api.close_connection_channel()
+
+        self._connection_with_database = None
 
         await connection.close()
 
+    # -------------------------------------------------------------------------
+    async def close_pool(self) -> None:
+        """close_pool закрывает свободные соединения пула.
+
+        *Соединения закрываются синхронно, поэтому в отдельном потоке.
+        Метод следует вызывать после завершения транзакций над пулом.
+        """
+        pool: Optional[MySQLConnectionPool] = self.__pool
+
+        if pool is None:
+            return
+
+        self.__pool = None
+
+        await asyncio.to_thread(pool._remove_connections)
+
     # -------------------------------------------------------------------------
     async def connect_api_to_database(self) -> None:
         """connect_api_to_database устанавливает подключение API к БД.
@@ -147,12 +202,21 @@ class AsyncMySQLDataBase(
         Этот метод настраивает соединение API к БД,
         передавая пул соединений и независимое соединение,
         обеспечивая возможность API взаимодействовать над БД.
+
+        *Пул соединений и независимое соединение устанавливаются одновременно.
         """
-        pool: MySQLConnectionPool = self.__pool
-        connection_with_database: AsyncMySQLConnectionType = (
-            await self.get_connection_with_database()
+        pool, connection_with_database = await asyncio.gather(
+            self.open_pool(), self.get_connection_with_database()
         )
 
         await self.api.set_up(
             separate_connection=connection_with_database, pool=pool
         )
+
+    # -------------------------------------------------------------------------
+    def __create_pool(self) -> MySQLConnectionPool:
+        return ResizableMySQLConnectionPool(
+            pool_name=self.__pool_name,
+            pool_size=self.__pool_size,
+            **self._connection_data,
+        )
@@ -19,15 +19,25 @@ from ..database_module.async_sql_database_api import (
 from ..database_module.async_sql_database_pool_api import (
     AsyncSQLDataBasePoolAPI,
 )
+from ..database_module.separate_connection_channel import (
+    SeparateConnectionChannel,
+)
+
+import time
+import asyncio
 
-from typing import Dict
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
 from string import Template
 from mysql.connector.pooling import MySQLConnectionPool
 from mysql.connector.errors import Error as MySQLError
 
+from .resizable_pool import ResizableMySQLConnectionPool
 from .types import (
     AsyncMySQLConnectionType,
     MySQLPooledConnection,
+    TransactionObserverType,
 )
 
 
@@ -50,11 +60,39 @@ class AsyncMySQLAPI(
     Attributes:
         __pool (AsyncMySQLConnectionPool): Активный пул соединений к БД
         __connection_with_database (AsyncMySQLConnectionType): Активное независимое подключение к БД.
+        __connection_channel (SeparateConnectionChannel): Очередь операций
+            над независимым подключением, выполняемых по порядку.
+        __fallback_queue_depth (Optional[int]): Глубина очереди независимого подключения,
+            начиная с которой запросы выполняются через пул.
+        __transaction_observer (Optional[TransactionObserverType]): Функция, получающая
+            замеры транзакций над пулом (например, для экспорта метрик).
+        __active_transactions_amount (int): Количество выполняющихся транзакций над пулом.
+        __pool_slot_waiters (Deque[asyncio.Future[None]]): Очередь вызовов,
+            ожидающих освобождения соединения пула.
+        __connections_in_use_amount (int): Количество занятых соединений пула.
     """
 
     __pool: MySQLConnectionPool
     __connection_with_database: AsyncMySQLConnectionType
+    __connection_channel: Optional[SeparateConnectionChannel[AsyncMySQLConnectionType]] = None
+    __fallback_queue_depth: Optional[int]
+    __transaction_observer: Optional[TransactionObserverType] = None
+    __active_transactions_amount: int = 0
+    __pool_slot_waiters: Deque[asyncio.Future[None]]
+    __connections_in_use_amount: int = 0
+
+    def __init__(self, fallback_queue_depth: Optional[int] = 16) -> None:
+        """__init__ конструктор.
+
+        Args:
+            fallback_queue_depth (Optional[int], optional): Глубина очереди независимого
+                подключения, начиная с которой запросы execute_sql_query_to_database
+                выполняются через пул. None - всегда ожидать очереди. По умолчанию 16.
+        """
+        self.__fallback_queue_depth = fallback_queue_depth
+        self.__pool_slot_waiters = deque()
 
+    # -------------------------------------------------------------------------
     async def set_up(
         self,
         separate_connection: AsyncMySQLConnectionType,
@@ -84,6 +122,67 @@ class AsyncMySQLAPI(
         """
         self.__pool = pool
 
+    # -------------------------------------------------------------------------
+    def set_transaction_observer(
+        self, observer: Optional[TransactionObserverType]
+    ) -> None:
+        """set_transaction_observer задаёт функцию, получающую замеры транзакций.
+
+        *Функция вызывается в цикле событий после завершения каждой транзакции
+        методом execute_transaction_use_pool.
+
+        Args:
+            observer (Optional[TransactionObserverType]): Функция; None - отключить.
+        """
+        self.__transaction_observer = observer
+
+    # -------------------------------------------------------------------------
+    @property
+    def pool_size(self) -> int:
+        return self.__pool.pool_size
+
+    # -------------------------------------------------------------------------
+    @property
+    def active_transactions_amount(self) -> int:
+        return self.__active_transactions_amount
+
+    # -------------------------------------------------------------------------
+    @property
+    def connections_in_use_amount(self) -> int:
+        return self.__connections_in_use_amount
+
+    # -------------------------------------------------------------------------
+    @property
+    def transaction_observer(self) -> Optional[TransactionObserverType]:
+        return self.__transaction_observer
+
+    # -------------------------------------------------------------------------
+    async def resize_pool(self, pool_size: int) -> int:
+        """resize_pool изменяет количество соединений пула.
+
+        *Соединения устанавливаются синхронно, поэтому в отдельном потоке.
+        Занятые соединения не закрываются, поэтому уменьшенный размер
+        может оказаться больше требуемого.
+
+        Args:
+            pool_size (int): Требуемый размер пула.
+
+        Raises:
+            TypeError: Возбуждается если пул не является ResizableMySQLConnectionPool.
+
+        Returns:
+            int: Установленный размер пула.
+        """
+        if not isinstance(self.__pool, ResizableMySQLConnectionPool):
+            raise TypeError("Пул соединений не поддерживает изменение размера!")
+
+        new_pool_size: int = await asyncio.to_thread(self.__pool.resize, pool_size)
+
+        # Добавленные соединения сразу отдаются ожидающим транзакциям.
+        self.__wake_pool_slot_waiters()
+
+        return new_pool_size
+
     # -------------------------------------------------------------------------
     async def set_connection_with_database(
         self, connection: AsyncMySQLConnectionType
@@ -97,6 +196,58 @@ class AsyncMySQLAPI(
             connection (AsyncMySQLConnectionType): Независимое соединение к БД.
         """
         self.__connection_with_database = connection
+        self.__connection_channel = SeparateConnectionChannel(
+            connection=connection, fallback_queue_depth=self.__fallback_queue_depth
+        )
+
+    # -------------------------------------------------------------------------
+    async def execute_use_connection_with_database[ResultType](
+        self,
+        operation: Callable[[AsyncMySQLConnectionType], Awaitable[ResultType]],
+        fallback: Optional[Callable[[], Awaitable[ResultType]]] = None,
+    ) -> ResultType:
+        """execute_use_connection_with_database выполняет операцию над независимым подключением.
+
+        Операции разных задач выполняются по очереди в порядке вызова,
+        поэтому запросы не перемешиваются на одном подключении.
+
+        Args:
+            operation (Callable[[AsyncMySQLConnectionType], Awaitable[ResultType]]): Функция,
+                получающая независимое подключение и выполняющая запросы.
+            fallback (Optional[Callable[[], Awaitable[ResultType]]], optional): Вариант
+                операции через пул, выполняемый при заполненной очереди. По умолчанию None.
+
+        Returns:
+            ResultType: Результат операции.
+        """
+        return await self.__connection_channel.execute(  # type: ignore
+            operation=operation, fallback=fallback
+        )
+
+    # -------------------------------------------------------------------------
+    async def close_connection_channel(self) -> None:
+        """close_connection_channel ожидает операции над независимым подключением.
+
+        *Метод следует вызвать перед закрытием независимого подключения.
+        """
+        if self.__connection_channel is not None:
+            await self.__connection_channel.close()
+
+    # -------------------------------------------------------------------------
+    @property
+    def connection_queue_depth(self) -> int:
+        if self.__connection_channel is None:
+            return 0
+
+        return self.__connection_channel.queue_depth
+
+    # -------------------------------------------------------------------------
+    @property
+    def connection_fallback_amount(self) -> int:
+        if self.__connection_channel is None:
+            return 0
+
+        return self.__connection_channel.fallback_amount
 
     # -------------------------------------------------------------------------
     async def get_connection_with_database(self) -> AsyncMySQLConnectionType:
@@ -137,11 +288,13 @@ class AsyncMySQLAPI(
         Returns:
             bool: True, если подключение активно; иначе False.
         """
-        connection: AsyncMySQLConnectionType = (
-            await self.get_connection_with_database()
-        )
 
-        connection_status: bool = await connection.is_connected()
+        async def operation(connection: AsyncMySQLConnectionType) -> bool:
+            return await connection.is_connected()
+
+        connection_status: bool = await self.execute_use_connection_with_database(
+            operation
+        )
 
         return connection_status
 
@@ -174,24 +327,25 @@ class AsyncMySQLAPI(
             query_template (Template): Шаблон строки запроса.
             query_data (Dict[str, str]): Данные для подстановки в шаблон.
         """
-        connection: MySQLPooledConnection = (
-            await self.get_connection_from_pool()
-        )
-
         query_string: str = query_template.substitute(**query_data)
 
-        try:
-            with connection.cursor() as cursor:
-                cursor.execute(query_string)
+        async with self.__acquire_pool_slot():
+            connection: MySQLPooledConnection = (
+                await self.get_connection_from_pool()
+            )
 
-                connection.commit()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(query_string)
 
-        except MySQLError as error:
-            connection.rollback()
-            print(f"Возникла ошибка при выполнении запроса! {error}")
+                    connection.commit()
 
-        finally:
-            await self.close_connection_from_pool(connection=connection)
+            except MySQLError as error:
+                connection.rollback()
+                print(f"Возникла ошибка при выполнении запроса! {error}")
+
+            finally:
+                await self.close_connection_from_pool(connection=connection)
 
     # -------------------------------------------------------------------------
     async def execute_sql_query_to_database(
@@ -202,22 +356,187 @@ class AsyncMySQLAPI(
         Этот метод выполняет запрос к БД, используя независимое соединение.
         Для генерации запроса используется шаблон запроса и данные для подстановки в него.
 
+        *Запросы разных задач выполняются по очереди; если очередь заполнена,
+        запрос выполняется через пул соединений.
+
         Args:
             query_template (Template): Шаблон строки запроса.
             query_data (Dict[str, str]): Данные для подстановки в шаблон.
         """
-        connection: AsyncMySQLConnectionType = (
-            await self.get_connection_with_database()
-        )
-
         query_string: str = query_template.substitute(**query_data)
 
+        async def operation(connection: AsyncMySQLConnectionType) -> None:
+            try:
+                async with await connection.cursor() as cursor:
+                    await cursor.execute(query_string)
+
+                    await connection.commit()
+
+            except MySQLError as error:
+                await connection.rollback()
+                print(f"Возникла ошибка при выполнении запроса! {error}")
+
+        async def fallback() -> None:
+            await self.execute_sql_query_use_pool(
+                query_template=query_template, query_data=query_data
+            )
+
+        await self.execute_use_connection_with_database(operation, fallback)
+
+    # -------------------------------------------------------------------------
+    async def execute_transaction_use_pool[ResultType](
+        self,
+        transaction: Callable[[MySQLPooledConnection], ResultType],
+    ) -> ResultType:
+        """execute_transaction_use_pool выполняет транзакцию над БД.
+
+        Этот метод выполняет функцию-транзакцию в отдельном потоке,
+        используя соединение из пула, что не блокирует цикл событий,
+        пока синхронное соединение ожидает ответа от БД.
+
+        *Если все соединения пула заняты, транзакция ожидает освобождения
+        соединения в очереди, а не завершается ошибкой PoolError.
+        При ошибке изменения откатываются, а исключение возбуждается повторно.
+        При отмене вызова поток завершает транзакцию, а соединение считается
+        занятым, пока поток не вернёт его в пул.
+
+        Args:
+            transaction (Callable[[MySQLPooledConnection], ResultType]): Функция,
+                получающая соединение из пула и выполняющая запросы.
+
+        Returns:
+            ResultType: Результат, возвращённый функцией-транзакцией.
+        """
+        # Время получения соединения записывается потоком, выполняющим транзакцию,
+        # поэтому замер ожидания включает время в очереди за соединением.
+        timings: List[float] = [time.perf_counter()]
+        queued_at: float = timings[0]
+        error: Optional[BaseException] = None
+
+        self.__active_transactions_amount += 1
+
+        try:
+            await self.__take_pool_slot()
+
+            # Отмена не прерывает поток, поэтому место в пуле освобождается
+            # по завершении потока, а не при отмене ожидающей задачи.
+            future: asyncio.Future[ResultType] = asyncio.ensure_future(
+                asyncio.to_thread(self.__run_transaction, transaction, timings)
+            )
+            future.add_done_callback(lambda _: self.__release_pool_slot())
+
+            return await asyncio.shield(future)
+
+        except BaseException as exception:
+            error = exception
+            raise
+
+        finally:
+            self.__active_transactions_amount -= 1
+
+            if self.__transaction_observer is not None:
+                self.__transaction_observer(
+                    timings[0] - queued_at, time.perf_counter() - timings[0], error
+                )
+
+    # -------------------------------------------------------------------------
+    @asynccontextmanager
+    async def __acquire_pool_slot(self) -> AsyncIterator[None]:
+        """__acquire_pool_slot занимает соединение пула на время блока."""
+        await self.__take_pool_slot()
+
         try:
-            async with await connection.cursor() as cursor:
-                await cursor.execute(query_string)
+            yield
+
+        finally:
+            self.__release_pool_slot()
 
-                await connection.commit()
+    # -------------------------------------------------------------------------
+    async def __take_pool_slot(self) -> None:
+        """__take_pool_slot ожидает свободное соединение пула.
 
-        except MySQLError as error:
-            await connection.rollback()
-            print(f"Возникла ошибка при выполнении запроса! {error}")
+        Пул MySQL не ожидает освобождения соединения и сразу возбуждает PoolError,
+        поэтому количество одновременно занятых соединений ограничивается
+        текущим размером пула, а остальные вызовы ожидают в порядке очереди.
+        """
+        if (
+            not self.__pool_slot_waiters
+            and self.__connections_in_use_amount < self.__pool.pool_size
+        ):
+            self.__connections_in_use_amount += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.__pool_slot_waiters.append(waiter)
+
+        try:
+            await waiter
+
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Соединение было передано до отмены, поэтому отдаётся следующему.
+                self.__release_pool_slot()
+            elif waiter in self.__pool_slot_waiters:
+                self.__pool_slot_waiters.remove(waiter)
+
+            raise
+
+    # -------------------------------------------------------------------------
+    def __release_pool_slot(self) -> None:
+        """__release_pool_slot освобождает соединение пула.
+
+        *Метод синхронный, поэтому может вызываться из done-callback.
+        """
+        self.__connections_in_use_amount -= 1
+        self.__wake_pool_slot_waiters()
+
+    # -------------------------------------------------------------------------
+    def __wake_pool_slot_waiters(self) -> None:
+        """__wake_pool_slot_waiters передаёт свободные соединения ожидающим вызовам."""
+        while (
+            self.__pool_slot_waiters
+            and self.__connections_in_use_amount < self.__pool.pool_size
+        ):
+            waiter: asyncio.Future[None] = self.__pool_slot_waiters.popleft()
+
+            if not waiter.done():
+                self.__connections_in_use_amount += 1
+                waiter.set_result(None)
+
+    # -------------------------------------------------------------------------
+    def __run_transaction[ResultType](
+        self,
+        transaction: Callable[[MySQLPooledConnection], ResultType],
+        timings: Optional[List[float]] = None,
+    ) -> ResultType:
+        """__run_transaction синхронно выполняет транзакцию над БД.
+
+        Args:
+            transaction (Callable[[MySQLPooledConnection], ResultType]): Функция-транзакция.
+            timings (Optional[List[float]], optional): Список, первый элемент которого
+                заменяется временем получения соединения (time.perf_counter).
+
+        Returns:
+            ResultType: Результат, возвращённый функцией-транзакцией.
+        """
+        try:
+            connection: MySQLPooledConnection = self.__pool.get_connection()
+        finally:
+            if timings is not None:
+                timings[0] = time.perf_counter()
+
+        try:
+            connection.start_transaction()
+
+            result: ResultType = transaction(connection)
+
+            connection.commit()
+
+            return result
+
+        except Exception:
+            connection.rollback()
+            raise
+
+        finally:
+            connection.close()
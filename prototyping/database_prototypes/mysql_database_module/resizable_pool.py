@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `resizable_pool` реализует пул соединений MySQL,
+размер которого можно изменять во время работы приложения.
+
+MySQLConnectionPool создаёт очередь соединений фиксированного размера,
+поэтому изменение размера выполняется над очередью пула под его блокировкой.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["ResizableMySQLConnectionPool"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import queue
+
+from typing import List
+
+from mysql.connector import connect
+from mysql.connector.errors import Error as MySQLError
+from mysql.connector.pooling import (
+    CNX_POOL_MAXSIZE,
+    CONNECTION_POOL_LOCK,
+    MySQLConnectionPool,
+)
+
+
+# _____________________________________________________________________________
+class ResizableMySQLConnectionPool(MySQLConnectionPool):
+    """ResizableMySQLConnectionPool класс пула соединений MySQL с изменяемым размером.
+
+    *Соединения при увеличении пула устанавливаются вне блокировки пула,
+    поэтому не задерживают получение соединений другими потоками.
+    При уменьшении закрываются только свободные соединения.
+
+    Args:
+        MySQLConnectionPool: Пул соединений mysql-connector.
+    """
+
+    # -------------------------------------------------------------------------
+    def resize(self, pool_size: int) -> int:
+        """resize изменяет количество соединений пула.
+
+        *Метод синхронный и устанавливает соединения, поэтому
+        из асинхронного кода его следует вызывать в отдельном потоке.
+        Если свободных соединений меньше, чем требуется закрыть,
+        пул уменьшается настолько, насколько возможно.
+
+        Args:
+            pool_size (int): Требуемый размер пула.
+
+        Raises:
+            ValueError: Возбуждается если размер вне границ от 1 до CNX_POOL_MAXSIZE.
+
+        Returns:
+            int: Установленный размер пула.
+        """
+        if pool_size < 1 or pool_size > CNX_POOL_MAXSIZE:
+            raise ValueError(
+                f"Размер пула должен быть в границах от 1 до {CNX_POOL_MAXSIZE}!"
+            )
+
+        if pool_size > self.pool_size:
+            self.__grow(amount=pool_size - self.pool_size)
+        else:
+            self.__shrink(amount=self.pool_size - pool_size)
+
+        return self.pool_size
+
+    # -------------------------------------------------------------------------
+    def __grow(self, amount: int) -> None:
+        connections: List = []
+
+        try:
+            for _ in range(amount):
+                connection = connect(**self._cnx_config)
+                connection.pool_config_version = self._config_version
+                connections.append(connection)
+
+        finally:
+            # Соединения, установленные до ошибки, всё равно добавляются в пул.
+            with CONNECTION_POOL_LOCK:
+                self._cnx_queue.maxsize += len(connections)
+                self._pool_size += len(connections)  # type: ignore
+
+                for connection in connections:
+                    self._queue_connection(connection)
+
+    # -------------------------------------------------------------------------
+    def __shrink(self, amount: int) -> None:
+        connections: List = []
+
+        with CONNECTION_POOL_LOCK:
+            while len(connections) < amount:
+                try:
+                    connections.append(self._cnx_queue.get(block=False))
+                except queue.Empty:
+                    break
+
+            self._cnx_queue.maxsize -= len(connections)
+            self._pool_size -= len(connections)  # type: ignore
+
+        for connection in connections:
+            try:
+                connection.disconnect()
+            except MySQLError:
+                pass
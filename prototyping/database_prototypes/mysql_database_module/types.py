@@ -9,9 +9,10 @@ __all__: list[str] = [
     "AsyncMySQLConnectionType",
     "AsyncMySQLConnectMethodType",
     "MySQLPooledConnection",
+    "TransactionObserverType",
 ]
 
-from typing import Callable, Union, Coroutine, Any
+from typing import Callable, Optional, Union, Coroutine, Any
 
 from mysql.connector.pooling import PooledMySQLConnection
 from mysql.connector.connection_cext import CMySQLConnection
@@ -29,3 +30,7 @@ AsyncMySQLConnectMethodType = Callable[
 
 # Аннотация для типа соединения из пула к MySQL.
 MySQLPooledConnection = Union[PooledMySQLConnection, CMySQLConnection]
+
+# Аннотация для функции, получающей замеры каждой транзакции над пулом:
+# (ожидание соединения в секундах, выполнение в секундах, исключение либо None).
+TransactionObserverType = Callable[[float, float, Optional[BaseException]], Any]
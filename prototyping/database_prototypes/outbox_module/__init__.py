@@ -0,0 +1,4 @@
+__all__: list[str] = ["Outbox", "OutboxJob"]
+
+from .outbox import Outbox
+from .types import OutboxJob
@@ -0,0 +1,599 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `outbox` реализует фоновую очередь задач (outbox), хранящуюся в таблице БД,
+чтобы обработчики обновлений не выполняли побочные действия (уведомления, письма,
+записи аудита) во время обработки, а только добавляли задачу и завершались.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["Outbox"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import json
+import random
+import asyncio
+
+from functools import partial
+from string import Template
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+
+from .types import OutboxHandlerType, OutboxJob
+
+
+# Таблица не входит в схему MainDataBaseModel, так как хранит служебные данные бота.
+# Выполненные задачи удаляются, поэтому в таблице остаются только
+# ожидающие, выполняющиеся и исчерпавшие попытки ('dead') задачи.
+_CREATE_TABLE_QUERY: str = (
+    "CREATE TABLE IF NOT EXISTS `OutboxJob` ("
+    "`id` BIGINT UNSIGNED NOT NULL AUTO_INCREMENT, "
+    "`kind` VARCHAR(64) NOT NULL, "
+    "`payload` JSON NOT NULL, "
+    "`status` ENUM('queued', 'processing', 'dead') NOT NULL DEFAULT 'queued', "
+    "`attempts` INT UNSIGNED NOT NULL DEFAULT 0, "
+    "`available_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6), "
+    "`last_error` TEXT NULL, "
+    "`created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6), "
+    "PRIMARY KEY (`id`), "
+    "INDEX `status_available_at_idx` (`status`, `available_at`))"
+)
+
+_INSERT_QUERY: str = "INSERT INTO `OutboxJob` (`kind`, `payload`) VALUES (%s, %s)"
+
+# Ожидающие задачи, а также выполняющиеся задачи с истёкшим сроком видимости
+# (обработчик завершился, не сообщив результат), без ожидания заблокированных строк.
+_CLAIM_TEMPLATE = Template(
+    "SELECT `id`, `kind`, `payload`, `attempts` FROM `OutboxJob` "
+    "WHERE `status` IN ('queued', 'processing') AND `available_at` <= NOW(6) "
+    "AND `kind` IN ($kinds) "
+    "ORDER BY `available_at` LIMIT %s "
+    "FOR UPDATE SKIP LOCKED"
+)
+
+_MARK_PROCESSING_TEMPLATE = Template(
+    "UPDATE `OutboxJob` SET `status` = 'processing', `attempts` = `attempts` + 1, "
+    "`available_at` = NOW(6) + INTERVAL %s SECOND "
+    "WHERE `id` IN ($placeholders)"
+)
+
+_DELETE_QUERY: str = "DELETE FROM `OutboxJob` WHERE `id` = %s"
+
+# Результат записывается, только если задача не была забрана повторно
+# после истечения срока видимости (номер попытки совпадает).
+_RETRY_QUERY: str = (
+    "UPDATE `OutboxJob` SET `status` = 'queued', "
+    "`available_at` = NOW(6) + INTERVAL %s SECOND, `last_error` = %s "
+    "WHERE `id` = %s AND `attempts` = %s"
+)
+
+_DEAD_QUERY: str = (
+    "UPDATE `OutboxJob` SET `status` = 'dead', `last_error` = %s "
+    "WHERE `id` = %s AND `attempts` = %s"
+)
+
+_REQUEUE_DEAD_QUERY: str = (
+    "UPDATE `OutboxJob` SET `status` = 'queued', `attempts` = 0, "
+    "`available_at` = NOW(6) WHERE `status` = 'dead'"
+)
+
+# Максимальная длина сохраняемого текста ошибки.
+_MAX_ERROR_LENGTH: int = 2000
+
+
+# _____________________________________________________________________________
+class Outbox:
+    """Outbox класс фоновой очереди задач.
+
+    Добавление задачи (enqueue) помещает её в буфер памяти и ожидает записи
+    буфера в БД, которую фоновая задача выполняет одной транзакцией для всех
+    добавленных за интервал задач (групповая фиксация). enqueue_nowait
+    не ожидает записи: такая задача теряется при аварийном завершении процесса.
+
+    Обработчики забирают задачи пакетами, переводя их в статус 'processing'
+    на срок видимости. Если результат не записан до истечения срока,
+    задача снова становится доступной (доставка "хотя бы один раз").
+    Задачи типа с ограничением выполнения забираются только на свободные места,
+    поэтому срок видимости не расходуется на ожидание очереди внутри процесса.
+
+    Неудачная попытка повторяется с экспоненциальной задержкой,
+    после max_attempts попыток задача переводится в статус 'dead'.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+        __handlers (Dict[str, OutboxHandlerType]): Обработчики по типу задачи.
+        __kind_limits (Dict[str, int]): Ограничения выполнения по типу задачи.
+        __kind_running (Dict[str, int]): Количество выполняющихся задач по типу.
+        __max_concurrency (int): Максимальное количество выполняющихся задач.
+        __batch_size (int): Максимальное количество задач в пакете.
+        __visibility_timeout (float): Срок видимости забранной задачи в секундах.
+        __max_attempts (int): Количество попыток до перевода задачи в 'dead'.
+        __base_backoff (float): Задержка перед второй попыткой в секундах.
+        __max_backoff (float): Максимальная задержка между попытками в секундах.
+        __poll_interval (float): Интервал опроса при отсутствии задач в секундах.
+        __flush_interval (float): Интервал записи буферов в секундах.
+        __pending_inserts (List[Tuple[str, str]]): Добавленные, но не записанные задачи.
+        __insert_waiters (List[asyncio.Future]): Ожидающие записи вызовы enqueue.
+        __pending_deletes (List[Tuple[int]]): Выполненные задачи.
+        __pending_retries (List[Tuple[float, str, int, int]]): Задачи для повтора.
+        __pending_dead (List[Tuple[str, int, int]]): Задачи, исчерпавшие попытки.
+        __running (Set[asyncio.Task]): Выполняющиеся задачи.
+        __buffer_full (asyncio.Event): Событие заполнения буфера добавленных задач.
+        __stopping (asyncio.Event): Событие остановки фоновой записи буферов.
+        __slot_freed (asyncio.Event): Событие завершения выполняющейся задачи.
+        __background_tasks (List[asyncio.Task]): Задачи записи буферов и выборки задач.
+    """
+
+    __api: AsyncMySQLAPI
+    __handlers: Dict[str, OutboxHandlerType]
+    __kind_limits: Dict[str, int]
+    __kind_running: Dict[str, int]
+    __max_concurrency: int
+    __batch_size: int
+    __visibility_timeout: float
+    __max_attempts: int
+    __base_backoff: float
+    __max_backoff: float
+    __poll_interval: float
+    __flush_interval: float
+    __pending_inserts: List[Tuple[str, str]]
+    __insert_waiters: List[asyncio.Future]
+    __pending_deletes: List[Tuple[int]]
+    __pending_retries: List[Tuple[float, str, int, int]]
+    __pending_dead: List[Tuple[str, int, int]]
+    __running: Set[asyncio.Task]
+    __buffer_full: asyncio.Event
+    __stopping: asyncio.Event
+    __slot_freed: asyncio.Event
+    __background_tasks: List[asyncio.Task]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        api: AsyncMySQLAPI,
+        max_concurrency: int = 16,
+        batch_size: int = 50,
+        visibility_timeout: float = 60.0,
+        max_attempts: int = 5,
+        base_backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        poll_interval: float = 1.0,
+        flush_interval: float = 0.05,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+            max_concurrency (int, optional): Максимальное количество выполняющихся задач.
+                                             По умолчанию 16.
+            batch_size (int, optional): Максимальное количество задач в пакете
+                                        (выборка и запись буфера). По умолчанию 50.
+            visibility_timeout (float, optional): Срок видимости забранной задачи;
+                                                  он же ограничивает время выполнения.
+                                                  По умолчанию 60.0.
+            max_attempts (int, optional): Количество попыток. По умолчанию 5.
+            base_backoff (float, optional): Задержка перед второй попыткой. По умолчанию 1.0.
+            max_backoff (float, optional): Максимальная задержка. По умолчанию 300.0.
+            poll_interval (float, optional): Интервал опроса при отсутствии задач.
+                                             По умолчанию 1.0.
+            flush_interval (float, optional): Интервал записи буферов. По умолчанию 0.05.
+
+        Raises:
+            ValueError: Возбуждается если ограничения меньше 1.
+        """
+        if min(max_concurrency, batch_size, max_attempts) < 1:
+            raise ValueError("Ограничения очереди задач должны быть больше нуля!")
+
+        self.__api = api
+        self.__handlers = {}
+        self.__kind_limits = {}
+        self.__kind_running = {}
+        self.__max_concurrency = max_concurrency
+        self.__batch_size = batch_size
+        self.__visibility_timeout = visibility_timeout
+        self.__max_attempts = max_attempts
+        self.__base_backoff = base_backoff
+        self.__max_backoff = max_backoff
+        self.__poll_interval = poll_interval
+        self.__flush_interval = flush_interval
+        self.__pending_inserts = []
+        self.__insert_waiters = []
+        self.__pending_deletes = []
+        self.__pending_retries = []
+        self.__pending_dead = []
+        self.__running = set()
+        self.__buffer_full = asyncio.Event()
+        self.__stopping = asyncio.Event()
+        self.__slot_freed = asyncio.Event()
+        self.__background_tasks = []
+
+    # -------------------------------------------------------------------------
+    @property
+    def running_amount(self) -> int:
+        return len(self.__running)
+
+    # -------------------------------------------------------------------------
+    def register(
+        self, kind: str, handler: OutboxHandlerType, concurrency: Optional[int] = None
+    ) -> None:
+        """register добавляет обработчик задач указанного типа.
+
+        *Задачи забираются только для типов, имеющих обработчик,
+        поэтому разные процессы могут обрабатывать разные типы задач.
+
+        Args:
+            kind (str): Тип задачи.
+            handler (OutboxHandlerType): Функция, выполняющая задачу.
+            concurrency (Optional[int], optional): Максимальное количество одновременно
+                                                   выполняющихся задач этого типа.
+        """
+        self.__handlers[kind] = handler
+
+        if concurrency is not None:
+            self.__kind_limits[kind] = concurrency
+
+    # -------------------------------------------------------------------------
+    async def create_table(self) -> None:
+        """create_table создаёт таблицу `OutboxJob`, если она не существует."""
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                cursor.execute(_CREATE_TABLE_QUERY)
+
+        await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def enqueue(self, kind: str, payload: Mapping[str, Any]) -> None:
+        """enqueue добавляет задачу, ожидая записи буфера в БД.
+
+        *Задачи, добавленные за интервал записи, записываются одной транзакцией,
+        поэтому ожидание не превышает flush_interval и времени транзакции.
+        Запись выполняет фоновая задача, запускаемая методом start.
+
+        Args:
+            kind (str): Тип задачи.
+            payload (Mapping[str, Any]): Данные задачи, сериализуемые в JSON.
+
+        Raises:
+            Exception: Возбуждается если буфер не удалось записать при остановке.
+        """
+        waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        self.enqueue_nowait(kind=kind, payload=payload)
+        self.__insert_waiters.append(waiter)
+
+        await waiter
+
+    # -------------------------------------------------------------------------
+    def enqueue_nowait(self, kind: str, payload: Mapping[str, Any]) -> None:
+        """enqueue_nowait добавляет задачу в буфер, не ожидая записи в БД.
+
+        *Задача будет потеряна, если процесс завершится до записи буфера.
+
+        Args:
+            kind (str): Тип задачи.
+            payload (Mapping[str, Any]): Данные задачи, сериализуемые в JSON.
+        """
+        self.__pending_inserts.append((kind, json.dumps(payload)))
+
+        if len(self.__pending_inserts) >= self.__batch_size:
+            self.__buffer_full.set()
+
+    # -------------------------------------------------------------------------
+    async def enqueue_durable(self, kind: str, payload: Mapping[str, Any]) -> int:
+        """enqueue_durable добавляет задачу, ожидая её записи в БД.
+
+        Args:
+            kind (str): Тип задачи.
+            payload (Mapping[str, Any]): Данные задачи, сериализуемые в JSON.
+
+        Returns:
+            int: Идентификатор задачи.
+        """
+        serialized_payload: str = json.dumps(payload)
+
+        def transaction(connection: MySQLPooledConnection) -> int:
+            with connection.cursor() as cursor:
+                cursor.execute(_INSERT_QUERY, (kind, serialized_payload))
+
+                return cursor.lastrowid
+
+        return await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def flush(self) -> None:
+        """flush записывает буферы добавленных задач и результатов одной транзакцией."""
+        inserts, self.__pending_inserts = self.__pending_inserts, []
+        waiters, self.__insert_waiters = self.__insert_waiters, []
+        deletes, self.__pending_deletes = self.__pending_deletes, []
+        retries, self.__pending_retries = self.__pending_retries, []
+        dead, self.__pending_dead = self.__pending_dead, []
+
+        self.__buffer_full.clear()
+
+        if not (inserts or deletes or retries or dead):
+            return
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                if inserts:
+                    cursor.executemany(_INSERT_QUERY, inserts)
+
+                if deletes:
+                    cursor.executemany(_DELETE_QUERY, deletes)
+
+                if retries:
+                    cursor.executemany(_RETRY_QUERY, retries)
+
+                if dead:
+                    cursor.executemany(_DEAD_QUERY, dead)
+
+        try:
+            await self.__api.execute_transaction_use_pool(transaction)
+
+        except Exception:
+            # Незаписанные изменения возвращаются в начало буферов.
+            self.__pending_inserts[:0] = inserts
+            self.__insert_waiters[:0] = waiters
+            self.__pending_deletes[:0] = deletes
+            self.__pending_retries[:0] = retries
+            self.__pending_dead[:0] = dead
+
+            raise
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    # -------------------------------------------------------------------------
+    async def claim_batch(self, limit: int) -> List[OutboxJob]:
+        """claim_batch забирает пакет доступных задач.
+
+        Задачи типа с ограничением выполнения забираются отдельным запросом
+        не более чем на свободные места этого типа.
+
+        Args:
+            limit (int): Максимальное количество задач.
+
+        Returns:
+            List[OutboxJob]: Забранные задачи, переведённые в статус 'processing'.
+        """
+        unlimited_kinds: List[str] = [
+            kind for kind in self.__handlers if kind not in self.__kind_limits
+        ]
+        limited_kinds: List[Tuple[str, int]] = [
+            (kind, capacity - self.__kind_running.get(kind, 0))
+            for kind, capacity in self.__kind_limits.items()
+            if kind in self.__handlers
+        ]
+        claims: List[Tuple[List[str], int]] = [
+            ([kind], free) for kind, free in limited_kinds if free > 0
+        ]
+
+        if unlimited_kinds:
+            claims.append((unlimited_kinds, limit))
+
+        if not claims or limit < 1:
+            return []
+
+        visibility_timeout: float = self.__visibility_timeout
+
+        def transaction(connection: MySQLPooledConnection) -> List[OutboxJob]:
+            rows: List[Tuple[Any, ...]] = []
+
+            with connection.cursor() as cursor:
+                for kinds, kinds_limit in claims:
+                    remaining: int = min(kinds_limit, limit - len(rows))
+
+                    if remaining < 1:
+                        break
+
+                    cursor.execute(
+                        _CLAIM_TEMPLATE.substitute(
+                            kinds=", ".join(["%s"] * len(kinds))
+                        ),
+                        (*kinds, remaining),
+                    )
+                    rows.extend(cursor.fetchall())
+
+                if not rows:
+                    return []
+
+                cursor.execute(
+                    _MARK_PROCESSING_TEMPLATE.substitute(
+                        placeholders=", ".join(["%s"] * len(rows))
+                    ),
+                    (visibility_timeout, *(row[0] for row in rows)),
+                )
+
+            return [
+                OutboxJob(
+                    job_id=job_id,
+                    kind=kind,
+                    payload=json.loads(payload),
+                    attempts=attempts + 1,
+                )
+                for job_id, kind, payload, attempts in rows
+            ]
+
+        return await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def requeue_dead(self) -> int:
+        """requeue_dead возвращает задачи, исчерпавшие попытки, в очередь.
+
+        Returns:
+            int: Количество возвращённых задач.
+        """
+
+        def transaction(connection: MySQLPooledConnection) -> int:
+            with connection.cursor() as cursor:
+                cursor.execute(_REQUEUE_DEAD_QUERY)
+
+                return cursor.rowcount
+
+        return await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    def get_backoff(self, attempts: int) -> float:
+        """get_backoff возвращает задержку перед следующей попыткой.
+
+        *Задержка случайно уменьшается до половины, чтобы задачи,
+        завершившиеся ошибкой одновременно, не повторялись одновременно.
+
+        Args:
+            attempts (int): Количество выполненных попыток.
+
+        Returns:
+            float: Задержка в секундах.
+        """
+        backoff: float = min(
+            self.__max_backoff, self.__base_backoff * 2 ** (attempts - 1)
+        )
+
+        return backoff * random.uniform(0.5, 1.0)
+
+    # -------------------------------------------------------------------------
+    def start(self) -> None:
+        """start запускает фоновые задачи записи буферов и выполнения задач."""
+        loop = asyncio.get_running_loop()
+
+        self.__stopping.clear()
+        self.__background_tasks = [
+            loop.create_task(self.__run_flush()),
+            loop.create_task(self.__run_workers()),
+        ]
+
+    # -------------------------------------------------------------------------
+    async def stop(self, drain_timeout: float = 30.0) -> None:
+        """stop прекращает забирать задачи, ожидает выполняющиеся и записывает буферы.
+
+        *Задачи, не завершившиеся за drain_timeout, будут повторены
+        после истечения срока видимости. Выполняющаяся запись буферов
+        не отменяется, а завершается; вызовы enqueue, чьи задачи не удалось
+        записать, завершаются исключением.
+
+        Args:
+            drain_timeout (float, optional): Время ожидания выполняющихся задач.
+                                             По умолчанию 30.0.
+        """
+        background_tasks, self.__background_tasks = self.__background_tasks, []
+
+        if background_tasks:
+            flush_task, workers_task = background_tasks
+
+            workers_task.cancel()
+
+            try:
+                await workers_task
+            except asyncio.CancelledError:
+                pass
+
+            # Запись буферов не отменяется: транзакция в потоке может быть
+            # зафиксирована уже после отмены, а ожидающие enqueue - потеряны.
+            self.__stopping.set()
+            self.__buffer_full.set()
+
+            await flush_task
+
+        if self.__running:
+            await asyncio.wait(list(self.__running), timeout=drain_timeout)
+
+        try:
+            await self.flush()
+
+        except BaseException as error:
+            # Вызовы enqueue больше не дождутся записи буфера.
+            waiters, self.__insert_waiters = self.__insert_waiters, []
+
+            for waiter in waiters:
+                if waiter.done():
+                    continue
+
+                if isinstance(error, asyncio.CancelledError):
+                    waiter.cancel()
+                else:
+                    waiter.set_exception(error)
+
+            raise
+
+    # -------------------------------------------------------------------------
+    async def __run_flush(self) -> None:
+        """__run_flush записывает буферы по интервалу, либо при заполнении."""
+        while not self.__stopping.is_set():
+            try:
+                await asyncio.wait_for(
+                    self.__buffer_full.wait(), timeout=self.__flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                await self.flush()
+            except Exception as error:
+                print(f"Возникла ошибка при записи очереди задач! {error}")
+                await asyncio.sleep(self.__poll_interval)
+
+    # -------------------------------------------------------------------------
+    async def __run_workers(self) -> None:
+        """__run_workers забирает задачи пакетами, пока есть свободные места."""
+        while True:
+            free: int = self.__max_concurrency - len(self.__running)
+
+            if free < 1:
+                self.__slot_freed.clear()
+                await self.__slot_freed.wait()
+                continue
+
+            try:
+                jobs: List[OutboxJob] = await self.claim_batch(
+                    limit=min(free, self.__batch_size)
+                )
+            except Exception as error:
+                print(f"Возникла ошибка при выборке очереди задач! {error}")
+                jobs = []
+
+            if not jobs:
+                await asyncio.sleep(self.__poll_interval)
+                continue
+
+            for job in jobs:
+                self.__kind_running[job.kind] = self.__kind_running.get(job.kind, 0) + 1
+
+                task: asyncio.Task = asyncio.create_task(self.__execute(job=job))
+                self.__running.add(task)
+                task.add_done_callback(partial(self.__on_job_done, job.kind))
+
+    # -------------------------------------------------------------------------
+    async def __execute(self, job: OutboxJob) -> None:
+        """__execute выполняет задачу и добавляет её результат в буфер."""
+        try:
+            await asyncio.wait_for(
+                self.__handlers[job.kind](job), timeout=self.__visibility_timeout
+            )
+
+        except Exception as error:
+            message: str = f"{type(error).__name__}: {error}"[:_MAX_ERROR_LENGTH]
+
+            if job.attempts >= self.__max_attempts:
+                self.__pending_dead.append((message, job.job_id, job.attempts))
+            else:
+                self.__pending_retries.append(
+                    (self.get_backoff(job.attempts), message, job.job_id, job.attempts)
+                )
+
+            return
+
+        self.__pending_deletes.append((job.job_id,))
+
+    # -------------------------------------------------------------------------
+    def __on_job_done(self, kind: str, task: asyncio.Task) -> None:
+        self.__running.discard(task)
+        self.__kind_running[kind] -= 1
+        self.__slot_freed.set()
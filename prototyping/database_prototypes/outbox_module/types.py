@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль предназначен для хранения типов,
+описывающих задачи фоновой очереди (outbox).
+"""
+
+__all__: list[str] = ["OutboxJob", "OutboxHandlerType"]
+
+from dataclasses import dataclass
+
+from typing import Any, Awaitable, Callable, Dict
+
+
+# _____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class OutboxJob:
+    """OutboxJob класс для представления задачи фоновой очереди.
+
+    Attributes:
+        job_id (int): Идентификатор задачи в таблице `OutboxJob`.
+        kind (str): Тип задачи, по которому выбирается обработчик.
+        payload (Dict[str, Any]): Данные задачи.
+        attempts (int): Номер текущей попытки выполнения, начиная с 1.
+    """
+
+    job_id: int
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int
+
+
+# Аннотация для функции, выполняющей задачу.
+# *Исключение считается неудачной попыткой; задача будет повторена.
+OutboxHandlerType = Callable[[OutboxJob], Awaitable[Any]]
@@ -0,0 +1,4 @@
+__all__: list[str] = ["OrderChange", "SalesRollups", "SalesSummary"]
+
+from .sales_rollups import SalesRollups
+from .types import OrderChange, SalesSummary
@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `sales_rollups` реализует агрегаты продаж по продавцу, товару и дню,
+изменяемые вместе с заказами, чтобы панели продавцов и администраторов
+читали готовые значения, а не группировали все заказы таблицы `Order`.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["SalesRollups"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+
+from datetime import date
+from decimal import Decimal
+from string import Template
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+
+from .types import OrderChange, SalesSummary
+
+
+# Аннотация для значений агрегата: (заказы, выручка, возвраты, сумма возвратов).
+_MeasuresType = List[Any]
+
+_MEASURES: Tuple[str, ...] = (
+    "orders_amount",
+    "revenue",
+    "refunds_amount",
+    "refunded_revenue",
+)
+
+_MEASURE_COLUMNS: str = (
+    "`orders_amount` INT NOT NULL DEFAULT 0, "
+    "`revenue` DECIMAL(14, 2) NOT NULL DEFAULT 0, "
+    "`refunds_amount` INT NOT NULL DEFAULT 0, "
+    "`refunded_revenue` DECIMAL(14, 2) NOT NULL DEFAULT 0, "
+)
+
+# Таблицы не входят в схему MainDataBaseModel и хранят производные данные:
+# их можно удалить и построить заново функцией backfill.
+_CREATE_TABLE_QUERIES: Tuple[str, ...] = (
+    "CREATE TABLE IF NOT EXISTS `SalesRollup` ("
+    "`seller_id` INT NOT NULL, "
+    "`day` DATE NOT NULL, "
+    "`product_id` INT NOT NULL, "
+    + _MEASURE_COLUMNS
+    + "PRIMARY KEY (`seller_id`, `day`, `product_id`), "
+    "INDEX `product_id_day_idx` (`product_id`, `day`))",
+    "CREATE TABLE IF NOT EXISTS `SalesDailyRollup` ("
+    "`day` DATE NOT NULL, " + _MEASURE_COLUMNS + "PRIMARY KEY (`day`))",
+    # Единственная строка хранит прогресс заполнения агрегатов историей заказов.
+    "CREATE TABLE IF NOT EXISTS `SalesRollupState` ("
+    "`id` TINYINT UNSIGNED NOT NULL, "
+    "`backfill_order_id` BIGINT NOT NULL DEFAULT 0, "
+    "`is_complete` TINYINT NOT NULL DEFAULT 0, "
+    "PRIMARY KEY (`id`))",
+    "INSERT IGNORE INTO `SalesRollupState` (`id`) VALUES (1)",
+)
+
+_UPSERT_TEMPLATE = Template(
+    "INSERT INTO `$table` ($keys, "
+    + ", ".join(f"`{measure}`" for measure in _MEASURES)
+    + ") VALUES ($placeholders) AS `new` ON DUPLICATE KEY UPDATE "
+    + ", ".join(
+        f"`{measure}` = `$table`.`{measure}` + `new`.`{measure}`"
+        for measure in _MEASURES
+    )
+)
+
+_UPSERT_ROLLUP_QUERY: str = _UPSERT_TEMPLATE.substitute(
+    table="SalesRollup",
+    keys="`seller_id`, `day`, `product_id`",
+    placeholders=", ".join(["%s"] * (3 + len(_MEASURES))),
+)
+
+_UPSERT_DAILY_ROLLUP_QUERY: str = _UPSERT_TEMPLATE.substitute(
+    table="SalesDailyRollup",
+    keys="`day`",
+    placeholders=", ".join(["%s"] * (1 + len(_MEASURES))),
+)
+
+_SELECT_STATE_TEMPLATE = Template(
+    "SELECT `backfill_order_id`, `is_complete` FROM `SalesRollupState` "
+    "WHERE `id` = 1 $lock"
+)
+
+_SELECT_ORDERS_CHUNK_QUERY: str = (
+    "SELECT `Order`.`id`, `Product`.`owner_id`, `Order`.`product_id`, "
+    "`Order`.`created_at`, `Order`.`total_price`, `Order`.`status` "
+    "FROM `Order` JOIN `Product` ON `Product`.`id` = `Order`.`product_id` "
+    "WHERE `Order`.`id` > %s ORDER BY `Order`.`id` LIMIT %s"
+)
+
+_UPDATE_STATE_QUERY: str = (
+    "UPDATE `SalesRollupState` SET `backfill_order_id` = %s, `is_complete` = %s "
+    "WHERE `id` = 1"
+)
+
+_SELECT_SUMMARY_TEMPLATE = Template(
+    "SELECT `day`, "
+    + ", ".join(f"SUM(`{measure}`)" for measure in _MEASURES)
+    + " FROM `$table` WHERE $condition AND `day` BETWEEN %s AND %s "
+    "GROUP BY `day` ORDER BY `day`"
+)
+
+
+# ----------------------------------------------------------------------------
+def _get_measures(status: Optional[str], total_price: Decimal) -> _MeasuresType:
+    """_get_measures возвращает вклад заказа с указанным статусом в агрегаты."""
+    if status == "completed":
+        return [1, total_price, 0, Decimal(0)]
+
+    if status == "refunded":
+        return [0, Decimal(0), 1, total_price]
+
+    return [0, Decimal(0), 0, Decimal(0)]
+
+
+# ----------------------------------------------------------------------------
+def _write_measures(
+    connection: MySQLPooledConnection,
+    rollup: Dict[Tuple[int, date, int], _MeasuresType],
+) -> None:
+    """_write_measures прибавляет значения к агрегатам по товарам и по дням.
+
+    *Строки упорядочены по ключу, поэтому одновременные транзакции
+    блокируют строки агрегатов в одном порядке.
+    """
+    daily_rollup: Dict[date, _MeasuresType] = {}
+
+    for (_, day, _), measures in rollup.items():
+        daily_measures: _MeasuresType = daily_rollup.setdefault(
+            day, [0, Decimal(0), 0, Decimal(0)]
+        )
+
+        for index, value in enumerate(measures):
+            daily_measures[index] += value
+
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            _UPSERT_ROLLUP_QUERY,
+            [(*key, *measures) for key, measures in sorted(rollup.items())],
+        )
+        cursor.executemany(
+            _UPSERT_DAILY_ROLLUP_QUERY,
+            [(day, *measures) for day, measures in sorted(daily_rollup.items())],
+        )
+
+
+# _____________________________________________________________________________
+class SalesRollups:
+    """SalesRollups класс агрегатов продаж по продавцу, товару и дню.
+
+    Выполненные заказы учитываются в количестве заказов и выручке,
+    возвращённые - в количестве и сумме возвратов, по дню создания заказа.
+    Агрегаты хранятся по (продавец, день, товар) и отдельно по дням для
+    администраторов, поэтому время чтения панели зависит от количества
+    дней и товаров, но не от количества заказов.
+
+    Изменения заказов учитываются методом apply_order_change в той же транзакции,
+    что и запись заказа. История заказов, созданных до появления агрегатов,
+    учитывается фоновым заполнением (backfill) пакетами по идентификатору заказа.
+    Пока заполнение не завершено, изменения заказов, ещё не пройденных им,
+    пропускаются: заполнение учтёт их с уже изменённым статусом.
+
+    *Заполнение блокирует строку `SalesRollupState` на запись, а изменения заказов -
+    на чтение, поэтому пакет заполнения не выполняется одновременно с изменением
+    заказа. После завершения заполнения блокировка не используется.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+        __is_backfill_complete (bool): Известно ли, что заполнение завершено.
+    """
+
+    __api: AsyncMySQLAPI
+    __is_backfill_complete: bool
+
+    # -------------------------------------------------------------------------
+    def __init__(self, api: AsyncMySQLAPI) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+        """
+        self.__api = api
+        self.__is_backfill_complete = False
+
+    # -------------------------------------------------------------------------
+    @property
+    def is_backfill_complete(self) -> bool:
+        return self.__is_backfill_complete
+
+    # -------------------------------------------------------------------------
+    async def create_tables(self) -> None:
+        """create_tables создаёт таблицы агрегатов, если они не существуют."""
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                for query in _CREATE_TABLE_QUERIES:
+                    cursor.execute(query)
+
+        await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    def apply_order_change(
+        self, connection: MySQLPooledConnection, change: OrderChange
+    ) -> None:
+        """apply_order_change учитывает изменение заказа в агрегатах.
+
+        Метод синхронный и вызывается из функции-транзакции, изменяющей заказ,
+        поэтому агрегаты изменяются только вместе с заказом.
+
+        *Метод следует вызвать до изменения строки `Order` в транзакции:
+        блокировка состояния заполнения должна быть получена первой,
+        иначе транзакция и пакет заполнения могут ожидать друг друга.
+
+        Args:
+            connection (MySQLPooledConnection): Соединение транзакции, изменяющей заказ.
+            change (OrderChange): Изменение заказа.
+        """
+        if not self.__is_backfill_complete:
+            with connection.cursor() as cursor:
+                cursor.execute(_SELECT_STATE_TEMPLATE.substitute(lock="FOR SHARE"))
+                backfill_order_id, is_complete = cursor.fetchone()
+
+            if is_complete:
+                self.__is_backfill_complete = True
+
+            # Заказ ещё не пройден заполнением и будет учтён им.
+            elif change.order_id is None or change.order_id > backfill_order_id:
+                return
+
+        previous: _MeasuresType = _get_measures(
+            status=change.previous_status, total_price=change.total_price
+        )
+        current: _MeasuresType = _get_measures(
+            status=change.status, total_price=change.total_price
+        )
+
+        if previous == current:
+            return
+
+        _write_measures(
+            connection=connection,
+            rollup={
+                (change.seller_id, change.created_at.date(), change.product_id): [
+                    new - old for new, old in zip(current, previous)
+                ]
+            },
+        )
+
+    # -------------------------------------------------------------------------
+    async def backfill_chunk(self, chunk_size: int = 1000) -> bool:
+        """backfill_chunk учитывает в агрегатах следующий пакет заказов из истории.
+
+        *Пакет и продвижение состояния заполнения записываются одной транзакцией,
+        поэтому прерванное заполнение продолжается без повторного учёта заказов.
+
+        Args:
+            chunk_size (int, optional): Количество заказов в пакете. По умолчанию 1000.
+
+        Returns:
+            bool: True, если заполнение завершено.
+        """
+
+        def transaction(connection: MySQLPooledConnection) -> bool:
+            with connection.cursor() as cursor:
+                cursor.execute(_SELECT_STATE_TEMPLATE.substitute(lock="FOR UPDATE"))
+                backfill_order_id, is_complete = cursor.fetchone()
+
+                if is_complete:
+                    return True
+
+                cursor.execute(
+                    _SELECT_ORDERS_CHUNK_QUERY, (backfill_order_id, chunk_size)
+                )
+                rows: List[Tuple[Any, ...]] = cursor.fetchall()
+
+            rollup: Dict[Tuple[int, date, int], _MeasuresType] = {}
+
+            for _, seller_id, product_id, created_at, total_price, status in rows:
+                measures: _MeasuresType = rollup.setdefault(
+                    (seller_id, created_at.date(), product_id),
+                    [0, Decimal(0), 0, Decimal(0)],
+                )
+
+                for index, value in enumerate(
+                    _get_measures(status=status, total_price=total_price)
+                ):
+                    measures[index] += value
+
+            if rollup:
+                _write_measures(connection=connection, rollup=rollup)
+
+            is_complete = len(rows) < chunk_size
+
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    _UPDATE_STATE_QUERY,
+                    (rows[-1][0] if rows else backfill_order_id, int(is_complete)),
+                )
+
+            return is_complete
+
+        is_complete: bool = await self.__api.execute_transaction_use_pool(transaction)
+
+        if is_complete:
+            self.__is_backfill_complete = True
+
+        return is_complete
+
+    # -------------------------------------------------------------------------
+    async def backfill(self, chunk_size: int = 1000, pause: float = 0.05) -> None:
+        """backfill заполняет агрегаты историей заказов пакетами до завершения.
+
+        Args:
+            chunk_size (int, optional): Количество заказов в пакете. По умолчанию 1000.
+            pause (float, optional): Пауза между пакетами, ограничивающая нагрузку
+                                     на БД, в секундах. По умолчанию 0.05.
+        """
+        while not await self.backfill_chunk(chunk_size=chunk_size):
+            await asyncio.sleep(pause)
+
+    # -------------------------------------------------------------------------
+    async def get_seller_sales(
+        self, seller_id: int, first_day: date, last_day: date
+    ) -> List[SalesSummary]:
+        """get_seller_sales возвращает продажи всех товаров продавца по дням.
+
+        Args:
+            seller_id (int): Идентификатор продавца.
+            first_day (date): Первый день периода.
+            last_day (date): Последний день периода.
+
+        Returns:
+            List[SalesSummary]: Продажи по дням, в которые они были.
+        """
+        return await self.__select_summaries(
+            table="SalesRollup",
+            condition="`seller_id` = %s",
+            parameters=(seller_id, first_day, last_day),
+        )
+
+    # -------------------------------------------------------------------------
+    async def get_product_sales(
+        self, product_id: int, first_day: date, last_day: date
+    ) -> List[SalesSummary]:
+        """get_product_sales возвращает продажи товара по дням.
+
+        Args:
+            product_id (int): Идентификатор товара.
+            first_day (date): Первый день периода.
+            last_day (date): Последний день периода.
+
+        Returns:
+            List[SalesSummary]: Продажи по дням, в которые они были.
+        """
+        return await self.__select_summaries(
+            table="SalesRollup",
+            condition="`product_id` = %s",
+            parameters=(product_id, first_day, last_day),
+        )
+
+    # -------------------------------------------------------------------------
+    async def get_total_sales(
+        self, first_day: date, last_day: date
+    ) -> List[SalesSummary]:
+        """get_total_sales возвращает продажи всех продавцов по дням.
+
+        Args:
+            first_day (date): Первый день периода.
+            last_day (date): Последний день периода.
+
+        Returns:
+            List[SalesSummary]: Продажи по дням, в которые они были.
+        """
+        return await self.__select_summaries(
+            table="SalesDailyRollup",
+            condition="TRUE",
+            parameters=(first_day, last_day),
+        )
+
+    # -------------------------------------------------------------------------
+    async def __select_summaries(
+        self, table: str, condition: str, parameters: Iterable[Any]
+    ) -> List[SalesSummary]:
+        select_query: str = _SELECT_SUMMARY_TEMPLATE.substitute(
+            table=table, condition=condition
+        )
+
+        def transaction(
+            connection: MySQLPooledConnection,
+        ) -> List[Tuple[Any, ...]]:
+            with connection.cursor() as cursor:
+                cursor.execute(select_query, tuple(parameters))
+
+                return cursor.fetchall()
+
+        return [
+            SalesSummary(
+                day=day,
+                orders_amount=int(orders_amount),
+                revenue=Decimal(revenue),
+                refunds_amount=int(refunds_amount),
+                refunded_revenue=Decimal(refunded_revenue),
+            )
+            for day, orders_amount, revenue, refunds_amount, refunded_revenue in (
+                await self.__api.execute_transaction_use_pool(transaction)
+            )
+        ]
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль предназначен для хранения типов,
+описывающих агрегаты продаж для панелей продавцов и администраторов.
+"""
+
+__all__: list[str] = ["OrderChange", "SalesSummary"]
+
+from datetime import date, datetime
+from decimal import Decimal
+from dataclasses import dataclass
+
+from typing import Optional
+
+
+# _____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class OrderChange:
+    """OrderChange класс для представления изменения заказа.
+
+    Attributes:
+        order_id (Optional[int]): Идентификатор заказа. Для нового заказа - None.
+        seller_id (int): Идентификатор продавца (владельца товара).
+        product_id (int): Идентификатор товара.
+        created_at (datetime): Дата и время создания заказа.
+        total_price (Decimal): Стоимость заказа.
+        previous_status (Optional[str]): Статус до изменения. Для нового заказа - None.
+        status (str): Статус после изменения.
+    """
+
+    order_id: Optional[int]
+    seller_id: int
+    product_id: int
+    created_at: datetime
+    total_price: Decimal
+    previous_status: Optional[str]
+    status: str
+
+
+# _____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class SalesSummary:
+    """SalesSummary класс для представления продаж за день.
+
+    Attributes:
+        day (date): День создания заказов.
+        orders_amount (int): Количество выполненных заказов.
+        revenue (Decimal): Выручка выполненных заказов.
+        refunds_amount (int): Количество возвращённых заказов.
+        refunded_revenue (Decimal): Стоимость возвращённых заказов.
+    """
+
+    day: date
+    orders_amount: int
+    revenue: Decimal
+    refunds_amount: int
+    refunded_revenue: Decimal
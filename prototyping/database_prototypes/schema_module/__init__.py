@@ -0,0 +1,16 @@
+__all__: list[str] = [
+    "BaseRow",
+    "ColumnModel",
+    "IndexModel",
+    "TableModel",
+    "PooledConnectionType",
+    "read_mwb_model",
+    "schema_fingerprint",
+    "find_schema_drift",
+]
+
+from .base_row import BaseRow
+from .mwb_model import ColumnModel, IndexModel, TableModel
+from .mwb_model import read_mwb_model, schema_fingerprint
+from .schema_drift import find_schema_drift
+from .types import PooledConnectionType
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `base_row` реализует базовый класс строк таблиц,
+генерируемых по модели БД (см. `models_generator`).
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["BaseRow"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from typing import Any, Tuple
+
+
+# _____________________________________________________________________________
+class BaseRow:
+    """BaseRow базовый класс строки таблицы.
+
+    *Наследники объявляют `__slots__` со столбцами таблицы в порядке выборки,
+    поэтому строка курсора передаётся в конструктор позиционно (`Row(*row)`),
+    без построения словаря на каждую строку.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    # -------------------------------------------------------------------------
+    def as_tuple(self) -> Tuple[Any, ...]:
+        """as_tuple возвращает значения столбцов в порядке `__slots__`.
+
+        Returns:
+            Tuple[Any, ...]: Значения столбцов строки.
+        """
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    # -------------------------------------------------------------------------
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.as_tuple() == other.as_tuple()  # type: ignore
+
+    # -------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        fields: str = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+
+        return f"{type(self).__name__}({fields})"
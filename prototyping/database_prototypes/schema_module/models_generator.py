@@ -0,0 +1,636 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `models_generator` генерирует по модели MySQL Workbench модуль
+с классами строк таблиц (`__slots__`) и функциями запросов к ним.
+
+Для каждой таблицы генерируются запросы вставки, изменения и удаления
+по первичному ключу и запросы выборки по каждому индексу.
+Запросы являются готовыми строками с параметрами `%s`, поэтому при выполнении
+не формируются из шаблонов, а строки курсора передаются в конструктор
+класса строки позиционно.
+
+Генерация выполняется как шаг сборки; с ключом `--check` модуль не записывается,
+а сверяется с моделью и схемой SQLite, и при расхождении возвращается код 1.
+
+Запуск из каталога `prototyping`:
+    python -m database_prototypes.schema_module.models_generator --check
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["generate_models_source"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import re
+import sys
+import argparse
+
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .mwb_model import ColumnModel, IndexModel, TableModel
+from .mwb_model import read_mwb_model, schema_fingerprint
+from .schema_drift import find_schema_drift
+
+
+_LINE_LENGTH: int = 88
+
+_INDENT: str = "    "
+
+_WORD_SEPARATOR_PATTERN = re.compile(r"(?<!=) (?!= |%s)")
+
+_DEFAULT_MODEL_PATH: Path = (
+    Path(__file__).resolve().parents[3] / "Templates" / "DataBase" / "MainDataBaseModel.mwb"
+)
+
+_DEFAULT_OUTPUT_PATH: Path = Path(__file__).resolve().with_name("nekoshop_models.py")
+
+_CLASS_SEPARATOR: str = "# " + "_" * 77
+_METHOD_SEPARATOR: str = _INDENT + "# " + "-" * 73
+_FUNCTION_SEPARATOR: str = "# " + "-" * 76
+
+_HEADER_TEMPLATE: str = '''# -*- coding: utf-8 -*-
+
+"""
+Модуль `{module_name}` содержит классы строк и функции запросов
+к таблицам БД, описанным моделью `{model_name}`.
+
+*Модуль сгенерирован и не изменяется вручную. После изменения модели:
+    python -m database_prototypes.schema_module.models_generator
+
+Функции запросов выполняются над соединением из пула
+(например, внутри функции-транзакции execute_transaction_use_pool).
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+'''
+
+
+# ----------------------------------------------------------------------------
+def _to_snake_case(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower()
+
+
+# ----------------------------------------------------------------------------
+def _quote_columns(columns: Sequence[str], separator: str = ", ") -> str:
+    return separator.join(f"`{column}`" for column in columns)
+
+
+# ----------------------------------------------------------------------------
+def _annotation(column: ColumnModel) -> str:
+    annotation: str = column.python_type
+
+    if column.enum_values:
+        annotation = "Literal[{}]".format(
+            ", ".join(f'"{value}"' for value in column.enum_values)
+        )
+
+    return annotation if column.is_not_null else f"Optional[{annotation}]"
+
+
+# ----------------------------------------------------------------------------
+def _render_bracketed(
+    indent: str, head: str, items: Sequence[str], tail: str
+) -> List[str]:
+    """_render_bracketed размещает элементы в скобках по правилам форматирования black.
+
+    Args:
+        indent (str): Отступ первой строки.
+        head (str): Текст до элементов, включая открывающую скобку.
+        items (Sequence[str]): Элементы, разделяемые запятыми.
+        tail (str): Текст после элементов, начиная с закрывающей скобки.
+
+    Returns:
+        List[str]: Строки кода.
+    """
+    joined: str = ", ".join(items)
+
+    if len(indent + head + joined + tail) <= _LINE_LENGTH:
+        return [indent + head + joined + tail]
+
+    if len(indent + _INDENT + joined) <= _LINE_LENGTH:
+        return [indent + head, indent + _INDENT + joined, indent + tail]
+
+    return (
+        [indent + head]
+        + [f"{indent}{_INDENT}{item}," for item in items]
+        + [indent + tail]
+    )
+
+
+# ----------------------------------------------------------------------------
+def _render_tuple(indent: str, head: str, items: Sequence[str], tail: str) -> List[str]:
+    if len(items) == 1:
+        return [f"{indent}{head}{items[0]},{tail}"]
+
+    return _render_bracketed(indent, head, items, tail)
+
+
+# ----------------------------------------------------------------------------
+def _render_string(indent: str, head: str, value: str) -> List[str]:
+    """_render_string размещает строковую константу, разбивая её по словам.
+
+    Args:
+        indent (str): Отступ строк.
+        head (str): Текст до значения (например, "NAME: str = ").
+        value (str): Значение строки без кавычек.
+
+    Returns:
+        List[str]: Строки кода.
+    """
+    if len(f'{indent}{head}"{value}"') <= _LINE_LENGTH:
+        return [f'{indent}{head}"{value}"']
+
+    width: int = _LINE_LENGTH - len(indent + _INDENT) - 2
+    chunks: List[str] = []
+    chunk: str = ""
+
+    # Строка не разрывается внутри сравнений "`column` = %s" и списков "%s, %s".
+    for word in _WORD_SEPARATOR_PATTERN.split(value):
+        candidate: str = f"{chunk} {word}" if chunk else word
+
+        if chunk and len(candidate) + 1 > width:
+            chunks.append(chunk + " ")
+            chunk = word
+        else:
+            chunk = candidate
+
+    chunks.append(chunk)
+
+    return (
+        [f"{indent}{head}("]
+        + [f'{indent}{_INDENT}"{chunk}"' for chunk in chunks]
+        + [f"{indent})"]
+    )
+
+
+# ----------------------------------------------------------------------------
+def _render_execute(indent: str, query_name: str, parameters: Sequence[str]) -> List[str]:
+    single_line: List[str] = _render_tuple(
+        indent, f"cursor.execute({query_name}, (", parameters, "))"
+    )
+
+    if len(single_line) == 1 and len(single_line[0]) <= _LINE_LENGTH:
+        return single_line
+
+    inner: str = indent + _INDENT
+    joined: str = ", ".join(parameters) + ("," if len(parameters) == 1 else "")
+
+    if len(f"{inner}{query_name}, ({joined})") <= _LINE_LENGTH:
+        return [
+            f"{indent}cursor.execute(",
+            f"{inner}{query_name}, ({joined})",
+            f"{indent})",
+        ]
+
+    return (
+        [f"{indent}cursor.execute(", f"{inner}{query_name},"]
+        + _render_bracketed(inner, "(", parameters, "),")
+        + [f"{indent})"]
+    )
+
+
+# ----------------------------------------------------------------------------
+def _render_docstring(summary: str, note: str) -> List[str]:
+    return [f'{_INDENT}"""{summary}', "", f"{_INDENT}{note}", f'{_INDENT}"""']
+
+
+# _____________________________________________________________________________
+class _TableRenderer:
+    """_TableRenderer класс генерации кода одной таблицы.
+
+    Attributes:
+        table (TableModel): Описание таблицы.
+        row_class (str): Имя класса строки таблицы.
+        snake_name (str): Имя таблицы в нижнем регистре с подчёркиваниями.
+        exports (List[str]): Публичные имена, объявленные для таблицы.
+    """
+
+    table: TableModel
+    row_class: str
+    snake_name: str
+    exports: List[str]
+
+    # -------------------------------------------------------------------------
+    def __init__(self, table: TableModel) -> None:
+        self.table = table
+        self.row_class = f"{table.name}Row"
+        self.snake_name = _to_snake_case(table.name)
+        self.exports = [self.row_class]
+
+    # -------------------------------------------------------------------------
+    def render(self) -> List[str]:
+        lines: List[str] = self.__render_row_class()
+        functions: List[List[str]] = []
+        queries: List[str] = []
+
+        for index in self.__lookup_indices():
+            query, function = self.__render_select(index)
+            queries += query + [""]
+            functions.append(function)
+
+        primary_key: Optional[IndexModel] = self.table.primary_key
+
+        for render in (self.__render_insert, self.__render_update, self.__render_delete):
+            if render is not self.__render_insert and primary_key is None:
+                continue
+
+            rendered: Optional[Tuple[List[str], List[str]]] = render()
+
+            if rendered is not None:
+                queries += rendered[0] + [""]
+                functions.append(rendered[1])
+
+        lines += ["", ""] + queries[:-1]
+
+        for function in functions:
+            lines += ["", ""] + function
+
+        return lines
+
+    # -------------------------------------------------------------------------
+    def __render_row_class(self) -> List[str]:
+        columns: Tuple[ColumnModel, ...] = self.table.columns
+
+        lines: List[str] = [
+            _CLASS_SEPARATOR,
+            f"class {self.row_class}(BaseRow):",
+            f'{_INDENT}"""{self.row_class} строка таблицы `{self.table.name}`."""',
+            "",
+        ]
+        lines += _render_tuple(
+            _INDENT, "__slots__ = (", [f'"{column.name}"' for column in columns], ")"
+        )
+        lines.append("")
+        lines += [f"{_INDENT}{column.name}: {_annotation(column)}" for column in columns]
+        lines += ["", _METHOD_SEPARATOR]
+        lines += _render_bracketed(
+            _INDENT,
+            "def __init__(",
+            ["self"] + [f"{column.name}: {_annotation(column)}" for column in columns],
+            ") -> None:",
+        )
+        lines += [
+            f"{_INDENT * 2}self.{column.name} = {column.name}" for column in columns
+        ]
+
+        return lines
+
+    # -------------------------------------------------------------------------
+    def __lookup_indices(self) -> List[IndexModel]:
+        seen: Set[Tuple[str, ...]] = set()
+        indices: List[IndexModel] = []
+
+        # Первичный ключ выбирается первым, повторяющиеся наборы столбцов пропускаются.
+        for index in sorted(self.table.indices, key=lambda index: not index.is_primary):
+            if index.columns in seen:
+                continue
+
+            seen.add(index.columns)
+            indices.append(index)
+
+        return indices
+
+    # -------------------------------------------------------------------------
+    def __parameters(self, columns: Sequence[str]) -> List[str]:
+        return [
+            f"{column}: {_annotation(self.table.get_column(column))}"
+            for column in columns
+        ]
+
+    # -------------------------------------------------------------------------
+    def __where(self, columns: Sequence[str]) -> str:
+        return " AND ".join(f"`{column}` = %s" for column in columns)
+
+    # -------------------------------------------------------------------------
+    def __render_select(self, index: IndexModel) -> Tuple[List[str], List[str]]:
+        suffix: str = "_and_".join(index.columns)
+        function_name: str = f"select_{self.snake_name}_by_{suffix}"
+        query_name: str = f"{function_name.upper()}_QUERY"
+        column_names: List[str] = [column.name for column in self.table.columns]
+
+        query: List[str] = _render_string(
+            "",
+            f"{query_name}: str = ",
+            f"SELECT {_quote_columns(column_names)} FROM `{self.table.name}` "
+            f"WHERE {self.__where(index.columns)}",
+        )
+
+        result: str = (
+            f"Optional[{self.row_class}]" if index.is_unique else f"List[{self.row_class}]"
+        )
+        description: str = "строку" if index.is_unique else "строки"
+
+        function: List[str] = [_FUNCTION_SEPARATOR]
+        function += _render_bracketed(
+            "",
+            f"def {function_name}(",
+            ["connection: PooledConnectionType"] + self.__parameters(index.columns),
+            f") -> {result}:",
+        )
+        function += _render_docstring(
+            f"{function_name} выбирает {description}.",
+            f"*Выборка `{self.table.name}` по индексу `{index.name}`.",
+        )
+        function.append(f"{_INDENT}with connection.cursor() as cursor:")
+        function += _render_execute(_INDENT * 2, query_name, index.columns)
+        function.append("")
+
+        if index.is_unique:
+            function += [
+                f"{_INDENT * 2}row = cursor.fetchone()",
+                "",
+                f"{_INDENT}return None if row is None else {self.row_class}(*row)",
+            ]
+        else:
+            function.append(
+                f"{_INDENT * 2}return [{self.row_class}(*row) for row in cursor.fetchall()]"
+            )
+
+        self.exports += [query_name, function_name]
+
+        return query, function
+
+    # -------------------------------------------------------------------------
+    def __render_insert(self) -> Tuple[List[str], List[str]]:
+        function_name: str = f"insert_{self.snake_name}"
+        query_name: str = f"{function_name.upper()}_QUERY"
+        columns: List[str] = [
+            column.name for column in self.table.columns if not column.is_auto_increment
+        ]
+        has_auto_increment: bool = len(columns) != len(self.table.columns)
+
+        query: List[str] = _render_string(
+            "",
+            f"{query_name}: str = ",
+            f"INSERT INTO `{self.table.name}` ({_quote_columns(columns)}) "
+            f"VALUES ({', '.join('%s' for _ in columns)})",
+        )
+
+        function: List[str] = [_FUNCTION_SEPARATOR]
+        function += _render_bracketed(
+            "",
+            f"def {function_name}(",
+            ["connection: PooledConnectionType", f"row: {self.row_class}"],
+            ") -> int:" if has_auto_increment else ") -> None:",
+        )
+
+        function += _render_docstring(
+            f"{function_name} добавляет строку.",
+            f"*Возвращает идентификатор добавленной строки `{self.table.name}`."
+            if has_auto_increment
+            else f"*Строка добавляется в таблицу `{self.table.name}`.",
+        )
+
+        function.append(f"{_INDENT}with connection.cursor() as cursor:")
+        function += _render_execute(
+            _INDENT * 2, query_name, [f"row.{column}" for column in columns]
+        )
+
+        if has_auto_increment:
+            function += ["", f"{_INDENT * 2}return cursor.lastrowid"]
+
+        self.exports += [query_name, function_name]
+
+        return query, function
+
+    # -------------------------------------------------------------------------
+    def __render_update(self) -> Optional[Tuple[List[str], List[str]]]:
+        primary_key: IndexModel = self.table.primary_key  # type: ignore
+        columns: List[str] = [
+            column.name
+            for column in self.table.columns
+            if column.name not in primary_key.columns
+        ]
+
+        if not columns:
+            return None
+
+        function_name: str = f"update_{self.snake_name}"
+        query_name: str = f"{function_name.upper()}_QUERY"
+
+        query: List[str] = _render_string(
+            "",
+            f"{query_name}: str = ",
+            f"UPDATE `{self.table.name}` SET "
+            f"{_quote_columns(columns, ' = %s, ')} = %s "
+            f"WHERE {self.__where(primary_key.columns)}",
+        )
+
+        function: List[str] = [_FUNCTION_SEPARATOR]
+        function += _render_bracketed(
+            "",
+            f"def {function_name}(",
+            ["connection: PooledConnectionType", f"row: {self.row_class}"],
+            ") -> int:",
+        )
+        function += _render_docstring(
+            f"{function_name} изменяет строку.",
+            f"*Возвращает количество изменённых строк `{self.table.name}`.",
+        )
+        function.append(f"{_INDENT}with connection.cursor() as cursor:")
+        function += _render_execute(
+            _INDENT * 2,
+            query_name,
+            [f"row.{column}" for column in columns + list(primary_key.columns)],
+        )
+        function += ["", f"{_INDENT * 2}return cursor.rowcount"]
+
+        self.exports += [query_name, function_name]
+
+        return query, function
+
+    # -------------------------------------------------------------------------
+    def __render_delete(self) -> Tuple[List[str], List[str]]:
+        primary_key: IndexModel = self.table.primary_key  # type: ignore
+        function_name: str = f"delete_{self.snake_name}"
+        query_name: str = f"{function_name.upper()}_QUERY"
+
+        query: List[str] = _render_string(
+            "",
+            f"{query_name}: str = ",
+            f"DELETE FROM `{self.table.name}` WHERE {self.__where(primary_key.columns)}",
+        )
+
+        function: List[str] = [_FUNCTION_SEPARATOR]
+        function += _render_bracketed(
+            "",
+            f"def {function_name}(",
+            ["connection: PooledConnectionType"]
+            + self.__parameters(primary_key.columns),
+            ") -> int:",
+        )
+        function += _render_docstring(
+            f"{function_name} удаляет строку.",
+            f"*Возвращает количество удалённых строк `{self.table.name}`.",
+        )
+        function.append(f"{_INDENT}with connection.cursor() as cursor:")
+        function += _render_execute(_INDENT * 2, query_name, primary_key.columns)
+        function += ["", f"{_INDENT * 2}return cursor.rowcount"]
+
+        self.exports += [query_name, function_name]
+
+        return query, function
+
+
+# ----------------------------------------------------------------------------
+def generate_models_source(
+    tables: Tuple[TableModel, ...], model_name: str, module_name: str
+) -> str:
+    """generate_models_source генерирует исходный код модуля моделей.
+
+    *Результат зависит только от описания таблиц,
+    поэтому повторная генерация по неизменной модели даёт тот же текст.
+
+    Args:
+        tables (Tuple[TableModel, ...]): Таблицы модели.
+        model_name (str): Имя файла модели, указываемое в описании модуля.
+        module_name (str): Имя генерируемого модуля.
+
+    Returns:
+        str: Исходный код модуля.
+    """
+    renderers: List[_TableRenderer] = [_TableRenderer(table) for table in tables]
+    body: List[str] = []
+
+    for renderer in renderers:
+        body += ["", ""] + renderer.render()
+
+    python_types: Set[str] = {
+        column.python_type for table in tables for column in table.columns
+    }
+    typing_names: Set[str] = {"Dict", "List", "Optional", "Tuple"}
+
+    if any(column.enum_values for table in tables for column in table.columns):
+        typing_names.add("Literal")
+
+    imports: List[str] = []
+    datetime_names: List[str] = sorted(python_types & {"date", "datetime"})
+
+    if datetime_names:
+        imports.append(f"from datetime import {', '.join(datetime_names)}")
+
+    if "Decimal" in python_types:
+        imports.append("from decimal import Decimal")
+
+    imports.append(f"from typing import {', '.join(sorted(typing_names))}")
+
+    exports: List[str] = [
+        "SCHEMA_FINGERPRINT",
+        "TABLE_COLUMNS",
+        *(name for renderer in renderers for name in renderer.exports),
+    ]
+
+    lines: List[str] = [
+        _HEADER_TEMPLATE.format(module_name=module_name, model_name=model_name)
+    ]
+    lines += ["__all__: list[str] = ["]
+    lines += [f'{_INDENT}"{name}",' for name in exports]
+    lines += [
+        "]",
+        "",
+        '__author__ = "HyacinthusIO"',
+        '__version__ = "1.0.0"',
+        "",
+        *imports,
+        "",
+        "from .base_row import BaseRow",
+        "from .types import PooledConnectionType",
+        "",
+        "",
+        "# Отпечаток схемы модели, по которой сгенерирован модуль.",
+        *_render_string("", "SCHEMA_FINGERPRINT: str = ", schema_fingerprint(tables)),
+        "",
+        "# Столбцы таблиц в порядке выборки (и порядке параметров классов строк).",
+        "TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {",
+    ]
+
+    for table in tables:
+        lines += _render_tuple(
+            _INDENT,
+            f'"{table.name}": (',
+            [f'"{column.name}"' for column in table.columns],
+            "),",
+        )
+
+    lines.append("}")
+    lines += body
+
+    return "\n".join(lines) + "\n"
+
+
+# ----------------------------------------------------------------------------
+def _check_sqlite_schema(table_columns: Dict[str, Tuple[str, ...]]) -> List[str]:
+    from ..sqlite_database_module.schema import NEKOSHOP_SCHEMA_QUERIES
+    from ..sqlite_database_module.sqlite_connection import SQLiteConnectionPool
+
+    pool = SQLiteConnectionPool(
+        database=":memory:", pool_name="schema_check", pool_size=1, timeout=5.0
+    )
+    connection = pool.get_connection()
+
+    try:
+        with connection.cursor() as cursor:
+            for query in NEKOSHOP_SCHEMA_QUERIES:
+                cursor.execute(query)
+
+        return find_schema_drift(connection, table_columns)
+
+    finally:
+        connection.close()
+        pool.close()
+
+
+# ----------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--model", type=Path, default=_DEFAULT_MODEL_PATH)
+    parser.add_argument("--output", type=Path, default=_DEFAULT_OUTPUT_PATH)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="не записывать модуль, а завершиться с кодом 1 при расхождении",
+    )
+    arguments = parser.parse_args()
+
+    tables: Tuple[TableModel, ...] = read_mwb_model(str(arguments.model))
+    source: str = generate_models_source(
+        tables=tables, model_name=arguments.model.name, module_name=arguments.output.stem
+    )
+
+    if not arguments.check:
+        arguments.output.write_text(source, encoding="utf-8")
+        print(f"Сгенерирован модуль {arguments.output} ({len(tables)} таблиц)")
+        return
+
+    problems: List[str] = []
+
+    if not arguments.output.exists() or (
+        arguments.output.read_text(encoding="utf-8") != source
+    ):
+        problems.append(
+            f"Модуль {arguments.output} не соответствует модели {arguments.model.name}"
+        )
+
+    problems += _check_sqlite_schema(
+        {table.name: tuple(column.name for column in table.columns) for table in tables}
+    )
+
+    for problem in problems:
+        print(problem, file=sys.stderr)
+
+    if problems:
+        sys.exit(1)
+
+    print("Схема соответствует модели")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `mwb_model` читает модель MySQL Workbench (.mwb) и представляет
+таблицы, столбцы и индексы схемы в виде неизменяемых объектов.
+
+Файл .mwb является zip-архивом, содержащим XML-документ `document.mwb.xml`.
+Из документа читаются только сведения, необходимые для генерации кода:
+имена, типы и обязательность столбцов, первичные ключи и индексы.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "ColumnModel",
+    "IndexModel",
+    "TableModel",
+    "read_mwb_model",
+    "schema_fingerprint",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import re
+import hashlib
+import zipfile
+
+import xml.etree.ElementTree as ElementTree
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+_DOCUMENT_NAME: str = "document.mwb.xml"
+
+_DATATYPE_PREFIX: str = "com.mysql.rdbms.mysql.datatype."
+
+# Соответствие типов MySQL типам значений, возвращаемых драйвером.
+_PYTHON_TYPES: Dict[str, str] = {
+    "tinyint": "int",
+    "smallint": "int",
+    "mediumint": "int",
+    "int": "int",
+    "bigint": "int",
+    "float": "float",
+    "double": "float",
+    "decimal": "Decimal",
+    "char": "str",
+    "varchar": "str",
+    "tinytext": "str",
+    "text": "str",
+    "mediumtext": "str",
+    "longtext": "str",
+    "enum": "str",
+    "binary": "bytes",
+    "varbinary": "bytes",
+    "tinyblob": "bytes",
+    "blob": "bytes",
+    "mediumblob": "bytes",
+    "longblob": "bytes",
+    "date": "date",
+    "datetime": "datetime",
+    "datetime_f": "datetime",
+    "timestamp": "datetime",
+    "timestamp_f": "datetime",
+}
+
+_ENUM_VALUE_PATTERN = re.compile(r"'((?:[^']|'')*)'")
+
+
+# _____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class ColumnModel:
+    """ColumnModel класс описания столбца таблицы.
+
+    Attributes:
+        name (str): Имя столбца.
+        datatype (str): Тип столбца MySQL (например, "varchar", "datetime_f").
+        python_type (str): Тип значения столбца в Python.
+        is_not_null (bool): Столбец объявлен как NOT NULL.
+        is_auto_increment (bool): Значение столбца назначается БД.
+        enum_values (Tuple[str, ...]): Допустимые значения столбца ENUM.
+    """
+
+    name: str
+    datatype: str
+    python_type: str
+    is_not_null: bool
+    is_auto_increment: bool
+    enum_values: Tuple[str, ...] = ()
+
+
+# _____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class IndexModel:
+    """IndexModel класс описания индекса таблицы.
+
+    Attributes:
+        name (str): Имя индекса.
+        columns (Tuple[str, ...]): Столбцы индекса по порядку.
+        is_primary (bool): Индекс является первичным ключом.
+        is_unique (bool): Индекс является уникальным (в т.ч. первичный ключ).
+    """
+
+    name: str
+    columns: Tuple[str, ...]
+    is_primary: bool
+    is_unique: bool
+
+
+# _____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class TableModel:
+    """TableModel класс описания таблицы.
+
+    Attributes:
+        name (str): Имя таблицы.
+        columns (Tuple[ColumnModel, ...]): Столбцы таблицы по порядку.
+        indices (Tuple[IndexModel, ...]): Индексы таблицы по порядку.
+    """
+
+    name: str
+    columns: Tuple[ColumnModel, ...]
+    indices: Tuple[IndexModel, ...]
+
+    # -------------------------------------------------------------------------
+    @property
+    def primary_key(self) -> Optional[IndexModel]:
+        for index in self.indices:
+            if index.is_primary:
+                return index
+
+        return None
+
+    # -------------------------------------------------------------------------
+    def get_column(self, name: str) -> ColumnModel:
+        for column in self.columns:
+            if column.name == name:
+                return column
+
+        raise KeyError(f"Столбец `{name}` отсутствует в таблице `{self.name}`!")
+
+
+# ----------------------------------------------------------------------------
+def _get_text(element: ElementTree.Element, key: str) -> str:
+    child: Optional[ElementTree.Element] = element.find(f"*[@key='{key}']")
+
+    if child is None or child.text is None:
+        return ""
+
+    return child.text
+
+
+# ----------------------------------------------------------------------------
+def _get_list(element: ElementTree.Element, key: str) -> List[ElementTree.Element]:
+    child: Optional[ElementTree.Element] = element.find(f"value[@key='{key}']")
+
+    return [] if child is None else list(child)
+
+
+# ----------------------------------------------------------------------------
+def _read_column(element: ElementTree.Element, table_name: str) -> ColumnModel:
+    name: str = _get_text(element, "name")
+    datatype: str = _get_text(element, "simpleType").removeprefix(_DATATYPE_PREFIX)
+
+    if datatype not in _PYTHON_TYPES:
+        raise ValueError(
+            f"Неподдерживаемый тип `{datatype}` столбца `{table_name}`.`{name}`!"
+        )
+
+    enum_values: Tuple[str, ...] = ()
+
+    if datatype == "enum":
+        enum_values = tuple(
+            value.replace("''", "'")
+            for value in _ENUM_VALUE_PATTERN.findall(
+                _get_text(element, "datatypeExplicitParams")
+            )
+        )
+
+    return ColumnModel(
+        name=name,
+        datatype=datatype,
+        python_type=_PYTHON_TYPES[datatype],
+        is_not_null=_get_text(element, "isNotNull") == "1",
+        is_auto_increment=_get_text(element, "autoIncrement") == "1",
+        enum_values=enum_values,
+    )
+
+
+# ----------------------------------------------------------------------------
+def read_mwb_model(path: str) -> Tuple[TableModel, ...]:
+    """read_mwb_model читает таблицы из модели MySQL Workbench.
+
+    *Таблицы без столбцов (заготовки на диаграмме) пропускаются.
+
+    Args:
+        path (str): Путь к файлу модели .mwb.
+
+    Returns:
+        Tuple[TableModel, ...]: Таблицы модели в порядке их объявления.
+
+    Raises:
+        ValueError: Возбуждается если в модели используется неподдерживаемый тип столбца.
+    """
+    with zipfile.ZipFile(path) as archive:
+        root: ElementTree.Element = ElementTree.fromstring(archive.read(_DOCUMENT_NAME))
+
+    column_names: Dict[str, str] = {}
+    table_elements: List[ElementTree.Element] = []
+
+    for element in root.iter("value"):
+        struct_name: Optional[str] = element.get("struct-name")
+
+        if struct_name == "db.mysql.Column":
+            column_names[element.get("id", "")] = _get_text(element, "name")
+
+        elif struct_name == "db.mysql.Table":
+            table_elements.append(element)
+
+    tables: List[TableModel] = []
+
+    for element in table_elements:
+        name: str = _get_text(element, "name")
+        columns: Tuple[ColumnModel, ...] = tuple(
+            _read_column(column, name) for column in _get_list(element, "columns")
+        )
+
+        if not columns:
+            continue
+
+        indices: Tuple[IndexModel, ...] = tuple(
+            IndexModel(
+                name=_get_text(index, "name"),
+                columns=tuple(
+                    column_names[_get_text(index_column, "referencedColumn")]
+                    for index_column in _get_list(index, "columns")
+                ),
+                is_primary=_get_text(index, "isPrimary") == "1",
+                is_unique=_get_text(index, "indexType") in ("PRIMARY", "UNIQUE"),
+            )
+            for index in _get_list(element, "indices")
+        )
+
+        tables.append(TableModel(name=name, columns=columns, indices=indices))
+
+    return tuple(tables)
+
+
+# ----------------------------------------------------------------------------
+def schema_fingerprint(tables: Tuple[TableModel, ...]) -> str:
+    """schema_fingerprint вычисляет отпечаток схемы.
+
+    *Отпечаток зависит только от таблиц, столбцов и индексов,
+    поэтому перемещение таблиц на диаграмме не изменяет его.
+
+    Args:
+        tables (Tuple[TableModel, ...]): Таблицы модели.
+
+    Returns:
+        str: Шестнадцатеричный SHA-256 описания схемы.
+    """
+    digest = hashlib.sha256()
+
+    for table in tables:
+        digest.update(repr(table).encode())
+
+    return digest.hexdigest()
@@ -0,0 +1,2371 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `nekoshop_models` содержит классы строк и функции запросов
+к таблицам БД, описанным моделью `MainDataBaseModel.mwb`.
+
+*Модуль сгенерирован и не изменяется вручную. После изменения модели:
+    python -m database_prototypes.schema_module.models_generator
+
+Функции запросов выполняются над соединением из пула
+(например, внутри функции-транзакции execute_transaction_use_pool).
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "SCHEMA_FINGERPRINT",
+    "TABLE_COLUMNS",
+    "UserRow",
+    "SELECT_USER_BY_ID_QUERY",
+    "select_user_by_id",
+    "SELECT_USER_BY_PHONE_NUMBER_QUERY",
+    "select_user_by_phone_number",
+    "SELECT_USER_BY_EMAIL_QUERY",
+    "select_user_by_email",
+    "SELECT_USER_BY_INTERFACE_LANGUAGE_CODE_QUERY",
+    "select_user_by_interface_language_code",
+    "INSERT_USER_QUERY",
+    "insert_user",
+    "UPDATE_USER_QUERY",
+    "update_user",
+    "DELETE_USER_QUERY",
+    "delete_user",
+    "CategoryRow",
+    "SELECT_CATEGORY_BY_ID_QUERY",
+    "select_category_by_id",
+    "SELECT_CATEGORY_BY_NAME_QUERY",
+    "select_category_by_name",
+    "INSERT_CATEGORY_QUERY",
+    "insert_category",
+    "UPDATE_CATEGORY_QUERY",
+    "update_category",
+    "DELETE_CATEGORY_QUERY",
+    "delete_category",
+    "ServiceRow",
+    "SELECT_SERVICE_BY_ID_QUERY",
+    "select_service_by_id",
+    "SELECT_SERVICE_BY_CATEGORY_ID_QUERY",
+    "select_service_by_category_id",
+    "SELECT_SERVICE_BY_NAME_QUERY",
+    "select_service_by_name",
+    "INSERT_SERVICE_QUERY",
+    "insert_service",
+    "UPDATE_SERVICE_QUERY",
+    "update_service",
+    "DELETE_SERVICE_QUERY",
+    "delete_service",
+    "ProductRow",
+    "SELECT_PRODUCT_BY_ID_QUERY",
+    "select_product_by_id",
+    "SELECT_PRODUCT_BY_SERVICE_ID_QUERY",
+    "select_product_by_service_id",
+    "SELECT_PRODUCT_BY_OWNER_ID_QUERY",
+    "select_product_by_owner_id",
+    "INSERT_PRODUCT_QUERY",
+    "insert_product",
+    "UPDATE_PRODUCT_QUERY",
+    "update_product",
+    "DELETE_PRODUCT_QUERY",
+    "delete_product",
+    "OrderRow",
+    "SELECT_ORDER_BY_ID_QUERY",
+    "select_order_by_id",
+    "SELECT_ORDER_BY_CUSTOMER_USER_ID_QUERY",
+    "select_order_by_customer_user_id",
+    "SELECT_ORDER_BY_PRODUCT_ID_QUERY",
+    "select_order_by_product_id",
+    "INSERT_ORDER_QUERY",
+    "insert_order",
+    "UPDATE_ORDER_QUERY",
+    "update_order",
+    "DELETE_ORDER_QUERY",
+    "delete_order",
+    "SupportedInterfaceLanguageRow",
+    "SELECT_SUPPORTED_INTERFACE_LANGUAGE_BY_CODE_QUERY",
+    "select_supported_interface_language_by_code",
+    "INSERT_SUPPORTED_INTERFACE_LANGUAGE_QUERY",
+    "insert_supported_interface_language",
+    "UPDATE_SUPPORTED_INTERFACE_LANGUAGE_QUERY",
+    "update_supported_interface_language",
+    "DELETE_SUPPORTED_INTERFACE_LANGUAGE_QUERY",
+    "delete_supported_interface_language",
+    "TicketRow",
+    "SELECT_TICKET_BY_ID_QUERY",
+    "select_ticket_by_id",
+    "SELECT_TICKET_BY_CREATOR_USER_ID_QUERY",
+    "select_ticket_by_creator_user_id",
+    "INSERT_TICKET_QUERY",
+    "insert_ticket",
+    "UPDATE_TICKET_QUERY",
+    "update_ticket",
+    "DELETE_TICKET_QUERY",
+    "delete_ticket",
+    "TicketSolutionRow",
+    "SELECT_TICKET_SOLUTION_BY_TICKET_ID_QUERY",
+    "select_ticket_solution_by_ticket_id",
+    "SELECT_TICKET_SOLUTION_BY_RESPONSIBLE_ADMIN_ID_QUERY",
+    "select_ticket_solution_by_responsible_admin_id",
+    "INSERT_TICKET_SOLUTION_QUERY",
+    "insert_ticket_solution",
+    "UPDATE_TICKET_SOLUTION_QUERY",
+    "update_ticket_solution",
+    "DELETE_TICKET_SOLUTION_QUERY",
+    "delete_ticket_solution",
+    "RequestEditProductRow",
+    "SELECT_REQUEST_EDIT_PRODUCT_BY_ID_QUERY",
+    "select_request_edit_product_by_id",
+    "SELECT_REQUEST_EDIT_PRODUCT_BY_PRODUCT_ID_QUERY",
+    "select_request_edit_product_by_product_id",
+    "INSERT_REQUEST_EDIT_PRODUCT_QUERY",
+    "insert_request_edit_product",
+    "UPDATE_REQUEST_EDIT_PRODUCT_QUERY",
+    "update_request_edit_product",
+    "DELETE_REQUEST_EDIT_PRODUCT_QUERY",
+    "delete_request_edit_product",
+    "EditProductDataRow",
+    "SELECT_EDIT_PRODUCT_DATA_BY_REQUEST_ID_QUERY",
+    "select_edit_product_data_by_request_id",
+    "INSERT_EDIT_PRODUCT_DATA_QUERY",
+    "insert_edit_product_data",
+    "UPDATE_EDIT_PRODUCT_DATA_QUERY",
+    "update_edit_product_data",
+    "DELETE_EDIT_PRODUCT_DATA_QUERY",
+    "delete_edit_product_data",
+    "RequestAddProductRow",
+    "SELECT_REQUEST_ADD_PRODUCT_BY_ID_QUERY",
+    "select_request_add_product_by_id",
+    "SELECT_REQUEST_ADD_PRODUCT_BY_OWNER_USER_ID_QUERY",
+    "select_request_add_product_by_owner_user_id",
+    "SELECT_REQUEST_ADD_PRODUCT_BY_SERVICE_ID_QUERY",
+    "select_request_add_product_by_service_id",
+    "INSERT_REQUEST_ADD_PRODUCT_QUERY",
+    "insert_request_add_product",
+    "UPDATE_REQUEST_ADD_PRODUCT_QUERY",
+    "update_request_add_product",
+    "DELETE_REQUEST_ADD_PRODUCT_QUERY",
+    "delete_request_add_product",
+    "AddProductDataRow",
+    "SELECT_ADD_PRODUCT_DATA_BY_REQUEST_ID_QUERY",
+    "select_add_product_data_by_request_id",
+    "INSERT_ADD_PRODUCT_DATA_QUERY",
+    "insert_add_product_data",
+    "UPDATE_ADD_PRODUCT_DATA_QUERY",
+    "update_add_product_data",
+    "DELETE_ADD_PRODUCT_DATA_QUERY",
+    "delete_add_product_data",
+    "RequestDeleteProductRow",
+    "SELECT_REQUEST_DELETE_PRODUCT_BY_ID_QUERY",
+    "select_request_delete_product_by_id",
+    "SELECT_REQUEST_DELETE_PRODUCT_BY_PRODUCT_ID_QUERY",
+    "select_request_delete_product_by_product_id",
+    "INSERT_REQUEST_DELETE_PRODUCT_QUERY",
+    "insert_request_delete_product",
+    "UPDATE_REQUEST_DELETE_PRODUCT_QUERY",
+    "update_request_delete_product",
+    "DELETE_REQUEST_DELETE_PRODUCT_QUERY",
+    "delete_request_delete_product",
+    "RequestBlockProductRow",
+    "SELECT_REQUEST_BLOCK_PRODUCT_BY_ID_QUERY",
+    "select_request_block_product_by_id",
+    "SELECT_REQUEST_BLOCK_PRODUCT_BY_PRODUCT_ID_QUERY",
+    "select_request_block_product_by_product_id",
+    "INSERT_REQUEST_BLOCK_PRODUCT_QUERY",
+    "insert_request_block_product",
+    "UPDATE_REQUEST_BLOCK_PRODUCT_QUERY",
+    "update_request_block_product",
+    "DELETE_REQUEST_BLOCK_PRODUCT_QUERY",
+    "delete_request_block_product",
+    "RequestUnblockProductRow",
+    "SELECT_REQUEST_UNBLOCK_PRODUCT_BY_ID_QUERY",
+    "select_request_unblock_product_by_id",
+    "SELECT_REQUEST_UNBLOCK_PRODUCT_BY_PRODUCT_ID_QUERY",
+    "select_request_unblock_product_by_product_id",
+    "INSERT_REQUEST_UNBLOCK_PRODUCT_QUERY",
+    "insert_request_unblock_product",
+    "UPDATE_REQUEST_UNBLOCK_PRODUCT_QUERY",
+    "update_request_unblock_product",
+    "DELETE_REQUEST_UNBLOCK_PRODUCT_QUERY",
+    "delete_request_unblock_product",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Literal, Optional, Tuple
+
+from .base_row import BaseRow
+from .types import PooledConnectionType
+
+
+# Отпечаток схемы модели, по которой сгенерирован модуль.
+SCHEMA_FINGERPRINT: str = (
+    "ae03ca10e4fd312df0b21032afb78e723e932432daee2a9eb7a5017e9f3df31f"
+)
+
+# Столбцы таблиц в порядке выборки (и порядке параметров классов строк).
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "User": (
+        "id",
+        "phone_number",
+        "email",
+        "is_email_notification",
+        "is_banned",
+        "is_admin",
+        "is_seller",
+        "interface_language_code",
+    ),
+    "Category": ("id", "name", "description", "is_blocked"),
+    "Service": ("id", "category_id", "name", "description", "image", "is_blocked"),
+    "Product": (
+        "id",
+        "owner_id",
+        "service_id",
+        "title",
+        "description",
+        "image",
+        "price",
+        "is_blocked",
+        "quantity",
+    ),
+    "Order": (
+        "id", "product_id", "customer_user_id", "status", "total_price", "created_at"
+    ),
+    "SupportedInterfaceLanguage": ("code", "name"),
+    "Ticket": (
+        "id",
+        "creator_user_id",
+        "status",
+        "subject",
+        "description",
+        "created_at",
+        "updated_at",
+    ),
+    "TicketSolution": (
+        "ticket_id", "responsible_admin_id", "solution", "created_at", "updated_at"
+    ),
+    "RequestEditProduct": ("id", "product_id", "status", "created_at", "updated_at"),
+    "EditProductData": (
+        "request_id", "new_title", "new_description", "new_image", "new_price"
+    ),
+    "RequestAddProduct": (
+        "id", "service_id", "owner_user_id", "status", "created_at", "updated_at"
+    ),
+    "AddProductData": ("request_id", "title", "description", "image", "price"),
+    "RequestDeleteProduct": ("id", "product_id", "status", "created_at", "updated_at"),
+    "RequestBlockProduct": ("id", "product_id", "status", "created_at", "updated_at"),
+    "RequestUnblockProduct": ("id", "product_id", "status", "created_at", "updated_at"),
+}
+
+
+# _____________________________________________________________________________
+class UserRow(BaseRow):
+    """UserRow строка таблицы `User`."""
+
+    __slots__ = (
+        "id",
+        "phone_number",
+        "email",
+        "is_email_notification",
+        "is_banned",
+        "is_admin",
+        "is_seller",
+        "interface_language_code",
+    )
+
+    id: int
+    phone_number: str
+    email: Optional[str]
+    is_email_notification: int
+    is_banned: int
+    is_admin: int
+    is_seller: int
+    interface_language_code: str
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        id: int,
+        phone_number: str,
+        email: Optional[str],
+        is_email_notification: int,
+        is_banned: int,
+        is_admin: int,
+        is_seller: int,
+        interface_language_code: str,
+    ) -> None:
+        self.id = id
+        self.phone_number = phone_number
+        self.email = email
+        self.is_email_notification = is_email_notification
+        self.is_banned = is_banned
+        self.is_admin = is_admin
+        self.is_seller = is_seller
+        self.interface_language_code = interface_language_code
+
+
+SELECT_USER_BY_ID_QUERY: str = (
+    "SELECT `id`, `phone_number`, `email`, `is_email_notification`, `is_banned`, "
+    "`is_admin`, `is_seller`, `interface_language_code` FROM `User` WHERE `id` = %s"
+)
+
+SELECT_USER_BY_PHONE_NUMBER_QUERY: str = (
+    "SELECT `id`, `phone_number`, `email`, `is_email_notification`, `is_banned`, "
+    "`is_admin`, `is_seller`, `interface_language_code` FROM `User` WHERE "
+    "`phone_number` = %s"
+)
+
+SELECT_USER_BY_EMAIL_QUERY: str = (
+    "SELECT `id`, `phone_number`, `email`, `is_email_notification`, `is_banned`, "
+    "`is_admin`, `is_seller`, `interface_language_code` FROM `User` WHERE `email` = %s"
+)
+
+SELECT_USER_BY_INTERFACE_LANGUAGE_CODE_QUERY: str = (
+    "SELECT `id`, `phone_number`, `email`, `is_email_notification`, `is_banned`, "
+    "`is_admin`, `is_seller`, `interface_language_code` FROM `User` WHERE "
+    "`interface_language_code` = %s"
+)
+
+INSERT_USER_QUERY: str = (
+    "INSERT INTO `User` (`phone_number`, `email`, `is_email_notification`, "
+    "`is_banned`, `is_admin`, `is_seller`, `interface_language_code`) VALUES "
+    "(%s, %s, %s, %s, %s, %s, %s)"
+)
+
+UPDATE_USER_QUERY: str = (
+    "UPDATE `User` SET `phone_number` = %s, `email` = %s, "
+    "`is_email_notification` = %s, `is_banned` = %s, `is_admin` = %s, "
+    "`is_seller` = %s, `interface_language_code` = %s WHERE `id` = %s"
+)
+
+DELETE_USER_QUERY: str = "DELETE FROM `User` WHERE `id` = %s"
+
+
+# ----------------------------------------------------------------------------
+def select_user_by_id(connection: PooledConnectionType, id: int) -> Optional[UserRow]:
+    """select_user_by_id выбирает строку.
+
+    *Выборка `User` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_USER_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else UserRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_user_by_phone_number(
+    connection: PooledConnectionType, phone_number: str
+) -> Optional[UserRow]:
+    """select_user_by_phone_number выбирает строку.
+
+    *Выборка `User` по индексу `phone_number_UNIQUE`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_USER_BY_PHONE_NUMBER_QUERY, (phone_number,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else UserRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_user_by_email(
+    connection: PooledConnectionType, email: Optional[str]
+) -> Optional[UserRow]:
+    """select_user_by_email выбирает строку.
+
+    *Выборка `User` по индексу `email_UNIQUE`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_USER_BY_EMAIL_QUERY, (email,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else UserRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_user_by_interface_language_code(
+    connection: PooledConnectionType, interface_language_code: str
+) -> List[UserRow]:
+    """select_user_by_interface_language_code выбирает строки.
+
+    *Выборка `User` по индексу `InterfaceLanguageCode_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            SELECT_USER_BY_INTERFACE_LANGUAGE_CODE_QUERY, (interface_language_code,)
+        )
+
+        return [UserRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def insert_user(connection: PooledConnectionType, row: UserRow) -> int:
+    """insert_user добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `User`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_USER_QUERY,
+            (
+                row.phone_number,
+                row.email,
+                row.is_email_notification,
+                row.is_banned,
+                row.is_admin,
+                row.is_seller,
+                row.interface_language_code,
+            ),
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_user(connection: PooledConnectionType, row: UserRow) -> int:
+    """update_user изменяет строку.
+
+    *Возвращает количество изменённых строк `User`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_USER_QUERY,
+            (
+                row.phone_number,
+                row.email,
+                row.is_email_notification,
+                row.is_banned,
+                row.is_admin,
+                row.is_seller,
+                row.interface_language_code,
+                row.id,
+            ),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_user(connection: PooledConnectionType, id: int) -> int:
+    """delete_user удаляет строку.
+
+    *Возвращает количество удалённых строк `User`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_USER_QUERY, (id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class CategoryRow(BaseRow):
+    """CategoryRow строка таблицы `Category`."""
+
+    __slots__ = ("id", "name", "description", "is_blocked")
+
+    id: int
+    name: str
+    description: str
+    is_blocked: int
+
+    # -------------------------------------------------------------------------
+    def __init__(self, id: int, name: str, description: str, is_blocked: int) -> None:
+        self.id = id
+        self.name = name
+        self.description = description
+        self.is_blocked = is_blocked
+
+
+SELECT_CATEGORY_BY_ID_QUERY: str = (
+    "SELECT `id`, `name`, `description`, `is_blocked` FROM `Category` WHERE `id` = %s"
+)
+
+SELECT_CATEGORY_BY_NAME_QUERY: str = (
+    "SELECT `id`, `name`, `description`, `is_blocked` FROM `Category` WHERE "
+    "`name` = %s"
+)
+
+INSERT_CATEGORY_QUERY: str = (
+    "INSERT INTO `Category` (`name`, `description`, `is_blocked`) VALUES (%s, %s, %s)"
+)
+
+UPDATE_CATEGORY_QUERY: str = (
+    "UPDATE `Category` SET `name` = %s, `description` = %s, `is_blocked` = %s WHERE "
+    "`id` = %s"
+)
+
+DELETE_CATEGORY_QUERY: str = "DELETE FROM `Category` WHERE `id` = %s"
+
+
+# ----------------------------------------------------------------------------
+def select_category_by_id(
+    connection: PooledConnectionType, id: int
+) -> Optional[CategoryRow]:
+    """select_category_by_id выбирает строку.
+
+    *Выборка `Category` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_CATEGORY_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else CategoryRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_category_by_name(
+    connection: PooledConnectionType, name: str
+) -> Optional[CategoryRow]:
+    """select_category_by_name выбирает строку.
+
+    *Выборка `Category` по индексу `title_UNIQUE`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_CATEGORY_BY_NAME_QUERY, (name,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else CategoryRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def insert_category(connection: PooledConnectionType, row: CategoryRow) -> int:
+    """insert_category добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `Category`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_CATEGORY_QUERY, (row.name, row.description, row.is_blocked)
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_category(connection: PooledConnectionType, row: CategoryRow) -> int:
+    """update_category изменяет строку.
+
+    *Возвращает количество изменённых строк `Category`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_CATEGORY_QUERY, (row.name, row.description, row.is_blocked, row.id)
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_category(connection: PooledConnectionType, id: int) -> int:
+    """delete_category удаляет строку.
+
+    *Возвращает количество удалённых строк `Category`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_CATEGORY_QUERY, (id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class ServiceRow(BaseRow):
+    """ServiceRow строка таблицы `Service`."""
+
+    __slots__ = ("id", "category_id", "name", "description", "image", "is_blocked")
+
+    id: int
+    category_id: int
+    name: str
+    description: str
+    image: bytes
+    is_blocked: int
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        id: int,
+        category_id: int,
+        name: str,
+        description: str,
+        image: bytes,
+        is_blocked: int,
+    ) -> None:
+        self.id = id
+        self.category_id = category_id
+        self.name = name
+        self.description = description
+        self.image = image
+        self.is_blocked = is_blocked
+
+
+SELECT_SERVICE_BY_ID_QUERY: str = (
+    "SELECT `id`, `category_id`, `name`, `description`, `image`, `is_blocked` FROM "
+    "`Service` WHERE `id` = %s"
+)
+
+SELECT_SERVICE_BY_CATEGORY_ID_QUERY: str = (
+    "SELECT `id`, `category_id`, `name`, `description`, `image`, `is_blocked` FROM "
+    "`Service` WHERE `category_id` = %s"
+)
+
+SELECT_SERVICE_BY_NAME_QUERY: str = (
+    "SELECT `id`, `category_id`, `name`, `description`, `image`, `is_blocked` FROM "
+    "`Service` WHERE `name` = %s"
+)
+
+INSERT_SERVICE_QUERY: str = (
+    "INSERT INTO `Service` (`category_id`, `name`, `description`, `image`, "
+    "`is_blocked`) VALUES (%s, %s, %s, %s, %s)"
+)
+
+UPDATE_SERVICE_QUERY: str = (
+    "UPDATE `Service` SET `category_id` = %s, `name` = %s, `description` = %s, "
+    "`image` = %s, `is_blocked` = %s WHERE `id` = %s"
+)
+
+DELETE_SERVICE_QUERY: str = "DELETE FROM `Service` WHERE `id` = %s"
+
+
+# ----------------------------------------------------------------------------
+def select_service_by_id(
+    connection: PooledConnectionType, id: int
+) -> Optional[ServiceRow]:
+    """select_service_by_id выбирает строку.
+
+    *Выборка `Service` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_SERVICE_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else ServiceRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_service_by_category_id(
+    connection: PooledConnectionType, category_id: int
+) -> List[ServiceRow]:
+    """select_service_by_category_id выбирает строки.
+
+    *Выборка `Service` по индексу `CategoryTypeID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_SERVICE_BY_CATEGORY_ID_QUERY, (category_id,))
+
+        return [ServiceRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def select_service_by_name(
+    connection: PooledConnectionType, name: str
+) -> Optional[ServiceRow]:
+    """select_service_by_name выбирает строку.
+
+    *Выборка `Service` по индексу `title_UNIQUE`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_SERVICE_BY_NAME_QUERY, (name,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else ServiceRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def insert_service(connection: PooledConnectionType, row: ServiceRow) -> int:
+    """insert_service добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `Service`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_SERVICE_QUERY,
+            (row.category_id, row.name, row.description, row.image, row.is_blocked),
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_service(connection: PooledConnectionType, row: ServiceRow) -> int:
+    """update_service изменяет строку.
+
+    *Возвращает количество изменённых строк `Service`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_SERVICE_QUERY,
+            (
+                row.category_id,
+                row.name,
+                row.description,
+                row.image,
+                row.is_blocked,
+                row.id,
+            ),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_service(connection: PooledConnectionType, id: int) -> int:
+    """delete_service удаляет строку.
+
+    *Возвращает количество удалённых строк `Service`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_SERVICE_QUERY, (id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class ProductRow(BaseRow):
+    """ProductRow строка таблицы `Product`."""
+
+    __slots__ = (
+        "id",
+        "owner_id",
+        "service_id",
+        "title",
+        "description",
+        "image",
+        "price",
+        "is_blocked",
+        "quantity",
+    )
+
+    id: int
+    owner_id: int
+    service_id: int
+    title: str
+    description: str
+    image: bytes
+    price: Decimal
+    is_blocked: int
+    quantity: Optional[int]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        id: int,
+        owner_id: int,
+        service_id: int,
+        title: str,
+        description: str,
+        image: bytes,
+        price: Decimal,
+        is_blocked: int,
+        quantity: Optional[int],
+    ) -> None:
+        self.id = id
+        self.owner_id = owner_id
+        self.service_id = service_id
+        self.title = title
+        self.description = description
+        self.image = image
+        self.price = price
+        self.is_blocked = is_blocked
+        self.quantity = quantity
+
+
+SELECT_PRODUCT_BY_ID_QUERY: str = (
+    "SELECT `id`, `owner_id`, `service_id`, `title`, `description`, `image`, `price`, "
+    "`is_blocked`, `quantity` FROM `Product` WHERE `id` = %s"
+)
+
+SELECT_PRODUCT_BY_SERVICE_ID_QUERY: str = (
+    "SELECT `id`, `owner_id`, `service_id`, `title`, `description`, `image`, `price`, "
+    "`is_blocked`, `quantity` FROM `Product` WHERE `service_id` = %s"
+)
+
+SELECT_PRODUCT_BY_OWNER_ID_QUERY: str = (
+    "SELECT `id`, `owner_id`, `service_id`, `title`, `description`, `image`, `price`, "
+    "`is_blocked`, `quantity` FROM `Product` WHERE `owner_id` = %s"
+)
+
+INSERT_PRODUCT_QUERY: str = (
+    "INSERT INTO `Product` (`owner_id`, `service_id`, `title`, `description`, `image`, "
+    "`price`, `is_blocked`, `quantity`) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"
+)
+
+UPDATE_PRODUCT_QUERY: str = (
+    "UPDATE `Product` SET `owner_id` = %s, `service_id` = %s, `title` = %s, "
+    "`description` = %s, `image` = %s, `price` = %s, `is_blocked` = %s, "
+    "`quantity` = %s WHERE `id` = %s"
+)
+
+DELETE_PRODUCT_QUERY: str = "DELETE FROM `Product` WHERE `id` = %s"
+
+
+# ----------------------------------------------------------------------------
+def select_product_by_id(
+    connection: PooledConnectionType, id: int
+) -> Optional[ProductRow]:
+    """select_product_by_id выбирает строку.
+
+    *Выборка `Product` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_PRODUCT_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else ProductRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_product_by_service_id(
+    connection: PooledConnectionType, service_id: int
+) -> List[ProductRow]:
+    """select_product_by_service_id выбирает строки.
+
+    *Выборка `Product` по индексу `ServiceID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_PRODUCT_BY_SERVICE_ID_QUERY, (service_id,))
+
+        return [ProductRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def select_product_by_owner_id(
+    connection: PooledConnectionType, owner_id: int
+) -> List[ProductRow]:
+    """select_product_by_owner_id выбирает строки.
+
+    *Выборка `Product` по индексу `OwnerID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_PRODUCT_BY_OWNER_ID_QUERY, (owner_id,))
+
+        return [ProductRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def insert_product(connection: PooledConnectionType, row: ProductRow) -> int:
+    """insert_product добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `Product`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_PRODUCT_QUERY,
+            (
+                row.owner_id,
+                row.service_id,
+                row.title,
+                row.description,
+                row.image,
+                row.price,
+                row.is_blocked,
+                row.quantity,
+            ),
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_product(connection: PooledConnectionType, row: ProductRow) -> int:
+    """update_product изменяет строку.
+
+    *Возвращает количество изменённых строк `Product`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_PRODUCT_QUERY,
+            (
+                row.owner_id,
+                row.service_id,
+                row.title,
+                row.description,
+                row.image,
+                row.price,
+                row.is_blocked,
+                row.quantity,
+                row.id,
+            ),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_product(connection: PooledConnectionType, id: int) -> int:
+    """delete_product удаляет строку.
+
+    *Возвращает количество удалённых строк `Product`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_PRODUCT_QUERY, (id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class OrderRow(BaseRow):
+    """OrderRow строка таблицы `Order`."""
+
+    __slots__ = (
+        "id", "product_id", "customer_user_id", "status", "total_price", "created_at"
+    )
+
+    id: int
+    product_id: int
+    customer_user_id: int
+    status: Literal["pending", "canceled", "refunded", "completed"]
+    total_price: Decimal
+    created_at: datetime
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        id: int,
+        product_id: int,
+        customer_user_id: int,
+        status: Literal["pending", "canceled", "refunded", "completed"],
+        total_price: Decimal,
+        created_at: datetime,
+    ) -> None:
+        self.id = id
+        self.product_id = product_id
+        self.customer_user_id = customer_user_id
+        self.status = status
+        self.total_price = total_price
+        self.created_at = created_at
+
+
+SELECT_ORDER_BY_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `customer_user_id`, `status`, `total_price`, "
+    "`created_at` FROM `Order` WHERE `id` = %s"
+)
+
+SELECT_ORDER_BY_CUSTOMER_USER_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `customer_user_id`, `status`, `total_price`, "
+    "`created_at` FROM `Order` WHERE `customer_user_id` = %s"
+)
+
+SELECT_ORDER_BY_PRODUCT_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `customer_user_id`, `status`, `total_price`, "
+    "`created_at` FROM `Order` WHERE `product_id` = %s"
+)
+
+INSERT_ORDER_QUERY: str = (
+    "INSERT INTO `Order` (`product_id`, `customer_user_id`, `status`, `total_price`, "
+    "`created_at`) VALUES (%s, %s, %s, %s, %s)"
+)
+
+UPDATE_ORDER_QUERY: str = (
+    "UPDATE `Order` SET `product_id` = %s, `customer_user_id` = %s, `status` = %s, "
+    "`total_price` = %s, `created_at` = %s WHERE `id` = %s"
+)
+
+DELETE_ORDER_QUERY: str = "DELETE FROM `Order` WHERE `id` = %s"
+
+
+# ----------------------------------------------------------------------------
+def select_order_by_id(connection: PooledConnectionType, id: int) -> Optional[OrderRow]:
+    """select_order_by_id выбирает строку.
+
+    *Выборка `Order` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_ORDER_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else OrderRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_order_by_customer_user_id(
+    connection: PooledConnectionType, customer_user_id: int
+) -> List[OrderRow]:
+    """select_order_by_customer_user_id выбирает строки.
+
+    *Выборка `Order` по индексу `OrdererUserID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_ORDER_BY_CUSTOMER_USER_ID_QUERY, (customer_user_id,))
+
+        return [OrderRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def select_order_by_product_id(
+    connection: PooledConnectionType, product_id: int
+) -> List[OrderRow]:
+    """select_order_by_product_id выбирает строки.
+
+    *Выборка `Order` по индексу `ProductID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_ORDER_BY_PRODUCT_ID_QUERY, (product_id,))
+
+        return [OrderRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def insert_order(connection: PooledConnectionType, row: OrderRow) -> int:
+    """insert_order добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `Order`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_ORDER_QUERY,
+            (
+                row.product_id,
+                row.customer_user_id,
+                row.status,
+                row.total_price,
+                row.created_at,
+            ),
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_order(connection: PooledConnectionType, row: OrderRow) -> int:
+    """update_order изменяет строку.
+
+    *Возвращает количество изменённых строк `Order`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_ORDER_QUERY,
+            (
+                row.product_id,
+                row.customer_user_id,
+                row.status,
+                row.total_price,
+                row.created_at,
+                row.id,
+            ),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_order(connection: PooledConnectionType, id: int) -> int:
+    """delete_order удаляет строку.
+
+    *Возвращает количество удалённых строк `Order`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_ORDER_QUERY, (id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class SupportedInterfaceLanguageRow(BaseRow):
+    """SupportedInterfaceLanguageRow строка таблицы `SupportedInterfaceLanguage`."""
+
+    __slots__ = ("code", "name")
+
+    code: str
+    name: str
+
+    # -------------------------------------------------------------------------
+    def __init__(self, code: str, name: str) -> None:
+        self.code = code
+        self.name = name
+
+
+SELECT_SUPPORTED_INTERFACE_LANGUAGE_BY_CODE_QUERY: str = (
+    "SELECT `code`, `name` FROM `SupportedInterfaceLanguage` WHERE `code` = %s"
+)
+
+INSERT_SUPPORTED_INTERFACE_LANGUAGE_QUERY: str = (
+    "INSERT INTO `SupportedInterfaceLanguage` (`code`, `name`) VALUES (%s, %s)"
+)
+
+UPDATE_SUPPORTED_INTERFACE_LANGUAGE_QUERY: str = (
+    "UPDATE `SupportedInterfaceLanguage` SET `name` = %s WHERE `code` = %s"
+)
+
+DELETE_SUPPORTED_INTERFACE_LANGUAGE_QUERY: str = (
+    "DELETE FROM `SupportedInterfaceLanguage` WHERE `code` = %s"
+)
+
+
+# ----------------------------------------------------------------------------
+def select_supported_interface_language_by_code(
+    connection: PooledConnectionType, code: str
+) -> Optional[SupportedInterfaceLanguageRow]:
+    """select_supported_interface_language_by_code выбирает строку.
+
+    *Выборка `SupportedInterfaceLanguage` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_SUPPORTED_INTERFACE_LANGUAGE_BY_CODE_QUERY, (code,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else SupportedInterfaceLanguageRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def insert_supported_interface_language(
+    connection: PooledConnectionType, row: SupportedInterfaceLanguageRow
+) -> None:
+    """insert_supported_interface_language добавляет строку.
+
+    *Строка добавляется в таблицу `SupportedInterfaceLanguage`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(INSERT_SUPPORTED_INTERFACE_LANGUAGE_QUERY, (row.code, row.name))
+
+
+# ----------------------------------------------------------------------------
+def update_supported_interface_language(
+    connection: PooledConnectionType, row: SupportedInterfaceLanguageRow
+) -> int:
+    """update_supported_interface_language изменяет строку.
+
+    *Возвращает количество изменённых строк `SupportedInterfaceLanguage`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(UPDATE_SUPPORTED_INTERFACE_LANGUAGE_QUERY, (row.name, row.code))
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_supported_interface_language(
+    connection: PooledConnectionType, code: str
+) -> int:
+    """delete_supported_interface_language удаляет строку.
+
+    *Возвращает количество удалённых строк `SupportedInterfaceLanguage`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_SUPPORTED_INTERFACE_LANGUAGE_QUERY, (code,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class TicketRow(BaseRow):
+    """TicketRow строка таблицы `Ticket`."""
+
+    __slots__ = (
+        "id",
+        "creator_user_id",
+        "status",
+        "subject",
+        "description",
+        "created_at",
+        "updated_at",
+    )
+
+    id: int
+    creator_user_id: int
+    status: Literal["open", "pending", "resolved", "closed"]
+    subject: str
+    description: str
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        id: int,
+        creator_user_id: int,
+        status: Literal["open", "pending", "resolved", "closed"],
+        subject: str,
+        description: str,
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> None:
+        self.id = id
+        self.creator_user_id = creator_user_id
+        self.status = status
+        self.subject = subject
+        self.description = description
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+SELECT_TICKET_BY_ID_QUERY: str = (
+    "SELECT `id`, `creator_user_id`, `status`, `subject`, `description`, `created_at`, "
+    "`updated_at` FROM `Ticket` WHERE `id` = %s"
+)
+
+SELECT_TICKET_BY_CREATOR_USER_ID_QUERY: str = (
+    "SELECT `id`, `creator_user_id`, `status`, `subject`, `description`, `created_at`, "
+    "`updated_at` FROM `Ticket` WHERE `creator_user_id` = %s"
+)
+
+INSERT_TICKET_QUERY: str = (
+    "INSERT INTO `Ticket` (`creator_user_id`, `status`, `subject`, `description`, "
+    "`created_at`, `updated_at`) VALUES (%s, %s, %s, %s, %s, %s)"
+)
+
+UPDATE_TICKET_QUERY: str = (
+    "UPDATE `Ticket` SET `creator_user_id` = %s, `status` = %s, `subject` = %s, "
+    "`description` = %s, `created_at` = %s, `updated_at` = %s WHERE `id` = %s"
+)
+
+DELETE_TICKET_QUERY: str = "DELETE FROM `Ticket` WHERE `id` = %s"
+
+
+# ----------------------------------------------------------------------------
+def select_ticket_by_id(
+    connection: PooledConnectionType, id: int
+) -> Optional[TicketRow]:
+    """select_ticket_by_id выбирает строку.
+
+    *Выборка `Ticket` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_TICKET_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else TicketRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_ticket_by_creator_user_id(
+    connection: PooledConnectionType, creator_user_id: int
+) -> List[TicketRow]:
+    """select_ticket_by_creator_user_id выбирает строки.
+
+    *Выборка `Ticket` по индексу `CreatorUserID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_TICKET_BY_CREATOR_USER_ID_QUERY, (creator_user_id,))
+
+        return [TicketRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def insert_ticket(connection: PooledConnectionType, row: TicketRow) -> int:
+    """insert_ticket добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `Ticket`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_TICKET_QUERY,
+            (
+                row.creator_user_id,
+                row.status,
+                row.subject,
+                row.description,
+                row.created_at,
+                row.updated_at,
+            ),
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_ticket(connection: PooledConnectionType, row: TicketRow) -> int:
+    """update_ticket изменяет строку.
+
+    *Возвращает количество изменённых строк `Ticket`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_TICKET_QUERY,
+            (
+                row.creator_user_id,
+                row.status,
+                row.subject,
+                row.description,
+                row.created_at,
+                row.updated_at,
+                row.id,
+            ),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_ticket(connection: PooledConnectionType, id: int) -> int:
+    """delete_ticket удаляет строку.
+
+    *Возвращает количество удалённых строк `Ticket`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_TICKET_QUERY, (id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class TicketSolutionRow(BaseRow):
+    """TicketSolutionRow строка таблицы `TicketSolution`."""
+
+    __slots__ = (
+        "ticket_id", "responsible_admin_id", "solution", "created_at", "updated_at"
+    )
+
+    ticket_id: int
+    responsible_admin_id: int
+    solution: str
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        ticket_id: int,
+        responsible_admin_id: int,
+        solution: str,
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> None:
+        self.ticket_id = ticket_id
+        self.responsible_admin_id = responsible_admin_id
+        self.solution = solution
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+SELECT_TICKET_SOLUTION_BY_TICKET_ID_QUERY: str = (
+    "SELECT `ticket_id`, `responsible_admin_id`, `solution`, `created_at`, "
+    "`updated_at` FROM `TicketSolution` WHERE `ticket_id` = %s"
+)
+
+SELECT_TICKET_SOLUTION_BY_RESPONSIBLE_ADMIN_ID_QUERY: str = (
+    "SELECT `ticket_id`, `responsible_admin_id`, `solution`, `created_at`, "
+    "`updated_at` FROM `TicketSolution` WHERE `responsible_admin_id` = %s"
+)
+
+INSERT_TICKET_SOLUTION_QUERY: str = (
+    "INSERT INTO `TicketSolution` (`ticket_id`, `responsible_admin_id`, `solution`, "
+    "`created_at`, `updated_at`) VALUES (%s, %s, %s, %s, %s)"
+)
+
+UPDATE_TICKET_SOLUTION_QUERY: str = (
+    "UPDATE `TicketSolution` SET `responsible_admin_id` = %s, `solution` = %s, "
+    "`created_at` = %s, `updated_at` = %s WHERE `ticket_id` = %s"
+)
+
+DELETE_TICKET_SOLUTION_QUERY: str = (
+    "DELETE FROM `TicketSolution` WHERE `ticket_id` = %s"
+)
+
+
+# ----------------------------------------------------------------------------
+def select_ticket_solution_by_ticket_id(
+    connection: PooledConnectionType, ticket_id: int
+) -> Optional[TicketSolutionRow]:
+    """select_ticket_solution_by_ticket_id выбирает строку.
+
+    *Выборка `TicketSolution` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_TICKET_SOLUTION_BY_TICKET_ID_QUERY, (ticket_id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else TicketSolutionRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_ticket_solution_by_responsible_admin_id(
+    connection: PooledConnectionType, responsible_admin_id: int
+) -> List[TicketSolutionRow]:
+    """select_ticket_solution_by_responsible_admin_id выбирает строки.
+
+    *Выборка `TicketSolution` по индексу `ResponsibleAdminID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            SELECT_TICKET_SOLUTION_BY_RESPONSIBLE_ADMIN_ID_QUERY,
+            (responsible_admin_id),
+        )
+
+        return [TicketSolutionRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def insert_ticket_solution(
+    connection: PooledConnectionType, row: TicketSolutionRow
+) -> None:
+    """insert_ticket_solution добавляет строку.
+
+    *Строка добавляется в таблицу `TicketSolution`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_TICKET_SOLUTION_QUERY,
+            (
+                row.ticket_id,
+                row.responsible_admin_id,
+                row.solution,
+                row.created_at,
+                row.updated_at,
+            ),
+        )
+
+
+# ----------------------------------------------------------------------------
+def update_ticket_solution(
+    connection: PooledConnectionType, row: TicketSolutionRow
+) -> int:
+    """update_ticket_solution изменяет строку.
+
+    *Возвращает количество изменённых строк `TicketSolution`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_TICKET_SOLUTION_QUERY,
+            (
+                row.responsible_admin_id,
+                row.solution,
+                row.created_at,
+                row.updated_at,
+                row.ticket_id,
+            ),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_ticket_solution(connection: PooledConnectionType, ticket_id: int) -> int:
+    """delete_ticket_solution удаляет строку.
+
+    *Возвращает количество удалённых строк `TicketSolution`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_TICKET_SOLUTION_QUERY, (ticket_id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class RequestEditProductRow(BaseRow):
+    """RequestEditProductRow строка таблицы `RequestEditProduct`."""
+
+    __slots__ = ("id", "product_id", "status", "created_at", "updated_at")
+
+    id: int
+    product_id: int
+    status: Literal["open", "pending", "closed", "canceled"]
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        id: int,
+        product_id: int,
+        status: Literal["open", "pending", "closed", "canceled"],
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> None:
+        self.id = id
+        self.product_id = product_id
+        self.status = status
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+SELECT_REQUEST_EDIT_PRODUCT_BY_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `status`, `created_at`, `updated_at` FROM "
+    "`RequestEditProduct` WHERE `id` = %s"
+)
+
+SELECT_REQUEST_EDIT_PRODUCT_BY_PRODUCT_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `status`, `created_at`, `updated_at` FROM "
+    "`RequestEditProduct` WHERE `product_id` = %s"
+)
+
+INSERT_REQUEST_EDIT_PRODUCT_QUERY: str = (
+    "INSERT INTO `RequestEditProduct` (`product_id`, `status`, `created_at`, "
+    "`updated_at`) VALUES (%s, %s, %s, %s)"
+)
+
+UPDATE_REQUEST_EDIT_PRODUCT_QUERY: str = (
+    "UPDATE `RequestEditProduct` SET `product_id` = %s, `status` = %s, "
+    "`created_at` = %s, `updated_at` = %s WHERE `id` = %s"
+)
+
+DELETE_REQUEST_EDIT_PRODUCT_QUERY: str = (
+    "DELETE FROM `RequestEditProduct` WHERE `id` = %s"
+)
+
+
+# ----------------------------------------------------------------------------
+def select_request_edit_product_by_id(
+    connection: PooledConnectionType, id: int
+) -> Optional[RequestEditProductRow]:
+    """select_request_edit_product_by_id выбирает строку.
+
+    *Выборка `RequestEditProduct` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_REQUEST_EDIT_PRODUCT_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else RequestEditProductRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_request_edit_product_by_product_id(
+    connection: PooledConnectionType, product_id: int
+) -> List[RequestEditProductRow]:
+    """select_request_edit_product_by_product_id выбирает строки.
+
+    *Выборка `RequestEditProduct` по индексу `ProductID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_REQUEST_EDIT_PRODUCT_BY_PRODUCT_ID_QUERY, (product_id,))
+
+        return [RequestEditProductRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def insert_request_edit_product(
+    connection: PooledConnectionType, row: RequestEditProductRow
+) -> int:
+    """insert_request_edit_product добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `RequestEditProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_REQUEST_EDIT_PRODUCT_QUERY,
+            (row.product_id, row.status, row.created_at, row.updated_at),
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_request_edit_product(
+    connection: PooledConnectionType, row: RequestEditProductRow
+) -> int:
+    """update_request_edit_product изменяет строку.
+
+    *Возвращает количество изменённых строк `RequestEditProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_REQUEST_EDIT_PRODUCT_QUERY,
+            (row.product_id, row.status, row.created_at, row.updated_at, row.id),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_request_edit_product(connection: PooledConnectionType, id: int) -> int:
+    """delete_request_edit_product удаляет строку.
+
+    *Возвращает количество удалённых строк `RequestEditProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_REQUEST_EDIT_PRODUCT_QUERY, (id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class EditProductDataRow(BaseRow):
+    """EditProductDataRow строка таблицы `EditProductData`."""
+
+    __slots__ = ("request_id", "new_title", "new_description", "new_image", "new_price")
+
+    request_id: int
+    new_title: Optional[str]
+    new_description: Optional[str]
+    new_image: Optional[bytes]
+    new_price: Optional[Decimal]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        request_id: int,
+        new_title: Optional[str],
+        new_description: Optional[str],
+        new_image: Optional[bytes],
+        new_price: Optional[Decimal],
+    ) -> None:
+        self.request_id = request_id
+        self.new_title = new_title
+        self.new_description = new_description
+        self.new_image = new_image
+        self.new_price = new_price
+
+
+SELECT_EDIT_PRODUCT_DATA_BY_REQUEST_ID_QUERY: str = (
+    "SELECT `request_id`, `new_title`, `new_description`, `new_image`, `new_price` "
+    "FROM `EditProductData` WHERE `request_id` = %s"
+)
+
+INSERT_EDIT_PRODUCT_DATA_QUERY: str = (
+    "INSERT INTO `EditProductData` (`request_id`, `new_title`, `new_description`, "
+    "`new_image`, `new_price`) VALUES (%s, %s, %s, %s, %s)"
+)
+
+UPDATE_EDIT_PRODUCT_DATA_QUERY: str = (
+    "UPDATE `EditProductData` SET `new_title` = %s, `new_description` = %s, "
+    "`new_image` = %s, `new_price` = %s WHERE `request_id` = %s"
+)
+
+DELETE_EDIT_PRODUCT_DATA_QUERY: str = (
+    "DELETE FROM `EditProductData` WHERE `request_id` = %s"
+)
+
+
+# ----------------------------------------------------------------------------
+def select_edit_product_data_by_request_id(
+    connection: PooledConnectionType, request_id: int
+) -> Optional[EditProductDataRow]:
+    """select_edit_product_data_by_request_id выбирает строку.
+
+    *Выборка `EditProductData` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_EDIT_PRODUCT_DATA_BY_REQUEST_ID_QUERY, (request_id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else EditProductDataRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def insert_edit_product_data(
+    connection: PooledConnectionType, row: EditProductDataRow
+) -> None:
+    """insert_edit_product_data добавляет строку.
+
+    *Строка добавляется в таблицу `EditProductData`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_EDIT_PRODUCT_DATA_QUERY,
+            (
+                row.request_id,
+                row.new_title,
+                row.new_description,
+                row.new_image,
+                row.new_price,
+            ),
+        )
+
+
+# ----------------------------------------------------------------------------
+def update_edit_product_data(
+    connection: PooledConnectionType, row: EditProductDataRow
+) -> int:
+    """update_edit_product_data изменяет строку.
+
+    *Возвращает количество изменённых строк `EditProductData`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_EDIT_PRODUCT_DATA_QUERY,
+            (
+                row.new_title,
+                row.new_description,
+                row.new_image,
+                row.new_price,
+                row.request_id,
+            ),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_edit_product_data(connection: PooledConnectionType, request_id: int) -> int:
+    """delete_edit_product_data удаляет строку.
+
+    *Возвращает количество удалённых строк `EditProductData`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_EDIT_PRODUCT_DATA_QUERY, (request_id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class RequestAddProductRow(BaseRow):
+    """RequestAddProductRow строка таблицы `RequestAddProduct`."""
+
+    __slots__ = (
+        "id", "service_id", "owner_user_id", "status", "created_at", "updated_at"
+    )
+
+    id: int
+    service_id: int
+    owner_user_id: int
+    status: Literal["open", "pending", "closed", "canceled"]
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        id: int,
+        service_id: int,
+        owner_user_id: int,
+        status: Literal["open", "pending", "closed", "canceled"],
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> None:
+        self.id = id
+        self.service_id = service_id
+        self.owner_user_id = owner_user_id
+        self.status = status
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+SELECT_REQUEST_ADD_PRODUCT_BY_ID_QUERY: str = (
+    "SELECT `id`, `service_id`, `owner_user_id`, `status`, `created_at`, `updated_at` "
+    "FROM `RequestAddProduct` WHERE `id` = %s"
+)
+
+SELECT_REQUEST_ADD_PRODUCT_BY_OWNER_USER_ID_QUERY: str = (
+    "SELECT `id`, `service_id`, `owner_user_id`, `status`, `created_at`, `updated_at` "
+    "FROM `RequestAddProduct` WHERE `owner_user_id` = %s"
+)
+
+SELECT_REQUEST_ADD_PRODUCT_BY_SERVICE_ID_QUERY: str = (
+    "SELECT `id`, `service_id`, `owner_user_id`, `status`, `created_at`, `updated_at` "
+    "FROM `RequestAddProduct` WHERE `service_id` = %s"
+)
+
+INSERT_REQUEST_ADD_PRODUCT_QUERY: str = (
+    "INSERT INTO `RequestAddProduct` (`service_id`, `owner_user_id`, `status`, "
+    "`created_at`, `updated_at`) VALUES (%s, %s, %s, %s, %s)"
+)
+
+UPDATE_REQUEST_ADD_PRODUCT_QUERY: str = (
+    "UPDATE `RequestAddProduct` SET `service_id` = %s, `owner_user_id` = %s, "
+    "`status` = %s, `created_at` = %s, `updated_at` = %s WHERE `id` = %s"
+)
+
+DELETE_REQUEST_ADD_PRODUCT_QUERY: str = (
+    "DELETE FROM `RequestAddProduct` WHERE `id` = %s"
+)
+
+
+# ----------------------------------------------------------------------------
+def select_request_add_product_by_id(
+    connection: PooledConnectionType, id: int
+) -> Optional[RequestAddProductRow]:
+    """select_request_add_product_by_id выбирает строку.
+
+    *Выборка `RequestAddProduct` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_REQUEST_ADD_PRODUCT_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else RequestAddProductRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_request_add_product_by_owner_user_id(
+    connection: PooledConnectionType, owner_user_id: int
+) -> List[RequestAddProductRow]:
+    """select_request_add_product_by_owner_user_id выбирает строки.
+
+    *Выборка `RequestAddProduct` по индексу `NewProductOwnerUserID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            SELECT_REQUEST_ADD_PRODUCT_BY_OWNER_USER_ID_QUERY, (owner_user_id,)
+        )
+
+        return [RequestAddProductRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def select_request_add_product_by_service_id(
+    connection: PooledConnectionType, service_id: int
+) -> List[RequestAddProductRow]:
+    """select_request_add_product_by_service_id выбирает строки.
+
+    *Выборка `RequestAddProduct` по индексу `ServiceID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_REQUEST_ADD_PRODUCT_BY_SERVICE_ID_QUERY, (service_id,))
+
+        return [RequestAddProductRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def insert_request_add_product(
+    connection: PooledConnectionType, row: RequestAddProductRow
+) -> int:
+    """insert_request_add_product добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `RequestAddProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_REQUEST_ADD_PRODUCT_QUERY,
+            (
+                row.service_id,
+                row.owner_user_id,
+                row.status,
+                row.created_at,
+                row.updated_at,
+            ),
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_request_add_product(
+    connection: PooledConnectionType, row: RequestAddProductRow
+) -> int:
+    """update_request_add_product изменяет строку.
+
+    *Возвращает количество изменённых строк `RequestAddProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_REQUEST_ADD_PRODUCT_QUERY,
+            (
+                row.service_id,
+                row.owner_user_id,
+                row.status,
+                row.created_at,
+                row.updated_at,
+                row.id,
+            ),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_request_add_product(connection: PooledConnectionType, id: int) -> int:
+    """delete_request_add_product удаляет строку.
+
+    *Возвращает количество удалённых строк `RequestAddProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_REQUEST_ADD_PRODUCT_QUERY, (id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class AddProductDataRow(BaseRow):
+    """AddProductDataRow строка таблицы `AddProductData`."""
+
+    __slots__ = ("request_id", "title", "description", "image", "price")
+
+    request_id: int
+    title: str
+    description: str
+    image: bytes
+    price: Decimal
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        request_id: int,
+        title: str,
+        description: str,
+        image: bytes,
+        price: Decimal,
+    ) -> None:
+        self.request_id = request_id
+        self.title = title
+        self.description = description
+        self.image = image
+        self.price = price
+
+
+SELECT_ADD_PRODUCT_DATA_BY_REQUEST_ID_QUERY: str = (
+    "SELECT `request_id`, `title`, `description`, `image`, `price` FROM "
+    "`AddProductData` WHERE `request_id` = %s"
+)
+
+INSERT_ADD_PRODUCT_DATA_QUERY: str = (
+    "INSERT INTO `AddProductData` (`request_id`, `title`, `description`, `image`, "
+    "`price`) VALUES (%s, %s, %s, %s, %s)"
+)
+
+UPDATE_ADD_PRODUCT_DATA_QUERY: str = (
+    "UPDATE `AddProductData` SET `title` = %s, `description` = %s, `image` = %s, "
+    "`price` = %s WHERE `request_id` = %s"
+)
+
+DELETE_ADD_PRODUCT_DATA_QUERY: str = (
+    "DELETE FROM `AddProductData` WHERE `request_id` = %s"
+)
+
+
+# ----------------------------------------------------------------------------
+def select_add_product_data_by_request_id(
+    connection: PooledConnectionType, request_id: int
+) -> Optional[AddProductDataRow]:
+    """select_add_product_data_by_request_id выбирает строку.
+
+    *Выборка `AddProductData` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_ADD_PRODUCT_DATA_BY_REQUEST_ID_QUERY, (request_id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else AddProductDataRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def insert_add_product_data(
+    connection: PooledConnectionType, row: AddProductDataRow
+) -> None:
+    """insert_add_product_data добавляет строку.
+
+    *Строка добавляется в таблицу `AddProductData`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_ADD_PRODUCT_DATA_QUERY,
+            (row.request_id, row.title, row.description, row.image, row.price),
+        )
+
+
+# ----------------------------------------------------------------------------
+def update_add_product_data(
+    connection: PooledConnectionType, row: AddProductDataRow
+) -> int:
+    """update_add_product_data изменяет строку.
+
+    *Возвращает количество изменённых строк `AddProductData`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_ADD_PRODUCT_DATA_QUERY,
+            (row.title, row.description, row.image, row.price, row.request_id),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_add_product_data(connection: PooledConnectionType, request_id: int) -> int:
+    """delete_add_product_data удаляет строку.
+
+    *Возвращает количество удалённых строк `AddProductData`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_ADD_PRODUCT_DATA_QUERY, (request_id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class RequestDeleteProductRow(BaseRow):
+    """RequestDeleteProductRow строка таблицы `RequestDeleteProduct`."""
+
+    __slots__ = ("id", "product_id", "status", "created_at", "updated_at")
+
+    id: int
+    product_id: int
+    status: Literal["open", "pending", "closed", "canceled"]
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        id: int,
+        product_id: int,
+        status: Literal["open", "pending", "closed", "canceled"],
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> None:
+        self.id = id
+        self.product_id = product_id
+        self.status = status
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+SELECT_REQUEST_DELETE_PRODUCT_BY_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `status`, `created_at`, `updated_at` FROM "
+    "`RequestDeleteProduct` WHERE `id` = %s"
+)
+
+SELECT_REQUEST_DELETE_PRODUCT_BY_PRODUCT_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `status`, `created_at`, `updated_at` FROM "
+    "`RequestDeleteProduct` WHERE `product_id` = %s"
+)
+
+INSERT_REQUEST_DELETE_PRODUCT_QUERY: str = (
+    "INSERT INTO `RequestDeleteProduct` (`product_id`, `status`, `created_at`, "
+    "`updated_at`) VALUES (%s, %s, %s, %s)"
+)
+
+UPDATE_REQUEST_DELETE_PRODUCT_QUERY: str = (
+    "UPDATE `RequestDeleteProduct` SET `product_id` = %s, `status` = %s, "
+    "`created_at` = %s, `updated_at` = %s WHERE `id` = %s"
+)
+
+DELETE_REQUEST_DELETE_PRODUCT_QUERY: str = (
+    "DELETE FROM `RequestDeleteProduct` WHERE `id` = %s"
+)
+
+
+# ----------------------------------------------------------------------------
+def select_request_delete_product_by_id(
+    connection: PooledConnectionType, id: int
+) -> Optional[RequestDeleteProductRow]:
+    """select_request_delete_product_by_id выбирает строку.
+
+    *Выборка `RequestDeleteProduct` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_REQUEST_DELETE_PRODUCT_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else RequestDeleteProductRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_request_delete_product_by_product_id(
+    connection: PooledConnectionType, product_id: int
+) -> List[RequestDeleteProductRow]:
+    """select_request_delete_product_by_product_id выбирает строки.
+
+    *Выборка `RequestDeleteProduct` по индексу `ProductID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_REQUEST_DELETE_PRODUCT_BY_PRODUCT_ID_QUERY, (product_id,))
+
+        return [RequestDeleteProductRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def insert_request_delete_product(
+    connection: PooledConnectionType, row: RequestDeleteProductRow
+) -> int:
+    """insert_request_delete_product добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `RequestDeleteProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_REQUEST_DELETE_PRODUCT_QUERY,
+            (row.product_id, row.status, row.created_at, row.updated_at),
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_request_delete_product(
+    connection: PooledConnectionType, row: RequestDeleteProductRow
+) -> int:
+    """update_request_delete_product изменяет строку.
+
+    *Возвращает количество изменённых строк `RequestDeleteProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_REQUEST_DELETE_PRODUCT_QUERY,
+            (row.product_id, row.status, row.created_at, row.updated_at, row.id),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_request_delete_product(connection: PooledConnectionType, id: int) -> int:
+    """delete_request_delete_product удаляет строку.
+
+    *Возвращает количество удалённых строк `RequestDeleteProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_REQUEST_DELETE_PRODUCT_QUERY, (id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class RequestBlockProductRow(BaseRow):
+    """RequestBlockProductRow строка таблицы `RequestBlockProduct`."""
+
+    __slots__ = ("id", "product_id", "status", "created_at", "updated_at")
+
+    id: int
+    product_id: int
+    status: Literal["open", "pending", "closed", "canceled"]
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        id: int,
+        product_id: int,
+        status: Literal["open", "pending", "closed", "canceled"],
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> None:
+        self.id = id
+        self.product_id = product_id
+        self.status = status
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+SELECT_REQUEST_BLOCK_PRODUCT_BY_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `status`, `created_at`, `updated_at` FROM "
+    "`RequestBlockProduct` WHERE `id` = %s"
+)
+
+SELECT_REQUEST_BLOCK_PRODUCT_BY_PRODUCT_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `status`, `created_at`, `updated_at` FROM "
+    "`RequestBlockProduct` WHERE `product_id` = %s"
+)
+
+INSERT_REQUEST_BLOCK_PRODUCT_QUERY: str = (
+    "INSERT INTO `RequestBlockProduct` (`product_id`, `status`, `created_at`, "
+    "`updated_at`) VALUES (%s, %s, %s, %s)"
+)
+
+UPDATE_REQUEST_BLOCK_PRODUCT_QUERY: str = (
+    "UPDATE `RequestBlockProduct` SET `product_id` = %s, `status` = %s, "
+    "`created_at` = %s, `updated_at` = %s WHERE `id` = %s"
+)
+
+DELETE_REQUEST_BLOCK_PRODUCT_QUERY: str = (
+    "DELETE FROM `RequestBlockProduct` WHERE `id` = %s"
+)
+
+
+# ----------------------------------------------------------------------------
+def select_request_block_product_by_id(
+    connection: PooledConnectionType, id: int
+) -> Optional[RequestBlockProductRow]:
+    """select_request_block_product_by_id выбирает строку.
+
+    *Выборка `RequestBlockProduct` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_REQUEST_BLOCK_PRODUCT_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else RequestBlockProductRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_request_block_product_by_product_id(
+    connection: PooledConnectionType, product_id: int
+) -> List[RequestBlockProductRow]:
+    """select_request_block_product_by_product_id выбирает строки.
+
+    *Выборка `RequestBlockProduct` по индексу `ProductID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_REQUEST_BLOCK_PRODUCT_BY_PRODUCT_ID_QUERY, (product_id,))
+
+        return [RequestBlockProductRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def insert_request_block_product(
+    connection: PooledConnectionType, row: RequestBlockProductRow
+) -> int:
+    """insert_request_block_product добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `RequestBlockProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_REQUEST_BLOCK_PRODUCT_QUERY,
+            (row.product_id, row.status, row.created_at, row.updated_at),
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_request_block_product(
+    connection: PooledConnectionType, row: RequestBlockProductRow
+) -> int:
+    """update_request_block_product изменяет строку.
+
+    *Возвращает количество изменённых строк `RequestBlockProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_REQUEST_BLOCK_PRODUCT_QUERY,
+            (row.product_id, row.status, row.created_at, row.updated_at, row.id),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_request_block_product(connection: PooledConnectionType, id: int) -> int:
+    """delete_request_block_product удаляет строку.
+
+    *Возвращает количество удалённых строк `RequestBlockProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_REQUEST_BLOCK_PRODUCT_QUERY, (id,))
+
+        return cursor.rowcount
+
+
+# _____________________________________________________________________________
+class RequestUnblockProductRow(BaseRow):
+    """RequestUnblockProductRow строка таблицы `RequestUnblockProduct`."""
+
+    __slots__ = ("id", "product_id", "status", "created_at", "updated_at")
+
+    id: int
+    product_id: int
+    status: Literal["open", "pending", "closed", "canceled"]
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        id: int,
+        product_id: int,
+        status: Literal["open", "pending", "closed", "canceled"],
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ) -> None:
+        self.id = id
+        self.product_id = product_id
+        self.status = status
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+SELECT_REQUEST_UNBLOCK_PRODUCT_BY_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `status`, `created_at`, `updated_at` FROM "
+    "`RequestUnblockProduct` WHERE `id` = %s"
+)
+
+SELECT_REQUEST_UNBLOCK_PRODUCT_BY_PRODUCT_ID_QUERY: str = (
+    "SELECT `id`, `product_id`, `status`, `created_at`, `updated_at` FROM "
+    "`RequestUnblockProduct` WHERE `product_id` = %s"
+)
+
+INSERT_REQUEST_UNBLOCK_PRODUCT_QUERY: str = (
+    "INSERT INTO `RequestUnblockProduct` (`product_id`, `status`, `created_at`, "
+    "`updated_at`) VALUES (%s, %s, %s, %s)"
+)
+
+UPDATE_REQUEST_UNBLOCK_PRODUCT_QUERY: str = (
+    "UPDATE `RequestUnblockProduct` SET `product_id` = %s, `status` = %s, "
+    "`created_at` = %s, `updated_at` = %s WHERE `id` = %s"
+)
+
+DELETE_REQUEST_UNBLOCK_PRODUCT_QUERY: str = (
+    "DELETE FROM `RequestUnblockProduct` WHERE `id` = %s"
+)
+
+
+# ----------------------------------------------------------------------------
+def select_request_unblock_product_by_id(
+    connection: PooledConnectionType, id: int
+) -> Optional[RequestUnblockProductRow]:
+    """select_request_unblock_product_by_id выбирает строку.
+
+    *Выборка `RequestUnblockProduct` по индексу `PRIMARY`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_REQUEST_UNBLOCK_PRODUCT_BY_ID_QUERY, (id,))
+
+        row = cursor.fetchone()
+
+    return None if row is None else RequestUnblockProductRow(*row)
+
+
+# ----------------------------------------------------------------------------
+def select_request_unblock_product_by_product_id(
+    connection: PooledConnectionType, product_id: int
+) -> List[RequestUnblockProductRow]:
+    """select_request_unblock_product_by_product_id выбирает строки.
+
+    *Выборка `RequestUnblockProduct` по индексу `ProductID_idx`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            SELECT_REQUEST_UNBLOCK_PRODUCT_BY_PRODUCT_ID_QUERY, (product_id,)
+        )
+
+        return [RequestUnblockProductRow(*row) for row in cursor.fetchall()]
+
+
+# ----------------------------------------------------------------------------
+def insert_request_unblock_product(
+    connection: PooledConnectionType, row: RequestUnblockProductRow
+) -> int:
+    """insert_request_unblock_product добавляет строку.
+
+    *Возвращает идентификатор добавленной строки `RequestUnblockProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_REQUEST_UNBLOCK_PRODUCT_QUERY,
+            (row.product_id, row.status, row.created_at, row.updated_at),
+        )
+
+        return cursor.lastrowid
+
+
+# ----------------------------------------------------------------------------
+def update_request_unblock_product(
+    connection: PooledConnectionType, row: RequestUnblockProductRow
+) -> int:
+    """update_request_unblock_product изменяет строку.
+
+    *Возвращает количество изменённых строк `RequestUnblockProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_REQUEST_UNBLOCK_PRODUCT_QUERY,
+            (row.product_id, row.status, row.created_at, row.updated_at, row.id),
+        )
+
+        return cursor.rowcount
+
+
+# ----------------------------------------------------------------------------
+def delete_request_unblock_product(connection: PooledConnectionType, id: int) -> int:
+    """delete_request_unblock_product удаляет строку.
+
+    *Возвращает количество удалённых строк `RequestUnblockProduct`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_REQUEST_UNBLOCK_PRODUCT_QUERY, (id,))
+
+        return cursor.rowcount
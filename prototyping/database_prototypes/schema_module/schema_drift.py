@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `schema_drift` сверяет столбцы таблиц БД со столбцами,
+для которых сгенерированы классы строк (см. `models_generator`).
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["find_schema_drift"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from typing import List, Mapping, Tuple
+
+from .types import PooledConnectionType
+
+
+# ----------------------------------------------------------------------------
+def find_schema_drift(
+    connection: PooledConnectionType, table_columns: Mapping[str, Tuple[str, ...]]
+) -> List[str]:
+    """find_schema_drift сверяет столбцы таблиц БД со сгенерированными.
+
+    *Столбцы читаются из описания результата пустой выборки,
+    поэтому проверка подходит для MySQL и SQLite.
+
+    Args:
+        connection (PooledConnectionType): Соединение из пула к проверяемой БД.
+        table_columns (Mapping[str, Tuple[str, ...]]): Ожидаемые столбцы таблиц
+                                                      (например, TABLE_COLUMNS).
+
+    Returns:
+        List[str]: Описания расхождений; пустой список, если расхождений нет.
+    """
+    problems: List[str] = []
+
+    for table, expected in table_columns.items():
+        with connection.cursor() as cursor:
+            try:
+                cursor.execute(f"SELECT * FROM `{table}` LIMIT 0")
+                cursor.fetchall()
+
+            # Драйверы MySQL и SQLite возбуждают разные классы ошибок.
+            except Exception as error:
+                problems.append(f"Таблица `{table}` недоступна: {error}")
+                continue
+
+            actual: Tuple[str, ...] = tuple(column[0] for column in cursor.description)
+
+        if actual != expected:
+            problems.append(
+                f"Столбцы таблицы `{table}` расходятся с моделью: "
+                f"ожидалось {expected}, получено {actual}"
+            )
+
+    return problems
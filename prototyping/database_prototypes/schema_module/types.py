@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль предназначен для хранения типов,
+используемых сгенерированными функциями запросов.
+"""
+
+__all__: list[str] = ["PooledConnectionType"]
+
+from typing import Union
+
+from ..mysql_database_module.types import MySQLPooledConnection
+from ..sqlite_database_module.sqlite_connection import SQLitePooledConnection
+
+
+# Аннотация для соединения из пула, над которым выполняются функции запросов.
+# *Запросы используют параметры `%s`, поэтому подходят для MySQL и SQLite.
+PooledConnectionType = Union[MySQLPooledConnection, SQLitePooledConnection]
@@ -0,0 +1,4 @@
+__all__: list[str] = ["AsyncSQLiteAPI", "AsyncSQLiteDataBase"]
+
+from .async_sqlite_database import AsyncSQLiteDataBase
+from .async_sqlite_database_api import AsyncSQLiteAPI
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `async_sqlite_database` реализует класс,
+который предоставляет абстракцию для работы над базой данных SQLite
+(в файле, либо в памяти процесса).
+
+БД не требует сервера, поэтому используется для тестов обработчиков и бенчмарков,
+а также для сравнения накладных расходов пула соединений с MySQL.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["AsyncSQLiteDataBase"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from ..database_module.abstract_async_database import AbstractAsyncDataBase
+
+import asyncio
+
+from typing import Any, Dict, Optional
+
+from .async_sqlite_database_api import AsyncSQLiteAPI
+from .schema import NEKOSHOP_SCHEMA_QUERIES
+from .sqlite_connection import (
+    AsyncSQLiteConnection,
+    SQLiteConnectionPool,
+    SQLitePooledConnection,
+    connect,
+    create_pool_name,
+)
+from .types import AsyncSQLiteConnectMethodType
+
+
+# _____________________________________________________________________________
+class AsyncSQLiteDataBase(
+    AbstractAsyncDataBase[
+        AsyncSQLiteAPI, AsyncSQLiteConnectMethodType, AsyncSQLiteConnection
+    ]
+):
+    """AsyncSQLiteDataBase класс для представления БД SQLite.
+
+    *Данная реализация родительского класса, как и AsyncMySQLDataBase,
+    интерпретируется использованием пула соединений и одиночного/независимого соединения.
+    Если в connection_data["database"] указан ":memory:", пул и независимое
+    соединение используют общую БД в памяти с именем пула; БД удаляется,
+    когда закрыты все её соединения. Без указанного имени пул получает
+    уникальное имя, поэтому разные объекты БД не разделяют одну БД в памяти.
+
+    Args:
+        AbstractAsyncDataBase: Базовый класс для реализации конкретного типа БД.
+
+    Attributes:
+        __pool (Optional[SQLiteConnectionPool]): Активный пул соединений к БД,
+                                                 либо None если пул ещё не открыт.
+        __pool_name (str): Именной идентификатор пула соединений.
+        __pool_size (int): Размер/количество доступных соединений пула.
+    """
+
+    __pool: Optional[SQLiteConnectionPool]
+    __pool_name: str
+    __pool_size: int
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        connection_data: Dict[str, Any],
+        api: AsyncSQLiteAPI,
+        connect_method: AsyncSQLiteConnectMethodType = connect,
+        pool_name: Optional[str] = None,
+        pool_size: int = 3,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            connection_data (Dict[str, Any]): Данные соединения: "database" - путь
+                                              к файлу БД, либо ":memory:";
+                                              "timeout" - время ожидания блокировки.
+            api (AsyncSQLiteAPI): Объект API для выполнения операций над БД.
+            connect_method (AsyncSQLiteConnectMethodType, optional): Функция независимого
+                                                                     подключения к БД.
+            pool_name (Optional[str], optional): Именной идентификатор пула соединений.
+                                                 По умолчанию уникальное имя.
+            pool_size (int, optional): Размер/количество доступных соединений пула.
+                                       По умолчанию 3.
+        """
+        super().__init__(
+            connect_method=connect_method,
+            connection_data=connection_data,
+            api=api,
+        )
+
+        self.__pool = None
+        self.__pool_name = pool_name or create_pool_name()
+        self.__pool_size = pool_size
+
+    # -------------------------------------------------------------------------
+    async def open_pool(self) -> SQLiteConnectionPool:
+        """open_pool открывает пул соединений к БД, если он ещё не открыт.
+
+        Returns:
+            SQLiteConnectionPool: Открытый пул соединений к БД.
+        """
+        if self.__pool is None:
+            self.__pool = await asyncio.to_thread(
+                SQLiteConnectionPool,
+                self._connection_data["database"],
+                self.__pool_name,
+                self.__pool_size,
+                self._connection_data.get("timeout", 5.0),
+            )
+
+        return self.__pool
+
+    # -------------------------------------------------------------------------
+    async def get_connect_method(self) -> AsyncSQLiteConnectMethodType:
+        """get_connect_method возвращает функцию для одиночного соединения к БД.
+
+        Returns:
+            AsyncSQLiteConnectMethodType: Функция, используемая для подключения к БД.
+        """
+        return self._connect_method
+
+    # -------------------------------------------------------------------------
+    async def create_connection_with_database(self) -> None:
+        """create_connection_with_database устанавливает независимое подключение к БД.
+
+        *Установленное подключение сохраняется в атрибуте `_connection_with_database`.
+        """
+        connect_method: AsyncSQLiteConnectMethodType = await self.get_connect_method()
+
+        self._connection_with_database = await connect_method(
+            name=self.__pool_name, **self._connection_data
+        )
+
+    # -------------------------------------------------------------------------
+    async def get_connection_with_database(self) -> AsyncSQLiteConnection:
+        """get_connection_with_database возвращает объект независимого подключения к БД.
+
+        *Если соединение не было создано,
+        тогда вызвается соответствующий метод для создания подключения к БД.
+
+        Returns:
+            AsyncSQLiteConnection: Объект подключения к БД.
+        """
+        if self._connection_with_database is None:
+            await self.create_connection_with_database()
+
+        return self._connection_with_database  # type: ignore
+
+    # -------------------------------------------------------------------------
+    async def close_connection_with_database(self) -> None:
+        """close_connection_with_database закрывает текущее независимое подключение к БД.
+
+        *Если соединение не было создано, метод ничего не делает.
+        Перед закрытием ожидаются операции, ожидающие в очереди API.
+        """
+        connection: Optional[AsyncSQLiteConnection] = self._connection_with_database
+
+        if connection is None:
+            return
+
+        await self.api.close_connection_channel()
+
+        self._connection_with_database = None
+
+        await connection.close()
+
+    # -------------------------------------------------------------------------
+    async def close_pool(self) -> None:
+        """close_pool закрывает свободные соединения пула."""
+        pool: Optional[SQLiteConnectionPool] = self.__pool
+
+        if pool is None:
+            return
+
+        self.__pool = None
+
+        await asyncio.to_thread(pool.close)
+
+    # -------------------------------------------------------------------------
+    async def connect_api_to_database(self) -> None:
+        """connect_api_to_database устанавливает подключение API к БД.
+
+        *Пул соединений и независимое соединение устанавливаются одновременно.
+        """
+        pool, connection_with_database = await asyncio.gather(
+            self.open_pool(), self.get_connection_with_database()
+        )
+
+        await self.api.set_up(
+            separate_connection=connection_with_database, pool=pool
+        )
+
+    # -------------------------------------------------------------------------
+    async def create_schema(self) -> None:
+        """create_schema создаёт таблицы схемы NekoShop, если они не существуют.
+
+        *API должен быть подключён к БД методом connect_api_to_database.
+        """
+
+        def transaction(connection: SQLitePooledConnection) -> None:
+            with connection.cursor() as cursor:
+                for query in NEKOSHOP_SCHEMA_QUERIES:
+                    cursor.execute(query)
+
+        await self.api.execute_transaction_use_pool(transaction)
@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `async_sqlite_database_api` предоставляет класс представляющий API,
+для взаимодействия над базой данных SQLite.
+
+*API повторяет AsyncMySQLAPI, поэтому функции-транзакции, написанные для MySQL
+(параметры `%s`, методы cursor, fetchone, fetchall, rowcount, lastrowid),
+выполняются без изменений, если используемый SQL поддерживается SQLite.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["AsyncSQLiteAPI"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from ..database_module.async_sql_database_api import (
+    AsyncSQLDataBaseAPI,
+)
+from ..database_module.async_sql_database_pool_api import (
+    AsyncSQLDataBasePoolAPI,
+)
+from ..database_module.separate_connection_channel import (
+    SeparateConnectionChannel,
+)
+
+import time
+import sqlite3
+import asyncio
+
+from typing import Awaitable, Callable, Dict, List, Optional
+from string import Template
+
+from .sqlite_connection import (
+    AsyncSQLiteConnection,
+    SQLiteConnectionPool,
+    SQLitePooledConnection,
+)
+from .types import TransactionObserverType
+
+
+class AsyncSQLiteAPI(
+    AsyncSQLDataBaseAPI[AsyncSQLiteConnection],
+    AsyncSQLDataBasePoolAPI[SQLiteConnectionPool, SQLitePooledConnection],
+):
+    """AsyncSQLiteAPI класс для представления API для БД SQLite.
+
+    Этот класс предназначен для представления API.
+    Он предоставляет асинхронные методы для управления соединениями пула и независимым соединением к БД.
+
+    *Независимое соединение используется для прямого подключения к БД.
+    Пул соединений используется для запросов приложения, использующего данный API.
+
+    Args:
+        AsyncSQLDataBaseAPI: Интерфейс для реализации API одиночного соединения.
+        AsyncSQLDataBasePoolAPI: Интерфейс для реализации API пула соединений.
+
+    Attributes:
+        __pool (SQLiteConnectionPool): Активный пул соединений к БД.
+        __connection_with_database (AsyncSQLiteConnection): Активное независимое подключение к БД.
+        __connection_channel (SeparateConnectionChannel): Очередь операций
+            над независимым подключением, выполняемых по порядку.
+        __fallback_queue_depth (Optional[int]): Глубина очереди независимого подключения,
+            начиная с которой запросы выполняются через пул.
+        __transaction_observer (Optional[TransactionObserverType]): Функция, получающая
+            замеры транзакций над пулом (например, для экспорта метрик).
+        __active_transactions_amount (int): Количество выполняющихся транзакций над пулом.
+    """
+
+    __pool: SQLiteConnectionPool
+    __connection_with_database: AsyncSQLiteConnection
+    __connection_channel: Optional[SeparateConnectionChannel[AsyncSQLiteConnection]] = None
+    __fallback_queue_depth: Optional[int]
+    __transaction_observer: Optional[TransactionObserverType] = None
+    __active_transactions_amount: int = 0
+
+    def __init__(self, fallback_queue_depth: Optional[int] = 16) -> None:
+        """__init__ конструктор.
+
+        Args:
+            fallback_queue_depth (Optional[int], optional): Глубина очереди независимого
+                подключения, начиная с которой запросы execute_sql_query_to_database
+                выполняются через пул. None - всегда ожидать очереди. По умолчанию 16.
+        """
+        self.__fallback_queue_depth = fallback_queue_depth
+
+    # -------------------------------------------------------------------------
+    async def set_up(
+        self,
+        separate_connection: AsyncSQLiteConnection,
+        pool: SQLiteConnectionPool,
+    ) -> None:
+        """set_up настраивает API.
+
+        Этот метод используется для первичной настройки API.
+        Вызывая соответствующие методы для установки независимого и пула соединений.
+
+        Args:
+            separate_connection (AsyncSQLiteConnection): Независимое соединение к БД.
+            pool (SQLiteConnectionPool): Пул соединений к БД.
+        """
+        await self.set_connection_with_database(connection=separate_connection)
+        await self.set_connection_to_pool(pool=pool)
+
+    # -------------------------------------------------------------------------
+    async def set_connection_to_pool(self, pool: SQLiteConnectionPool) -> None:
+        """set_connection_to_pool подключает пул соединений к API.
+
+        Args:
+            pool (SQLiteConnectionPool): Пул соединений к БД.
+        """
+        self.__pool = pool
+
+    # -------------------------------------------------------------------------
+    def set_transaction_observer(
+        self, observer: Optional[TransactionObserverType]
+    ) -> None:
+        """set_transaction_observer задаёт функцию, получающую замеры транзакций.
+
+        Args:
+            observer (Optional[TransactionObserverType]): Функция; None - отключить.
+        """
+        self.__transaction_observer = observer
+
+    # -------------------------------------------------------------------------
+    @property
+    def pool_size(self) -> int:
+        return self.__pool.pool_size
+
+    # -------------------------------------------------------------------------
+    @property
+    def active_transactions_amount(self) -> int:
+        return self.__active_transactions_amount
+
+    # -------------------------------------------------------------------------
+    @property
+    def connections_in_use_amount(self) -> int:
+        return self.__pool.connections_in_use_amount
+
+    # -------------------------------------------------------------------------
+    @property
+    def transaction_observer(self) -> Optional[TransactionObserverType]:
+        return self.__transaction_observer
+
+    # -------------------------------------------------------------------------
+    async def resize_pool(self, pool_size: int) -> int:
+        """resize_pool изменяет количество соединений пула.
+
+        *Соединения устанавливаются синхронно, поэтому в отдельном потоке.
+        Занятые соединения не закрываются, поэтому уменьшенный размер
+        может оказаться больше требуемого.
+
+        Args:
+            pool_size (int): Требуемый размер пула.
+
+        Returns:
+            int: Установленный размер пула.
+        """
+        return await asyncio.to_thread(self.__pool.resize, pool_size)
+
+    # -------------------------------------------------------------------------
+    async def set_connection_with_database(
+        self, connection: AsyncSQLiteConnection
+    ) -> None:
+        """set_connection_with_database устанавливает соединение к БД для API.
+
+        Args:
+            connection (AsyncSQLiteConnection): Независимое соединение к БД.
+        """
+        self.__connection_with_database = connection
+        self.__connection_channel = SeparateConnectionChannel(
+            connection=connection, fallback_queue_depth=self.__fallback_queue_depth
+        )
+
+    # -------------------------------------------------------------------------
+    async def execute_use_connection_with_database[ResultType](
+        self,
+        operation: Callable[[AsyncSQLiteConnection], Awaitable[ResultType]],
+        fallback: Optional[Callable[[], Awaitable[ResultType]]] = None,
+    ) -> ResultType:
+        """execute_use_connection_with_database выполняет операцию над независимым подключением.
+
+        Операции разных задач выполняются по очереди в порядке вызова,
+        поэтому запросы не перемешиваются на одном подключении.
+
+        Args:
+            operation (Callable[[AsyncSQLiteConnection], Awaitable[ResultType]]): Функция,
+                получающая независимое подключение и выполняющая запросы.
+            fallback (Optional[Callable[[], Awaitable[ResultType]]], optional): Вариант
+                операции через пул, выполняемый при заполненной очереди. По умолчанию None.
+
+        Returns:
+            ResultType: Результат операции.
+        """
+        return await self.__connection_channel.execute(  # type: ignore
+            operation=operation, fallback=fallback
+        )
+
+    # -------------------------------------------------------------------------
+    async def close_connection_channel(self) -> None:
+        """close_connection_channel ожидает операции над независимым подключением.
+
+        *Метод следует вызвать перед закрытием независимого подключения.
+        """
+        if self.__connection_channel is not None:
+            await self.__connection_channel.close()
+
+    # -------------------------------------------------------------------------
+    @property
+    def connection_queue_depth(self) -> int:
+        if self.__connection_channel is None:
+            return 0
+
+        return self.__connection_channel.queue_depth
+
+    # -------------------------------------------------------------------------
+    @property
+    def connection_fallback_amount(self) -> int:
+        if self.__connection_channel is None:
+            return 0
+
+        return self.__connection_channel.fallback_amount
+
+    # -------------------------------------------------------------------------
+    async def get_connection_with_database(self) -> AsyncSQLiteConnection:
+        """get_connection_with_database возвращает независимое подключение к БД.
+
+        Returns:
+            AsyncSQLiteConnection: Объект подключения к БД.
+        """
+        return self.__connection_with_database
+
+    # -------------------------------------------------------------------------
+    async def get_connection_from_pool(self) -> SQLitePooledConnection:
+        """get_connection_from_pool возвращает объект подключения к БД из пула.
+
+        *Соединения в пуле, являются синхронными.
+
+        Returns:
+            SQLitePooledConnection: Объект соединения к БД из пула.
+        """
+        return await asyncio.to_thread(self.__pool.get_connection)
+
+    # -------------------------------------------------------------------------
+    async def check_connection_with_database(self) -> bool:
+        """check_connection_with_database проверяет активность прямого подключения к БД.
+
+        Returns:
+            bool: True, если подключение активно; иначе False.
+        """
+
+        async def operation(connection: AsyncSQLiteConnection) -> bool:
+            return await connection.is_connected()
+
+        return await self.execute_use_connection_with_database(operation)
+
+    # -------------------------------------------------------------------------
+    async def close_connection_from_pool(
+        self, connection: SQLitePooledConnection
+    ) -> None:
+        """close_connection_from_pool возвращает соединение обратно в пул.
+
+        Args:
+            connection (SQLitePooledConnection): Объект соединения из пула.
+        """
+        connection.close()
+
+    # -------------------------------------------------------------------------
+    async def execute_sql_query_use_pool(
+        self,
+        query_template: Template,
+        query_data: Dict[str, str],
+    ) -> None:
+        """execute_sql_query_use_pool выполняет запрос к БД, используя соединение из пула.
+
+        Args:
+            query_template (Template): Шаблон строки запроса.
+            query_data (Dict[str, str]): Данные для подстановки в шаблон.
+        """
+        query_string: str = query_template.substitute(**query_data)
+
+        def transaction(connection: SQLitePooledConnection) -> None:
+            with connection.cursor() as cursor:
+                cursor.execute(query_string)
+
+        try:
+            await self.execute_transaction_use_pool(transaction)
+
+        except sqlite3.Error as error:
+            print(f"Возникла ошибка при выполнении запроса! {error}")
+
+    # -------------------------------------------------------------------------
+    async def execute_sql_query_to_database(
+        self, query_template: Template, query_data: Dict[str, str]
+    ) -> None:
+        """execute_sql_query_to_database выполняет запрос к БД, используя независимое соединение.
+
+        Args:
+            query_template (Template): Шаблон строки запроса.
+            query_data (Dict[str, str]): Данные для подстановки в шаблон.
+        """
+        query_string: str = query_template.substitute(**query_data)
+
+        async def operation(connection: AsyncSQLiteConnection) -> None:
+            try:
+                async with await connection.cursor() as cursor:
+                    await cursor.execute(query_string)
+
+                    await connection.commit()
+
+            except sqlite3.Error as error:
+                await connection.rollback()
+                print(f"Возникла ошибка при выполнении запроса! {error}")
+
+        async def fallback() -> None:
+            await self.execute_sql_query_use_pool(
+                query_template=query_template, query_data=query_data
+            )
+
+        await self.execute_use_connection_with_database(operation, fallback)
+
+    # -------------------------------------------------------------------------
+    async def execute_transaction_use_pool[ResultType](
+        self,
+        transaction: Callable[[SQLitePooledConnection], ResultType],
+    ) -> ResultType:
+        """execute_transaction_use_pool выполняет транзакцию над БД.
+
+        Этот метод выполняет функцию-транзакцию в отдельном потоке,
+        используя соединение из пула.
+
+        *При ошибке изменения откатываются, а исключение возбуждается повторно.
+
+        Args:
+            transaction (Callable[[SQLitePooledConnection], ResultType]): Функция,
+                получающая соединение из пула и выполняющая запросы.
+
+        Returns:
+            ResultType: Результат, возвращённый функцией-транзакцией.
+        """
+        timings: List[float] = [time.perf_counter()]
+        queued_at: float = timings[0]
+        error: Optional[BaseException] = None
+
+        self.__active_transactions_amount += 1
+
+        try:
+            return await asyncio.to_thread(self.__run_transaction, transaction, timings)
+
+        except BaseException as exception:
+            error = exception
+            raise
+
+        finally:
+            self.__active_transactions_amount -= 1
+
+            if self.__transaction_observer is not None:
+                self.__transaction_observer(
+                    timings[0] - queued_at, time.perf_counter() - timings[0], error
+                )
+
+    # -------------------------------------------------------------------------
+    def __run_transaction[ResultType](
+        self,
+        transaction: Callable[[SQLitePooledConnection], ResultType],
+        timings: List[float],
+    ) -> ResultType:
+        try:
+            connection: SQLitePooledConnection = self.__pool.get_connection()
+        finally:
+            timings[0] = time.perf_counter()
+
+        try:
+            connection.start_transaction()
+
+            result: ResultType = transaction(connection)
+
+            connection.commit()
+
+            return result
+
+        except Exception:
+            connection.rollback()
+            raise
+
+        finally:
+            connection.close()
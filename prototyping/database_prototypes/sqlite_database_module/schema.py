@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `schema` содержит схему БД NekoShop (Templates/DataBase/MainDataBaseModel.mwb),
+переведённую на диалект SQLite.
+
+Перечисления MySQL (ENUM) заменены ограничениями CHECK,
+DECIMAL и DATETIME преобразуются в Decimal и datetime при чтении.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["NEKOSHOP_SCHEMA_QUERIES"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from typing import Tuple
+
+
+_REQUEST_STATUSES: str = "('open', 'pending', 'closed', 'canceled')"
+
+
+# ----------------------------------------------------------------------------
+def _request_table(name: str, on_delete: str) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS `{name}` ("
+        "`id` INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "`product_id` INTEGER NOT NULL "
+        f"REFERENCES `Product` (`id`) ON DELETE {on_delete}, "
+        f"`status` TEXT NOT NULL DEFAULT 'open' CHECK (`status` IN {_REQUEST_STATUSES}), "
+        "`created_at` DATETIME NOT NULL, "
+        "`updated_at` DATETIME)"
+    )
+
+
+# Запросы перечислены в порядке зависимостей внешних ключей.
+NEKOSHOP_SCHEMA_QUERIES: Tuple[str, ...] = (
+    "CREATE TABLE IF NOT EXISTS `SupportedInterfaceLanguage` ("
+    "`code` VARCHAR(10) PRIMARY KEY, "
+    "`name` VARCHAR(60) NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS `User` ("
+    "`id` INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "`phone_number` VARCHAR(20) NOT NULL UNIQUE, "
+    "`email` VARCHAR(255) UNIQUE, "
+    "`is_email_notification` TINYINT NOT NULL DEFAULT 0, "
+    "`is_banned` TINYINT NOT NULL DEFAULT 0, "
+    "`is_admin` TINYINT NOT NULL DEFAULT 0, "
+    "`is_seller` TINYINT NOT NULL DEFAULT 0, "
+    "`interface_language_code` VARCHAR(10) NOT NULL "
+    "REFERENCES `SupportedInterfaceLanguage` (`code`) ON DELETE CASCADE)",
+    "CREATE INDEX IF NOT EXISTS `InterfaceLanguageCode_idx` "
+    "ON `User` (`interface_language_code`)",
+    "CREATE TABLE IF NOT EXISTS `Category` ("
+    "`id` INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "`name` VARCHAR(60) NOT NULL UNIQUE, "
+    "`description` VARCHAR(160) NOT NULL, "
+    "`is_blocked` TINYINT NOT NULL DEFAULT 0)",
+    "CREATE TABLE IF NOT EXISTS `Service` ("
+    "`id` INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "`category_id` INTEGER NOT NULL REFERENCES `Category` (`id`) ON DELETE CASCADE, "
+    "`name` VARCHAR(60) NOT NULL UNIQUE, "
+    "`description` VARCHAR(255) NOT NULL, "
+    "`image` BLOB NOT NULL, "
+    "`is_blocked` TINYINT NOT NULL DEFAULT 0)",
+    "CREATE INDEX IF NOT EXISTS `CategoryTypeID_idx` ON `Service` (`category_id`)",
+    "CREATE TABLE IF NOT EXISTS `Product` ("
+    "`id` INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "`owner_id` INTEGER NOT NULL REFERENCES `User` (`id`) ON DELETE CASCADE, "
+    "`service_id` INTEGER NOT NULL REFERENCES `Service` (`id`) ON DELETE CASCADE, "
+    "`title` VARCHAR(60) NOT NULL, "
+    "`description` VARCHAR(255) NOT NULL, "
+    "`image` BLOB NOT NULL, "
+    "`price` DECIMAL(6, 2) NOT NULL, "
+    "`is_blocked` TINYINT NOT NULL DEFAULT 0, "
+    "`quantity` INTEGER)",
+    "CREATE INDEX IF NOT EXISTS `ServiceID_idx` ON `Product` (`service_id`)",
+    "CREATE INDEX IF NOT EXISTS `OwnerID_idx` ON `Product` (`owner_id`)",
+    "CREATE TABLE IF NOT EXISTS `Order` ("
+    "`id` INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "`product_id` INTEGER NOT NULL REFERENCES `Product` (`id`), "
+    "`customer_user_id` INTEGER NOT NULL REFERENCES `User` (`id`), "
+    "`status` TEXT NOT NULL DEFAULT 'pending' "
+    "CHECK (`status` IN ('pending', 'canceled', 'refunded', 'completed')), "
+    "`total_price` DECIMAL(6, 2) NOT NULL, "
+    "`created_at` DATETIME NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS `OrdererUserID_idx` ON `Order` (`customer_user_id`)",
+    "CREATE INDEX IF NOT EXISTS `Order_ProductID_idx` ON `Order` (`product_id`)",
+    "CREATE TABLE IF NOT EXISTS `Ticket` ("
+    "`id` INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "`creator_user_id` INTEGER NOT NULL REFERENCES `User` (`id`), "
+    "`status` TEXT NOT NULL DEFAULT 'open' "
+    "CHECK (`status` IN ('open', 'pending', 'resolved', 'closed')), "
+    "`subject` VARCHAR(100) NOT NULL, "
+    "`description` TEXT NOT NULL, "
+    "`created_at` DATETIME NOT NULL, "
+    "`updated_at` DATETIME)",
+    "CREATE INDEX IF NOT EXISTS `CreatorUserID_idx` ON `Ticket` (`creator_user_id`)",
+    "CREATE TABLE IF NOT EXISTS `TicketSolution` ("
+    "`ticket_id` INTEGER PRIMARY KEY REFERENCES `Ticket` (`id`) ON DELETE CASCADE, "
+    "`responsible_admin_id` INTEGER NOT NULL REFERENCES `User` (`id`), "
+    "`solution` TEXT NOT NULL, "
+    "`created_at` DATETIME NOT NULL, "
+    "`updated_at` DATETIME)",
+    "CREATE INDEX IF NOT EXISTS `ResponsibleAdminID_idx` "
+    "ON `TicketSolution` (`responsible_admin_id`)",
+    _request_table(name="RequestEditProduct", on_delete="CASCADE"),
+    "CREATE TABLE IF NOT EXISTS `EditProductData` ("
+    "`request_id` INTEGER PRIMARY KEY "
+    "REFERENCES `RequestEditProduct` (`id`) ON DELETE CASCADE, "
+    "`new_title` VARCHAR(60), "
+    "`new_description` VARCHAR(255), "
+    "`new_image` BLOB, "
+    "`new_price` DECIMAL(6, 2))",
+    "CREATE TABLE IF NOT EXISTS `RequestAddProduct` ("
+    "`id` INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "`service_id` INTEGER NOT NULL REFERENCES `Service` (`id`), "
+    "`owner_user_id` INTEGER NOT NULL REFERENCES `User` (`id`), "
+    f"`status` TEXT NOT NULL DEFAULT 'open' CHECK (`status` IN {_REQUEST_STATUSES}), "
+    "`created_at` DATETIME NOT NULL, "
+    "`updated_at` DATETIME)",
+    "CREATE TABLE IF NOT EXISTS `AddProductData` ("
+    "`request_id` INTEGER PRIMARY KEY REFERENCES `RequestAddProduct` (`id`), "
+    "`title` VARCHAR(60) NOT NULL, "
+    "`description` VARCHAR(255) NOT NULL, "
+    "`image` BLOB NOT NULL, "
+    "`price` DECIMAL(6, 2) NOT NULL)",
+    _request_table(name="RequestDeleteProduct", on_delete="CASCADE"),
+    _request_table(name="RequestBlockProduct", on_delete="NO ACTION"),
+    _request_table(name="RequestUnblockProduct", on_delete="CASCADE"),
+)
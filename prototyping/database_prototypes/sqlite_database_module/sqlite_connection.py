@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `sqlite_connection` реализует соединения к SQLite,
+совместимые по используемым методам с соединениями MySQL Connector/Python:
+синхронный пул соединений для транзакций в отдельных потоках
+и асинхронное независимое соединение, выполняющее запросы в отдельном потоке.
+
+Запросы, написанные для MySQL, используют параметры `%s`,
+поэтому они заменяются на параметры SQLite `?` перед выполнением.
+
+*Если вместо пути к файлу указан ":memory:", используется общая БД в памяти (memdb),
+доступная всем соединениям процесса с тем же именем пула. Пул без указанного имени
+получает уникальное имя, поэтому такие пулы не используют одну БД.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "SQLiteCursor",
+    "SQLitePooledConnection",
+    "SQLiteConnectionPool",
+    "AsyncSQLiteCursor",
+    "AsyncSQLiteConnection",
+    "resolve_database",
+    "create_pool_name",
+    "connect",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import re
+import uuid
+import queue
+import sqlite3
+import asyncio
+import threading
+import datetime
+import functools
+
+from decimal import Decimal
+from types import TracebackType
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Type
+
+
+_PARAMETER_PATTERN = re.compile(r"%%|%s")
+
+# Соединения SQLite не преобразуют Decimal и datetime по умолчанию,
+# тогда как соединения MySQL возвращают эти типы для DECIMAL и DATETIME.
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_adapter(datetime.datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("DECIMAL", lambda value: Decimal(value.decode()))
+sqlite3.register_converter(
+    "DATETIME", lambda value: datetime.datetime.fromisoformat(value.decode())
+)
+
+
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=512)
+def _translate_query(query: str) -> str:
+    return _PARAMETER_PATTERN.sub(
+        lambda match: "%" if match.group() == "%%" else "?", query
+    )
+
+
+# ----------------------------------------------------------------------------
+def create_pool_name() -> str:
+    """create_pool_name возвращает уникальное имя пула (и общей БД в памяти).
+
+    Returns:
+        str: Имя вида "sqlite_pool_<uuid>".
+    """
+    return f"sqlite_pool_{uuid.uuid4().hex}"
+
+
+# ----------------------------------------------------------------------------
+def resolve_database(database: str, name: str) -> Tuple[str, bool]:
+    """resolve_database возвращает адрес БД для sqlite3.connect.
+
+    Args:
+        database (str): Путь к файлу БД, либо ":memory:".
+        name (str): Имя общей БД в памяти.
+
+    Returns:
+        Tuple[str, bool]: Адрес БД и является ли он URI.
+    """
+    if database == ":memory:":
+        return f"file:/{name}?vfs=memdb", True
+
+    return database, database.startswith("file:")
+
+
+# ----------------------------------------------------------------------------
+def _open_connection(database: str, uri: bool, timeout: float) -> sqlite3.Connection:
+    connection = sqlite3.connect(
+        database,
+        uri=uri,
+        timeout=timeout,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        isolation_level=None,
+        check_same_thread=False,
+    )
+    connection.execute("PRAGMA foreign_keys = ON")
+
+    if "vfs=memdb" not in database:
+        connection.execute("PRAGMA journal_mode = WAL")
+
+    return connection
+
+
+# ____________________________________________________________________________
+class SQLiteCursor:
+    """SQLiteCursor класс курсора, принимающего запросы с параметрами `%s`.
+
+    Attributes:
+        __cursor (sqlite3.Cursor): Курсор SQLite.
+    """
+
+    __cursor: sqlite3.Cursor
+
+    # -------------------------------------------------------------------------
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self.__cursor = cursor
+
+    # -------------------------------------------------------------------------
+    def __enter__(self) -> "SQLiteCursor":
+        return self
+
+    # -------------------------------------------------------------------------
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    @property
+    def rowcount(self) -> int:
+        return self.__cursor.rowcount
+
+    # -------------------------------------------------------------------------
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return self.__cursor.lastrowid
+
+    # -------------------------------------------------------------------------
+    @property
+    def description(self) -> Optional[Tuple[Tuple[Any, ...], ...]]:
+        return self.__cursor.description
+
+    # -------------------------------------------------------------------------
+    def execute(self, query: str, parameters: Sequence[Any] = ()) -> None:
+        self.__cursor.execute(_translate_query(query), tuple(parameters))
+
+    # -------------------------------------------------------------------------
+    def executemany(self, query: str, parameters: Iterable[Sequence[Any]]) -> None:
+        self.__cursor.executemany(_translate_query(query), parameters)
+
+    # -------------------------------------------------------------------------
+    def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        return self.__cursor.fetchone()
+
+    # -------------------------------------------------------------------------
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        return self.__cursor.fetchall()
+
+    # -------------------------------------------------------------------------
+    def close(self) -> None:
+        self.__cursor.close()
+
+
+# ____________________________________________________________________________
+class SQLitePooledConnection:
+    """SQLitePooledConnection класс соединения из пула SQLite.
+
+    *Метод close возвращает соединение в пул, а не закрывает его.
+
+    Attributes:
+        __connection (sqlite3.Connection): Соединение SQLite.
+        __pool (SQLiteConnectionPool): Пул, которому принадлежит соединение.
+        __is_released (bool): Возвращено ли соединение в пул.
+    """
+
+    __connection: sqlite3.Connection
+    __pool: "SQLiteConnectionPool"
+    __is_released: bool
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self, connection: sqlite3.Connection, pool: "SQLiteConnectionPool"
+    ) -> None:
+        self.__connection = connection
+        self.__pool = pool
+        self.__is_released = False
+
+    # -------------------------------------------------------------------------
+    def cursor(self) -> SQLiteCursor:
+        return SQLiteCursor(cursor=self.__connection.cursor())
+
+    # -------------------------------------------------------------------------
+    def start_transaction(self) -> None:
+        """start_transaction начинает транзакцию, сразу захватывая блокировку записи.
+
+        *Захват блокировки при начале транзакции исключает взаимную блокировку
+        транзакций, одновременно повышающих блокировку чтения до записи.
+        """
+        self.__connection.execute("BEGIN IMMEDIATE")
+
+    # -------------------------------------------------------------------------
+    def commit(self) -> None:
+        self.__connection.commit()
+
+    # -------------------------------------------------------------------------
+    def rollback(self) -> None:
+        self.__connection.rollback()
+
+    # -------------------------------------------------------------------------
+    def is_connected(self) -> bool:
+        try:
+            self.__connection.execute("SELECT 1")
+        except sqlite3.Error:
+            return False
+
+        return True
+
+    # -------------------------------------------------------------------------
+    def close(self) -> None:
+        if self.__is_released:
+            return
+
+        self.__is_released = True
+
+        if self.__connection.in_transaction:
+            self.__connection.rollback()
+
+        self.__pool.add_connection(connection=self.__connection)
+
+
+# ____________________________________________________________________________
+class SQLiteConnectionPool:
+    """SQLiteConnectionPool класс пула синхронных соединений к SQLite.
+
+    *Соединения создаются при создании пула, как в MySQLConnectionPool.
+
+    Attributes:
+        __pool_name (str): Именной идентификатор пула (и имя общей БД в памяти).
+        __pool_size (int): Количество соединений пула.
+        __timeout (float): Время ожидания свободного соединения и блокировки БД.
+        __address (str): Путь к файлу БД, либо URI общей БД в памяти.
+        __uri (bool): Является ли адрес URI.
+        __connections (queue.Queue[sqlite3.Connection]): Свободные соединения.
+        __lock (threading.Lock): Блокировка изменения размера пула.
+    """
+
+    __pool_name: str
+    __pool_size: int
+    __timeout: float
+    __address: str
+    __uri: bool
+    __connections: "queue.Queue[sqlite3.Connection]"
+    __lock: threading.Lock
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        database: str,
+        pool_name: Optional[str] = None,
+        pool_size: int = 3,
+        timeout: float = 5.0,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            database (str): Путь к файлу БД, либо ":memory:".
+            pool_name (Optional[str], optional): Именной идентификатор пула.
+                                                 По умолчанию уникальное имя.
+            pool_size (int, optional): Количество соединений пула. По умолчанию 3.
+            timeout (float, optional): Время ожидания свободного соединения
+                                       и блокировки БД. По умолчанию 5.0.
+
+        Raises:
+            ValueError: Возбуждается если размер пула меньше 1.
+        """
+        if pool_size < 1:
+            raise ValueError("Размер пула должен быть больше 0!")
+
+        self.__pool_name = pool_name or create_pool_name()
+        self.__pool_size = pool_size
+        self.__timeout = timeout
+        self.__connections = queue.Queue(maxsize=pool_size)
+        self.__lock = threading.Lock()
+
+        self.__address, self.__uri = resolve_database(
+            database=database, name=self.__pool_name
+        )
+
+        for _ in range(pool_size):
+            self.__connections.put_nowait(self.__open_connection())
+
+    # -------------------------------------------------------------------------
+    @property
+    def pool_name(self) -> str:
+        return self.__pool_name
+
+    # -------------------------------------------------------------------------
+    @property
+    def pool_size(self) -> int:
+        return self.__pool_size
+
+    # -------------------------------------------------------------------------
+    @property
+    def connections_in_use_amount(self) -> int:
+        return self.__pool_size - self.__connections.qsize()
+
+    # -------------------------------------------------------------------------
+    def get_connection(self) -> SQLitePooledConnection:
+        """get_connection возвращает свободное соединение, ожидая его при необходимости.
+
+        Raises:
+            TimeoutError: Возбуждается если свободное соединение не появилось за timeout.
+
+        Returns:
+            SQLitePooledConnection: Соединение из пула.
+        """
+        try:
+            connection: sqlite3.Connection = self.__connections.get(
+                timeout=self.__timeout
+            )
+        except queue.Empty:
+            raise TimeoutError(f"Нет свободных соединений в пуле {self.__pool_name}!")
+
+        return SQLitePooledConnection(connection=connection, pool=self)
+
+    # -------------------------------------------------------------------------
+    def add_connection(self, connection: sqlite3.Connection) -> None:
+        """add_connection возвращает соединение в пул."""
+        self.__connections.put_nowait(connection)
+
+    # -------------------------------------------------------------------------
+    def resize(self, pool_size: int) -> int:
+        """resize изменяет количество соединений пула.
+
+        *При уменьшении закрываются только свободные соединения;
+        если их меньше, чем требуется закрыть, пул уменьшается насколько возможно.
+
+        Args:
+            pool_size (int): Требуемый размер пула.
+
+        Raises:
+            ValueError: Возбуждается если размер пула меньше 1.
+
+        Returns:
+            int: Установленный размер пула.
+        """
+        if pool_size < 1:
+            raise ValueError("Размер пула должен быть больше 0!")
+
+        with self.__lock:
+            if pool_size > self.__pool_size:
+                connections: List[sqlite3.Connection] = [
+                    self.__open_connection()
+                    for _ in range(pool_size - self.__pool_size)
+                ]
+
+                with self.__connections.mutex:
+                    self.__connections.maxsize += len(connections)
+
+                for connection in connections:
+                    self.__connections.put_nowait(connection)
+
+                self.__pool_size += len(connections)
+
+            while self.__pool_size > pool_size:
+                try:
+                    connection = self.__connections.get_nowait()
+                except queue.Empty:
+                    break
+
+                with self.__connections.mutex:
+                    self.__connections.maxsize -= 1
+
+                connection.close()
+                self.__pool_size -= 1
+
+        return self.__pool_size
+
+    # -------------------------------------------------------------------------
+    def __open_connection(self) -> sqlite3.Connection:
+        return _open_connection(
+            database=self.__address, uri=self.__uri, timeout=self.__timeout
+        )
+
+    # -------------------------------------------------------------------------
+    def close(self) -> None:
+        """close закрывает свободные соединения пула."""
+        while True:
+            try:
+                self.__connections.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+# ____________________________________________________________________________
+class AsyncSQLiteCursor:
+    """AsyncSQLiteCursor класс асинхронного курсора независимого соединения.
+
+    Attributes:
+        __cursor (SQLiteCursor): Синхронный курсор.
+    """
+
+    __cursor: SQLiteCursor
+
+    # -------------------------------------------------------------------------
+    def __init__(self, cursor: SQLiteCursor) -> None:
+        self.__cursor = cursor
+
+    # -------------------------------------------------------------------------
+    async def __aenter__(self) -> "AsyncSQLiteCursor":
+        return self
+
+    # -------------------------------------------------------------------------
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.__cursor.close()
+
+    # -------------------------------------------------------------------------
+    @property
+    def rowcount(self) -> int:
+        return self.__cursor.rowcount
+
+    # -------------------------------------------------------------------------
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return self.__cursor.lastrowid
+
+    # -------------------------------------------------------------------------
+    async def execute(self, query: str, parameters: Sequence[Any] = ()) -> None:
+        await asyncio.to_thread(self.__cursor.execute, query, parameters)
+
+    # -------------------------------------------------------------------------
+    async def executemany(
+        self, query: str, parameters: Iterable[Sequence[Any]]
+    ) -> None:
+        await asyncio.to_thread(self.__cursor.executemany, query, list(parameters))
+
+    # -------------------------------------------------------------------------
+    async def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        return await asyncio.to_thread(self.__cursor.fetchone)
+
+    # -------------------------------------------------------------------------
+    async def fetchall(self) -> List[Tuple[Any, ...]]:
+        return await asyncio.to_thread(self.__cursor.fetchall)
+
+
+# ____________________________________________________________________________
+class AsyncSQLiteConnection:
+    """AsyncSQLiteConnection класс асинхронного независимого соединения к SQLite.
+
+    Запросы выполняются в отдельном потоке, не блокируя цикл событий.
+
+    Attributes:
+        __connection (Optional[sqlite3.Connection]): Соединение SQLite,
+                                                     либо None если оно закрыто.
+    """
+
+    __connection: Optional[sqlite3.Connection]
+
+    # -------------------------------------------------------------------------
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.__connection = connection
+
+    # -------------------------------------------------------------------------
+    async def cursor(self) -> AsyncSQLiteCursor:
+        return AsyncSQLiteCursor(cursor=SQLiteCursor(self.__get_connection().cursor()))
+
+    # -------------------------------------------------------------------------
+    async def commit(self) -> None:
+        await asyncio.to_thread(self.__get_connection().commit)
+
+    # -------------------------------------------------------------------------
+    async def rollback(self) -> None:
+        await asyncio.to_thread(self.__get_connection().rollback)
+
+    # -------------------------------------------------------------------------
+    async def is_connected(self) -> bool:
+        if self.__connection is None:
+            return False
+
+        try:
+            await asyncio.to_thread(self.__connection.execute, "SELECT 1")
+        except sqlite3.Error:
+            return False
+
+        return True
+
+    # -------------------------------------------------------------------------
+    async def close(self) -> None:
+        if self.__connection is not None:
+            connection, self.__connection = self.__connection, None
+            await asyncio.to_thread(connection.close)
+
+    # -------------------------------------------------------------------------
+    def __get_connection(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            raise sqlite3.ProgrammingError("Соединение к БД закрыто!")
+
+        return self.__connection
+
+
+# ----------------------------------------------------------------------------
+async def connect(
+    database: str, name: Optional[str] = None, timeout: float = 5.0
+) -> AsyncSQLiteConnection:
+    """connect устанавливает асинхронное независимое соединение к SQLite.
+
+    Args:
+        database (str): Путь к файлу БД, либо ":memory:".
+        name (Optional[str], optional): Имя общей БД в памяти, совпадающее
+                                        с именем пула. По умолчанию уникальное имя.
+        timeout (float, optional): Время ожидания блокировки БД. По умолчанию 5.0.
+
+    Returns:
+        AsyncSQLiteConnection: Открытое соединение.
+    """
+    address, uri = resolve_database(database=database, name=name or create_pool_name())
+
+    connection: sqlite3.Connection = await asyncio.to_thread(
+        _open_connection, address, uri, timeout
+    )
+
+    return AsyncSQLiteConnection(connection=connection)
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль предназначен для хранения кастомных типов,
+для обеспечения корректной аннотации в используемом коде.
+"""
+
+__all__: list[str] = [
+    "AsyncSQLiteConnectMethodType",
+    "TransactionObserverType",
+]
+
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional
+
+if TYPE_CHECKING:
+    from .sqlite_connection import AsyncSQLiteConnection
+
+
+# Аннотация для функции, используемой для установки асинхронного соединения к SQLite.
+AsyncSQLiteConnectMethodType = Callable[
+    ..., Coroutine[Any, Any, "AsyncSQLiteConnection"]
+]
+
+# Аннотация для функции, получающей замеры каждой транзакции над пулом:
+# (ожидание соединения в секундах, выполнение в секундах, исключение либо None).
+TransactionObserverType = Callable[[float, float, Optional[BaseException]], Any]
@@ -0,0 +1,5 @@
+__all__: list[str] = ["TicketEngine", "TicketPriorityQueue", "TimerWheel"]
+
+from .ticket_engine import TicketEngine
+from .ticket_queue import TicketPriorityQueue
+from .timer_wheel import TimerWheel
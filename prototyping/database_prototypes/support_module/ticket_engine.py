@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `ticket_engine` реализует планировщик обращений в поддержку,
+который хранит открытые обращения в очереди с приоритетом,
+отслеживает сроки реакции (SLA) с помощью колеса таймеров
+и записывает изменения статусов в БД пакетами.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["TicketEngine"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+
+from .ticket_queue import TicketPriorityQueue
+from .timer_wheel import TimerWheel
+
+
+_SELECT_OPEN_TICKETS_QUERY: str = (
+    "SELECT t.`id`, t.`created_at`, t.`subject`, u.`is_seller` "
+    "FROM `Ticket` AS t "
+    "JOIN `User` AS u ON u.`id` = t.`creator_user_id` "
+    "WHERE t.`status` = 'open'"
+)
+
+_UPDATE_STATUS_QUERY: str = (
+    "UPDATE `Ticket` SET `status` = %s, `updated_at` = NOW() WHERE `id` = %s"
+)
+
+_UPSERT_SOLUTION_QUERY: str = (
+    "INSERT INTO `TicketSolution` "
+    "(`ticket_id`, `responsible_admin_id`, `solution`, `created_at`) "
+    "VALUES (%s, %s, %s, NOW()) "
+    "ON DUPLICATE KEY UPDATE `responsible_admin_id` = VALUES(`responsible_admin_id`), "
+    "`solution` = VALUES(`solution`), `updated_at` = NOW()"
+)
+
+# Количество строк, читаемых из курсора за раз при загрузке обращений.
+_FETCH_CHUNK_SIZE: int = 1000
+
+
+# _____________________________________________________________________________
+class TicketEngine:
+    """TicketEngine класс планировщика обращений в поддержку.
+
+    Приоритет обращения вычисляется один раз при добавлении:
+    из времени создания вычитаются бонусы за уровень пользователя и категорию.
+    Поэтому обращения упорядочены по возрасту, а более важные обращения
+    обслуживаются так, будто были созданы раньше.
+
+    Для каждого ожидающего обращения устанавливается таймер SLA.
+    При его срабатывании обращение эскалируется: его приоритет повышается,
+    вызывается функция эскалации и устанавливается таймер следующего уровня.
+
+    Изменения статусов накапливаются в памяти и записываются одной транзакцией.
+    Повторные изменения одного обращения до записи объединяются.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+        __queue (TicketPriorityQueue): Очередь ожидающих обращений.
+        __timers (TimerWheel[int]): Колесо таймеров SLA.
+        __escalate (Callable[[int, int], Awaitable[None]]): Функция эскалации обращения.
+        __categorize (Callable[[str], int]): Функция определения категории по теме обращения.
+        __tier_weights (Dict[int, float]): Бонус в секундах для уровня пользователя.
+        __category_weights (Dict[int, float]): Бонус в секундах для категории.
+        __sla_seconds (Sequence[float]): Сроки реакции для каждого уровня эскалации.
+        __escalation_bonus (float): Бонус в секундах за каждый уровень эскалации.
+        __escalation_levels (Dict[int, int]): Уровень эскалации обращений.
+        __pending_statuses (Dict[int, str]): Статусы, ожидающие записи в БД.
+        __pending_solutions (Dict[int, Tuple[int, str]]): Решения, ожидающие записи в БД.
+        __flush_interval (float): Интервал записи изменений в БД.
+        __flush_task (Optional[asyncio.Task]): Фоновая задача записи изменений.
+    """
+
+    __api: AsyncMySQLAPI
+    __queue: TicketPriorityQueue
+    __timers: TimerWheel[int]
+    __escalate: Callable[[int, int], Awaitable[None]]
+    __categorize: Callable[[str], int]
+    __tier_weights: Dict[int, float]
+    __category_weights: Dict[int, float]
+    __sla_seconds: Sequence[float]
+    __escalation_bonus: float
+    __escalation_levels: Dict[int, int]
+    __pending_statuses: Dict[int, str]
+    __pending_solutions: Dict[int, Tuple[int, str]]
+    __flush_interval: float
+    __flush_task: Optional[asyncio.Task]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        api: AsyncMySQLAPI,
+        escalate: Callable[[int, int], Awaitable[None]],
+        categorize: Callable[[str], int] = lambda subject: 0,
+        tier_weights: Optional[Dict[int, float]] = None,
+        category_weights: Optional[Dict[int, float]] = None,
+        sla_seconds: Sequence[float] = (900.0, 3600.0, 14400.0),
+        escalation_bonus: float = 3600.0,
+        flush_interval: float = 1.0,
+        timer_tick_seconds: float = 1.0,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+            escalate (Callable[[int, int], Awaitable[None]]): Функция, получающая
+                идентификатор обращения и новый уровень эскалации.
+            categorize (Callable[[str], int], optional): Функция определения категории
+                по теме обращения. По умолчанию все обращения имеют категорию 0.
+            tier_weights (Optional[Dict[int, float]], optional): Бонус для уровня пользователя.
+                По умолчанию продавцы (уровень 1) получают бонус в один час.
+            category_weights (Optional[Dict[int, float]], optional): Бонус для категории.
+                По умолчанию бонусы не назначаются.
+            sla_seconds (Sequence[float], optional): Сроки реакции для уровней эскалации.
+            escalation_bonus (float, optional): Бонус за уровень эскалации. По умолчанию час.
+            flush_interval (float, optional): Интервал записи изменений. По умолчанию 1.0.
+            timer_tick_seconds (float, optional): Точность таймеров SLA. По умолчанию 1.0.
+        """
+        self.__api = api
+        self.__queue = TicketPriorityQueue()
+        self.__timers = TimerWheel(
+            on_expire=self.__on_sla_expired, tick_seconds=timer_tick_seconds
+        )
+        self.__escalate = escalate
+        self.__categorize = categorize
+        self.__tier_weights = {1: 3600.0} if tier_weights is None else tier_weights
+        self.__category_weights = {} if category_weights is None else category_weights
+        self.__sla_seconds = sla_seconds
+        self.__escalation_bonus = escalation_bonus
+        self.__escalation_levels = {}
+        self.__pending_statuses = {}
+        self.__pending_solutions = {}
+        self.__flush_interval = flush_interval
+        self.__flush_task = None
+
+    # -------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.__queue)
+
+    # -------------------------------------------------------------------------
+    async def start(self) -> None:
+        """start загружает открытые обращения и запускает фоновые задачи."""
+        rows: List[Tuple] = await self.__api.execute_transaction_use_pool(
+            self.__select_open_tickets
+        )
+
+        for ticket_id, created_at, subject, is_seller in rows:
+            self.admit(
+                ticket_id=ticket_id,
+                created_at=created_at,
+                tier=int(is_seller),
+                category=self.__categorize(subject),
+            )
+
+        self.__timers.start()
+        self.__flush_task = asyncio.get_running_loop().create_task(self.__run_flush())
+
+    # -------------------------------------------------------------------------
+    async def stop(self) -> None:
+        """stop останавливает фоновые задачи и записывает накопленные изменения."""
+        await self.__timers.stop()
+
+        if self.__flush_task is not None:
+            self.__flush_task.cancel()
+
+            try:
+                await self.__flush_task
+            except asyncio.CancelledError:
+                pass
+
+            self.__flush_task = None
+
+        await self.flush()
+
+    # -------------------------------------------------------------------------
+    def admit(
+        self, ticket_id: int, created_at: datetime, tier: int = 0, category: int = 0
+    ) -> None:
+        """admit добавляет открытое обращение в очередь и устанавливает таймер SLA.
+
+        Args:
+            ticket_id (int): Идентификатор обращения.
+            created_at (datetime): Дата и время создания обращения.
+            tier (int, optional): Уровень пользователя. По умолчанию 0.
+            category (int, optional): Категория обращения. По умолчанию 0.
+        """
+        score: float = (
+            created_at.timestamp()
+            - self.__tier_weights.get(tier, 0.0)
+            - self.__category_weights.get(category, 0.0)
+        )
+
+        self.__queue.push(ticket_id=ticket_id, score=score)
+
+        elapsed: float = max(0.0, datetime.now().timestamp() - created_at.timestamp())
+        self.__timers.schedule(
+            key=ticket_id, delay_seconds=self.__sla_seconds[0] - elapsed
+        )
+
+    # -------------------------------------------------------------------------
+    def take_next(self) -> Optional[int]:
+        """take_next извлекает обращение с наивысшим приоритетом для администратора.
+
+        Returns:
+            Optional[int]: Идентификатор обращения, либо None если очередь пуста.
+        """
+        ticket_id: Optional[int] = self.__queue.pop()
+
+        if ticket_id is not None:
+            self.__timers.cancel(key=ticket_id)
+            self.__escalation_levels.pop(ticket_id, None)
+            self.__pending_statuses[ticket_id] = "pending"
+
+        return ticket_id
+
+    # -------------------------------------------------------------------------
+    def resolve(self, ticket_id: int, admin_id: int, solution: str) -> None:
+        """resolve сохраняет решение обращения.
+
+        Args:
+            ticket_id (int): Идентификатор обращения.
+            admin_id (int): Идентификатор ответственного администратора.
+            solution (str): Текст решения.
+        """
+        self.__queue.remove(ticket_id=ticket_id)
+        self.__timers.cancel(key=ticket_id)
+        self.__escalation_levels.pop(ticket_id, None)
+
+        self.__pending_statuses[ticket_id] = "resolved"
+        self.__pending_solutions[ticket_id] = (admin_id, solution)
+
+    # -------------------------------------------------------------------------
+    def close(self, ticket_id: int) -> None:
+        """close закрывает обращение без решения.
+
+        Args:
+            ticket_id (int): Идентификатор обращения.
+        """
+        self.__queue.remove(ticket_id=ticket_id)
+        self.__timers.cancel(key=ticket_id)
+        self.__escalation_levels.pop(ticket_id, None)
+
+        self.__pending_statuses[ticket_id] = "closed"
+
+    # -------------------------------------------------------------------------
+    async def flush(self) -> None:
+        """flush записывает накопленные изменения в БД одной транзакцией."""
+        if not self.__pending_statuses and not self.__pending_solutions:
+            return
+
+        statuses: List[Tuple[str, int]] = [
+            (status, ticket_id) for ticket_id, status in self.__pending_statuses.items()
+        ]
+        solutions: List[Tuple[int, int, str]] = [
+            (ticket_id, admin_id, solution)
+            for ticket_id, (admin_id, solution) in self.__pending_solutions.items()
+        ]
+
+        self.__pending_statuses = {}
+        self.__pending_solutions = {}
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                if statuses:
+                    cursor.executemany(_UPDATE_STATUS_QUERY, statuses)
+
+                if solutions:
+                    cursor.executemany(_UPSERT_SOLUTION_QUERY, solutions)
+
+        try:
+            await self.__api.execute_transaction_use_pool(transaction)
+
+        except Exception:
+            # Неудачно записанные изменения возвращаются, если не были заменены новыми.
+            for status, ticket_id in statuses:
+                self.__pending_statuses.setdefault(ticket_id, status)
+
+            for ticket_id, admin_id, solution in solutions:
+                self.__pending_solutions.setdefault(ticket_id, (admin_id, solution))
+
+            raise
+
+    # -------------------------------------------------------------------------
+    async def __on_sla_expired(self, ticket_id: int) -> None:
+        """__on_sla_expired эскалирует обращение, срок реакции на которое истёк.
+
+        Args:
+            ticket_id (int): Идентификатор обращения.
+        """
+        score: Optional[float] = self.__queue.get_score(ticket_id=ticket_id)
+
+        if score is None:
+            return
+
+        level: int = self.__escalation_levels.get(ticket_id, 0) + 1
+        self.__escalation_levels[ticket_id] = level
+
+        self.__queue.push(ticket_id=ticket_id, score=score - self.__escalation_bonus)
+
+        if level < len(self.__sla_seconds):
+            self.__timers.schedule(key=ticket_id, delay_seconds=self.__sla_seconds[level])
+
+        await self.__escalate(ticket_id, level)
+
+    # -------------------------------------------------------------------------
+    async def __run_flush(self) -> None:
+        """__run_flush периодически записывает накопленные изменения в БД."""
+        while True:
+            await asyncio.sleep(self.__flush_interval)
+
+            try:
+                await self.flush()
+            except Exception as error:
+                print(f"Возникла ошибка при записи статусов обращений! {error}")
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def __select_open_tickets(connection: MySQLPooledConnection) -> List[Tuple]:
+        """__select_open_tickets читает открытые обращения частями.
+
+        Args:
+            connection (MySQLPooledConnection): Соединение из пула.
+
+        Returns:
+            List[Tuple]: Строки открытых обращений.
+        """
+        rows: List[Tuple] = []
+
+        with connection.cursor() as cursor:
+            cursor.execute(_SELECT_OPEN_TICKETS_QUERY)
+
+            while chunk := cursor.fetchmany(_FETCH_CHUNK_SIZE):
+                rows.extend(chunk)
+
+        return rows
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `ticket_queue` реализует очередь обращений в поддержку с приоритетом,
+основанную на двоичной куче с отложенным удалением элементов.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["TicketEntry", "TicketPriorityQueue"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import heapq
+
+from itertools import count
+
+from typing import Dict, Iterator, List, Optional
+
+
+# _____________________________________________________________________________
+class TicketEntry:
+    """TicketEntry класс элемента очереди обращений.
+
+    *Элемент хранит только необходимые для планирования поля,
+    поэтому объём памяти на одно обращение не зависит от его содержимого.
+
+    Attributes:
+        score (float): Приоритет обращения; меньшее значение обслуживается раньше.
+        sequence (int): Порядковый номер, упорядочивающий обращения с равным приоритетом.
+        ticket_id (int): Идентификатор обращения.
+        is_removed (bool): Признак удалённого из очереди элемента.
+    """
+
+    __slots__ = ("score", "sequence", "ticket_id", "is_removed")
+
+    score: float
+    sequence: int
+    ticket_id: int
+    is_removed: bool
+
+    # -------------------------------------------------------------------------
+    def __init__(self, score: float, sequence: int, ticket_id: int) -> None:
+        self.score = score
+        self.sequence = sequence
+        self.ticket_id = ticket_id
+        self.is_removed = False
+
+    # -------------------------------------------------------------------------
+    def __lt__(self, other: "TicketEntry") -> bool:
+        return (self.score, self.sequence) < (other.score, other.sequence)
+
+
+# _____________________________________________________________________________
+class TicketPriorityQueue:
+    """TicketPriorityQueue класс очереди обращений с приоритетом.
+
+    Добавление, извлечение и изменение приоритета выполняются за O(log n).
+    Удалённые элементы помечаются и отбрасываются при извлечении,
+    а при накоплении большого их числа куча перестраивается.
+
+    Attributes:
+        __heap (List[TicketEntry]): Двоичная куча элементов.
+        __entries (Dict[int, TicketEntry]): Актуальные элементы по идентификатору обращения.
+        __sequence (Iterator[int]): Счётчик порядковых номеров.
+    """
+
+    __heap: List[TicketEntry]
+    __entries: Dict[int, TicketEntry]
+    __sequence: Iterator[int]
+
+    # -------------------------------------------------------------------------
+    def __init__(self) -> None:
+        """__init__ конструктор."""
+        self.__heap = []
+        self.__entries = {}
+        self.__sequence = count()
+
+    # -------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    # -------------------------------------------------------------------------
+    def __contains__(self, ticket_id: int) -> bool:
+        return ticket_id in self.__entries
+
+    # -------------------------------------------------------------------------
+    def push(self, ticket_id: int, score: float) -> None:
+        """push добавляет обращение или изменяет его приоритет.
+
+        Args:
+            ticket_id (int): Идентификатор обращения.
+            score (float): Приоритет; меньшее значение обслуживается раньше.
+        """
+        self.remove(ticket_id=ticket_id)
+
+        entry = TicketEntry(
+            score=score, sequence=next(self.__sequence), ticket_id=ticket_id
+        )
+
+        self.__entries[ticket_id] = entry
+        heapq.heappush(self.__heap, entry)
+
+    # -------------------------------------------------------------------------
+    def remove(self, ticket_id: int) -> bool:
+        """remove удаляет обращение из очереди.
+
+        Args:
+            ticket_id (int): Идентификатор обращения.
+
+        Returns:
+            bool: True, если обращение находилось в очереди.
+        """
+        entry: Optional[TicketEntry] = self.__entries.pop(ticket_id, None)
+
+        if entry is None:
+            return False
+
+        entry.is_removed = True
+
+        # Перестроение кучи, когда удалённые элементы занимают большую её часть.
+        if len(self.__heap) > 2 * len(self.__entries) + 64:
+            self.__heap = [item for item in self.__heap if not item.is_removed]
+            heapq.heapify(self.__heap)
+
+        return True
+
+    # -------------------------------------------------------------------------
+    def get_score(self, ticket_id: int) -> Optional[float]:
+        """get_score возвращает приоритет обращения.
+
+        Args:
+            ticket_id (int): Идентификатор обращения.
+
+        Returns:
+            Optional[float]: Приоритет, либо None если обращения нет в очереди.
+        """
+        entry: Optional[TicketEntry] = self.__entries.get(ticket_id)
+
+        return None if entry is None else entry.score
+
+    # -------------------------------------------------------------------------
+    def peek(self) -> Optional[int]:
+        """peek возвращает обращение с наивысшим приоритетом, не извлекая его.
+
+        Returns:
+            Optional[int]: Идентификатор обращения, либо None если очередь пуста.
+        """
+        self.__discard_removed()
+
+        return self.__heap[0].ticket_id if self.__heap else None
+
+    # -------------------------------------------------------------------------
+    def pop(self) -> Optional[int]:
+        """pop извлекает обращение с наивысшим приоритетом.
+
+        Returns:
+            Optional[int]: Идентификатор обращения, либо None если очередь пуста.
+        """
+        self.__discard_removed()
+
+        if not self.__heap:
+            return None
+
+        entry: TicketEntry = heapq.heappop(self.__heap)
+        del self.__entries[entry.ticket_id]
+
+        return entry.ticket_id
+
+    # -------------------------------------------------------------------------
+    def __discard_removed(self) -> None:
+        """__discard_removed отбрасывает удалённые элементы с вершины кучи."""
+        while self.__heap and self.__heap[0].is_removed:
+            heapq.heappop(self.__heap)
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `timer_wheel` реализует хешированное колесо таймеров,
+которое обслуживает большое количество отложенных срабатываний
+одной фоновой задачей вместо отдельной задачи на каждый таймер.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["TimerWheel"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import math
+
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+# _____________________________________________________________________________
+class TimerWheel[KeyType]:
+    """TimerWheel класс хешированного колеса таймеров.
+
+    Колесо разделено на ячейки, каждая из которых соответствует одному тику.
+    Таймер помещается в ячейку по времени срабатывания и хранит количество
+    полных оборотов колеса, которое осталось пройти до срабатывания.
+
+    Установка и отмена таймера выполняются за O(1),
+    а на каждый тик обрабатывается только одна ячейка.
+
+    Attributes:
+        __tick_seconds (float): Длительность одного тика в секундах.
+        __slots (List[Dict[KeyType, int]]): Ячейки колеса: ключ таймера -> оставшиеся обороты.
+        __positions (Dict[KeyType, int]): Ячейка, в которой находится таймер.
+        __cursor (int): Текущая ячейка колеса.
+        __on_expire (Callable[[KeyType], Awaitable[None]]): Функция, вызываемая при срабатывании.
+        __task (Optional[asyncio.Task]): Фоновая задача, вращающая колесо.
+    """
+
+    __tick_seconds: float
+    __slots: List[Dict[KeyType, int]]
+    __positions: Dict[KeyType, int]
+    __cursor: int
+    __on_expire: Callable[[KeyType], Awaitable[None]]
+    __task: Optional[asyncio.Task]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        on_expire: Callable[[KeyType], Awaitable[None]],
+        tick_seconds: float = 1.0,
+        slots_amount: int = 512,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            on_expire (Callable[[KeyType], Awaitable[None]]): Функция, вызываемая
+                с ключом таймера при его срабатывании.
+            tick_seconds (float, optional): Длительность тика. По умолчанию 1.0.
+            slots_amount (int, optional): Количество ячеек колеса. По умолчанию 512.
+        """
+        self.__tick_seconds = tick_seconds
+        self.__slots = [{} for _ in range(slots_amount)]
+        self.__positions = {}
+        self.__cursor = 0
+        self.__on_expire = on_expire
+        self.__task = None
+
+    # -------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+    # -------------------------------------------------------------------------
+    def __contains__(self, key: KeyType) -> bool:
+        return key in self.__positions
+
+    # -------------------------------------------------------------------------
+    def schedule(self, key: KeyType, delay_seconds: float) -> None:
+        """schedule устанавливает таймер, заменяя ранее установленный с тем же ключом.
+
+        Args:
+            key (KeyType): Ключ таймера.
+            delay_seconds (float): Задержка до срабатывания в секундах.
+        """
+        self.cancel(key=key)
+
+        ticks: int = max(1, math.ceil(delay_seconds / self.__tick_seconds))
+        rounds, offset = divmod(ticks, len(self.__slots))
+
+        position: int = (self.__cursor + offset) % len(self.__slots)
+
+        if offset == 0:
+            rounds -= 1
+
+        self.__slots[position][key] = rounds
+        self.__positions[key] = position
+
+    # -------------------------------------------------------------------------
+    def cancel(self, key: KeyType) -> bool:
+        """cancel отменяет таймер.
+
+        Args:
+            key (KeyType): Ключ таймера.
+
+        Returns:
+            bool: True, если таймер был установлен.
+        """
+        position: Optional[int] = self.__positions.pop(key, None)
+
+        if position is None:
+            return False
+
+        del self.__slots[position][key]
+
+        return True
+
+    # -------------------------------------------------------------------------
+    def advance(self) -> List[KeyType]:
+        """advance поворачивает колесо на один тик.
+
+        Returns:
+            List[KeyType]: Ключи сработавших таймеров.
+        """
+        self.__cursor = (self.__cursor + 1) % len(self.__slots)
+
+        slot: Dict[KeyType, int] = self.__slots[self.__cursor]
+        expired: List[KeyType] = []
+        waiting: List[Tuple[KeyType, int]] = []
+
+        for key, rounds in slot.items():
+            if rounds == 0:
+                expired.append(key)
+            else:
+                waiting.append((key, rounds - 1))
+
+        for key in expired:
+            del slot[key]
+            del self.__positions[key]
+
+        for key, rounds in waiting:
+            slot[key] = rounds
+
+        return expired
+
+    # -------------------------------------------------------------------------
+    def start(self) -> None:
+        """start запускает фоновую задачу, вращающую колесо."""
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    # -------------------------------------------------------------------------
+    async def stop(self) -> None:
+        """stop останавливает фоновую задачу, сохраняя установленные таймеры."""
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+
+        self.__task = None
+
+    # -------------------------------------------------------------------------
+    async def __run(self) -> None:
+        """__run вращает колесо, учитывая время, затраченное на обработку тика."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        next_tick_at: float = loop.time() + self.__tick_seconds
+
+        while True:
+            await asyncio.sleep(max(0.0, next_tick_at - loop.time()))
+            next_tick_at += self.__tick_seconds
+
+            # Ошибка обработки одного таймера не должна останавливать колесо.
+            for key in self.advance():
+                try:
+                    await self.__on_expire(key)
+
+                except Exception as error:
+                    print(f"Возникла ошибка при срабатывании таймера {key}! {error}")
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_hot_table_archiver представляет из себя набор модульных тестов,
+для тестирования компонентов модуля hot_table_archiver.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from datetime import timedelta
+from typing import Any, Callable, List, Sequence, Tuple
+
+from mysql.connector.errors import Error as MySQLError
+
+from database_prototypes.archive_module.hot_table_archiver import *
+from database_prototypes.archive_module.types import ArchiveDependent, ArchivePolicy
+
+
+# ____________________________________________________________________________
+class FakeCursor:
+    """FakeCursor курсор, записывающий запросы и возвращающий заданные строки."""
+
+    def __init__(self, connection: "FakeConnection") -> None:
+        self.connection: FakeConnection = connection
+        self.rows: List[Tuple[Any, ...]] = []
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def execute(self, query: str, parameters: Sequence[Any] = ()) -> None:
+        self.connection.queries.append((query, tuple(parameters)))
+        self.rows = self.connection.respond(query, tuple(parameters))
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        return self.rows
+
+
+# ____________________________________________________________________________
+class FakeConnection:
+    """FakeConnection соединение, передающее запросы функции respond."""
+
+    def __init__(self, respond: Callable[[str, Tuple[Any, ...]], Any]) -> None:
+        self.respond: Callable[[str, Tuple[Any, ...]], Any] = respond
+        self.queries: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(connection=self)
+
+
+# ____________________________________________________________________________
+class FakeAPI:
+    """FakeAPI API, выполняющий транзакции над одним FakeConnection."""
+
+    def __init__(self, connection: FakeConnection) -> None:
+        self.connection: FakeConnection = connection
+
+    async def execute_transaction_use_pool(self, transaction: Callable) -> Any:
+        return transaction(self.connection)
+
+
+# ____________________________________________________________________________
+class BaseHotTableArchiverTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.candidates: List[Tuple[int]] = [(1,), (2,), (3,)]
+        self.locked: List[Tuple[int]] = [(1,), (3,)]
+        self.connection = FakeConnection(respond=self.respond)
+        self.policy = ArchivePolicy(
+            table="Ticket",
+            closed_statuses=("resolved", "closed"),
+            retention=timedelta(days=1),
+            dependents=(
+                ArchiveDependent(table="TicketSolution", key_column="ticket_id"),
+            ),
+        )
+        self.archiver = HotTableArchiver(
+            api=FakeAPI(connection=self.connection),  # type: ignore
+            policies=(self.policy,),
+            batch_size=3,
+        )
+
+    # -------------------------------------------------------------------------
+    def respond(self, query: str, parameters: Tuple[Any, ...]) -> List[Tuple[int]]:
+        if not query.startswith("SELECT `id` FROM `Ticket`"):
+            return []
+
+        return self.locked if "FOR UPDATE" in query else self.candidates
+
+    # -------------------------------------------------------------------------
+    def get_queries(self, prefix: str) -> List[Tuple[str, Tuple[Any, ...]]]:
+        return [item for item in self.connection.queries if item[0].startswith(prefix)]
+
+
+# ____________________________________________________________________________
+class TestHotTableArchiverPositive(BaseHotTableArchiverTestCase):
+    async def test_candidates_are_read_without_locks(self) -> None:
+        await self.archiver.archive_batch(policy=self.policy)
+
+        select_query, parameters = self.connection.queries[0]
+
+        self.assertNotIn(member="FOR UPDATE", container=select_query)
+        self.assertEqual(first=("resolved", "closed", 86400, 3), second=parameters)
+
+    # -------------------------------------------------------------------------
+    async def test_only_candidates_are_locked(self) -> None:
+        await self.archiver.archive_batch(policy=self.policy)
+
+        lock_query, parameters = self.connection.queries[1]
+
+        self.assertIn(member="`id` IN (%s, %s, %s)", container=lock_query)
+        self.assertIn(member="`status` IN (%s, %s)", container=lock_query)
+        self.assertIn(member="FOR UPDATE SKIP LOCKED", container=lock_query)
+        self.assertEqual(first=(1, 2, 3, "resolved", "closed"), second=parameters)
+
+    # -------------------------------------------------------------------------
+    async def test_locked_rows_are_moved_with_dependents(self) -> None:
+        archived: int = await self.archiver.archive_batch(policy=self.policy)
+
+        tables: List[str] = [
+            query.split("`")[1] for query, _ in self.connection.queries[2:]
+        ]
+
+        self.assertEqual(first=2, second=archived)
+        self.assertEqual(
+            first=[
+                "TicketSolutionArchive",
+                "TicketSolution",
+                "TicketArchive",
+                "Ticket",
+            ],
+            second=tables,
+        )
+        self.assertTrue(
+            all(parameters == (1, 3) for _, parameters in self.connection.queries[2:])
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_archive_table_stops_on_short_batch(self) -> None:
+        archived: int = await self.archiver.archive_table(policy=self.policy)
+
+        self.assertEqual(first=2, second=archived)
+        self.assertEqual(first=2, second=len(self.get_queries(prefix="SELECT `id`")))
+
+    # -------------------------------------------------------------------------
+    async def test_create_archive_tables_creates_index(self) -> None:
+        await self.archiver.create_archive_tables()
+
+        self.assertEqual(
+            first=1, second=len(self.get_queries(prefix="CREATE INDEX"))
+        )
+
+
+# ____________________________________________________________________________
+class TestHotTableArchiverNegative(BaseHotTableArchiverTestCase):
+    async def test_no_candidates(self) -> None:
+        self.candidates = []
+
+        archived: int = await self.archiver.archive_batch(policy=self.policy)
+
+        self.assertEqual(first=0, second=archived)
+        self.assertEqual(first=1, second=len(self.connection.queries))
+
+    # -------------------------------------------------------------------------
+    async def test_all_candidates_locked(self) -> None:
+        self.locked = []
+
+        archived: int = await self.archiver.archive_batch(policy=self.policy)
+
+        self.assertEqual(first=0, second=archived)
+        self.assertEqual(first=2, second=len(self.connection.queries))
+
+    # -------------------------------------------------------------------------
+    async def test_existing_index_is_ignored(self) -> None:
+        def respond(query: str, parameters: Tuple[Any, ...]) -> List[Any]:
+            if query.startswith("CREATE INDEX"):
+                raise MySQLError(msg="Duplicate key name", errno=1061)
+
+            return []
+
+        self.connection.respond = respond
+
+        await self.archiver.create_archive_tables()
+
+        self.assertTrue(
+            any(query.startswith("ALTER TABLE") for query, _ in self.connection.queries)
+        )
+
+    # -------------------------------------------------------------------------
+    def test_invalid_parameters(self) -> None:
+        with self.assertRaises(ValueError):
+            HotTableArchiver(api=None, batch_size=0)  # type: ignore
+
+        with self.assertRaises(ValueError):
+            HotTableArchiver(api=None, duty_cycle=1.5)  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_popularity_tracker представляет из себя набор модульных тестов,
+для тестирования компонентов модуля popularity_tracker.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import random
+import unittest
+
+from collections import Counter
+from typing import List, Tuple
+
+from database_prototypes.counters_module.popularity_tracker import *
+
+
+# ____________________________________________________________________________
+class BasePopularityTrackerTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tracker = PopularityTracker(size=2, width=64, depth=2)
+
+    # -------------------------------------------------------------------------
+    def get_indices(self, tracker: PopularityTracker, product_id: int) -> List[int]:
+        get_indices = tracker._PopularityTracker__get_indices  # type: ignore
+
+        return get_indices(product_id=product_id)
+
+    # -------------------------------------------------------------------------
+    def find_row_collision(self, tracker: PopularityTracker) -> Tuple[int, int]:
+        """find_row_collision находит товары, совпадающие только в первой строке."""
+        first_product_id: int = 1
+        first_indices: List[int] = self.get_indices(tracker, first_product_id)
+
+        for product_id in range(2, 100_000):
+            indices: List[int] = self.get_indices(tracker, product_id)
+
+            if indices[0] == first_indices[0] and indices[1] != first_indices[1]:
+                return first_product_id, product_id
+
+        raise AssertionError("Товары с совпадающим счётчиком не найдены!")
+
+
+# ____________________________________________________________________________
+class TestPopularityTrackerPositive(BasePopularityTrackerTestCase):
+    def test_top_keeps_most_popular(self) -> None:
+        for product_id, times in ((1, 3), (2, 2), (3, 1)):
+            for _ in range(times):
+                self.tracker.observe(product_id=product_id)
+
+        self.assertEqual(first=[(1, 3), (2, 2)], second=self.tracker.top())
+
+        self.tracker.observe(product_id=3, weight=3)
+
+        self.assertEqual(first=[(3, 4), (1, 3)], second=self.tracker.top())
+        self.assertEqual(first=[(3, 4)], second=self.tracker.top(limit=1))
+
+    # -------------------------------------------------------------------------
+    def test_conservative_update_increase_only_minimal_counters(self) -> None:
+        popular_id, rare_id = self.find_row_collision(tracker=self.tracker)
+        shared_index: int = self.get_indices(self.tracker, popular_id)[0]
+        rows = self.tracker._PopularityTracker__rows  # type: ignore
+
+        self.tracker.observe(product_id=popular_id, weight=5)
+
+        self.assertEqual(first=1, second=self.tracker.observe(product_id=rare_id))
+        # Обычный скетч увеличил бы общий счётчик до 6.
+        self.assertEqual(first=5, second=rows[0][shared_index])
+        self.assertEqual(first=5, second=self.tracker.estimate(product_id=popular_id))
+
+    # -------------------------------------------------------------------------
+    def test_estimate_never_below_exact_count(self) -> None:
+        tracker = PopularityTracker(size=5, width=16, depth=3)
+        generator = random.Random(42)
+        events: List[int] = [generator.randint(1, 200) for _ in range(2_000)]
+
+        for product_id in events:
+            tracker.observe(product_id=product_id)
+
+        for product_id, count in Counter(events).items():
+            self.assertGreaterEqual(
+                a=tracker.estimate(product_id=product_id), b=count
+            )
+
+    # -------------------------------------------------------------------------
+    def test_heap_pruned_to_top_entries(self) -> None:
+        for _ in range(100):
+            self.tracker.observe(product_id=1)
+            self.tracker.observe(product_id=2)
+
+        heap = self.tracker._PopularityTracker__heap  # type: ignore
+
+        self.assertLessEqual(a=len(heap), b=4 * self.tracker.size)
+        self.assertEqual(first=[(1, 100), (2, 100)], second=sorted(self.tracker.top()))
+
+    # -------------------------------------------------------------------------
+    def test_decay_halves_estimates(self) -> None:
+        self.tracker.observe(product_id=1, weight=8)
+        self.tracker.observe(product_id=2, weight=5)
+
+        self.tracker.decay()
+
+        self.assertEqual(first=4, second=self.tracker.estimate(product_id=1))
+        self.assertEqual(first=[(1, 4), (2, 2)], second=self.tracker.top())
+
+        # После уменьшения новые события вытесняют старые популярные товары.
+        self.tracker.observe(product_id=3, weight=3)
+
+        self.assertEqual(first=[(1, 4), (3, 3)], second=self.tracker.top())
+
+    # -------------------------------------------------------------------------
+    def test_seed_and_discard(self) -> None:
+        self.tracker.seed(scores=[(1, 10), (2, 7)])
+        self.tracker.discard(product_id=1)
+
+        self.assertEqual(first=[(2, 7)], second=self.tracker.top())
+
+        self.tracker.observe(product_id=3)
+
+        self.assertEqual(first=[(2, 7), (3, 1)], second=self.tracker.top())
+
+
+# ____________________________________________________________________________
+class TestPopularityTrackerNegative(BasePopularityTrackerTestCase):
+    def test_invalid_sizes(self) -> None:
+        for sizes in ((0, 1, 1), (1, 0, 1), (1, 1, 0)):
+            with self.subTest(sizes=sizes), self.assertRaises(ValueError):
+                PopularityTracker(*sizes)
+
+    # -------------------------------------------------------------------------
+    def test_less_popular_product_not_enter_full_top(self) -> None:
+        self.tracker.observe(product_id=1, weight=3)
+        self.tracker.observe(product_id=2, weight=3)
+
+        self.tracker.observe(product_id=3, weight=3)
+
+        self.assertEqual(first=[(1, 3), (2, 3)], second=self.tracker.top())
+        self.assertEqual(first=3, second=self.tracker.estimate(product_id=3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_product_counters представляет из себя набор модульных тестов,
+для тестирования компонентов модуля product_counters.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from database_prototypes.counters_module.product_counters import *
+from database_prototypes.counters_module.types import ProductCounterKind
+
+
+# ____________________________________________________________________________
+class FakeCursor:
+    """FakeCursor курсор, записывающий пакеты строк."""
+
+    def __init__(self, api: "FakeAPI") -> None:
+        self.api: FakeAPI = api
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def executemany(self, query: str, rows: Sequence[Tuple[int, ...]]) -> None:
+        self.api.batches.append(list(rows))
+
+
+# ____________________________________________________________________________
+class FakeAPI:
+    """FakeAPI API, выполняющий транзакцию после вызова on_transaction.
+
+    on_transaction имитирует события, поступающие во время записи,
+    а error - неудачную запись.
+    """
+
+    def __init__(self) -> None:
+        self.batches: List[List[Tuple[int, ...]]] = []
+        self.on_transaction: Optional[Callable[[], Any]] = None
+        self.error: Optional[Exception] = None
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(api=self)
+
+    async def execute_transaction_use_pool(self, transaction: Callable) -> Any:
+        await asyncio.sleep(0)
+
+        if self.on_transaction is not None:
+            self.on_transaction()
+
+        if self.error is not None:
+            raise self.error
+
+        return transaction(self)
+
+
+# ____________________________________________________________________________
+class BaseProductCountersTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.api = FakeAPI()
+        self.counters = ProductCounters(
+            api=self.api, flush_interval=3600.0  # type: ignore
+        )
+
+
+# ____________________________________________________________________________
+class TestProductCountersPositive(BaseProductCountersTestCase):
+    async def test_flush_writes_one_sorted_batch(self) -> None:
+        self.counters.increment(product_id=2, kind=ProductCounterKind.VIEWS)
+        self.counters.increment(product_id=1, kind=ProductCounterKind.CLICKS, amount=2)
+        self.counters.increment(product_id=2, kind=ProductCounterKind.ADD_TO_CART)
+
+        self.assertEqual(first=2, second=await self.counters.flush())
+        self.assertEqual(first=[[(1, 0, 2, 0), (2, 1, 0, 1)]], second=self.api.batches)
+        self.assertEqual(first=0, second=self.counters.pending_products_amount)
+
+    # -------------------------------------------------------------------------
+    async def test_increment_observed_by_popularity(self) -> None:
+        self.counters.increment(product_id=1, kind=ProductCounterKind.VIEWS)
+        self.counters.increment(product_id=2, kind=ProductCounterKind.ADD_TO_CART)
+
+        self.assertEqual(first=[(2, 10), (1, 1)], second=self.counters.popularity.top())
+
+    # -------------------------------------------------------------------------
+    async def test_stop_flushes_remaining_counts(self) -> None:
+        self.counters.start()
+        self.counters.increment(product_id=7, kind=ProductCounterKind.VIEWS, amount=3)
+        await asyncio.sleep(0)
+
+        await self.counters.stop()
+
+        self.assertEqual(first=[[(7, 3, 0, 0)]], second=self.api.batches)
+        self.assertEqual(first=0, second=self.counters.pending_products_amount)
+
+    # -------------------------------------------------------------------------
+    async def test_full_buffer_flushed_early(self) -> None:
+        counters = ProductCounters(
+            api=self.api, flush_interval=3600.0, max_pending_products=2  # type: ignore
+        )
+        counters.start()
+
+        counters.increment(product_id=1, kind=ProductCounterKind.VIEWS)
+        counters.increment(product_id=2, kind=ProductCounterKind.VIEWS)
+
+        for _ in range(10):
+            if self.api.batches:
+                break
+
+            await asyncio.sleep(0)
+
+        await counters.stop()
+
+        self.assertEqual(first=[[(1, 1, 0, 0), (2, 1, 0, 0)]], second=self.api.batches)
+
+
+# ____________________________________________________________________________
+class TestProductCountersNegative(BaseProductCountersTestCase):
+    async def test_failed_flush_merges_counts_back(self) -> None:
+        self.counters.increment(product_id=1, kind=ProductCounterKind.VIEWS, amount=2)
+        self.counters.increment(product_id=2, kind=ProductCounterKind.CLICKS)
+
+        def increment_during_write() -> None:
+            self.counters.increment(product_id=1, kind=ProductCounterKind.VIEWS)
+            self.counters.increment(product_id=3, kind=ProductCounterKind.ADD_TO_CART)
+
+        self.api.on_transaction = increment_during_write
+        self.api.error = ConnectionError("БД недоступна!")
+
+        with self.assertRaises(ConnectionError):
+            await self.counters.flush()
+
+        self.assertEqual(
+            first=(3, 1, 1),
+            second=(
+                self.counters.get_pending(product_id=1)[ProductCounterKind.VIEWS],
+                self.counters.get_pending(product_id=2)[ProductCounterKind.CLICKS],
+                self.counters.get_pending(product_id=3)[ProductCounterKind.ADD_TO_CART],
+            ),
+        )
+
+        self.api.on_transaction = None
+        self.api.error = None
+
+        self.assertEqual(first=3, second=await self.counters.flush())
+        self.assertEqual(
+            first=[[(1, 3, 0, 0), (2, 0, 1, 0), (3, 0, 0, 1)]], second=self.api.batches
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_stop_raises_when_final_flush_fails(self) -> None:
+        self.counters.start()
+        self.counters.increment(product_id=1, kind=ProductCounterKind.VIEWS)
+        self.api.error = ConnectionError("БД недоступна!")
+
+        with self.assertRaises(ConnectionError):
+            await self.counters.stop()
+
+        self.assertEqual(first=1, second=self.counters.pending_products_amount)
+
+    # -------------------------------------------------------------------------
+    def test_invalid_max_pending_products(self) -> None:
+        with self.assertRaises(ValueError):
+            ProductCounters(api=None, max_pending_products=0)  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_pool_autosizer представляет из себя набор модульных тестов,
+для тестирования компонентов модуля pool_autosizer.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from typing import Any, List, Optional, Tuple
+
+from database_prototypes.database_module.pool_autosizer import *
+
+
+# ____________________________________________________________________________
+class FakePoolAPI:
+    """FakePoolAPI API БД с пулом, размер которого изменяется мгновенно."""
+
+    def __init__(self, pool_size: int) -> None:
+        self.pool_size: int = pool_size
+        self.connections_in_use_amount: int = 0
+        self.transaction_observer: Optional[Any] = None
+        self.resizes: List[int] = []
+
+    def set_transaction_observer(self, observer: Optional[Any]) -> None:
+        self.transaction_observer = observer
+
+    async def resize_pool(self, pool_size: int) -> int:
+        self.resizes.append(pool_size)
+        self.pool_size = pool_size
+
+        return pool_size
+
+
+# ____________________________________________________________________________
+class BasePoolAutosizerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.api = FakePoolAPI(pool_size=4)
+        self.autosizer = PoolAutosizer(
+            api=self.api, min_size=2, max_size=8, shrink_after=3
+        )
+
+    # -------------------------------------------------------------------------
+    def sample(self, active: int, times: int = 1) -> None:
+        self.api.connections_in_use_amount = active
+
+        for _ in range(times):
+            self.autosizer.sample_utilization()
+
+    # -------------------------------------------------------------------------
+    async def evaluate_idle(self, times: int) -> List[Optional[PoolSizingDecision]]:
+        decisions: List[Optional[PoolSizingDecision]] = []
+
+        for _ in range(times):
+            self.sample(active=0)
+            decisions.append(await self.autosizer.evaluate())
+
+        return decisions
+
+
+# ____________________________________________________________________________
+class TestPoolAutosizerPositive(BasePoolAutosizerTestCase):
+    async def test_grow_on_wait(self) -> None:
+        self.autosizer.observe_transaction(
+            wait_seconds=0.05, duration_seconds=0.01, error=None
+        )
+
+        decision: Optional[PoolSizingDecision] = await self.autosizer.evaluate()
+
+        assert decision is not None
+        self.assertEqual(
+            first=("wait", 4, 6),
+            second=(decision.reason, decision.previous_size, decision.pool_size),
+        )
+        self.assertEqual(first=[6], second=self.api.resizes)
+
+    # -------------------------------------------------------------------------
+    async def test_grow_on_utilization(self) -> None:
+        self.sample(active=4, times=3)
+
+        decision: Optional[PoolSizingDecision] = await self.autosizer.evaluate()
+
+        assert decision is not None
+        self.assertEqual(first="utilization", second=decision.reason)
+        self.assertEqual(first=1.0, second=decision.utilization)
+
+    # -------------------------------------------------------------------------
+    async def test_grow_on_saturation(self) -> None:
+        self.autosizer.observe_transaction(
+            wait_seconds=0.0, duration_seconds=0.0, error=TimeoutError()
+        )
+
+        decision: Optional[PoolSizingDecision] = await self.autosizer.evaluate()
+
+        assert decision is not None
+        self.assertEqual(first="saturation", second=decision.reason)
+
+    # -------------------------------------------------------------------------
+    async def test_grow_is_capped_by_max_size(self) -> None:
+        self.api.pool_size = 7
+        self.sample(active=7)
+
+        decision: Optional[PoolSizingDecision] = await self.autosizer.evaluate()
+
+        assert decision is not None
+        self.assertEqual(first=8, second=decision.pool_size)
+
+        self.sample(active=8)
+
+        self.assertIsNone(await self.autosizer.evaluate())
+
+    # -------------------------------------------------------------------------
+    async def test_shrink_after_idle_streak(self) -> None:
+        decisions: List[Optional[PoolSizingDecision]] = await self.evaluate_idle(
+            times=3
+        )
+
+        self.assertEqual(first=[None, None], second=decisions[:2])
+        assert decisions[2] is not None
+        self.assertEqual(
+            first=("idle", 4, 3),
+            second=(
+                decisions[2].reason,
+                decisions[2].previous_size,
+                decisions[2].pool_size,
+            ),
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_shrink_stops_at_min_size(self) -> None:
+        await self.evaluate_idle(times=12)
+
+        self.assertEqual(first=2, second=self.api.pool_size)
+        self.assertEqual(first=[3, 2], second=self.api.resizes)
+
+    # -------------------------------------------------------------------------
+    async def test_no_shrink_right_after_grow(self) -> None:
+        self.sample(active=4)
+        await self.autosizer.evaluate()
+
+        # Окно очищено после увеличения, поэтому простой отсчитывается заново.
+        decisions: List[Optional[PoolSizingDecision]] = await self.evaluate_idle(
+            times=2
+        )
+
+        self.assertEqual(first=[None, None], second=decisions)
+        self.assertEqual(first=[6], second=self.api.resizes)
+
+    # -------------------------------------------------------------------------
+    async def test_moderate_load_resets_idle_streak(self) -> None:
+        await self.evaluate_idle(times=2)
+
+        self.sample(active=2, times=10)
+        self.assertIsNone(await self.autosizer.evaluate())
+
+        decisions: List[Optional[PoolSizingDecision]] = await self.evaluate_idle(
+            times=1
+        )
+
+        self.assertEqual(first=[None], second=decisions)
+        self.assertEqual(first=[], second=self.api.resizes)
+
+    # -------------------------------------------------------------------------
+    async def test_no_shrink_when_smaller_pool_would_grow_back(self) -> None:
+        autosizer = PoolAutosizer(
+            api=self.api,
+            min_size=1,
+            max_size=8,
+            low_utilization=0.5,
+            high_utilization=0.6,
+            shrink_after=1,
+        )
+        self.api.pool_size = 2
+        self.api.connections_in_use_amount = 1
+
+        for _ in range(4):
+            autosizer.sample_utilization()
+
+        self.api.connections_in_use_amount = 0
+        autosizer.sample_utilization()
+
+        # Загрузка 0.4 ниже порога, но на пуле из 1 соединения стала бы 0.8.
+        self.assertIsNone(await autosizer.evaluate())
+
+    # -------------------------------------------------------------------------
+    async def test_bounds_are_restored(self) -> None:
+        self.api.pool_size = 12
+
+        decision: Optional[PoolSizingDecision] = await self.autosizer.evaluate()
+
+        assert decision is not None
+        self.assertEqual(
+            first=("bounds", 8), second=(decision.reason, decision.pool_size)
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_decision_observer(self) -> None:
+        decisions: List[PoolSizingDecision] = []
+        self.autosizer.set_decision_observer(decisions.append)
+
+        self.sample(active=4)
+        decision: Optional[PoolSizingDecision] = await self.autosizer.evaluate()
+
+        self.assertEqual(first=[decision], second=decisions)
+        self.assertEqual(first=(decision,), second=self.autosizer.decisions)
+
+    # -------------------------------------------------------------------------
+    async def test_start_chains_previous_observer(self) -> None:
+        calls: List[Tuple[float, float, Optional[BaseException]]] = []
+
+        def previous(wait: float, duration: float, error: Any) -> None:
+            calls.append((wait, duration, error))
+
+        self.api.set_transaction_observer(previous)
+        self.autosizer.start()
+
+        self.api.transaction_observer(0.5, 0.1, None)  # type: ignore
+
+        await self.autosizer.stop()
+
+        self.assertEqual(first=[(0.5, 0.1, None)], second=calls)
+        self.assertIs(expr1=previous, expr2=self.api.transaction_observer)
+
+        decision: Optional[PoolSizingDecision] = await self.autosizer.evaluate()
+
+        assert decision is not None
+        self.assertEqual(first="wait", second=decision.reason)
+
+
+# ____________________________________________________________________________
+class TestPoolAutosizerNegative(BasePoolAutosizerTestCase):
+    def test_invalid_bounds(self) -> None:
+        with self.assertRaises(ValueError):
+            PoolAutosizer(api=self.api, min_size=4, max_size=2)
+
+        with self.assertRaises(ValueError):
+            PoolAutosizer(api=self.api, min_size=0, max_size=2)
+
+    # -------------------------------------------------------------------------
+    def test_invalid_thresholds(self) -> None:
+        with self.assertRaises(ValueError):
+            PoolAutosizer(
+                api=self.api,
+                min_size=1,
+                max_size=2,
+                low_utilization=0.9,
+                high_utilization=0.8,
+            )
+
+    # -------------------------------------------------------------------------
+    async def test_other_errors_are_not_saturation(self) -> None:
+        self.sample(active=2)
+        self.autosizer.observe_transaction(
+            wait_seconds=0.0, duration_seconds=0.0, error=ValueError()
+        )
+
+        self.assertIsNone(await self.autosizer.evaluate())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_separate_connection_channel представляет из себя набор модульных тестов,
+для тестирования компонентов модуля separate_connection_channel.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+
+from typing import Any, Awaitable, Callable, List
+
+from database_prototypes.database_module.separate_connection_channel import *
+
+
+# ____________________________________________________________________________
+class FakeConnection:
+    """FakeConnection соединение, обнаруживающее одновременные запросы."""
+
+    def __init__(self) -> None:
+        self.queries: List[str] = []
+        self.is_busy: bool = False
+        self.overlaps: int = 0
+
+    async def query(self, text: str, delay: float = 0.001) -> str:
+        if self.is_busy:
+            self.overlaps += 1
+
+        self.is_busy = True
+
+        try:
+            await asyncio.sleep(delay)
+            self.queries.append(text)
+
+        finally:
+            self.is_busy = False
+
+        return f"result {text}"
+
+
+# ____________________________________________________________________________
+class BaseSeparateConnectionChannelTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.connection = FakeConnection()
+        self.channel: SeparateConnectionChannel[FakeConnection] = (
+            SeparateConnectionChannel(
+                connection=self.connection, fallback_queue_depth=3
+            )
+        )
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.channel.close()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def make_operation(
+        text: str, delay: float = 0.001
+    ) -> Callable[[FakeConnection], Awaitable[str]]:
+        async def operation(connection: FakeConnection) -> str:
+            return await connection.query(text=text, delay=delay)
+
+        return operation
+
+
+# ____________________________________________________________________________
+class TestSeparateConnectionChannelPositive(BaseSeparateConnectionChannelTestCase):
+    async def test_concurrent_callers_served_in_fifo_order(self) -> None:
+        channel: SeparateConnectionChannel[FakeConnection] = SeparateConnectionChannel(
+            connection=self.connection, fallback_queue_depth=None
+        )
+        texts: List[str] = [f"query {index}" for index in range(10)]
+
+        results: List[str] = await asyncio.gather(
+            *(channel.execute(self.make_operation(text=text)) for text in texts)
+        )
+        await channel.close()
+
+        self.assertEqual(first=texts, second=self.connection.queries)
+        self.assertEqual(first=[f"result {text}" for text in texts], second=results)
+        self.assertEqual(first=0, second=self.connection.overlaps)
+
+    # -------------------------------------------------------------------------
+    async def test_fallback_used_above_queue_depth(self) -> None:
+        fallback_calls: List[str] = []
+
+        async def fallback() -> str:
+            fallback_calls.append("fallback")
+
+            return "result fallback"
+
+        blocked = asyncio.Event()
+
+        async def blocking_operation(connection: FakeConnection) -> str:
+            await blocked.wait()
+
+            return await connection.query(text="blocking")
+
+        first = asyncio.create_task(self.channel.execute(blocking_operation))
+        await asyncio.sleep(0)
+
+        queued: List[asyncio.Task] = [
+            asyncio.create_task(
+                self.channel.execute(self.make_operation(text=f"query {index}"))
+            )
+            for index in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        self.assertEqual(first=3, second=self.channel.queue_depth)
+        self.assertEqual(
+            first="result fallback",
+            second=await self.channel.execute(
+                self.make_operation(text="overflow"), fallback=fallback
+            ),
+        )
+
+        blocked.set()
+        await asyncio.gather(first, *queued)
+
+        self.assertEqual(first=["fallback"], second=fallback_calls)
+        self.assertEqual(first=1, second=self.channel.fallback_amount)
+        self.assertNotIn(member="overflow", container=self.connection.queries)
+
+    # -------------------------------------------------------------------------
+    async def test_fallback_not_used_below_queue_depth(self) -> None:
+        async def fallback() -> str:
+            return "result fallback"
+
+        self.assertEqual(
+            first="result query",
+            second=await self.channel.execute(
+                self.make_operation(text="query"), fallback=fallback
+            ),
+        )
+        self.assertEqual(first=0, second=self.channel.fallback_amount)
+
+    # -------------------------------------------------------------------------
+    async def test_close_drains_queued_operations(self) -> None:
+        tasks: List[asyncio.Task] = [
+            asyncio.create_task(
+                self.channel.execute(self.make_operation(text=f"query {index}"))
+            )
+            for index in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        await self.channel.close()
+
+        self.assertEqual(
+            first=["query 0", "query 1", "query 2"], second=self.connection.queries
+        )
+        self.assertTrue(expr=all(task.done() for task in tasks))
+        self.assertEqual(first=0, second=self.channel.queue_depth)
+
+    # -------------------------------------------------------------------------
+    async def test_execute_after_close_restart_writer(self) -> None:
+        await self.channel.execute(self.make_operation(text="before"))
+        await self.channel.close()
+
+        self.assertEqual(
+            first="result after",
+            second=await self.channel.execute(self.make_operation(text="after")),
+        )
+
+
+# ____________________________________________________________________________
+class TestSeparateConnectionChannelNegative(BaseSeparateConnectionChannelTestCase):
+    async def test_exception_propagated_to_its_caller_only(self) -> None:
+        async def failing_operation(_: FakeConnection) -> str:
+            raise ValueError("Ошибка запроса!")
+
+        results: List[Any] = await asyncio.gather(
+            self.channel.execute(self.make_operation(text="first")),
+            self.channel.execute(failing_operation),
+            self.channel.execute(self.make_operation(text="last")),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(first="result first", second=results[0])
+        self.assertIsInstance(obj=results[1], cls=ValueError)
+        self.assertEqual(first="result last", second=results[2])
+
+    # -------------------------------------------------------------------------
+    async def test_cancelled_before_start_not_executed(self) -> None:
+        blocked = asyncio.Event()
+
+        async def blocking_operation(connection: FakeConnection) -> str:
+            await blocked.wait()
+
+            return await connection.query(text="blocking")
+
+        first = asyncio.create_task(self.channel.execute(blocking_operation))
+        cancelled = asyncio.create_task(
+            self.channel.execute(self.make_operation(text="cancelled"))
+        )
+        last = asyncio.create_task(
+            self.channel.execute(self.make_operation(text="last"))
+        )
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        blocked.set()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled
+
+        await asyncio.gather(first, last)
+
+        self.assertEqual(first=["blocking", "last"], second=self.connection.queries)
+
+    # -------------------------------------------------------------------------
+    async def test_started_operation_completed_after_caller_cancelled(self) -> None:
+        task = asyncio.create_task(
+            self.channel.execute(self.make_operation(text="slow", delay=0.02))
+        )
+        await asyncio.sleep(0.005)
+
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        await self.channel.close()
+
+        self.assertEqual(first=["slow"], second=self.connection.queries)
+
+
+if __name__ == "__main__":
+    unittest.main()
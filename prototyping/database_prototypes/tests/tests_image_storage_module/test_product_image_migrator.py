@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_product_image_migrator представляет из себя набор модульных тестов,
+для тестирования компонентов модуля product_image_migrator.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
+
+from database_prototypes.image_storage_module.product_image_migrator import *
+
+
+# ____________________________________________________________________________
+class FakeProductTable:
+    """FakeProductTable таблица `Product` со строками, заблокированными извне.
+
+    Запрос без SKIP LOCKED снимает блокировку, как если бы транзакция,
+    удерживающая строку, завершилась за время ожидания.
+    """
+
+    def __init__(self, images: Dict[int, bytes]) -> None:
+        self.rows: Dict[int, List[Any]] = {
+            product_id: [image, None] for product_id, image in images.items()
+        }
+        self.locked: Set[int] = set()
+        self.queries: List[str] = []
+
+    def select_batch(
+        self, query: str, last_id: int, limit: int
+    ) -> List[Tuple[Any, ...]]:
+        self.queries.append(query)
+
+        if "SKIP LOCKED" not in query:
+            self.locked.clear()
+
+        return [
+            (product_id, image)
+            for product_id, (image, image_key) in sorted(self.rows.items())
+            if product_id > last_id
+            and image_key is None
+            and product_id not in self.locked
+        ][:limit]
+
+    def set_image_keys(self, updates: Sequence[Tuple[str, int]]) -> None:
+        for image_key, product_id in updates:
+            self.rows[product_id] = [b"", image_key]
+
+
+# ____________________________________________________________________________
+class FakeCursor:
+    """FakeCursor курсор, выполняющий запросы над FakeProductTable."""
+
+    def __init__(self, table: FakeProductTable) -> None:
+        self.table: FakeProductTable = table
+        self.rows: List[Tuple[Any, ...]] = []
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def execute(self, query: str, parameters: Sequence[Any] = ()) -> None:
+        self.rows = self.table.select_batch(query, *parameters)
+
+    def executemany(self, query: str, parameters: Sequence[Tuple[str, int]]) -> None:
+        self.table.set_image_keys(updates=parameters)
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        return self.rows
+
+
+# ____________________________________________________________________________
+class FakeConnection:
+    """FakeConnection соединение с FakeProductTable."""
+
+    def __init__(self, table: FakeProductTable) -> None:
+        self.table: FakeProductTable = table
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(table=self.table)
+
+
+# ____________________________________________________________________________
+class FakeAPI:
+    """FakeAPI API, выполняющий транзакции над одним FakeConnection."""
+
+    def __init__(self, table: FakeProductTable) -> None:
+        self.connection = FakeConnection(table=table)
+
+    async def execute_transaction_use_pool(self, transaction: Callable) -> Any:
+        return transaction(self.connection)
+
+
+# ____________________________________________________________________________
+class FakeStorage:
+    """FakeStorage хранилище изображений в памяти."""
+
+    def __init__(self) -> None:
+        self.images: Dict[str, bytes] = {}
+
+    def put_sync(self, image: bytes) -> str:
+        key: str = f"key-{image.decode()}"
+        self.images[key] = image
+
+        return key
+
+
+# ____________________________________________________________________________
+class BaseProductImageMigratorTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.table = FakeProductTable(
+            images={index: f"image-{index}".encode() for index in range(1, 8)}
+        )
+        self.storage = FakeStorage()
+        self.migrator = ProductImageMigrator(
+            api=FakeAPI(table=self.table),  # type: ignore
+            storage=self.storage,  # type: ignore
+            batch_size=2,
+        )
+
+    # -------------------------------------------------------------------------
+    def get_missing_keys(self) -> List[int]:
+        return [
+            product_id
+            for product_id, (_, image_key) in self.table.rows.items()
+            if image_key is None
+        ]
+
+
+# ____________________________________________________________________________
+class TestProductImageMigratorPositive(BaseProductImageMigratorTestCase):
+    async def test_all_images_migrated(self) -> None:
+        self.assertEqual(first=7, second=await self.migrator.run())
+        self.assertEqual(first=[], second=self.get_missing_keys())
+        self.assertEqual(first=7, second=len(self.storage.images))
+
+    # -------------------------------------------------------------------------
+    async def test_locked_rows_migrated_by_final_pass(self) -> None:
+        self.table.locked.update({2, 5})
+
+        self.assertEqual(first=7, second=await self.migrator.run())
+        self.assertEqual(first=[], second=self.get_missing_keys())
+        self.assertEqual(
+            first=("key-image-2", "key-image-5"),
+            second=(self.table.rows[2][1], self.table.rows[5][1]),
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_batch_skips_locked_rows(self) -> None:
+        self.table.locked.add(1)
+
+        self.assertEqual(first=2, second=await self.migrator.migrate_batch())
+        self.assertEqual(first=[1, 4, 5, 6, 7], second=self.get_missing_keys())
+        self.assertIn(member="SKIP LOCKED", container=self.table.queries[0])
+
+
+# ____________________________________________________________________________
+class TestProductImageMigratorNegative(BaseProductImageMigratorTestCase):
+    def test_invalid_batch_size(self) -> None:
+        with self.assertRaises(ValueError):
+            ProductImageMigrator(api=None, storage=None, batch_size=0)  # type: ignore
+
+    # -------------------------------------------------------------------------
+    async def test_empty_table_migrates_nothing(self) -> None:
+        self.table.rows.clear()
+
+        self.assertEqual(first=0, second=await self.migrator.run())
+        self.assertNotIn(member="SKIP LOCKED", container=self.table.queries[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_admin_assigner представляет из себя набор модульных тестов,
+для тестирования компонентов модуля admin_assigner.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from typing import List
+
+from database_prototypes.moderation_module.admin_assigner import *
+
+
+# ____________________________________________________________________________
+class BaseAdminAssignerTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        unittest.TestCase.setUp(self)
+
+        self.assigner = AdminAssigner(admin_ids=[10, 20, 30])
+
+
+# ____________________________________________________________________________
+class TestAdminAssignerPositive(BaseAdminAssignerTestCase):
+    def test_round_robin_on_equal_load(self) -> None:
+        admin_ids: List[int] = [self.assigner.assign() for _ in range(6)]
+
+        self.assertEqual(first=[10, 20, 30, 10, 20, 30], second=admin_ids)
+
+    # -------------------------------------------------------------------------
+    def test_least_loaded_admin_is_chosen(self) -> None:
+        for _ in range(3):
+            self.assigner.assign()
+
+        self.assigner.release(admin_id=20)
+
+        self.assertEqual(first=20, second=self.assigner.assign())
+        self.assertEqual(first=1, second=self.assigner.get_load(admin_id=20))
+
+    # -------------------------------------------------------------------------
+    def test_added_admin_gets_next_request(self) -> None:
+        for _ in range(3):
+            self.assigner.assign()
+
+        self.assigner.add_admin(admin_id=40)
+
+        self.assertEqual(first=40, second=self.assigner.assign())
+
+    # -------------------------------------------------------------------------
+    def test_removed_admin_gets_no_requests(self) -> None:
+        self.assigner.remove_admin(admin_id=10)
+
+        admin_ids: List[int] = [self.assigner.assign() for _ in range(4)]
+
+        self.assertNotIn(member=10, container=admin_ids)
+
+
+# ____________________________________________________________________________
+class TestAdminAssignerNegative(BaseAdminAssignerTestCase):
+    def test_no_admins(self) -> None:
+        with self.assertRaises(ValueError):
+            AdminAssigner(admin_ids=[])
+
+    # -------------------------------------------------------------------------
+    def test_assign_without_admins_returns_None(self) -> None:
+        for admin_id in (10, 20, 30):
+            self.assigner.remove_admin(admin_id=admin_id)
+
+        self.assertIsNone(self.assigner.assign())
+
+    # -------------------------------------------------------------------------
+    def test_release_without_load(self) -> None:
+        self.assigner.release(admin_id=10)
+        self.assigner.release(admin_id=99)
+
+        self.assertEqual(first=0, second=self.assigner.get_load(admin_id=10))
+        self.assertEqual(first=0, second=self.assigner.get_load(admin_id=99))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_moderation_queue представляет из себя набор модульных тестов,
+для тестирования компонентов модуля moderation_queue.
+
+*Вместо сервера MySQL используется поддельная БД, которая понимает
+запросы очереди и пропускает заблокированные строки только при SKIP LOCKED.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import re
+import asyncio
+import unittest
+
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from database_prototypes.moderation_module.admin_assigner import AdminAssigner
+from database_prototypes.moderation_module.moderation_queue import *
+from database_prototypes.moderation_module.types import (
+    ModerationRequest,
+    ModerationRequestKind,
+)
+
+
+# ____________________________________________________________________________
+class FakeModerationDatabase:
+    """FakeModerationDatabase БД, выполняющая запросы очереди модерации."""
+
+    def __init__(self) -> None:
+        self.now: datetime = datetime(2024, 1, 1)
+        self.tables: Dict[str, Dict[int, Dict[str, Any]]] = {
+            kind.value: {} for kind in ModerationRequestKind
+        }
+        # Строки, заблокированные транзакциями других обработчиков.
+        self.locked: Set[Tuple[str, int]] = set()
+        self.applied: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def add_request(
+        self, kind: ModerationRequestKind, request_id: int, product_id: Any = None
+    ) -> None:
+        self.tables[kind.value][request_id] = {
+            "status": "open",
+            "product_id": product_id,
+            "created_at": self.now + timedelta(microseconds=request_id),
+            "updated_at": self.now,
+        }
+
+    def get_status(self, kind: ModerationRequestKind, request_id: int) -> str:
+        return self.tables[kind.value][request_id]["status"]
+
+    def execute(self, query: str, parameters: Tuple[Any, ...]) -> List[Tuple]:
+        if query.startswith(("INSERT", "DELETE", "UPDATE `Product`")):
+            self.applied.append((query.split()[0], parameters))
+
+            return []
+
+        table_match = re.search(r"`(Request\w+)`", query)
+        assert table_match is not None, query
+        table: str = table_match.group(1)
+        rows: Dict[int, Dict[str, Any]] = self.tables[table]
+
+        if query.startswith("SELECT `id`, "):
+            return self.__claim(table=table, query=query, parameters=parameters)
+
+        if query.startswith("SELECT `id` FROM"):
+            row = rows.get(parameters[0])
+
+            return [(parameters[0],)] if row and row["status"] == "pending" else []
+
+        if "SET `status` = 'pending'" in query:
+            for request_id in parameters:
+                rows[request_id].update(status="pending", updated_at=self.now)
+
+        elif "SET `status` = 'open'" in query:
+            for request_id in parameters:
+                if rows[request_id]["status"] == "pending":
+                    rows[request_id].update(status="open", updated_at=self.now)
+
+        elif "SET `status` = %s" in query:
+            status, request_id = parameters
+            rows[request_id].update(status=status, updated_at=self.now)
+
+        else:
+            raise AssertionError(query)
+
+        return []
+
+    def __claim(
+        self, table: str, query: str, parameters: Tuple[Any, ...]
+    ) -> List[Tuple]:
+        if "'pending'" in query:
+            lease_seconds, limit = parameters
+            expired_before: datetime = self.now - timedelta(seconds=lease_seconds)
+            candidates = sorted(
+                (
+                    (row["updated_at"], request_id)
+                    for request_id, row in self.tables[table].items()
+                    if row["status"] == "pending" and row["updated_at"] < expired_before
+                )
+            )
+        else:
+            (limit,) = parameters
+            candidates = sorted(
+                (row["created_at"], request_id)
+                for request_id, row in self.tables[table].items()
+                if row["status"] == "open"
+            )
+
+        claimed: List[Tuple] = []
+
+        for _, request_id in candidates:
+            if len(claimed) == limit:
+                break
+
+            if (table, request_id) in self.locked:
+                if "SKIP LOCKED" not in query:
+                    raise TimeoutError("Lock wait timeout exceeded")
+
+                continue
+
+            row = self.tables[table][request_id]
+            product_id = None if "NULL" in query else row["product_id"]
+            claimed.append((request_id, product_id, row["created_at"]))
+
+        return claimed
+
+
+# ____________________________________________________________________________
+class FakeCursor:
+    def __init__(self, database: FakeModerationDatabase) -> None:
+        self.database = database
+        self.rows: List[Tuple] = []
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        pass
+
+    def execute(self, query: str, parameters: Tuple[Any, ...] = ()) -> None:
+        self.rows = self.database.execute(query=query, parameters=tuple(parameters))
+
+    def fetchall(self) -> List[Tuple]:
+        rows, self.rows = self.rows, []
+
+        return rows
+
+    def fetchone(self) -> Any:
+        return self.rows[0] if self.rows else None
+
+
+# ____________________________________________________________________________
+class FakeConnection:
+    def __init__(self, database: FakeModerationDatabase) -> None:
+        self.database = database
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(database=self.database)
+
+
+# ____________________________________________________________________________
+class FakeAPI:
+    def __init__(self, database: FakeModerationDatabase) -> None:
+        self.connection = FakeConnection(database=database)
+
+    async def execute_transaction_use_pool(self, transaction: Callable) -> Any:
+        return transaction(self.connection)
+
+
+# ____________________________________________________________________________
+class BaseModerationQueueTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.database = FakeModerationDatabase()
+        self.assigner = AdminAssigner(admin_ids=[10, 20])
+        self.notified: List[Tuple[int, ModerationRequest]] = []
+        self.failing_request_ids: Set[int] = set()
+        self.queue = ModerationQueue(
+            api=FakeAPI(database=self.database),  # type: ignore
+            assigner=self.assigner,
+            notify=self.notify,
+            batch_size=3,
+            lease_seconds=60,
+            poll_interval=0.01,
+        )
+
+    # -------------------------------------------------------------------------
+    async def notify(self, admin_id: int, request: ModerationRequest) -> None:
+        if request.request_id in self.failing_request_ids:
+            raise ConnectionError("Чат администратора недоступен!")
+
+        self.notified.append((admin_id, request))
+
+    # -------------------------------------------------------------------------
+    def add_requests(self, kind: ModerationRequestKind, amount: int) -> None:
+        for request_id in range(1, amount + 1):
+            self.database.add_request(
+                kind=kind, request_id=request_id, product_id=request_id * 100
+            )
+
+
+# ____________________________________________________________________________
+class TestModerationQueuePositive(BaseModerationQueueTestCase):
+    async def test_claim_batch_marks_requests_pending(self) -> None:
+        self.add_requests(kind=ModerationRequestKind.BLOCK_PRODUCT, amount=5)
+
+        requests: List[ModerationRequest] = await self.queue.claim_batch()
+
+        self.assertEqual(
+            first=[1, 2, 3], second=[request.request_id for request in requests]
+        )
+        self.assertEqual(first=100, second=requests[0].product_id)
+
+        for request_id in (1, 2, 3):
+            self.assertEqual(
+                first="pending",
+                second=self.database.get_status(
+                    kind=ModerationRequestKind.BLOCK_PRODUCT, request_id=request_id
+                ),
+            )
+
+        second_batch: List[ModerationRequest] = await self.queue.claim_batch()
+
+        self.assertEqual(
+            first=[4, 5], second=[request.request_id for request in second_batch]
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_claim_batch_skips_locked_requests(self) -> None:
+        self.add_requests(kind=ModerationRequestKind.ADD_PRODUCT, amount=4)
+        self.database.locked = {
+            (ModerationRequestKind.ADD_PRODUCT.value, 1),
+            (ModerationRequestKind.ADD_PRODUCT.value, 3),
+        }
+
+        requests: List[ModerationRequest] = await self.queue.claim_batch()
+
+        self.assertEqual(
+            first=[2, 4], second=[request.request_id for request in requests]
+        )
+        self.assertIsNone(requests[0].product_id)
+        self.assertEqual(
+            first="open",
+            second=self.database.get_status(
+                kind=ModerationRequestKind.ADD_PRODUCT, request_id=1
+            ),
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_expired_lease_claimed_before_open(self) -> None:
+        kind = ModerationRequestKind.DELETE_PRODUCT
+        self.database.add_request(kind=kind, request_id=1, product_id=100)
+        await self.queue.claim_batch()
+
+        self.database.now += timedelta(seconds=30)
+
+        self.assertEqual(first=[], second=await self.queue.claim_batch())
+
+        # Новая заявка создана раньше, но аренда первой уже истекла.
+        self.database.add_request(kind=kind, request_id=2, product_id=200)
+        self.database.tables[kind.value][2]["created_at"] = datetime(2023, 1, 1)
+        self.database.now += timedelta(seconds=31)
+
+        requests: List[ModerationRequest] = await self.queue.claim_batch()
+
+        self.assertEqual(
+            first=[1, 2], second=[request.request_id for request in requests]
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_approve_pending_request_applies_it(self) -> None:
+        self.add_requests(kind=ModerationRequestKind.BLOCK_PRODUCT, amount=1)
+        requests: List[ModerationRequest] = await self.queue.claim_batch()
+        await self.queue.dispatch(requests=requests)
+
+        self.assertTrue(expr=await self.queue.approve(request=requests[0]))
+        self.assertEqual(
+            first="closed",
+            second=self.database.get_status(
+                kind=ModerationRequestKind.BLOCK_PRODUCT, request_id=1
+            ),
+        )
+        self.assertEqual(first=[("UPDATE", (100,))], second=self.database.applied)
+        self.assertEqual(first=0, second=self.assigner.get_load(admin_id=10))
+
+    # -------------------------------------------------------------------------
+    async def test_reject_pending_request_cancels_it(self) -> None:
+        self.add_requests(kind=ModerationRequestKind.ADD_PRODUCT, amount=1)
+        requests: List[ModerationRequest] = await self.queue.claim_batch()
+
+        self.assertTrue(expr=await self.queue.reject(request=requests[0]))
+        self.assertEqual(
+            first="canceled",
+            second=self.database.get_status(
+                kind=ModerationRequestKind.ADD_PRODUCT, request_id=1
+            ),
+        )
+        self.assertEqual(first=[], second=self.database.applied)
+
+    # -------------------------------------------------------------------------
+    async def test_dispatch_assigns_requests_to_admins(self) -> None:
+        self.add_requests(kind=ModerationRequestKind.UNBLOCK_PRODUCT, amount=3)
+        requests: List[ModerationRequest] = await self.queue.claim_batch()
+
+        self.assertEqual(first=3, second=await self.queue.dispatch(requests=requests))
+        self.assertEqual(
+            first=[10, 20, 10], second=[admin_id for admin_id, _ in self.notified]
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_run_dispatches_until_stopped(self) -> None:
+        self.add_requests(kind=ModerationRequestKind.EDIT_PRODUCT, amount=4)
+        stop_event = asyncio.Event()
+
+        task = asyncio.create_task(self.queue.run(stop_event=stop_event))
+        await asyncio.sleep(0.05)
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1.0)
+
+        self.assertEqual(
+            first=[1, 2, 3, 4],
+            second=sorted(request.request_id for _, request in self.notified),
+        )
+
+
+# ____________________________________________________________________________
+class TestModerationQueueNegative(BaseModerationQueueTestCase):
+    async def test_approve_not_pending_request_returns_False(self) -> None:
+        self.add_requests(kind=ModerationRequestKind.BLOCK_PRODUCT, amount=1)
+        request = ModerationRequest(
+            kind=ModerationRequestKind.BLOCK_PRODUCT,
+            request_id=1,
+            product_id=100,
+            created_at=self.database.now,
+        )
+
+        self.assertFalse(expr=await self.queue.approve(request=request))
+
+        await self.queue.claim_batch()
+        await self.queue.approve(request=request)
+
+        self.assertFalse(expr=await self.queue.approve(request=request))
+        self.assertFalse(expr=await self.queue.reject(request=request))
+        self.assertEqual(first=1, second=len(self.database.applied))
+
+    # -------------------------------------------------------------------------
+    async def test_failed_notify_reopens_request(self) -> None:
+        self.add_requests(kind=ModerationRequestKind.DELETE_PRODUCT, amount=2)
+        self.failing_request_ids = {2}
+        requests: List[ModerationRequest] = await self.queue.claim_batch()
+
+        self.assertEqual(first=1, second=await self.queue.dispatch(requests=requests))
+        self.assertEqual(
+            first="open",
+            second=self.database.get_status(
+                kind=ModerationRequestKind.DELETE_PRODUCT, request_id=2
+            ),
+        )
+        self.assertEqual(first=0, second=self.assigner.get_load(admin_id=20))
+
+        self.failing_request_ids = set()
+        reclaimed: List[ModerationRequest] = await self.queue.claim_batch()
+
+        self.assertEqual(
+            first=[2], second=[request.request_id for request in reclaimed]
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_dispatch_without_admins_reopens_requests(self) -> None:
+        self.add_requests(kind=ModerationRequestKind.ADD_PRODUCT, amount=2)
+        self.assigner.remove_admin(admin_id=10)
+        self.assigner.remove_admin(admin_id=20)
+        requests: List[ModerationRequest] = await self.queue.claim_batch()
+
+        self.assertEqual(first=0, second=await self.queue.dispatch(requests=requests))
+        self.assertEqual(first=[], second=self.notified)
+
+        for request_id in (1, 2):
+            self.assertEqual(
+                first="open",
+                second=self.database.get_status(
+                    kind=ModerationRequestKind.ADD_PRODUCT, request_id=request_id
+                ),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
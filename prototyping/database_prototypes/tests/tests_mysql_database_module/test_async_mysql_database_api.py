@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_async_mysql_database_api представляет из себя набор модульных тестов,
+для тестирования компонентов модуля async_mysql_database_api.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+import asyncio
+import threading
+import unittest
+
+from typing import Any, List, Optional, Tuple
+
+from mysql.connector.errors import PoolError
+
+from database_prototypes.mysql_database_module.async_mysql_database_api import *
+
+
+# ____________________________________________________________________________
+class FakePooledConnection:
+    """FakePooledConnection соединение, возвращающееся в пул при закрытии."""
+
+    def __init__(self, pool: "FakePool") -> None:
+        self.pool: FakePool = pool
+        self.rolled_back: bool = False
+
+    def start_transaction(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        self.rolled_back = True
+
+    def close(self) -> None:
+        self.pool.release()
+
+
+# ____________________________________________________________________________
+class FakePool:
+    """FakePool пул, который, как MySQLConnectionPool, не ожидает соединения."""
+
+    def __init__(self, pool_size: int) -> None:
+        self.pool_size: int = pool_size
+        self.in_use: int = 0
+        self.max_in_use: int = 0
+        self.lock = threading.Lock()
+
+    def get_connection(self) -> FakePooledConnection:
+        with self.lock:
+            if self.in_use >= self.pool_size:
+                raise PoolError("Failed getting connection; pool exhausted")
+
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+
+        return FakePooledConnection(pool=self)
+
+    def release(self) -> None:
+        with self.lock:
+            self.in_use -= 1
+
+
+# ____________________________________________________________________________
+class BaseAsyncMySQLAPITestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.pool = FakePool(pool_size=2)
+        self.api = AsyncMySQLAPI()
+        await self.api.set_connection_to_pool(pool=self.pool)  # type: ignore
+
+        self.measures: List[Tuple[float, float, Optional[BaseException]]] = []
+        self.api.set_transaction_observer(
+            lambda wait, duration, error: self.measures.append((wait, duration, error))
+        )
+
+
+# ____________________________________________________________________________
+class TestAsyncMySQLAPIPositive(BaseAsyncMySQLAPITestCase):
+    async def test_transactions_queue_for_exhausted_pool(self) -> None:
+        def transaction(connection: Any) -> int:
+            time.sleep(0.05)
+
+            return 1
+
+        results: List[int] = await asyncio.gather(
+            *(self.api.execute_transaction_use_pool(transaction) for _ in range(6))
+        )
+
+        self.assertEqual(first=[1] * 6, second=results)
+        self.assertEqual(first=2, second=self.pool.max_in_use)
+        self.assertEqual(first=0, second=self.api.active_transactions_amount)
+
+    # -------------------------------------------------------------------------
+    async def test_queued_transactions_not_counted_as_connections_in_use(
+        self,
+    ) -> None:
+        release = threading.Event()
+
+        def blocking(connection: Any) -> None:
+            release.wait(timeout=1.0)
+
+        tasks: List[asyncio.Task] = [
+            asyncio.create_task(self.api.execute_transaction_use_pool(blocking))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(first=3, second=self.api.active_transactions_amount)
+        self.assertEqual(first=2, second=self.api.connections_in_use_amount)
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(first=0, second=self.api.connections_in_use_amount)
+
+    # -------------------------------------------------------------------------
+    async def test_queue_wait_is_measured(self) -> None:
+        def transaction(connection: Any) -> None:
+            time.sleep(0.05)
+
+        await asyncio.gather(
+            *(self.api.execute_transaction_use_pool(transaction) for _ in range(4))
+        )
+
+        waits: List[float] = sorted(wait for wait, _, _ in self.measures)
+
+        self.assertLess(a=waits[0], b=0.04)
+        self.assertGreaterEqual(a=waits[-1], b=0.04)
+
+
+# ____________________________________________________________________________
+class TestAsyncMySQLAPINegative(BaseAsyncMySQLAPITestCase):
+    async def test_failed_transaction_frees_connection(self) -> None:
+        connections: List[Any] = []
+
+        def failing(connection: Any) -> None:
+            connections.append(connection)
+            raise ValueError("Ошибка транзакции!")
+
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                await self.api.execute_transaction_use_pool(failing)
+
+        self.assertTrue(all(connection.rolled_back for connection in connections))
+        self.assertEqual(first=0, second=self.pool.in_use)
+        self.assertIsInstance(obj=self.measures[-1][2], cls=ValueError)
+
+    # -------------------------------------------------------------------------
+    async def test_cancelled_waiter_does_not_hold_slot(self) -> None:
+        release = threading.Event()
+
+        def blocking(connection: Any) -> None:
+            release.wait(timeout=1.0)
+
+        holders: List[asyncio.Task] = [
+            asyncio.create_task(self.api.execute_transaction_use_pool(blocking))
+            for _ in range(2)
+        ]
+        waiter = asyncio.create_task(self.api.execute_transaction_use_pool(blocking))
+
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        release.set()
+        await asyncio.gather(*holders)
+
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        self.assertIsNone(
+            await self.api.execute_transaction_use_pool(lambda connection: None)
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_cancelled_running_transaction_holds_slot_until_done(self) -> None:
+        self.pool = FakePool(pool_size=1)
+        await self.api.set_connection_to_pool(pool=self.pool)  # type: ignore
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow(connection: Any) -> str:
+            started.set()
+            release.wait(timeout=1.0)
+
+            return "slow"
+
+        running = asyncio.create_task(self.api.execute_transaction_use_pool(slow))
+
+        await asyncio.to_thread(started.wait, 1.0)
+        running.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await running
+
+        following = asyncio.create_task(
+            self.api.execute_transaction_use_pool(lambda connection: "following")
+        )
+        await asyncio.sleep(0.02)
+
+        self.assertFalse(expr=following.done())
+
+        release.set()
+
+        self.assertEqual(first="following", second=await following)
+
+
+if __name__ == "__main__":
+    unittest.main()
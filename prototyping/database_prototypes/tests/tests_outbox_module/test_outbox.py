@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_outbox представляет из себя набор модульных тестов,
+для тестирования компонентов модуля outbox.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import json
+import asyncio
+import unittest
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from database_prototypes.outbox_module.outbox import *
+from database_prototypes.outbox_module.types import OutboxJob
+
+
+_RETRY: str = "UPDATE `OutboxJob` SET `status` = 'queued'"
+_DEAD: str = "UPDATE `OutboxJob` SET `status` = 'dead'"
+
+
+# ____________________________________________________________________________
+class FakeCursor:
+    """FakeCursor курсор, записывающий запросы в FakeOutboxAPI."""
+
+    def __init__(self, api: "FakeOutboxAPI") -> None:
+        self.api: FakeOutboxAPI = api
+        self.rows: List[Tuple[Any, ...]] = []
+        self.rowcount: int = 0
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def execute(self, query: str, parameters: Sequence[Any] = ()) -> None:
+        self.api.queries.append((query, tuple(parameters)))
+        self.rows = self.api.claim(tuple(parameters)) if "FOR UPDATE" in query else []
+
+    def executemany(self, query: str, parameters: List[Tuple[Any, ...]]) -> None:
+        if self.api.fail_writes:
+            raise ConnectionError("БД недоступна!")
+
+        self.api.writes.append((query, list(parameters)))
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        return self.rows
+
+
+# ____________________________________________________________________________
+class FakeOutboxAPI:
+    """FakeOutboxAPI API, выдающий задачи из списка и записывающий результаты."""
+
+    def __init__(self) -> None:
+        self.jobs: List[Tuple[int, str, str, int]] = []
+        self.queries: List[Tuple[str, Tuple[Any, ...]]] = []
+        self.writes: List[Tuple[str, List[Tuple[Any, ...]]]] = []
+        self.fail_writes: bool = False
+        self.write_delay: float = 0.0
+
+    def add_job(self, job_id: int, kind: str, attempts: int = 0) -> None:
+        self.jobs.append((job_id, kind, json.dumps({"id": job_id}), attempts))
+
+    def claim(self, parameters: Tuple[Any, ...]) -> List[Tuple[Any, ...]]:
+        *kinds, limit = parameters
+        claimed: List[Tuple[Any, ...]] = [
+            job for job in self.jobs if job[1] in kinds
+        ][:limit]
+
+        for job in claimed:
+            self.jobs.remove(job)
+
+        return claimed
+
+    def get_writes(self, prefix: str) -> List[Tuple[Any, ...]]:
+        return [
+            row
+            for query, rows in self.writes
+            if query.startswith(prefix)
+            for row in rows
+        ]
+
+    async def execute_transaction_use_pool(self, transaction: Callable) -> Any:
+        await asyncio.sleep(self.write_delay)
+
+        return transaction(self)
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(api=self)
+
+
+# ____________________________________________________________________________
+class BaseOutboxTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.api = FakeOutboxAPI()
+        self.outbox = Outbox(
+            api=self.api,  # type: ignore
+            max_attempts=3,
+            base_backoff=1.0,
+            max_backoff=3.0,
+            poll_interval=0.01,
+            flush_interval=0.01,
+        )
+        self.handled: List[OutboxJob] = []
+
+    # -------------------------------------------------------------------------
+    async def handle(self, job: OutboxJob) -> None:
+        self.handled.append(job)
+
+    # -------------------------------------------------------------------------
+    async def fail(self, job: OutboxJob) -> None:
+        self.handled.append(job)
+        raise RuntimeError("Ошибка задачи!")
+
+    # -------------------------------------------------------------------------
+    async def run_outbox(self, seconds: float = 0.1) -> None:
+        self.outbox.start()
+        await asyncio.sleep(seconds)
+        await self.outbox.stop()
+
+
+# ____________________________________________________________________________
+class TestOutboxPositive(BaseOutboxTestCase):
+    async def test_completed_job_is_deleted(self) -> None:
+        self.outbox.register(kind="mail", handler=self.handle)
+        self.api.add_job(job_id=1, kind="mail")
+
+        await self.run_outbox()
+
+        self.assertEqual(first=[1], second=[job.job_id for job in self.handled])
+        self.assertEqual(first=1, second=self.handled[0].attempts)
+        self.assertEqual(first={"id": 1}, second=self.handled[0].payload)
+        self.assertEqual(first=[(1,)], second=self.api.get_writes("DELETE"))
+
+    # -------------------------------------------------------------------------
+    async def test_enqueue_waits_for_group_commit(self) -> None:
+        self.outbox.start()
+
+        await asyncio.gather(
+            *(self.outbox.enqueue(kind="mail", payload={"index": i}) for i in range(3))
+        )
+
+        inserts: List[Tuple[Any, ...]] = self.api.get_writes("INSERT")
+        await self.outbox.stop()
+
+        self.assertEqual(first=3, second=len(inserts))
+        self.assertEqual(first=1, second=len(self.api.writes))
+
+    # -------------------------------------------------------------------------
+    async def test_enqueue_nowait_is_flushed(self) -> None:
+        self.outbox.enqueue_nowait(kind="mail", payload={"index": 1})
+
+        self.assertEqual(first=[], second=self.api.writes)
+
+        await self.outbox.flush()
+
+        self.assertEqual(
+            first=[("mail", '{"index": 1}')], second=self.api.get_writes("INSERT")
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_backoff_grows_and_is_capped(self) -> None:
+        for attempts, ceiling in ((1, 1.0), (2, 2.0), (3, 3.0), (10, 3.0)):
+            backoff: float = self.outbox.get_backoff(attempts=attempts)
+
+            self.assertGreaterEqual(a=backoff, b=ceiling / 2)
+            self.assertLessEqual(a=backoff, b=ceiling)
+
+    # -------------------------------------------------------------------------
+    async def test_limited_kind_is_claimed_for_free_slots(self) -> None:
+        release: asyncio.Event = asyncio.Event()
+        started: List[int] = []
+
+        async def slow(job: OutboxJob) -> None:
+            started.append(job.job_id)
+            await release.wait()
+
+        self.outbox.register(kind="slow", handler=slow, concurrency=1)
+        self.outbox.register(kind="mail", handler=self.handle)
+
+        for job_id in range(1, 4):
+            self.api.add_job(job_id=job_id, kind="slow")
+
+        self.api.add_job(job_id=4, kind="mail")
+
+        self.outbox.start()
+        await asyncio.sleep(0.05)
+
+        # Задачи ограниченного типа остаются в очереди, пока место занято.
+        self.assertEqual(first=[1], second=started)
+        self.assertEqual(first=2, second=len(self.api.jobs))
+        self.assertEqual(first=[4], second=[job.job_id for job in self.handled])
+
+        release.set()
+        await asyncio.sleep(0.1)
+        await self.outbox.stop()
+
+        self.assertEqual(first=[1, 2, 3], second=started)
+        self.assertEqual(first=4, second=len(self.api.get_writes("DELETE")))
+
+
+# ____________________________________________________________________________
+class TestOutboxNegative(BaseOutboxTestCase):
+    async def test_failed_job_is_retried_with_backoff(self) -> None:
+        self.outbox.register(kind="mail", handler=self.fail)
+        self.api.add_job(job_id=1, kind="mail")
+
+        await self.run_outbox()
+
+        retries: List[Tuple[Any, ...]] = self.api.get_writes(_RETRY)
+        backoff, message, job_id, attempts = retries[0]
+
+        self.assertEqual(first=1, second=len(retries))
+        self.assertEqual(first=(1, 1), second=(job_id, attempts))
+        self.assertTrue(0.5 <= backoff <= 1.0)
+        self.assertEqual(first="RuntimeError: Ошибка задачи!", second=message)
+        self.assertEqual(first=[], second=self.api.get_writes("DELETE"))
+
+    # -------------------------------------------------------------------------
+    async def test_last_attempt_goes_to_dead_letter(self) -> None:
+        self.outbox.register(kind="mail", handler=self.fail)
+        self.api.add_job(job_id=1, kind="mail", attempts=2)
+
+        await self.run_outbox()
+
+        dead: List[Tuple[Any, ...]] = self.api.get_writes(_DEAD)
+
+        self.assertEqual(first=[("RuntimeError: Ошибка задачи!", 1, 3)], second=dead)
+        self.assertEqual(first=[], second=self.api.get_writes(_RETRY))
+
+    # -------------------------------------------------------------------------
+    async def test_timeout_counts_as_failed_attempt(self) -> None:
+        outbox = Outbox(
+            api=self.api,  # type: ignore
+            visibility_timeout=0.01,
+            poll_interval=0.01,
+            flush_interval=0.01,
+        )
+
+        async def hang(job: OutboxJob) -> None:
+            await asyncio.sleep(1.0)
+
+        outbox.register(kind="mail", handler=hang)
+        self.api.add_job(job_id=1, kind="mail")
+
+        outbox.start()
+        await asyncio.sleep(0.1)
+        await outbox.stop()
+
+        retries: List[Tuple[Any, ...]] = self.api.get_writes(_RETRY)
+
+        self.assertEqual(first=1, second=len(retries))
+        self.assertTrue(retries[0][1].startswith("TimeoutError"))
+
+    # -------------------------------------------------------------------------
+    async def test_failed_flush_keeps_buffers(self) -> None:
+        self.outbox.enqueue_nowait(kind="mail", payload={"index": 1})
+        self.api.fail_writes = True
+
+        with self.assertRaises(ConnectionError):
+            await self.outbox.flush()
+
+        self.api.fail_writes = False
+        await self.outbox.flush()
+
+        self.assertEqual(first=1, second=len(self.api.get_writes("INSERT")))
+
+    # -------------------------------------------------------------------------
+    async def test_enqueue_fails_when_stop_cannot_flush(self) -> None:
+        self.api.fail_writes = True
+        self.outbox.start()
+
+        enqueue: asyncio.Task = asyncio.create_task(
+            self.outbox.enqueue(kind="mail", payload={"index": 1})
+        )
+        await asyncio.sleep(0.05)
+
+        self.assertFalse(enqueue.done())
+
+        with self.assertRaises(ConnectionError):
+            await self.outbox.stop()
+
+        with self.assertRaises(ConnectionError):
+            await enqueue
+
+    # -------------------------------------------------------------------------
+    async def test_stop_during_slow_flush_completes_enqueue(self) -> None:
+        self.api.write_delay = 0.05
+        self.outbox.start()
+
+        enqueue: asyncio.Task = asyncio.create_task(
+            self.outbox.enqueue(kind="mail", payload={"index": 1})
+        )
+        await asyncio.sleep(0.03)
+
+        self.assertFalse(enqueue.done())
+
+        await self.outbox.stop()
+
+        self.assertTrue(enqueue.done())
+        self.assertIsNone(await enqueue)
+        self.assertEqual(first=1, second=len(self.api.get_writes("INSERT")))
+
+    # -------------------------------------------------------------------------
+    def test_invalid_limits(self) -> None:
+        with self.assertRaises(ValueError):
+            Outbox(api=self.api, max_attempts=0)  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
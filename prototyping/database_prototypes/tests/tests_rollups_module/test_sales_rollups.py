@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_sales_rollups представляет из себя набор модульных тестов,
+для тестирования компонентов модуля sales_rollups.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from database_prototypes.rollups_module.sales_rollups import *
+from database_prototypes.rollups_module.sales_rollups import _get_measures
+from database_prototypes.rollups_module.types import OrderChange
+
+
+CREATED_AT: datetime = datetime(2024, 5, 1, 12, 30)
+PRICE: Decimal = Decimal("150.00")
+
+
+# ____________________________________________________________________________
+class FakeDataBase:
+    """FakeDataBase таблицы заказов, агрегатов и состояния заполнения в памяти.
+
+    *Запросы агрегатов используют синтаксис MySQL (ON DUPLICATE KEY UPDATE,
+    FOR SHARE), поэтому выполняются не СУБД, а по их назначению.
+    """
+
+    def __init__(self) -> None:
+        self.orders: List[List[Any]] = []
+        self.state: List[int] = [0, 0]
+        self.rollup: Dict[Tuple[Any, ...], List[Any]] = {}
+        self.daily_rollup: Dict[Tuple[Any, ...], List[Any]] = {}
+        self.queries: List[str] = []
+
+    def add_order(self, order_id: int, status: str) -> None:
+        self.orders.append([order_id, 7, 3, CREATED_AT, PRICE, status])
+
+    def set_status(self, order_id: int, status: str) -> None:
+        for order in self.orders:
+            if order[0] == order_id:
+                order[5] = status
+
+    def execute(self, query: str, parameters: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        self.queries.append(query)
+
+        if query.startswith("SELECT `backfill_order_id`"):
+            return [tuple(self.state)]
+
+        if query.startswith("SELECT `Order`.`id`"):
+            last_id, limit = parameters
+
+            return [tuple(order) for order in self.orders if order[0] > last_id][:limit]
+
+        if query.startswith("UPDATE `SalesRollupState`"):
+            self.state = list(parameters)
+
+        return []
+
+    def upsert(self, query: str, rows: Sequence[Tuple[Any, ...]]) -> None:
+        self.queries.append(query)
+        table = self.daily_rollup if "`SalesDailyRollup`" in query else self.rollup
+        keys_amount: int = len(rows[0]) - 4 if rows else 0
+
+        for row in rows:
+            measures: List[Any] = table.setdefault(
+                row[:keys_amount], [0, Decimal(0), 0, Decimal(0)]
+            )
+
+            for index, value in enumerate(row[keys_amount:]):
+                measures[index] += value
+
+
+# ____________________________________________________________________________
+class FakeCursor:
+    """FakeCursor курсор, передающий запросы FakeDataBase."""
+
+    def __init__(self, database: FakeDataBase) -> None:
+        self.database: FakeDataBase = database
+        self.rows: List[Tuple[Any, ...]] = []
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def execute(self, query: str, parameters: Sequence[Any] = ()) -> None:
+        self.rows = self.database.execute(query, tuple(parameters))
+
+    def executemany(self, query: str, rows: Sequence[Tuple[Any, ...]]) -> None:
+        self.database.upsert(query, rows)
+
+    def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        return self.rows
+
+
+# ____________________________________________________________________________
+class FakeConnection:
+    """FakeConnection соединение с FakeDataBase."""
+
+    def __init__(self, database: FakeDataBase) -> None:
+        self.database: FakeDataBase = database
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(database=self.database)
+
+
+# ____________________________________________________________________________
+class FakeAPI:
+    """FakeAPI API, выполняющий транзакции над одним FakeConnection."""
+
+    def __init__(self, connection: FakeConnection) -> None:
+        self.connection: FakeConnection = connection
+
+    async def execute_transaction_use_pool(self, transaction: Callable) -> Any:
+        return transaction(self.connection)
+
+
+# ____________________________________________________________________________
+class BaseSalesRollupsTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.database = FakeDataBase()
+        self.connection = FakeConnection(database=self.database)
+        self.rollups = SalesRollups(
+            api=FakeAPI(connection=self.connection)  # type: ignore
+        )
+
+    # -------------------------------------------------------------------------
+    def change(
+        self, order_id: Optional[int], previous_status: Optional[str], status: str
+    ) -> None:
+        self.rollups.apply_order_change(
+            connection=self.connection,  # type: ignore
+            change=OrderChange(
+                order_id=order_id,
+                seller_id=7,
+                product_id=3,
+                created_at=CREATED_AT,
+                total_price=PRICE,
+                previous_status=previous_status,
+                status=status,
+            ),
+        )
+
+    # -------------------------------------------------------------------------
+    def get_rollup(self) -> Optional[List[Any]]:
+        return self.database.rollup.get((7, CREATED_AT.date(), 3))
+
+    # -------------------------------------------------------------------------
+    def get_daily_rollup(self) -> Optional[List[Any]]:
+        return self.database.daily_rollup.get((CREATED_AT.date(),))
+
+
+# ____________________________________________________________________________
+class TestSalesRollupsPositive(BaseSalesRollupsTestCase):
+    def test_get_measures(self) -> None:
+        self.assertEqual(
+            first=[1, PRICE, 0, Decimal(0)],
+            second=_get_measures(status="completed", total_price=PRICE),
+        )
+        self.assertEqual(
+            first=[0, Decimal(0), 1, PRICE],
+            second=_get_measures(status="refunded", total_price=PRICE),
+        )
+
+        for status in ("pending", "cancelled", None):
+            with self.subTest(status=status):
+                self.assertEqual(
+                    first=[0, Decimal(0), 0, Decimal(0)],
+                    second=_get_measures(status=status, total_price=PRICE),
+                )
+
+    # -------------------------------------------------------------------------
+    async def test_order_lifecycle_deltas(self) -> None:
+        self.database.state = [0, 1]
+
+        self.change(order_id=None, previous_status=None, status="pending")
+
+        self.assertIsNone(obj=self.get_rollup())
+
+        self.change(order_id=1, previous_status="pending", status="completed")
+
+        self.assertEqual(first=[1, PRICE, 0, Decimal(0)], second=self.get_rollup())
+
+        self.change(order_id=1, previous_status="completed", status="refunded")
+
+        self.assertEqual(first=[0, Decimal(0), 1, PRICE], second=self.get_rollup())
+        self.assertEqual(first=self.get_rollup(), second=self.get_daily_rollup())
+
+    # -------------------------------------------------------------------------
+    async def test_change_of_backfilled_order_applied(self) -> None:
+        self.database.state = [10, 0]
+
+        self.change(order_id=5, previous_status="pending", status="completed")
+
+        self.assertEqual(first=[1, PRICE, 0, Decimal(0)], second=self.get_rollup())
+        self.assertFalse(expr=self.rollups.is_backfill_complete)
+
+    # -------------------------------------------------------------------------
+    async def test_backfill_counts_order_changed_beyond_cursor_once(self) -> None:
+        for order_id in (1, 2, 3):
+            self.database.add_order(order_id=order_id, status="completed")
+
+        self.database.set_status(order_id=3, status="pending")
+
+        self.assertFalse(expr=await self.rollups.backfill_chunk(chunk_size=2))
+        self.assertEqual(first=[2, 0], second=self.database.state)
+
+        # Заказ 3 ещё не пройден заполнением: изменение пропускается.
+        self.change(order_id=3, previous_status="pending", status="completed")
+        self.database.set_status(order_id=3, status="completed")
+
+        self.assertEqual(first=[2, PRICE * 2, 0, Decimal(0)], second=self.get_rollup())
+
+        await self.rollups.backfill(chunk_size=2, pause=0)
+
+        self.assertTrue(expr=self.rollups.is_backfill_complete)
+        self.assertEqual(first=[3, PRICE * 3, 0, Decimal(0)], second=self.get_rollup())
+        self.assertEqual(first=self.get_rollup(), second=self.get_daily_rollup())
+
+    # -------------------------------------------------------------------------
+    async def test_state_not_read_after_backfill_complete(self) -> None:
+        self.database.state = [0, 1]
+        self.change(order_id=1, previous_status="pending", status="completed")
+        self.database.queries.clear()
+
+        self.change(order_id=2, previous_status="pending", status="completed")
+
+        self.assertFalse(
+            expr=any("SalesRollupState" in query for query in self.database.queries)
+        )
+        self.assertEqual(first=[2, PRICE * 2, 0, Decimal(0)], second=self.get_rollup())
+
+
+# ____________________________________________________________________________
+class TestSalesRollupsNegative(BaseSalesRollupsTestCase):
+    async def test_change_beyond_backfill_cursor_skipped(self) -> None:
+        self.database.state = [10, 0]
+
+        self.change(order_id=11, previous_status="pending", status="completed")
+        self.change(order_id=None, previous_status=None, status="completed")
+
+        self.assertEqual(first={}, second=self.database.rollup)
+        self.assertEqual(first={}, second=self.database.daily_rollup)
+
+    # -------------------------------------------------------------------------
+    async def test_unchanged_measures_not_written(self) -> None:
+        self.database.state = [0, 1]
+
+        self.change(order_id=1, previous_status="pending", status="cancelled")
+
+        self.assertEqual(first={}, second=self.database.rollup)
+
+    # -------------------------------------------------------------------------
+    async def test_completed_backfill_not_reprocess_orders(self) -> None:
+        self.database.add_order(order_id=1, status="completed")
+        await self.rollups.backfill(chunk_size=10, pause=0)
+        self.database.queries.clear()
+
+        self.assertTrue(expr=await self.rollups.backfill_chunk(chunk_size=10))
+        self.assertEqual(first=1, second=len(self.database.queries))
+        self.assertEqual(first=[1, PRICE, 0, Decimal(0)], second=self.get_rollup())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_models_generator представляет из себя набор модульных тестов,
+для тестирования компонентов модулей models_generator и nekoshop_models.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import os
+import sys
+import tempfile
+import unittest
+import subprocess
+
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional
+
+from database_prototypes.schema_module.nekoshop_models import *
+from database_prototypes.sqlite_database_module.schema import NEKOSHOP_SCHEMA_QUERIES
+from database_prototypes.sqlite_database_module.sqlite_connection import *
+
+
+# Каталог `prototyping`, из которого модули запускаются как `database_prototypes.*`.
+PROTOTYPING_DIR: Path = Path(__file__).resolve().parents[3]
+
+
+# ----------------------------------------------------------------------------
+def run_models_generator(*arguments: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "database_prototypes.schema_module.models_generator",
+            *arguments,
+        ],
+        cwd=PROTOTYPING_DIR,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+# ____________________________________________________________________________
+class TestModelsGeneratorPositive(unittest.TestCase):
+    def test_check_generated_module_matches_model(self) -> None:
+        completed: subprocess.CompletedProcess = run_models_generator("--check")
+
+        self.assertEqual(first=0, second=completed.returncode, msg=completed.stderr)
+        self.assertIn(member="Схема соответствует модели", container=completed.stdout)
+
+
+# ____________________________________________________________________________
+class TestModelsGeneratorNegative(unittest.TestCase):
+    def test_check_stale_module_exit_with_code_1(self) -> None:
+        descriptor, filepath = tempfile.mkstemp(suffix=".py")
+
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.write("# Устаревший модуль\n")
+
+        self.addCleanup(os.remove, filepath)
+
+        completed: subprocess.CompletedProcess = run_models_generator(
+            "--check", "--output", filepath
+        )
+
+        self.assertEqual(first=1, second=completed.returncode)
+        self.assertIn(member="не соответствует модели", container=completed.stderr)
+
+
+# ____________________________________________________________________________
+class TestNekoShopModelsPositive(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = SQLiteConnectionPool(database=":memory:", pool_size=1, timeout=5.0)
+        self.connection = self.pool.get_connection()
+
+        self.addCleanup(self.pool.close)
+        self.addCleanup(self.connection.close)
+
+        with self.connection.cursor() as cursor:
+            for query in NEKOSHOP_SCHEMA_QUERIES:
+                cursor.execute(query)
+
+    # -------------------------------------------------------------------------
+    def insert_product(self) -> int:
+        insert_supported_interface_language(
+            self.connection, SupportedInterfaceLanguageRow(code="ru", name="Русский")
+        )
+        owner_id: int = insert_user(
+            self.connection,
+            UserRow(
+                id=0,
+                phone_number="+70000000000",
+                email=None,
+                is_email_notification=0,
+                is_banned=0,
+                is_admin=0,
+                is_seller=1,
+                interface_language_code="ru",
+            ),
+        )
+        category_id: int = insert_category(
+            self.connection,
+            CategoryRow(id=0, name="Игры", description="Игровые услуги", is_blocked=0),
+        )
+        service_id: int = insert_service(
+            self.connection,
+            ServiceRow(
+                id=0,
+                category_id=category_id,
+                name="Прокачка",
+                description="Прокачка персонажа",
+                image=b"service",
+                is_blocked=0,
+            ),
+        )
+
+        return insert_product(
+            self.connection,
+            ProductRow(
+                id=0,
+                owner_id=owner_id,
+                service_id=service_id,
+                title="Уровень 60",
+                description="Прокачка до 60 уровня",
+                image=b"\x89PNG",
+                price=Decimal("1499.99"),
+                is_blocked=0,
+                quantity=None,
+            ),
+        )
+
+    # -------------------------------------------------------------------------
+    def test_row_decoded_into_row_class(self) -> None:
+        product_id: int = self.insert_product()
+        product: Optional[ProductRow] = select_product_by_id(
+            self.connection, product_id
+        )
+
+        assert product is not None
+        self.assertEqual(
+            first=(
+                product_id,
+                "Уровень 60",
+                b"\x89PNG",
+                Decimal("1499.99"),
+                None,
+            ),
+            second=(
+                product.id,
+                product.title,
+                product.image,
+                product.price,
+                product.quantity,
+            ),
+        )
+
+    # -------------------------------------------------------------------------
+    def test_order_round_trip_keeps_types(self) -> None:
+        product_id: int = self.insert_product()
+        expected = OrderRow(
+            id=0,
+            product_id=product_id,
+            customer_user_id=1,
+            status="pending",
+            total_price=Decimal("1499.99"),
+            created_at=datetime(2024, 5, 1, 12, 30, 15),
+        )
+        expected.id = insert_order(self.connection, expected)
+
+        order: Optional[OrderRow] = select_order_by_id(self.connection, expected.id)
+
+        self.assertEqual(first=expected, second=order)
+        assert order is not None
+        self.assertIsInstance(obj=order.total_price, cls=Decimal)
+        self.assertIsInstance(obj=order.created_at, cls=datetime)
+
+        order.status = "completed"
+
+        self.assertEqual(first=1, second=update_order(self.connection, order))
+        self.assertEqual(
+            first=["completed"],
+            second=[
+                row.status
+                for row in select_order_by_customer_user_id(self.connection, 1)
+            ],
+        )
+        self.assertEqual(first=1, second=delete_order(self.connection, order.id))
+        self.assertIsNone(obj=select_order_by_id(self.connection, order.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_async_sqlite_database представляет из себя набор модульных тестов,
+для тестирования компонентов модулей async_sqlite_database и sqlite_connection.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import sqlite3
+import unittest
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Set, Tuple
+
+from database_prototypes.sqlite_database_module import *
+from database_prototypes.sqlite_database_module.sqlite_connection import *
+
+
+# ____________________________________________________________________________
+class BaseAsyncSQLiteDataBaseTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.database = await self.open_database()
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.close_database(database=self.database)
+
+        await unittest.IsolatedAsyncioTestCase.asyncTearDown(self)
+
+    # -------------------------------------------------------------------------
+    async def open_database(self) -> AsyncSQLiteDataBase:
+        database = AsyncSQLiteDataBase(
+            connection_data={"database": ":memory:", "timeout": 1.0},
+            api=AsyncSQLiteAPI(),
+            pool_size=2,
+        )
+        await database.connect_api_to_database()
+        await database.create_schema()
+
+        return database
+
+    # -------------------------------------------------------------------------
+    async def close_database(self, database: AsyncSQLiteDataBase) -> None:
+        await database.close_connection_with_database()
+        await database.close_pool()
+
+    # -------------------------------------------------------------------------
+    async def insert_language(self, code: str) -> None:
+        def transaction(connection: Any) -> None:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "INSERT INTO `SupportedInterfaceLanguage` (`code`, `name`) "
+                    "VALUES (%s, %s)",
+                    (code, code.upper()),
+                )
+
+        await self.database.api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def select_languages(self) -> List[str]:
+        def transaction(connection: Any) -> List[str]:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT `code` FROM `SupportedInterfaceLanguage` ORDER BY `code`"
+                )
+
+                return [row[0] for row in cursor.fetchall()]
+
+        return await self.database.api.execute_transaction_use_pool(transaction)
+
+
+# ____________________________________________________________________________
+class TestAsyncSQLiteDataBasePositive(BaseAsyncSQLiteDataBaseTestCase):
+    async def test_create_schema(self) -> None:
+        def transaction(connection: Any) -> Set[str]:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT `name` FROM `sqlite_master` WHERE `type` = 'table'"
+                )
+
+                return {row[0] for row in cursor.fetchall()}
+
+        tables: Set[str] = await self.database.api.execute_transaction_use_pool(
+            transaction
+        )
+
+        self.assertLessEqual(
+            a={"User", "Product", "Order", "Ticket", "RequestAddProduct"}, b=tables
+        )
+
+        # Повторное создание схемы не изменяет существующие таблицы.
+        await self.database.create_schema()
+
+    # -------------------------------------------------------------------------
+    async def test_transaction_is_committed(self) -> None:
+        await self.insert_language(code="ru")
+
+        self.assertEqual(first=["ru"], second=await self.select_languages())
+
+    # -------------------------------------------------------------------------
+    async def test_percent_parameters_are_translated(self) -> None:
+        await self.insert_language(code="en")
+        await self.insert_language(code="ru")
+
+        def transaction(connection: Any) -> List[Tuple[Any, ...]]:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT `code` FROM `SupportedInterfaceLanguage` "
+                    "WHERE `name` LIKE 'R%%' AND `code` <> %s",
+                    ("en",),
+                )
+
+                return cursor.fetchall()
+
+        rows: List[Tuple[Any, ...]] = (
+            await self.database.api.execute_transaction_use_pool(transaction)
+        )
+
+        self.assertEqual(first=[("ru",)], second=rows)
+
+    # -------------------------------------------------------------------------
+    async def test_decimal_and_datetime_round_trip(self) -> None:
+        created_at = datetime(2024, 6, 1, 12, 30, 15, 250000)
+
+        def transaction(connection: Any) -> Optional[Tuple[Any, ...]]:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "INSERT INTO `SupportedInterfaceLanguage` VALUES ('ru', 'RU')"
+                )
+                cursor.execute(
+                    "INSERT INTO `User` (`phone_number`, `interface_language_code`) "
+                    "VALUES ('+70000000000', 'ru')"
+                )
+                cursor.execute(
+                    "INSERT INTO `Category` (`name`, `description`) VALUES ('c', 'c')"
+                )
+                cursor.execute(
+                    "INSERT INTO `Service` "
+                    "(`category_id`, `name`, `description`, `image`) "
+                    "VALUES (1, 's', 's', x'00')"
+                )
+                cursor.execute(
+                    "INSERT INTO `Product` (`owner_id`, `service_id`, `title`, "
+                    "`description`, `image`, `price`) "
+                    "VALUES (1, 1, 't', 'd', x'00', %s)",
+                    (Decimal("19.99"),),
+                )
+                cursor.execute(
+                    "INSERT INTO `Order` "
+                    "(`product_id`, `customer_user_id`, `total_price`, `created_at`) "
+                    "VALUES (1, 1, %s, %s)",
+                    (Decimal("39.98"), created_at),
+                )
+                cursor.execute("SELECT `total_price`, `created_at` FROM `Order`")
+
+                return cursor.fetchone()
+
+        row: Optional[Tuple[Any, ...]] = (
+            await self.database.api.execute_transaction_use_pool(transaction)
+        )
+
+        self.assertEqual(first=(Decimal("39.98"), created_at), second=row)
+        assert row is not None
+        self.assertIsInstance(obj=row[0], cls=Decimal)
+
+    # -------------------------------------------------------------------------
+    async def test_separate_connection_shares_memory_database(self) -> None:
+        await self.insert_language(code="ru")
+
+        async def operation(connection: AsyncSQLiteConnection) -> List[Any]:
+            async with await connection.cursor() as cursor:
+                await cursor.execute("SELECT `code` FROM `SupportedInterfaceLanguage`")
+
+                return await cursor.fetchall()
+
+        rows: List[Any] = (
+            await self.database.api.execute_use_connection_with_database(operation)
+        )
+
+        self.assertEqual(first=[("ru",)], second=rows)
+
+    # -------------------------------------------------------------------------
+    async def test_resize_pool(self) -> None:
+        self.assertEqual(first=4, second=await self.database.api.resize_pool(4))
+        self.assertEqual(first=1, second=await self.database.api.resize_pool(1))
+        self.assertEqual(first=1, second=self.database.api.pool_size)
+
+    # -------------------------------------------------------------------------
+    async def test_connections_in_use_amount(self) -> None:
+        def transaction(connection: Any) -> int:
+            return self.database.api.connections_in_use_amount
+
+        in_use: int = await self.database.api.execute_transaction_use_pool(transaction)
+
+        self.assertEqual(first=1, second=in_use)
+        self.assertEqual(first=0, second=self.database.api.connections_in_use_amount)
+
+    # -------------------------------------------------------------------------
+    def test_create_pool_name_is_unique(self) -> None:
+        self.assertNotEqual(first=create_pool_name(), second=create_pool_name())
+
+
+# ____________________________________________________________________________
+class TestAsyncSQLiteDataBaseNegative(BaseAsyncSQLiteDataBaseTestCase):
+    async def test_failed_transaction_is_rolled_back(self) -> None:
+        def transaction(connection: Any) -> None:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "INSERT INTO `SupportedInterfaceLanguage` VALUES ('ru', 'RU')"
+                )
+
+            raise ValueError("Ошибка транзакции!")
+
+        with self.assertRaises(ValueError):
+            await self.database.api.execute_transaction_use_pool(transaction)
+
+        self.assertEqual(first=[], second=await self.select_languages())
+
+    # -------------------------------------------------------------------------
+    async def test_constraint_error_is_raised(self) -> None:
+        await self.insert_language(code="ru")
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            await self.insert_language(code="ru")
+
+        self.assertEqual(first=["ru"], second=await self.select_languages())
+
+    # -------------------------------------------------------------------------
+    async def test_default_names_do_not_share_memory_database(self) -> None:
+        await self.insert_language(code="ru")
+
+        def transaction(connection: Any) -> List[Tuple[Any, ...]]:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT `code` FROM `SupportedInterfaceLanguage`")
+
+                return cursor.fetchall()
+
+        other: AsyncSQLiteDataBase = await self.open_database()
+
+        try:
+            rows: List[Tuple[Any, ...]] = await other.api.execute_transaction_use_pool(
+                transaction
+            )
+
+        finally:
+            await self.close_database(database=other)
+
+        self.assertEqual(first=[], second=rows)
+
+    # -------------------------------------------------------------------------
+    def test_invalid_pool_size(self) -> None:
+        with self.assertRaises(ValueError):
+            SQLiteConnectionPool(database=":memory:", pool_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
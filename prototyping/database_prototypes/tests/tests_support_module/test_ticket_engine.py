@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_ticket_engine представляет из себя набор модульных тестов,
+для тестирования компонентов модуля ticket_engine.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from database_prototypes.support_module.ticket_engine import *
+
+
+# ____________________________________________________________________________
+class FakeCursor:
+    def __init__(self, api: "FakeAPI") -> None:
+        self.api = api
+        self.rows: List[Tuple] = []
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        pass
+
+    def execute(self, query: str) -> None:
+        self.rows = list(self.api.open_tickets)
+
+    def fetchmany(self, size: int) -> List[Tuple]:
+        chunk, self.rows = self.rows[:size], self.rows[size:]
+
+        return chunk
+
+    def executemany(self, query: str, parameters: Sequence[Tuple]) -> None:
+        self.api.written.append((query.split()[0], list(parameters)))
+
+
+# ____________________________________________________________________________
+class FakeConnection:
+    def __init__(self, api: "FakeAPI") -> None:
+        self.api = api
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(api=self.api)
+
+
+# ____________________________________________________________________________
+class FakeAPI:
+    def __init__(self) -> None:
+        self.open_tickets: List[Tuple] = []
+        self.written: List[Tuple[str, List[Tuple]]] = []
+        self.is_failing: bool = False
+
+    async def execute_transaction_use_pool(self, transaction: Callable) -> Any:
+        if self.is_failing:
+            raise ConnectionError("БД недоступна!")
+
+        return transaction(FakeConnection(api=self))
+
+
+# ____________________________________________________________________________
+class BaseTicketEngineTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.api = FakeAPI()
+        self.escalations: List[Tuple[int, int]] = []
+        self.engine = TicketEngine(
+            api=self.api,  # type: ignore
+            escalate=self.escalate,
+            sla_seconds=(0.05, 0.05),
+            escalation_bonus=3600.0,
+            flush_interval=60.0,
+            timer_tick_seconds=0.01,
+        )
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.engine.stop()
+
+    # -------------------------------------------------------------------------
+    async def escalate(self, ticket_id: int, level: int) -> None:
+        self.escalations.append((ticket_id, level))
+
+    # -------------------------------------------------------------------------
+    async def wait_for_escalations(self, amount: int) -> None:
+        async with asyncio.timeout(delay=1.0):
+            while len(self.escalations) < amount:
+                await asyncio.sleep(0.01)
+
+    # -------------------------------------------------------------------------
+    def take_all(self) -> List[int]:
+        ticket_ids: List[int] = []
+
+        while (ticket_id := self.engine.take_next()) is not None:
+            ticket_ids.append(ticket_id)
+
+        return ticket_ids
+
+
+# ____________________________________________________________________________
+class TestTicketEnginePositive(BaseTicketEngineTestCase):
+    async def test_start_loads_open_tickets_by_priority(self) -> None:
+        now: datetime = datetime.now()
+        self.api.open_tickets = [
+            (1, now - timedelta(minutes=30), "Оплата", 0),
+            (2, now - timedelta(minutes=10), "Товар", 1),
+            (3, now - timedelta(minutes=20), "Доставка", 0),
+        ]
+
+        await self.engine.start()
+
+        self.assertEqual(first=3, second=len(self.engine))
+        # Продавец получает бонус в час и обслуживается первым.
+        self.assertEqual(first=[2, 1, 3], second=self.take_all())
+
+    # -------------------------------------------------------------------------
+    async def test_take_next_cancels_sla_timer(self) -> None:
+        await self.engine.start()
+        self.engine.admit(ticket_id=1, created_at=datetime.now())
+
+        self.assertEqual(first=1, second=self.engine.take_next())
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(first=[], second=self.escalations)
+
+        await self.engine.flush()
+
+        self.assertEqual(
+            first=[("UPDATE", [("pending", 1)])], second=self.api.written
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_expired_sla_escalates_each_level(self) -> None:
+        now: datetime = datetime.now()
+        await self.engine.start()
+        self.engine.admit(ticket_id=1, created_at=now - timedelta(minutes=5))
+        self.engine.admit(ticket_id=2, created_at=now)
+
+        self.engine.close(ticket_id=1)
+        await self.wait_for_escalations(amount=2)
+        await asyncio.sleep(0.1)
+
+        # После последнего уровня таймер больше не устанавливается.
+        self.assertEqual(first=[(2, 1), (2, 2)], second=self.escalations)
+
+    # -------------------------------------------------------------------------
+    async def test_escalated_ticket_moves_ahead(self) -> None:
+        now: datetime = datetime.now()
+        engine = TicketEngine(
+            api=self.api,  # type: ignore
+            escalate=self.escalate,
+            sla_seconds=(60.0, 60.0),
+            timer_tick_seconds=0.01,
+        )
+        # Срок реакции на первое обращение уже истёк,
+        # а второе создано продавцом и получает бонус в час.
+        engine.admit(ticket_id=1, created_at=now - timedelta(minutes=10))
+        engine.admit(ticket_id=2, created_at=now, tier=1)
+
+        await engine.start()
+
+        try:
+            await self.wait_for_escalations(amount=1)
+
+            self.assertEqual(first=[(1, 1)], second=self.escalations)
+            self.assertEqual(first=1, second=engine.take_next())
+            self.assertEqual(first=2, second=engine.take_next())
+
+        finally:
+            await engine.stop()
+
+    # -------------------------------------------------------------------------
+    async def test_resolve_flushes_status_and_solution(self) -> None:
+        await self.engine.start()
+        self.engine.admit(ticket_id=1, created_at=datetime.now())
+
+        self.engine.take_next()
+        self.engine.resolve(ticket_id=1, admin_id=10, solution="Заказ возвращён")
+
+        await self.engine.stop()
+
+        self.assertEqual(
+            first=[
+                ("UPDATE", [("resolved", 1)]),
+                ("INSERT", [(1, 10, "Заказ возвращён")]),
+            ],
+            second=self.api.written,
+        )
+        self.assertEqual(first=0, second=len(self.engine))
+
+
+# ____________________________________________________________________________
+class TestTicketEngineNegative(BaseTicketEngineTestCase):
+    async def test_resolved_ticket_not_escalated(self) -> None:
+        await self.engine.start()
+        self.engine.admit(ticket_id=1, created_at=datetime.now())
+        self.engine.resolve(ticket_id=1, admin_id=10, solution="Решено")
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(first=[], second=self.escalations)
+        self.assertIsNone(self.engine.take_next())
+
+    # -------------------------------------------------------------------------
+    async def test_failed_flush_keeps_newer_changes(self) -> None:
+        await self.engine.start()
+        self.engine.admit(ticket_id=1, created_at=datetime.now())
+        self.engine.admit(ticket_id=2, created_at=datetime.now())
+
+        self.take_all()
+        self.api.is_failing = True
+
+        with self.assertRaises(expected_exception=ConnectionError):
+            await self.engine.flush()
+
+        self.engine.close(ticket_id=2)
+        self.api.is_failing = False
+        await self.engine.flush()
+
+        self.assertEqual(
+            first=[("UPDATE", [("pending", 1), ("closed", 2)])],
+            second=self.api.written,
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_take_next_from_empty_engine(self) -> None:
+        await self.engine.start()
+
+        ticket_id: Optional[int] = self.engine.take_next()
+
+        self.assertIsNone(ticket_id)
+
+        await self.engine.flush()
+
+        self.assertEqual(first=[], second=self.api.written)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_ticket_queue представляет из себя набор модульных тестов,
+для тестирования компонентов модуля ticket_queue.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from typing import List, Optional
+
+from database_prototypes.support_module.ticket_queue import *
+
+
+# ____________________________________________________________________________
+class BaseTicketPriorityQueueTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        unittest.TestCase.setUp(self)
+
+        self.queue = TicketPriorityQueue()
+
+    # -------------------------------------------------------------------------
+    def pop_all(self) -> List[int]:
+        ticket_ids: List[int] = []
+
+        while (ticket_id := self.queue.pop()) is not None:
+            ticket_ids.append(ticket_id)
+
+        return ticket_ids
+
+
+# ____________________________________________________________________________
+class TestTicketPriorityQueuePositive(BaseTicketPriorityQueueTestCase):
+    def test_pop_by_score(self) -> None:
+        for ticket_id, score in ((1, 3.0), (2, 1.0), (3, 2.0)):
+            self.queue.push(ticket_id=ticket_id, score=score)
+
+        self.assertEqual(first=2, second=self.queue.peek())
+        self.assertEqual(first=[2, 3, 1], second=self.pop_all())
+
+    # -------------------------------------------------------------------------
+    def test_equal_scores_keep_push_order(self) -> None:
+        for ticket_id in (5, 3, 4):
+            self.queue.push(ticket_id=ticket_id, score=1.0)
+
+        self.assertEqual(first=[5, 3, 4], second=self.pop_all())
+
+    # -------------------------------------------------------------------------
+    def test_push_changes_score(self) -> None:
+        self.queue.push(ticket_id=1, score=1.0)
+        self.queue.push(ticket_id=2, score=2.0)
+        self.queue.push(ticket_id=1, score=3.0)
+
+        self.assertEqual(first=2, second=len(self.queue))
+        self.assertEqual(first=3.0, second=self.queue.get_score(ticket_id=1))
+        self.assertEqual(first=[2, 1], second=self.pop_all())
+
+    # -------------------------------------------------------------------------
+    def test_remove(self) -> None:
+        self.queue.push(ticket_id=1, score=1.0)
+        self.queue.push(ticket_id=2, score=2.0)
+
+        self.assertTrue(self.queue.remove(ticket_id=1))
+        self.assertNotIn(member=1, container=self.queue)
+        self.assertEqual(first=2, second=self.queue.peek())
+        self.assertEqual(first=[2], second=self.pop_all())
+
+    # -------------------------------------------------------------------------
+    def test_many_removals_keep_order(self) -> None:
+        for ticket_id in range(300):
+            self.queue.push(ticket_id=ticket_id, score=float(300 - ticket_id))
+
+        for ticket_id in range(0, 300, 3):
+            self.queue.push(ticket_id=ticket_id, score=-float(ticket_id))
+
+        for ticket_id in range(1, 300, 3):
+            self.queue.remove(ticket_id=ticket_id)
+
+        expected: List[int] = list(range(297, -1, -3)) + [
+            ticket_id for ticket_id in range(299, 0, -1) if ticket_id % 3 == 2
+        ]
+
+        self.assertEqual(first=200, second=len(self.queue))
+        self.assertEqual(first=expected, second=self.pop_all())
+
+
+# ____________________________________________________________________________
+class TestTicketPriorityQueueNegative(BaseTicketPriorityQueueTestCase):
+    def test_empty_queue(self) -> None:
+        self.assertIsNone(self.queue.peek())
+        self.assertIsNone(self.queue.pop())
+
+    # -------------------------------------------------------------------------
+    def test_remove_unknown_ticket(self) -> None:
+        self.assertFalse(self.queue.remove(ticket_id=1))
+
+    # -------------------------------------------------------------------------
+    def test_score_of_unknown_ticket(self) -> None:
+        score: Optional[float] = self.queue.get_score(ticket_id=1)
+
+        self.assertIsNone(score)
+
+
+if __name__ == "__main__":
+    unittest.main()
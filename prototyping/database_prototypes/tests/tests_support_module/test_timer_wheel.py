@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_timer_wheel представляет из себя набор модульных тестов,
+для тестирования компонентов модуля timer_wheel.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+
+from typing import List
+
+from database_prototypes.support_module.timer_wheel import *
+
+
+# ____________________________________________________________________________
+class BaseTimerWheelTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.expired: List[str] = []
+        self.wheel: TimerWheel[str] = TimerWheel(
+            on_expire=self.on_expire, tick_seconds=1.0, slots_amount=4
+        )
+
+    # -------------------------------------------------------------------------
+    async def on_expire(self, key: str) -> None:
+        if key.startswith("fail"):
+            raise RuntimeError("Ошибка обработки таймера!")
+
+        self.expired.append(key)
+
+    # -------------------------------------------------------------------------
+    def advance(self, ticks: int) -> List[List[str]]:
+        return [self.wheel.advance() for _ in range(ticks)]
+
+
+# ____________________________________________________________________________
+class TestTimerWheelPositive(BaseTimerWheelTestCase):
+    def test_expires_on_its_tick(self) -> None:
+        self.wheel.schedule(key="a", delay_seconds=1.0)
+        self.wheel.schedule(key="b", delay_seconds=2.5)
+
+        self.assertEqual(first=[["a"], [], ["b"]], second=self.advance(ticks=3))
+        self.assertEqual(first=0, second=len(self.wheel))
+
+    # -------------------------------------------------------------------------
+    def test_delay_longer_than_one_round(self) -> None:
+        self.wheel.schedule(key="a", delay_seconds=4.0)
+        self.wheel.schedule(key="b", delay_seconds=9.0)
+
+        ticks: List[List[str]] = self.advance(ticks=9)
+
+        self.assertEqual(first=["a"], second=ticks[3])
+        self.assertEqual(first=["b"], second=ticks[8])
+        self.assertEqual(first=2, second=sum(map(len, ticks)))
+
+    # -------------------------------------------------------------------------
+    def test_zero_delay_expires_on_next_tick(self) -> None:
+        self.wheel.schedule(key="a", delay_seconds=0.0)
+
+        self.assertEqual(first=[["a"]], second=self.advance(ticks=1))
+
+    # -------------------------------------------------------------------------
+    def test_reschedule_replaces_timer(self) -> None:
+        self.wheel.schedule(key="a", delay_seconds=1.0)
+        self.wheel.schedule(key="a", delay_seconds=3.0)
+
+        self.assertEqual(first=1, second=len(self.wheel))
+        self.assertEqual(first=[[], [], ["a"]], second=self.advance(ticks=3))
+
+    # -------------------------------------------------------------------------
+    def test_cancel(self) -> None:
+        self.wheel.schedule(key="a", delay_seconds=2.0)
+
+        self.assertTrue(self.wheel.cancel(key="a"))
+        self.assertNotIn(member="a", container=self.wheel)
+        self.assertEqual(first=[[], [], [], [], []], second=self.advance(ticks=5))
+
+    # -------------------------------------------------------------------------
+    async def test_run_calls_on_expire(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(
+            on_expire=self.on_expire, tick_seconds=0.01, slots_amount=8
+        )
+        wheel.schedule(key="a", delay_seconds=0.02)
+        wheel.start()
+
+        await asyncio.sleep(0.1)
+        await wheel.stop()
+
+        self.assertEqual(first=["a"], second=self.expired)
+
+
+# ____________________________________________________________________________
+class TestTimerWheelNegative(BaseTimerWheelTestCase):
+    def test_cancel_unknown_key(self) -> None:
+        self.assertFalse(self.wheel.cancel(key="a"))
+
+    # -------------------------------------------------------------------------
+    async def test_failed_expire_does_not_stop_wheel(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(
+            on_expire=self.on_expire, tick_seconds=0.01, slots_amount=8
+        )
+        wheel.schedule(key="fail", delay_seconds=0.01)
+        wheel.schedule(key="a", delay_seconds=0.01)
+        wheel.schedule(key="b", delay_seconds=0.03)
+        wheel.start()
+
+        await asyncio.sleep(0.1)
+        await wheel.stop()
+
+        self.assertEqual(first=["a", "b"], second=self.expired)
+
+
+if __name__ == "__main__":
+    unittest.main()
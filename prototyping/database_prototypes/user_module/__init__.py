@@ -0,0 +1,3 @@
+__all__: list[str] = ["UserRepository"]
+
+from .user_repository import UserRepository
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль `user_repository` реализует класс для чтения и изменения
+данных пользователей (таблица `User`), уведомляющий подписчиков об изменениях,
+чтобы кэши данных пользователей не хранили устаревшие записи.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["UserChangeListenerType", "UserRepository"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from string import Template
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from ..mysql_database_module.async_mysql_database_api import AsyncMySQLAPI
+from ..mysql_database_module.types import MySQLPooledConnection
+
+
+# Аннотация для функции, получающей идентификатор пользователя и изменённые столбцы.
+UserChangeListenerType = Callable[[int, Mapping[str, Any]], Any]
+
+_SELECT_USER_QUERY: str = (
+    "SELECT `id`, `is_banned`, `is_admin`, `is_seller`, `interface_language_code` "
+    "FROM `User` WHERE `id` = %s"
+)
+
+_SELECT_BANNED_USER_IDS_QUERY: str = "SELECT `id` FROM `User` WHERE `is_banned` = 1"
+
+_UPDATE_USER_TEMPLATE = Template("UPDATE `User` SET $assignments WHERE `id` = %s")
+
+# Столбцы, которые могут изменяться действиями администратора или пользователя.
+_MUTABLE_COLUMNS: Tuple[str, ...] = (
+    "is_banned",
+    "is_admin",
+    "is_seller",
+    "is_email_notification",
+    "interface_language_code",
+)
+
+
+# _____________________________________________________________________________
+class UserRepository:
+    """UserRepository класс для работы над данными пользователей.
+
+    Attributes:
+        __api (AsyncMySQLAPI): API для выполнения транзакций над БД.
+        __listeners (List[UserChangeListenerType]): Подписчики на изменения пользователей.
+    """
+
+    __api: AsyncMySQLAPI
+    __listeners: List[UserChangeListenerType]
+
+    # -------------------------------------------------------------------------
+    def __init__(self, api: AsyncMySQLAPI) -> None:
+        """__init__ конструктор.
+
+        Args:
+            api (AsyncMySQLAPI): Настроенный API для работы над БД.
+        """
+        self.__api = api
+        self.__listeners = []
+
+    # -------------------------------------------------------------------------
+    def add_change_listener(self, listener: UserChangeListenerType) -> None:
+        """add_change_listener добавляет подписчика на изменения пользователей.
+
+        Args:
+            listener (UserChangeListenerType): Функция, вызываемая после изменения.
+        """
+        self.__listeners.append(listener)
+
+    # -------------------------------------------------------------------------
+    async def fetch_user_row(self, user_id: int) -> Optional[Tuple[Any, ...]]:
+        """fetch_user_row возвращает данные пользователя, необходимые для обработки обновлений.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            Optional[Tuple[Any, ...]]: (id, is_banned, is_admin, is_seller,
+                interface_language_code), либо None если пользователь не найден.
+        """
+
+        def transaction(connection: MySQLPooledConnection) -> Optional[Tuple[Any, ...]]:
+            with connection.cursor() as cursor:
+                cursor.execute(_SELECT_USER_QUERY, (user_id,))
+
+                return cursor.fetchone()
+
+        return await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def fetch_banned_user_ids(self) -> List[int]:
+        """fetch_banned_user_ids возвращает идентификаторы заблокированных пользователей.
+
+        Returns:
+            List[int]: Идентификаторы заблокированных пользователей.
+        """
+
+        def transaction(connection: MySQLPooledConnection) -> List[int]:
+            with connection.cursor() as cursor:
+                cursor.execute(_SELECT_BANNED_USER_IDS_QUERY)
+
+                return [row[0] for row in cursor.fetchall()]
+
+        return await self.__api.execute_transaction_use_pool(transaction)
+
+    # -------------------------------------------------------------------------
+    async def update_user(self, user_id: int, **changes: Any) -> None:
+        """update_user изменяет данные пользователя и уведомляет подписчиков.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            **changes (Any): Изменяемые столбцы и их новые значения.
+
+        Raises:
+            ValueError: Возбуждается если передан неизменяемый или неизвестный столбец.
+        """
+        unknown_columns: List[str] = [
+            column for column in changes if column not in _MUTABLE_COLUMNS
+        ]
+
+        if unknown_columns or not changes:
+            raise ValueError(f"Недопустимые столбцы для изменения: {unknown_columns}")
+
+        columns: List[str] = list(changes)
+        query: str = _UPDATE_USER_TEMPLATE.substitute(
+            assignments=", ".join(f"`{column}` = %s" for column in columns)
+        )
+
+        def transaction(connection: MySQLPooledConnection) -> None:
+            with connection.cursor() as cursor:
+                cursor.execute(query, (*(changes[column] for column in columns), user_id))
+
+        await self.__api.execute_transaction_use_pool(transaction)
+
+        changed: Dict[str, Any] = dict(changes)
+
+        for listener in self.__listeners:
+            listener(user_id, changed)
+
+    # -------------------------------------------------------------------------
+    async def set_banned(self, user_id: int, is_banned: bool) -> None:
+        """set_banned блокирует или разблокирует пользователя.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            is_banned (bool): Новое состояние блокировки.
+        """
+        await self.update_user(user_id, is_banned=is_banned)
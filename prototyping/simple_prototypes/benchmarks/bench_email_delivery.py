@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль bench_email_delivery замеряет пропускную способность отправки писем
+(писем в секунду) на локальный SMTP сервер aiosmtpd: с новым соединением
+для каждого письма и с переиспользованием соединений пула.
+
+Запуск из каталога `simple_prototypes`:
+    python -m benchmarks.bench_email_delivery --emails 2000 --domains 4
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+import socket
+import asyncio
+import argparse
+
+from aiosmtpd.controller import Controller
+from aiosmtplib import SMTP
+
+from typing import List
+
+from prototypes.email_scripts.email_renderer import (
+    EmailRenderer,
+    EmailTemplate,
+    OutgoingEmail,
+)
+from prototypes.email_scripts.email_delivery_engine import EmailDeliveryEngine
+from prototypes.email_scripts.smtp_connection_pool import SMTPConnectionPool
+
+
+# ____________________________________________________________________________
+class SinkHandler:
+    async def handle_DATA(self, server, session, envelope) -> str:
+        return "250 Message accepted for delivery"
+
+
+# ----------------------------------------------------------------------------
+async def send_with_new_connections(
+    emails: List[OutgoingEmail], hostname: str, port: int, concurrency: int
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(email: OutgoingEmail) -> None:
+        async with semaphore:
+            client = SMTP(hostname=hostname, port=port, start_tls=False)
+            await client.connect()
+            await client.sendmail(email.sender, [email.recipient], email.content)
+            await client.quit()
+
+    await asyncio.gather(*(send(email=email) for email in emails))
+
+
+# ----------------------------------------------------------------------------
+async def run_benchmark(
+    emails_amount: int, domains: int, pool_size: int, batch_size: int, port: int
+) -> None:
+    renderer = EmailRenderer(
+        sender="shop@nekoshop.ru",
+        templates={
+            "order": EmailTemplate(
+                subject="Заказ №$order_id выполнен",
+                text="Заказ №$order_id на сумму $price выполнен.",
+                html="<p>Заказ №<b>$order_id</b> выполнен.</p>",
+            )
+        },
+    )
+
+    started_at: float = time.perf_counter()
+    emails: List[OutgoingEmail] = [
+        renderer.render(
+            template_name="order",
+            recipient=f"buyer{index}@domain{index % domains}.ru",
+            values={"order_id": index, "price": "399.00"},
+        )
+        for index in range(emails_amount)
+    ]
+    render_elapsed: float = time.perf_counter() - started_at
+
+    print(
+        f"Писем: {emails_amount}, доменов: {domains}, "
+        f"подготовка: {emails_amount / render_elapsed:10.1f} писем/с"
+    )
+
+    started_at = time.perf_counter()
+    await send_with_new_connections(
+        emails=emails, hostname="127.0.0.1", port=port, concurrency=pool_size
+    )
+    elapsed: float = time.perf_counter() - started_at
+
+    print(f"new connection {elapsed:8.2f} s | {emails_amount / elapsed:10.1f} писем/с")
+
+    engine = EmailDeliveryEngine(
+        pool=SMTPConnectionPool(
+            hostname="127.0.0.1", port=port, size=pool_size, start_tls=False
+        ),
+        per_domain_limit=max(1, pool_size // domains),
+        batch_size=batch_size,
+    )
+
+    started_at = time.perf_counter()
+    errors = await engine.send_many(emails)
+    elapsed = time.perf_counter() - started_at
+
+    await engine.close()
+
+    print(
+        f"pooled engine  {elapsed:8.2f} s | {emails_amount / elapsed:10.1f} писем/с"
+        f" | ошибок: {sum(error is not None for error in errors)}"
+    )
+
+
+# ----------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--emails", type=int, default=2000)
+    parser.add_argument("--domains", type=int, default=4)
+    parser.add_argument("--pool-size", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=20)
+    arguments = parser.parse_args()
+
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        port: int = listener.getsockname()[1]
+
+    controller = Controller(SinkHandler(), hostname="127.0.0.1", port=port)
+    controller.start()
+
+    try:
+        asyncio.run(
+            run_benchmark(
+                emails_amount=arguments.emails,
+                domains=arguments.domains,
+                pool_size=arguments.pool_size,
+                batch_size=arguments.batch_size,
+                port=port,
+            )
+        )
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль bench_job_executor сравнивает задержку цикла событий при массовой обработке
+загрузок: в обработчике (в цикле событий) и в пуле процессов JobExecutor.
+
+Задержка цикла - насколько позже запланированного просыпается периодическая задача.
+Если установлена библиотека Pillow, обрабатываются изображения, иначе формируются отчёты CSV.
+
+Запуск из каталога `simple_prototypes`:
+    python -m benchmarks.bench_job_executor --uploads 200
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import io
+import time
+import random
+import asyncio
+import argparse
+
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from prototypes.job_scripts.cpu_jobs import build_csv_report, make_thumbnail
+from prototypes.job_scripts.job_executor import JobExecutor
+
+
+TICK_SECONDS: float = 0.01
+
+
+# ----------------------------------------------------------------------------
+def make_uploads(amount: int) -> Tuple[Callable[..., Any], List[Tuple[Any, ...]]]:
+    """make_uploads возвращает задачу и различающиеся аргументы для каждой загрузки."""
+    try:
+        from PIL import Image
+    except ImportError:
+        rows = [(index, f"product-{index}", "399.00") for index in range(20_000)]
+
+        return build_csv_report, [
+            (("id", "title", "price"), rows[index:] + rows[:index])
+            for index in range(amount)
+        ]
+
+    uploads: List[Tuple[Any, ...]] = []
+
+    for _ in range(amount):
+        output = io.BytesIO()
+        Image.effect_noise((1600, 1200), random.randint(16, 64)).convert("RGB").save(
+            output, format="JPEG"
+        )
+        uploads.append((output.getvalue(),))
+
+    return make_thumbnail, uploads
+
+
+# ----------------------------------------------------------------------------
+async def measure_loop_lag(
+    process_uploads: Callable[[], Awaitable[None]],
+) -> Tuple[float, List[float]]:
+    """measure_loop_lag выполняет обработку загрузок и замеряет задержку цикла событий.
+
+    Returns:
+        Tuple[float, List[float]]: Время обработки и отсортированные задержки в секундах.
+    """
+    lags: List[float] = []
+    is_finished: bool = False
+
+    async def ticker() -> None:
+        while not is_finished:
+            expected: float = time.perf_counter() + TICK_SECONDS
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append(max(0.0, time.perf_counter() - expected))
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK_SECONDS)
+
+    started_at: float = time.perf_counter()
+    await process_uploads()
+    elapsed: float = time.perf_counter() - started_at
+
+    is_finished = True
+    await ticker_task
+
+    return elapsed, sorted(lags)
+
+
+# ----------------------------------------------------------------------------
+async def run_benchmark(uploads_amount: int, max_workers: int) -> None:
+    function, uploads = make_uploads(amount=uploads_amount)
+    executor = JobExecutor(max_workers=max_workers or None)
+
+    async def inline() -> None:
+        for arguments in uploads:
+            function(*arguments)
+            await asyncio.sleep(0)
+
+    async def offloaded() -> None:
+        await asyncio.gather(
+            *(executor.run(function, *arguments, use_cache=False) for arguments in uploads)
+        )
+
+    # Процессы пула запускаются до замера.
+    await asyncio.gather(*(executor.run(function, *uploads[0]) for _ in range(2)))
+
+    print(f"Задача: {function.__name__}, загрузок: {uploads_amount}")
+
+    for name, process_uploads in (("inline", inline), ("process pool", offloaded)):
+        elapsed, lags = await measure_loop_lag(process_uploads=process_uploads)
+
+        print(
+            f"{name:<13} {elapsed:8.2f} s | lag p50 {lags[len(lags) // 2] * 1000:8.2f} ms"
+            f" | p99 {lags[int(len(lags) * 0.99)] * 1000:8.2f} ms"
+            f" | max {lags[-1] * 1000:8.2f} ms"
+        )
+
+    await executor.close()
+
+
+# ----------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uploads", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=0)
+    arguments = parser.parse_args()
+
+    asyncio.run(
+        run_benchmark(uploads_amount=arguments.uploads, max_workers=arguments.workers)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль bench_localization сравнивает время вывода одного сообщения
+скомпилированными каталогами, gettext и fluent (если установлен `fluent.runtime`).
+
+Запуск из каталога `simple_prototypes`:
+    python -m benchmarks.bench_localization --iterations 200000
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import io
+import json
+import struct
+import gettext
+import argparse
+import timeit
+
+from typing import Any, Callable, Dict, List, Tuple
+
+from prototypes.localization_scripts.catalogue_compiler import PATH_TO_LOCALES_DIR
+from prototypes.localization_scripts.localizer import Localizer
+
+
+LANGUAGE_CODE: str = "en"
+MESSAGES: List[Tuple[str, Dict[str, Any]]] = [
+    ("catalogue.title", {}),
+    ("start.greeting", {"name": "Neko"}),
+    ("order.created", {"order_id": 1024, "total_price": "499.00"}),
+    (
+        "catalogue.product_card",
+        {"title": "Nitro", "description": "Подписка на месяц", "price": "399.00"},
+    ),
+]
+
+
+# ----------------------------------------------------------------------------
+def load_source_catalogue(language_code: str) -> Dict[str, str]:
+    with open(f"{PATH_TO_LOCALES_DIR}/{language_code}.json", encoding="utf-8") as file:
+        return json.load(file)
+
+
+# ----------------------------------------------------------------------------
+def build_mo_file(catalogue: Dict[str, str]) -> bytes:
+    """build_mo_file собирает .mo файл gettext в памяти (аналог утилиты msgfmt)."""
+    catalogue = {"": "Content-Type: text/plain; charset=UTF-8\n", **catalogue}
+    keys: List[bytes] = [key.encode() for key in sorted(catalogue)]
+    values: List[bytes] = [catalogue[key].encode() for key in sorted(catalogue)]
+
+    keys_start: int = 7 * 4 + 16 * len(keys)
+    values_start: int = keys_start + sum(len(key) + 1 for key in keys)
+
+    keys_table: List[int] = []
+    offset: int = keys_start
+    for key in keys:
+        keys_table += [len(key), offset]
+        offset += len(key) + 1
+
+    values_table: List[int] = []
+    offset = values_start
+    for value in values:
+        values_table += [len(value), offset]
+        offset += len(value) + 1
+
+    header: bytes = struct.pack(
+        "Iiiiiii", 0x950412DE, 0, len(keys), 7 * 4, 7 * 4 + 8 * len(keys), 0, 0
+    )
+
+    return (
+        header
+        + struct.pack(f"{len(keys_table)}i", *keys_table)
+        + struct.pack(f"{len(values_table)}i", *values_table)
+        + b"".join(key + b"\0" for key in keys)
+        + b"".join(value + b"\0" for value in values)
+    )
+
+
+# ----------------------------------------------------------------------------
+def make_compiled_render() -> Callable[[str, Dict[str, Any]], str]:
+    translator = Localizer().get_translator(language_code=LANGUAGE_CODE)
+
+    return lambda key, values: translator.render(key, **values)
+
+
+# ----------------------------------------------------------------------------
+def make_gettext_render() -> Callable[[str, Dict[str, Any]], str]:
+    translations = gettext.GNUTranslations(
+        io.BytesIO(build_mo_file(load_source_catalogue(language_code=LANGUAGE_CODE)))
+    )
+    translate: Callable[[str], str] = translations.gettext
+
+    return lambda key, values: translate(key).format(**values)
+
+
+# ----------------------------------------------------------------------------
+def make_fluent_render() -> Callable[[str, Dict[str, Any]], str]:
+    from fluent.runtime import FluentBundle, FluentResource
+
+    catalogue: Dict[str, str] = load_source_catalogue(language_code=LANGUAGE_CODE)
+    source: str = "".join(
+        f"{key.replace('.', '-')} = "
+        + template.replace("{", "{ $").replace("}", " }").replace("\n", "\n    ")
+        + "\n"
+        for key, template in catalogue.items()
+    )
+
+    bundle = FluentBundle([LANGUAGE_CODE], use_isolating=False)
+    bundle.add_resource(FluentResource(source))
+
+    def render(key: str, values: Dict[str, Any]) -> str:
+        message = bundle.get_message(key.replace(".", "-"))
+        text, _ = bundle.format_pattern(message.value, values)
+
+        return text
+
+    return render
+
+
+# ----------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    arguments = parser.parse_args()
+
+    renderers: Dict[str, Callable[[], Callable[[str, Dict[str, Any]], str]]] = {
+        "compiled": make_compiled_render,
+        "gettext": make_gettext_render,
+        "fluent": make_fluent_render,
+    }
+
+    for name, make_render in renderers.items():
+        try:
+            render = make_render()
+        except ImportError:
+            print(f"{name:<10} пропущен: библиотека не установлена")
+            continue
+
+        for key, values in MESSAGES:
+            elapsed: float = timeit.timeit(
+                lambda: render(key, values), number=arguments.iterations
+            )
+
+            print(
+                f"{name:<10} {key:<24} "
+                f"{elapsed / arguments.iterations * 1e9:10.1f} ns/message"
+            )
+
+
+if __name__ == "__main__":
+    main()
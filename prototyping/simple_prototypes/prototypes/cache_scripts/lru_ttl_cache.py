@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль lru_ttl_cache предоставляет кэш ограниченного размера,
+вытесняющий давно неиспользованные записи (LRU) и записи с истёкшим сроком жизни (TTL).
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["LRUTTLCache"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+
+# ____________________________________________________________________________
+class LRUTTLCache[KeyType, ValueType]:
+    """LRUTTLCache класс кэша с ограничением размера и срока жизни записей.
+
+    Значение None сохраняется как отрицательная запись (например, "пользователь не найден")
+    со своим, обычно более коротким, сроком жизни.
+
+    *Кэш не использует блокировки и рассчитан на работу в одном цикле событий.
+
+    Attributes:
+        __entries (OrderedDict[KeyType, Tuple[float, Optional[ValueType]]]): Записи:
+            ключ -> (момент истечения срока жизни, значение).
+        __max_size (int): Максимальное количество записей.
+        __ttl_seconds (float): Срок жизни записи со значением.
+        __negative_ttl_seconds (float): Срок жизни отрицательной записи.
+        __clock (Callable[[], float]): Функция получения текущего времени.
+    """
+
+    __entries: "OrderedDict[KeyType, Tuple[float, Optional[ValueType]]]"
+    __max_size: int
+    __ttl_seconds: float
+    __negative_ttl_seconds: float
+    __clock: Callable[[], float]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        negative_ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            max_size (int): Максимальное количество записей.
+            ttl_seconds (float): Срок жизни записи со значением.
+            negative_ttl_seconds (Optional[float], optional): Срок жизни отрицательной записи.
+                                                              По умолчанию равен ttl_seconds.
+            clock (Callable[[], float], optional): Функция получения текущего времени.
+                                                   По умолчанию time.monotonic.
+
+        Raises:
+            ValueError: Возбуждается если размер кэша меньше единицы.
+        """
+        if max_size < 1:
+            raise ValueError("Размер кэша должен быть больше нуля!")
+
+        self.__entries = OrderedDict()
+        self.__max_size = max_size
+        self.__ttl_seconds = ttl_seconds
+        self.__negative_ttl_seconds = (
+            ttl_seconds if negative_ttl_seconds is None else negative_ttl_seconds
+        )
+        self.__clock = clock
+
+    # -------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    # -------------------------------------------------------------------------
+    def __contains__(self, key: KeyType) -> bool:
+        return self.lookup(key=key)[0]
+
+    # -------------------------------------------------------------------------
+    def lookup(self, key: KeyType) -> Tuple[bool, Optional[ValueType]]:
+        """lookup ищет запись в кэше.
+
+        Args:
+            key (KeyType): Ключ записи.
+
+        Returns:
+            Tuple[bool, Optional[ValueType]]: Найдена ли действующая запись и её значение.
+                                              Для отрицательной записи - (True, None).
+        """
+        entry: Optional[Tuple[float, Optional[ValueType]]] = self.__entries.get(key)
+
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+
+        if expires_at <= self.__clock():
+            del self.__entries[key]
+            return False, None
+
+        self.__entries.move_to_end(key)
+
+        return True, value
+
+    # -------------------------------------------------------------------------
+    def get(
+        self, key: KeyType, default: Optional[ValueType] = None
+    ) -> Optional[ValueType]:
+        """get возвращает значение записи.
+
+        Args:
+            key (KeyType): Ключ записи.
+            default (Optional[ValueType], optional): Значение при отсутствии записи.
+
+        Returns:
+            Optional[ValueType]: Значение записи, либо default.
+        """
+        is_found, value = self.lookup(key=key)
+
+        return value if is_found else default
+
+    # -------------------------------------------------------------------------
+    def set(self, key: KeyType, value: Optional[ValueType]) -> None:
+        """set сохраняет запись, вытесняя самую давно использованную при переполнении.
+
+        Args:
+            key (KeyType): Ключ записи.
+            value (Optional[ValueType]): Значение; None сохраняется как отрицательная запись.
+        """
+        ttl_seconds: float = (
+            self.__negative_ttl_seconds if value is None else self.__ttl_seconds
+        )
+
+        self.__entries[key] = (self.__clock() + ttl_seconds, value)
+        self.__entries.move_to_end(key)
+
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+    # -------------------------------------------------------------------------
+    def invalidate(self, key: KeyType) -> bool:
+        """invalidate удаляет запись из кэша.
+
+        Args:
+            key (KeyType): Ключ записи.
+
+        Returns:
+            bool: True, если запись находилась в кэше.
+        """
+        return self.__entries.pop(key, None) is not None
+
+    # -------------------------------------------------------------------------
+    def clear(self) -> None:
+        """clear удаляет все записи из кэша."""
+        self.__entries.clear()
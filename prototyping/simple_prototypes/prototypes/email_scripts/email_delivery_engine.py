@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль email_delivery_engine используется для отправки писем уведомлений
+пакетами через пул соединений SMTP с ограничением одновременной отправки
+на каждый домен получателей.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["EmailDeliveryEngine"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+
+from aiosmtplib import SMTPRecipientsRefused, SMTPResponseException
+
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from collections import deque
+
+from prototypes.email_scripts.email_renderer import OutgoingEmail
+from prototypes.email_scripts.smtp_connection_pool import SMTPConnectionPool
+
+
+# Код ответа SMTP: сервер закрывает соединение.
+_SERVICE_NOT_AVAILABLE_CODE: int = 421
+
+# Письмо, ожидающее отправки: письмо, результат и количество неудачных попыток.
+_QueuedEmailType = Tuple[OutgoingEmail, "asyncio.Future[None]", int]
+
+
+# ____________________________________________________________________________
+class EmailDeliveryEngine:
+    """EmailDeliveryEngine класс отправки писем.
+
+    Письма группируются по домену получателя. Для каждого домена запускается
+    не более per_domain_limit задач отправки, каждая задача отправляет письма
+    пакетами по batch_size через одно соединение пула, пока очередь домена не опустеет.
+
+    Ошибка, относящаяся к письму (получатель отклонён, письмо не принято),
+    передаётся в результат письма без повтора. Письма пакета, не отправленные
+    из-за потери соединения, возвращаются в начало очереди домена и повторяются
+    до max_attempts раз.
+
+    Attributes:
+        __pool (SMTPConnectionPool): Пул соединений SMTP.
+        __per_domain_limit (int): Максимальное количество задач отправки на домен.
+        __batch_size (int): Количество писем, отправляемых через соединение за раз.
+        __max_attempts (int): Количество попыток отправки при потере соединения.
+        __retry_delay (float): Задержка перед повтором после потери соединения.
+        __queues (Dict[str, Deque[_QueuedEmailType]]): Очереди писем по домену.
+        __active (Dict[str, int]): Количество задач отправки по домену.
+        __tasks (Set[asyncio.Task]): Задачи отправки.
+    """
+
+    __pool: SMTPConnectionPool
+    __per_domain_limit: int
+    __batch_size: int
+    __max_attempts: int
+    __retry_delay: float
+    __queues: Dict[str, Deque[_QueuedEmailType]]
+    __active: Dict[str, int]
+    __tasks: Set[asyncio.Task]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        pool: SMTPConnectionPool,
+        per_domain_limit: int = 2,
+        batch_size: int = 20,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            pool (SMTPConnectionPool): Пул соединений SMTP.
+            per_domain_limit (int, optional): Максимальное количество задач отправки
+                                              на домен. По умолчанию 2.
+            batch_size (int, optional): Количество писем за одно получение соединения.
+                                        По умолчанию 20.
+            max_attempts (int, optional): Количество попыток при потере соединения.
+                                          По умолчанию 3.
+            retry_delay (float, optional): Задержка перед повтором, умножаемая
+                                           на номер попытки. По умолчанию 1.0.
+
+        Raises:
+            ValueError: Возбуждается если ограничения меньше 1.
+        """
+        if min(per_domain_limit, batch_size, max_attempts) < 1:
+            raise ValueError("Ограничения отправки писем должны быть больше нуля!")
+
+        self.__pool = pool
+        self.__per_domain_limit = per_domain_limit
+        self.__batch_size = batch_size
+        self.__max_attempts = max_attempts
+        self.__retry_delay = retry_delay
+        self.__queues = {}
+        self.__active = {}
+        self.__tasks = set()
+
+    # -------------------------------------------------------------------------
+    @property
+    def pending_amount(self) -> int:
+        return sum(len(queue) for queue in self.__queues.values())
+
+    # -------------------------------------------------------------------------
+    def submit(self, email: OutgoingEmail) -> "asyncio.Future[None]":
+        """submit добавляет письмо в очередь отправки.
+
+        Args:
+            email (OutgoingEmail): Письмо.
+
+        Returns:
+            asyncio.Future[None]: Результат отправки; содержит исключение,
+                                  если письмо не отправлено.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        self.__queues.setdefault(email.domain, deque()).append((email, future, 0))
+        self.__schedule(domain=email.domain)
+
+        return future
+
+    # -------------------------------------------------------------------------
+    async def send(self, email: OutgoingEmail) -> None:
+        """send отправляет письмо, ожидая результата.
+
+        Args:
+            email (OutgoingEmail): Письмо.
+
+        Raises:
+            aiosmtplib.SMTPException: Возбуждается если письмо не отправлено.
+        """
+        await self.submit(email=email)
+
+    # -------------------------------------------------------------------------
+    async def send_many(
+        self, emails: Iterable[OutgoingEmail]
+    ) -> List[Optional[BaseException]]:
+        """send_many отправляет письма, ожидая результата всех писем.
+
+        Args:
+            emails (Iterable[OutgoingEmail]): Письма.
+
+        Returns:
+            List[Optional[BaseException]]: Ошибки в порядке писем; None - письмо отправлено.
+        """
+        results = await asyncio.gather(
+            *(self.submit(email=email) for email in emails), return_exceptions=True
+        )
+
+        return list(results)  # type: ignore
+
+    # -------------------------------------------------------------------------
+    async def close(self) -> None:
+        """close дожидается отправки писем из очереди и закрывает пул соединений."""
+        # Задачи могут запускаться повторно при возврате писем в очередь.
+        while self.__tasks:
+            tasks: List[asyncio.Task] = list(self.__tasks)
+            self.__tasks.difference_update(tasks)
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        await self.__pool.close()
+
+    # -------------------------------------------------------------------------
+    def __schedule(self, domain: str) -> None:
+        """__schedule запускает задачи отправки домена, если очередь больше пакета."""
+        queue: Deque[_QueuedEmailType] = self.__queues[domain]
+
+        while (
+            self.__active.get(domain, 0) < self.__per_domain_limit
+            and len(queue) > self.__active.get(domain, 0) * self.__batch_size
+        ):
+            self.__active[domain] = self.__active.get(domain, 0) + 1
+
+            task: asyncio.Task = asyncio.create_task(self.__run_domain(domain=domain))
+            self.__tasks.add(task)
+            task.add_done_callback(self.__tasks.discard)
+
+    # -------------------------------------------------------------------------
+    async def __run_domain(self, domain: str) -> None:
+        """__run_domain отправляет письма домена пакетами, пока очередь не опустеет."""
+        queue: Deque[_QueuedEmailType] = self.__queues[domain]
+
+        try:
+            while queue:
+                batch: List[_QueuedEmailType] = [
+                    queue.popleft() for _ in range(min(self.__batch_size, len(queue)))
+                ]
+
+                if not await self.__send_batch(queue=queue, batch=batch):
+                    await asyncio.sleep(self.__retry_delay * (batch[0][2] + 1))
+
+        finally:
+            self.__active[domain] -= 1
+
+            if not self.__active[domain]:
+                del self.__active[domain]
+
+                if not queue:
+                    del self.__queues[domain]
+                else:
+                    self.__schedule(domain=domain)
+
+    # -------------------------------------------------------------------------
+    async def __send_batch(
+        self, queue: Deque[_QueuedEmailType], batch: List[_QueuedEmailType]
+    ) -> bool:
+        """__send_batch отправляет пакет писем через одно соединение.
+
+        Returns:
+            bool: False - соединение потеряно, неотправленные письма возвращены в очередь.
+        """
+        sent: int = 0
+
+        try:
+            async with self.__pool.acquire() as connection:
+                for email, future, _ in batch:
+                    if not future.done():
+                        try:
+                            await connection.send(email=email)
+
+                        except SMTPRecipientsRefused as error:
+                            future.set_exception(error)
+
+                        except SMTPResponseException as error:
+                            if error.code == _SERVICE_NOT_AVAILABLE_CODE:
+                                raise
+
+                            future.set_exception(error)
+
+                        else:
+                            future.set_result(None)
+
+                    sent += 1
+
+        except Exception as error:
+            retried: List[_QueuedEmailType] = []
+
+            for email, future, attempts in batch[sent:]:
+                if future.done():
+                    continue
+
+                if attempts + 1 >= self.__max_attempts:
+                    future.set_exception(error)
+                else:
+                    retried.append((email, future, attempts + 1))
+
+            queue.extendleft(reversed(retried))
+
+            return not retried
+
+        return True
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль email_renderer используется для подготовки писем уведомлений
+(заказы, модерация) из шаблонов, разобранных и проверенных один раз при запуске.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "EmailTemplate",
+    "OutgoingEmail",
+    "EmailRenderer",
+    "normalize_address",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import html
+import base64
+import secrets
+
+from dataclasses import dataclass
+from email.utils import formatdate, make_msgid
+from string import Template
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+
+# ____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class EmailTemplate:
+    """EmailTemplate класс шаблона письма.
+
+    Подстановки записываются в формате string.Template: `$order_id`, `${order_id}`.
+
+    Attributes:
+        subject (str): Шаблон темы письма.
+        text (str): Шаблон текстовой версии письма.
+        html (Optional[str]): Шаблон HTML версии письма. По умолчанию None.
+    """
+
+    subject: str
+    text: str
+    html: Optional[str] = None
+
+
+# ____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class OutgoingEmail:
+    """OutgoingEmail класс подготовленного к отправке письма.
+
+    Attributes:
+        sender (str): Адрес отправителя.
+        recipient (str): Адрес получателя.
+        content (bytes): Письмо в формате для передачи по SMTP.
+    """
+
+    sender: str
+    recipient: str
+    content: bytes
+
+    # -------------------------------------------------------------------------
+    @property
+    def domain(self) -> str:
+        return self.recipient.rpartition("@")[2].lower()
+
+
+# Длина части значения заголовка в байтах UTF-8, при которой строка закодированного
+# слова RFC 2047 вместе с именем заголовка не превышает 78 символов.
+_ENCODED_WORD_BYTES: int = 39
+
+
+# ----------------------------------------------------------------------------
+def _encode_header(value: str) -> str:
+    """_encode_header кодирует значение заголовка по RFC 2047, если оно не ASCII."""
+    value = " ".join(value.split())
+
+    if value.isascii() and len(value) <= 76:
+        return value
+
+    words: List[str] = []
+    chunk: str = ""
+
+    # Строка делится по символам, чтобы не разрывать многобайтовые символы.
+    for symbol in value:
+        if len((chunk + symbol).encode("utf-8")) > _ENCODED_WORD_BYTES:
+            words.append(chunk)
+            chunk = ""
+
+        chunk += symbol
+
+    words.append(chunk)
+
+    return "\r\n ".join(
+        f"=?utf-8?b?{base64.b64encode(word.encode('utf-8')).decode('ascii')}?="
+        for word in words
+    )
+
+
+# ----------------------------------------------------------------------------
+def _encode_text_part(subtype: str, text: str) -> str:
+    """_encode_text_part возвращает текстовую часть письма в кодировке base64."""
+    content: bytes = text.replace("\r\n", "\n").replace("\n", "\r\n").encode("utf-8")
+
+    return (
+        f'Content-Type: text/{subtype}; charset="utf-8"\r\n'
+        "Content-Transfer-Encoding: base64\r\n\r\n"
+        + base64.encodebytes(content).decode("ascii").replace("\n", "\r\n")
+    )
+
+
+# ----------------------------------------------------------------------------
+def normalize_address(address: str) -> str:
+    """normalize_address проверяет адрес и переводит домен в ASCII (IDNA).
+
+    Args:
+        address (str): Адрес электронной почты.
+
+    Raises:
+        ValueError: Возбуждается если адрес некорректен.
+
+    Returns:
+        str: Адрес, пригодный для заголовка и команд SMTP.
+    """
+    local_part, separator, domain = address.strip().rpartition("@")
+
+    if (
+        not separator
+        or not local_part
+        or not local_part.isascii()
+        or not domain
+        or any(symbol in address for symbol in "\r\n<>, ")
+    ):
+        raise ValueError(f"Некорректный адрес электронной почты: {address!r}")
+
+    try:
+        domain = domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        raise ValueError(f"Некорректный домен электронной почты: {address!r}") from None
+
+    return f"{local_part}@{domain.lower()}"
+
+
+# ____________________________________________________________________________
+class EmailRenderer:
+    """EmailRenderer класс подготовки писем из шаблонов.
+
+    Шаблоны разбираются и проверяются в конструкторе, поэтому ошибка в шаблоне
+    обнаруживается при запуске, а не при первом уведомлении.
+
+    Структура MIME письма (заголовки, разделитель частей) формируется один раз,
+    при подготовке письма выполняются только подстановки и кодирование частей в base64.
+    Письмо кодируется один раз для набора значений: для каждого получателя
+    к готовому содержимому добавляются только заголовки `To` и `Message-ID`.
+
+    Attributes:
+        __sender (str): Адрес отправителя.
+        __message_id_domain (str): Домен идентификаторов писем.
+        __boundary (str): Разделитель частей письма с HTML версией.
+        __templates (Dict[str, Tuple[Template, Template, Optional[Template]]]):
+            Разобранные шаблоны темы, текста и HTML по имени.
+        __identifiers (Dict[str, Set[str]]): Подстановки каждого шаблона.
+    """
+
+    __sender: str
+    __message_id_domain: str
+    __boundary: str
+    __templates: Dict[str, Tuple[Template, Template, Optional[Template]]]
+    __identifiers: Dict[str, Set[str]]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        sender: str,
+        templates: Mapping[str, EmailTemplate],
+        message_id_domain: Optional[str] = None,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            sender (str): Адрес отправителя.
+            templates (Mapping[str, EmailTemplate]): Шаблоны писем по имени.
+            message_id_domain (Optional[str], optional): Домен идентификаторов писем.
+                                                         По умолчанию домен отправителя.
+
+        Raises:
+            ValueError: Возбуждается если адрес отправителя или шаблон некорректен.
+        """
+        self.__sender = normalize_address(address=sender)
+        # make_msgid без домена определяет имя хоста при каждом вызове.
+        self.__message_id_domain = message_id_domain or self.__sender.rpartition("@")[2]
+        # Части кодируются в base64, поэтому разделитель не может встретиться в содержимом.
+        self.__boundary = f"=_nekoshop_{secrets.token_hex(8)}"
+        self.__templates = {}
+        self.__identifiers = {}
+
+        for name, email_template in templates.items():
+            parts: List[Optional[Template]] = [
+                None if part is None else Template(part)
+                for part in (email_template.subject, email_template.text, email_template.html)
+            ]
+            identifiers: Set[str] = set()
+
+            for part in parts:
+                if part is None:
+                    continue
+
+                if not part.is_valid():
+                    raise ValueError(f"Некорректный шаблон письма: {name}")
+
+                identifiers.update(part.get_identifiers())
+
+            self.__templates[name] = (parts[0], parts[1], parts[2])  # type: ignore
+            self.__identifiers[name] = identifiers
+
+    # -------------------------------------------------------------------------
+    @property
+    def template_names(self) -> List[str]:
+        return list(self.__templates)
+
+    # -------------------------------------------------------------------------
+    def render_content(self, template_name: str, values: Mapping[str, Any]) -> bytes:
+        """render_content подготавливает общее для всех получателей содержимое письма.
+
+        Args:
+            template_name (str): Имя шаблона.
+            values (Mapping[str, Any]): Значения подстановок.
+
+        Raises:
+            KeyError: Возбуждается если шаблон не найден, либо не хватает значений.
+
+        Returns:
+            bytes: Письмо без заголовков `To` и `Message-ID`.
+        """
+        if template_name not in self.__templates:
+            raise KeyError(f"Шаблон письма не найден: {template_name}")
+
+        missing: Set[str] = self.__identifiers[template_name] - set(values)
+
+        if missing:
+            raise KeyError(
+                f"Не хватает значений для шаблона {template_name}: {sorted(missing)}"
+            )
+
+        subject, text, html_template = self.__templates[template_name]
+
+        headers: str = (
+            f"From: {self.__sender}\r\n"
+            f"Subject: {_encode_header(subject.substitute(values))}\r\n"
+            f"Date: {formatdate(localtime=True)}\r\n"
+            "MIME-Version: 1.0\r\n"
+        )
+        text_part: str = _encode_text_part(subtype="plain", text=text.substitute(values))
+
+        if html_template is None:
+            return (headers + text_part).encode("ascii")
+
+        html_part: str = _encode_text_part(
+            subtype="html",
+            text=html_template.substitute(
+                {key: html.escape(str(value)) for key, value in values.items()}
+            ),
+        )
+
+        return (
+            f"{headers}"
+            f'Content-Type: multipart/alternative; boundary="{self.__boundary}"\r\n\r\n'
+            f"--{self.__boundary}\r\n{text_part}\r\n"
+            f"--{self.__boundary}\r\n{html_part}\r\n"
+            f"--{self.__boundary}--\r\n"
+        ).encode("ascii")
+
+    # -------------------------------------------------------------------------
+    def render_many(
+        self, template_name: str, recipients: Iterable[str], values: Mapping[str, Any]
+    ) -> List[OutgoingEmail]:
+        """render_many подготавливает одинаковые письма для нескольких получателей.
+
+        Args:
+            template_name (str): Имя шаблона.
+            recipients (Iterable[str]): Адреса получателей.
+            values (Mapping[str, Any]): Значения подстановок.
+
+        Raises:
+            KeyError: Возбуждается если шаблон не найден, либо не хватает значений.
+            ValueError: Возбуждается если адрес получателя некорректен.
+
+        Returns:
+            List[OutgoingEmail]: Письма в порядке получателей.
+        """
+        content: bytes = self.render_content(template_name=template_name, values=values)
+        emails: List[OutgoingEmail] = []
+
+        for recipient in recipients:
+            address: str = normalize_address(address=recipient)
+            headers: str = (
+                f"To: {address}\r\n"
+                f"Message-ID: {make_msgid(domain=self.__message_id_domain)}\r\n"
+            )
+
+            emails.append(
+                OutgoingEmail(
+                    sender=self.__sender,
+                    recipient=address,
+                    content=headers.encode("ascii") + content,
+                )
+            )
+
+        return emails
+
+    # -------------------------------------------------------------------------
+    def render(
+        self, template_name: str, recipient: str, values: Mapping[str, Any]
+    ) -> OutgoingEmail:
+        """render подготавливает письмо для одного получателя.
+
+        Args:
+            template_name (str): Имя шаблона.
+            recipient (str): Адрес получателя.
+            values (Mapping[str, Any]): Значения подстановок.
+
+        Returns:
+            OutgoingEmail: Письмо.
+        """
+        return self.render_many(
+            template_name=template_name, recipients=(recipient,), values=values
+        )[0]
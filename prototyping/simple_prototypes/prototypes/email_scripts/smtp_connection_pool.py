@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль smtp_connection_pool используется для переиспользования соединений
+с SMTP сервером: установка соединения (TCP, TLS, EHLO, AUTH) выполняется
+один раз на множество писем, а не для каждого письма.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["SMTPConnection", "SMTPConnectionPool"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+import asyncio
+import contextlib
+
+from aiosmtplib import SMTP
+
+from typing import AsyncIterator, Deque, Optional
+
+from collections import deque
+
+from prototypes.email_scripts.email_renderer import OutgoingEmail
+
+
+# ____________________________________________________________________________
+class SMTPConnection:
+    """SMTPConnection класс соединения пула.
+
+    Attributes:
+        __client (SMTP): Клиент SMTP.
+        __messages_sent (int): Количество отправленных через соединение писем.
+        __released_at (float): Время возврата соединения в пул.
+    """
+
+    __client: SMTP
+    __messages_sent: int
+    __released_at: float
+
+    # -------------------------------------------------------------------------
+    def __init__(self, client: SMTP) -> None:
+        self.__client = client
+        self.__messages_sent = 0
+        self.__released_at = time.monotonic()
+
+    # -------------------------------------------------------------------------
+    @property
+    def client(self) -> SMTP:
+        return self.__client
+
+    # -------------------------------------------------------------------------
+    @property
+    def messages_sent(self) -> int:
+        return self.__messages_sent
+
+    # -------------------------------------------------------------------------
+    @property
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self.__released_at
+
+    # -------------------------------------------------------------------------
+    async def send(self, email: OutgoingEmail) -> None:
+        """send отправляет письмо.
+
+        Args:
+            email (OutgoingEmail): Письмо.
+
+        Raises:
+            aiosmtplib.SMTPException: Возбуждается если письмо не принято сервером,
+                                      либо соединение потеряно.
+        """
+        await self.__client.sendmail(email.sender, [email.recipient], email.content)
+
+        self.__messages_sent += 1
+
+    # -------------------------------------------------------------------------
+    def mark_released(self) -> None:
+        self.__released_at = time.monotonic()
+
+
+# ____________________________________________________________________________
+class SMTPConnectionPool:
+    """SMTPConnectionPool класс пула соединений с SMTP сервером.
+
+    Соединения открываются лениво и возвращаются в пул после использования.
+    Соединение закрывается, если оно простаивало дольше idle_timeout
+    (серверы разрывают простаивающие соединения), отправило
+    max_messages_per_connection писем, либо при его использовании возникла ошибка.
+
+    Attributes:
+        __hostname (str): Адрес SMTP сервера.
+        __port (int): Порт SMTP сервера.
+        __username (Optional[str]): Имя пользователя для аутентификации.
+        __password (Optional[str]): Пароль для аутентификации.
+        __use_tls (bool): Использовать ли TLS с момента подключения.
+        __start_tls (Optional[bool]): Использовать ли STARTTLS; None - если поддерживается.
+        __timeout (float): Время ожидания ответа сервера в секундах.
+        __idle_timeout (float): Максимальное время простоя соединения в секундах.
+        __max_messages_per_connection (int): Максимальное количество писем на соединение.
+        __idle (Deque[SMTPConnection]): Простаивающие соединения.
+        __semaphore (asyncio.Semaphore): Ограничение количества соединений.
+        __is_closed (bool): Закрыт ли пул.
+    """
+
+    __hostname: str
+    __port: int
+    __username: Optional[str]
+    __password: Optional[str]
+    __use_tls: bool
+    __start_tls: Optional[bool]
+    __timeout: float
+    __idle_timeout: float
+    __max_messages_per_connection: int
+    __idle: Deque[SMTPConnection]
+    __semaphore: asyncio.Semaphore
+    __is_closed: bool
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        size: int = 4,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = False,
+        start_tls: Optional[bool] = None,
+        timeout: float = 30.0,
+        idle_timeout: float = 30.0,
+        max_messages_per_connection: int = 100,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            hostname (str): Адрес SMTP сервера.
+            port (int): Порт SMTP сервера.
+            size (int, optional): Максимальное количество соединений. По умолчанию 4.
+            username (Optional[str], optional): Имя пользователя. По умолчанию None.
+            password (Optional[str], optional): Пароль. По умолчанию None.
+            use_tls (bool, optional): Использовать ли TLS с момента подключения.
+                                      По умолчанию False.
+            start_tls (Optional[bool], optional): Использовать ли STARTTLS.
+                                                  По умолчанию None - если поддерживается.
+            timeout (float, optional): Время ожидания ответа сервера. По умолчанию 30.0.
+            idle_timeout (float, optional): Максимальное время простоя соединения.
+                                            По умолчанию 30.0.
+            max_messages_per_connection (int, optional): Максимальное количество писем
+                                                         на соединение. По умолчанию 100.
+
+        Raises:
+            ValueError: Возбуждается если размер пула меньше 1.
+        """
+        if size < 1 or max_messages_per_connection < 1:
+            raise ValueError("Ограничения пула соединений должны быть больше нуля!")
+
+        self.__hostname = hostname
+        self.__port = port
+        self.__username = username
+        self.__password = password
+        self.__use_tls = use_tls
+        self.__start_tls = start_tls
+        self.__timeout = timeout
+        self.__idle_timeout = idle_timeout
+        self.__max_messages_per_connection = max_messages_per_connection
+        self.__idle = deque()
+        self.__semaphore = asyncio.Semaphore(size)
+        self.__is_closed = False
+
+    # -------------------------------------------------------------------------
+    @property
+    def idle_amount(self) -> int:
+        return len(self.__idle)
+
+    # -------------------------------------------------------------------------
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[SMTPConnection]:
+        """acquire выдаёт соединение из пула, ожидая освобождения при необходимости.
+
+        *Если в блоке возникла ошибка, соединение закрывается, а не возвращается в пул.
+
+        Raises:
+            RuntimeError: Возбуждается если пул закрыт.
+
+        Yields:
+            SMTPConnection: Подключённое соединение.
+        """
+        async with self.__semaphore:
+            if self.__is_closed:
+                raise RuntimeError("Пул соединений SMTP закрыт!")
+
+            connection: SMTPConnection = await self.__take_connection()
+
+            try:
+                yield connection
+
+            except BaseException:
+                connection.client.close()
+                raise
+
+            if (
+                self.__is_closed
+                or not connection.client.is_connected
+                or connection.messages_sent >= self.__max_messages_per_connection
+            ):
+                await self.__quit(connection=connection)
+            else:
+                connection.mark_released()
+                self.__idle.append(connection)
+
+    # -------------------------------------------------------------------------
+    async def close(self) -> None:
+        """close закрывает простаивающие соединения и запрещает выдачу новых."""
+        self.__is_closed = True
+
+        while self.__idle:
+            await self.__quit(connection=self.__idle.pop())
+
+    # -------------------------------------------------------------------------
+    async def __take_connection(self) -> SMTPConnection:
+        # Последнее возвращённое соединение простаивало меньше всего.
+        while self.__idle:
+            connection: SMTPConnection = self.__idle.pop()
+
+            if (
+                connection.client.is_connected
+                and connection.idle_seconds < self.__idle_timeout
+            ):
+                return connection
+
+            connection.client.close()
+
+        client = SMTP(
+            hostname=self.__hostname,
+            port=self.__port,
+            username=self.__username,
+            password=self.__password,
+            use_tls=self.__use_tls,
+            start_tls=self.__start_tls,
+            timeout=self.__timeout,
+        )
+        await client.connect()
+
+        return SMTPConnection(client=client)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    async def __quit(connection: SMTPConnection) -> None:
+        try:
+            await connection.client.quit()
+        except Exception:
+            connection.client.close()
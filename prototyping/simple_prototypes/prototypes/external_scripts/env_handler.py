@@ -11,6 +11,7 @@ Copyright 2024 HyacinthusIO
 
 __all__: list[str] = [
     "load_env_file",
+    "read_env_file",
     "get_key_value_from_environment",
     "normalize_env_value_type",
 ]
@@ -21,7 +22,7 @@ __version__ = "1.0.0"
 import os
 import dotenv
 
-from typing import Union
+from typing import Dict, Union
 
 
 # ----------------------------------------------------------------------------
@@ -46,6 +47,34 @@ def load_env_file(filepath: str) -> bool:
     return dotenv.load_dotenv(dotenv_path=filepath)
 
 
+# ----------------------------------------------------------------------------
+def read_env_file(filepath: str) -> Dict[str, str]:
+    """read_env_file читает пары - [ключ : значение] из '.env' файла.
+
+    Функция разбирает файл имеющий расширение '.env', не загружая пары
+    в виртуальное окружение системы.
+
+    *Ключи без значения (строка `KEY` без знака `=`) пропускаются.
+
+    Args:
+        filepath (str): путь к '.env' файлу.
+
+    Raises:
+        FileNotFoundError: Возбуждается если файл не существует.
+
+    Returns:
+        Dict[str, str]: Пары - [ключ : значение] из файла.
+    """
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"Файл не обнаружен по указанному пути: {filepath}")
+
+    return {
+        key: value
+        for key, value in dotenv.dotenv_values(dotenv_path=filepath).items()
+        if value is not None
+    }
+
+
 # ----------------------------------------------------------------------------
 def get_key_value_from_environment(key: str) -> str:
     """get_key_value_from_environment возвращает значение ключа из окружения.
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль cpu_jobs содержит задачи, нагружающие процессор: обработку изображений товаров
+и формирование отчётов о продажах. Задачи предназначены для выполнения в JobExecutor,
+поэтому объявлены на уровне модуля и принимают/возвращают сериализуемые значения.
+
+*Для обработки изображений необходима библиотека Pillow.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["resize_image", "make_thumbnail", "build_csv_report"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import io
+import csv
+
+from typing import Any, Sequence, Tuple
+
+
+# ----------------------------------------------------------------------------
+def resize_image(
+    image: bytes, max_side: int = 1280, image_format: str = "JPEG", quality: int = 85
+) -> bytes:
+    """resize_image уменьшает изображение, сохраняя пропорции.
+
+    Args:
+        image (bytes): Исходное изображение.
+        max_side (int, optional): Максимальный размер стороны. По умолчанию 1280.
+        image_format (str, optional): Формат результата. По умолчанию "JPEG".
+        quality (int, optional): Качество сжатия. По умолчанию 85.
+
+    Raises:
+        ImportError: Возбуждается если библиотека Pillow не установлена.
+
+    Returns:
+        bytes: Изображение в указанном формате.
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(image)) as source:
+        source.thumbnail((max_side, max_side))
+
+        if image_format == "JPEG" and source.mode not in ("RGB", "L"):
+            source = source.convert("RGB")
+
+        output = io.BytesIO()
+        source.save(output, format=image_format, quality=quality, optimize=True)
+
+    return output.getvalue()
+
+
+# ----------------------------------------------------------------------------
+def make_thumbnail(image: bytes, side: int = 320) -> bytes:
+    """make_thumbnail создаёт миниатюру изображения для карточки товара.
+
+    Args:
+        image (bytes): Исходное изображение.
+        side (int, optional): Максимальный размер стороны. По умолчанию 320.
+
+    Returns:
+        bytes: Миниатюра в формате JPEG.
+    """
+    return resize_image(image=image, max_side=side, quality=75)
+
+
+# ----------------------------------------------------------------------------
+def build_csv_report(header: Sequence[str], rows: Sequence[Tuple[Any, ...]]) -> bytes:
+    """build_csv_report формирует отчёт в формате CSV.
+
+    *Отчёт кодируется в UTF-8 с BOM, чтобы он корректно открывался в табличных редакторах.
+
+    Args:
+        header (Sequence[str]): Названия столбцов.
+        rows (Sequence[Tuple[Any, ...]]): Строки отчёта.
+
+    Returns:
+        bytes: Содержимое CSV файла.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+
+    writer.writerow(header)
+    writer.writerows(rows)
+
+    return output.getvalue().encode("utf-8-sig")
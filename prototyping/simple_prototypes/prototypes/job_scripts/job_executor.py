@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль job_executor используется для выполнения задач, нагружающих процессор,
+в пуле процессов, не блокируя цикл событий бота.
+Результаты задач кэшируются по хэшу содержимого аргументов,
+одновременные одинаковые задачи выполняются один раз.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["JobExecutor", "setup_job_executor"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import os
+import pickle
+import asyncio
+import hashlib
+import multiprocessing
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from aiogram import Dispatcher
+
+from prototypes.cache_scripts.lru_ttl_cache import LRUTTLCache
+
+
+# ____________________________________________________________________________
+class _Job:
+    """_Job класс выполняющейся задачи и количества ожидающих её результат."""
+
+    __slots__ = ("future", "waiters")
+
+    future: asyncio.Future
+    waiters: int
+
+    # -------------------------------------------------------------------------
+    def __init__(self, future: asyncio.Future) -> None:
+        self.future = future
+        self.waiters = 0
+
+
+# ____________________________________________________________________________
+class JobExecutor:
+    """JobExecutor класс для выполнения задач в пуле процессов.
+
+    Количество принятых и ещё не завершённых задач ограничено,
+    при заполнении очереди новые задачи ожидают освобождения места,
+    либо отклоняются (параметр `wait`).
+
+    Задачи передаются пулу только при наличии свободного процесса,
+    поэтому, если все ожидающие результат задачи отменены до её начала,
+    задача не выполняется.
+
+    *Функция задачи должна быть объявлена на уровне модуля,
+    а её аргументы и результат - сериализуемы (pickle).
+
+    Attributes:
+        __executor (ProcessPoolExecutor): Пул процессов.
+        __slots (asyncio.Semaphore): Свободные места для задач (процессы и очередь).
+        __workers (asyncio.Semaphore): Свободные процессы пула.
+        __results (LRUTTLCache[str, Any]): Кэш результатов задач.
+        __jobs (Dict[str, _Job]): Выполняющиеся кэшируемые задачи.
+    """
+
+    __executor: ProcessPoolExecutor
+    __slots: asyncio.Semaphore
+    __workers: asyncio.Semaphore
+    __results: LRUTTLCache[str, Any]
+    __jobs: Dict[str, _Job]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queued: int = 64,
+        cache_size: int = 256,
+        cache_ttl_seconds: float = 3600.0,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            max_workers (Optional[int], optional): Количество процессов.
+                                                   По умолчанию количество ядер.
+            max_queued (int, optional): Количество задач, ожидающих свободный процесс.
+                                        По умолчанию 64.
+            cache_size (int, optional): Количество кэшируемых результатов. По умолчанию 256.
+            cache_ttl_seconds (float, optional): Срок жизни результата. По умолчанию 3600.0.
+
+        Raises:
+            ValueError: Возбуждается если размер очереди отрицательный.
+        """
+        if max_queued < 0:
+            raise ValueError("Размер очереди задач не может быть отрицательным!")
+
+        max_workers = max_workers or os.cpu_count() or 1
+
+        self.__executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self.__slots = asyncio.Semaphore(max_workers + max_queued)
+        self.__workers = asyncio.Semaphore(max_workers)
+        self.__results = LRUTTLCache(
+            max_size=cache_size, ttl_seconds=cache_ttl_seconds
+        )
+        self.__jobs = {}
+
+    # -------------------------------------------------------------------------
+    @property
+    def is_full(self) -> bool:
+        return self.__slots.locked()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def make_key(function: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+        """make_key возвращает ключ результата задачи - хэш функции и её аргументов.
+
+        *Аргументы типа bytes хэшируются напрямую, остальные - в сериализованном виде.
+        Каждому аргументу предшествуют его вид и длина, поэтому разная разбивка
+        одних и тех же байтов на аргументы даёт разные ключи.
+
+        Args:
+            function (Callable[..., Any]): Функция задачи.
+
+        Returns:
+            str: SHA-256 в шестнадцатеричном виде.
+        """
+        digest = hashlib.sha256(
+            f"{function.__module__}.{function.__qualname__}".encode()
+        )
+
+        arguments: Tuple[Tuple[bytes, Any], ...] = (
+            *((b"A", value) for value in args),
+            *((b"K", item) for item in sorted(kwargs.items())),
+        )
+
+        for kind, value in arguments:
+            if isinstance(value, (bytes, bytearray, memoryview)):
+                kind += b"B"
+            else:
+                kind += b"P"
+                value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+            digest.update(kind + memoryview(value).nbytes.to_bytes(8, "big"))
+            digest.update(value)
+
+        return digest.hexdigest()
+
+    # -------------------------------------------------------------------------
+    async def run(
+        self,
+        function: Callable[..., Any],
+        *args: Any,
+        use_cache: bool = True,
+        wait: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """run выполняет задачу в пуле процессов и возвращает её результат.
+
+        Args:
+            function (Callable[..., Any]): Функция задачи.
+            *args (Any): Позиционные аргументы функции.
+            use_cache (bool, optional): Использовать ли кэш результатов. По умолчанию True.
+            wait (bool, optional): Ожидать ли места в очереди. По умолчанию True.
+            **kwargs (Any): Именованные аргументы функции.
+
+        Raises:
+            asyncio.QueueFull: Возбуждается если очередь заполнена и `wait` равен False.
+
+        Returns:
+            Any: Результат функции.
+        """
+        key: Optional[str] = None
+
+        if use_cache:
+            key = self.make_key(function, *args, **kwargs)
+            is_found, result = self.__results.lookup(key=key)
+
+            if is_found:
+                return result
+
+            job: Optional[_Job] = self.__jobs.get(key)
+
+            if job is not None:
+                return await self.__wait(job=job)
+
+        if not wait and self.__slots.locked():
+            raise asyncio.QueueFull("Очередь задач заполнена!")
+
+        await self.__slots.acquire()
+
+        # Пока задача ожидала места, такая же задача могла быть принята.
+        if key is not None and key in self.__jobs:
+            self.__slots.release()
+
+            return await self.__wait(job=self.__jobs[key])
+
+        job = _Job(
+            future=asyncio.ensure_future(
+                self.__execute(function=function, args=args, kwargs=kwargs)
+            )
+        )
+
+        if key is not None:
+            self.__jobs[key] = job
+            job.future.add_done_callback(
+                lambda done, job_key=key: self.__store_result(key=job_key, future=done)
+            )
+
+        return await self.__wait(job=job)
+
+    # -------------------------------------------------------------------------
+    def invalidate(self, key: str) -> bool:
+        """invalidate удаляет результат задачи из кэша.
+
+        Args:
+            key (str): Ключ результата (make_key).
+
+        Returns:
+            bool: True, если результат был в кэше.
+        """
+        return self.__results.invalidate(key=key)
+
+    # -------------------------------------------------------------------------
+    async def close(self, cancel_pending: bool = True) -> None:
+        """close завершает пул процессов.
+
+        Args:
+            cancel_pending (bool, optional): Отменить ли задачи, ожидающие процесс.
+                                             По умолчанию True.
+        """
+        await asyncio.to_thread(
+            self.__executor.shutdown, wait=True, cancel_futures=cancel_pending
+        )
+
+    # -------------------------------------------------------------------------
+    async def __execute(
+        self,
+        function: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """__execute передаёт задачу пулу, когда в нём есть свободный процесс.
+
+        *Задача, ожидающая свободный процесс, ещё не передана пулу,
+        поэтому её отмена гарантированно предотвращает выполнение.
+        """
+        loop = asyncio.get_running_loop()
+
+        try:
+            await self.__workers.acquire()
+        except BaseException:
+            self.__slots.release()
+            raise
+
+        try:
+            executor_future: Future = self.__executor.submit(function, *args, **kwargs)
+        except BaseException:
+            self.__release_worker()
+            raise
+
+        # Процесс освобождается, когда он завершил задачу, а не когда её перестали ждать.
+        def release_worker(_: Future) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self.__release_worker)
+
+        executor_future.add_done_callback(release_worker)
+
+        return await asyncio.wrap_future(executor_future)
+
+    # -------------------------------------------------------------------------
+    def __release_worker(self) -> None:
+        self.__workers.release()
+        self.__slots.release()
+
+    # -------------------------------------------------------------------------
+    async def __wait(self, job: _Job) -> Any:
+        job.waiters += 1
+
+        try:
+            return await asyncio.shield(job.future)
+
+        except asyncio.CancelledError:
+            if job.waiters == 1:
+                job.future.cancel()
+
+            raise
+
+        finally:
+            job.waiters -= 1
+
+    # -------------------------------------------------------------------------
+    def __store_result(self, key: str, future: asyncio.Future) -> None:
+        if self.__jobs.get(key) is not None and self.__jobs[key].future is future:
+            del self.__jobs[key]
+
+        if not future.cancelled() and future.exception() is None:
+            self.__results.set(key=key, value=future.result())
+
+
+# ----------------------------------------------------------------------------
+def setup_job_executor(dispatcher: Dispatcher, executor: JobExecutor) -> None:
+    """setup_job_executor передаёт исполнитель задач обработчикам диспатчера.
+
+    Обработчики получают исполнитель в аргументе `job_executor`,
+    пул процессов завершается при остановке диспатчера.
+
+    Args:
+        dispatcher (Dispatcher): Диспатчер, созданный функцией create_dispatcher.
+        executor (JobExecutor): Исполнитель задач.
+    """
+    dispatcher["job_executor"] = executor
+
+    async def close_executor() -> None:
+        await executor.close()
+
+    dispatcher.shutdown.register(close_executor)
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль catalogue_compiler используется для сборки каталогов сообщений бота
+из исходных файлов (locales/<код языка>.json) в импортируемый python модуль,
+в котором шаблоны сообщений уже разобраны на текст и подстановки.
+
+Запуск из каталога `simple_prototypes`:
+    python -m prototypes.localization_scripts.catalogue_compiler
+    python -m prototypes.localization_scripts.catalogue_compiler --check
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "CompiledMessage",
+    "parse_message_template",
+    "compile_catalogues",
+    "render_catalogues_module",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import os
+import sys
+import json
+import string
+import argparse
+
+from typing import Dict, List, Tuple, Union
+
+
+# Аннотация для скомпилированного сообщения:
+# строка без подстановок, либо пара (фрагменты текста, имена подстановок).
+CompiledMessage = Union[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]
+
+PATH_TO_LOCALES_DIR: str = os.path.join(os.path.dirname(__file__), "locales")
+PATH_TO_COMPILED_MODULE: str = os.path.join(
+    os.path.dirname(__file__), "compiled_catalogues.py"
+)
+DEFAULT_LANGUAGE_CODE: str = "ru"
+
+_MODULE_HEADER: str = '''# -*- coding: utf-8 -*-
+
+"""
+Модуль compiled_catalogues сгенерирован модулем catalogue_compiler.
+(Изменения следует вносить в файлы каталога locales с последующей сборкой)
+"""
+
+__all__: list[str] = ["DEFAULT_LANGUAGE_CODE", "CATALOGUES"]
+
+'''
+
+
+# ----------------------------------------------------------------------------
+def parse_message_template(template: str) -> CompiledMessage:
+    """parse_message_template разбирает шаблон сообщения.
+
+    Функция разделяет шаблон на фрагменты текста и имена подстановок,
+    чтобы при выводе сообщения не требовался повторный разбор шаблона.
+
+    *Поддерживаются только именованные подстановки вида `{name}`.
+
+    Args:
+        template (str): Шаблон сообщения.
+
+    Raises:
+        ValueError: Возбуждается если подстановка не именованная
+                    или содержит преобразование/формат.
+
+    Returns:
+        CompiledMessage: Скомпилированное сообщение.
+    """
+    literals: List[str] = []
+    names: List[str] = []
+    pending_literal: str = ""
+
+    for literal, name, format_spec, conversion in string.Formatter().parse(template):
+        pending_literal += literal
+
+        if name is None:
+            continue
+
+        if not name.isidentifier() or format_spec or conversion:
+            raise ValueError(
+                f"Неподдерживаемая подстановка {{{name}}} в шаблоне: {template!r}"
+            )
+
+        literals.append(pending_literal)
+        names.append(name)
+        pending_literal = ""
+
+    if not names:
+        return pending_literal
+
+    literals.append(pending_literal)
+
+    return tuple(literals), tuple(names)
+
+
+# ----------------------------------------------------------------------------
+def compile_catalogues(
+    locales_dir: str = PATH_TO_LOCALES_DIR,
+    default_language_code: str = DEFAULT_LANGUAGE_CODE,
+) -> Dict[str, Dict[str, CompiledMessage]]:
+    """compile_catalogues компилирует все каталоги сообщений.
+
+    Каждый каталог сверяется с каталогом языка по умолчанию:
+    набор ключей и подстановок в сообщениях должен совпадать.
+
+    Args:
+        locales_dir (str, optional): Путь к каталогу с исходными файлами.
+        default_language_code (str, optional): Код языка по умолчанию.
+
+    Raises:
+        ValueError: Возбуждается если каталоги не согласованы.
+
+    Returns:
+        Dict[str, Dict[str, CompiledMessage]]: Каталоги по коду языка.
+    """
+    catalogues: Dict[str, Dict[str, CompiledMessage]] = {}
+
+    for filename in sorted(os.listdir(locales_dir)):
+        language_code, extension = os.path.splitext(filename)
+
+        if extension != ".json":
+            continue
+
+        with open(os.path.join(locales_dir, filename), encoding="utf-8") as file:
+            source: Dict[str, str] = json.load(file)
+
+        catalogues[language_code] = {
+            key: parse_message_template(template=source[key]) for key in sorted(source)
+        }
+
+    if default_language_code not in catalogues:
+        raise ValueError(f"Отсутствует каталог языка по умолчанию: {default_language_code}")
+
+    default_catalogue: Dict[str, CompiledMessage] = catalogues[default_language_code]
+
+    for language_code, catalogue in catalogues.items():
+        if catalogue.keys() != default_catalogue.keys():
+            raise ValueError(
+                f"Ключи каталога {language_code} не совпадают с каталогом "
+                f"{default_language_code}: "
+                f"{sorted(catalogue.keys() ^ default_catalogue.keys())}"
+            )
+
+        for key, message in catalogue.items():
+            if _get_names(message) != _get_names(default_catalogue[key]):
+                raise ValueError(
+                    f"Подстановки сообщения {key} в каталоге {language_code} "
+                    f"не совпадают с каталогом {default_language_code}"
+                )
+
+    return catalogues
+
+
+# ----------------------------------------------------------------------------
+def render_catalogues_module(
+    catalogues: Dict[str, Dict[str, CompiledMessage]],
+    default_language_code: str = DEFAULT_LANGUAGE_CODE,
+) -> str:
+    """render_catalogues_module формирует исходный код модуля с каталогами.
+
+    Args:
+        catalogues (Dict[str, Dict[str, CompiledMessage]]): Скомпилированные каталоги.
+        default_language_code (str, optional): Код языка по умолчанию.
+
+    Returns:
+        str: Исходный код модуля.
+    """
+    lines: List[str] = [
+        _MODULE_HEADER,
+        f"DEFAULT_LANGUAGE_CODE: str = {default_language_code!r}\n\n",
+        "CATALOGUES = {\n",
+    ]
+
+    for language_code, catalogue in catalogues.items():
+        lines.append(f"    {language_code!r}: {{\n")
+
+        for key, message in catalogue.items():
+            lines.append(f"        {key!r}: {message!r},\n")
+
+        lines.append("    },\n")
+
+    lines.append("}\n")
+
+    return "".join(lines)
+
+
+# ----------------------------------------------------------------------------
+def _get_names(message: CompiledMessage) -> Tuple[str, ...]:
+    return () if isinstance(message, str) else tuple(sorted(message[1]))
+
+
+# ----------------------------------------------------------------------------
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Сборка каталогов сообщений бота.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="проверить, что собранный модуль соответствует исходным файлам",
+    )
+    arguments = parser.parse_args()
+
+    module_source: str = render_catalogues_module(catalogues=compile_catalogues())
+
+    if arguments.check:
+        with open(PATH_TO_COMPILED_MODULE, encoding="utf-8") as file:
+            if file.read() != module_source:
+                print("Каталоги сообщений устарели, требуется повторная сборка.")
+                return 1
+
+        return 0
+
+    with open(PATH_TO_COMPILED_MODULE, "w", encoding="utf-8") as file:
+        file.write(module_source)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
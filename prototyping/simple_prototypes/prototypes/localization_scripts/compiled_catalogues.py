@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль compiled_catalogues сгенерирован модулем catalogue_compiler.
+(Изменения следует вносить в файлы каталога locales с последующей сборкой)
+"""
+
+__all__: list[str] = ["DEFAULT_LANGUAGE_CODE", "CATALOGUES"]
+
+DEFAULT_LANGUAGE_CODE: str = 'ru'
+
+CATALOGUES = {
+    'en': {
+        'catalogue.empty': 'There are no products in this category yet.',
+        'catalogue.product_card': (('', '\n\n', '\n\nPrice: ', ' ₽'), ('title', 'description', 'price')),
+        'catalogue.title': 'Product catalogue',
+        'moderation.new_request': (('New request #', ' is waiting for review.'), ('request_id',)),
+        'order.created': (('Order #', ' has been created. Amount due: ', ' ₽.'), ('order_id', 'total_price')),
+        'order.status_changed': (('Order #', ' status: ', '.'), ('order_id', 'status')),
+        'start.choose_action': 'Choose what you are interested in:',
+        'start.greeting': (('Hi, ', "! I'm Neko, your assistant in NekoShop."), ('name',)),
+        'support.ticket_created': (('Ticket #', ' has been registered. We will reply shortly.'), ('ticket_id',)),
+        'user.banned': 'Access to the shop is restricted.',
+    },
+    'ru': {
+        'catalogue.empty': 'В этой категории пока нет товаров.',
+        'catalogue.product_card': (('', '\n\n', '\n\nЦена: ', ' ₽'), ('title', 'description', 'price')),
+        'catalogue.title': 'Каталог товаров',
+        'moderation.new_request': (('Новая заявка №', ' ожидает проверки.'), ('request_id',)),
+        'order.created': (('Заказ №', ' создан. Сумма к оплате: ', ' ₽.'), ('order_id', 'total_price')),
+        'order.status_changed': (('Статус заказа №', ': ', '.'), ('order_id', 'status')),
+        'start.choose_action': 'Выбери, что тебя интересует:',
+        'start.greeting': (('Привет, ', '! Я Неко, твоя помощница в NekoShop.'), ('name',)),
+        'support.ticket_created': (('Обращение №', ' зарегистрировано. Мы ответим в ближайшее время.'), ('ticket_id',)),
+        'user.banned': 'Доступ к магазину ограничен.',
+    },
+}
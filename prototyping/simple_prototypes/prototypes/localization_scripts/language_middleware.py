@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль language_middleware используется для определения языка пользователя
+один раз на каждое обновление, передавая обработчикам готовый переводчик.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "LanguageResolveMethodType",
+    "LanguageMiddleware",
+    "setup_localization",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from aiogram import BaseMiddleware, Dispatcher
+from aiogram.types import TelegramObject, User
+
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .localizer import Localizer, Translator
+
+
+# Аннотация для функции, возвращающей код языка интерфейса пользователя
+# (`User.interface_language_code`) по его идентификатору.
+LanguageResolveMethodType = Callable[[int], Awaitable[Optional[str]]]
+
+
+# ____________________________________________________________________________
+class LanguageMiddleware(BaseMiddleware):
+    """LanguageMiddleware промежуточный обработчик для выбора языка.
+
+    Язык определяется в следующем порядке:
+    язык интерфейса, сохранённый для пользователя в БД,
+    язык клиента telegram пользователя, язык по умолчанию.
+
+    *Переводчик передаётся обработчикам в аргументе `translator`.
+
+    Attributes:
+        __localizer (Localizer): Объект для выбора переводчика.
+        __resolve_language (Optional[LanguageResolveMethodType]): Функция получения
+            сохранённого языка пользователя.
+    """
+
+    __localizer: Localizer
+    __resolve_language: Optional[LanguageResolveMethodType]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        localizer: Localizer,
+        resolve_language: Optional[LanguageResolveMethodType] = None,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            localizer (Localizer): Объект для выбора переводчика.
+            resolve_language (Optional[LanguageResolveMethodType], optional): Функция
+                получения сохранённого языка пользователя. По умолчанию None.
+        """
+        self.__localizer = localizer
+        self.__resolve_language = resolve_language
+
+    # -------------------------------------------------------------------------
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        user: Optional[User] = data.get("event_from_user")
+        language_code: Optional[str] = None
+
+        if user is not None:
+            if self.__resolve_language is not None:
+                language_code = await self.__resolve_language(user.id)
+
+            if language_code is None:
+                language_code = user.language_code
+
+        translator: Translator = self.__localizer.get_translator(
+            language_code=language_code
+        )
+
+        data["translator"] = translator
+        data["language_code"] = translator.language_code
+
+        return await handler(event, data)
+
+
+# ----------------------------------------------------------------------------
+def setup_localization(
+    dispatcher: Dispatcher,
+    localizer: Optional[Localizer] = None,
+    resolve_language: Optional[LanguageResolveMethodType] = None,
+) -> Localizer:
+    """setup_localization подключает определение языка к диспатчеру.
+
+    Промежуточный обработчик регистрируется как внешний для обновлений,
+    поэтому язык определяется один раз, независимо от типа события.
+
+    Args:
+        dispatcher (Dispatcher): Диспатчер, созданный функцией create_dispatcher.
+        localizer (Optional[Localizer], optional): Объект для выбора переводчика.
+                                                   По умолчанию каталоги проекта.
+        resolve_language (Optional[LanguageResolveMethodType], optional): Функция
+            получения сохранённого языка пользователя. По умолчанию None.
+
+    Returns:
+        Localizer: Подключённый объект для выбора переводчика.
+    """
+    if localizer is None:
+        localizer = Localizer()
+
+    dispatcher.update.outer_middleware(
+        LanguageMiddleware(localizer=localizer, resolve_language=resolve_language)
+    )
+
+    return localizer
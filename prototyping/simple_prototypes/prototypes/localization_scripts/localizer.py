@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль localizer используется для вывода сообщений бота на языке пользователя,
+используя скомпилированные каталоги сообщений.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["Translator", "Localizer"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import sys
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .catalogue_compiler import CompiledMessage
+from .compiled_catalogues import CATALOGUES, DEFAULT_LANGUAGE_CODE
+
+
+# Аннотация для подготовленного к выводу сообщения:
+# строка без подстановок, либо первый фрагмент текста
+# и пары (имя подстановки, следующий за ней фрагмент текста).
+PreparedMessage = Union[str, Tuple[str, Tuple[Tuple[str, str], ...]]]
+
+
+# ____________________________________________________________________________
+class Translator:
+    """Translator класс для вывода сообщений на одном языке.
+
+    Attributes:
+        language_code (str): Код языка сообщений.
+        __messages (Dict[str, PreparedMessage]): Подготовленные сообщения по ключу.
+    """
+
+    __slots__ = ("language_code", "__messages")
+
+    language_code: str
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self, language_code: str, messages: Dict[str, PreparedMessage]
+    ) -> None:
+        self.language_code = language_code
+        self.__messages = messages
+
+    # -------------------------------------------------------------------------
+    def render(self, key: str, **values: Any) -> str:
+        """render возвращает сообщение с выполненными подстановками.
+
+        *Шаблон не разбирается повторно: фрагменты текста и подстановки
+        соединяются в заранее известном порядке.
+
+        Args:
+            key (str): Ключ сообщения.
+            **values (Any): Значения подстановок.
+
+        Raises:
+            KeyError: Возбуждается если сообщение или подстановка не найдены.
+
+        Returns:
+            str: Готовое сообщение.
+        """
+        message: PreparedMessage = self.__messages[key]
+
+        if isinstance(message, str):
+            return message
+
+        first_literal, substitutions = message
+        parts: List[str] = [first_literal]
+
+        for name, literal in substitutions:
+            parts.append(str(values[name]))
+            parts.append(literal)
+
+        return "".join(parts)
+
+    # -------------------------------------------------------------------------
+    __call__ = render
+
+
+# ____________________________________________________________________________
+class Localizer:
+    """Localizer класс для выбора переводчика по коду языка.
+
+    Ключи сообщений и фрагменты текста интернируются при создании,
+    поэтому поиск сообщения сводится к сравнению ссылок на строки.
+
+    Attributes:
+        default_language_code (str): Код языка по умолчанию.
+        __translators (Dict[str, Translator]): Переводчики по коду языка.
+    """
+
+    default_language_code: str
+    __translators: Dict[str, Translator]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        catalogues: Dict[str, Dict[str, CompiledMessage]] = CATALOGUES,
+        default_language_code: str = DEFAULT_LANGUAGE_CODE,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            catalogues (Dict[str, Dict[str, CompiledMessage]], optional): Каталоги
+                сообщений по коду языка. По умолчанию скомпилированные каталоги проекта.
+            default_language_code (str, optional): Код языка по умолчанию.
+
+        Raises:
+            KeyError: Возбуждается если отсутствует каталог языка по умолчанию.
+        """
+        if default_language_code not in catalogues:
+            raise KeyError(f"Каталог языка {default_language_code} не найден!")
+
+        self.default_language_code = default_language_code
+        self.__translators = {
+            sys.intern(language_code): Translator(
+                language_code=sys.intern(language_code),
+                messages={
+                    sys.intern(key): _prepare_message(message=message)
+                    for key, message in catalogue.items()
+                },
+            )
+            for language_code, catalogue in catalogues.items()
+        }
+
+    # -------------------------------------------------------------------------
+    @property
+    def language_codes(self) -> List[str]:
+        return list(self.__translators)
+
+    # -------------------------------------------------------------------------
+    def get_translator(self, language_code: Optional[str]) -> Translator:
+        """get_translator возвращает переводчик для кода языка.
+
+        *Для неподдерживаемого языка возвращается переводчик языка по умолчанию.
+        Код вида `en-US` сводится к основному коду `en`.
+
+        Args:
+            language_code (Optional[str]): Код языка пользователя.
+
+        Returns:
+            Translator: Переводчик.
+        """
+        if language_code:
+            translator: Optional[Translator] = self.__translators.get(language_code)
+
+            if translator is None:
+                translator = self.__translators.get(language_code.split("-", 1)[0])
+
+            if translator is not None:
+                return translator
+
+        return self.__translators[self.default_language_code]
+
+
+# ----------------------------------------------------------------------------
+def _prepare_message(message: CompiledMessage) -> PreparedMessage:
+    if isinstance(message, str):
+        return sys.intern(message)
+
+    literals, names = message
+
+    return (
+        sys.intern(literals[0]),
+        tuple(
+            (sys.intern(name), sys.intern(literal))
+            for name, literal in zip(names, literals[1:])
+        ),
+    )
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль database_metrics используется для сбора метрик пула соединений БД
+(занятые и свободные соединения, ожидание соединения), длительности транзакций
+и решений об изменении размера пула.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "register_database_metrics",
+    "register_pool_autosizer_metrics",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.1.0"
+
+from typing import Any, Callable, Optional, Protocol, Tuple
+
+from prototypes.monitoring_scripts.metrics import MetricsRegistry
+
+
+# ____________________________________________________________________________
+class ObservableDatabaseAPI(Protocol):
+    """ObservableDatabaseAPI описание API БД, предоставляющего замеры транзакций.
+
+    *Соответствует AsyncMySQLAPI из database_prototypes.
+    """
+
+    @property
+    def pool_size(self) -> int: ...
+
+    @property
+    def connections_in_use_amount(self) -> int: ...
+
+    @property
+    def transaction_observer(
+        self,
+    ) -> Optional[Callable[[float, float, Optional[BaseException]], Any]]: ...
+
+    def set_transaction_observer(
+        self, observer: Optional[Callable[[float, float, Optional[BaseException]], Any]]
+    ) -> None: ...
+
+
+# ----------------------------------------------------------------------------
+def register_database_metrics(
+    registry: MetricsRegistry, api: ObservableDatabaseAPI, database: str = "main"
+) -> None:
+    """register_database_metrics регистрирует метрики пула соединений API БД.
+
+    *Ранее установленный наблюдатель транзакций API продолжает вызываться.
+
+    Args:
+        registry (MetricsRegistry): Набор метрик приложения.
+        api (ObservableDatabaseAPI): API БД с подключённым пулом соединений.
+        database (str, optional): Значение метки `database`. По умолчанию "main".
+    """
+    names = {
+        "in_use": "db_pool_connections_in_use",
+        "idle": "db_pool_connections_idle",
+        "wait": "db_pool_wait_seconds",
+        "duration": "db_transaction_duration_seconds",
+        "errors": "db_transaction_errors",
+    }
+
+    # Метрики общие для всех БД, поэтому создаются при подключении первой из них.
+    if names["in_use"] not in registry:
+        registry.gauge(
+            name=names["in_use"],
+            documentation="Количество занятых соединений пула.",
+            label_names=("database",),
+        )
+        registry.gauge(
+            name=names["idle"],
+            documentation="Количество свободных соединений пула.",
+            label_names=("database",),
+        )
+        registry.histogram(
+            name=names["wait"],
+            documentation="Ожидание потока и соединения пула перед транзакцией.",
+            label_names=("database",),
+        )
+        registry.histogram(
+            name=names["duration"],
+            documentation="Длительность транзакций над пулом соединений.",
+            label_names=("database",),
+        )
+        registry.counter(
+            name=names["errors"],
+            documentation="Количество транзакций, завершившихся ошибкой.",
+            label_names=("database", "error"),
+        )
+
+    # Транзакции, ожидающие соединения в очереди, не занимают его,
+    # поэтому метрики основаны на занятых соединениях, а не на транзакциях.
+    registry.get(names["in_use"]).labels(database).set_function(  # type: ignore
+        lambda: api.connections_in_use_amount
+    )
+    registry.get(names["idle"]).labels(database).set_function(  # type: ignore
+        lambda: max(0, api.pool_size - api.connections_in_use_amount)
+    )
+
+    wait = registry.get(names["wait"]).labels(database)  # type: ignore
+    duration = registry.get(names["duration"]).labels(database)  # type: ignore
+    errors = registry.get(names["errors"])
+    previous_observer = api.transaction_observer
+
+    def observe(
+        wait_seconds: float, duration_seconds: float, error: Optional[BaseException]
+    ) -> None:
+        wait.observe(wait_seconds)
+        duration.observe(duration_seconds)
+
+        if error is not None:
+            errors.labels(database, type(error).__name__).inc()  # type: ignore
+
+        if previous_observer is not None:
+            previous_observer(wait_seconds, duration_seconds, error)
+
+    api.set_transaction_observer(observe)
+
+
+# ____________________________________________________________________________
+class ObservablePoolAutosizer(Protocol):
+    """ObservablePoolAutosizer описание объекта, изменяющего размер пула соединений.
+
+    *Соответствует PoolAutosizer из database_prototypes.
+    """
+
+    @property
+    def pool_size(self) -> int: ...
+
+    @property
+    def min_size(self) -> int: ...
+
+    @property
+    def max_size(self) -> int: ...
+
+    @property
+    def wait_p95_seconds(self) -> float: ...
+
+    @property
+    def utilization(self) -> float: ...
+
+    def set_decision_observer(self, observer: Optional[Callable[[Any], Any]]) -> None: ...
+
+
+# ----------------------------------------------------------------------------
+def register_pool_autosizer_metrics(
+    registry: MetricsRegistry, autosizer: ObservablePoolAutosizer, database: str = "main"
+) -> None:
+    """register_pool_autosizer_metrics регистрирует метрики изменения размера пула.
+
+    *Решение об изменении размера передаётся как объект с атрибутами
+    previous_size, pool_size и reason (PoolSizingDecision).
+
+    Args:
+        registry (MetricsRegistry): Набор метрик приложения.
+        autosizer (ObservablePoolAutosizer): Объект, изменяющий размер пула.
+        database (str, optional): Значение метки `database`. По умолчанию "main".
+    """
+    gauges: Tuple[Tuple[str, str, Callable[[], float]], ...] = (
+        (
+            "db_pool_size",
+            "Текущий размер пула соединений.",
+            lambda: autosizer.pool_size,
+        ),
+        (
+            "db_pool_min_size",
+            "Минимальный размер пула соединений.",
+            lambda: autosizer.min_size,
+        ),
+        (
+            "db_pool_max_size",
+            "Максимальный размер пула соединений.",
+            lambda: autosizer.max_size,
+        ),
+        (
+            "db_pool_autosizer_wait_p95_seconds",
+            "95-й перцентиль ожидания соединения при последней оценке размера пула.",
+            lambda: autosizer.wait_p95_seconds,
+        ),
+        (
+            "db_pool_autosizer_utilization",
+            "Загрузка пула соединений при последней оценке размера пула.",
+            lambda: autosizer.utilization,
+        ),
+    )
+    resizes_name: str = "db_pool_resizes"
+
+    if resizes_name not in registry:
+        for name, documentation, _ in gauges:
+            registry.gauge(
+                name=name, documentation=documentation, label_names=("database",)
+            )
+
+        registry.counter(
+            name=resizes_name,
+            documentation="Количество изменений размера пула соединений.",
+            label_names=("database", "direction", "reason"),
+        )
+
+    for name, _, function in gauges:
+        registry.get(name).labels(database).set_function(function)  # type: ignore
+
+    resizes = registry.get(resizes_name)
+
+    def observe(decision: Any) -> None:
+        direction: str = "grow" if decision.pool_size > decision.previous_size else "shrink"
+
+        resizes.labels(database, direction, decision.reason).inc()  # type: ignore
+
+    autosizer.set_decision_observer(observe)
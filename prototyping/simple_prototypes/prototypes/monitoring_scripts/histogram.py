@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль histogram предоставляет гистограмму с фиксированными границами интервалов
+для накопления распределения длительностей (задержка цикла событий, время запросов).
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["DEFAULT_LATENCY_BUCKETS", "Histogram"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import bisect
+import math
+
+from typing import List, Sequence, Tuple
+
+
+# Границы интервалов в секундах: от миллисекунды до десяти секунд.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+# ____________________________________________________________________________
+class Histogram:
+    """Histogram класс гистограммы с фиксированными границами интервалов.
+
+    Наблюдение увеличивает счётчик одного интервала (поиск делением пополам),
+    поэтому запись не выделяет память и не зависит от количества наблюдений.
+
+    *Гистограмма не использует блокировки и рассчитана на запись из одного потока.
+
+    Attributes:
+        __bounds (Tuple[float, ...]): Верхние границы интервалов по возрастанию.
+        __counts (List[int]): Количество наблюдений в интервалах; последний - выше границ.
+        __sum (float): Сумма наблюдений.
+        __max (float): Наибольшее наблюдение.
+    """
+
+    __bounds: Tuple[float, ...]
+    __counts: List[int]
+    __sum: float
+    __max: float
+
+    # -------------------------------------------------------------------------
+    def __init__(self, bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """__init__ конструктор.
+
+        Args:
+            bounds (Sequence[float], optional): Верхние границы интервалов.
+                                                По умолчанию DEFAULT_LATENCY_BUCKETS.
+
+        Raises:
+            ValueError: Возбуждается если границы не возрастают, либо не заданы.
+        """
+        if not bounds or any(
+            lower >= upper for lower, upper in zip(bounds, bounds[1:])
+        ):
+            raise ValueError("Границы интервалов гистограммы должны возрастать!")
+
+        self.__bounds = tuple(bounds)
+        self.__counts = [0] * (len(bounds) + 1)
+        self.__sum = 0.0
+        self.__max = 0.0
+
+    # -------------------------------------------------------------------------
+    @property
+    def bounds(self) -> Tuple[float, ...]:
+        return self.__bounds
+
+    # -------------------------------------------------------------------------
+    @property
+    def count(self) -> int:
+        return sum(self.__counts)
+
+    # -------------------------------------------------------------------------
+    @property
+    def sum(self) -> float:
+        return self.__sum
+
+    # -------------------------------------------------------------------------
+    @property
+    def max(self) -> float:
+        return self.__max
+
+    # -------------------------------------------------------------------------
+    def observe(self, value: float) -> None:
+        """observe добавляет наблюдение.
+
+        Args:
+            value (float): Наблюдаемое значение.
+        """
+        # Значение, равное границе, относится к интервалу этой границы ("le").
+        self.__counts[bisect.bisect_left(self.__bounds, value)] += 1
+        self.__sum += value
+
+        if value > self.__max:
+            self.__max = value
+
+    # -------------------------------------------------------------------------
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        """cumulative_counts возвращает накопленное количество наблюдений по границам.
+
+        Returns:
+            List[Tuple[float, int]]: Пары - [граница : количество наблюдений не больше
+                                     границы], последняя граница - бесконечность.
+        """
+        result: List[Tuple[float, int]] = []
+        total: int = 0
+
+        for bound, count in zip((*self.__bounds, math.inf), self.__counts):
+            total += count
+            result.append((bound, total))
+
+        return result
+
+    # -------------------------------------------------------------------------
+    def quantile(self, fraction: float) -> float:
+        """quantile оценивает квантиль линейной интерполяцией внутри интервала.
+
+        Args:
+            fraction (float): Доля квантиля от 0 до 1.
+
+        Returns:
+            float: Оценка квантиля; 0.0 если наблюдений нет.
+        """
+        total: int = self.count
+
+        if not total:
+            return 0.0
+
+        rank: float = fraction * total
+        lower_bound: float = 0.0
+        accumulated: int = 0
+
+        for bound, count in zip((*self.__bounds, self.__max), self.__counts):
+            if count and accumulated + count >= rank:
+                upper_bound: float = min(bound, self.__max)
+
+                return lower_bound + (upper_bound - lower_bound) * (
+                    (rank - accumulated) / count
+                )
+
+            accumulated += count
+            lower_bound = bound
+
+        return self.__max
+
+    # -------------------------------------------------------------------------
+    def reset(self) -> None:
+        """reset удаляет все наблюдения."""
+        self.__counts = [0] * (len(self.__bounds) + 1)
+        self.__sum = 0.0
+        self.__max = 0.0
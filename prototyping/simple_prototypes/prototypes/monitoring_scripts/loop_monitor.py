@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль loop_monitor используется для наблюдения за задержкой цикла событий
+и поиска блокирующих вызовов (синхронные запросы к БД, чтение файлов и т.п.)
+во время работы бота.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["BlockingReport", "LoopMonitor"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import sys
+import time
+import asyncio
+import threading
+import traceback
+
+from dataclasses import dataclass
+
+from typing import Any, Callable, Deque, List, Optional
+
+from collections import deque
+
+from prototypes.monitoring_scripts.histogram import Histogram
+
+
+# Аннотация для функции, вызываемой при обнаружении блокировки цикла событий.
+BlockingCallbackType = Callable[["BlockingReport"], Any]
+
+
+# ____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class BlockingReport:
+    """BlockingReport класс записи о блокировке цикла событий.
+
+    Attributes:
+        detected_at (float): Время обнаружения блокировки (time.time).
+        blocked_seconds (float): Длительность блокировки в секундах.
+        stack (str): Стек потока цикла событий во время блокировки.
+    """
+
+    detected_at: float
+    blocked_seconds: float
+    stack: str
+
+
+# ----------------------------------------------------------------------------
+def print_blocking_report(report: BlockingReport) -> None:
+    print(
+        f"Цикл событий был заблокирован на {report.blocked_seconds * 1000:.1f} мс!\n"
+        f"{report.stack}"
+    )
+
+
+# ____________________________________________________________________________
+class LoopMonitor:
+    """LoopMonitor класс наблюдения за циклом событий.
+
+    Задача в цикле событий просыпается каждые interval секунд: разница между
+    запланированным и фактическим пробуждением (задержка) записывается в гистограмму.
+
+    Отдельный поток проверяет, как давно задача просыпалась. Если дольше threshold,
+    цикл событий занят одним обратным вызовом, и поток сохраняет стек потока
+    цикла событий, пока блокирующий вызов ещё выполняется.
+
+    Attributes:
+        __interval (float): Интервал пробуждения задачи в секундах.
+        __threshold (float): Задержка, считающаяся блокировкой, в секундах.
+        __on_blocking (Optional[BlockingCallbackType]): Функция, вызываемая при блокировке.
+        __lag_histogram (Histogram): Гистограмма задержки цикла событий.
+        __reports (Deque[BlockingReport]): Последние записи о блокировках.
+        __blocking_amount (int): Количество обнаруженных блокировок.
+        __heartbeat_at (float): Время последнего пробуждения задачи (time.monotonic).
+        __captured_stack (Optional[str]): Стек, сохранённый во время текущей блокировки.
+        __loop_thread_id (Optional[int]): Идентификатор потока цикла событий.
+        __task (Optional[asyncio.Task]): Задача измерения задержки.
+        __watchdog (Optional[threading.Thread]): Поток проверки блокировок.
+        __stop_event (threading.Event): Событие остановки потока проверки.
+    """
+
+    __interval: float
+    __threshold: float
+    __on_blocking: Optional[BlockingCallbackType]
+    __lag_histogram: Histogram
+    __reports: Deque[BlockingReport]
+    __blocking_amount: int
+    __heartbeat_at: float
+    __captured_stack: Optional[str]
+    __loop_thread_id: Optional[int]
+    __task: Optional[asyncio.Task]
+    __watchdog: Optional[threading.Thread]
+    __stop_event: threading.Event
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        interval: float = 0.05,
+        threshold: float = 0.1,
+        max_reports: int = 100,
+        on_blocking: Optional[BlockingCallbackType] = print_blocking_report,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            interval (float, optional): Интервал пробуждения задачи. По умолчанию 0.05.
+            threshold (float, optional): Задержка, считающаяся блокировкой.
+                                         По умолчанию 0.1.
+            max_reports (int, optional): Количество хранимых записей о блокировках.
+                                         По умолчанию 100.
+            on_blocking (Optional[BlockingCallbackType], optional): Функция, вызываемая
+                в цикле событий при блокировке. По умолчанию печатает запись.
+
+        Raises:
+            ValueError: Возбуждается если интервал или порог не больше нуля.
+        """
+        if interval <= 0 or threshold <= 0:
+            raise ValueError("Интервал и порог блокировки должны быть больше нуля!")
+
+        self.__interval = interval
+        self.__threshold = threshold
+        self.__on_blocking = on_blocking
+        self.__lag_histogram = Histogram()
+        self.__reports = deque(maxlen=max_reports)
+        self.__blocking_amount = 0
+        self.__heartbeat_at = time.monotonic()
+        self.__captured_stack = None
+        self.__loop_thread_id = None
+        self.__task = None
+        self.__watchdog = None
+        self.__stop_event = threading.Event()
+
+    # -------------------------------------------------------------------------
+    @property
+    def lag_histogram(self) -> Histogram:
+        return self.__lag_histogram
+
+    # -------------------------------------------------------------------------
+    @property
+    def reports(self) -> List[BlockingReport]:
+        return list(self.__reports)
+
+    # -------------------------------------------------------------------------
+    @property
+    def blocking_amount(self) -> int:
+        return self.__blocking_amount
+
+    # -------------------------------------------------------------------------
+    @property
+    def is_running(self) -> bool:
+        return self.__task is not None
+
+    # -------------------------------------------------------------------------
+    def start(self) -> None:
+        """start запускает наблюдение за текущим циклом событий.
+
+        Raises:
+            RuntimeError: Возбуждается если наблюдение уже запущено.
+        """
+        if self.__task is not None:
+            raise RuntimeError("Наблюдение за циклом событий уже запущено!")
+
+        self.__loop_thread_id = threading.get_ident()
+        self.__heartbeat_at = time.monotonic()
+        self.__stop_event.clear()
+
+        self.__task = asyncio.get_running_loop().create_task(self.__run_heartbeat())
+        self.__watchdog = threading.Thread(
+            target=self.__run_watchdog, name="loop-monitor-watchdog", daemon=True
+        )
+        self.__watchdog.start()
+
+    # -------------------------------------------------------------------------
+    async def stop(self) -> None:
+        """stop останавливает наблюдение."""
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+
+        self.__task = None
+        self.__stop_event.set()
+
+        if self.__watchdog is not None:
+            await asyncio.to_thread(self.__watchdog.join)
+            self.__watchdog = None
+
+    # -------------------------------------------------------------------------
+    def report(self) -> str:
+        """report возвращает сводку задержки цикла событий.
+
+        Returns:
+            str: Количество замеров, квантили задержки и количество блокировок.
+        """
+        histogram: Histogram = self.__lag_histogram
+
+        return (
+            f"Задержка цикла событий: замеров {histogram.count}, "
+            f"p50 {histogram.quantile(0.5) * 1000:.2f} мс, "
+            f"p99 {histogram.quantile(0.99) * 1000:.2f} мс, "
+            f"max {histogram.max * 1000:.2f} мс, "
+            f"блокировок {self.__blocking_amount}"
+        )
+
+    # -------------------------------------------------------------------------
+    async def __run_heartbeat(self) -> None:
+        """__run_heartbeat замеряет задержку пробуждения задачи."""
+        while True:
+            expected_at: float = time.monotonic() + self.__interval
+            await asyncio.sleep(self.__interval)
+
+            now: float = time.monotonic()
+            lag: float = max(0.0, now - expected_at)
+
+            self.__heartbeat_at = now
+            self.__lag_histogram.observe(lag)
+
+            if lag >= self.__threshold:
+                self.__register_blocking(lag=lag)
+
+    # -------------------------------------------------------------------------
+    def __register_blocking(self, lag: float) -> None:
+        stack: Optional[str] = self.__captured_stack
+        self.__captured_stack = None
+
+        report = BlockingReport(
+            detected_at=time.time(),
+            blocked_seconds=lag,
+            stack=stack or "Стек не получен: блокировка завершилась до проверки.",
+        )
+
+        self.__reports.append(report)
+        self.__blocking_amount += 1
+
+        if self.__on_blocking is not None:
+            try:
+                self.__on_blocking(report)
+            except Exception as error:
+                print(f"Возникла ошибка при обработке блокировки цикла событий! {error}")
+
+    # -------------------------------------------------------------------------
+    def __run_watchdog(self) -> None:
+        """__run_watchdog сохраняет стек потока цикла событий во время блокировки."""
+        captured_for: Optional[float] = None
+
+        while not self.__stop_event.wait(self.__threshold / 2):
+            heartbeat_at: float = self.__heartbeat_at
+
+            if (
+                heartbeat_at == captured_for
+                or time.monotonic() - heartbeat_at < self.__interval + self.__threshold
+            ):
+                continue
+
+            frame = sys._current_frames().get(self.__loop_thread_id)  # type: ignore
+
+            if frame is None:
+                continue
+
+            self.__captured_stack = "".join(traceback.format_stack(frame))
+            captured_for = heartbeat_at
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль metrics предоставляет счётчики, измерители и гистограммы
+и их вывод в текстовом формате Prometheus (OpenMetrics) для сбора метрик
+работы бота и БД.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "Counter",
+    "Gauge",
+    "HistogramMetric",
+    "MetricsRegistry",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import math
+import re
+
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from prototypes.monitoring_scripts.histogram import DEFAULT_LATENCY_BUCKETS, Histogram
+
+
+_NAME_PATTERN = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+
+# Аннотация для функции, возвращающей значение измерителя при сборе метрик.
+GaugeFunctionType = Callable[[], float]
+
+ChildType = TypeVar("ChildType")
+
+
+# ----------------------------------------------------------------------------
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(float(value))
+
+
+# ----------------------------------------------------------------------------
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+
+    pairs: List[str] = [
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in zip(names, values)
+    ]
+
+    return "{" + ",".join(pairs) + "}"
+
+
+# ____________________________________________________________________________
+class CounterValue:
+    """CounterValue значение счётчика с конкретными значениями меток."""
+
+    __slots__ = ("value",)
+
+    value: float
+
+    # -------------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    # -------------------------------------------------------------------------
+    def inc(self, amount: float = 1.0) -> None:
+        """inc увеличивает счётчик.
+
+        Raises:
+            ValueError: Возбуждается если значение отрицательное.
+        """
+        if amount < 0:
+            raise ValueError("Счётчик может только увеличиваться!")
+
+        self.value += amount
+
+
+# ____________________________________________________________________________
+class GaugeValue:
+    """GaugeValue значение измерителя с конкретными значениями меток."""
+
+    __slots__ = ("value", "function")
+
+    value: float
+    function: Optional[GaugeFunctionType]
+
+    # -------------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.value = 0.0
+        self.function = None
+
+    # -------------------------------------------------------------------------
+    def set(self, value: float) -> None:
+        self.value = value
+
+    # -------------------------------------------------------------------------
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    # -------------------------------------------------------------------------
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    # -------------------------------------------------------------------------
+    def set_function(self, function: GaugeFunctionType) -> None:
+        """set_function задаёт функцию, вычисляющую значение при сборе метрик.
+
+        Args:
+            function (GaugeFunctionType): Функция без аргументов.
+        """
+        self.function = function
+
+    # -------------------------------------------------------------------------
+    def get(self) -> float:
+        return self.value if self.function is None else self.function()
+
+
+# ____________________________________________________________________________
+class _Metric(ABC, Generic[ChildType]):
+    """_Metric базовый класс метрики со значениями по набору меток.
+
+    Значения с конкретными метками создаются при первом обращении и кэшируются,
+    поэтому вызывающий код может сохранить значение и обновлять его без поиска.
+
+    *Метрики не используют блокировки и рассчитаны на обновление из одного
+    цикла событий; чтение при сборе выполняется в том же цикле.
+
+    Attributes:
+        name (str): Имя метрики.
+        documentation (str): Описание метрики.
+        label_names (Tuple[str, ...]): Имена меток.
+        _children (Dict[Tuple[str, ...], ChildType]): Значения по значениям меток.
+    """
+
+    metric_type: str = "untyped"
+
+    name: str
+    documentation: str
+    label_names: Tuple[str, ...]
+    _children: Dict[Tuple[str, ...], ChildType]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            name (str): Имя метрики.
+            documentation (str): Описание метрики.
+            label_names (Sequence[str], optional): Имена меток. По умолчанию без меток.
+
+        Raises:
+            ValueError: Возбуждается если имя метрики или метки некорректно.
+        """
+        for checked_name in (name, *label_names):
+            if not _NAME_PATTERN.match(checked_name) or checked_name == "le":
+                raise ValueError(f"Некорректное имя метрики, либо метки: {checked_name}")
+
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children = {}
+
+    # -------------------------------------------------------------------------
+    def labels(self, *label_values: str) -> ChildType:
+        """labels возвращает значение метрики с указанными значениями меток.
+
+        Raises:
+            ValueError: Возбуждается если количество значений не совпадает с метками.
+
+        Returns:
+            ChildType: Значение метрики.
+        """
+        child: Optional[ChildType] = self._children.get(label_values)
+
+        if child is None:
+            if len(label_values) != len(self.label_names):
+                raise ValueError(
+                    f"Метрика {self.name} ожидает метки: {list(self.label_names)}"
+                )
+
+            child = self._children[label_values] = self._create_child()
+
+        return child
+
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    def _create_child(self) -> ChildType:
+        """_create_child создаёт значение метрики для нового набора меток."""
+        pass
+
+    # -------------------------------------------------------------------------
+    @abstractmethod
+    def _render_child(self, labels: str, child: ChildType) -> List[str]:
+        """_render_child возвращает строки формата Prometheus для значения метрики."""
+        pass
+
+    # -------------------------------------------------------------------------
+    def render(self) -> List[str]:
+        """render возвращает строки метрики в текстовом формате Prometheus.
+
+        Returns:
+            List[str]: Строки HELP, TYPE и значений.
+        """
+        documentation: str = self.documentation.replace("\\", "\\\\").replace(
+            "\n", "\\n"
+        )
+        lines: List[str] = [
+            f"# HELP {self.name} {documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+
+        for label_values, child in list(self._children.items()):
+            lines.extend(
+                self._render_child(
+                    labels=_format_labels(names=self.label_names, values=label_values),
+                    child=child,
+                )
+            )
+
+        return lines
+
+
+# ____________________________________________________________________________
+class Counter(_Metric[CounterValue]):
+    """Counter класс счётчика, значение которого только увеличивается.
+
+    *Значение выводится с суффиксом `_total`.
+
+    Args:
+        _Metric: Базовый класс метрики.
+    """
+
+    metric_type = "counter"
+
+    # -------------------------------------------------------------------------
+    def inc(self, amount: float = 1.0) -> None:
+        """inc увеличивает счётчик без меток."""
+        self.labels().inc(amount)
+
+    # -------------------------------------------------------------------------
+    def _create_child(self) -> CounterValue:
+        return CounterValue()
+
+    # -------------------------------------------------------------------------
+    def _render_child(self, labels: str, child: CounterValue) -> List[str]:
+        return [f"{self.name}_total{labels} {_format_value(child.value)}"]
+
+
+# ____________________________________________________________________________
+class Gauge(_Metric[GaugeValue]):
+    """Gauge класс измерителя, значение которого может увеличиваться и уменьшаться.
+
+    Args:
+        _Metric: Базовый класс метрики.
+    """
+
+    metric_type = "gauge"
+
+    # -------------------------------------------------------------------------
+    def set(self, value: float) -> None:
+        """set задаёт значение измерителя без меток."""
+        self.labels().set(value)
+
+    # -------------------------------------------------------------------------
+    def set_function(self, function: GaugeFunctionType) -> None:
+        """set_function задаёт функцию, вычисляющую значение измерителя без меток."""
+        self.labels().set_function(function)
+
+    # -------------------------------------------------------------------------
+    def _create_child(self) -> GaugeValue:
+        return GaugeValue()
+
+    # -------------------------------------------------------------------------
+    def _render_child(self, labels: str, child: GaugeValue) -> List[str]:
+        try:
+            value: float = child.get()
+        except Exception as error:
+            print(f"Возникла ошибка при получении значения метрики {self.name}! {error}")
+            return []
+
+        return [f"{self.name}{labels} {_format_value(value)}"]
+
+
+# ____________________________________________________________________________
+class HistogramMetric(_Metric[Histogram]):
+    """HistogramMetric класс метрики распределения значений.
+
+    Args:
+        _Metric: Базовый класс метрики.
+
+    Attributes:
+        bounds (Tuple[float, ...]): Верхние границы интервалов гистограмм.
+    """
+
+    metric_type = "histogram"
+
+    bounds: Tuple[float, ...]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        self.bounds = tuple(bounds)
+
+        # Границы проверяются при создании, а не при первом наблюдении.
+        Histogram(bounds=self.bounds)
+
+        super().__init__(name=name, documentation=documentation, label_names=label_names)
+
+    # -------------------------------------------------------------------------
+    def observe(self, value: float) -> None:
+        """observe добавляет наблюдение в гистограмму без меток."""
+        self.labels().observe(value)
+
+    # -------------------------------------------------------------------------
+    def _create_child(self) -> Histogram:
+        return Histogram(bounds=self.bounds)
+
+    # -------------------------------------------------------------------------
+    def _render_child(self, labels: str, child: Histogram) -> List[str]:
+        # Метка `le` добавляется к остальным меткам значения.
+        prefix: str = labels[:-1] + "," if labels else "{"
+        lines: List[str] = [
+            f'{self.name}_bucket{prefix}le="{_format_value(bound)}"}} {count}'
+            for bound, count in child.cumulative_counts()
+        ]
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+
+        return lines
+
+
+# ____________________________________________________________________________
+class MetricsRegistry:
+    """MetricsRegistry класс набора метрик приложения.
+
+    Attributes:
+        __metrics (Dict[str, _Metric]): Метрики по имени.
+    """
+
+    __metrics: Dict[str, _Metric]
+
+    # -------------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.__metrics = {}
+
+    # -------------------------------------------------------------------------
+    def __contains__(self, name: str) -> bool:
+        return name in self.__metrics
+
+    # -------------------------------------------------------------------------
+    def get(self, name: str) -> Optional[_Metric]:
+        return self.__metrics.get(name)
+
+    # -------------------------------------------------------------------------
+    def counter(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> Counter:
+        """counter создаёт и регистрирует счётчик."""
+        return self.__register(
+            Counter(name=name, documentation=documentation, label_names=label_names)
+        )
+
+    # -------------------------------------------------------------------------
+    def gauge(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> Gauge:
+        """gauge создаёт и регистрирует измеритель."""
+        return self.__register(
+            Gauge(name=name, documentation=documentation, label_names=label_names)
+        )
+
+    # -------------------------------------------------------------------------
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> HistogramMetric:
+        """histogram создаёт и регистрирует гистограмму."""
+        return self.__register(
+            HistogramMetric(
+                name=name,
+                documentation=documentation,
+                label_names=label_names,
+                bounds=bounds,
+            )
+        )
+
+    # -------------------------------------------------------------------------
+    def render(self) -> str:
+        """render возвращает все метрики в текстовом формате Prometheus.
+
+        Returns:
+            str: Текст для ответа на запрос сборщика метрик.
+        """
+        lines: List[str] = []
+
+        for metric in self.__metrics.values():
+            lines.extend(metric.render())
+
+        return "\n".join(lines) + "\n"
+
+    # -------------------------------------------------------------------------
+    def __register[MetricType: _Metric](self, metric: MetricType) -> MetricType:
+        if metric.name in self.__metrics:
+            raise ValueError(f"Метрика уже зарегистрирована: {metric.name}")
+
+        self.__metrics[metric.name] = metric
+
+        return metric
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль metrics_server предоставляет HTTP сервер для сбора метрик (/metrics)
+и проверок готовности и работоспособности бота (/health/ready, /health/live).
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["MetricsServer"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from aiohttp import web
+
+from typing import Optional
+
+from prototypes.monitoring_scripts.metrics import MetricsRegistry
+from prototypes.telegram_scripts.bot_state_handlers import BotState, HealthReport
+
+
+# ____________________________________________________________________________
+class MetricsServer:
+    """MetricsServer класс HTTP сервера метрик и проверок состояния.
+
+    *Сервер работает в цикле событий бота, поэтому метрики читаются без блокировок.
+
+    Attributes:
+        __registry (MetricsRegistry): Набор метрик приложения.
+        __state (Optional[BotState]): Состояние бота для проверок.
+        __host (str): Адрес сервера.
+        __port (int): Порт сервера (0 - выбирается системой).
+        __health_timeout (float): Время ожидания каждой проверки зависимости.
+        __runner (Optional[web.AppRunner]): Запущенное приложение.
+    """
+
+    CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+    __registry: MetricsRegistry
+    __state: Optional[BotState]
+    __host: str
+    __port: int
+    __health_timeout: float
+    __runner: Optional[web.AppRunner]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        state: Optional[BotState] = None,
+        host: str = "127.0.0.1",
+        port: int = 9100,
+        health_timeout: float = 1.0,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            registry (MetricsRegistry): Набор метрик приложения.
+            state (Optional[BotState], optional): Состояние бота. По умолчанию None -
+                                                  проверки состояния не публикуются.
+            host (str, optional): Адрес сервера. По умолчанию "127.0.0.1".
+            port (int, optional): Порт сервера. По умолчанию 9100.
+            health_timeout (float, optional): Время ожидания проверки. По умолчанию 1.0.
+        """
+        self.__registry = registry
+        self.__state = state
+        self.__host = host
+        self.__port = port
+        self.__health_timeout = health_timeout
+        self.__runner = None
+
+    # -------------------------------------------------------------------------
+    @property
+    def port(self) -> int:
+        return self.__port
+
+    # -------------------------------------------------------------------------
+    @property
+    def is_running(self) -> bool:
+        return self.__runner is not None
+
+    # -------------------------------------------------------------------------
+    async def start(self) -> None:
+        """start запускает сервер.
+
+        Raises:
+            RuntimeError: Возбуждается если сервер уже запущен.
+        """
+        if self.__runner is not None:
+            raise RuntimeError("Сервер метрик уже запущен!")
+
+        application = web.Application()
+        application.router.add_get("/metrics", self.__handle_metrics)
+
+        if self.__state is not None:
+            application.router.add_get("/health/live", self.__handle_live)
+            application.router.add_get("/health/ready", self.__handle_ready)
+
+        runner = web.AppRunner(application, access_log=None)
+        await runner.setup()
+
+        site = web.TCPSite(runner, host=self.__host, port=self.__port)
+        await site.start()
+
+        # Если порт выбирается системой, сохраняется фактический.
+        if self.__port == 0 and runner.addresses:
+            self.__port = runner.addresses[0][1]
+
+        self.__runner = runner
+
+    # -------------------------------------------------------------------------
+    async def stop(self) -> None:
+        """stop останавливает сервер."""
+        if self.__runner is not None:
+            runner, self.__runner = self.__runner, None
+            await runner.cleanup()
+
+    # -------------------------------------------------------------------------
+    async def __handle_metrics(self, _: web.Request) -> web.Response:
+        response = web.Response(body=self.__registry.render().encode("utf-8"))
+        response.headers["Content-Type"] = self.CONTENT_TYPE
+
+        return response
+
+    # -------------------------------------------------------------------------
+    async def __handle_live(self, _: web.Request) -> web.Response:
+        report: HealthReport = await self.__check_health()
+
+        return web.json_response(report.as_dict(), status=200 if report.is_live else 503)
+
+    # -------------------------------------------------------------------------
+    async def __handle_ready(self, _: web.Request) -> web.Response:
+        report: HealthReport = await self.__check_health()
+
+        return web.json_response(report.as_dict(), status=200 if report.is_ready else 503)
+
+    # -------------------------------------------------------------------------
+    async def __check_health(self) -> HealthReport:
+        return await self.__state.check_health(  # type: ignore
+            timeout=self.__health_timeout
+        )
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль circuit_breaker предоставляет автоматический выключатель (circuit breaker)
+для вызовов внешней зависимости (БД, Telegram Bot API): после серии неудачных
+или медленных вызовов зависимость перестаёт вызываться на заданное время,
+а вызовы сразу отклоняются, не занимая память ожиданием ответа.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["CircuitState", "CircuitOpenError", "CircuitBreaker"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+
+from enum import Enum
+
+from typing import Any, Awaitable, Callable, Optional, Tuple, Type
+
+
+# ____________________________________________________________________________
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# ____________________________________________________________________________
+class CircuitOpenError(RuntimeError):
+    """CircuitOpenError исключение отклонённого вызова разомкнутой зависимости.
+
+    Attributes:
+        name (str): Название зависимости.
+        retry_after (float): Время до пробного вызова в секундах.
+    """
+
+    name: str
+    retry_after: float
+
+    # -------------------------------------------------------------------------
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(
+            f"Вызовы зависимости {name} приостановлены на {retry_after:.1f} с!"
+        )
+        self.name = name
+        self.retry_after = retry_after
+
+
+# ____________________________________________________________________________
+class CircuitBreaker:
+    """CircuitBreaker класс автоматического выключателя вызовов зависимости.
+
+    В замкнутом состоянии вызовы выполняются, а неудачи подряд подсчитываются.
+    После failure_threshold неудач выключатель размыкается и recovery_timeout секунд
+    отклоняет вызовы исключением CircuitOpenError. Затем выполняется один пробный
+    вызов: при успехе выключатель замыкается, при неудаче снова размыкается.
+
+    *Неудачей считается исключение из failure_errors, а также вызов,
+    выполнявшийся дольше slow_call_seconds. Остальные исключения
+    (например, ошибки в запросе) на состояние выключателя не влияют.
+    Выключатель не использует блокировки и рассчитан на работу в одном цикле событий.
+
+    Attributes:
+        __name (str): Название зависимости.
+        __failure_threshold (int): Количество неудач подряд для размыкания.
+        __recovery_timeout (float): Время в разомкнутом состоянии до пробного вызова.
+        __slow_call_seconds (Optional[float]): Длительность вызова, считающаяся неудачей.
+        __failure_errors (Tuple[Type[BaseException], ...]): Исключения-неудачи.
+        __clock (Callable[[], float]): Функция получения текущего времени.
+        __state (CircuitState): Состояние выключателя.
+        __failures (int): Количество неудач подряд.
+        __opened_at (float): Время размыкания.
+        __is_probing (bool): Выполняется ли пробный вызов.
+    """
+
+    __name: str
+    __failure_threshold: int
+    __recovery_timeout: float
+    __slow_call_seconds: Optional[float]
+    __failure_errors: Tuple[Type[BaseException], ...]
+    __clock: Callable[[], float]
+    __state: CircuitState
+    __failures: int
+    __opened_at: float
+    __is_probing: bool
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        slow_call_seconds: Optional[float] = None,
+        failure_errors: Tuple[Type[BaseException], ...] = (Exception,),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            name (str): Название зависимости.
+            failure_threshold (int, optional): Количество неудач подряд для размыкания.
+                                               По умолчанию 5.
+            recovery_timeout (float, optional): Время в разомкнутом состоянии
+                                                до пробного вызова. По умолчанию 30.0.
+            slow_call_seconds (Optional[float], optional): Длительность вызова,
+                считающаяся неудачей. По умолчанию None - не учитывается.
+            failure_errors (Tuple[Type[BaseException], ...], optional): Исключения,
+                считающиеся неудачей. По умолчанию (Exception,).
+            clock (Callable[[], float], optional): Функция получения текущего времени.
+                                                   По умолчанию time.monotonic.
+
+        Raises:
+            ValueError: Возбуждается если количество неудач меньше единицы.
+        """
+        if failure_threshold < 1:
+            raise ValueError(
+                "Количество неудач для размыкания должно быть больше нуля!"
+            )
+
+        self.__name = name
+        self.__failure_threshold = failure_threshold
+        self.__recovery_timeout = recovery_timeout
+        self.__slow_call_seconds = slow_call_seconds
+        self.__failure_errors = failure_errors
+        self.__clock = clock
+        self.__state = CircuitState.CLOSED
+        self.__failures = 0
+        self.__opened_at = 0.0
+        self.__is_probing = False
+
+    # -------------------------------------------------------------------------
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    # -------------------------------------------------------------------------
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self.__state is CircuitState.OPEN
+            and self.__clock() - self.__opened_at >= self.__recovery_timeout
+        ):
+            self.__state = CircuitState.HALF_OPEN
+
+        return self.__state
+
+    # -------------------------------------------------------------------------
+    @property
+    def failures(self) -> int:
+        return self.__failures
+
+    # -------------------------------------------------------------------------
+    def reject_if_open(self) -> None:
+        """reject_if_open отклоняет вызов, если выключатель разомкнут.
+
+        *Метод не начинает пробный вызов и используется для отказа
+        до ожидания других ресурсов (например, места в ограничителе).
+
+        Raises:
+            CircuitOpenError: Возбуждается если выключатель разомкнут.
+        """
+        if self.state is CircuitState.OPEN:
+            raise CircuitOpenError(name=self.__name, retry_after=self.__retry_after())
+
+    # -------------------------------------------------------------------------
+    async def call[ResultType](
+        self, function: Callable[..., Awaitable[ResultType]], *args: Any, **kwargs: Any
+    ) -> ResultType:
+        """call выполняет вызов зависимости через выключатель.
+
+        Args:
+            function (Callable[..., Awaitable[ResultType]]): Асинхронная функция вызова.
+            *args (Any): Позиционные аргументы функции.
+            **kwargs (Any): Именованные аргументы функции.
+
+        Raises:
+            CircuitOpenError: Возбуждается если выключатель разомкнут,
+                              либо пробный вызов уже выполняется.
+
+        Returns:
+            ResultType: Результат функции.
+        """
+        state: CircuitState = self.state
+
+        if state is CircuitState.OPEN or (
+            state is CircuitState.HALF_OPEN and self.__is_probing
+        ):
+            raise CircuitOpenError(name=self.__name, retry_after=self.__retry_after())
+
+        is_probe: bool = state is CircuitState.HALF_OPEN
+        self.__is_probing = self.__is_probing or is_probe
+        started_at: float = self.__clock()
+
+        try:
+            result: ResultType = await function(*args, **kwargs)
+
+        except self.__failure_errors:
+            self.__record_failure()
+            raise
+
+        finally:
+            if is_probe:
+                self.__is_probing = False
+
+        if (
+            self.__slow_call_seconds is not None
+            and self.__clock() - started_at > self.__slow_call_seconds
+        ):
+            self.__record_failure()
+        else:
+            self.__record_success()
+
+        return result
+
+    # -------------------------------------------------------------------------
+    def __record_success(self) -> None:
+        self.__failures = 0
+        self.__state = CircuitState.CLOSED
+
+    # -------------------------------------------------------------------------
+    def __record_failure(self) -> None:
+        self.__failures += 1
+
+        # Неудача пробного вызова размыкает выключатель сразу.
+        if (
+            self.__state is CircuitState.HALF_OPEN
+            or self.__failures >= self.__failure_threshold
+        ):
+            self.__state = CircuitState.OPEN
+            self.__opened_at = self.__clock()
+
+    # -------------------------------------------------------------------------
+    def __retry_after(self) -> float:
+        return max(0.0, self.__opened_at + self.__recovery_timeout - self.__clock())
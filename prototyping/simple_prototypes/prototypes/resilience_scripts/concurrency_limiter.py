@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль concurrency_limiter предоставляет адаптивное ограничение количества
+одновременных вызовов зависимости (AIMD): предел растёт на единицу за каждые
+`limit` быстрых вызовов и умножается на backoff_ratio при медленном вызове
+или перегрузке. Вызовы сверх предела отклоняются по приоритету,
+поэтому при перегрузке первыми отбрасываются вызовы низкого приоритета.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "Priority",
+    "current_priority",
+    "LoadShedError",
+    "AdaptiveConcurrencyLimiter",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+import asyncio
+import contextlib
+import contextvars
+
+from enum import IntEnum
+
+from typing import AsyncIterator, Deque, Optional, Tuple, Type
+
+from collections import deque
+
+
+# ____________________________________________________________________________
+class Priority(IntEnum):
+    LOW = 0
+    HIGH = 1
+
+
+# Приоритет текущей задачи (например, обрабатываемого обновления),
+# используемый ограничителями, если приоритет вызова не указан явно.
+current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "current_priority", default=Priority.HIGH
+)
+
+
+# ____________________________________________________________________________
+class LoadShedError(RuntimeError):
+    """LoadShedError исключение вызова, отброшенного при перегрузке.
+
+    Attributes:
+        name (str): Название зависимости.
+        priority (Priority): Приоритет отброшенного вызова.
+    """
+
+    name: str
+    priority: Priority
+
+    # -------------------------------------------------------------------------
+    def __init__(self, name: str, priority: Priority) -> None:
+        super().__init__(
+            f"Вызов зависимости {name} с приоритетом {priority.name} "
+            "отброшен из-за перегрузки!"
+        )
+        self.name = name
+        self.priority = priority
+
+
+# ____________________________________________________________________________
+class AdaptiveConcurrencyLimiter:
+    """AdaptiveConcurrencyLimiter класс адаптивного ограничения одновременных вызовов.
+
+    Вызов высокого приоритета выполняется, если выполняющихся вызовов меньше предела,
+    иначе ожидает в очереди ограниченного размера не дольше queue_timeout секунд.
+    Вызов низкого приоритета выполняется, только если выполняющихся вызовов меньше
+    доли low_priority_share предела и очередь пуста, и никогда не ожидает.
+    Поэтому память, занимаемая ожидающими вызовами, ограничена max_queue_size.
+
+    *Предел уменьшается не чаще одного раза на поколение вызовов: вызовы,
+    начатые до последнего уменьшения, его не повторяют.
+    Ограничитель не использует блокировки и рассчитан на работу в одном цикле событий.
+
+    Attributes:
+        __name (str): Название зависимости.
+        __limit (float): Текущий предел одновременных вызовов.
+        __min_limit (int): Минимальный предел.
+        __max_limit (int): Максимальный предел.
+        __latency_threshold_seconds (float): Длительность вызова, считающаяся медленной.
+        __backoff_ratio (float): Множитель уменьшения предела.
+        __low_priority_share (float): Доля предела, доступная вызовам низкого приоритета.
+        __max_queue_size (int): Максимальное количество ожидающих вызовов.
+        __queue_timeout (float): Максимальное время ожидания в очереди.
+        __overload_errors (Tuple[Type[BaseException], ...]): Исключения перегрузки.
+        __in_flight (int): Количество выполняющихся вызовов.
+        __waiters (Deque[asyncio.Future]): Ожидающие вызовы высокого приоритета.
+        __decreased_at (float): Время последнего уменьшения предела.
+        __shed_amount (int): Количество отброшенных вызовов.
+    """
+
+    __name: str
+    __limit: float
+    __min_limit: int
+    __max_limit: int
+    __latency_threshold_seconds: float
+    __backoff_ratio: float
+    __low_priority_share: float
+    __max_queue_size: int
+    __queue_timeout: float
+    __overload_errors: Tuple[Type[BaseException], ...]
+    __in_flight: int
+    __waiters: Deque[asyncio.Future]
+    __decreased_at: float
+    __shed_amount: int
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        latency_threshold_seconds: float = 0.5,
+        backoff_ratio: float = 0.8,
+        low_priority_share: float = 0.5,
+        max_queue_size: int = 100,
+        queue_timeout: float = 5.0,
+        overload_errors: Tuple[Type[BaseException], ...] = (TimeoutError,),
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            name (str): Название зависимости.
+            initial_limit (int, optional): Начальный предел. По умолчанию 16.
+            min_limit (int, optional): Минимальный предел. По умолчанию 1.
+            max_limit (int, optional): Максимальный предел. По умолчанию 256.
+            latency_threshold_seconds (float, optional): Длительность вызова,
+                считающаяся медленной. По умолчанию 0.5.
+            backoff_ratio (float, optional): Множитель уменьшения предела. По умолчанию 0.8.
+            low_priority_share (float, optional): Доля предела, доступная вызовам
+                                                  низкого приоритета. По умолчанию 0.5.
+            max_queue_size (int, optional): Максимальное количество ожидающих вызовов.
+                                            По умолчанию 100.
+            queue_timeout (float, optional): Максимальное время ожидания в очереди.
+                                             По умолчанию 5.0.
+            overload_errors (Tuple[Type[BaseException], ...], optional): Исключения,
+                означающие перегрузку зависимости. По умолчанию (TimeoutError,).
+
+        Raises:
+            ValueError: Возбуждается если границы предела или множитель некорректны.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Предел должен удовлетворять условию 1 <= min_limit <= "
+                "initial_limit <= max_limit!"
+            )
+
+        if not 0 < backoff_ratio < 1 or not 0 < low_priority_share <= 1:
+            raise ValueError(
+                "Множитель уменьшения должен быть в интервале (0, 1), "
+                "а доля низкого приоритета - в интервале (0, 1]!"
+            )
+
+        self.__name = name
+        self.__limit = float(initial_limit)
+        self.__min_limit = min_limit
+        self.__max_limit = max_limit
+        self.__latency_threshold_seconds = latency_threshold_seconds
+        self.__backoff_ratio = backoff_ratio
+        self.__low_priority_share = low_priority_share
+        self.__max_queue_size = max_queue_size
+        self.__queue_timeout = queue_timeout
+        self.__overload_errors = overload_errors
+        self.__in_flight = 0
+        self.__waiters = deque()
+        self.__decreased_at = float("-inf")
+        self.__shed_amount = 0
+
+    # -------------------------------------------------------------------------
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    # -------------------------------------------------------------------------
+    @property
+    def limit(self) -> int:
+        return int(self.__limit)
+
+    # -------------------------------------------------------------------------
+    @property
+    def in_flight(self) -> int:
+        return self.__in_flight
+
+    # -------------------------------------------------------------------------
+    @property
+    def queued(self) -> int:
+        return len(self.__waiters)
+
+    # -------------------------------------------------------------------------
+    @property
+    def shed_amount(self) -> int:
+        return self.__shed_amount
+
+    # -------------------------------------------------------------------------
+    def would_admit(self, priority: Priority) -> bool:
+        """would_admit проверяет, будет ли вызов выполнен без ожидания.
+
+        Args:
+            priority (Priority): Приоритет вызова.
+
+        Returns:
+            bool: True, если есть свободное место для вызова этого приоритета.
+        """
+        if priority >= Priority.HIGH:
+            return self.__in_flight < self.limit and not self.__waiters
+
+        low_priority_limit: int = max(1, int(self.__limit * self.__low_priority_share))
+
+        return self.__in_flight < low_priority_limit and not self.__waiters
+
+    # -------------------------------------------------------------------------
+    @contextlib.asynccontextmanager
+    async def acquire(self, priority: Optional[Priority] = None) -> AsyncIterator[None]:
+        """acquire занимает место для вызова зависимости на время блока.
+
+        *Длительность блока и исключения из overload_errors изменяют предел.
+
+        Args:
+            priority (Optional[Priority], optional): Приоритет вызова.
+                По умолчанию None - приоритет текущей задачи (current_priority).
+
+        Raises:
+            LoadShedError: Возбуждается если вызов отброшен из-за перегрузки.
+
+        Yields:
+            None: Место для вызова занято.
+        """
+        if priority is None:
+            priority = current_priority.get()
+
+        await self.__admit(priority=priority)
+
+        started_at: float = time.perf_counter()
+        is_overloaded: Optional[bool] = None
+
+        try:
+            yield
+            is_overloaded = (
+                time.perf_counter() - started_at > self.__latency_threshold_seconds
+            )
+
+        except self.__overload_errors:
+            is_overloaded = True
+            raise
+
+        finally:
+            self.__release(started_at=started_at, is_overloaded=is_overloaded)
+
+    # -------------------------------------------------------------------------
+    async def __admit(self, priority: Priority) -> None:
+        if self.would_admit(priority=priority):
+            self.__in_flight += 1
+            return
+
+        if priority < Priority.HIGH or len(self.__waiters) >= self.__max_queue_size:
+            self.__shed_amount += 1
+            raise LoadShedError(name=self.__name, priority=priority)
+
+        waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.__waiters.append(waiter)
+
+        try:
+            async with asyncio.timeout(self.__queue_timeout):
+                await waiter
+
+        except BaseException as error:
+            if waiter.done() and not waiter.cancelled():
+                # Место уже передано вызову, но он отменён до начала.
+                self.__release(started_at=time.perf_counter(), is_overloaded=None)
+            else:
+                waiter.cancel()
+
+                with contextlib.suppress(ValueError):
+                    self.__waiters.remove(waiter)
+
+            if isinstance(error, TimeoutError):
+                self.__shed_amount += 1
+                raise LoadShedError(name=self.__name, priority=priority) from error
+
+            raise
+
+    # -------------------------------------------------------------------------
+    def __release(self, started_at: float, is_overloaded: Optional[bool]) -> None:
+        self.__in_flight -= 1
+
+        if is_overloaded:
+            if started_at > self.__decreased_at:
+                self.__limit = max(
+                    float(self.__min_limit), self.__limit * self.__backoff_ratio
+                )
+                self.__decreased_at = time.perf_counter()
+
+        # Предел растёт, только если он используется хотя бы наполовину.
+        elif is_overloaded is not None and 2 * (self.__in_flight + 1) >= self.__limit:
+            self.__limit = min(
+                float(self.__max_limit), self.__limit + 1.0 / self.__limit
+            )
+
+        # Освободившиеся места передаются ожидающим вызовам по порядку.
+        while self.__waiters and self.__in_flight < self.limit:
+            waiter: asyncio.Future = self.__waiters.popleft()
+
+            if not waiter.done():
+                self.__in_flight += 1
+                waiter.set_result(None)
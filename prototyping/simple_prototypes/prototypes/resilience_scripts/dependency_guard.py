@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль dependency_guard объединяет автоматический выключатель и ограничение
+одновременных вызовов для одной зависимости, включая возврат закэшированного
+ответа, пока зависимость недоступна или перегружена.
+
+Пример защиты вызовов БД (ошибки соединения MySQL считаются неудачами):
+    guard = DependencyGuard(
+        breaker=CircuitBreaker(
+            name="mysql", failure_errors=(OperationalError, InterfaceError, PoolError)
+        ),
+        limiter=AdaptiveConcurrencyLimiter(name="mysql", overload_errors=(PoolError,)),
+    )
+    api = GuardedDatabaseAPI(api=database.api, guard=guard)
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["DependencyGuard", "GuardedDatabaseAPI"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from string import Template
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from prototypes.cache_scripts.lru_ttl_cache import LRUTTLCache
+from prototypes.resilience_scripts.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from prototypes.resilience_scripts.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    LoadShedError,
+    Priority,
+)
+
+
+# ____________________________________________________________________________
+class DependencyGuard:
+    """DependencyGuard класс защиты вызовов одной зависимости.
+
+    Вызов сначала отклоняется, если выключатель разомкнут, затем занимает место
+    в ограничителе и выполняется через выключатель.
+
+    Attributes:
+        __breaker (CircuitBreaker): Автоматический выключатель зависимости.
+        __limiter (Optional[AdaptiveConcurrencyLimiter]): Ограничение одновременных вызовов.
+    """
+
+    __breaker: CircuitBreaker
+    __limiter: Optional[AdaptiveConcurrencyLimiter]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ) -> None:
+        self.__breaker = breaker
+        self.__limiter = limiter
+
+    # -------------------------------------------------------------------------
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self.__breaker
+
+    # -------------------------------------------------------------------------
+    @property
+    def limiter(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        return self.__limiter
+
+    # -------------------------------------------------------------------------
+    async def call[ResultType](
+        self,
+        function: Callable[..., Awaitable[ResultType]],
+        *args: Any,
+        priority: Optional[Priority] = None,
+        **kwargs: Any,
+    ) -> ResultType:
+        """call выполняет вызов зависимости.
+
+        Args:
+            function (Callable[..., Awaitable[ResultType]]): Асинхронная функция вызова.
+            *args (Any): Позиционные аргументы функции.
+            priority (Optional[Priority], optional): Приоритет вызова.
+                По умолчанию None - приоритет текущей задачи.
+            **kwargs (Any): Именованные аргументы функции.
+
+        Raises:
+            CircuitOpenError: Возбуждается если выключатель разомкнут.
+            LoadShedError: Возбуждается если вызов отброшен из-за перегрузки.
+
+        Returns:
+            ResultType: Результат функции.
+        """
+        self.__breaker.reject_if_open()
+
+        if self.__limiter is None:
+            return await self.__breaker.call(function, *args, **kwargs)
+
+        async with self.__limiter.acquire(priority=priority):
+            return await self.__breaker.call(function, *args, **kwargs)
+
+    # -------------------------------------------------------------------------
+    async def call_with_fallback[ResultType](
+        self,
+        cache: LRUTTLCache[Hashable, ResultType],
+        key: Hashable,
+        function: Callable[..., Awaitable[ResultType]],
+        *args: Any,
+        priority: Optional[Priority] = None,
+        **kwargs: Any,
+    ) -> ResultType:
+        """call_with_fallback выполняет вызов, возвращая закэшированный ответ при отказе.
+
+        Успешный ответ сохраняется в кэш. Если вызов отклонён выключателем
+        или отброшен из-за перегрузки, возвращается последний сохранённый ответ.
+
+        *Срок жизни записей кэша определяет, насколько устаревший ответ допустим;
+        для каталога товаров он обычно больше, чем у кэша обычных запросов.
+
+        Args:
+            cache (LRUTTLCache[Hashable, ResultType]): Кэш последних успешных ответов.
+            key (Hashable): Ключ ответа в кэше.
+            function (Callable[..., Awaitable[ResultType]]): Асинхронная функция вызова.
+            *args (Any): Позиционные аргументы функции.
+            priority (Optional[Priority], optional): Приоритет вызова.
+                По умолчанию None - приоритет текущей задачи.
+            **kwargs (Any): Именованные аргументы функции.
+
+        Raises:
+            CircuitOpenError: Возбуждается если выключатель разомкнут и ответа нет в кэше.
+            LoadShedError: Возбуждается если вызов отброшен и ответа нет в кэше.
+
+        Returns:
+            ResultType: Результат функции, либо закэшированный ответ.
+        """
+        try:
+            result: ResultType = await self.call(
+                function, *args, priority=priority, **kwargs
+            )
+
+        except (CircuitOpenError, LoadShedError):
+            is_found, cached = cache.lookup(key=key)
+
+            if not is_found:
+                raise
+
+            return cached  # type: ignore
+
+        cache.set(key=key, value=result)
+
+        return result
+
+
+# ____________________________________________________________________________
+class GuardedDatabaseAPI:
+    """GuardedDatabaseAPI класс API БД, вызовы пула которого защищены.
+
+    Транзакции над пулом соединений выполняются через DependencyGuard,
+    остальные атрибуты передаются API без изменений, поэтому экземпляр
+    можно использовать вместо AsyncMySQLAPI из database_prototypes.
+
+    Attributes:
+        __api (Any): Защищаемое API БД.
+        __guard (DependencyGuard): Защита вызовов БД.
+    """
+
+    __api: Any
+    __guard: DependencyGuard
+
+    # -------------------------------------------------------------------------
+    def __init__(self, api: Any, guard: DependencyGuard) -> None:
+        self.__api = api
+        self.__guard = guard
+
+    # -------------------------------------------------------------------------
+    @property
+    def guard(self) -> DependencyGuard:
+        return self.__guard
+
+    # -------------------------------------------------------------------------
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__api, name)
+
+    # -------------------------------------------------------------------------
+    async def execute_transaction_use_pool[ResultType](
+        self,
+        transaction: Callable[[Any], ResultType],
+        priority: Optional[Priority] = None,
+    ) -> ResultType:
+        """execute_transaction_use_pool выполняет транзакцию над БД через защиту.
+
+        Args:
+            transaction (Callable[[Any], ResultType]): Функция-транзакция.
+            priority (Optional[Priority], optional): Приоритет вызова.
+                По умолчанию None - приоритет текущей задачи.
+
+        Returns:
+            ResultType: Результат, возвращённый функцией-транзакцией.
+        """
+        return await self.__guard.call(
+            self.__api.execute_transaction_use_pool, transaction, priority=priority
+        )
+
+    # -------------------------------------------------------------------------
+    async def execute_sql_query_use_pool(
+        self,
+        query_template: Template,
+        query_data: Dict[str, str],
+        priority: Optional[Priority] = None,
+    ) -> None:
+        """execute_sql_query_use_pool выполняет запрос к БД через защиту.
+
+        *Метод API с тем же именем перехватывает ошибки MySQL и только выводит их,
+        поэтому выключатель не узнал бы о неудаче. Запрос выполняется транзакцией
+        над пулом, и, в отличие от метода API, ошибки передаются вызывающему.
+
+        Args:
+            query_template (Template): Шаблон строки запроса.
+            query_data (Dict[str, str]): Данные для подстановки в шаблон.
+            priority (Optional[Priority], optional): Приоритет вызова.
+                По умолчанию None - приоритет текущей задачи.
+        """
+        query_string: str = query_template.substitute(**query_data)
+
+        def transaction(connection: Any) -> None:
+            with connection.cursor() as cursor:
+                cursor.execute(query_string)
+
+        await self.execute_transaction_use_pool(transaction, priority=priority)
@@ -1 +0,0 @@
-print(f"Package Imported: {__package__}\n{__path__}\n\n")
@@ -18,7 +18,10 @@ from aiogram import Dispatcher, Bot
 from aiogram.enums import ParseMode
 from aiogram.client.default import DefaultBotProperties
 
-from typing import Any
+from typing import Any, Optional
+
+from prototypes.monitoring_scripts.loop_monitor import LoopMonitor
+from prototypes.telegram_scripts.lifecycle_handler import LifecycleManager
 
 
 # ----------------------------------------------------------------------------
@@ -63,7 +66,12 @@ async def configure_bot(
 
 
 # ----------------------------------------------------------------------------
-async def run_bot(bot: Bot, dispatcher: Dispatcher) -> None:
+async def run_bot(
+    bot: Bot,
+    dispatcher: Dispatcher,
+    loop_monitor: Optional[LoopMonitor] = None,
+    lifecycle: Optional[LifecycleManager] = None,
+) -> None:
     """run_bot запускает telegram бота в онлайн.
 
     Функция используется для инициирования запуска telegram бота,
@@ -72,5 +80,23 @@ async def run_bot(bot: Bot, dispatcher: Dispatcher) -> None:
     Args:
         bot (Bot): Настроенный экземпляр aiogram.Bot.
         dispatcher (Dispatcher): Настроенный экземпляр aiogram.Dispatcher.
+        loop_monitor (Optional[LoopMonitor], optional): Наблюдение за задержкой
+            цикла событий на время работы бота. По умолчанию None - не используется.
+        lifecycle (Optional[LifecycleManager], optional): Менеджер корректной остановки:
+            ожидание обрабатываемых обновлений и шаги остановки при завершении опроса.
+            По умолчанию None - не используется.
     """
-    await dispatcher.start_polling(bot)  # type: ignore
+    if lifecycle is not None:
+        lifecycle.setup(dispatcher=dispatcher)
+
+    if loop_monitor is None:
+        await dispatcher.start_polling(bot)  # type: ignore
+        return
+
+    loop_monitor.start()
+
+    try:
+        await dispatcher.start_polling(bot)  # type: ignore
+    finally:
+        await loop_monitor.stop()
+        print(loop_monitor.report())
@@ -1,52 +1,211 @@
 # -*- coding: utf-8 -*-
 
 """
-Модуль bot_state_handlers используяется для демонстрации работы
-обработчиков состояния бота.
-(Прямое использование данного модуля в разработке конечного продукта не предусмотренно)
+Модуль bot_state_handlers используяется для отслеживания этапа жизненного цикла бота
+(запуск, работа, остановка) и формирования отчёта о его состоянии
+для проверок готовности (readiness) и работоспособности (liveness).
 
 Copyright 2024 HyacinthusIO
 Лицензия Apache, версия 2.0 (Apache-2.0 license)
 """
 
-__all__: list[str] = ["on_start_bot", "on_stop_bot", "_current_state"]
+__all__: list[str] = [
+    "BotStage",
+    "BotState",
+    "HealthReport",
+    "on_start_bot",
+    "on_stop_bot",
+    "_current_state",
+]
 
 __author__ = "HyacinthusIO"
-__version__ = "1.0.0"
+__version__ = "1.1.0"
+
+import time
+import asyncio
+
+from enum import Enum
+from dataclasses import dataclass
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+# Аннотация для функции проверки состояния зависимости (БД, пул SMTP и т.п.).
+HealthCheckType = Callable[[], Awaitable[bool]]
+
+
+# ____________________________________________________________________________
+class BotStage(Enum):
+    CREATED = "created"
+    STARTING = "starting"
+    RUNNING = "running"
+    STOPPING = "stopping"
+    STOPPED = "stopped"
+
+
+# ____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class HealthReport:
+    """HealthReport класс отчёта о состоянии бота.
+
+    Attributes:
+        stage (BotStage): Этап жизненного цикла.
+        is_live (bool): Работоспособен ли процесс (иначе его следует перезапустить).
+        is_ready (bool): Готов ли бот обрабатывать обновления.
+        uptime_seconds (float): Время работы с момента запуска в секундах.
+        checks (Dict[str, bool]): Результаты проверок по имени.
+    """
+
+    stage: BotStage
+    is_live: bool
+    is_ready: bool
+    uptime_seconds: float
+    checks: Dict[str, bool]
+
+    # -------------------------------------------------------------------------
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage.value,
+            "is_live": self.is_live,
+            "is_ready": self.is_ready,
+            "uptime_seconds": round(self.uptime_seconds, 3),
+            "checks": dict(self.checks),
+        }
 
 
 # ____________________________________________________________________________
 class BotState:
+    """BotState класс состояния бота.
+
+    Состояние включено (True), пока бот находится на этапе RUNNING.
+
+    Проверки зависимостей делятся на проверки работоспособности (ошибка означает,
+    что процесс следует перезапустить) и проверки готовности (ошибка означает,
+    что бот временно не может обрабатывать обновления).
+
+    Attributes:
+        __stage (BotStage): Этап жизненного цикла.
+        __started_at (Optional[float]): Время перехода на этап RUNNING (time.monotonic).
+        __checks (Dict[str, Tuple[HealthCheckType, bool]]): Проверки по имени:
+            (функция проверки, является ли проверкой работоспособности).
+    """
+
+    __stage: BotStage
+    __started_at: Optional[float]
+    __checks: Dict[str, Tuple[HealthCheckType, bool]]
+
+    # -------------------------------------------------------------------------
     def __init__(self) -> None:
-        self.__state: bool = False
+        self.__stage = BotStage.CREATED
+        self.__started_at = None
+        self.__checks = {}
 
     # -------------------------------------------------------------------------
     @property
     def state(self) -> bool:
-        return self.__state
+        return self.__stage is BotStage.RUNNING
 
     # -------------------------------------------------------------------------
     @state.setter
     def state(self, new_state: bool) -> None:
-        self.__state = new_state
+        self.stage = BotStage.RUNNING if new_state else BotStage.STOPPED
+
+    # -------------------------------------------------------------------------
+    @property
+    def stage(self) -> BotStage:
+        return self.__stage
+
+    # -------------------------------------------------------------------------
+    @stage.setter
+    def stage(self, new_stage: BotStage) -> None:
+        if new_stage is BotStage.RUNNING and self.__stage is not BotStage.RUNNING:
+            self.__started_at = time.monotonic()
+
+        self.__stage = new_stage
+
+    # -------------------------------------------------------------------------
+    @property
+    def uptime_seconds(self) -> float:
+        if self.__started_at is None or self.__stage is not BotStage.RUNNING:
+            return 0.0
+
+        return time.monotonic() - self.__started_at
 
     # -------------------------------------------------------------------------
     def switch_state(self) -> None:
         self.state = False if self.state else True
 
+    # -------------------------------------------------------------------------
+    def add_health_check(
+        self, name: str, check: HealthCheckType, is_liveness: bool = False
+    ) -> None:
+        """add_health_check добавляет проверку зависимости.
+
+        Args:
+            name (str): Имя проверки в отчёте.
+            check (HealthCheckType): Функция, возвращающая True если зависимость доступна.
+            is_liveness (bool, optional): Является ли проверкой работоспособности.
+                                          По умолчанию False - проверка готовности.
+        """
+        self.__checks[name] = (check, is_liveness)
+
+    # -------------------------------------------------------------------------
+    async def check_health(self, timeout: float = 1.0) -> HealthReport:
+        """check_health выполняет проверки одновременно и формирует отчёт.
+
+        *Проверка, не завершившаяся за timeout, либо возбудившая исключение, не пройдена.
+
+        Args:
+            timeout (float, optional): Время ожидания каждой проверки. По умолчанию 1.0.
+
+        Returns:
+            HealthReport: Отчёт о состоянии бота.
+        """
+        names: List[str] = list(self.__checks)
+        results: List[bool] = list(
+            await asyncio.gather(
+                *(
+                    self.__run_check(check=self.__checks[name][0], timeout=timeout)
+                    for name in names
+                )
+            )
+        )
+        checks: Dict[str, bool] = dict(zip(names, results))
+
+        is_live: bool = self.__stage is not BotStage.STOPPED and all(
+            checks[name] for name in names if self.__checks[name][1]
+        )
+
+        return HealthReport(
+            stage=self.__stage,
+            is_live=is_live,
+            is_ready=is_live and self.state and all(results),
+            uptime_seconds=self.uptime_seconds,
+            checks=checks,
+        )
+
     # -------------------------------------------------------------------------
     def __call__(self) -> bool:
         return self.state
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    async def __run_check(check: HealthCheckType, timeout: float) -> bool:
+        try:
+            async with asyncio.timeout(timeout):
+                return bool(await check())
+        except Exception:
+            return False
+
 
 _current_state = BotState()
 
 
 # ----------------------------------------------------------------------------
 async def on_start_bot() -> None:
-    _current_state.switch_state()
+    _current_state.stage = BotStage.RUNNING
 
 
 # ----------------------------------------------------------------------------
 async def on_stop_bot() -> None:
-    _current_state.switch_state()
+    _current_state.stage = BotStage.STOPPED
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль chunked_input_file используется для загрузки файлов в telegram частями,
+полученными из асинхронного источника (например, хранилища изображений),
+без копирования содержимого в bytes перед отправкой.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["ChunkedInputFile"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from aiogram import Bot
+from aiogram.types import InputFile
+
+from typing import AsyncGenerator, AsyncIterator, Callable, Optional, Union
+
+
+# Аннотация для части файла, передаваемой без копирования.
+ChunkType = Union[bytes, bytearray, memoryview]
+
+# Аннотация для функции, открывающей источник частей файла.
+ChunksOpenMethodType = Callable[[], AsyncIterator[ChunkType]]
+
+
+# ____________________________________________________________________________
+class ChunkedInputFile(InputFile):
+    """ChunkedInputFile класс файла, загружаемого частями из асинхронного источника.
+
+    В отличие от BufferedInputFile, части не копируются:
+    memoryview передаётся в тело запроса aiohttp как есть.
+
+    *Источник открывается при каждой отправке, поэтому файл можно отправлять повторно.
+
+    Attributes:
+        __open_chunks (ChunksOpenMethodType): Функция, открывающая источник частей файла.
+    """
+
+    __open_chunks: ChunksOpenMethodType
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self, open_chunks: ChunksOpenMethodType, filename: Optional[str] = None
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            open_chunks (ChunksOpenMethodType): Функция, открывающая источник частей файла,
+                                                например `lambda: storage.iter_chunks(key)`.
+            filename (Optional[str], optional): Имя файла. По умолчанию None.
+        """
+        super().__init__(filename=filename)
+
+        self.__open_chunks = open_chunks
+
+    # -------------------------------------------------------------------------
+    async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:
+        async for chunk in self.__open_chunks():
+            yield chunk  # type: ignore
@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль inline_search_handler реализует поиск товаров в inline-режиме
+(`@NekoShopBot запрос` в любом чате): запросы одного пользователя откладываются
+на время набора текста, устаревшие запросы отменяются, а страницы результатов
+кэшируются по нормализованному запросу, поэтому набор текста
+не превращается в запрос к БД на каждое нажатие клавиши.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "ProductSearchResult",
+    "InlineSearchPage",
+    "InlineProductSearch",
+    "normalize_query",
+    "build_inline_results",
+    "create_inline_search_router",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import html
+import time
+import asyncio
+
+from dataclasses import dataclass
+
+from aiogram import Router
+from aiogram.types import (
+    InlineQuery,
+    InlineQueryResultArticle,
+    InputTextMessageContent,
+)
+
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from prototypes.cache_scripts.lru_ttl_cache import LRUTTLCache
+
+
+# Аннотация для функции поиска товаров в БД: (запрос, смещение, количество)
+# -> строки (id, title, description, price).
+ProductSearchMethodType = Callable[[str, int, int], Awaitable[Sequence[Sequence[Any]]]]
+
+# Максимальное количество результатов в ответе на inline-запрос (ограничение Bot API).
+_MAX_PAGE_SIZE: int = 50
+
+# Максимальная длина описания результата в списке inline-режима.
+_DESCRIPTION_LENGTH: int = 100
+
+
+# ____________________________________________________________________________
+class ProductSearchResult:
+    """ProductSearchResult класс компактной записи о найденном товаре.
+
+    Attributes:
+        product_id (int): Идентификатор товара.
+        title (str): Название товара.
+        description (str): Описание товара.
+        price (Decimal): Цена товара.
+    """
+
+    __slots__ = ("product_id", "title", "description", "price")
+
+    product_id: int
+    title: str
+    description: str
+    price: Decimal
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self, product_id: int, title: str, description: str, price: Decimal
+    ) -> None:
+        self.product_id = product_id
+        self.title = title
+        self.description = description
+        self.price = price
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "ProductSearchResult":
+        """from_row создаёт запись из строки таблицы `Product`.
+
+        Args:
+            row (Sequence[Any]): (id, title, description, price).
+
+        Returns:
+            ProductSearchResult: Запись о найденном товаре.
+        """
+        return cls(
+            product_id=row[0], title=row[1], description=row[2], price=Decimal(row[3])
+        )
+
+
+# ____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class InlineSearchPage:
+    """InlineSearchPage класс страницы результатов поиска.
+
+    Attributes:
+        results (Tuple[ProductSearchResult, ...]): Найденные товары.
+        next_offset (str): Смещение следующей страницы для Bot API,
+                           пустая строка - страница последняя.
+    """
+
+    results: Tuple[ProductSearchResult, ...]
+    next_offset: str
+
+
+_EMPTY_PAGE: InlineSearchPage = InlineSearchPage(results=(), next_offset="")
+
+
+# ----------------------------------------------------------------------------
+def normalize_query(query: str) -> str:
+    """normalize_query приводит запрос к виду, по которому кэшируются результаты.
+
+    Args:
+        query (str): Текст inline-запроса.
+
+    Returns:
+        str: Запрос в нижнем регистре с одиночными пробелами между словами.
+    """
+    return " ".join(query.casefold().split())
+
+
+# ____________________________________________________________________________
+class InlineProductSearch:
+    """InlineProductSearch класс поиска товаров для inline-режима.
+
+    Первая страница ищется только после паузы debounce_seconds: если за это время
+    пользователь изменил запрос, предыдущий запрос отменяется, не обращаясь к БД.
+    Запрос, отменённый во время поиска, прекращает ожидать результат, а поиск
+    отменяется, если его результат больше никто не ожидает. Одинаковые запросы
+    разных пользователей выполняют один поиск.
+
+    Страницы кэшируются по (нормализованный запрос, смещение) на ttl_seconds.
+    Тот же срок передаётся Bot API (cache_time), поэтому повторные запросы
+    обслуживаются кэшем Telegram, не доходя до бота.
+
+    *Класс не использует блокировки и рассчитан на работу в одном цикле событий.
+
+    Attributes:
+        __search_products (ProductSearchMethodType): Функция поиска товаров в БД.
+        __page_size (int): Количество товаров на странице.
+        __debounce_seconds (float): Пауза перед поиском первой страницы.
+        __min_query_length (int): Минимальная длина запроса для поиска.
+        __cache_time (int): Срок кэширования результатов в Telegram в секундах.
+        __pages (LRUTTLCache[Tuple[str, int], InlineSearchPage]): Кэш страниц.
+        __loading (Dict[Tuple[str, int], asyncio.Task]): Выполняющиеся поиски.
+        __waiters (Dict[Tuple[str, int], int]): Количество ожидающих каждого поиска.
+        __pending (Dict[int, asyncio.Task]): Текущий запрос каждого пользователя.
+    """
+
+    __search_products: ProductSearchMethodType
+    __page_size: int
+    __debounce_seconds: float
+    __min_query_length: int
+    __cache_time: int
+    __pages: LRUTTLCache[Tuple[str, int], InlineSearchPage]
+    __loading: Dict[Tuple[str, int], asyncio.Task]
+    __waiters: Dict[Tuple[str, int], int]
+    __pending: Dict[int, asyncio.Task]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        search_products: ProductSearchMethodType,
+        page_size: int = 20,
+        debounce_seconds: float = 0.3,
+        min_query_length: int = 2,
+        ttl_seconds: float = 60.0,
+        max_size: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            search_products (ProductSearchMethodType): Функция поиска товаров в БД.
+            page_size (int, optional): Количество товаров на странице. По умолчанию 20.
+            debounce_seconds (float, optional): Пауза перед поиском первой страницы.
+                                                По умолчанию 0.3.
+            min_query_length (int, optional): Минимальная длина запроса для поиска.
+                                              По умолчанию 2.
+            ttl_seconds (float, optional): Срок жизни страницы в кэше. По умолчанию 60.0.
+            max_size (int, optional): Максимальное количество страниц в кэше.
+                                      По умолчанию 10000.
+            clock (Callable[[], float], optional): Функция получения текущего времени.
+                                                   По умолчанию time.monotonic.
+
+        Raises:
+            ValueError: Возбуждается если размер страницы не в промежутке [1, 50].
+        """
+        if not 1 <= page_size <= _MAX_PAGE_SIZE:
+            raise ValueError(
+                f"Размер страницы должен быть от 1 до {_MAX_PAGE_SIZE} результатов!"
+            )
+
+        self.__search_products = search_products
+        self.__page_size = page_size
+        self.__debounce_seconds = debounce_seconds
+        self.__min_query_length = min_query_length
+        self.__cache_time = int(ttl_seconds)
+        self.__pages = LRUTTLCache(
+            max_size=max_size, ttl_seconds=ttl_seconds, clock=clock
+        )
+        self.__loading = {}
+        self.__waiters = {}
+        self.__pending = {}
+
+    # -------------------------------------------------------------------------
+    @property
+    def cache_time(self) -> int:
+        return self.__cache_time
+
+    # -------------------------------------------------------------------------
+    async def search(
+        self, user_id: int, query: str, offset: str = ""
+    ) -> Optional[InlineSearchPage]:
+        """search возвращает страницу результатов поиска.
+
+        Args:
+            user_id (int): Идентификатор пользователя, выполняющего запрос.
+            query (str): Текст inline-запроса.
+            offset (str, optional): Смещение страницы из inline-запроса.
+                                    По умолчанию "" - первая страница.
+
+        Returns:
+            Optional[InlineSearchPage]: Страница результатов, либо None
+                                        если запрос отменён более новым запросом.
+        """
+        previous: Optional[asyncio.Task] = self.__pending.pop(user_id, None)
+
+        if previous is not None:
+            previous.cancel()
+
+        normalized: str = normalize_query(query=query)
+
+        if len(normalized) < self.__min_query_length:
+            return _EMPTY_PAGE
+
+        key: Tuple[str, int] = (normalized, int(offset) if offset.isdigit() else 0)
+        page: Optional[InlineSearchPage] = self.__pages.get(key=key)
+
+        if page is not None:
+            return page
+
+        # Следующие страницы запрашиваются прокруткой, а не набором текста.
+        task: asyncio.Task = asyncio.get_running_loop().create_task(
+            self.__wait_page(key=key, delay=0.0 if key[1] else self.__debounce_seconds)
+        )
+        self.__pending[user_id] = task
+
+        try:
+            return await task
+
+        except asyncio.CancelledError:
+            current: Optional[asyncio.Task] = asyncio.current_task()
+
+            # Отменён только запрос, а не обработчик обновления.
+            if task.cancelled() and (current is None or not current.cancelling()):
+                return None
+
+            raise
+
+        finally:
+            if self.__pending.get(user_id) is task:
+                del self.__pending[user_id]
+
+    # -------------------------------------------------------------------------
+    async def __wait_page(self, key: Tuple[str, int], delay: float) -> InlineSearchPage:
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        loading: Optional[asyncio.Task] = self.__loading.get(key)
+
+        if loading is None:
+            loading = asyncio.get_running_loop().create_task(self.__load_page(key=key))
+            self.__loading[key] = loading
+
+        self.__waiters[key] = self.__waiters.get(key, 0) + 1
+
+        try:
+            return await asyncio.shield(loading)
+
+        finally:
+            self.__waiters[key] -= 1
+
+            if not self.__waiters[key]:
+                del self.__waiters[key]
+                del self.__loading[key]
+
+                if not loading.done():
+                    loading.cancel()
+
+    # -------------------------------------------------------------------------
+    async def __load_page(self, key: Tuple[str, int]) -> InlineSearchPage:
+        query, offset = key
+
+        # Лишняя строка показывает, есть ли следующая страница.
+        rows: Sequence[Sequence[Any]] = await self.__search_products(
+            query, offset, self.__page_size + 1
+        )
+        page = InlineSearchPage(
+            results=tuple(
+                map(ProductSearchResult.from_row, rows[: self.__page_size])
+            ),
+            next_offset=(
+                str(offset + self.__page_size) if len(rows) > self.__page_size else ""
+            ),
+        )
+        self.__pages.set(key=key, value=page)
+
+        return page
+
+
+# ----------------------------------------------------------------------------
+def build_inline_results(page: InlineSearchPage) -> List[InlineQueryResultArticle]:
+    """build_inline_results создаёт результаты inline-запроса для страницы поиска.
+
+    Args:
+        page (InlineSearchPage): Страница результатов поиска.
+
+    Returns:
+        List[InlineQueryResultArticle]: Результаты для ответа на inline-запрос.
+    """
+    return [
+        InlineQueryResultArticle(
+            id=str(result.product_id),
+            title=result.title,
+            description=f"{result.price} | {result.description[:_DESCRIPTION_LENGTH]}",
+            input_message_content=InputTextMessageContent(
+                message_text=(
+                    f"<b>{html.escape(result.title)}</b>\n"
+                    f"{html.escape(result.description)}\n\n"
+                    f"{result.price}"
+                )
+            ),
+        )
+        for result in page.results
+    ]
+
+
+# ----------------------------------------------------------------------------
+def create_inline_search_router(search: InlineProductSearch) -> Router:
+    """create_inline_search_router создаёт маршрутизатор inline-запросов.
+
+    *Для работы inline-режима его следует включить у бота в @BotFather (/setinline).
+    Inline-запросы имеют низкий приоритет (см. classify_update_priority)
+    и отбрасываются первыми при перегрузке.
+
+    Args:
+        search (InlineProductSearch): Поиск товаров для inline-режима.
+
+    Returns:
+        Router: Маршрутизатор, подключаемый к диспатчеру (include_router).
+    """
+    router = Router(name=__name__)
+
+    @router.inline_query()
+    async def inline_product_search(inline_query: InlineQuery) -> None:
+        page: Optional[InlineSearchPage] = await search.search(
+            user_id=inline_query.from_user.id,
+            query=inline_query.query,
+            offset=inline_query.offset,
+        )
+
+        # Telegram ожидает ответ только на последний запрос пользователя.
+        if page is None:
+            return
+
+        await inline_query.answer(
+            results=build_inline_results(page=page),
+            cache_time=search.cache_time,
+            is_personal=False,
+            next_offset=page.next_offset,
+        )
+
+    return router
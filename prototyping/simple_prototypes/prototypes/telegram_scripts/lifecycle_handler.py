@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль lifecycle_handler используется для корректного завершения работы бота:
+по сигналу SIGTERM (SIGINT) прекращается приём обновлений, ожидается завершение
+обрабатываемых обновлений, после чего по порядку выполняются шаги остановки
+(запись буферов кэшей и очереди задач, закрытие пулов соединений).
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["ShutdownStepResult", "LifecycleManager"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+import signal
+import asyncio
+import contextlib
+
+from dataclasses import dataclass
+
+from aiogram import Dispatcher
+from aiogram.types import TelegramObject
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from prototypes.telegram_scripts.bot_state_handlers import (
+    BotStage,
+    BotState,
+    _current_state,
+)
+
+
+# Аннотация для функции, выполняемой при остановке бота.
+ShutdownMethodType = Callable[[], Awaitable[Any]]
+
+
+# ____________________________________________________________________________
+@dataclass(frozen=True, slots=True)
+class ShutdownStepResult:
+    """ShutdownStepResult класс результата шага остановки.
+
+    Attributes:
+        name (str): Название шага.
+        duration_seconds (float): Длительность шага в секундах.
+        error (Optional[str]): Описание ошибки, либо None если шаг выполнен.
+    """
+
+    name: str
+    duration_seconds: float
+    error: Optional[str]
+
+
+# ____________________________________________________________________________
+class LifecycleManager:
+    """LifecycleManager класс управления запуском и остановкой бота.
+
+    Менеджер подключается к событиям startup и shutdown диспатчера.
+    Остановка выполняется в порядке:
+        1. Этап STOPPING: проверка готовности не пройдена, приём обновлений прекращён.
+        2. Ожидание обрабатываемых обновлений, но не дольше drain_timeout.
+        3. Шаги остановки в порядке добавления, каждый не дольше своего времени.
+           Ошибка шага выводится и не прерывает следующие шаги.
+        4. Этап STOPPED.
+
+    *Шаги следует добавлять в порядке зависимостей: сначала запись буферов
+    (кэши, Outbox.stop), затем закрытие клиентов (EmailDeliveryEngine.close),
+    в конце закрытие соединений к БД (close_connection_with_database, close_pool).
+
+    Attributes:
+        __state (BotState): Состояние бота.
+        __drain_timeout (float): Время ожидания обрабатываемых обновлений.
+        __step_timeout (float): Время выполнения шага остановки по умолчанию.
+        __steps (List[Tuple[str, ShutdownMethodType, float]]): Шаги остановки:
+            (название, функция, время выполнения).
+        __in_flight_amount (int): Количество обрабатываемых обновлений.
+        __idle (asyncio.Event): Установлено, пока нет обрабатываемых обновлений.
+        __results (List[ShutdownStepResult]): Результаты шагов последней остановки.
+        __stop_tasks (Set[asyncio.Task]): Задачи остановки приёма по сигналу.
+    """
+
+    __state: BotState
+    __drain_timeout: float
+    __step_timeout: float
+    __steps: List[Tuple[str, ShutdownMethodType, float]]
+    __in_flight_amount: int
+    __idle: asyncio.Event
+    __results: List[ShutdownStepResult]
+    __stop_tasks: Set[asyncio.Task]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        state: BotState = _current_state,
+        drain_timeout: float = 30.0,
+        step_timeout: float = 10.0,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            state (BotState, optional): Состояние бота. По умолчанию общее состояние
+                                        модуля bot_state_handlers.
+            drain_timeout (float, optional): Время ожидания обрабатываемых обновлений.
+                                             По умолчанию 30.0.
+            step_timeout (float, optional): Время выполнения шага остановки.
+                                            По умолчанию 10.0.
+        """
+        self.__state = state
+        self.__drain_timeout = drain_timeout
+        self.__step_timeout = step_timeout
+        self.__steps = []
+        self.__in_flight_amount = 0
+        self.__idle = asyncio.Event()
+        self.__idle.set()
+        self.__results = []
+        self.__stop_tasks = set()
+
+    # -------------------------------------------------------------------------
+    @property
+    def in_flight_amount(self) -> int:
+        return self.__in_flight_amount
+
+    # -------------------------------------------------------------------------
+    @property
+    def results(self) -> List[ShutdownStepResult]:
+        return list(self.__results)
+
+    # -------------------------------------------------------------------------
+    def add_shutdown_step(
+        self, name: str, method: ShutdownMethodType, timeout: Optional[float] = None
+    ) -> None:
+        """add_shutdown_step добавляет шаг остановки.
+
+        Args:
+            name (str): Название шага.
+            method (ShutdownMethodType): Функция шага.
+            timeout (Optional[float], optional): Время выполнения шага.
+                                                 По умолчанию step_timeout.
+        """
+        self.__steps.append(
+            (name, method, self.__step_timeout if timeout is None else timeout)
+        )
+
+    # -------------------------------------------------------------------------
+    def setup(self, dispatcher: Dispatcher, handle_signals: bool = True) -> None:
+        """setup подключает менеджер к диспатчеру.
+
+        *Функцию следует вызвать первой из функций подключения промежуточных обработчиков,
+        чтобы учитывались все обрабатываемые обновления.
+
+        Args:
+            dispatcher (Dispatcher): Диспатчер, созданный функцией create_dispatcher.
+            handle_signals (bool, optional): Обрабатывать ли SIGTERM и SIGINT.
+                                             По умолчанию True.
+        """
+        dispatcher.update.outer_middleware(self.__track_update)
+
+        async def on_startup() -> None:
+            self.__state.stage = BotStage.RUNNING
+
+            if handle_signals:
+                self.__install_signal_handlers(dispatcher=dispatcher)
+
+        dispatcher.startup.register(on_startup)
+        dispatcher.shutdown.register(self.shutdown)
+
+    # -------------------------------------------------------------------------
+    async def shutdown(self) -> List[ShutdownStepResult]:
+        """shutdown ожидает обрабатываемые обновления и выполняет шаги остановки.
+
+        Returns:
+            List[ShutdownStepResult]: Результаты шагов остановки.
+        """
+        self.__state.stage = BotStage.STOPPING
+
+        # Задачи обработки, созданные перед остановкой приёма, должны успеть начаться.
+        await asyncio.sleep(0)
+
+        try:
+            async with asyncio.timeout(self.__drain_timeout):
+                await self.__idle.wait()
+
+        except TimeoutError:
+            print(
+                "Обработка обновлений не завершилась за отведённое время! "
+                f"Осталось: {self.__in_flight_amount}"
+            )
+
+        self.__results = [
+            await self.__run_step(name=name, method=method, timeout=timeout)
+            for name, method, timeout in self.__steps
+        ]
+
+        self.__state.stage = BotStage.STOPPED
+
+        return self.results
+
+    # -------------------------------------------------------------------------
+    async def __track_update(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        self.__in_flight_amount += 1
+        self.__idle.clear()
+
+        try:
+            return await handler(event, data)
+
+        finally:
+            self.__in_flight_amount -= 1
+
+            if self.__in_flight_amount == 0:
+                self.__idle.set()
+
+    # -------------------------------------------------------------------------
+    def __install_signal_handlers(self, dispatcher: Dispatcher) -> None:
+        loop = asyncio.get_running_loop()
+
+        def on_signal() -> None:
+            if self.__state.stage is not BotStage.RUNNING:
+                return
+
+            # Проверка готовности перестаёт проходить до остановки приёма обновлений.
+            self.__state.stage = BotStage.STOPPING
+
+            task: asyncio.Task = loop.create_task(dispatcher.stop_polling())
+            self.__stop_tasks.add(task)
+            task.add_done_callback(self.__stop_tasks.discard)
+
+        # Обработчики заменяют установленные диспатчером при запуске опроса.
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(signal.SIGTERM, on_signal)
+            loop.add_signal_handler(signal.SIGINT, on_signal)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    async def __run_step(
+        name: str, method: ShutdownMethodType, timeout: float
+    ) -> ShutdownStepResult:
+        started_at: float = time.perf_counter()
+        error: Optional[str] = None
+
+        try:
+            async with asyncio.timeout(timeout):
+                await method()
+
+        except TimeoutError:
+            error = "превышено время выполнения"
+
+        except Exception as exception:
+            error = repr(exception)
+
+        if error is not None:
+            print(f"Шаг остановки не выполнен ({name}): {error}")
+
+        return ShutdownStepResult(
+            name=name, duration_seconds=time.perf_counter() - started_at, error=error
+        )
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль media_cache используется для отправки изображений товаров без повторной загрузки:
+после первой загрузки сохраняется идентификатор файла telegram (`file_id`),
+и следующие отправки того же изображения передают только его.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["MediaCache"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import hashlib
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import BufferedInputFile, InputMediaPhoto, Message
+
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from prototypes.cache_scripts.lru_ttl_cache import LRUTTLCache
+
+
+# Аннотация для функции, загружающей из БД пары - [хэш : file_id] для указанных хэшей.
+FileIdsLoadMethodType = Callable[[Sequence[str]], Awaitable[Mapping[str, str]]]
+
+# Аннотация для функции, сохраняющей в БД пары - [хэш : file_id].
+FileIdsStoreMethodType = Callable[[Mapping[str, str]], Awaitable[Any]]
+
+# Аннотация для функции, удаляющей из БД недействительный file_id.
+FileIdDeleteMethodType = Callable[[str], Awaitable[Any]]
+
+# Максимальное количество элементов в одной группе медиа.
+_MEDIA_GROUP_LIMIT: int = 10
+
+# Части описаний ошибок telegram, означающих, что сохранённый file_id недействителен.
+_INVALID_FILE_ID_MESSAGES: Tuple[str, ...] = (
+    "wrong file identifier",
+    "wrong remote file identifier",
+    "file reference expired",
+)
+
+
+# ----------------------------------------------------------------------------
+def _is_invalid_file_id_error(error: TelegramBadRequest) -> bool:
+    """_is_invalid_file_id_error проверяет, отклонён ли запрос из-за file_id.
+
+    *Остальные ошибки (например, неверная подпись или чат не найден)
+    не связаны с сохранённым идентификатором и не должны его удалять.
+    """
+    message: str = error.message.casefold().replace("_", " ")
+
+    return any(part in message for part in _INVALID_FILE_ID_MESSAGES)
+
+
+# ____________________________________________________________________________
+class MediaCache:
+    """MediaCache класс кэша идентификаторов файлов telegram.
+
+    Ключом является SHA-256 содержимого изображения. Кэш заполняется лениво:
+    идентификаторы отсутствующих в памяти изображений загружаются из БД
+    одним запросом при первой отправке. Изображения, не найденные в БД,
+    кэшируются как отрицательные записи на короткий срок.
+
+    Если telegram отклонил сохранённый file_id как неверный или устаревший,
+    он удаляется, а изображение загружается повторно. Остальные ошибки
+    запроса возбуждаются без изменения кэша.
+
+    Attributes:
+        __load_file_ids (FileIdsLoadMethodType): Функция загрузки из БД.
+        __store_file_ids (FileIdsStoreMethodType): Функция сохранения в БД.
+        __delete_file_id (Optional[FileIdDeleteMethodType]): Функция удаления из БД.
+        __file_ids (LRUTTLCache[str, str]): Кэш идентификаторов файлов.
+    """
+
+    __load_file_ids: FileIdsLoadMethodType
+    __store_file_ids: FileIdsStoreMethodType
+    __delete_file_id: Optional[FileIdDeleteMethodType]
+    __file_ids: LRUTTLCache[str, str]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        load_file_ids: FileIdsLoadMethodType,
+        store_file_ids: FileIdsStoreMethodType,
+        delete_file_id: Optional[FileIdDeleteMethodType] = None,
+        max_size: int = 10_000,
+        negative_ttl_seconds: float = 60.0,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            load_file_ids (FileIdsLoadMethodType): Функция загрузки из БД.
+            store_file_ids (FileIdsStoreMethodType): Функция сохранения в БД.
+            delete_file_id (Optional[FileIdDeleteMethodType], optional): Функция удаления
+                                                                        из БД. По умолчанию None.
+            max_size (int, optional): Максимальное количество записей. По умолчанию 10000.
+            negative_ttl_seconds (float, optional): Срок жизни записи о незагруженном
+                                                    изображении. По умолчанию 60.0.
+        """
+        self.__load_file_ids = load_file_ids
+        self.__store_file_ids = store_file_ids
+        self.__delete_file_id = delete_file_id
+        # file_id не устаревает, поэтому записи со значением вытесняются только по LRU.
+        self.__file_ids = LRUTTLCache(
+            max_size=max_size,
+            ttl_seconds=float("inf"),
+            negative_ttl_seconds=negative_ttl_seconds,
+        )
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def hash_content(image: bytes) -> str:
+        """hash_content возвращает ключ изображения.
+
+        Args:
+            image (bytes): Содержимое изображения.
+
+        Returns:
+            str: SHA-256 в шестнадцатеричном виде.
+        """
+        return hashlib.sha256(image).hexdigest()
+
+    # -------------------------------------------------------------------------
+    async def get_file_ids(
+        self, content_hashes: Sequence[str]
+    ) -> Dict[str, Optional[str]]:
+        """get_file_ids возвращает идентификаторы файлов изображений.
+
+        Args:
+            content_hashes (Sequence[str]): Ключи изображений.
+
+        Returns:
+            Dict[str, Optional[str]]: Пары - [хэш : file_id], None если изображение
+                                      ещё не загружалось.
+        """
+        file_ids: Dict[str, Optional[str]] = {}
+        missing: List[str] = []
+
+        for content_hash in dict.fromkeys(content_hashes):
+            is_found, file_id = self.__file_ids.lookup(key=content_hash)
+
+            if is_found:
+                file_ids[content_hash] = file_id
+            else:
+                missing.append(content_hash)
+
+        if missing:
+            loaded: Mapping[str, str] = await self.__load_file_ids(missing)
+
+            for content_hash in missing:
+                file_ids[content_hash] = loaded.get(content_hash)
+                self.__file_ids.set(key=content_hash, value=file_ids[content_hash])
+
+        return file_ids
+
+    # -------------------------------------------------------------------------
+    async def remember(self, file_ids: Mapping[str, str]) -> None:
+        """remember сохраняет идентификаторы загруженных файлов.
+
+        Args:
+            file_ids (Mapping[str, str]): Пары - [хэш : file_id].
+        """
+        if not file_ids:
+            return
+
+        for content_hash, file_id in file_ids.items():
+            self.__file_ids.set(key=content_hash, value=file_id)
+
+        await self.__store_file_ids(file_ids)
+
+    # -------------------------------------------------------------------------
+    async def forget(self, content_hash: str) -> None:
+        """forget удаляет недействительный идентификатор файла.
+
+        Args:
+            content_hash (str): Ключ изображения.
+        """
+        self.__file_ids.invalidate(key=content_hash)
+
+        if self.__delete_file_id is not None:
+            await self.__delete_file_id(content_hash)
+
+    # -------------------------------------------------------------------------
+    async def send_photo(
+        self, bot: Bot, chat_id: Union[int, str], image: bytes, **kwargs: Any
+    ) -> Message:
+        """send_photo отправляет изображение товара.
+
+        Args:
+            bot (Bot): Экземпляр бота.
+            chat_id (Union[int, str]): Идентификатор чата.
+            image (bytes): Содержимое изображения.
+            **kwargs (Any): Остальные параметры метода sendPhoto (caption, reply_markup...).
+
+        Returns:
+            Message: Отправленное сообщение.
+        """
+        content_hash: str = self.hash_content(image=image)
+        file_id: Optional[str] = (await self.get_file_ids((content_hash,)))[content_hash]
+
+        if file_id is not None:
+            try:
+                return await bot.send_photo(chat_id=chat_id, photo=file_id, **kwargs)
+            except TelegramBadRequest as error:
+                if not _is_invalid_file_id_error(error=error):
+                    raise
+
+                await self.forget(content_hash=content_hash)
+
+        message: Message = await bot.send_photo(
+            chat_id=chat_id,
+            photo=BufferedInputFile(file=image, filename=f"{content_hash}.jpg"),
+            **kwargs,
+        )
+
+        await self.remember(file_ids={content_hash: message.photo[-1].file_id})  # type: ignore
+
+        return message
+
+    # -------------------------------------------------------------------------
+    async def send_media_group(
+        self,
+        bot: Bot,
+        chat_id: Union[int, str],
+        images: Sequence[bytes],
+        caption: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Message]:
+        """send_media_group отправляет изображения товара группами медиа.
+
+        Идентификаторы всех изображений загружаются одним запросом,
+        изображения отправляются группами по 10 (ограничение telegram),
+        новые идентификаторы сохраняются одной транзакцией после отправки.
+
+        Args:
+            bot (Bot): Экземпляр бота.
+            chat_id (Union[int, str]): Идентификатор чата.
+            images (Sequence[bytes]): Содержимое изображений.
+            caption (Optional[str], optional): Подпись к первому изображению.
+            **kwargs (Any): Остальные параметры метода sendMediaGroup.
+
+        Returns:
+            List[Message]: Отправленные сообщения.
+        """
+        content_hashes: List[str] = [self.hash_content(image=image) for image in images]
+        file_ids: Dict[str, Optional[str]] = await self.get_file_ids(content_hashes)
+        uploaded: Dict[str, str] = {}
+        messages: List[Message] = []
+
+        for start in range(0, len(images), _MEDIA_GROUP_LIMIT):
+            group_hashes: List[str] = content_hashes[start : start + _MEDIA_GROUP_LIMIT]
+            group_images: Sequence[bytes] = images[start : start + _MEDIA_GROUP_LIMIT]
+            group_caption: Optional[str] = caption if start == 0 else None
+
+            try:
+                group_messages: List[Message] = await bot.send_media_group(
+                    chat_id=chat_id,
+                    media=self.__build_media(
+                        group_hashes, group_images, file_ids, uploaded, group_caption
+                    ),
+                    **kwargs,
+                )
+
+            except TelegramBadRequest as error:
+                if not _is_invalid_file_id_error(error=error):
+                    raise
+
+                # Неизвестно, какой из идентификаторов отклонён,
+                # поэтому все изображения группы загружаются повторно.
+                for content_hash in group_hashes:
+                    if file_ids.get(content_hash) is not None:
+                        file_ids[content_hash] = None
+                        await self.forget(content_hash=content_hash)
+
+                group_messages = await bot.send_media_group(
+                    chat_id=chat_id,
+                    media=self.__build_media(
+                        group_hashes, group_images, file_ids, uploaded, group_caption
+                    ),
+                    **kwargs,
+                )
+
+            for content_hash, message in zip(group_hashes, group_messages):
+                if file_ids.get(content_hash) is None and content_hash not in uploaded:
+                    uploaded[content_hash] = message.photo[-1].file_id  # type: ignore
+
+            messages.extend(group_messages)
+
+        await self.remember(file_ids=uploaded)
+
+        return messages
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def __build_media(
+        content_hashes: Sequence[str],
+        images: Sequence[bytes],
+        file_ids: Mapping[str, Optional[str]],
+        uploaded: Mapping[str, str],
+        caption: Optional[str],
+    ) -> List[InputMediaPhoto]:
+        media: List[InputMediaPhoto] = []
+
+        for index, (content_hash, image) in enumerate(zip(content_hashes, images)):
+            file_id: Optional[str] = file_ids.get(content_hash) or uploaded.get(
+                content_hash
+            )
+
+            media.append(
+                InputMediaPhoto(
+                    media=file_id
+                    or BufferedInputFile(file=image, filename=f"{content_hash}.jpg"),
+                    caption=caption if index == 0 else None,
+                )
+            )
+
+        return media
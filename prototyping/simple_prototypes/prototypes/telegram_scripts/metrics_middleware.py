@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль metrics_middleware используется для сбора метрик обработки обновлений
+(количество, длительность, ошибки) и запросов к Telegram Bot API.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "UpdateMetricsMiddleware",
+    "TelegramAPIMetricsMiddleware",
+    "setup_metrics",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+
+from aiogram import BaseMiddleware, Bot, Dispatcher
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.types import TelegramObject, Update
+
+from typing import Any, Awaitable, Callable, Dict
+
+from prototypes.monitoring_scripts.metrics import (
+    Counter,
+    HistogramMetric,
+    MetricsRegistry,
+)
+
+
+# ____________________________________________________________________________
+class UpdateMetricsMiddleware(BaseMiddleware):
+    """UpdateMetricsMiddleware промежуточный обработчик метрик обновлений.
+
+    Attributes:
+        __updates (Counter): Количество обработанных обновлений по типу.
+        __errors (Counter): Количество обновлений, обработка которых завершилась ошибкой.
+        __latency (HistogramMetric): Длительность обработки обновлений по типу.
+    """
+
+    __updates: Counter
+    __errors: Counter
+    __latency: HistogramMetric
+
+    # -------------------------------------------------------------------------
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.__updates = registry.counter(
+            name="bot_updates",
+            documentation="Количество обработанных обновлений.",
+            label_names=("update_type",),
+        )
+        self.__errors = registry.counter(
+            name="bot_update_errors",
+            documentation="Количество обновлений, обработка которых завершилась ошибкой.",
+            label_names=("update_type", "error"),
+        )
+        self.__latency = registry.histogram(
+            name="bot_update_duration_seconds",
+            documentation="Длительность обработки обновлений.",
+            label_names=("update_type",),
+        )
+
+    # -------------------------------------------------------------------------
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        update_type: str = (
+            event.event_type if isinstance(event, Update) else type(event).__name__
+        )
+        started_at: float = time.perf_counter()
+
+        try:
+            return await handler(event, data)
+
+        except Exception as error:
+            self.__errors.labels(update_type, type(error).__name__).inc()
+            raise
+
+        finally:
+            self.__latency.labels(update_type).observe(time.perf_counter() - started_at)
+            self.__updates.labels(update_type).inc()
+
+
+# ____________________________________________________________________________
+class TelegramAPIMetricsMiddleware(BaseRequestMiddleware):
+    """TelegramAPIMetricsMiddleware промежуточный обработчик метрик запросов к Bot API.
+
+    Attributes:
+        __requests (Counter): Количество запросов по методу.
+        __errors (Counter): Количество неудачных запросов по методу и ошибке.
+        __latency (HistogramMetric): Длительность запросов по методу.
+    """
+
+    __requests: Counter
+    __errors: Counter
+    __latency: HistogramMetric
+
+    # -------------------------------------------------------------------------
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.__requests = registry.counter(
+            name="telegram_api_requests",
+            documentation="Количество запросов к Telegram Bot API.",
+            label_names=("method",),
+        )
+        self.__errors = registry.counter(
+            name="telegram_api_errors",
+            documentation="Количество неудачных запросов к Telegram Bot API.",
+            label_names=("method", "error"),
+        )
+        self.__latency = registry.histogram(
+            name="telegram_api_request_duration_seconds",
+            documentation="Длительность запросов к Telegram Bot API.",
+            label_names=("method",),
+        )
+
+    # -------------------------------------------------------------------------
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        bot: Bot,
+        method: TelegramMethod,
+    ) -> Response:
+        method_name: str = method.__api_method__
+        started_at: float = time.perf_counter()
+
+        try:
+            return await make_request(bot, method)
+
+        except Exception as error:
+            self.__errors.labels(method_name, type(error).__name__).inc()
+            raise
+
+        finally:
+            self.__latency.labels(method_name).observe(time.perf_counter() - started_at)
+            self.__requests.labels(method_name).inc()
+
+
+# ----------------------------------------------------------------------------
+def setup_metrics(dispatcher: Dispatcher, bot: Bot, registry: MetricsRegistry) -> None:
+    """setup_metrics подключает сбор метрик обновлений и запросов к Bot API.
+
+    *Функцию следует вызвать первой из функций подключения промежуточных обработчиков,
+    чтобы длительность обработки включала их работу.
+
+    Args:
+        dispatcher (Dispatcher): Диспатчер, созданный функцией create_dispatcher.
+        bot (Bot): Бот, созданный функцией configure_bot.
+        registry (MetricsRegistry): Набор метрик приложения.
+    """
+    dispatcher.update.outer_middleware(UpdateMetricsMiddleware(registry=registry))
+    bot.session.middleware(TelegramAPIMetricsMiddleware(registry=registry))
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль resilience_middleware используется для защиты бота от перегрузки:
+обновления низкого приоритета (просмотр каталога) отбрасываются раньше
+обновлений высокого приоритета (оплата и заказы), а запросы к Telegram Bot API
+выполняются через автоматический выключатель и ограничение одновременных вызовов.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "TELEGRAM_FAILURE_ERRORS",
+    "TELEGRAM_OVERLOAD_ERRORS",
+    "classify_update_priority",
+    "create_telegram_guard",
+    "LoadSheddingMiddleware",
+    "TelegramAPIResilienceMiddleware",
+    "setup_resilience",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+from aiogram import BaseMiddleware, Bot, Dispatcher
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import (
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from aiogram.methods import GetUpdates, Response, TelegramMethod
+from aiogram.types import TelegramObject, Update
+
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple, Type
+
+from prototypes.resilience_scripts.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from prototypes.resilience_scripts.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    LoadShedError,
+    Priority,
+    current_priority,
+)
+from prototypes.resilience_scripts.dependency_guard import DependencyGuard
+
+
+# Аннотация для функции, определяющей приоритет обновления.
+UpdatePriorityMethodType = Callable[[Update], Priority]
+
+# Аннотация для функции, вызываемой при отбрасывании обновления
+# (например, чтобы ответить на нажатие кнопки сообщением о перегрузке).
+ShedHandlerType = Callable[[Update, Dict[str, Any], Exception], Awaitable[Any]]
+
+# Исключения, означающие недоступность Telegram Bot API.
+# *TelegramRetryAfter означает ограничение частоты запросов, а не недоступность:
+# он уменьшает предел одновременных запросов, но не размыкает выключатель.
+TELEGRAM_FAILURE_ERRORS: Tuple[Type[BaseException], ...] = (
+    TelegramNetworkError,
+    TelegramServerError,
+    TimeoutError,
+)
+
+# Исключения, означающие перегрузку Telegram Bot API.
+TELEGRAM_OVERLOAD_ERRORS: Tuple[Type[BaseException], ...] = (
+    TelegramRetryAfter,
+    TimeoutError,
+)
+
+# Префиксы данных кнопок, нажатия которых относятся к оплате и заказам.
+HIGH_PRIORITY_CALLBACK_PREFIXES: Tuple[str, ...] = ("order", "payment", "checkout")
+
+
+# ----------------------------------------------------------------------------
+def classify_update_priority(
+    update: Update,
+    high_priority_prefixes: Sequence[str] = HIGH_PRIORITY_CALLBACK_PREFIXES,
+) -> Priority:
+    """classify_update_priority определяет приоритет обновления.
+
+    Высокий приоритет имеют обновления оплаты, нажатия кнопок с данными,
+    начинающимися с high_priority_prefixes, и сообщения пользователей.
+    Остальные нажатия кнопок и встроенные запросы относятся к просмотру каталога.
+
+    Args:
+        update (Update): Обновление.
+        high_priority_prefixes (Sequence[str], optional): Префиксы данных кнопок
+            высокого приоритета. По умолчанию HIGH_PRIORITY_CALLBACK_PREFIXES.
+
+    Returns:
+        Priority: Приоритет обновления.
+    """
+    if update.callback_query is not None:
+        data: str = update.callback_query.data or ""
+
+        if data.startswith(tuple(high_priority_prefixes)):
+            return Priority.HIGH
+
+        return Priority.LOW
+
+    if update.inline_query is not None or update.chosen_inline_result is not None:
+        return Priority.LOW
+
+    return Priority.HIGH
+
+
+# ----------------------------------------------------------------------------
+def create_telegram_guard(
+    failure_threshold: int = 5,
+    recovery_timeout: float = 10.0,
+    initial_limit: int = 30,
+    max_limit: int = 100,
+) -> DependencyGuard:
+    """create_telegram_guard создаёт защиту запросов к Telegram Bot API.
+
+    Args:
+        failure_threshold (int, optional): Количество неудач подряд для размыкания.
+                                           По умолчанию 5.
+        recovery_timeout (float, optional): Время до пробного запроса. По умолчанию 10.0.
+        initial_limit (int, optional): Начальный предел одновременных запросов.
+                                       По умолчанию 30.
+        max_limit (int, optional): Максимальный предел одновременных запросов.
+                                   По умолчанию 100.
+
+    Returns:
+        DependencyGuard: Защита запросов к Telegram Bot API.
+    """
+    return DependencyGuard(
+        breaker=CircuitBreaker(
+            name="telegram",
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+            failure_errors=TELEGRAM_FAILURE_ERRORS,
+        ),
+        limiter=AdaptiveConcurrencyLimiter(
+            name="telegram",
+            initial_limit=initial_limit,
+            max_limit=max_limit,
+            latency_threshold_seconds=2.0,
+            overload_errors=TELEGRAM_OVERLOAD_ERRORS,
+        ),
+    )
+
+
+# ____________________________________________________________________________
+class LoadSheddingMiddleware(BaseMiddleware):
+    """LoadSheddingMiddleware промежуточный обработчик отбрасывания обновлений.
+
+    Обработка обновления занимает место в ограничителе с приоритетом обновления,
+    поэтому количество одновременно обрабатываемых обновлений ограничено,
+    а при перегрузке первыми отбрасываются обновления низкого приоритета.
+    Приоритет обновления устанавливается в current_priority и используется
+    защитой вызовов БД и Telegram Bot API из обработчиков.
+
+    *Если обработчик не получил ответ зависимости (CircuitOpenError, LoadShedError),
+    обновление также считается отброшенным и не завершается ошибкой.
+
+    Attributes:
+        __limiter (AdaptiveConcurrencyLimiter): Ограничение обрабатываемых обновлений.
+        __classify (UpdatePriorityMethodType): Функция определения приоритета.
+        __on_shed (Optional[ShedHandlerType]): Функция, вызываемая при отбрасывании.
+    """
+
+    __limiter: AdaptiveConcurrencyLimiter
+    __classify: UpdatePriorityMethodType
+    __on_shed: Optional[ShedHandlerType]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        limiter: AdaptiveConcurrencyLimiter,
+        classify: UpdatePriorityMethodType = classify_update_priority,
+        on_shed: Optional[ShedHandlerType] = None,
+    ) -> None:
+        self.__limiter = limiter
+        self.__classify = classify
+        self.__on_shed = on_shed
+
+    # -------------------------------------------------------------------------
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        if not isinstance(event, Update):
+            return await handler(event, data)
+
+        priority: Priority = self.__classify(event)
+        token = current_priority.set(priority)
+
+        try:
+            async with self.__limiter.acquire(priority=priority):
+                return await handler(event, data)
+
+        except (CircuitOpenError, LoadShedError) as error:
+            if self.__on_shed is not None:
+                await self.__on_shed(event, data, error)
+
+            return None
+
+        finally:
+            current_priority.reset(token)
+
+
+# ____________________________________________________________________________
+class TelegramAPIResilienceMiddleware(BaseRequestMiddleware):
+    """TelegramAPIResilienceMiddleware промежуточный обработчик защиты запросов к Bot API.
+
+    *Запросы getUpdates выполняются без защиты: долгий опрос
+    длится секунды и не означает перегрузку Telegram.
+
+    Attributes:
+        __guard (DependencyGuard): Защита запросов к Telegram Bot API.
+    """
+
+    __guard: DependencyGuard
+
+    # -------------------------------------------------------------------------
+    def __init__(self, guard: DependencyGuard) -> None:
+        self.__guard = guard
+
+    # -------------------------------------------------------------------------
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        bot: Bot,
+        method: TelegramMethod,
+    ) -> Response:
+        if isinstance(method, GetUpdates):
+            return await make_request(bot, method)
+
+        return await self.__guard.call(make_request, bot, method)
+
+
+# ----------------------------------------------------------------------------
+def setup_resilience(
+    dispatcher: Dispatcher,
+    bot: Bot,
+    update_limiter: AdaptiveConcurrencyLimiter,
+    telegram_guard: Optional[DependencyGuard] = None,
+    classify: UpdatePriorityMethodType = classify_update_priority,
+    on_shed: Optional[ShedHandlerType] = None,
+) -> None:
+    """setup_resilience подключает отбрасывание обновлений и защиту запросов к Bot API.
+
+    *Функцию следует вызвать после setup_metrics и до setup_user_context,
+    чтобы отброшенные обновления учитывались в метриках, но не обращались к БД.
+
+    Args:
+        dispatcher (Dispatcher): Диспатчер, созданный функцией create_dispatcher.
+        bot (Bot): Бот, созданный функцией configure_bot.
+        update_limiter (AdaptiveConcurrencyLimiter): Ограничение обрабатываемых обновлений.
+        telegram_guard (Optional[DependencyGuard], optional): Защита запросов к Bot API.
+            По умолчанию None - создаётся функцией create_telegram_guard.
+        classify (UpdatePriorityMethodType, optional): Функция определения приоритета.
+            По умолчанию classify_update_priority.
+        on_shed (Optional[ShedHandlerType], optional): Функция, вызываемая
+            при отбрасывании обновления. По умолчанию None.
+    """
+    dispatcher.update.outer_middleware(
+        LoadSheddingMiddleware(
+            limiter=update_limiter, classify=classify, on_shed=on_shed
+        )
+    )
+    bot.session.middleware(
+        TelegramAPIResilienceMiddleware(
+            guard=create_telegram_guard() if telegram_guard is None else telegram_guard
+        )
+    )
@@ -0,0 +1,634 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль sharding_handler используется для обработки обновлений telegram бота
+в нескольких процессах: один процесс получает обновления и распределяет их
+между процессами-обработчиками по идентификатору чата,
+поэтому обновления одного чата обрабатываются по порядку.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = ["get_shard_key", "ShardSupervisor", "run_sharded_bot"]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import os
+import time
+import queue
+import asyncio
+import multiprocessing
+
+from collections import OrderedDict
+from multiprocessing.context import SpawnContext, SpawnProcess
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from aiogram import Bot, Dispatcher
+from aiogram.enums import ParseMode
+from aiogram.types import Update
+from aiogram.client.default import DefaultBotProperties
+from aiogram.exceptions import (
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from aiogram.utils.backoff import Backoff, BackoffConfig
+
+
+# Аннотация для функции, настраивающей диспатчер в процессе-обработчике.
+# *Функция должна быть объявлена на уровне модуля, чтобы её можно было передать процессу.
+# В ней же создаются ресурсы процесса (например, собственный пул соединений к БД),
+# закрытие которых регистрируется в `dispatcher.shutdown`.
+WorkerSetupMethodType = Callable[[Bot], Awaitable[Dispatcher]]
+
+# Аннотация для сериализованного обновления (Update.model_dump(mode="json")).
+UpdatePayloadType = Dict[str, Any]
+
+# Задержки повтора getUpdates после сетевой ошибки, как при polling aiogram.
+_POLLING_BACKOFF_CONFIG = BackoffConfig(
+    min_delay=1.0, max_delay=5.0, factor=1.3, jitter=0.1
+)
+
+# Задержки перезапуска обработчика, завершающегося аварийно снова и снова.
+_RESTART_BACKOFF_CONFIG = BackoffConfig(
+    min_delay=0.5, max_delay=30.0, factor=2.0, jitter=0.1
+)
+
+# Типы обновлений, содержащие чат в `message.chat` или `chat`.
+_CHAT_UPDATE_TYPES: Tuple[str, ...] = (
+    "message",
+    "edited_message",
+    "channel_post",
+    "edited_channel_post",
+    "business_message",
+    "edited_business_message",
+    "my_chat_member",
+    "chat_member",
+    "chat_join_request",
+    "message_reaction",
+    "message_reaction_count",
+    "chat_boost",
+    "removed_chat_boost",
+)
+
+# Типы обновлений, не имеющие чата; ключом является отправитель.
+_USER_UPDATE_TYPES: Tuple[str, ...] = (
+    "inline_query",
+    "chosen_inline_result",
+    "shipping_query",
+    "pre_checkout_query",
+    "poll_answer",
+)
+
+
+# ----------------------------------------------------------------------------
+def get_shard_key(update: UpdatePayloadType) -> int:
+    """get_shard_key возвращает ключ, по которому обновление закрепляется за обработчиком.
+
+    Ключом является идентификатор чата, либо идентификатор пользователя
+    для обновлений без чата, либо идентификатор обновления.
+
+    Args:
+        update (UpdatePayloadType): Сериализованное обновление.
+
+    Returns:
+        int: Ключ обновления.
+    """
+    for update_type in _CHAT_UPDATE_TYPES:
+        event: Optional[Dict[str, Any]] = update.get(update_type)
+
+        if event is not None and "chat" in event:
+            return event["chat"]["id"]
+
+    callback_query: Optional[Dict[str, Any]] = update.get("callback_query")
+
+    if callback_query is not None:
+        message: Optional[Dict[str, Any]] = callback_query.get("message")
+
+        if message is not None and "chat" in message:
+            return message["chat"]["id"]
+
+        return callback_query["from"]["id"]
+
+    for update_type in _USER_UPDATE_TYPES:
+        event = update.get(update_type)
+
+        if event is not None:
+            user: Optional[Dict[str, Any]] = event.get("from", event.get("user"))
+
+            if user is not None:
+                return user["id"]
+
+    return update["update_id"]
+
+
+# ----------------------------------------------------------------------------
+def _run_worker(
+    bot_token: str,
+    setup_worker: WorkerSetupMethodType,
+    updates_queue: "multiprocessing.Queue[Optional[UpdatePayloadType]]",
+    acks_queue: "multiprocessing.Queue[int]",
+) -> None:
+    """_run_worker точка входа процесса-обработчика."""
+    asyncio.run(
+        _serve_worker(
+            bot_token=bot_token,
+            setup_worker=setup_worker,
+            updates_queue=updates_queue,
+            acks_queue=acks_queue,
+        )
+    )
+
+
+# ----------------------------------------------------------------------------
+async def _serve_worker(
+    bot_token: str,
+    setup_worker: WorkerSetupMethodType,
+    updates_queue: "multiprocessing.Queue[Optional[UpdatePayloadType]]",
+    acks_queue: "multiprocessing.Queue[int]",
+) -> None:
+    """_serve_worker обрабатывает обновления, полученные от распределяющего процесса.
+
+    Обновления разных чатов обрабатываются одновременно,
+    обновления одного чата - в порядке получения.
+    """
+    bot = Bot(token=bot_token, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+    dispatcher: Dispatcher = await setup_worker(bot)
+    chat_tails: Dict[int, asyncio.Task] = {}
+
+    async def handle(
+        payload: UpdatePayloadType, previous: Optional[asyncio.Task]
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+
+        # Подтверждение отправляется и после ошибки обработчика, иначе обновление
+        # занимало бы место в распределяющем процессе и повторялось после перезапуска.
+        try:
+            await dispatcher.feed_raw_update(bot=bot, update=payload)
+        except Exception as error:
+            print(
+                f"Возникла ошибка при обработке обновления {payload['update_id']}! "
+                f"{error}"
+            )
+        finally:
+            acks_queue.put(payload["update_id"])
+
+    def forget(shard_key: int, task: asyncio.Task) -> None:
+        if chat_tails.get(shard_key) is task:
+            del chat_tails[shard_key]
+
+    await dispatcher.emit_startup(bot=bot)
+
+    try:
+        while True:
+            payload: Optional[UpdatePayloadType] = await asyncio.to_thread(
+                updates_queue.get
+            )
+
+            if payload is None:
+                break
+
+            shard_key: int = get_shard_key(update=payload)
+            task: asyncio.Task = asyncio.create_task(
+                handle(payload=payload, previous=chat_tails.get(shard_key))
+            )
+            chat_tails[shard_key] = task
+            task.add_done_callback(lambda done, key=shard_key: forget(key, done))
+
+        if chat_tails:
+            await asyncio.wait(list(chat_tails.values()))
+
+    finally:
+        await dispatcher.emit_shutdown(bot=bot)
+        await bot.session.close()
+
+
+# ____________________________________________________________________________
+class ShardSupervisor:
+    """ShardSupervisor класс для управления процессами-обработчиками обновлений.
+
+    Обновление закрепляется за обработчиком по остатку от деления ключа (get_shard_key)
+    на количество обработчиков и передаётся ему через очередь процесса.
+    Обновление считается обработанным, когда обработчик подтвердил его обработку.
+
+    Если процесс-обработчик завершился аварийно, он перезапускается с растущей
+    задержкой, а неподтверждённые им обновления передаются новому процессу
+    в исходном порядке. Задержка сбрасывается, когда обработчик подтвердил
+    обработку; после max_restarts перезапусков подряд без подтверждений
+    обработчик считается неработоспособным.
+    Обновление, обработанное, но не подтверждённое до завершения процесса,
+    будет обработано повторно (доставка "хотя бы один раз").
+
+    *Обновления могут поступать как из метода run_polling,
+    так и из обработчика webhook, вызывающего метод dispatch.
+
+    Attributes:
+        __context (SpawnContext): Контекст создания процессов.
+        __bot_token (str): Токен бота.
+        __setup_worker (WorkerSetupMethodType): Функция настройки диспатчера обработчика.
+        __workers_amount (int): Количество процессов-обработчиков.
+        __max_in_flight (int): Максимальное количество неподтверждённых обновлений обработчика.
+        __processes (List[Optional[SpawnProcess]]): Процессы-обработчики.
+        __updates_queues (List[multiprocessing.Queue]): Очереди обновлений обработчиков.
+        __acks_queues (List[multiprocessing.Queue]): Очереди подтверждений обработки.
+        __in_flight (List[OrderedDict[int, UpdatePayloadType]]): Неподтверждённые обновления.
+        __restarts_amount (int): Количество перезапусков обработчиков.
+        __max_restarts (int): Количество перезапусков обработчика подряд
+            без подтверждений обработки.
+        __restart_backoffs (List[Backoff]): Задержки перезапуска обработчиков.
+        __restart_at (List[Optional[float]]): Время (time.monotonic),
+            после которого завершившийся обработчик будет перезапущен.
+    """
+
+    __context: SpawnContext
+    __bot_token: str
+    __setup_worker: WorkerSetupMethodType
+    __workers_amount: int
+    __max_in_flight: int
+    __processes: List[Optional[SpawnProcess]]
+    __updates_queues: List["multiprocessing.Queue[Optional[UpdatePayloadType]]"]
+    __acks_queues: List["multiprocessing.Queue[int]"]
+    __in_flight: List["OrderedDict[int, UpdatePayloadType]"]
+    __restarts_amount: int
+    __max_restarts: int
+    __restart_backoffs: List[Backoff]
+    __restart_at: List[Optional[float]]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        bot_token: str,
+        setup_worker: WorkerSetupMethodType,
+        workers_amount: Optional[int] = None,
+        max_in_flight: int = 1000,
+        max_restarts: int = 5,
+        restart_backoff: BackoffConfig = _RESTART_BACKOFF_CONFIG,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            bot_token (str): Токен бота.
+            setup_worker (WorkerSetupMethodType): Функция настройки диспатчера обработчика.
+            workers_amount (Optional[int], optional): Количество процессов-обработчиков.
+                                                      По умолчанию количество ядер.
+            max_in_flight (int, optional): Максимальное количество неподтверждённых
+                                           обновлений одного обработчика. По умолчанию 1000.
+            max_restarts (int, optional): Количество перезапусков обработчика подряд
+                                          без подтверждений обработки. По умолчанию 5.
+            restart_backoff (BackoffConfig, optional): Задержки перезапуска.
+                                                       По умолчанию от 0.5 до 30 секунд.
+
+        Raises:
+            ValueError: Возбуждается если количество обработчиков или лимит меньше 1.
+        """
+        workers_amount = workers_amount or os.cpu_count() or 1
+
+        if workers_amount < 1 or max_in_flight < 1:
+            raise ValueError(
+                "Количество обработчиков и лимит обновлений должны быть больше 0!"
+            )
+
+        self.__context = multiprocessing.get_context("spawn")
+        self.__bot_token = bot_token
+        self.__setup_worker = setup_worker
+        self.__workers_amount = workers_amount
+        self.__max_in_flight = max_in_flight
+        self.__processes = [None] * workers_amount
+        self.__updates_queues = [self.__context.Queue() for _ in range(workers_amount)]
+        self.__acks_queues = [self.__context.Queue() for _ in range(workers_amount)]
+        self.__in_flight = [OrderedDict() for _ in range(workers_amount)]
+        self.__restarts_amount = 0
+        self.__max_restarts = max_restarts
+        self.__restart_backoffs = [
+            Backoff(config=restart_backoff) for _ in range(workers_amount)
+        ]
+        self.__restart_at = [None] * workers_amount
+
+    # -------------------------------------------------------------------------
+    @property
+    def workers_amount(self) -> int:
+        return self.__workers_amount
+
+    # -------------------------------------------------------------------------
+    @property
+    def restarts_amount(self) -> int:
+        return self.__restarts_amount
+
+    # -------------------------------------------------------------------------
+    @property
+    def in_flight_amount(self) -> int:
+        return sum(len(in_flight) for in_flight in self.__in_flight)
+
+    # -------------------------------------------------------------------------
+    def start(self) -> None:
+        """start запускает процессы-обработчики."""
+        for worker_index in range(self.__workers_amount):
+            self.__start_worker(worker_index=worker_index)
+
+    # -------------------------------------------------------------------------
+    def get_worker_index(self, update: UpdatePayloadType) -> int:
+        """get_worker_index возвращает индекс обработчика, за которым закреплено обновление.
+
+        Args:
+            update (UpdatePayloadType): Сериализованное обновление.
+
+        Returns:
+            int: Индекс обработчика.
+        """
+        return get_shard_key(update=update) % self.__workers_amount
+
+    # -------------------------------------------------------------------------
+    def can_dispatch(self, update: UpdatePayloadType) -> bool:
+        """can_dispatch проверяет, не превышен ли лимит обновлений обработчика.
+
+        Args:
+            update (UpdatePayloadType): Сериализованное обновление.
+
+        Returns:
+            bool: True, если обновление можно передать обработчику.
+        """
+        worker_index: int = self.get_worker_index(update=update)
+
+        return len(self.__in_flight[worker_index]) < self.__max_in_flight
+
+    # -------------------------------------------------------------------------
+    def dispatch(self, update: UpdatePayloadType) -> int:
+        """dispatch передаёт обновление закреплённому обработчику.
+
+        Args:
+            update (UpdatePayloadType): Сериализованное обновление.
+
+        Returns:
+            int: Индекс обработчика.
+        """
+        worker_index: int = self.get_worker_index(update=update)
+
+        self.__in_flight[worker_index][update["update_id"]] = update
+        self.__updates_queues[worker_index].put(update)
+
+        return worker_index
+
+    # -------------------------------------------------------------------------
+    def collect_acks(self) -> int:
+        """collect_acks учитывает подтверждения обработки, полученные от обработчиков.
+
+        Returns:
+            int: Количество полученных подтверждений.
+        """
+        collected: int = 0
+
+        for worker_index in range(self.__workers_amount):
+            collected += self.__collect_worker_acks(worker_index=worker_index)
+
+        return collected
+
+    # -------------------------------------------------------------------------
+    def restart_crashed_workers(self) -> List[int]:
+        """restart_crashed_workers перезапускает аварийно завершившиеся обработчики.
+
+        *Неподтверждённые обновления передаются новому процессу в исходном порядке.
+        Обработчик перезапускается после задержки, поэтому метод следует
+        вызывать периодически.
+
+        Raises:
+            RuntimeError: Возбуждается если обработчик завершился аварийно
+                          max_restarts раз подряд без подтверждений обработки.
+
+        Returns:
+            List[int]: Индексы перезапущенных обработчиков.
+        """
+        restarted: List[int] = []
+
+        for worker_index, process in enumerate(self.__processes):
+            if process is None or process.is_alive():
+                continue
+
+            # Подтверждения, отправленные до завершения процесса, учитываются
+            # до повторной передачи обновлений.
+            self.__collect_worker_acks(worker_index=worker_index)
+
+            if self.__restart_at[worker_index] is None:
+                backoff: Backoff = self.__restart_backoffs[worker_index]
+
+                if backoff.counter >= self.__max_restarts:
+                    raise RuntimeError(
+                        f"Обработчик {worker_index} завершился аварийно "
+                        f"{backoff.counter + 1} раз подряд!"
+                    )
+
+                delay: float = max(0.0, next(backoff))
+                self.__restart_at[worker_index] = time.monotonic() + delay
+
+                print(
+                    f"Обработчик {worker_index} завершился с кодом {process.exitcode}, "
+                    f"перезапуск через {delay:.1f} с, повторно передаётся обновлений: "
+                    f"{len(self.__in_flight[worker_index])}"
+                )
+
+            if time.monotonic() < self.__restart_at[worker_index]:  # type: ignore
+                continue
+
+            self.__restart_at[worker_index] = None
+
+            # Очереди завершившегося процесса могли остаться в неконсистентном
+            # состоянии, поэтому новому процессу создаются новые очереди.
+            self.__updates_queues[worker_index] = self.__context.Queue()
+            self.__acks_queues[worker_index] = self.__context.Queue()
+            self.__start_worker(worker_index=worker_index)
+
+            for update in self.__in_flight[worker_index].values():
+                self.__updates_queues[worker_index].put(update)
+
+            self.__restarts_amount += 1
+            restarted.append(worker_index)
+
+        return restarted
+
+    # -------------------------------------------------------------------------
+    async def run_polling(
+        self,
+        bot: Bot,
+        stop_event: asyncio.Event,
+        polling_timeout: int = 10,
+        check_interval: float = 0.1,
+        backoff_config: BackoffConfig = _POLLING_BACKOFF_CONFIG,
+    ) -> None:
+        """run_polling получает обновления и распределяет их между обработчиками.
+
+        *Получение обновлений подтверждается telegram следующим запросом (offset),
+        неподтверждённые обработчиками обновления хранятся в памяти до подтверждения.
+        После сетевой ошибки, либо ошибки сервера telegram запрос повторяется
+        с растущей задержкой, как при polling aiogram; при ограничении частоты -
+        через указанное telegram время.
+
+        Args:
+            bot (Bot): Экземпляр бота, получающего обновления.
+            stop_event (asyncio.Event): Событие остановки получения обновлений.
+            polling_timeout (int, optional): Таймаут запроса getUpdates. По умолчанию 10.
+            check_interval (float, optional): Интервал ожидания обработчика,
+                                              достигшего лимита. По умолчанию 0.1.
+            backoff_config (BackoffConfig, optional): Задержки повтора запроса.
+                                                      По умолчанию от 1 до 5 секунд.
+        """
+        offset: Optional[int] = None
+        backoff = Backoff(config=backoff_config)
+
+        while not stop_event.is_set():
+            try:
+                updates: List[Update] = await bot.get_updates(
+                    offset=offset, timeout=polling_timeout
+                )
+
+            except (
+                TelegramNetworkError,
+                TelegramRetryAfter,
+                TelegramServerError,
+            ) as error:
+                delay: float = (
+                    error.retry_after
+                    if isinstance(error, TelegramRetryAfter)
+                    else next(backoff)
+                )
+                print(
+                    f"Возникла ошибка при получении обновлений! {error} "
+                    f"Повтор через {delay:.1f} с."
+                )
+
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+                self.collect_acks()
+                self.restart_crashed_workers()
+                continue
+
+            backoff.reset()
+
+            for update in updates:
+                payload: UpdatePayloadType = update.model_dump(
+                    mode="json", exclude_unset=True
+                )
+
+                while not self.can_dispatch(update=payload):
+                    await asyncio.sleep(check_interval)
+                    self.collect_acks()
+                    self.restart_crashed_workers()
+
+                self.dispatch(update=payload)
+                offset = update.update_id + 1
+
+            self.collect_acks()
+            self.restart_crashed_workers()
+
+    # -------------------------------------------------------------------------
+    async def wait_until_processed(self, check_interval: float = 0.05) -> None:
+        """wait_until_processed ожидает подтверждения всех переданных обновлений.
+
+        Args:
+            check_interval (float, optional): Интервал проверки. По умолчанию 0.05.
+        """
+        while True:
+            self.collect_acks()
+            self.restart_crashed_workers()
+
+            if self.in_flight_amount == 0:
+                return
+
+            await asyncio.sleep(check_interval)
+
+    # -------------------------------------------------------------------------
+    def stop(self, timeout: float = 10.0) -> None:
+        """stop останавливает обработчики после обработки переданных им обновлений.
+
+        Args:
+            timeout (float, optional): Время ожидания завершения процесса,
+                                       после которого он завершается принудительно.
+        """
+        for worker_index, process in enumerate(self.__processes):
+            if process is not None and process.is_alive():
+                self.__updates_queues[worker_index].put(None)
+
+        for worker_index, process in enumerate(self.__processes):
+            if process is None:
+                continue
+
+            process.join(timeout=timeout)
+
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+            self.__processes[worker_index] = None
+
+        self.collect_acks()
+
+    # -------------------------------------------------------------------------
+    def __start_worker(self, worker_index: int) -> None:
+        process: SpawnProcess = self.__context.Process(
+            target=_run_worker,
+            kwargs={
+                "bot_token": self.__bot_token,
+                "setup_worker": self.__setup_worker,
+                "updates_queue": self.__updates_queues[worker_index],
+                "acks_queue": self.__acks_queues[worker_index],
+            },
+            name=f"shard-worker-{worker_index}",
+            daemon=True,
+        )
+        process.start()
+
+        self.__processes[worker_index] = process
+
+    # -------------------------------------------------------------------------
+    def __collect_worker_acks(self, worker_index: int) -> int:
+        collected: int = 0
+
+        while True:
+            try:
+                update_id: int = self.__acks_queues[worker_index].get_nowait()
+            except queue.Empty:
+                return collected
+
+            self.__in_flight[worker_index].pop(update_id, None)
+            collected += 1
+
+            # Обработчик обрабатывает обновления, поэтому следующий аварийный
+            # перезапуск выполняется без задержки предыдущих.
+            self.__restart_backoffs[worker_index].reset()
+
+
+# ----------------------------------------------------------------------------
+async def run_sharded_bot(
+    bot_token: str,
+    setup_worker: WorkerSetupMethodType,
+    workers_amount: Optional[int] = None,
+    stop_event: Optional[asyncio.Event] = None,
+) -> None:
+    """run_sharded_bot запускает telegram бота с обработкой обновлений в нескольких процессах.
+
+    *Функция является заменой run_bot, когда одного процесса недостаточно.
+
+    Args:
+        bot_token (str): Токен бота.
+        setup_worker (WorkerSetupMethodType): Функция настройки диспатчера обработчика.
+        workers_amount (Optional[int], optional): Количество процессов-обработчиков.
+                                                  По умолчанию количество ядер.
+        stop_event (Optional[asyncio.Event], optional): Событие остановки бота.
+    """
+    supervisor = ShardSupervisor(
+        bot_token=bot_token, setup_worker=setup_worker, workers_amount=workers_amount
+    )
+    bot = Bot(token=bot_token, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+
+    supervisor.start()
+
+    try:
+        await supervisor.run_polling(bot=bot, stop_event=stop_event or asyncio.Event())
+        await supervisor.wait_until_processed()
+    finally:
+        supervisor.stop()
+        await bot.session.close()
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль user_context_middleware используется для получения данных пользователя
+(`User`: блокировка, роли и язык интерфейса) на каждое обновление без обращения к БД,
+используя кэш компактных записей и множество идентификаторов заблокированных пользователей.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    "UserRecord",
+    "UserContextCache",
+    "UserContextMiddleware",
+    "setup_user_context",
+]
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+import asyncio
+
+from aiogram import BaseMiddleware, Dispatcher
+from aiogram.types import TelegramObject, User
+
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from prototypes.cache_scripts.lru_ttl_cache import LRUTTLCache
+
+
+# Аннотация для функции, загружающей строку пользователя из БД:
+# (id, is_banned, is_admin, is_seller, interface_language_code), либо None.
+UserLoadMethodType = Callable[[int], Awaitable[Optional[Sequence[Any]]]]
+
+# Аннотация для функции, загружающей идентификаторы заблокированных пользователей.
+BannedUserIdsLoadMethodType = Callable[[], Awaitable[Iterable[int]]]
+
+
+# ____________________________________________________________________________
+class UserRecord:
+    """UserRecord класс компактной записи о пользователе.
+
+    Attributes:
+        user_id (int): Идентификатор пользователя.
+        is_banned (bool): Заблокирован ли пользователь.
+        is_admin (bool): Является ли пользователь администратором.
+        is_seller (bool): Является ли пользователь продавцом.
+        language_code (str): Код языка интерфейса пользователя.
+    """
+
+    __slots__ = ("user_id", "is_banned", "is_admin", "is_seller", "language_code")
+
+    user_id: int
+    is_banned: bool
+    is_admin: bool
+    is_seller: bool
+    language_code: str
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        user_id: int,
+        is_banned: bool,
+        is_admin: bool,
+        is_seller: bool,
+        language_code: str,
+    ) -> None:
+        self.user_id = user_id
+        self.is_banned = is_banned
+        self.is_admin = is_admin
+        self.is_seller = is_seller
+        self.language_code = language_code
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "UserRecord":
+        """from_row создаёт запись из строки таблицы `User`.
+
+        Args:
+            row (Sequence[Any]): (id, is_banned, is_admin, is_seller, interface_language_code).
+
+        Returns:
+            UserRecord: Запись о пользователе.
+        """
+        return cls(
+            user_id=row[0],
+            is_banned=bool(row[1]),
+            is_admin=bool(row[2]),
+            is_seller=bool(row[3]),
+            language_code=row[4],
+        )
+
+
+# ____________________________________________________________________________
+class UserContextCache:
+    """UserContextCache класс кэша данных пользователей.
+
+    Записи о пользователях хранятся в кэше LRU/TTL. Отсутствующие в БД пользователи
+    кэшируются как отрицательные записи с более коротким сроком жизни.
+    Одновременные запросы одного пользователя выполняют одну загрузку из БД.
+
+    Идентификаторы заблокированных пользователей хранятся в отдельном множестве,
+    поэтому их обновления отклоняются без поиска записи. Множество перезагружается
+    из БД по истечении срока жизни, чтобы учитывать блокировки и разблокировки,
+    выполненные другими процессами.
+
+    *При изменении флагов пользователя действиями администратора,
+    следует вызвать метод apply_changes.
+
+    Attributes:
+        __load_user (UserLoadMethodType): Функция загрузки пользователя из БД.
+        __records (LRUTTLCache[int, UserRecord]): Кэш записей о пользователях.
+        __banned_user_ids (Set[int]): Идентификаторы заблокированных пользователей.
+        __load_banned_user_ids (Optional[BannedUserIdsLoadMethodType]): Функция загрузки
+            идентификаторов заблокированных пользователей из БД.
+        __banned_ttl_seconds (float): Срок жизни множества заблокированных.
+        __banned_expire_at (float): Время, после которого множество перезагружается.
+        __banned_reloading (asyncio.Lock): Блокировка перезагрузки множества.
+        __clock (Callable[[], float]): Функция получения текущего времени.
+        __loading (Dict[int, asyncio.Future]): Выполняющиеся загрузки пользователей.
+        __stale_loading (Set[int]): Загрузки, данные которых изменились до их завершения.
+    """
+
+    __load_user: UserLoadMethodType
+    __records: LRUTTLCache[int, UserRecord]
+    __banned_user_ids: Set[int]
+    __load_banned_user_ids: Optional[BannedUserIdsLoadMethodType]
+    __banned_ttl_seconds: float
+    __banned_expire_at: float
+    __banned_reloading: asyncio.Lock
+    __clock: Callable[[], float]
+    __loading: Dict[int, asyncio.Future]
+    __stale_loading: Set[int]
+
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        load_user: UserLoadMethodType,
+        max_size: int = 100_000,
+        ttl_seconds: float = 300.0,
+        negative_ttl_seconds: float = 30.0,
+        banned_ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """__init__ конструктор.
+
+        Args:
+            load_user (UserLoadMethodType): Функция загрузки пользователя из БД.
+            max_size (int, optional): Максимальное количество записей. По умолчанию 100000.
+            ttl_seconds (float, optional): Срок жизни записи. По умолчанию 300.0.
+            negative_ttl_seconds (float, optional): Срок жизни записи о неизвестном
+                                                    пользователе. По умолчанию 30.0.
+            banned_ttl_seconds (float, optional): Срок жизни множества заблокированных
+                                                  пользователей. По умолчанию 60.0.
+            clock (Callable[[], float], optional): Функция получения текущего времени.
+                                                   По умолчанию time.monotonic.
+        """
+        self.__load_user = load_user
+        self.__records = LRUTTLCache(
+            max_size=max_size,
+            ttl_seconds=ttl_seconds,
+            negative_ttl_seconds=negative_ttl_seconds,
+            clock=clock,
+        )
+        self.__banned_user_ids = set()
+        self.__load_banned_user_ids = None
+        self.__banned_ttl_seconds = banned_ttl_seconds
+        self.__banned_expire_at = 0.0
+        self.__banned_reloading = asyncio.Lock()
+        self.__clock = clock
+        self.__loading = {}
+        self.__stale_loading = set()
+
+    # -------------------------------------------------------------------------
+    async def load_banned_user_ids(
+        self, load_banned_user_ids: BannedUserIdsLoadMethodType
+    ) -> None:
+        """load_banned_user_ids загружает идентификаторы заблокированных пользователей.
+
+        *Функция загрузки сохраняется для перезагрузки методом refresh_banned_user_ids.
+
+        Args:
+            load_banned_user_ids (BannedUserIdsLoadMethodType): Функция загрузки из БД.
+        """
+        self.__load_banned_user_ids = load_banned_user_ids
+
+        async with self.__banned_reloading:
+            await self.__reload_banned_user_ids(load_banned_user_ids)
+
+    # -------------------------------------------------------------------------
+    async def refresh_banned_user_ids(self) -> None:
+        """refresh_banned_user_ids перезагружает идентификаторы заблокированных
+        пользователей, если истёк срок жизни множества.
+
+        *При ошибке загрузки сохраняется прежнее множество,
+        а следующая попытка выполняется по истечении срока жизни.
+        """
+        load_banned_user_ids: Optional[BannedUserIdsLoadMethodType] = (
+            self.__load_banned_user_ids
+        )
+
+        if load_banned_user_ids is None or self.__clock() < self.__banned_expire_at:
+            return
+
+        async with self.__banned_reloading:
+            # Множество могло быть перезагружено, пока ожидалась блокировка.
+            if self.__clock() < self.__banned_expire_at:
+                return
+
+            try:
+                await self.__reload_banned_user_ids(load_banned_user_ids)
+
+            except Exception as error:
+                self.__banned_expire_at = self.__clock() + self.__banned_ttl_seconds
+                print(
+                    "Возникла ошибка при загрузке заблокированных пользователей! "
+                    f"{error}"
+                )
+
+    # -------------------------------------------------------------------------
+    async def __reload_banned_user_ids(
+        self, load_banned_user_ids: BannedUserIdsLoadMethodType
+    ) -> None:
+        banned_user_ids: Set[int] = set(await load_banned_user_ids())
+
+        # Записи разблокированных пользователей также хранят устаревший флаг.
+        for user_id in self.__banned_user_ids - banned_user_ids:
+            self.invalidate(user_id=user_id)
+
+        self.__banned_user_ids = banned_user_ids
+        self.__banned_expire_at = self.__clock() + self.__banned_ttl_seconds
+
+    # -------------------------------------------------------------------------
+    def is_banned(self, user_id: int) -> bool:
+        """is_banned проверяет, заблокирован ли пользователь.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            bool: True, если пользователь заблокирован.
+        """
+        return user_id in self.__banned_user_ids
+
+    # -------------------------------------------------------------------------
+    async def get_record(self, user_id: int) -> Optional[UserRecord]:
+        """get_record возвращает запись о пользователе.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            Optional[UserRecord]: Запись о пользователе, либо None если он не найден в БД.
+        """
+        is_found, record = self.__records.lookup(key=user_id)
+
+        if is_found:
+            return record
+
+        loading: Optional[asyncio.Future] = self.__loading.get(user_id)
+
+        if loading is not None:
+            return await asyncio.shield(loading)
+
+        loading = asyncio.get_running_loop().create_future()
+        self.__loading[user_id] = loading
+
+        try:
+            row: Optional[Sequence[Any]] = await self.__load_user(user_id)
+            record = None if row is None else UserRecord.from_row(row=row)
+
+            if user_id not in self.__stale_loading:
+                self.__records.set(key=user_id, value=record)
+
+                if record is not None and record.is_banned:
+                    self.__banned_user_ids.add(user_id)
+
+            loading.set_result(record)
+
+        except BaseException as error:
+            loading.set_exception(error)
+
+            # Исключение уже передано ожидающим; без них оно не должно
+            # попадать в журнал как необработанное.
+            loading.exception()
+            raise
+
+        finally:
+            del self.__loading[user_id]
+            self.__stale_loading.discard(user_id)
+
+        return record
+
+    # -------------------------------------------------------------------------
+    async def resolve_language(self, user_id: int) -> Optional[str]:
+        """resolve_language возвращает язык интерфейса пользователя.
+
+        *Метод совместим с LanguageMiddleware из пакета localization_scripts.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            Optional[str]: Код языка, либо None если пользователь не найден.
+        """
+        record: Optional[UserRecord] = await self.get_record(user_id=user_id)
+
+        return None if record is None else record.language_code
+
+    # -------------------------------------------------------------------------
+    def apply_changes(self, user_id: int, changes: Mapping[str, Any]) -> None:
+        """apply_changes учитывает изменение данных пользователя.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            changes (Mapping[str, Any]): Изменённые столбцы таблицы `User` и их значения.
+        """
+        if "is_banned" in changes:
+            if changes["is_banned"]:
+                self.__banned_user_ids.add(user_id)
+            else:
+                self.__banned_user_ids.discard(user_id)
+
+        self.invalidate(user_id=user_id)
+
+    # -------------------------------------------------------------------------
+    def invalidate(self, user_id: int) -> None:
+        """invalidate удаляет запись о пользователе из кэша.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+        """
+        self.__records.invalidate(key=user_id)
+
+        if user_id in self.__loading:
+            self.__stale_loading.add(user_id)
+
+
+# ____________________________________________________________________________
+class UserContextMiddleware(BaseMiddleware):
+    """UserContextMiddleware промежуточный обработчик данных пользователя.
+
+    Обновления заблокированных пользователей отклоняются без обращения к кэшу и БД.
+    Остальным обработчикам запись о пользователе передаётся в аргументе `user_record`.
+
+    Attributes:
+        __cache (UserContextCache): Кэш данных пользователей.
+    """
+
+    __cache: UserContextCache
+
+    # -------------------------------------------------------------------------
+    def __init__(self, cache: UserContextCache) -> None:
+        self.__cache = cache
+
+    # -------------------------------------------------------------------------
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        user: Optional[User] = data.get("event_from_user")
+
+        if user is None:
+            return await handler(event, data)
+
+        await self.__cache.refresh_banned_user_ids()
+
+        if self.__cache.is_banned(user_id=user.id):
+            return None
+
+        record: Optional[UserRecord] = await self.__cache.get_record(user_id=user.id)
+
+        if record is not None and record.is_banned:
+            return None
+
+        data["user_record"] = record
+
+        return await handler(event, data)
+
+
+# ----------------------------------------------------------------------------
+def setup_user_context(dispatcher: Dispatcher, cache: UserContextCache) -> None:
+    """setup_user_context подключает данные пользователя к диспатчеру.
+
+    *Функцию следует вызвать до setup_localization,
+    чтобы язык пользователя определялся по уже загруженной записи.
+
+    Args:
+        dispatcher (Dispatcher): Диспатчер, созданный функцией create_dispatcher.
+        cache (UserContextCache): Кэш данных пользователей.
+    """
+    dispatcher.update.outer_middleware(UserContextMiddleware(cache=cache))
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_lru_ttl_cache представляет из себя набор модульных тестов,
+для тестирования компонентов модуля lru_ttl_cache.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from prototypes.cache_scripts.lru_ttl_cache import *
+
+
+# ____________________________________________________________________________
+class FakeClock:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    # -------------------------------------------------------------------------
+    def __call__(self) -> float:
+        return self.now
+
+
+# ____________________________________________________________________________
+class TestLRUTTLCachePositive(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.cache: LRUTTLCache[str, int] = LRUTTLCache(
+            max_size=2, ttl_seconds=10.0, negative_ttl_seconds=1.0, clock=self.clock
+        )
+
+    # ------------------------------------------------------------------------
+    def test_get_stored_value(self) -> None:
+        self.cache.set(key="banana", value=1)
+
+        self.assertEqual(first=1, second=self.cache.get(key="banana"))
+
+    # ------------------------------------------------------------------------
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        self.cache.set(key="banana", value=1)
+        self.cache.set(key="cherry", value=2)
+        self.cache.get(key="banana")
+        self.cache.set(key="orange", value=3)
+
+        self.assertIn(member="banana", container=self.cache)
+        self.assertNotIn(member="cherry", container=self.cache)
+
+    # ------------------------------------------------------------------------
+    def test_entry_expires_after_ttl(self) -> None:
+        self.cache.set(key="banana", value=1)
+        self.clock.now = 10.0
+
+        self.assertEqual(first=(False, None), second=self.cache.lookup(key="banana"))
+
+    # ------------------------------------------------------------------------
+    def test_negative_entry_is_found(self) -> None:
+        self.cache.set(key="banana", value=None)
+
+        self.assertEqual(first=(True, None), second=self.cache.lookup(key="banana"))
+
+    # ------------------------------------------------------------------------
+    def test_negative_entry_use_negative_ttl(self) -> None:
+        self.cache.set(key="banana", value=None)
+        self.clock.now = 1.0
+
+        self.assertNotIn(member="banana", container=self.cache)
+
+    # ------------------------------------------------------------------------
+    def test_invalidate_entry(self) -> None:
+        self.cache.set(key="banana", value=1)
+
+        self.assertTrue(self.cache.invalidate(key="banana"))
+        self.assertEqual(first=0, second=len(self.cache))
+
+
+# ____________________________________________________________________________
+class TestLRUTTLCacheNegative(unittest.TestCase):
+    def test_zero_size_raise_ValueError(self) -> None:
+        self.assertRaises(ValueError, LRUTTLCache, 0, 10.0)
+
+    # ------------------------------------------------------------------------
+    def test_missing_key_return_default(self) -> None:
+        cache: LRUTTLCache[str, int] = LRUTTLCache(max_size=1, ttl_seconds=1.0)
+
+        self.assertEqual(first=-1, second=cache.get(key="banana", default=-1))
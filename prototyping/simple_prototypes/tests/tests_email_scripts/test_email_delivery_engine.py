@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_email_delivery_engine представляет из себя набор модульных тестов,
+для тестирования компонентов модулей smtp_connection_pool и email_delivery_engine.
+
+*Тесты запускают локальный SMTP сервер aiosmtpd.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import socket
+import unittest
+
+from aiosmtpd.controller import Controller
+from aiosmtplib import SMTPRecipientsRefused
+
+from typing import Any, List, Optional, Set
+
+from prototypes.email_scripts.email_renderer import EmailRenderer, EmailTemplate
+from prototypes.email_scripts.email_delivery_engine import *
+from prototypes.email_scripts.smtp_connection_pool import *
+
+
+# ____________________________________________________________________________
+class RecordingHandler:
+    """RecordingHandler обработчик aiosmtpd, запоминающий принятые письма."""
+
+    def __init__(self) -> None:
+        self.recipients: List[str] = []
+        self.peers: Set[Any] = set()
+
+    # -------------------------------------------------------------------------
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options) -> str:
+        if address.startswith("reject"):
+            return "550 Получатель не найден"
+
+        envelope.rcpt_tos.append(address)
+
+        return "250 OK"
+
+    # -------------------------------------------------------------------------
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.recipients.extend(envelope.rcpt_tos)
+        self.peers.add(session.peer)
+
+        return "250 Message accepted for delivery"
+
+
+# ----------------------------------------------------------------------------
+def get_free_port() -> int:
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+
+        return listener.getsockname()[1]
+
+
+# ____________________________________________________________________________
+class SMTPServerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.handler = RecordingHandler()
+        self.controller = Controller(
+            self.handler, hostname="127.0.0.1", port=get_free_port()
+        )
+        self.controller.start()
+
+        self.renderer = EmailRenderer(
+            sender="shop@nekoshop.ru",
+            templates={
+                "order": EmailTemplate(subject="Заказ №$order_id", text="Заказ выполнен.")
+            },
+        )
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        self.controller.stop()
+
+    # -------------------------------------------------------------------------
+    def make_pool(self, **kwargs: Any) -> SMTPConnectionPool:
+        return SMTPConnectionPool(
+            hostname=self.controller.hostname,
+            port=self.controller.port,
+            start_tls=False,
+            **kwargs,
+        )
+
+
+# ____________________________________________________________________________
+class TestEmailDeliveryEnginePositive(SMTPServerTestCase):
+    async def test_send_many_reuses_connections(self) -> None:
+        recipients: List[str] = [f"buyer{index}@example.com" for index in range(30)] + [
+            f"seller{index}@example.org" for index in range(10)
+        ]
+        engine = EmailDeliveryEngine(
+            pool=self.make_pool(size=4), per_domain_limit=1, batch_size=8
+        )
+
+        errors: List[Optional[BaseException]] = await engine.send_many(
+            self.renderer.render_many(
+                template_name="order", recipients=recipients, values={"order_id": 1}
+            )
+        )
+        await engine.close()
+
+        self.assertEqual(first=[None] * len(recipients), second=errors)
+        self.assertEqual(first=sorted(recipients), second=sorted(self.handler.recipients))
+        # Одна задача на домен, соединение которой переиспользуется между пакетами.
+        self.assertLessEqual(a=len(self.handler.peers), b=2)
+        self.assertEqual(first=0, second=engine.pending_amount)
+
+    # -------------------------------------------------------------------------
+    async def test_rejected_recipient_does_not_break_batch(self) -> None:
+        engine = EmailDeliveryEngine(pool=self.make_pool(size=1))
+
+        errors: List[Optional[BaseException]] = await engine.send_many(
+            self.renderer.render_many(
+                template_name="order",
+                recipients=["first@example.com", "reject@example.com", "last@example.com"],
+                values={"order_id": 1},
+            )
+        )
+        await engine.close()
+
+        self.assertIsNone(errors[0])
+        self.assertIsInstance(obj=errors[1], cls=SMTPRecipientsRefused)
+        self.assertIsNone(errors[2])
+        self.assertEqual(
+            first=["first@example.com", "last@example.com"],
+            second=self.handler.recipients,
+        )
+        self.assertEqual(first=1, second=len(self.handler.peers))
+
+    # -------------------------------------------------------------------------
+    async def test_pool_reconnects_after_idle_timeout(self) -> None:
+        pool: SMTPConnectionPool = self.make_pool(size=1, idle_timeout=0.0)
+        engine = EmailDeliveryEngine(pool=pool)
+
+        for order_id in range(2):
+            await engine.send(
+                self.renderer.render(
+                    template_name="order",
+                    recipient="buyer@example.com",
+                    values={"order_id": order_id},
+                )
+            )
+
+        await engine.close()
+
+        self.assertEqual(first=2, second=len(self.handler.peers))
+        self.assertEqual(first=0, second=pool.idle_amount)
+
+
+# ____________________________________________________________________________
+class TestEmailDeliveryEngineNegative(SMTPServerTestCase):
+    async def test_unavailable_server(self) -> None:
+        engine = EmailDeliveryEngine(
+            pool=SMTPConnectionPool(
+                hostname="127.0.0.1", port=get_free_port(), start_tls=False, timeout=1.0
+            ),
+            max_attempts=2,
+            retry_delay=0.0,
+        )
+
+        with self.assertRaises(ConnectionError):
+            await engine.send(
+                self.renderer.render(
+                    template_name="order",
+                    recipient="buyer@example.com",
+                    values={"order_id": 1},
+                )
+            )
+
+        await engine.close()
+
+    # -------------------------------------------------------------------------
+    async def test_closed_pool(self) -> None:
+        pool: SMTPConnectionPool = self.make_pool()
+        await pool.close()
+
+        with self.assertRaises(RuntimeError):
+            async with pool.acquire():
+                pass
+
+    # -------------------------------------------------------------------------
+    async def test_invalid_limits(self) -> None:
+        with self.assertRaises(ValueError):
+            EmailDeliveryEngine(pool=self.make_pool(), per_domain_limit=0)
+
+        with self.assertRaises(ValueError):
+            self.make_pool(size=0)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_email_renderer представляет из себя набор модульных тестов,
+для тестирования компонентов модуля email_renderer.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import email
+import unittest
+
+from email.message import EmailMessage
+from email.policy import default
+
+from typing import List
+
+from prototypes.email_scripts.email_renderer import *
+
+
+TEMPLATES = {
+    "order_completed": EmailTemplate(
+        subject="Заказ №$order_id выполнен",
+        text="Здравствуйте, $name! Заказ №$order_id на сумму $price выполнен.",
+        html="<p>Здравствуйте, <b>$name</b>!</p>",
+    ),
+    "moderation": EmailTemplate(subject="Модерация", text="Заявка рассмотрена."),
+}
+
+
+# ____________________________________________________________________________
+class TestEmailRendererPositive(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        unittest.TestCase.setUpClass()
+
+        cls.renderer = EmailRenderer(sender="shop@nekoshop.ru", templates=TEMPLATES)
+        cls.values = {"order_id": 42, "name": "<Neko>", "price": "399.00"}
+
+    # -------------------------------------------------------------------------
+    def parse(self, outgoing_email: OutgoingEmail) -> EmailMessage:
+        return email.message_from_bytes(outgoing_email.content, policy=default)  # type: ignore
+
+    # -------------------------------------------------------------------------
+    def test_render(self) -> None:
+        outgoing_email: OutgoingEmail = self.renderer.render(
+            template_name="order_completed",
+            recipient="Buyer@Example.com",
+            values=self.values,
+        )
+        message: EmailMessage = self.parse(outgoing_email=outgoing_email)
+
+        self.assertEqual(first="shop@nekoshop.ru", second=outgoing_email.sender)
+        self.assertEqual(first="Buyer@example.com", second=outgoing_email.recipient)
+        self.assertEqual(first="example.com", second=outgoing_email.domain)
+        self.assertEqual(first="Buyer@example.com", second=message["To"])
+        self.assertEqual(first="Заказ №42 выполнен", second=message["Subject"])
+        self.assertTrue(message["Message-ID"].endswith("@nekoshop.ru>"))
+
+        text: str = message.get_body(preferencelist=("plain",)).get_content()  # type: ignore
+        html: str = message.get_body(preferencelist=("html",)).get_content()  # type: ignore
+
+        self.assertIn(member="сумму 399.00", container=text)
+        self.assertIn(member="<Neko>!", container=text)
+        self.assertIn(member="<b>&lt;Neko&gt;</b>", container=html)
+
+    # -------------------------------------------------------------------------
+    def test_render_many_shares_content(self) -> None:
+        outgoing_emails: List[OutgoingEmail] = self.renderer.render_many(
+            template_name="moderation",
+            recipients=["first@example.com", "second@example.org"],
+            values={},
+        )
+        messages: List[EmailMessage] = [
+            self.parse(outgoing_email=outgoing_email) for outgoing_email in outgoing_emails
+        ]
+
+        self.assertEqual(
+            first=["first@example.com", "second@example.org"],
+            second=[message["To"] for message in messages],
+        )
+        self.assertNotEqual(
+            first=messages[0]["Message-ID"], second=messages[1]["Message-ID"]
+        )
+        self.assertEqual(
+            first=outgoing_emails[0].content.partition(b"\r\nFrom:")[2],
+            second=outgoing_emails[1].content.partition(b"\r\nFrom:")[2],
+        )
+
+    # -------------------------------------------------------------------------
+    def test_long_subject_is_folded(self) -> None:
+        renderer = EmailRenderer(
+            sender="shop@nekoshop.ru",
+            templates={"long": EmailTemplate(subject="Товар $title", text="$title")},
+        )
+        title: str = "Очень длинное название товара 🐱 " * 4
+
+        outgoing_email: OutgoingEmail = renderer.render(
+            template_name="long", recipient="buyer@example.com", values={"title": title}
+        )
+        message: EmailMessage = self.parse(outgoing_email=outgoing_email)
+
+        self.assertEqual(first=f"Товар {title.strip()}", second=message["Subject"])
+        self.assertTrue(
+            all(len(line) <= 78 for line in outgoing_email.content.split(b"\r\n"))
+        )
+
+    # -------------------------------------------------------------------------
+    def test_normalize_international_domain(self) -> None:
+        self.assertEqual(
+            first="neko@xn--80aairftm.xn--p1ai",
+            second=normalize_address(address="neko@Магазин.РФ"),
+        )
+
+
+# ____________________________________________________________________________
+class TestEmailRendererNegative(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        unittest.TestCase.setUpClass()
+
+        cls.renderer = EmailRenderer(sender="shop@nekoshop.ru", templates=TEMPLATES)
+
+    # -------------------------------------------------------------------------
+    def test_missing_values(self) -> None:
+        with self.assertRaises(KeyError):
+            self.renderer.render(
+                template_name="order_completed",
+                recipient="buyer@example.com",
+                values={"order_id": 42},
+            )
+
+    # -------------------------------------------------------------------------
+    def test_unknown_template(self) -> None:
+        with self.assertRaises(KeyError):
+            self.renderer.render(
+                template_name="unknown", recipient="buyer@example.com", values={}
+            )
+
+    # -------------------------------------------------------------------------
+    def test_invalid_template(self) -> None:
+        with self.assertRaises(ValueError):
+            EmailRenderer(
+                sender="shop@nekoshop.ru",
+                templates={"broken": EmailTemplate(subject="$", text="")},
+            )
+
+    # -------------------------------------------------------------------------
+    def test_invalid_address(self) -> None:
+        for address in (
+            "buyer",
+            "@example.com",
+            "buyer@",
+            "buyer@example.com\r\nBcc: spam@example.com",
+            "покупатель@example.com",
+        ):
+            with self.assertRaises(ValueError):
+                normalize_address(address=address)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_job_executor представляет из себя набор модульных тестов,
+для тестирования компонентов модулей job_executor и cpu_jobs.
+
+*Тесты запускают процессы пула.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import os
+import time
+import shutil
+import asyncio
+import tempfile
+import unittest
+
+from prototypes.job_scripts.cpu_jobs import build_csv_report
+from prototypes.job_scripts.job_executor import *
+
+
+# ----------------------------------------------------------------------------
+def get_stamp(value: int) -> int:
+    return time.perf_counter_ns() + value
+
+
+# ----------------------------------------------------------------------------
+def sleep_and_touch(seconds: float, path: str) -> None:
+    time.sleep(seconds)
+
+    open(path, "w").close()
+
+
+# ____________________________________________________________________________
+class TestBuildCsvReportPositive(unittest.TestCase):
+    def test_report_content(self) -> None:
+        report: bytes = build_csv_report(
+            header=("product_id", "total_price"), rows=[(1, "399.00"), (2, "10.50")]
+        )
+
+        self.assertEqual(
+            first="product_id,total_price\r\n1,399.00\r\n2,10.50\r\n",
+            second=report.decode("utf-8-sig"),
+        )
+
+
+# ____________________________________________________________________________
+class TestMakeKeyPositive(unittest.TestCase):
+    def test_same_arguments_give_same_key(self) -> None:
+        self.assertEqual(
+            first=JobExecutor.make_key(get_stamp, b"ab", 1, value=b"c"),
+            second=JobExecutor.make_key(get_stamp, bytearray(b"ab"), 1, value=b"c"),
+        )
+
+    # -------------------------------------------------------------------------
+    def test_split_bytes_give_different_keys(self) -> None:
+        self.assertNotEqual(
+            first=JobExecutor.make_key(get_stamp, b"ab", b"c"),
+            second=JobExecutor.make_key(get_stamp, b"a", b"bc"),
+        )
+        self.assertNotEqual(
+            first=JobExecutor.make_key(get_stamp, b"abc"),
+            second=JobExecutor.make_key(get_stamp, b"ab", b"c"),
+        )
+
+    # -------------------------------------------------------------------------
+    def test_positional_and_keyword_arguments_give_different_keys(self) -> None:
+        self.assertNotEqual(
+            first=JobExecutor.make_key(get_stamp, ("value", 1)),
+            second=JobExecutor.make_key(get_stamp, value=1),
+        )
+
+
+# ____________________________________________________________________________
+class TestJobExecutorPositive(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.executor = JobExecutor(max_workers=2, max_queued=2)
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.executor.close()
+
+    # -------------------------------------------------------------------------
+    async def test_result_returned(self) -> None:
+        report: bytes = await self.executor.run(
+            build_csv_report, ("id",), [(1,)]
+        )
+
+        self.assertEqual(first="id\r\n1\r\n", second=report.decode("utf-8-sig"))
+
+    # -------------------------------------------------------------------------
+    async def test_result_cached_by_arguments(self) -> None:
+        first: int = await self.executor.run(get_stamp, 1)
+
+        self.assertEqual(first=first, second=await self.executor.run(get_stamp, 1))
+        self.assertNotEqual(first=first, second=await self.executor.run(get_stamp, 2))
+
+    # -------------------------------------------------------------------------
+    async def test_concurrent_identical_jobs_run_once(self) -> None:
+        first, second = await asyncio.gather(
+            self.executor.run(get_stamp, 3), self.executor.run(get_stamp, 3)
+        )
+
+        self.assertEqual(first=first, second=second)
+
+    # -------------------------------------------------------------------------
+    async def test_result_not_cached_without_cache(self) -> None:
+        first: int = await self.executor.run(get_stamp, 4, use_cache=False)
+
+        self.assertNotEqual(
+            first=first, second=await self.executor.run(get_stamp, 4, use_cache=False)
+        )
+
+
+# ____________________________________________________________________________
+class TestJobExecutorNegative(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.temp_dir: str = tempfile.mkdtemp()
+        self.executor = JobExecutor(max_workers=1, max_queued=1)
+
+        # Процесс пула запускается заранее, чтобы задачи не ожидали его запуска.
+        await self.executor.run(get_stamp, 0, use_cache=False)
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.executor.close()
+        shutil.rmtree(self.temp_dir)
+
+    # -------------------------------------------------------------------------
+    async def test_full_queue_raise_QueueFull(self) -> None:
+        jobs = [
+            asyncio.create_task(
+                self.executor.run(
+                    sleep_and_touch, 0.5, os.path.join(self.temp_dir, str(index))
+                )
+            )
+            for index in range(2)
+        ]
+        await asyncio.sleep(0.1)
+
+        with self.assertRaises(asyncio.QueueFull):
+            await self.executor.run(get_stamp, 5, wait=False)
+
+        await asyncio.gather(*jobs)
+
+    # -------------------------------------------------------------------------
+    async def test_cancelled_pending_job_not_executed(self) -> None:
+        running = asyncio.create_task(
+            self.executor.run(sleep_and_touch, 0.5, os.path.join(self.temp_dir, "first"))
+        )
+        await asyncio.sleep(0.1)
+
+        path_to_cancelled: str = os.path.join(self.temp_dir, "cancelled")
+        pending = asyncio.create_task(
+            self.executor.run(sleep_and_touch, 0.0, path_to_cancelled)
+        )
+        await asyncio.sleep(0.05)
+        pending.cancel()
+
+        await running
+
+        self.assertRaises(asyncio.CancelledError, pending.result)
+        self.assertFalse(os.path.exists(path_to_cancelled))
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_catalogue_compiler представляет из себя набор модульных тестов,
+для тестирования компонентов модуля catalogue_compiler.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import os
+import json
+import unittest
+import tempfile
+
+from typing import Dict
+
+from prototypes.localization_scripts.catalogue_compiler import *
+from prototypes.localization_scripts.catalogue_compiler import PATH_TO_COMPILED_MODULE
+
+
+# ____________________________________________________________________________
+class TestParseMessageTemplatePositive(unittest.TestCase):
+    def test_template_without_placeholders_return_string(self) -> None:
+        self.assertEqual(
+            first="Каталог товаров",
+            second=parse_message_template(template="Каталог товаров"),
+        )
+
+    # ------------------------------------------------------------------------
+    def test_template_split_into_literals_and_names(self) -> None:
+        self.assertEqual(
+            first=(("Заказ №", " создан: ", ""), ("order_id", "status")),
+            second=parse_message_template(template="Заказ №{order_id} создан: {status}"),
+        )
+
+    # ------------------------------------------------------------------------
+    def test_escaped_braces_are_literals(self) -> None:
+        self.assertEqual(
+            first="{literal}",
+            second=parse_message_template(template="{{literal}}"),
+        )
+
+
+# ____________________________________________________________________________
+class TestParseMessageTemplateNegative(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        unittest.TestCase.setUpClass()
+
+        cls.unsupported_templates: list[str] = [
+            "Позиционная {}",
+            "Индекс {0}",
+            "Формат {price:.2f}",
+            "Преобразование {name!r}",
+            "Атрибут {user.name}",
+        ]
+
+    # ------------------------------------------------------------------------
+    def test_unsupported_placeholder_raise_ValueError(self) -> None:
+        for template in self.unsupported_templates:
+            with self.subTest(msg=f"Template: {template}"):
+                self.assertRaises(ValueError, parse_message_template, template)
+
+
+# ____________________________________________________________________________
+class TestCompileCataloguesPositive(unittest.TestCase):
+    def test_compiled_module_is_up_to_date(self) -> None:
+        with open(PATH_TO_COMPILED_MODULE, encoding="utf-8") as file:
+            self.assertEqual(
+                first=render_catalogues_module(catalogues=compile_catalogues()),
+                second=file.read(),
+            )
+
+    # ------------------------------------------------------------------------
+    def test_rendered_module_is_importable(self) -> None:
+        catalogues = compile_catalogues()
+        namespace: Dict[str, object] = {}
+
+        exec(render_catalogues_module(catalogues=catalogues), namespace)
+
+        self.assertEqual(first=catalogues, second=namespace["CATALOGUES"])
+
+
+# ____________________________________________________________________________
+class TestCompileCataloguesNegative(unittest.TestCase):
+    def _compile(self, sources: Dict[str, Dict[str, str]]) -> None:
+        with tempfile.TemporaryDirectory() as locales_dir:
+            for language_code, source in sources.items():
+                with open(
+                    os.path.join(locales_dir, f"{language_code}.json"), "w", encoding="utf-8"
+                ) as file:
+                    json.dump(source, file)
+
+            compile_catalogues(locales_dir=locales_dir, default_language_code="ru")
+
+    # ------------------------------------------------------------------------
+    def test_missing_default_catalogue_raise_ValueError(self) -> None:
+        self.assertRaises(ValueError, self._compile, {"en": {"key": "value"}})
+
+    # ------------------------------------------------------------------------
+    def test_mismatched_keys_raise_ValueError(self) -> None:
+        self.assertRaises(
+            ValueError,
+            self._compile,
+            {"ru": {"key": "значение"}, "en": {"other_key": "value"}},
+        )
+
+    # ------------------------------------------------------------------------
+    def test_mismatched_placeholders_raise_ValueError(self) -> None:
+        self.assertRaises(
+            ValueError,
+            self._compile,
+            {"ru": {"key": "Привет, {name}"}, "en": {"key": "Hi, {user}"}},
+        )
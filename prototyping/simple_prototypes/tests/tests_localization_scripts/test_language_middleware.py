@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_language_middleware представляет из себя набор модульных тестов,
+для тестирования компонентов модуля language_middleware.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+import aiogram
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from aiogram.types import Chat, Message, Update, User
+
+from prototypes.telegram_scripts.bot_handler import create_dispatcher
+from prototypes.localization_scripts.language_middleware import *
+from prototypes.localization_scripts.localizer import Translator
+
+
+# ----------------------------------------------------------------------------
+def make_message_update(user_id: int, language_code: Optional[str]) -> Update:
+    return Update(
+        update_id=1,
+        message=Message(
+            message_id=1,
+            date=datetime.now(),
+            chat=Chat(id=user_id, type="private"),
+            from_user=User(
+                id=user_id,
+                is_bot=False,
+                first_name="Neko",
+                language_code=language_code,
+            ),
+            text="Привет",
+        ),
+    )
+
+
+# ____________________________________________________________________________
+class TestLanguageMiddlewarePositive(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.bot = aiogram.Bot(token="42:TEST")
+        self.dispatcher: aiogram.Dispatcher = await create_dispatcher()
+        self.received_languages: List[str] = []
+        self.stored_languages: Dict[int, str] = {1: "en"}
+        self.resolve_calls: List[int] = []
+
+        async def resolve_language(user_id: int) -> Optional[str]:
+            self.resolve_calls.append(user_id)
+
+            return self.stored_languages.get(user_id)
+
+        @self.dispatcher.message()
+        async def handler(msg: Message, translator: Translator) -> None:
+            self.received_languages.append(translator.language_code)
+
+        setup_localization(dispatcher=self.dispatcher, resolve_language=resolve_language)
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.bot.session.close()
+
+    # -------------------------------------------------------------------------
+    async def test_stored_language_has_priority(self) -> None:
+        await self.dispatcher.feed_update(
+            bot=self.bot, update=make_message_update(user_id=1, language_code="ru")
+        )
+
+        self.assertEqual(first=["en"], second=self.received_languages)
+
+    # -------------------------------------------------------------------------
+    async def test_client_language_used_without_stored_language(self) -> None:
+        await self.dispatcher.feed_update(
+            bot=self.bot, update=make_message_update(user_id=2, language_code="en")
+        )
+
+        self.assertEqual(first=["en"], second=self.received_languages)
+
+    # -------------------------------------------------------------------------
+    async def test_default_language_used_for_unsupported_language(self) -> None:
+        await self.dispatcher.feed_update(
+            bot=self.bot, update=make_message_update(user_id=2, language_code="de")
+        )
+
+        self.assertEqual(first=["ru"], second=self.received_languages)
+
+    # -------------------------------------------------------------------------
+    async def test_language_resolved_once_per_update(self) -> None:
+        await self.dispatcher.feed_update(
+            bot=self.bot, update=make_message_update(user_id=1, language_code=None)
+        )
+
+        self.assertEqual(first=[1], second=self.resolve_calls)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_localizer представляет из себя набор модульных тестов,
+для тестирования компонентов модуля localizer.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from prototypes.localization_scripts.localizer import *
+
+
+# ____________________________________________________________________________
+class TestLocalizerPositive(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        unittest.TestCase.setUpClass()
+
+        cls.localizer = Localizer(
+            catalogues={
+                "ru": {
+                    "title": "Каталог",
+                    "greeting": (("Привет, ", "!"), ("name",)),
+                },
+                "en": {
+                    "title": "Catalogue",
+                    "greeting": (("Hi, ", "!"), ("name",)),
+                },
+            },
+            default_language_code="ru",
+        )
+
+    # ------------------------------------------------------------------------
+    def test_render_message_without_placeholders(self) -> None:
+        translator: Translator = self.localizer.get_translator(language_code="en")
+
+        self.assertEqual(first="Catalogue", second=translator.render("title"))
+
+    # ------------------------------------------------------------------------
+    def test_render_message_with_placeholders(self) -> None:
+        translator: Translator = self.localizer.get_translator(language_code="en")
+
+        self.assertEqual(first="Hi, Neko!", second=translator("greeting", name="Neko"))
+
+    # ------------------------------------------------------------------------
+    def test_regional_language_code_use_base_language(self) -> None:
+        translator: Translator = self.localizer.get_translator(language_code="en-GB")
+
+        self.assertEqual(first="en", second=translator.language_code)
+
+    # ------------------------------------------------------------------------
+    def test_unsupported_language_use_default_language(self) -> None:
+        for language_code in ("de", "", None):
+            with self.subTest(msg=f"Language: {language_code}"):
+                translator: Translator = self.localizer.get_translator(
+                    language_code=language_code
+                )
+
+                self.assertEqual(first="ru", second=translator.language_code)
+
+    # ------------------------------------------------------------------------
+    def test_default_catalogues_are_loaded(self) -> None:
+        self.assertIn(member="ru", container=Localizer().language_codes)
+
+
+# ____________________________________________________________________________
+class TestLocalizerNegative(unittest.TestCase):
+    def test_missing_default_catalogue_raise_KeyError(self) -> None:
+        self.assertRaises(
+            KeyError, Localizer, {"en": {"title": "Catalogue"}}, "ru"
+        )
+
+    # ------------------------------------------------------------------------
+    def test_missing_placeholder_value_raise_KeyError(self) -> None:
+        translator: Translator = Localizer().get_translator(language_code="ru")
+
+        self.assertRaises(KeyError, translator.render, "start.greeting")
+
+    # ------------------------------------------------------------------------
+    def test_unknown_message_key_raise_KeyError(self) -> None:
+        translator: Translator = Localizer().get_translator(language_code="ru")
+
+        self.assertRaises(KeyError, translator.render, "banana.strawberry")
@@ -0,0 +1 @@
+print(f"Package Imported: {__package__}\n{__path__}\n\n")
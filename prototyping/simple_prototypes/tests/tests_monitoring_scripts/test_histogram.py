@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_histogram представляет из себя набор модульных тестов,
+для тестирования компонентов модуля histogram.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import math
+import unittest
+
+from prototypes.monitoring_scripts.histogram import *
+
+
+# ____________________________________________________________________________
+class TestHistogramPositive(unittest.TestCase):
+    def setUp(self) -> None:
+        self.histogram = Histogram(bounds=(1.0, 2.0, 4.0))
+
+    # -------------------------------------------------------------------------
+    def test_observe(self) -> None:
+        for value in (0.5, 1.0, 1.5, 3.0, 10.0):
+            self.histogram.observe(value)
+
+        self.assertEqual(first=5, second=self.histogram.count)
+        self.assertEqual(first=16.0, second=self.histogram.sum)
+        self.assertEqual(first=10.0, second=self.histogram.max)
+        self.assertEqual(
+            first=[(1.0, 2), (2.0, 3), (4.0, 4), (math.inf, 5)],
+            second=self.histogram.cumulative_counts(),
+        )
+
+    # -------------------------------------------------------------------------
+    def test_quantile(self) -> None:
+        for _ in range(50):
+            self.histogram.observe(0.5)
+
+        for _ in range(50):
+            self.histogram.observe(3.0)
+
+        self.assertLessEqual(a=self.histogram.quantile(0.5), b=1.0)
+        self.assertGreater(a=self.histogram.quantile(0.99), b=2.0)
+        self.assertLessEqual(a=self.histogram.quantile(1.0), b=3.0)
+
+    # -------------------------------------------------------------------------
+    def test_empty_and_reset(self) -> None:
+        self.assertEqual(first=0.0, second=self.histogram.quantile(0.99))
+
+        self.histogram.observe(3.0)
+        self.histogram.reset()
+
+        self.assertEqual(first=0, second=self.histogram.count)
+        self.assertEqual(first=0.0, second=self.histogram.max)
+
+
+# ____________________________________________________________________________
+class TestHistogramNegative(unittest.TestCase):
+    def test_invalid_bounds(self) -> None:
+        for bounds in ((), (1.0, 1.0), (2.0, 1.0)):
+            with self.assertRaises(ValueError):
+                Histogram(bounds=bounds)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_loop_monitor представляет из себя набор модульных тестов,
+для тестирования компонентов модуля loop_monitor.
+
+*Тесты намеренно блокируют цикл событий на доли секунды.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import time
+import asyncio
+import unittest
+
+from typing import List
+
+from prototypes.monitoring_scripts.loop_monitor import *
+from prototypes.telegram_scripts.bot_handler import run_bot
+
+
+# ----------------------------------------------------------------------------
+def blocking_database_call(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+# ____________________________________________________________________________
+class FakeDispatcher:
+    def __init__(self, monitor: LoopMonitor) -> None:
+        self.monitor = monitor
+        self.was_running: bool = False
+
+    # -------------------------------------------------------------------------
+    async def start_polling(self, bot: object) -> None:
+        await asyncio.sleep(0.05)
+
+        self.was_running = self.monitor.is_running
+
+
+# ____________________________________________________________________________
+class TestLoopMonitorPositive(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.detected: List[BlockingReport] = []
+        self.monitor = LoopMonitor(
+            interval=0.01, threshold=0.1, on_blocking=self.detected.append
+        )
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.monitor.stop()
+
+    # -------------------------------------------------------------------------
+    async def test_lag_measured_without_blocking(self) -> None:
+        self.monitor.start()
+        await asyncio.sleep(0.2)
+
+        self.assertGreater(a=self.monitor.lag_histogram.count, b=5)
+        self.assertEqual(first=0, second=self.monitor.blocking_amount)
+        self.assertIn(member="блокировок 0", container=self.monitor.report())
+
+    # -------------------------------------------------------------------------
+    async def test_blocking_call_stack_captured(self) -> None:
+        self.monitor.start()
+        await asyncio.sleep(0.05)
+
+        blocking_database_call(seconds=0.4)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(first=1, second=self.monitor.blocking_amount)
+        self.assertEqual(first=self.monitor.reports, second=self.detected)
+
+        report: BlockingReport = self.detected[0]
+
+        self.assertGreaterEqual(a=report.blocked_seconds, b=0.3)
+        self.assertIn(member="blocking_database_call", container=report.stack)
+        self.assertGreaterEqual(a=self.monitor.lag_histogram.max, b=0.3)
+
+    # -------------------------------------------------------------------------
+    async def test_run_bot_with_monitor(self) -> None:
+        dispatcher = FakeDispatcher(monitor=self.monitor)
+
+        await run_bot(
+            bot=None, dispatcher=dispatcher, loop_monitor=self.monitor  # type: ignore
+        )
+
+        self.assertTrue(dispatcher.was_running)
+        self.assertFalse(self.monitor.is_running)
+
+
+# ____________________________________________________________________________
+class TestLoopMonitorNegative(unittest.IsolatedAsyncioTestCase):
+    async def test_invalid_threshold(self) -> None:
+        with self.assertRaises(ValueError):
+            LoopMonitor(threshold=0)
+
+    # -------------------------------------------------------------------------
+    async def test_double_start(self) -> None:
+        monitor = LoopMonitor(on_blocking=None)
+        monitor.start()
+
+        with self.assertRaises(RuntimeError):
+            monitor.start()
+
+        await monitor.stop()
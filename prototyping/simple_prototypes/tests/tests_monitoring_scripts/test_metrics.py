@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_metrics представляет из себя набор модульных тестов,
+для тестирования компонентов модулей metrics и database_metrics.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from typing import Any, Optional
+
+from prototypes.monitoring_scripts.metrics import *
+from prototypes.monitoring_scripts.metrics import CounterValue, _Metric
+from prototypes.monitoring_scripts.database_metrics import *
+
+
+# ____________________________________________________________________________
+class FakeDatabaseAPI:
+    def __init__(self) -> None:
+        self.pool_size = 4
+        self.active_transactions_amount = 3
+        self.connections_in_use_amount = 1
+        self.observer: Optional[Any] = None
+
+    # -------------------------------------------------------------------------
+    @property
+    def transaction_observer(self) -> Optional[Any]:
+        return self.observer
+
+    # -------------------------------------------------------------------------
+    def set_transaction_observer(self, observer: Any) -> None:
+        self.observer = observer
+
+
+# ____________________________________________________________________________
+class FakePoolAutosizer:
+    def __init__(self) -> None:
+        self.pool_size = 6
+        self.min_size = 2
+        self.max_size = 16
+        self.wait_p95_seconds = 0.02
+        self.utilization = 0.9
+        self.observer: Optional[Any] = None
+
+    # -------------------------------------------------------------------------
+    def set_decision_observer(self, observer: Any) -> None:
+        self.observer = observer
+
+
+# ____________________________________________________________________________
+class TestMetricsRegistryPositive(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = MetricsRegistry()
+
+    # -------------------------------------------------------------------------
+    def test_counter_render(self) -> None:
+        counter = self.registry.counter(
+            name="bot_updates", documentation="Обновления.", label_names=("type",)
+        )
+        counter.labels("message").inc()
+        counter.labels("message").inc(2)
+        counter.labels("callback_query").inc()
+
+        self.assertEqual(
+            first=(
+                "# HELP bot_updates Обновления.\n"
+                "# TYPE bot_updates counter\n"
+                'bot_updates_total{type="message"} 3.0\n'
+                'bot_updates_total{type="callback_query"} 1.0\n'
+            ),
+            second=self.registry.render(),
+        )
+
+    # -------------------------------------------------------------------------
+    def test_gauge_function(self) -> None:
+        values = [5]
+        gauge = self.registry.gauge(name="queue_size", documentation="Очередь.")
+        gauge.set_function(lambda: values[0])
+
+        self.assertIn(member="queue_size 5.0", container=self.registry.render())
+
+        values[0] = 7
+
+        self.assertIn(member="queue_size 7.0", container=self.registry.render())
+
+    # -------------------------------------------------------------------------
+    def test_histogram_render(self) -> None:
+        histogram = self.registry.histogram(
+            name="latency_seconds",
+            documentation="Задержка.",
+            label_names=("method",),
+            bounds=(0.1, 1.0),
+        )
+        histogram.labels("sendMessage").observe(0.05)
+        histogram.labels("sendMessage").observe(0.5)
+
+        rendered: str = self.registry.render()
+
+        for line in (
+            'latency_seconds_bucket{method="sendMessage",le="0.1"} 1',
+            'latency_seconds_bucket{method="sendMessage",le="1.0"} 2',
+            'latency_seconds_bucket{method="sendMessage",le="+Inf"} 2',
+            'latency_seconds_sum{method="sendMessage"} 0.55',
+            'latency_seconds_count{method="sendMessage"} 2',
+        ):
+            self.assertIn(member=line, container=rendered)
+
+    # -------------------------------------------------------------------------
+    def test_histogram_without_labels(self) -> None:
+        histogram = self.registry.histogram(
+            name="wait_seconds", documentation="Ожидание.", bounds=(1.0,)
+        )
+        histogram.observe(2.0)
+
+        self.assertIn(
+            member='wait_seconds_bucket{le="+Inf"} 1', container=self.registry.render()
+        )
+
+    # -------------------------------------------------------------------------
+    def test_label_escaping(self) -> None:
+        counter = self.registry.counter(
+            name="errors", documentation="Ошибки.", label_names=("error",)
+        )
+        counter.labels('a"b\\c\nd').inc()
+
+        self.assertIn(
+            member='errors_total{error="a\\"b\\\\c\\nd"} 1.0',
+            container=self.registry.render(),
+        )
+
+    # -------------------------------------------------------------------------
+    def test_database_metrics(self) -> None:
+        api = FakeDatabaseAPI()
+        register_database_metrics(registry=self.registry, api=api)
+
+        api.observer(0.01, 0.2, None)  # type: ignore
+        api.observer(0.02, 0.3, ValueError())  # type: ignore
+
+        rendered: str = self.registry.render()
+
+        self.assertIn(
+            member='db_pool_connections_in_use{database="main"} 1.0', container=rendered
+        )
+        self.assertIn(
+            member='db_pool_connections_idle{database="main"} 3.0', container=rendered
+        )
+        self.assertIn(
+            member='db_transaction_duration_seconds_count{database="main"} 2',
+            container=rendered,
+        )
+        self.assertIn(
+            member='db_transaction_errors_total{database="main",error="ValueError"} 1.0',
+            container=rendered,
+        )
+
+    # -------------------------------------------------------------------------
+    def test_database_metrics_several_databases(self) -> None:
+        register_database_metrics(registry=self.registry, api=FakeDatabaseAPI())
+        register_database_metrics(
+            registry=self.registry, api=FakeDatabaseAPI(), database="orders"
+        )
+
+        self.assertIn(
+            member='db_pool_connections_idle{database="orders"} 3.0',
+            container=self.registry.render(),
+        )
+
+    # -------------------------------------------------------------------------
+    def test_database_metrics_chain_observer(self) -> None:
+        observed: list = []
+        api = FakeDatabaseAPI()
+        api.set_transaction_observer(lambda *args: observed.append(args))
+        register_database_metrics(registry=self.registry, api=api)
+
+        api.observer(0.01, 0.2, None)  # type: ignore
+
+        self.assertEqual(first=[(0.01, 0.2, None)], second=observed)
+
+    # -------------------------------------------------------------------------
+    def test_pool_autosizer_metrics(self) -> None:
+        autosizer = FakePoolAutosizer()
+        register_pool_autosizer_metrics(registry=self.registry, autosizer=autosizer)
+
+        autosizer.observer(  # type: ignore
+            type("Decision", (), {"previous_size": 4, "pool_size": 6, "reason": "wait"})
+        )
+
+        rendered: str = self.registry.render()
+
+        self.assertIn(member='db_pool_size{database="main"} 6.0', container=rendered)
+        self.assertIn(
+            member='db_pool_max_size{database="main"} 16.0', container=rendered
+        )
+        self.assertIn(
+            member=(
+                'db_pool_resizes_total{database="main",direction="grow",'
+                'reason="wait"} 1.0'
+            ),
+            container=rendered,
+        )
+
+
+# ____________________________________________________________________________
+class TestMetricsRegistryNegative(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = MetricsRegistry()
+
+    # -------------------------------------------------------------------------
+    def test_duplicate_name(self) -> None:
+        self.registry.counter(name="bot_updates", documentation="")
+
+        with self.assertRaises(expected_exception=ValueError):
+            self.registry.gauge(name="bot_updates", documentation="")
+
+    # -------------------------------------------------------------------------
+    def test_invalid_names(self) -> None:
+        for name, label_names in (("1updates", ()), ("updates", ("le",))):
+            with self.assertRaises(expected_exception=ValueError):
+                self.registry.counter(
+                    name=name, documentation="", label_names=label_names
+                )
+
+    # -------------------------------------------------------------------------
+    def test_wrong_labels_amount(self) -> None:
+        counter = self.registry.counter(
+            name="updates", documentation="", label_names=("type",)
+        )
+
+        with self.assertRaises(expected_exception=ValueError):
+            counter.inc()
+
+    # -------------------------------------------------------------------------
+    def test_counter_decrease(self) -> None:
+        counter = self.registry.counter(name="updates", documentation="")
+
+        with self.assertRaises(expected_exception=ValueError):
+            counter.inc(-1)
+
+    # -------------------------------------------------------------------------
+    def test_failing_gauge_function(self) -> None:
+        gauge = self.registry.gauge(name="broken", documentation="")
+        gauge.set_function(lambda: 1 / 0)
+
+        self.assertTrue(expr=self.registry.render().endswith("# TYPE broken gauge\n"))
+
+    # -------------------------------------------------------------------------
+    def test_metric_without_render_child(self) -> None:
+        class IncompleteMetric(_Metric[CounterValue]):
+            def _create_child(self) -> CounterValue:
+                return CounterValue()
+
+        with self.assertRaises(expected_exception=TypeError):
+            IncompleteMetric(name="incomplete", documentation="")  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_metrics_server представляет из себя набор модульных тестов,
+для тестирования компонентов модуля metrics_server.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+
+import aiohttp
+
+from typing import Any
+
+from prototypes.monitoring_scripts.metrics import MetricsRegistry
+from prototypes.monitoring_scripts.metrics_server import *
+from prototypes.telegram_scripts.bot_state_handlers import BotStage, BotState
+
+
+# ____________________________________________________________________________
+class TestMetricsServerPositive(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.registry = MetricsRegistry()
+        self.registry.counter(name="bot_updates", documentation="").inc()
+
+        self.state = BotState()
+        self.server = MetricsServer(registry=self.registry, state=self.state, port=0)
+        await self.server.start()
+
+        self.session = aiohttp.ClientSession(
+            base_url=f"http://127.0.0.1:{self.server.port}"
+        )
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.session.close()
+        await self.server.stop()
+
+    # -------------------------------------------------------------------------
+    async def get(self, path: str) -> tuple[int, str, Any]:
+        async with self.session.get(path) as response:
+            body: str = await response.text()
+
+            return response.status, response.headers["Content-Type"], body
+
+    # -------------------------------------------------------------------------
+    async def test_metrics(self) -> None:
+        status, content_type, body = await self.get("/metrics")
+
+        self.assertEqual(first=200, second=status)
+        self.assertTrue(expr=content_type.startswith("text/plain; version=0.0.4"))
+        self.assertIn(member="bot_updates_total 1.0", container=body)
+
+    # -------------------------------------------------------------------------
+    async def test_ready_follows_stage(self) -> None:
+        status, _, _ = await self.get("/health/ready")
+        self.assertEqual(first=503, second=status)
+
+        self.state.stage = BotStage.RUNNING
+        status, _, _ = await self.get("/health/ready")
+        self.assertEqual(first=200, second=status)
+
+        self.state.stage = BotStage.STOPPING
+        status, _, _ = await self.get("/health/ready")
+        self.assertEqual(first=503, second=status)
+
+        status, _, _ = await self.get("/health/live")
+        self.assertEqual(first=200, second=status)
+
+    # -------------------------------------------------------------------------
+    async def test_health_checks(self) -> None:
+        async def database_check() -> bool:
+            return False
+
+        async def event_loop_check() -> bool:
+            return True
+
+        self.state.stage = BotStage.RUNNING
+        self.state.add_health_check(name="database", check=database_check)
+        self.state.add_health_check(
+            name="event_loop", check=event_loop_check, is_liveness=True
+        )
+
+        report = await self.state.check_health()
+
+        self.assertTrue(expr=report.is_live)
+        self.assertFalse(expr=report.is_ready)
+        self.assertEqual(
+            first={"database": False, "event_loop": True}, second=report.checks
+        )
+
+        status, _, _ = await self.get("/health/ready")
+        self.assertEqual(first=503, second=status)
+
+    # -------------------------------------------------------------------------
+    async def test_hanging_liveness_check(self) -> None:
+        async def hanging_check() -> bool:
+            await asyncio.sleep(10)
+            return True
+
+        self.state.stage = BotStage.RUNNING
+        self.state.add_health_check(name="hang", check=hanging_check, is_liveness=True)
+
+        report = await self.state.check_health(timeout=0.05)
+
+        self.assertFalse(expr=report.is_live)
+        self.assertFalse(expr=report.is_ready)
+
+
+# ____________________________________________________________________________
+class TestMetricsServerNegative(unittest.IsolatedAsyncioTestCase):
+    async def test_double_start(self) -> None:
+        server = MetricsServer(registry=MetricsRegistry(), port=0)
+        await server.start()
+
+        try:
+            with self.assertRaises(expected_exception=RuntimeError):
+                await server.start()
+        finally:
+            await server.stop()
+
+        self.assertFalse(expr=server.is_running)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_circuit_breaker представляет из себя набор модульных тестов,
+для тестирования компонентов модуля circuit_breaker.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from prototypes.resilience_scripts.circuit_breaker import *
+
+
+# ____________________________________________________________________________
+class FakeClock:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    # -------------------------------------------------------------------------
+    def __call__(self) -> float:
+        return self.now
+
+
+# ----------------------------------------------------------------------------
+async def succeed() -> str:
+    return "ok"
+
+
+# ----------------------------------------------------------------------------
+async def fail() -> None:
+    raise ConnectionError("Зависимость недоступна!")
+
+
+# ____________________________________________________________________________
+class TestCircuitBreakerPositive(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            name="mysql",
+            failure_threshold=2,
+            recovery_timeout=10.0,
+            failure_errors=(ConnectionError,),
+            clock=self.clock,
+        )
+
+    # -------------------------------------------------------------------------
+    async def open_breaker(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                await self.breaker.call(fail)
+
+    # -------------------------------------------------------------------------
+    async def test_call_result(self) -> None:
+        self.assertEqual(first="ok", second=await self.breaker.call(succeed))
+        self.assertIs(expr1=CircuitState.CLOSED, expr2=self.breaker.state)
+
+    # -------------------------------------------------------------------------
+    async def test_open_after_failures(self) -> None:
+        await self.open_breaker()
+
+        self.assertIs(expr1=CircuitState.OPEN, expr2=self.breaker.state)
+
+        with self.assertRaises(CircuitOpenError) as context:
+            await self.breaker.call(succeed)
+
+        self.assertEqual(first=10.0, second=context.exception.retry_after)
+
+    # -------------------------------------------------------------------------
+    async def test_success_resets_failures(self) -> None:
+        with self.assertRaises(ConnectionError):
+            await self.breaker.call(fail)
+
+        await self.breaker.call(succeed)
+
+        self.assertEqual(first=0, second=self.breaker.failures)
+
+    # -------------------------------------------------------------------------
+    async def test_close_after_successful_probe(self) -> None:
+        await self.open_breaker()
+        self.clock.now = 10.0
+
+        self.assertIs(expr1=CircuitState.HALF_OPEN, expr2=self.breaker.state)
+
+        await self.breaker.call(succeed)
+
+        self.assertIs(expr1=CircuitState.CLOSED, expr2=self.breaker.state)
+
+    # -------------------------------------------------------------------------
+    async def test_reopen_after_failed_probe(self) -> None:
+        await self.open_breaker()
+        self.clock.now = 10.0
+
+        with self.assertRaises(ConnectionError):
+            await self.breaker.call(fail)
+
+        self.assertIs(expr1=CircuitState.OPEN, expr2=self.breaker.state)
+
+    # -------------------------------------------------------------------------
+    async def test_slow_call_is_failure(self) -> None:
+        clock = self.clock
+        breaker = CircuitBreaker(
+            name="mysql", failure_threshold=1, slow_call_seconds=1.0, clock=clock
+        )
+
+        async def slow() -> str:
+            clock.now += 2.0
+            return "ok"
+
+        self.assertEqual(first="ok", second=await breaker.call(slow))
+        self.assertIs(expr1=CircuitState.OPEN, expr2=breaker.state)
+
+    # -------------------------------------------------------------------------
+    async def test_other_errors_ignored(self) -> None:
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                await self.breaker.call(int, "x")  # type: ignore
+
+        self.assertIs(expr1=CircuitState.CLOSED, expr2=self.breaker.state)
+
+
+# ____________________________________________________________________________
+class TestCircuitBreakerNegative(unittest.IsolatedAsyncioTestCase):
+    def test_invalid_failure_threshold(self) -> None:
+        with self.assertRaises(ValueError):
+            CircuitBreaker(name="mysql", failure_threshold=0)
+
+    # -------------------------------------------------------------------------
+    async def test_reject_if_open(self) -> None:
+        breaker = CircuitBreaker(name="mysql", failure_threshold=1)
+
+        with self.assertRaises(ConnectionError):
+            await breaker.call(fail)
+
+        with self.assertRaises(CircuitOpenError):
+            breaker.reject_if_open()
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_concurrency_limiter представляет из себя набор модульных тестов,
+для тестирования компонентов модуля concurrency_limiter.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+
+from typing import List
+
+from prototypes.resilience_scripts.concurrency_limiter import *
+
+
+# ____________________________________________________________________________
+class TestAdaptiveConcurrencyLimiterPositive(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.limiter = AdaptiveConcurrencyLimiter(
+            name="mysql",
+            initial_limit=4,
+            min_limit=1,
+            max_limit=8,
+            latency_threshold_seconds=0.05,
+            backoff_ratio=0.5,
+            low_priority_share=0.5,
+            max_queue_size=2,
+            queue_timeout=1.0,
+        )
+
+    # -------------------------------------------------------------------------
+    async def hold(self, priority: Priority, release: asyncio.Event) -> None:
+        async with self.limiter.acquire(priority=priority):
+            await release.wait()
+
+    # -------------------------------------------------------------------------
+    async def test_shed_low_priority_first(self) -> None:
+        release = asyncio.Event()
+        tasks: List[asyncio.Task] = [
+            asyncio.create_task(self.hold(Priority.HIGH, release)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        with self.assertRaises(LoadShedError):
+            async with self.limiter.acquire(priority=Priority.LOW):
+                pass
+
+        async with self.limiter.acquire(priority=Priority.HIGH):
+            self.assertEqual(first=3, second=self.limiter.in_flight)
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(first=1, second=self.limiter.shed_amount)
+
+    # -------------------------------------------------------------------------
+    async def test_high_priority_waits_in_queue(self) -> None:
+        release = asyncio.Event()
+        tasks: List[asyncio.Task] = [
+            asyncio.create_task(self.hold(Priority.HIGH, release)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+
+        self.assertEqual(first=4, second=self.limiter.in_flight)
+        self.assertEqual(first=1, second=self.limiter.queued)
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(first=0, second=self.limiter.in_flight)
+        self.assertEqual(first=0, second=self.limiter.shed_amount)
+
+    # -------------------------------------------------------------------------
+    async def test_default_priority_from_context(self) -> None:
+        release = asyncio.Event()
+        task = asyncio.create_task(self.hold(Priority.HIGH, release))
+        await asyncio.sleep(0)
+        token = current_priority.set(Priority.LOW)
+
+        try:
+            async with self.limiter.acquire():
+                self.assertEqual(first=2, second=self.limiter.in_flight)
+
+            tasks: List[asyncio.Task] = [
+                asyncio.create_task(self.hold(Priority.HIGH, release))
+            ]
+            await asyncio.sleep(0)
+
+            with self.assertRaises(LoadShedError):
+                async with self.limiter.acquire():
+                    pass
+
+        finally:
+            current_priority.reset(token)
+
+        release.set()
+        await asyncio.gather(task, *tasks)
+
+    # -------------------------------------------------------------------------
+    async def test_decrease_on_slow_call(self) -> None:
+        async with self.limiter.acquire(priority=Priority.HIGH):
+            await asyncio.sleep(0.06)
+
+        self.assertEqual(first=2, second=self.limiter.limit)
+
+    # -------------------------------------------------------------------------
+    async def test_decrease_on_overload_error(self) -> None:
+        with self.assertRaises(TimeoutError):
+            async with self.limiter.acquire(priority=Priority.HIGH):
+                raise TimeoutError()
+
+        self.assertEqual(first=2, second=self.limiter.limit)
+
+    # -------------------------------------------------------------------------
+    async def test_decrease_once_per_generation(self) -> None:
+        async def slow_call() -> None:
+            async with self.limiter.acquire(priority=Priority.HIGH):
+                await asyncio.sleep(0.06)
+
+        await asyncio.gather(slow_call(), slow_call(), slow_call())
+
+        self.assertEqual(first=2, second=self.limiter.limit)
+
+    # -------------------------------------------------------------------------
+    async def test_increase_under_load(self) -> None:
+        release = asyncio.Event()
+        tasks: List[asyncio.Task] = [
+            asyncio.create_task(self.hold(Priority.HIGH, release)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        for _ in range(5):
+            async with self.limiter.acquire(priority=Priority.HIGH):
+                pass
+
+        self.assertEqual(first=5, second=self.limiter.limit)
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    # -------------------------------------------------------------------------
+    async def test_no_increase_when_idle(self) -> None:
+        for _ in range(8):
+            async with self.limiter.acquire(priority=Priority.HIGH):
+                pass
+
+        self.assertEqual(first=4, second=self.limiter.limit)
+
+
+# ____________________________________________________________________________
+class TestAdaptiveConcurrencyLimiterNegative(unittest.IsolatedAsyncioTestCase):
+    def test_invalid_limits(self) -> None:
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(name="mysql", initial_limit=1, min_limit=2)
+
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(name="mysql", backoff_ratio=1.0)
+
+    # -------------------------------------------------------------------------
+    async def test_queue_overflow(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(
+            name="mysql", initial_limit=1, max_queue_size=1
+        )
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with limiter.acquire(priority=Priority.HIGH):
+                await release.wait()
+
+        tasks: List[asyncio.Task] = [asyncio.create_task(hold()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with self.assertRaises(LoadShedError):
+            async with limiter.acquire(priority=Priority.HIGH):
+                pass
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    # -------------------------------------------------------------------------
+    async def test_queue_timeout(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(
+            name="mysql", initial_limit=1, queue_timeout=0.01
+        )
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with limiter.acquire(priority=Priority.HIGH):
+                await release.wait()
+
+        task = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        with self.assertRaises(LoadShedError):
+            async with limiter.acquire(priority=Priority.HIGH):
+                pass
+
+        self.assertEqual(first=0, second=limiter.queued)
+
+        release.set()
+        await task
+
+        self.assertEqual(first=0, second=limiter.in_flight)
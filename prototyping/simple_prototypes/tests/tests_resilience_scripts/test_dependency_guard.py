@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_dependency_guard представляет из себя набор модульных тестов,
+для тестирования компонентов модуля dependency_guard.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from string import Template
+from typing import Any, Callable, List
+
+from prototypes.cache_scripts.lru_ttl_cache import LRUTTLCache
+from prototypes.resilience_scripts.circuit_breaker import *
+from prototypes.resilience_scripts.concurrency_limiter import *
+from prototypes.resilience_scripts.dependency_guard import *
+
+
+# ____________________________________________________________________________
+class FakeCursor:
+    def __init__(self, queries: List[str]) -> None:
+        self.queries = queries
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        pass
+
+    def execute(self, query: str) -> None:
+        self.queries.append(query)
+
+
+# ____________________________________________________________________________
+class FakeDatabaseAPI:
+    def __init__(self) -> None:
+        self.pool_size = 4
+        self.is_available = True
+        self.queries: List[str] = []
+
+    # -------------------------------------------------------------------------
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(queries=self.queries)
+
+    # -------------------------------------------------------------------------
+    async def execute_transaction_use_pool(
+        self, transaction: Callable[[Any], Any]
+    ) -> Any:
+        if not self.is_available:
+            raise ConnectionError("БД недоступна!")
+
+        return transaction(self)
+
+    # -------------------------------------------------------------------------
+    async def execute_sql_query_use_pool(self, *_: Any, **__: Any) -> None:
+        # Как и AsyncMySQLAPI, метод не возбуждает ошибки соединения.
+        pass
+
+
+# ____________________________________________________________________________
+class TestDependencyGuardPositive(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.api = FakeDatabaseAPI()
+        self.guard = DependencyGuard(
+            breaker=CircuitBreaker(
+                name="mysql", failure_threshold=1, failure_errors=(ConnectionError,)
+            ),
+            limiter=AdaptiveConcurrencyLimiter(name="mysql", initial_limit=2),
+        )
+        self.guarded_api = GuardedDatabaseAPI(api=self.api, guard=self.guard)
+        self.catalogue: LRUTTLCache = LRUTTLCache(max_size=10, ttl_seconds=3600.0)
+
+    # -------------------------------------------------------------------------
+    async def load_catalogue(self) -> List[str]:
+        return await self.guarded_api.execute_transaction_use_pool(
+            lambda _: ["Neko Plush"]
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_guarded_transaction(self) -> None:
+        self.assertEqual(first=["Neko Plush"], second=await self.load_catalogue())
+        self.assertEqual(first=0, second=self.guard.limiter.in_flight)  # type: ignore
+
+    # -------------------------------------------------------------------------
+    async def test_guarded_sql_query(self) -> None:
+        await self.guarded_api.execute_sql_query_use_pool(
+            query_template=Template("DELETE FROM `$table`"),
+            query_data={"table": "Cart"},
+        )
+
+        self.assertEqual(first=["DELETE FROM `Cart`"], second=self.api.queries)
+
+    # -------------------------------------------------------------------------
+    async def test_attributes_passed_to_api(self) -> None:
+        self.assertEqual(first=4, second=self.guarded_api.pool_size)
+
+    # -------------------------------------------------------------------------
+    async def test_fallback_while_open(self) -> None:
+        await self.guard.call_with_fallback(
+            self.catalogue, "page:1", self.load_catalogue
+        )
+        self.api.is_available = False
+
+        with self.assertRaises(ConnectionError):
+            await self.load_catalogue()
+
+        self.assertIs(expr1=CircuitState.OPEN, expr2=self.guard.breaker.state)
+        self.assertEqual(
+            first=["Neko Plush"],
+            second=await self.guard.call_with_fallback(
+                self.catalogue, "page:1", self.load_catalogue
+            ),
+        )
+
+
+# ____________________________________________________________________________
+class TestDependencyGuardNegative(unittest.IsolatedAsyncioTestCase):
+    async def test_no_fallback_without_cached_answer(self) -> None:
+        api = FakeDatabaseAPI()
+        api.is_available = False
+        guard = DependencyGuard(
+            breaker=CircuitBreaker(
+                name="mysql", failure_threshold=1, failure_errors=(ConnectionError,)
+            )
+        )
+        guarded_api = GuardedDatabaseAPI(api=api, guard=guard)
+        cache: LRUTTLCache = LRUTTLCache(max_size=10, ttl_seconds=3600.0)
+
+        with self.assertRaises(ConnectionError):
+            await guarded_api.execute_transaction_use_pool(lambda _: None)
+
+        with self.assertRaises(CircuitOpenError):
+            await guard.call_with_fallback(
+                cache,
+                "page:1",
+                guarded_api.execute_transaction_use_pool,
+                lambda _: None,
+            )
+
+    # -------------------------------------------------------------------------
+    async def test_failed_sql_query_opens_breaker(self) -> None:
+        api = FakeDatabaseAPI()
+        api.is_available = False
+        guard = DependencyGuard(
+            breaker=CircuitBreaker(
+                name="mysql", failure_threshold=1, failure_errors=(ConnectionError,)
+            )
+        )
+        guarded_api = GuardedDatabaseAPI(api=api, guard=guard)
+
+        with self.assertRaises(ConnectionError):
+            await guarded_api.execute_sql_query_use_pool(
+                query_template=Template("DELETE FROM `Cart`"), query_data={}
+            )
+
+        self.assertIs(expr1=CircuitState.OPEN, expr2=guard.breaker.state)
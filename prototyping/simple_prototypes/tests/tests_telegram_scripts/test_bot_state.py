@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_bot_state представляет из себя набор модульных тестов,
+для тестирования класса BotState модуля bot_state_handlers.
+
+*В отличие от test_bot_state_handlers, тесты не запускают бота.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+
+from prototypes.telegram_scripts.bot_state_handlers import *
+
+
+# ----------------------------------------------------------------------------
+async def passing_check() -> bool:
+    return True
+
+
+# ----------------------------------------------------------------------------
+async def failing_check() -> bool:
+    return False
+
+
+# ____________________________________________________________________________
+class TestBotStateStagePositive(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = BotState()
+
+    # -------------------------------------------------------------------------
+    def test_created_state_is_disabled(self) -> None:
+        self.assertIs(expr1=BotStage.CREATED, expr2=self.state.stage)
+        self.assertFalse(expr=self.state())
+        self.assertEqual(first=0.0, second=self.state.uptime_seconds)
+
+    # -------------------------------------------------------------------------
+    def test_only_running_stage_enables_state(self) -> None:
+        for stage in BotStage:
+            with self.subTest(msg=f"Stage: {stage.value}"):
+                self.state.stage = stage
+
+                self.assertEqual(
+                    first=stage is BotStage.RUNNING, second=self.state.state
+                )
+
+    # -------------------------------------------------------------------------
+    def test_uptime_counted_from_running(self) -> None:
+        self.state.stage = BotStage.STARTING
+        self.state.stage = BotStage.RUNNING
+
+        self.assertGreater(a=self.state.uptime_seconds, b=0.0)
+
+        self.state.stage = BotStage.STOPPING
+
+        self.assertEqual(first=0.0, second=self.state.uptime_seconds)
+
+    # -------------------------------------------------------------------------
+    def test_repeated_running_keeps_uptime(self) -> None:
+        self.state.stage = BotStage.RUNNING
+        uptime: float = self.state.uptime_seconds
+
+        self.state.stage = BotStage.RUNNING
+
+        self.assertGreaterEqual(a=self.state.uptime_seconds, b=uptime)
+
+    # -------------------------------------------------------------------------
+    def test_switch_state(self) -> None:
+        self.state.switch_state()
+
+        self.assertIs(expr1=BotStage.RUNNING, expr2=self.state.stage)
+
+        self.state.switch_state()
+
+        self.assertIs(expr1=BotStage.STOPPED, expr2=self.state.stage)
+
+
+# ____________________________________________________________________________
+class TestBotStateHealthPositive(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.state = BotState()
+
+    # -------------------------------------------------------------------------
+    async def test_running_with_passing_checks_is_ready(self) -> None:
+        self.state.stage = BotStage.RUNNING
+        self.state.add_health_check(name="database", check=passing_check)
+        self.state.add_health_check(
+            name="event_loop", check=passing_check, is_liveness=True
+        )
+
+        report: HealthReport = await self.state.check_health()
+
+        self.assertTrue(expr=report.is_live)
+        self.assertTrue(expr=report.is_ready)
+        self.assertEqual(
+            first={"database": True, "event_loop": True}, second=report.checks
+        )
+        self.assertEqual(first="running", second=report.as_dict()["stage"])
+
+    # -------------------------------------------------------------------------
+    async def test_live_but_not_ready_outside_running(self) -> None:
+        for stage in (BotStage.CREATED, BotStage.STARTING, BotStage.STOPPING):
+            with self.subTest(msg=f"Stage: {stage.value}"):
+                self.state.stage = stage
+
+                report: HealthReport = await self.state.check_health()
+
+                self.assertTrue(expr=report.is_live)
+                self.assertFalse(expr=report.is_ready)
+
+
+# ____________________________________________________________________________
+class TestBotStateHealthNegative(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.state = BotState()
+        self.state.stage = BotStage.RUNNING
+
+    # -------------------------------------------------------------------------
+    async def test_stopped_is_not_live(self) -> None:
+        self.state.stage = BotStage.STOPPED
+
+        report: HealthReport = await self.state.check_health()
+
+        self.assertFalse(expr=report.is_live)
+        self.assertFalse(expr=report.is_ready)
+
+    # -------------------------------------------------------------------------
+    async def test_failed_readiness_check_keeps_live(self) -> None:
+        self.state.add_health_check(name="database", check=failing_check)
+
+        report: HealthReport = await self.state.check_health()
+
+        self.assertTrue(expr=report.is_live)
+        self.assertFalse(expr=report.is_ready)
+
+    # -------------------------------------------------------------------------
+    async def test_failed_liveness_check_is_not_live(self) -> None:
+        self.state.add_health_check(
+            name="event_loop", check=failing_check, is_liveness=True
+        )
+
+        report: HealthReport = await self.state.check_health()
+
+        self.assertFalse(expr=report.is_live)
+        self.assertFalse(expr=report.is_ready)
+
+    # -------------------------------------------------------------------------
+    async def test_raising_and_hanging_checks_fail(self) -> None:
+        async def raising_check() -> bool:
+            raise ConnectionError("БД недоступна!")
+
+        async def hanging_check() -> bool:
+            await asyncio.sleep(10)
+
+            return True
+
+        self.state.add_health_check(name="raising", check=raising_check)
+        self.state.add_health_check(name="hanging", check=hanging_check)
+
+        report: HealthReport = await self.state.check_health(timeout=0.05)
+
+        self.assertEqual(
+            first={"raising": False, "hanging": False}, second=report.checks
+        )
+        self.assertFalse(expr=report.is_ready)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_chunked_input_file представляет из себя набор модульных тестов,
+для тестирования компонентов модуля chunked_input_file.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+import aiogram
+
+from typing import AsyncIterator, List
+
+from prototypes.telegram_scripts.chunked_input_file import *
+
+
+# ____________________________________________________________________________
+class TestChunkedInputFilePositive(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.content: bytes = b"banana" * 100
+        self.bot = aiogram.Bot(token="42:TEST")
+
+        async def open_chunks() -> AsyncIterator[memoryview]:
+            view = memoryview(self.content)
+
+            for offset in range(0, len(view), 64):
+                yield view[offset : offset + 64]
+
+        self.input_file = ChunkedInputFile(open_chunks=open_chunks, filename="banana.jpg")
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.bot.session.close()
+
+    # -------------------------------------------------------------------------
+    async def test_chunks_passed_without_copy(self) -> None:
+        chunks: List[memoryview] = [
+            chunk async for chunk in self.input_file.read(bot=self.bot)  # type: ignore
+        ]
+
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+        self.assertEqual(first=self.content, second=b"".join(chunks))
+
+    # -------------------------------------------------------------------------
+    async def test_file_can_be_read_again(self) -> None:
+        for _ in range(2):
+            content: bytes = b"".join(
+                [chunk async for chunk in self.input_file.read(bot=self.bot)]
+            )
+
+            self.assertEqual(first=self.content, second=content)
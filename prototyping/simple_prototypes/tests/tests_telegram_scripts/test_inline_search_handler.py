@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_inline_search_handler представляет из себя набор модульных тестов,
+для тестирования компонентов модуля inline_search_handler.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+
+from decimal import Decimal
+from typing import Any, List, Optional, Sequence, Tuple
+
+from prototypes.telegram_scripts.inline_search_handler import *
+
+
+# ____________________________________________________________________________
+class BaseInlineSearchTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.rows: List[Tuple[Any, ...]] = [
+            (product_id, f"Товар {product_id}", "Описание", Decimal("9.99"))
+            for product_id in range(1, 6)
+        ]
+        self.search_calls: List[Tuple[str, int, int]] = []
+        self.release: Optional[asyncio.Event] = None
+        self.cancelled: List[str] = []
+
+        async def search_products(
+            query: str, offset: int, limit: int
+        ) -> Sequence[Sequence[Any]]:
+            self.search_calls.append((query, offset, limit))
+
+            try:
+                if self.release is not None:
+                    await self.release.wait()
+                else:
+                    await asyncio.sleep(0)
+
+            except asyncio.CancelledError:
+                self.cancelled.append(query)
+                raise
+
+            return self.rows[offset : offset + limit]
+
+        self.search = InlineProductSearch(
+            search_products=search_products, page_size=2, debounce_seconds=0.01
+        )
+
+
+# ____________________________________________________________________________
+class TestInlineProductSearchPositive(BaseInlineSearchTestCase):
+    def test_normalize_query(self) -> None:
+        self.assertEqual(
+            first="кошачий корм", second=normalize_query("  Кошачий   КОРМ ")
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_pages_use_next_offset(self) -> None:
+        first: Optional[InlineSearchPage] = await self.search.search(
+            user_id=1, query="товар"
+        )
+        last: Optional[InlineSearchPage] = await self.search.search(
+            user_id=1, query="товар", offset="4"
+        )
+
+        assert first is not None and last is not None
+        self.assertEqual(first="2", second=first.next_offset)
+        self.assertEqual(first=[1, 2], second=[r.product_id for r in first.results])
+        self.assertEqual(first="", second=last.next_offset)
+        self.assertEqual(first=[5], second=[r.product_id for r in last.results])
+        self.assertEqual(first=("товар", 4, 3), second=self.search_calls[-1])
+
+    # -------------------------------------------------------------------------
+    async def test_cached_by_normalized_query(self) -> None:
+        await self.search.search(user_id=1, query="Товар")
+        await self.search.search(user_id=2, query="  товар ")
+
+        self.assertEqual(first=1, second=len(self.search_calls))
+
+    # -------------------------------------------------------------------------
+    async def test_keystrokes_are_debounced(self) -> None:
+        pages: List[Optional[InlineSearchPage]] = []
+
+        async def type_query(text: str, delay: float) -> None:
+            await asyncio.sleep(delay)
+            pages.append(await self.search.search(user_id=1, query=text))
+
+        await asyncio.gather(
+            type_query("то", 0.0), type_query("тов", 0.001), type_query("товар", 0.002)
+        )
+
+        self.assertEqual(first=[("товар", 0, 3)], second=self.search_calls)
+        self.assertEqual(first=2, second=pages.count(None))
+
+    # -------------------------------------------------------------------------
+    async def test_superseded_lookup_is_cancelled(self) -> None:
+        self.release = asyncio.Event()
+        first = asyncio.create_task(self.search.search(user_id=1, query="товар"))
+
+        while not self.search_calls:
+            await asyncio.sleep(0.005)
+
+        second = asyncio.create_task(self.search.search(user_id=1, query="корм"))
+        await asyncio.sleep(0.05)
+        self.release.set()
+
+        self.assertIsNone(await first)
+        self.assertIsNotNone(await second)
+        self.assertEqual(first=["товар"], second=self.cancelled)
+
+    # -------------------------------------------------------------------------
+    async def test_users_share_one_lookup(self) -> None:
+        await asyncio.gather(
+            *(self.search.search(user_id=index, query="товар") for index in range(5))
+        )
+
+        self.assertEqual(first=1, second=len(self.search_calls))
+
+    # -------------------------------------------------------------------------
+    async def test_short_query_is_not_searched(self) -> None:
+        page: Optional[InlineSearchPage] = await self.search.search(
+            user_id=1, query="т"
+        )
+
+        self.assertEqual(first=(), second=page.results if page else None)
+        self.assertEqual(first=[], second=self.search_calls)
+
+    # -------------------------------------------------------------------------
+    async def test_build_inline_results_escapes_html(self) -> None:
+        self.rows[0] = (1, "<Корм>", "Для <кошек>", Decimal("5.00"))
+        page: Optional[InlineSearchPage] = await self.search.search(
+            user_id=1, query="корм"
+        )
+
+        assert page is not None
+        result = build_inline_results(page=page)[0]
+
+        self.assertEqual(first="1", second=result.id)
+        self.assertIn(
+            member="&lt;Корм&gt;",
+            container=result.input_message_content.message_text,  # type: ignore
+        )
+
+
+# ____________________________________________________________________________
+class TestInlineProductSearchNegative(BaseInlineSearchTestCase):
+    def test_invalid_page_size(self) -> None:
+        with self.assertRaises(ValueError):
+            InlineProductSearch(search_products=None, page_size=51)  # type: ignore
+
+    # -------------------------------------------------------------------------
+    async def test_failed_lookup_is_not_cached(self) -> None:
+        calls: List[str] = []
+
+        async def search_products(query: str, offset: int, limit: int) -> Any:
+            calls.append(query)
+            raise ConnectionError("БД недоступна!")
+
+        search = InlineProductSearch(
+            search_products=search_products, debounce_seconds=0
+        )
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                await search.search(user_id=1, query="товар")
+
+        self.assertEqual(first=2, second=len(calls))
+
+    # -------------------------------------------------------------------------
+    async def test_invalid_offset_returns_first_page(self) -> None:
+        await self.search.search(user_id=1, query="товар", offset="abc")
+
+        self.assertEqual(first=("товар", 0, 3), second=self.search_calls[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
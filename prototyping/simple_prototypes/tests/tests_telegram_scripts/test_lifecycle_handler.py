@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_lifecycle_handler представляет из себя набор модульных тестов,
+для тестирования компонентов модуля lifecycle_handler.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+
+import aiogram
+
+from aiogram.types import Message, Update
+
+from typing import List
+
+from prototypes.telegram_scripts.bot_state_handlers import BotStage, BotState
+from prototypes.telegram_scripts.lifecycle_handler import *
+
+
+# ----------------------------------------------------------------------------
+def create_update(update_id: int) -> Update:
+    return Update.model_validate(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": 1, "type": "private"},
+                "text": "text",
+            },
+        }
+    )
+
+
+# ____________________________________________________________________________
+class TestLifecycleManagerPositive(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.bot = aiogram.Bot(token="42:TEST")
+        self.dispatcher = aiogram.Dispatcher()
+        self.state = BotState()
+        self.events: List[str] = []
+
+        self.manager = LifecycleManager(state=self.state, drain_timeout=1.0)
+        self.manager.setup(dispatcher=self.dispatcher, handle_signals=False)
+
+        @self.dispatcher.message()
+        async def slow_handler(_: Message) -> None:
+            await asyncio.sleep(0.1)
+            self.events.append("handled")
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.bot.session.close()
+
+    # -------------------------------------------------------------------------
+    async def test_startup(self) -> None:
+        await self.dispatcher.emit_startup()
+
+        self.assertIs(expr1=BotStage.RUNNING, expr2=self.state.stage)
+
+    # -------------------------------------------------------------------------
+    async def test_drain_before_steps(self) -> None:
+        async def flush_outbox() -> None:
+            self.events.append("outbox")
+
+        async def close_pool() -> None:
+            self.events.append("pool")
+
+        self.manager.add_shutdown_step(name="outbox", method=flush_outbox)
+        self.manager.add_shutdown_step(name="pool", method=close_pool)
+
+        await self.dispatcher.emit_startup()
+
+        tasks = [
+            asyncio.create_task(self.dispatcher.feed_update(self.bot, create_update(i)))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(first=3, second=self.manager.in_flight_amount)
+
+        await self.dispatcher.emit_shutdown()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(first=["handled"] * 3 + ["outbox", "pool"], second=self.events)
+        self.assertIs(expr1=BotStage.STOPPED, expr2=self.state.stage)
+        self.assertEqual(first=0, second=self.manager.in_flight_amount)
+
+    # -------------------------------------------------------------------------
+    async def test_failed_step_does_not_stop_next(self) -> None:
+        async def failing_step() -> None:
+            raise ConnectionError("closed")
+
+        async def hanging_step() -> None:
+            await asyncio.sleep(10)
+
+        async def close_pool() -> None:
+            self.events.append("pool")
+
+        self.manager.add_shutdown_step(name="failing", method=failing_step)
+        self.manager.add_shutdown_step(name="hanging", method=hanging_step, timeout=0.05)
+        self.manager.add_shutdown_step(name="pool", method=close_pool)
+
+        results = await self.manager.shutdown()
+
+        self.assertEqual(first=["pool"], second=self.events)
+        self.assertEqual(
+            first=["failing", "hanging", "pool"],
+            second=[result.name for result in results],
+        )
+        self.assertIsNotNone(obj=results[0].error)
+        self.assertIsNotNone(obj=results[1].error)
+        self.assertIsNone(obj=results[2].error)
+
+
+# ____________________________________________________________________________
+class TestLifecycleManagerNegative(unittest.IsolatedAsyncioTestCase):
+    async def test_drain_timeout(self) -> None:
+        bot = aiogram.Bot(token="42:TEST")
+        dispatcher = aiogram.Dispatcher()
+        state = BotState()
+        manager = LifecycleManager(state=state, drain_timeout=0.05)
+        manager.setup(dispatcher=dispatcher, handle_signals=False)
+
+        @dispatcher.message()
+        async def hanging_handler(_: Message) -> None:
+            await asyncio.sleep(10)
+
+        task = asyncio.create_task(dispatcher.feed_update(bot, create_update(1)))
+        await asyncio.sleep(0.01)
+
+        try:
+            await manager.shutdown()
+
+            self.assertEqual(first=1, second=manager.in_flight_amount)
+            self.assertIs(expr1=BotStage.STOPPED, expr2=state.stage)
+        finally:
+            task.cancel()
+            await bot.session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
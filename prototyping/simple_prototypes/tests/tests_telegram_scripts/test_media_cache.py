@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_media_cache представляет из себя набор модульных тестов,
+для тестирования компонентов модуля media_cache.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+
+from types import SimpleNamespace
+from typing import Any, Dict, List, Mapping, Sequence, Set
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import BufferedInputFile
+
+from prototypes.telegram_scripts.media_cache import *
+
+
+# ____________________________________________________________________________
+class FakeBot:
+    """FakeBot имитирует методы отправки изображений, возвращая новые file_id."""
+
+    def __init__(self) -> None:
+        self.uploads: int = 0
+        self.media_group_calls: List[int] = []
+        self.rejected_file_ids: Set[str] = set()
+        self.error_message: str = "Bad Request: wrong file identifier/HTTP URL specified"
+
+    # -------------------------------------------------------------------------
+    async def send_photo(self, chat_id: int, photo: Any, **kwargs: Any) -> Any:
+        return SimpleNamespace(photo=[SimpleNamespace(file_id=self.__resolve(photo))])
+
+    # -------------------------------------------------------------------------
+    async def send_media_group(
+        self, chat_id: int, media: Sequence[Any], **kwargs: Any
+    ) -> List[Any]:
+        self.media_group_calls.append(len(media))
+
+        return [
+            SimpleNamespace(photo=[SimpleNamespace(file_id=self.__resolve(item.media))])
+            for item in media
+        ]
+
+    # -------------------------------------------------------------------------
+    def __resolve(self, photo: Any) -> str:
+        if isinstance(photo, BufferedInputFile):
+            self.uploads += 1
+
+            return f"file-{photo.filename}"
+
+        if photo in self.rejected_file_ids:
+            raise TelegramBadRequest(method=None, message=self.error_message)  # type: ignore
+
+        return photo
+
+
+# ____________________________________________________________________________
+class BaseMediaCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.stored: Dict[str, str] = {}
+        self.load_calls: List[List[str]] = []
+        self.bot = FakeBot()
+
+        async def load_file_ids(content_hashes: Sequence[str]) -> Mapping[str, str]:
+            self.load_calls.append(list(content_hashes))
+
+            return {
+                key: self.stored[key] for key in content_hashes if key in self.stored
+            }
+
+        async def store_file_ids(file_ids: Mapping[str, str]) -> None:
+            self.stored.update(file_ids)
+
+        async def delete_file_id(content_hash: str) -> None:
+            self.stored.pop(content_hash, None)
+
+        self.cache = MediaCache(
+            load_file_ids=load_file_ids,
+            store_file_ids=store_file_ids,
+            delete_file_id=delete_file_id,
+        )
+
+
+# ____________________________________________________________________________
+class TestMediaCachePositive(BaseMediaCacheTestCase):
+    async def test_image_uploaded_once(self) -> None:
+        for _ in range(3):
+            await self.cache.send_photo(bot=self.bot, chat_id=1, image=b"cat")  # type: ignore
+
+        self.assertEqual(first=1, second=self.bot.uploads)
+        self.assertEqual(first=1, second=len(self.load_calls))
+
+    # -------------------------------------------------------------------------
+    async def test_file_id_persisted_by_content_hash(self) -> None:
+        await self.cache.send_photo(bot=self.bot, chat_id=1, image=b"cat")  # type: ignore
+
+        self.assertIn(member=MediaCache.hash_content(image=b"cat"), container=self.stored)
+
+    # -------------------------------------------------------------------------
+    async def test_media_group_split_and_loaded_in_one_query(self) -> None:
+        images: List[bytes] = [f"image-{index}".encode() for index in range(12)]
+
+        await self.cache.send_media_group(bot=self.bot, chat_id=1, images=images)  # type: ignore
+        await self.cache.send_media_group(bot=self.bot, chat_id=1, images=images)  # type: ignore
+
+        self.assertEqual(first=[10, 2, 10, 2], second=self.bot.media_group_calls)
+        self.assertEqual(first=12, second=self.bot.uploads)
+        self.assertEqual(first=1, second=len(self.load_calls))
+
+    # -------------------------------------------------------------------------
+    async def test_duplicate_images_in_group_uploaded_once(self) -> None:
+        await self.cache.send_media_group(
+            bot=self.bot, chat_id=1, images=[b"cat", b"cat"]  # type: ignore
+        )
+
+        self.assertEqual(first=1, second=len(self.stored))
+
+
+# ____________________________________________________________________________
+class TestMediaCacheNegative(BaseMediaCacheTestCase):
+    async def test_rejected_file_id_reuploaded(self) -> None:
+        content_hash: str = MediaCache.hash_content(image=b"cat")
+        self.stored[content_hash] = "expired"
+        self.bot.rejected_file_ids.add("expired")
+
+        await self.cache.send_photo(bot=self.bot, chat_id=1, image=b"cat")  # type: ignore
+
+        self.assertEqual(first=1, second=self.bot.uploads)
+        self.assertEqual(first=f"file-{content_hash}.jpg", second=self.stored[content_hash])
+
+    # -------------------------------------------------------------------------
+    async def test_expired_file_reference_reuploaded_in_group(self) -> None:
+        content_hash: str = MediaCache.hash_content(image=b"cat")
+        self.stored[content_hash] = "expired"
+        self.bot.rejected_file_ids.add("expired")
+        self.bot.error_message = "Bad Request: FILE_REFERENCE_EXPIRED"
+
+        await self.cache.send_media_group(
+            bot=self.bot, chat_id=1, images=[b"cat", b"dog"]  # type: ignore
+        )
+
+        self.assertEqual(first=2, second=self.bot.uploads)
+        self.assertEqual(first=f"file-{content_hash}.jpg", second=self.stored[content_hash])
+
+    # -------------------------------------------------------------------------
+    async def test_unrelated_bad_request_keep_file_id(self) -> None:
+        content_hash: str = MediaCache.hash_content(image=b"cat")
+        self.stored[content_hash] = "valid"
+        self.bot.rejected_file_ids.add("valid")
+        self.bot.error_message = "Bad Request: message caption is too long"
+
+        with self.assertRaises(TelegramBadRequest):
+            await self.cache.send_photo(bot=self.bot, chat_id=1, image=b"cat")  # type: ignore
+
+        with self.assertRaises(TelegramBadRequest):
+            await self.cache.send_media_group(
+                bot=self.bot, chat_id=1, images=[b"cat"]  # type: ignore
+            )
+
+        self.assertEqual(first=0, second=self.bot.uploads)
+        self.assertEqual(first="valid", second=self.stored[content_hash])
+
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_metrics_middleware представляет из себя набор модульных тестов,
+для тестирования компонентов модуля metrics_middleware.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import unittest
+import aiogram
+
+from aiogram.methods import GetMe, SendMessage
+from aiogram.types import Update, User
+from aiogram.exceptions import TelegramNetworkError
+
+from typing import Any, Dict
+
+from prototypes.monitoring_scripts.metrics import MetricsRegistry
+from prototypes.telegram_scripts.metrics_middleware import *
+
+
+# ____________________________________________________________________________
+class BaseMetricsMiddlewareTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.registry = MetricsRegistry()
+        self.update = Update.model_validate(
+            {
+                "update_id": 1,
+                "message": {
+                    "message_id": 1,
+                    "date": 0,
+                    "chat": {"id": 1, "type": "private"},
+                    "text": "/start",
+                },
+            }
+        )
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    async def handle(_: Any, __: Dict[str, Any]) -> str:
+        return "handled"
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    async def make_request(_: Any, __: Any) -> str:
+        return "response"
+
+
+# ____________________________________________________________________________
+class TestUpdateMetricsMiddlewarePositive(BaseMetricsMiddlewareTestCase):
+    async def test_update_counted_by_type(self) -> None:
+        middleware = UpdateMetricsMiddleware(registry=self.registry)
+
+        self.assertEqual(
+            first="handled", second=await middleware(self.handle, self.update, {})
+        )
+        self.assertEqual(
+            first="handled", second=await middleware(self.handle, self.update, {})
+        )
+
+        rendered: str = self.registry.render()
+
+        self.assertIn(
+            member='bot_updates_total{update_type="message"} 2.0', container=rendered
+        )
+        self.assertIn(
+            member='bot_update_duration_seconds_count{update_type="message"} 2',
+            container=rendered,
+        )
+        self.assertNotIn(member="bot_update_errors_total{", container=rendered)
+
+    # -------------------------------------------------------------------------
+    async def test_event_without_update_labeled_by_class(self) -> None:
+        middleware = UpdateMetricsMiddleware(registry=self.registry)
+        user = User(id=1, is_bot=False, first_name="Neko")
+
+        await middleware(self.handle, user, {})
+
+        self.assertIn(
+            member='bot_updates_total{update_type="User"} 1.0',
+            container=self.registry.render(),
+        )
+
+
+# ____________________________________________________________________________
+class TestUpdateMetricsMiddlewareNegative(BaseMetricsMiddlewareTestCase):
+    async def test_failed_update_counted_and_raised(self) -> None:
+        middleware = UpdateMetricsMiddleware(registry=self.registry)
+
+        async def failing_handler(_: Any, __: Dict[str, Any]) -> None:
+            raise ValueError
+
+        with self.assertRaises(expected_exception=ValueError):
+            await middleware(failing_handler, self.update, {})
+
+        rendered: str = self.registry.render()
+
+        self.assertIn(
+            member='bot_update_errors_total{update_type="message",error="ValueError"}'
+            " 1.0",
+            container=rendered,
+        )
+        self.assertIn(
+            member='bot_updates_total{update_type="message"} 1.0', container=rendered
+        )
+
+    # -------------------------------------------------------------------------
+    def test_second_middleware_for_registry_raise_ValueError(self) -> None:
+        UpdateMetricsMiddleware(registry=self.registry)
+
+        with self.assertRaises(expected_exception=ValueError):
+            UpdateMetricsMiddleware(registry=self.registry)
+
+
+# ____________________________________________________________________________
+class TestTelegramAPIMetricsMiddlewarePositive(BaseMetricsMiddlewareTestCase):
+    async def test_request_counted_by_method(self) -> None:
+        middleware = TelegramAPIMetricsMiddleware(registry=self.registry)
+
+        self.assertEqual(
+            first="response",
+            second=await middleware(self.make_request, None, GetMe()),  # type: ignore
+        )
+        send_message = SendMessage(chat_id=1, text="Привет")
+
+        await middleware(self.make_request, None, send_message)  # type: ignore
+
+        rendered: str = self.registry.render()
+
+        self.assertIn(
+            member='telegram_api_requests_total{method="getMe"} 1.0', container=rendered
+        )
+        self.assertIn(
+            member='telegram_api_requests_total{method="sendMessage"} 1.0',
+            container=rendered,
+        )
+        self.assertIn(
+            member='telegram_api_request_duration_seconds_count{method="getMe"} 1',
+            container=rendered,
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_setup_metrics_registers_both_middlewares(self) -> None:
+        dispatcher = aiogram.Dispatcher()
+        bot = aiogram.Bot(token="42:TEST")
+
+        try:
+            setup_metrics(dispatcher=dispatcher, bot=bot, registry=self.registry)
+
+            self.assertTrue(
+                expr=any(
+                    isinstance(middleware, UpdateMetricsMiddleware)
+                    for middleware in dispatcher.update.outer_middleware
+                )
+            )
+            self.assertTrue(
+                expr=any(
+                    isinstance(middleware, TelegramAPIMetricsMiddleware)
+                    for middleware in bot.session.middleware
+                )
+            )
+
+        finally:
+            await bot.session.close()
+
+
+# ____________________________________________________________________________
+class TestTelegramAPIMetricsMiddlewareNegative(BaseMetricsMiddlewareTestCase):
+    async def test_failed_request_counted_and_raised(self) -> None:
+        middleware = TelegramAPIMetricsMiddleware(registry=self.registry)
+        method = GetMe()
+
+        async def failing_request(_: Any, __: Any) -> None:
+            raise TelegramNetworkError(method=method, message="Connection reset")
+
+        with self.assertRaises(expected_exception=TelegramNetworkError):
+            await middleware(failing_request, None, method)  # type: ignore
+
+        rendered: str = self.registry.render()
+
+        self.assertIn(
+            member="telegram_api_errors_total"
+            '{method="getMe",error="TelegramNetworkError"} 1.0',
+            container=rendered,
+        )
+        self.assertIn(
+            member='telegram_api_requests_total{method="getMe"} 1.0', container=rendered
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_resilience_middleware представляет из себя набор модульных тестов,
+для тестирования компонентов модуля resilience_middleware.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import GetUpdates, SendMessage
+from aiogram.types import Update
+
+from typing import Any, Dict, List
+
+from prototypes.resilience_scripts.circuit_breaker import *
+from prototypes.resilience_scripts.concurrency_limiter import *
+from prototypes.resilience_scripts.dependency_guard import DependencyGuard
+from prototypes.telegram_scripts.resilience_middleware import *
+
+
+# ----------------------------------------------------------------------------
+def create_callback_update(data: str) -> Update:
+    return Update.model_validate(
+        {
+            "update_id": 1,
+            "callback_query": {
+                "id": "1",
+                "from": {"id": 1, "is_bot": False, "first_name": "Neko"},
+                "chat_instance": "1",
+                "data": data,
+            },
+        }
+    )
+
+
+# ____________________________________________________________________________
+class TestResilienceMiddlewarePositive(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.limiter = AdaptiveConcurrencyLimiter(
+            name="updates", initial_limit=2, low_priority_share=0.5
+        )
+        self.shed: List[Exception] = []
+
+        async def on_shed(_: Update, __: Dict[str, Any], error: Exception) -> None:
+            self.shed.append(error)
+
+        self.middleware = LoadSheddingMiddleware(limiter=self.limiter, on_shed=on_shed)
+
+    # -------------------------------------------------------------------------
+    def test_classify_update_priority(self) -> None:
+        self.assertIs(
+            expr1=Priority.HIGH,
+            expr2=classify_update_priority(create_callback_update("order:42")),
+        )
+        self.assertIs(
+            expr1=Priority.LOW,
+            expr2=classify_update_priority(create_callback_update("catalogue:2")),
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_priority_set_for_handler(self) -> None:
+        async def handler(_: Any, __: Dict[str, Any]) -> Priority:
+            return current_priority.get()
+
+        self.assertIs(
+            expr1=Priority.LOW,
+            expr2=await self.middleware(
+                handler, create_callback_update("catalogue:2"), {}
+            ),
+        )
+        self.assertIs(expr1=Priority.HIGH, expr2=current_priority.get())
+
+    # -------------------------------------------------------------------------
+    async def test_shed_catalogue_before_orders(self) -> None:
+        release = asyncio.Event()
+
+        async def handler(_: Any, __: Dict[str, Any]) -> str:
+            await release.wait()
+            return "handled"
+
+        order = asyncio.create_task(
+            self.middleware(handler, create_callback_update("order:42"), {})
+        )
+        await asyncio.sleep(0)
+
+        catalogue = await asyncio.wait_for(
+            self.middleware(handler, create_callback_update("catalogue:2"), {}), 1.0
+        )
+        payment = asyncio.create_task(
+            self.middleware(handler, create_callback_update("payment:42"), {})
+        )
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertIsNone(obj=catalogue)
+        self.assertEqual(first=1, second=len(self.shed))
+        self.assertEqual(
+            first=["handled", "handled"], second=await asyncio.gather(order, payment)
+        )
+
+    # -------------------------------------------------------------------------
+    async def test_open_circuit_is_shed(self) -> None:
+        async def handler(_: Any, __: Dict[str, Any]) -> None:
+            raise CircuitOpenError(name="mysql", retry_after=1.0)
+
+        self.assertIsNone(
+            obj=await self.middleware(handler, create_callback_update("order:42"), {})
+        )
+        self.assertIsInstance(obj=self.shed[0], cls=CircuitOpenError)
+
+    # -------------------------------------------------------------------------
+    async def test_get_updates_bypass_guard(self) -> None:
+        guard = DependencyGuard(
+            breaker=CircuitBreaker(name="telegram", failure_threshold=1)
+        )
+        middleware = TelegramAPIResilienceMiddleware(guard=guard)
+        send_message = SendMessage(chat_id=1, text="text")
+        methods: List[Any] = []
+
+        async def make_request(_: Any, method: Any) -> Any:
+            methods.append(method)
+            raise ConnectionError("Telegram недоступен!")
+
+        with self.assertRaises(ConnectionError):
+            await middleware(make_request, None, send_message)  # type: ignore
+
+        with self.assertRaises(CircuitOpenError):
+            await middleware(make_request, None, send_message)  # type: ignore
+
+        with self.assertRaises(ConnectionError):
+            await middleware(make_request, None, GetUpdates())  # type: ignore
+
+        self.assertEqual(first=2, second=len(methods))
+
+    # -------------------------------------------------------------------------
+    async def test_retry_after_not_open_circuit(self) -> None:
+        guard: DependencyGuard = create_telegram_guard(failure_threshold=1)
+        middleware = TelegramAPIResilienceMiddleware(guard=guard)
+        send_message = SendMessage(chat_id=1, text="text")
+        methods: List[Any] = []
+
+        async def make_request(_: Any, method: Any) -> Any:
+            methods.append(method)
+            raise TelegramRetryAfter(
+                method=method, message="Too Many Requests", retry_after=1
+            )
+
+        for _ in range(3):
+            with self.assertRaises(TelegramRetryAfter):
+                await middleware(make_request, None, send_message)  # type: ignore
+
+        self.assertEqual(first=3, second=len(methods))
+        self.assertNotIn(member=TelegramRetryAfter, container=TELEGRAM_FAILURE_ERRORS)
+        self.assertIn(member=TelegramRetryAfter, container=TELEGRAM_OVERLOAD_ERRORS)
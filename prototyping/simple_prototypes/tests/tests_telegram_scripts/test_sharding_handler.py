@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_sharding_handler представляет из себя набор модульных тестов,
+для тестирования компонентов модуля sharding_handler.
+
+*Тесты ShardSupervisor запускают процессы-обработчики.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import os
+import shutil
+import asyncio
+import tempfile
+import unittest
+import aiogram
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from aiogram.types import Chat, Message, Update, User
+from aiogram.methods import GetUpdates
+from aiogram.exceptions import TelegramNetworkError
+from aiogram.utils.backoff import BackoffConfig
+
+from prototypes.telegram_scripts.sharding_handler import *
+
+
+# Каталог, в который обработчики записывают полученные сообщения.
+OUTPUT_DIR_ENVIRONMENT_KEY: str = "SHARDING_TEST_OUTPUT_DIR"
+
+
+# ----------------------------------------------------------------------------
+async def setup_test_worker(bot: aiogram.Bot) -> aiogram.Dispatcher:
+    dispatcher = aiogram.Dispatcher()
+    output_dir: str = os.environ[OUTPUT_DIR_ENVIRONMENT_KEY]
+
+    @dispatcher.message()
+    async def handler(message: Message) -> None:
+        crash_marker: str = os.path.join(output_dir, "crashed")
+
+        if message.text == "crash" and not os.path.exists(crash_marker):
+            open(crash_marker, "w").close()
+            os._exit(1)
+
+        if message.text == "crash loop":
+            os._exit(1)
+
+        if message.text == "fail":
+            raise RuntimeError("Ошибка обработчика!")
+
+        await asyncio.sleep(0.001 * (message.message_id % 3))
+
+        with open(os.path.join(output_dir, f"{message.chat.id}.log"), "a") as file:
+            file.write(f"{message.message_id}\n")
+
+    return dispatcher
+
+
+# ----------------------------------------------------------------------------
+def make_message_payload(update_id: int, chat_id: int, text: str) -> Dict[str, Any]:
+    return Update(
+        update_id=update_id,
+        message=Message(
+            message_id=update_id,
+            date=datetime.now(),
+            chat=Chat(id=chat_id, type="private"),
+            from_user=User(id=chat_id, is_bot=False, first_name="Neko"),
+            text=text,
+        ),
+    ).model_dump(mode="json", exclude_unset=True)
+
+
+# ____________________________________________________________________________
+class FakePollingBot:
+    """FakePollingBot бот, возвращающий на запросы getUpdates заданные ответы."""
+
+    def __init__(self, responses: List[Any], stop_event: asyncio.Event) -> None:
+        self.responses: List[Any] = responses
+        self.stop_event: asyncio.Event = stop_event
+        self.offsets: List[Optional[int]] = []
+
+    async def get_updates(self, offset: Optional[int], timeout: int) -> List[Update]:
+        self.offsets.append(offset)
+        response: Any = self.responses.pop(0)
+
+        if not self.responses:
+            self.stop_event.set()
+
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+
+# ____________________________________________________________________________
+class TestGetShardKeyPositive(unittest.TestCase):
+    def test_message_sharded_by_chat(self) -> None:
+        payload: Dict[str, Any] = make_message_payload(
+            update_id=1, chat_id=-100, text="Привет"
+        )
+
+        self.assertEqual(first=-100, second=get_shard_key(update=payload))
+
+    # ------------------------------------------------------------------------
+    def test_callback_query_sharded_by_message_chat(self) -> None:
+        payload: Dict[str, Any] = {
+            "update_id": 1,
+            "callback_query": {
+                "id": "1",
+                "from": {"id": 7},
+                "message": {"message_id": 1, "chat": {"id": 42}},
+            },
+        }
+
+        self.assertEqual(first=42, second=get_shard_key(update=payload))
+
+    # ------------------------------------------------------------------------
+    def test_inline_query_sharded_by_user(self) -> None:
+        payload: Dict[str, Any] = {"update_id": 1, "inline_query": {"from": {"id": 7}}}
+
+        self.assertEqual(first=7, second=get_shard_key(update=payload))
+
+
+# ____________________________________________________________________________
+class TestGetShardKeyNegative(unittest.TestCase):
+    def test_unknown_update_sharded_by_update_id(self) -> None:
+        self.assertEqual(first=5, second=get_shard_key(update={"update_id": 5}))
+
+    # ------------------------------------------------------------------------
+    def test_zero_workers_raise_ValueError(self) -> None:
+        self.assertRaises(
+            ValueError, ShardSupervisor, "42:TEST", setup_test_worker, 1, 0
+        )
+
+
+# ____________________________________________________________________________
+class TestShardSupervisorPositive(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.output_dir: str = tempfile.mkdtemp()
+        os.environ[OUTPUT_DIR_ENVIRONMENT_KEY] = self.output_dir
+
+        self.supervisor = ShardSupervisor(
+            bot_token="42:TEST", setup_worker=setup_test_worker, workers_amount=2
+        )
+        self.supervisor.start()
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        self.supervisor.stop()
+        shutil.rmtree(self.output_dir)
+
+    # -------------------------------------------------------------------------
+    async def test_chat_order_preserved(self) -> None:
+        for update_id in range(1, 31):
+            self.supervisor.dispatch(
+                update=make_message_payload(
+                    update_id=update_id, chat_id=update_id % 3, text="Привет"
+                )
+            )
+
+        await asyncio.wait_for(self.supervisor.wait_until_processed(), timeout=60)
+
+        for chat_id in range(3):
+            with self.subTest(msg=f"Chat: {chat_id}"):
+                self.assertEqual(
+                    first=list(range(chat_id or 3, 31, 3)),
+                    second=self.__read_log(chat_id=chat_id),
+                )
+
+    # -------------------------------------------------------------------------
+    async def test_crashed_worker_restarted_and_updates_requeued(self) -> None:
+        self.supervisor.dispatch(
+            update=make_message_payload(update_id=1, chat_id=2, text="crash")
+        )
+
+        for update_id in range(2, 6):
+            self.supervisor.dispatch(
+                update=make_message_payload(
+                    update_id=update_id, chat_id=2, text="Привет"
+                )
+            )
+
+        await asyncio.wait_for(self.supervisor.wait_until_processed(), timeout=60)
+
+        self.assertEqual(first=1, second=self.supervisor.restarts_amount)
+        self.assertEqual(first=[1, 2, 3, 4, 5], second=self.__read_log(chat_id=2))
+
+    # -------------------------------------------------------------------------
+    async def test_failed_update_is_acknowledged(self) -> None:
+        self.supervisor.dispatch(
+            update=make_message_payload(update_id=1, chat_id=4, text="fail")
+        )
+
+        for update_id in range(2, 4):
+            self.supervisor.dispatch(
+                update=make_message_payload(
+                    update_id=update_id, chat_id=4, text="Привет"
+                )
+            )
+
+        await asyncio.wait_for(self.supervisor.wait_until_processed(), timeout=60)
+
+        self.assertEqual(first=0, second=self.supervisor.restarts_amount)
+        self.assertEqual(first=[2, 3], second=self.__read_log(chat_id=4))
+
+    # -------------------------------------------------------------------------
+    async def test_polling_retried_after_network_error(self) -> None:
+        stop_event = asyncio.Event()
+        bot = FakePollingBot(
+            responses=[
+                TelegramNetworkError(method=GetUpdates(), message="Connection reset"),
+                [Update.model_validate(make_message_payload(1, 5, "Привет"))],
+            ],
+            stop_event=stop_event,
+        )
+
+        await self.supervisor.run_polling(
+            bot=bot,  # type: ignore
+            stop_event=stop_event,
+            backoff_config=BackoffConfig(
+                min_delay=0.01, max_delay=0.02, factor=2.0, jitter=0.0
+            ),
+        )
+        await asyncio.wait_for(self.supervisor.wait_until_processed(), timeout=60)
+
+        self.assertEqual(first=[None, None], second=bot.offsets)
+        self.assertEqual(first=[1], second=self.__read_log(chat_id=5))
+
+    # -------------------------------------------------------------------------
+    def __read_log(self, chat_id: int) -> List[int]:
+        with open(os.path.join(self.output_dir, f"{chat_id}.log")) as file:
+            return [int(line) for line in file]
+
+
+# ____________________________________________________________________________
+class TestShardSupervisorNegative(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.output_dir: str = tempfile.mkdtemp()
+        os.environ[OUTPUT_DIR_ENVIRONMENT_KEY] = self.output_dir
+
+        self.supervisor = ShardSupervisor(
+            bot_token="42:TEST",
+            setup_worker=setup_test_worker,
+            workers_amount=1,
+            max_restarts=1,
+            restart_backoff=BackoffConfig(
+                min_delay=0.01, max_delay=0.02, factor=2.0, jitter=0.0
+            ),
+        )
+        self.supervisor.start()
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        self.supervisor.stop()
+        shutil.rmtree(self.output_dir)
+
+    # -------------------------------------------------------------------------
+    async def test_crash_loop_raise_RuntimeError(self) -> None:
+        self.supervisor.dispatch(
+            update=make_message_payload(update_id=1, chat_id=1, text="crash loop")
+        )
+
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(self.supervisor.wait_until_processed(), timeout=60)
+
+        self.assertEqual(first=1, second=self.supervisor.restarts_amount)
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+"""
+Модуль test_user_context_middleware представляет из себя набор модульных тестов,
+для тестирования компонентов модуля user_context_middleware.
+
+Copyright 2024 HyacinthusIO
+Лицензия Apache, версия 2.0 (Apache-2.0 license)
+"""
+
+__author__ = "HyacinthusIO"
+__version__ = "1.0.0"
+
+import asyncio
+import unittest
+import aiogram
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiogram.types import Chat, Message, Update, User
+
+from prototypes.telegram_scripts.bot_handler import create_dispatcher
+from prototypes.telegram_scripts.user_context_middleware import *
+
+
+# ----------------------------------------------------------------------------
+def make_message_update(user_id: int) -> Update:
+    return Update(
+        update_id=1,
+        message=Message(
+            message_id=1,
+            date=datetime.now(),
+            chat=Chat(id=user_id, type="private"),
+            from_user=User(id=user_id, is_bot=False, first_name="Neko"),
+            text="Привет",
+        ),
+    )
+
+
+# ____________________________________________________________________________
+class BaseUserContextTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await unittest.IsolatedAsyncioTestCase.asyncSetUp(self)
+
+        self.rows: Dict[int, Tuple[Any, ...]] = {
+            1: (1, 0, 1, 0, "ru"),
+            2: (2, 1, 0, 0, "en"),
+        }
+        self.load_calls: List[int] = []
+
+        async def load_user(user_id: int) -> Optional[Tuple[Any, ...]]:
+            self.load_calls.append(user_id)
+            await asyncio.sleep(0)
+
+            return self.rows.get(user_id)
+
+        self._load_user = load_user
+        self.cache = UserContextCache(load_user=load_user)
+
+
+# ____________________________________________________________________________
+class TestUserContextCachePositive(BaseUserContextTestCase):
+    async def test_record_loaded_once(self) -> None:
+        await self.cache.get_record(user_id=1)
+        record: Optional[UserRecord] = await self.cache.get_record(user_id=1)
+
+        self.assertTrue(record is not None and record.is_admin)
+        self.assertEqual(first=[1], second=self.load_calls)
+
+    # -------------------------------------------------------------------------
+    async def test_concurrent_requests_share_one_load(self) -> None:
+        await asyncio.gather(*(self.cache.get_record(user_id=1) for _ in range(10)))
+
+        self.assertEqual(first=[1], second=self.load_calls)
+
+    # -------------------------------------------------------------------------
+    async def test_unknown_user_is_cached_as_negative(self) -> None:
+        self.assertIsNone(await self.cache.get_record(user_id=404))
+        self.assertIsNone(await self.cache.get_record(user_id=404))
+
+        self.assertEqual(first=[404], second=self.load_calls)
+
+    # -------------------------------------------------------------------------
+    async def test_loaded_banned_user_is_remembered(self) -> None:
+        await self.cache.get_record(user_id=2)
+
+        self.assertTrue(self.cache.is_banned(user_id=2))
+
+    # -------------------------------------------------------------------------
+    async def test_apply_changes_updates_ban_and_invalidates(self) -> None:
+        await self.cache.get_record(user_id=1)
+
+        self.rows[1] = (1, 1, 1, 0, "ru")
+        self.cache.apply_changes(user_id=1, changes={"is_banned": True})
+
+        self.assertTrue(self.cache.is_banned(user_id=1))
+
+        record: Optional[UserRecord] = await self.cache.get_record(user_id=1)
+
+        self.assertTrue(record is not None and record.is_banned)
+        self.assertEqual(first=[1, 1], second=self.load_calls)
+
+    # -------------------------------------------------------------------------
+    async def test_unban_removes_user_from_banned_ids(self) -> None:
+        await self.cache.load_banned_user_ids(load_banned_user_ids=self._load_banned)
+
+        self.cache.apply_changes(user_id=2, changes={"is_banned": False})
+
+        self.assertFalse(self.cache.is_banned(user_id=2))
+
+    # -------------------------------------------------------------------------
+    async def test_banned_user_ids_reloaded_after_ttl(self) -> None:
+        now: List[float] = [0.0]
+        banned_user_ids: List[int] = [2]
+        cache = UserContextCache(
+            load_user=self._load_user, banned_ttl_seconds=60.0, clock=lambda: now[0]
+        )
+
+        async def load_banned() -> List[int]:
+            return list(banned_user_ids)
+
+        await cache.load_banned_user_ids(load_banned_user_ids=load_banned)
+        await cache.get_record(user_id=2)
+
+        # Пользователя разблокировал другой процесс.
+        banned_user_ids.clear()
+        self.rows[2] = (2, 0, 0, 0, "en")
+        now[0] = 30.0
+        await cache.refresh_banned_user_ids()
+
+        self.assertTrue(cache.is_banned(user_id=2))
+
+        now[0] = 61.0
+        await cache.refresh_banned_user_ids()
+
+        self.assertFalse(cache.is_banned(user_id=2))
+
+        record: Optional[UserRecord] = await cache.get_record(user_id=2)
+
+        self.assertTrue(record is not None and not record.is_banned)
+
+    # -------------------------------------------------------------------------
+    async def test_resolve_language(self) -> None:
+        self.assertEqual(first="en", second=await self.cache.resolve_language(user_id=2))
+
+    # -------------------------------------------------------------------------
+    async def _load_banned(self) -> List[int]:
+        return [2]
+
+
+# ____________________________________________________________________________
+class TestUserContextMiddlewarePositive(BaseUserContextTestCase):
+    async def asyncSetUp(self) -> None:
+        await BaseUserContextTestCase.asyncSetUp(self)
+
+        self.bot = aiogram.Bot(token="42:TEST")
+        self.dispatcher: aiogram.Dispatcher = await create_dispatcher()
+        self.received_records: List[Optional[UserRecord]] = []
+
+        @self.dispatcher.message()
+        async def handler(msg: Message, user_record: Optional[UserRecord]) -> None:
+            self.received_records.append(user_record)
+
+        setup_user_context(dispatcher=self.dispatcher, cache=self.cache)
+
+    # -------------------------------------------------------------------------
+    async def asyncTearDown(self) -> None:
+        await self.bot.session.close()
+
+    # -------------------------------------------------------------------------
+    async def test_handler_receives_user_record(self) -> None:
+        await self.dispatcher.feed_update(bot=self.bot, update=make_message_update(1))
+
+        self.assertEqual(first=1, second=self.received_records[0].user_id)  # type: ignore
+
+    # -------------------------------------------------------------------------
+    async def test_banned_user_rejected_without_lookup(self) -> None:
+        await self.cache.load_banned_user_ids(load_banned_user_ids=self._load_banned)
+
+        await self.dispatcher.feed_update(bot=self.bot, update=make_message_update(2))
+
+        self.assertEqual(first=[], second=self.received_records)
+        self.assertEqual(first=[], second=self.load_calls)
+
+    # -------------------------------------------------------------------------
+    async def test_user_unbanned_elsewhere_passed_after_ttl(self) -> None:
+        banned_user_ids: List[int] = [2]
+
+        async def load_banned() -> List[int]:
+            return list(banned_user_ids)
+
+        cache = UserContextCache(load_user=self._load_user, banned_ttl_seconds=0.0)
+        dispatcher: aiogram.Dispatcher = await create_dispatcher()
+
+        @dispatcher.message()
+        async def handler(msg: Message, user_record: Optional[UserRecord]) -> None:
+            self.received_records.append(user_record)
+
+        setup_user_context(dispatcher=dispatcher, cache=cache)
+        await cache.load_banned_user_ids(load_banned_user_ids=load_banned)
+
+        await dispatcher.feed_update(bot=self.bot, update=make_message_update(2))
+
+        self.assertEqual(first=[], second=self.received_records)
+
+        banned_user_ids.clear()
+        self.rows[2] = (2, 0, 0, 0, "en")
+
+        await dispatcher.feed_update(bot=self.bot, update=make_message_update(2))
+        record: Optional[UserRecord] = self.received_records[0]
+
+        self.assertEqual(first=2, second=record.user_id)  # type: ignore
+
+    # -------------------------------------------------------------------------
+    async def test_unknown_user_passed_as_none(self) -> None:
+        await self.dispatcher.feed_update(bot=self.bot, update=make_message_update(404))
+
+        self.assertEqual(first=[None], second=self.received_records)
+
+    # -------------------------------------------------------------------------
+    async def _load_banned(self) -> List[int]:
+        return [2]